@@ -310,7 +310,8 @@ class ADKContentGenerator implements ContentGenerator {
                 } else if (type == 'trace_info') {
                   debugPrint('🔗 [TRACE_INFO] trace_id=${data['trace_id']}');
                   _traceInfoController.add(Map<String, dynamic>.from(data));
-                } else if (type == 'dashboard') {
+                } else if (type == 'dashboard' ||
+                    type == 'dashboard_patch') {
                   debugPrint(
                     '📊 [DASHBOARD] category=${data['category']}, tool=${data['tool_name']}',
                   );
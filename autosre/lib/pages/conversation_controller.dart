@@ -156,7 +156,11 @@ class ConversationController {
       debugPrint(
         '\u{1F4CA} [DASH] Received dashboard event: category=${event['category']}, tool=${event['tool_name']}',
       );
-      dashboardState.addFromEvent(event);
+      if (event['type'] == 'dashboard_patch') {
+        dashboardState.applyPatch(event);
+      } else {
+        dashboardState.addFromEvent(event);
+      }
     });
 
     _toolCallSubscription?.cancel();
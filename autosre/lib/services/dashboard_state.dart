@@ -107,6 +107,10 @@ class DashboardState extends ChangeNotifier {
   final List<DashboardItem> _items = [];
   int _itemCounter = 0;
 
+  /// Latest full event per backend `widget_key`, used to apply
+  /// `dashboard_patch` events. Each entry records its item under `_item_id`.
+  final Map<String, Map<String, dynamic>> _widgetEvents = {};
+
   /// When > 0, [notifyListeners] calls are deferred until the batch ends.
   int _batchDepth = 0;
   bool _batchDirty = false;
@@ -705,6 +709,15 @@ class DashboardState extends ChangeNotifier {
           return false;
       }
 
+      final widgetKey = event['widget_key'] as String?;
+      if (widgetKey != null) {
+        _widgetEvents[widgetKey] = {
+          ...event,
+          'data': dataMap,
+          '_item_id': _items.last.id,
+        };
+      }
+
       // Auto-open dashboard on first data
       final dashType = _categoryFromString(category);
       if (dashType != null && !_isOpen) {
@@ -721,6 +734,45 @@ class DashboardState extends ChangeNotifier {
     }
   }
 
+  /// Process a `dashboard_patch` event: a widget sent earlier only grew.
+  ///
+  /// Patches have the shape `{widget_key, field, items, set}`: [items] are
+  /// appended to the list `field` of the widget's last data and `set`
+  /// replaces changed scalar fields. The widget's item is replaced by the
+  /// patched one. Returns false (and changes nothing) if the widget is
+  /// unknown, e.g. after [clear].
+  bool applyPatch(Map<String, dynamic> patch) {
+    final widgetKey = patch['widget_key'] as String?;
+    final field = patch['field'] as String?;
+    final base = widgetKey == null ? null : _widgetEvents[widgetKey];
+    if (base == null || field == null) return false;
+
+    final data = Map<String, dynamic>.from(base['data'] as Map);
+    data[field] = [
+      ...(data[field] as List? ?? const []),
+      ...(patch['items'] as List? ?? const []),
+    ];
+    final changed = patch['set'];
+    if (changed is Map) {
+      data.addAll(Map<String, dynamic>.from(changed));
+    }
+
+    final previousId = base['_item_id'] as String?;
+    var applied = false;
+    batch(() {
+      applied = addFromEvent({
+        ...base,
+        'tool_name': patch['tool_name'] ?? base['tool_name'],
+        'data': data,
+      });
+      if (applied) {
+        _items.removeWhere((item) => item.id == previousId);
+        notifyListeners();
+      }
+    });
+    return applied;
+  }
+
   /// Adds a DashboardItem without calling notifyListeners.
   /// Used by [addFromEvent] to batch multiple state changes.
   void _addItemSilent(
@@ -853,6 +905,7 @@ class DashboardState extends ChangeNotifier {
   void clear() {
     _items.clear();
     _itemCounter = 0;
+    _widgetEvents.clear();
     _loadingStates.clear();
     _errorStates.clear();
     _lastQueryFilters.clear();
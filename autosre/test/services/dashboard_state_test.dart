@@ -449,6 +449,46 @@ void main() {
       expect(result, isFalse);
     });
 
+    test('applies patch to a keyed widget', () {
+      state.addFromEvent({
+        'category': 'metrics',
+        'widget_type': 'x-sre-metric-chart',
+        'tool_name': 'list_time_series',
+        'widget_key': 'x-sre-metric-chart:cpu',
+        'data': {
+          'metric_name': 'cpu',
+          'points': [
+            {'timestamp': '2026-01-01T00:00:00Z', 'value': 1.0},
+          ],
+          'labels': {},
+        },
+      });
+
+      final result = state.applyPatch({
+        'type': 'dashboard_patch',
+        'widget_key': 'x-sre-metric-chart:cpu',
+        'field': 'points',
+        'items': [
+          {'timestamp': '2026-01-01T00:01:00Z', 'value': 2.0},
+        ],
+        'set': {},
+      });
+
+      expect(result, isTrue);
+      expect(state.items.length, 1);
+      expect(state.items.first.metricSeries!.points.length, 2);
+    });
+
+    test('ignores patch for unknown widget', () {
+      final result = state.applyPatch({
+        'widget_key': 'missing',
+        'field': 'points',
+        'items': [],
+      });
+      expect(result, isFalse);
+      expect(state.items, isEmpty);
+    });
+
     test('auto-opens dashboard on first data', () {
       expect(state.isOpen, isFalse);
       state.addFromEvent({
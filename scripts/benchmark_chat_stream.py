@@ -0,0 +1,248 @@
+"""Load-benchmark the chat stream transport with a fake runner.
+
+Runs N concurrent streams, each consuming a synthetic turn of ADK events
+(streamed text deltas, tool calls and tool responses), and compares:
+
+- encoding: the legacy per-part ``getattr`` probing + ``json.dumps`` per line
+  (re-encoded to bytes as Starlette does) against ``normalize_event`` +
+  ``NDJSONStream``;
+- disconnect detection: N idle streams polling ``is_disconnected()`` every
+  100 ms against N ``cancel_on_disconnect`` watchers blocked on ``receive()``.
+
+Reports wall time, CPU time and bytes/chunks sent.
+
+Usage:
+    uv run python scripts/benchmark_chat_stream.py --streams 200 --deltas 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+sys.path.append(os.getcwd())
+
+from google.adk.events import Event
+from google.genai import types
+
+from sre_agent.api.helpers.stream_transport import (
+    NDJSONStream,
+    PartKind,
+    StreamTransportConfig,
+    cancel_on_disconnect,
+    normalize_event,
+)
+
+
+def build_turn(deltas: int, tools: int) -> list[Event]:
+    """Build one synthetic turn: streamed text with interleaved tool calls."""
+    events: list[Event] = []
+    for t in range(tools):
+        for i in range(deltas // max(tools, 1)):
+            events.append(
+                Event(
+                    author="sre_agent",
+                    partial=True,
+                    content=types.Content(
+                        role="model",
+                        parts=[types.Part.from_text(text=f"token{i} ")],
+                    ),
+                )
+            )
+        call = types.FunctionCall(
+            id=f"fc-{t}", name="list_log_entries", args={"filter": "severity>=ERROR"}
+        )
+        events.append(
+            Event(
+                author="sre_agent",
+                content=types.Content(
+                    role="model", parts=[types.Part(function_call=call)]
+                ),
+            )
+        )
+        response = types.FunctionResponse(
+            id=f"fc-{t}",
+            name="list_log_entries",
+            response={"entries": [{"severity": "ERROR", "message": "x" * 80}] * 20},
+        )
+        events.append(
+            Event(
+                author="sre_agent",
+                content=types.Content(
+                    role="user", parts=[types.Part(function_response=response)]
+                ),
+            )
+        )
+    return events
+
+
+async def fake_runner(turn: list[Event]) -> AsyncIterator[Event]:
+    """Yield the turn's events, giving other streams a turn in between."""
+    for event in turn:
+        yield event
+        await asyncio.sleep(0)
+
+
+def legacy_frames(event: Any) -> list[str]:
+    """The pre-transport per-part extraction and encoding."""
+    lines: list[str] = []
+    content = getattr(event, "content", None)
+    parts = getattr(content, "parts", []) or [] if content else []
+    for part in parts:
+        text = getattr(part, "text", None)
+        if text is None and isinstance(part, dict):
+            text = part.get("text")
+        if text and isinstance(text, str):
+            lines.append(json.dumps({"type": "text", "content": text}) + "\n")
+        fc = getattr(part, "function_call", None)
+        if fc is None and isinstance(part, dict):
+            fc = part.get("function_call")
+        if fc:
+            args = fc.args if not isinstance(fc, dict) else fc.get("args")
+            lines.append(
+                json.dumps({"type": "tool_call", "tool_name": fc.name, "args": args})
+                + "\n"
+            )
+        fr = getattr(part, "function_response", None)
+        if fr is None and isinstance(part, dict):
+            fr = part.get("function_response")
+        if fr:
+            result = getattr(fr, "response", None) or getattr(fr, "result", None)
+            lines.append(
+                json.dumps(
+                    {"type": "tool_response", "tool_name": fr.name, "result": result}
+                )
+                + "\n"
+            )
+    return lines
+
+
+async def legacy_stream(turn: list[Event]) -> tuple[int, int]:
+    """Consume a turn the legacy way; return (bytes, chunks) sent."""
+    sent = chunks = 0
+    async for event in fake_runner(turn):
+        for line in legacy_frames(event):
+            sent += len(line.encode("utf-8"))  # Starlette encodes str chunks
+            chunks += 1
+    return sent, chunks
+
+
+async def transport_stream(turn: list[Event], window_ms: float) -> tuple[int, int]:
+    """Consume a turn through the stream transport; return (bytes, chunks)."""
+    stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=window_ms))
+    sent = chunks = 0
+    async for event in fake_runner(turn):
+        for part in normalize_event(event):
+            if part.kind is PartKind.TEXT:
+                stream.write_text(part.text)
+            elif part.kind is PartKind.TOOL_CALL:
+                stream.write(
+                    {
+                        "type": "tool_call",
+                        "tool_name": part.tool_name,
+                        "args": part.args,
+                    }
+                )
+            elif part.kind is PartKind.TOOL_RESPONSE:
+                stream.write(
+                    {
+                        "type": "tool_response",
+                        "tool_name": part.tool_name,
+                        "result": part.result,
+                    }
+                )
+        chunk = stream.take(final=event.partial is not True)
+        if chunk:
+            sent += len(chunk)
+            chunks += 1
+    if chunk := stream.take():
+        sent += len(chunk)
+        chunks += 1
+    return sent, chunks
+
+
+class IdleRequest:
+    """A connected client: ``receive()`` blocks, ``is_disconnected()`` is False."""
+
+    def __init__(self) -> None:
+        """Create the request with an unset disconnect flag."""
+        self.gone = asyncio.Event()
+
+    async def receive(self) -> dict[str, str]:
+        """Block until the client disconnects."""
+        await self.gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def is_disconnected(self) -> bool:
+        """Report the disconnect flag."""
+        return self.gone.is_set()
+
+
+async def poll_disconnect(request: IdleRequest) -> None:
+    """The legacy 100 ms disconnect poller."""
+    while not await request.is_disconnected():
+        await asyncio.sleep(0.1)
+
+
+async def measure(label: str, coro: Any) -> Any:
+    """Await ``coro`` and print its wall and CPU time."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = await coro
+    print(
+        f"{label:<34} wall={time.perf_counter() - wall:7.3f}s "
+        f"cpu={time.process_time() - cpu:7.3f}s"
+    )
+    return result
+
+
+async def main() -> None:
+    """Run the encoding and disconnect-detection comparisons."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=200)
+    parser.add_argument("--deltas", type=int, default=200)
+    parser.add_argument("--tools", type=int, default=4)
+    parser.add_argument("--window-ms", type=float, default=25.0)
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    turn = build_turn(args.deltas, args.tools)
+    print(f"{args.streams} streams x {len(turn)} events per turn")
+
+    for label, factory in (
+        ("legacy json.dumps per line", lambda: legacy_stream(turn)),
+        ("transport (window 0ms)", lambda: transport_stream(turn, 0.0)),
+        (
+            f"transport (window {args.window_ms:g}ms)",
+            lambda: transport_stream(turn, args.window_ms),
+        ),
+    ):
+        results = await measure(
+            label, asyncio.gather(*(factory() for _ in range(args.streams)))
+        )
+        sent = sum(r[0] for r in results)
+        chunks = sum(r[1] for r in results)
+        print(f"{'':<34} {sent / 1e6:7.2f} MB in {chunks} chunks")
+
+    async def idle(watch: Any) -> None:
+        requests = [IdleRequest() for _ in range(args.streams)]
+        tasks = [asyncio.create_task(watch(r)) for r in requests]
+        await asyncio.sleep(args.idle_seconds)
+        for request in requests:
+            request.gone.set()
+        await asyncio.gather(*tasks)
+
+    await measure(
+        f"idle {args.idle_seconds:g}s: poll is_disconnected", idle(poll_disconnect)
+    )
+    await measure(
+        f"idle {args.idle_seconds:g}s: await http.disconnect",
+        idle(lambda r: cancel_on_disconnect(r, None, "bench")),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
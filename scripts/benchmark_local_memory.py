@@ -0,0 +1,153 @@
+"""Benchmark local memory search over a synthetic corpus of findings.
+
+Seeds a temporary SQLite database with N synthetic findings spread across
+users, then compares the legacy ``LIKE %query%`` scan against the FTS5/BM25
+search (lexical only and hybrid) of ``LocalMemoryService``.
+
+Usage:
+    uv run python scripts/benchmark_local_memory.py --findings 100000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.append(os.getcwd())
+
+from sre_agent.memory.local import (
+    LocalMemoryService,
+    _pack_vector,
+    hashed_ngram_vector,
+    scope_tokens,
+)
+
+SERVICES = ["checkout", "payments", "frontend", "inventory", "auth", "search"]
+SYMPTOMS = [
+    "p99 latency spike",
+    "OOMKilled pods",
+    "connection pool exhausted",
+    "5xx error rate above SLO",
+    "CrashLoopBackOff after deploy",
+    "disk pressure on node",
+    "certificate expired",
+    "DNS resolution timeout",
+]
+CAUSES = [
+    "bad config push",
+    "noisy neighbour",
+    "memory leak in cache",
+    "database lock contention",
+    "quota exhaustion",
+    "upstream dependency outage",
+]
+QUERIES = [
+    "connection pool exhausted checkout",
+    "OOMKilled memory leak",
+    "latency spike payments",
+    "certificate expired",
+    "dns timeout",
+    "lock contention database",
+]
+
+
+def seed(db_path: str, findings: int, users: int) -> None:
+    """Insert synthetic findings in bulk."""
+    LocalMemoryService(db_path=db_path)  # create the schema
+    rng = random.Random(42)
+    rows = []
+    for _ in range(findings):
+        content = (
+            f"{rng.choice(SYMPTOMS)} in {rng.choice(SERVICES)} caused by "
+            f"{rng.choice(CAUSES)} (incident {rng.randint(1, 10**6)})"
+        )
+        user_id = f"user{rng.randrange(users)}@example.com"
+        rows.append(
+            (
+                str(uuid.uuid4()),
+                user_id,
+                "bench",
+                content,
+                json.dumps({"user_id": user_id, "tool": "bench"}),
+                scope_tokens(user_id),
+                _pack_vector(hashed_ngram_vector(content)),
+            )
+        )
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO memories (id, user_id, session_id, content, metadata, "
+            "scope_tokens, embedding) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+
+def like_search(db_path: str, query: str, limit: int) -> None:
+    """Legacy search: unindexed substring scan, newest first."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "SELECT id, content, metadata FROM memories WHERE content LIKE ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (f"%{query}%", limit * 2),
+        ).fetchall()
+
+
+def report(name: str, samples: list[float]) -> None:
+    """Print latency percentiles in milliseconds."""
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{name:<22} p50={statistics.median(samples):8.2f}ms "
+        f"p95={p95:8.2f}ms max={samples[-1]:8.2f}ms"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--findings", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench_memory.db")
+        start = time.perf_counter()
+        seed(db_path, args.findings, args.users)
+        print(f"Seeded {args.findings} findings in {time.perf_counter() - start:.1f}s")
+
+        hybrid = LocalMemoryService(db_path=db_path)
+        lexical = LocalMemoryService(db_path=db_path, vector_weight=0.0)
+        user = "user0@example.com"
+
+        timings: dict[str, list[float]] = {
+            "LIKE scan (legacy)": [],
+            "FTS5 BM25": [],
+            "FTS5 BM25 + vectors": [],
+        }
+        for _ in range(args.iterations):
+            for query in QUERIES:
+                t0 = time.perf_counter()
+                like_search(db_path, query, args.limit)
+                t1 = time.perf_counter()
+                await lexical.search_memory(query=query, limit=args.limit, user_id=user)
+                t2 = time.perf_counter()
+                await hybrid.search_memory(query=query, limit=args.limit, user_id=user)
+                t3 = time.perf_counter()
+                timings["LIKE scan (legacy)"].append((t1 - t0) * 1000)
+                timings["FTS5 BM25"].append((t2 - t1) * 1000)
+                timings["FTS5 BM25 + vectors"].append((t3 - t2) * 1000)
+
+        for name, samples in timings.items():
+            report(name, samples)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
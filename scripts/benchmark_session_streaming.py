@@ -0,0 +1,128 @@
+"""Benchmark chat streaming latency with inline vs write-behind event persistence.
+
+Simulates the ``/api/genui/chat`` hot path: a fake runner produces N events per
+turn for several concurrent sessions, and each event is persisted before its
+chunk is "yielded". Compares awaiting ``ADKSessionManager.append_event`` per
+event (legacy) against the ``SessionEventJournal`` write-behind path, and
+reports time-to-first-chunk and inter-chunk latency.
+
+Storage is a temporary SQLite ``DatabaseSessionService``; ``--write-latency-ms``
+adds a delay per write to approximate the Vertex AI session API round trip.
+
+Usage:
+    uv run python scripts/benchmark_session_streaming.py --streams 20 --events 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.append(os.getcwd())
+
+from google.adk.events import Event
+from google.genai import types
+
+from sre_agent.services.session import ADKSessionManager
+
+
+def make_event(i: int) -> Event:
+    """Build a final text event like the ones the runner streams."""
+    return Event(
+        invocation_id=str(uuid.uuid4()),
+        author="sre_agent",
+        content=types.Content(
+            role="model", parts=[types.Part.from_text(text=f"chunk {i} " * 20)]
+        ),
+        timestamp=time.time(),
+    )
+
+
+def add_write_latency(manager: ADKSessionManager, latency_ms: float) -> None:
+    """Delay every storage write to emulate a remote session backend."""
+    if latency_ms <= 0:
+        return
+    service = manager.session_service
+    original = service.append_event
+
+    async def slow_append(session, event):  # type: ignore[no-untyped-def]
+        await asyncio.sleep(latency_ms / 1000)
+        return await original(session, event)
+
+    service.append_event = slow_append
+
+
+async def stream(
+    manager: ADKSessionManager, events: int, journaled: bool
+) -> tuple[float, list[float]]:
+    """Run one turn and return (time to first chunk, inter-chunk gaps) in ms."""
+    session = await manager.create_session(user_id=f"bench-{uuid.uuid4().hex[:8]}")
+    journal = manager.open_journal(session) if journaled else None
+    start = last = time.perf_counter()
+    first = 0.0
+    gaps: list[float] = []
+    for i in range(events):
+        event = make_event(i)
+        if journal is not None:
+            await journal.append(event)
+        else:
+            await manager.append_event(session, event)
+        now = time.perf_counter()  # the chunk would be yielded here
+        if i == 0:
+            first = (now - start) * 1000
+        else:
+            gaps.append((now - last) * 1000)
+        last = now
+        await asyncio.sleep(0)  # the runner yields control between events
+    if journal is not None:
+        await journal.close()
+    return first, gaps
+
+
+def report(name: str, firsts: list[float], gaps: list[float]) -> None:
+    """Print latency percentiles in milliseconds."""
+    gaps.sort()
+    p99 = gaps[max(int(len(gaps) * 0.99) - 1, 0)]
+    print(
+        f"{name:<14} first chunk p50={statistics.median(firsts):8.2f}ms "
+        f"max={max(firsts):8.2f}ms | inter-chunk p50={statistics.median(gaps):7.2f}ms "
+        f"p99={p99:7.2f}ms"
+    )
+
+
+async def main() -> None:
+    """Run both persistence modes and print latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--write-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["USE_DATABASE_SESSIONS"] = "true"
+        os.environ["SESSION_DB_PATH"] = os.path.join(tmp, "sessions.db")
+        os.environ.pop("SRE_AGENT_ID", None)
+        manager = ADKSessionManager()
+        add_write_latency(manager, args.write_latency_ms)
+
+        for name, journaled in (("inline", False), ("write-behind", True)):
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(stream(manager, args.events, journaled) for _ in range(args.streams))
+            )
+            elapsed = time.perf_counter() - start
+            firsts = [first for first, _ in results]
+            gaps = [gap for _, session_gaps in results for gap in session_gaps]
+            report(name, firsts, gaps)
+            print(f"{'':<14} {args.streams} streams persisted in {elapsed:.2f}s")
+
+        # Close pooled aiosqlite connections so their threads don't block exit.
+        await manager.session_service.db_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
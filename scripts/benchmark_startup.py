@@ -0,0 +1,108 @@
+"""Benchmark cold-start latency and enforce startup budgets.
+
+Each measurement runs in a fresh interpreter, so nothing is shared between
+runs except the OS page cache:
+
+- import: ``import sre_agent.agent`` (agents and tool sets are built lazily,
+  so this must stay small);
+- ttfb: create the FastAPI app, run its lifespan and receive the first
+  ``GET /health`` response;
+- warm-up: build every registered agent through the registry's warm-up
+  hook, which is what the first agent request pays on a cold replica;
+- first access: ``root_agent`` lookup after warm-up.
+
+The median of ``--runs`` runs is compared with each budget; the script exits
+with status 1 if any budget is exceeded, so it can gate CI.
+
+Usage:
+    uv run python scripts/benchmark_startup.py --runs 3 --import-budget 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PROBE = r"""
+import json, sys, time
+
+start = time.perf_counter()
+mode = sys.argv[1]
+if mode == "import":
+    import sre_agent.agent  # noqa: F401
+    result = {"import": time.perf_counter() - start}
+elif mode == "ttfb":
+    from fastapi.testclient import TestClient
+    from sre_agent.api.app import create_app
+
+    with TestClient(create_app()) as client:
+        client.get("/health")
+        result = {"ttfb": time.perf_counter() - start}
+else:
+    from sre_agent.core.agent_registry import get_agent_registry
+
+    registry = get_agent_registry()
+    warm = time.perf_counter()
+    registry.warm_up()
+    result = {"warm_up": time.perf_counter() - warm}
+    lookup = time.perf_counter()
+    from sre_agent.agent import root_agent  # noqa: F401
+    result["first_access"] = time.perf_counter() - lookup
+print("RESULT " + json.dumps(result))
+"""
+
+
+def run_probe(mode: str) -> dict[str, float]:
+    """Run one probe in a fresh interpreter and return its timings."""
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, mode],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.getcwd(),
+        check=True,
+    ).stdout
+    line = next(li for li in out.splitlines() if li.startswith("RESULT "))
+    timings: dict[str, float] = json.loads(line.removeprefix("RESULT "))
+    return timings
+
+
+def main() -> int:
+    """Run the probes, print medians and check them against the budgets."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--import-budget", type=float, default=5.0)
+    parser.add_argument("--ttfb-budget", type=float, default=15.0)
+    parser.add_argument("--warm-up-budget", type=float, default=30.0)
+    parser.add_argument("--first-access-budget", type=float, default=0.05)
+    args = parser.parse_args()
+
+    samples: dict[str, list[float]] = {}
+    for mode in ("import", "ttfb", "warm_up"):
+        for _ in range(args.runs):
+            for key, value in run_probe(mode).items():
+                samples.setdefault(key, []).append(value)
+
+    budgets = {
+        "import": args.import_budget,
+        "ttfb": args.ttfb_budget,
+        "warm_up": args.warm_up_budget,
+        "first_access": args.first_access_budget,
+    }
+    failed = False
+    for key, budget in budgets.items():
+        median = statistics.median(samples[key])
+        ok = median <= budget
+        failed |= not ok
+        print(
+            f"{key:<13} {median:8.3f}s  budget {budget:6.2f}s  "
+            f"{'ok' if ok else 'OVER BUDGET'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
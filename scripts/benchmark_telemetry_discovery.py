@@ -0,0 +1,113 @@
+"""Benchmark telemetry source discovery against a simulated GCP backend.
+
+Every discovery request is answered by an in-process ``httpx.MockTransport``
+after ``--latency-ms``, emulating the Logging, Observability and BigQuery
+REST round trips. Compares:
+
+- sequential: the legacy walk, one request at a time (linked log dataset,
+  trace strategies 1 and 2, then ``--datasets`` table listings);
+- catalog cold: one concurrent :class:`TelemetryCatalog` discovery;
+- catalog warm: ``--lookups`` cached lookups of the same project.
+
+Usage:
+    uv run python scripts/benchmark_telemetry_discovery.py --datasets 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+
+sys.path.append(os.getcwd())
+
+from sre_agent.services.telemetry_catalog import (
+    TelemetryCatalog,
+    TelemetryCatalogConfig,
+)
+
+PROJECT = "bench-project"
+
+
+def make_handler(datasets: int, latency_s: float) -> httpx.MockTransport:
+    """Build a transport with ``datasets`` datasets; the last holds the exports."""
+    names = [f"dataset_{i}" for i in range(datasets)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency_s)
+        path = request.url.path
+        if path.endswith("/buckets"):
+            bucket = f"projects/{PROJECT}/locations/global/buckets/_Default"
+            return httpx.Response(200, json={"buckets": [{"name": bucket}]})
+        if path.endswith("/links"):
+            return httpx.Response(200, json={"links": []})
+        if path.endswith(f"/projects/{PROJECT}/datasets"):
+            refs = [{"datasetReference": {"datasetId": n}} for n in names]
+            return httpx.Response(200, json={"datasets": refs})
+        if path.endswith("/tables"):
+            tables = ["_AllSpans", "_AllLogs"] if names[-1] in path else []
+            refs = [{"tableReference": {"tableId": t}} for t in tables]
+            return httpx.Response(200, json={"tables": refs})
+        if "/tables/" in path:
+            return httpx.Response(200, json={"schema": {"fields": [{"name": "x"}]}})
+        return httpx.Response(404, json={})
+
+    return httpx.MockTransport(handler)
+
+
+async def sequential(transport: httpx.MockTransport, datasets: int) -> int:
+    """Issue the legacy request sequence one at a time; return requests made."""
+    base = f"https://example/{PROJECT}"
+    paths = [
+        "/locations/global/buckets/_Default/links",
+        "/locations/-/buckets",
+        "/locations/global/buckets/_Default/links",
+        "/locations/global/buckets",
+        "/locations/global/buckets/_Default/datasets/Spans/links",
+        "/locations/us/buckets",
+        "/locations/us/buckets/_Default/datasets/Spans/links",
+        f"/projects/{PROJECT}/datasets",
+    ] + [f"/projects/{PROJECT}/datasets/dataset_{i}/tables" for i in range(datasets)]
+    async with httpx.AsyncClient(transport=transport) as client:
+        for path in paths:
+            await client.get(base + path)
+    return len(paths)
+
+
+async def main() -> None:
+    """Run the three modes and print wall times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--datasets", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+
+    transport = make_handler(args.datasets, args.latency_ms / 1000)
+    catalog = TelemetryCatalog(
+        TelemetryCatalogConfig(db_path="", max_datasets=args.datasets),
+        transport=transport,
+    )
+
+    start = time.perf_counter()
+    requests = await sequential(transport, args.datasets)
+    print(f"sequential     {time.perf_counter() - start:8.3f}s ({requests} requests)")
+
+    with patch("sre_agent.services.telemetry_catalog._resolve_token", return_value="t"):
+        start = time.perf_counter()
+        sources = await catalog.get(PROJECT)
+        print(f"catalog cold   {time.perf_counter() - start:8.3f}s -> {sources.mode}")
+
+        start = time.perf_counter()
+        for _ in range(args.lookups):
+            await catalog.get(PROJECT)
+        per_lookup = (time.perf_counter() - start) / args.lookups * 1e6
+        print(f"catalog warm   {per_lookup:8.2f}us per lookup")
+
+    await catalog.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
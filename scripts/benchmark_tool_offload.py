@@ -0,0 +1,143 @@
+"""Benchmark event-loop lag while CPU-heavy tools run concurrently.
+
+A probe coroutine sleeps for ``--tick-ms`` in a loop and records how late
+each wake-up is; that lateness is what every other stream on the replica
+waits. ``--concurrency`` ``extract_log_patterns`` calls over ``--entries``
+synthetic log entries run alongside it in three modes:
+
+- inline: the undecorated body called on the event loop (how ADK ran the
+  synchronous tool before it was marked ``cpu-heavy``);
+- thread: the body in ``asyncio.to_thread`` (the fallback path);
+- pool: the decorated tool, which runs in the tool process pool.
+
+The pool is started and warmed up before measuring. The script exits with
+status 1 if the p99 lag in pool mode exceeds ``--lag-budget-ms``, so it can
+gate CI.
+
+Usage:
+    uv run python scripts/benchmark_tool_offload.py --entries 20000 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ["SRE_AGENT_CPU_POOL"] = "true"
+
+
+def make_logs(count: int) -> list[dict[str, Any]]:
+    """Synthetic log entries with a realistic spread of templates."""
+    rng = random.Random(42)
+    templates = [
+        "GET /api/v1/orders/{n} returned 200 in {ms}ms",
+        "Connection to db-{n}.internal timed out after {ms}ms",
+        "User {n} failed authentication: invalid token",
+        "Cache miss for key session:{n}, fetching from origin",
+        "Retrying request {n} (attempt {a}/5) after {ms}ms backoff",
+        "OOMKilled container worker-{n} (limit 512Mi)",
+    ]
+    severities = ["INFO", "INFO", "WARNING", "ERROR"]
+    return [
+        {
+            "textPayload": rng.choice(templates).format(
+                n=rng.randint(1, 10_000), ms=rng.randint(1, 5000), a=rng.randint(1, 5)
+            ),
+            "severity": rng.choice(severities),
+            "timestamp": f"2026-01-01T00:00:{i % 60:02d}Z",
+        }
+        for i in range(count)
+    ]
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]], concurrency: int, tick: float
+) -> dict[str, float]:
+    """Run ``concurrency`` calls while probing event-loop lag."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def probe() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            lags.append(time.perf_counter() - start - tick)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.sleep(tick * 2)
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    done.set()
+    await probe_task
+
+    lags.sort()
+    return {
+        "wall_s": wall,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Measure every mode against the same input."""
+    from sre_agent.tools.analysis.logs.patterns import extract_log_patterns
+    from sre_agent.tools.common.execution import get_tool_process_pool
+
+    logs = make_logs(args.entries)
+    body = extract_log_patterns.__wrapped__
+    pool = get_tool_process_pool()
+    assert pool is not None
+    await asyncio.to_thread(pool.warm_up, ("sre_agent.tools.analysis.logs.patterns",))
+
+    async def inline() -> Any:
+        return body(logs)
+
+    async def thread() -> Any:
+        return await asyncio.to_thread(body, logs)
+
+    async def pooled() -> Any:
+        return await extract_log_patterns(logs)
+
+    tick = args.tick_ms / 1000
+    results = {}
+    for name, call in (("inline", inline), ("thread", thread), ("pool", pooled)):
+        results[name] = await measure(call, args.concurrency, tick)
+    return results
+
+
+def main() -> int:
+    """Run the benchmark, print a table and check the pool's lag budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--tick-ms", type=float, default=10.0)
+    parser.add_argument("--lag-budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'mode':<8} {'wall':>8} {'lag p50':>10} {'lag p99':>10} {'lag max':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<8} {r['wall_s']:7.2f}s {r['lag_p50_ms']:8.1f}ms "
+            f"{r['lag_p99_ms']:8.1f}ms {r['lag_max_ms']:8.1f}ms"
+        )
+
+    p99 = results["pool"]["lag_p99_ms"]
+    ok = p99 <= args.lag_budget_ms
+    print(
+        f"pool p99 lag {p99:.1f}ms  budget {args.lag_budget_ms:.1f}ms  "
+        f"{'ok' if ok else 'OVER BUDGET'}"
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
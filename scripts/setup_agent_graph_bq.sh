@@ -583,99 +583,24 @@ bq query --use_legacy_sql=false --project_id "$PROJECT_ID" "$BACKFILL_SQL"
 # 7. Create scheduled query for hourly incremental updates
 echo "🔹 Preparing scheduled query for hourly updates..."
 
-# Define the SQL for the scheduled query.
-# We use a double-quoted heredoc so that $PROJECT_ID and $GRAPH_DATASET are expanded.
-# We must escape backticks so they remain in the final SQL.
-HOURLY_UPDATE_SQL=$(cat << SQL_UPDATE_EOF
-INSERT INTO \`$PROJECT_ID.$GRAPH_DATASET.agent_graph_hourly\`
-WITH RawEdges AS (
-  SELECT
-    e.trace_id, e.session_id,
-    TIMESTAMP_TRUNC(n_dst.start_time, HOUR) as time_bucket,
-    e.source_node_id as source_id, n_src.node_type as source_type,
-    e.destination_node_id as target_id, n_dst.node_type as target_type,
-    e.edge_weight as call_count,
-    e.total_duration_ms,
-    e.total_tokens,
-    e.error_count as edge_error_count,
-    n_dst.total_input_tokens as input_tokens,
-    n_dst.total_output_tokens as output_tokens,
-    n_dst.service_name,
-    n_dst.node_description,
-    n_dst.start_time
-  FROM \`$PROJECT_ID.$GRAPH_DATASET.agent_topology_edges\` e
-  JOIN \`$PROJECT_ID.$GRAPH_DATASET.agent_topology_nodes\` n_dst
-    ON e.trace_id = n_dst.trace_id AND e.destination_node_id = n_dst.logical_node_id
-  JOIN \`$PROJECT_ID.$GRAPH_DATASET.agent_topology_nodes\` n_src
-    ON e.trace_id = n_src.trace_id AND e.source_node_id = n_src.logical_node_id
-  WHERE n_dst.start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 2 HOUR)
-    AND n_dst.start_time < TIMESTAMP_TRUNC(CURRENT_TIMESTAMP(), HOUR)
-),
-CostPaths AS (
-  SELECT re.*,
-    COALESCE(input_tokens, 0) * CASE
-      WHEN target_id LIKE '%flash%' THEN 0.00000015
-      WHEN target_id LIKE '%2.5-pro%' THEN 0.00000125
-      WHEN target_id LIKE '%1.5-pro%' THEN 0.00000125
-      ELSE 0.0000005
-    END
-    + COALESCE(output_tokens, 0) * CASE
-      WHEN target_id LIKE '%flash%' THEN 0.0000006
-      WHEN target_id LIKE '%2.5-pro%' THEN 0.00001
-      WHEN target_id LIKE '%1.5-pro%' THEN 0.000005
-      ELSE 0.000002
-    END AS span_cost
-  FROM RawEdges re
-),
--- Deduplicate: skip buckets that were already processed
-ExistingBuckets AS (
-  SELECT DISTINCT time_bucket FROM \`$PROJECT_ID.$GRAPH_DATASET.agent_graph_hourly\`
-  WHERE time_bucket >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 2 HOUR)
-),
-NewPaths AS (
-  SELECT cp.* FROM CostPaths cp
-  LEFT JOIN ExistingBuckets eb ON cp.time_bucket = eb.time_bucket
-  WHERE eb.time_bucket IS NULL
-)
-SELECT
-  time_bucket,
-  source_id, target_id, source_type, target_type,
-  SUM(call_count) AS call_count,
-  SUM(edge_error_count) AS error_count,
-  SUM(total_tokens) AS edge_tokens,
-  SUM(input_tokens) AS input_tokens,
-  SUM(output_tokens) AS output_tokens,
-  ROUND(SUM(span_cost), 6) AS total_cost,
-  SUM(total_duration_ms) AS sum_duration_ms,
-  ROUND(MAX(total_duration_ms), 2) AS max_p95_duration_ms,
-  COUNT(DISTINCT session_id) AS unique_sessions,
-  CAST(NULL AS STRING) AS sample_error,
-  SUM(total_tokens) AS node_total_tokens,
-  SUM(input_tokens) AS node_input_tokens,
-  SUM(output_tokens) AS node_output_tokens,
-  SUM(edge_error_count) > 0 AS node_has_error,
-  SUM(total_duration_ms) AS node_sum_duration_ms,
-  ROUND(MAX(total_duration_ms), 2) AS node_max_p95_duration_ms,
-  SUM(edge_error_count) AS node_error_count,
-  SUM(call_count) AS node_call_count,
-  ROUND(SUM(span_cost), 6) AS node_total_cost,
-  ANY_VALUE(node_description) AS node_description,
-  SUM(IF(target_type = 'Tool', call_count, 0)) AS tool_call_count,
-  SUM(IF(target_type = 'LLM', call_count, 0)) AS llm_call_count,
-  -- Downstream rollup (populated with direct values; full rollup computed at query time)
-  SUM(COALESCE(input_tokens, 0) + COALESCE(output_tokens, 0)) AS downstream_total_tokens,
-  ROUND(SUM(span_cost), 6) AS downstream_total_cost,
-  SUM(IF(target_type = 'Tool', call_count, 0)) AS downstream_tool_call_count,
-  SUM(IF(target_type = 'LLM', call_count, 0)) AS downstream_llm_call_count,
-  ARRAY_AGG(DISTINCT session_id IGNORE NULLS) AS session_ids,
-  ANY_VALUE(service_name) AS service_name
-FROM NewPaths
-GROUP BY time_bucket, source_id, target_id, source_type, target_type;
-SQL_UPDATE_EOF
-)
+# The scheduled script MERGEs closed hours since the watermark in
+# agent_graph_rollup_state, exactly like the backend's /rollup/refresh.
+# It is generated by sre_agent/services/agent_graph_rollup.py
+# (build_scheduled_refresh_sql) so both can run without writing duplicate
+# hourly rows. Set PYTHON to override the interpreter (default: uv run python).
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+HOURLY_UPDATE_SQL=$(cd "$REPO_ROOT" && ${PYTHON:-uv run python} -m sre_agent.services.agent_graph_rollup "$PROJECT_ID" "$GRAPH_DATASET")
+
+CONFIG_NAME="Agent Graph Hourly Rollup"
+
+# Retire the legacy INSERT-based refresh; it would duplicate hourly rows.
+LEGACY_CONFIG=$(bq ls --transfer_config --project_id="$PROJECT_ID" --transfer_location=US --format=prettyjson | jq -r '.[] | select(.displayName == "Agent Graph Hourly Refresh") | .name' || true)
+for config in $LEGACY_CONFIG; do
+  echo "🔹 Removing legacy scheduled query $config..."
+  bq rm -f --transfer_config "$config"
+done
 
 # Check if scheduled query already exists
-CONFIG_NAME="Agent Graph Hourly Refresh"
 EXISTING_CONFIG=$(bq ls --transfer_config --project_id="$PROJECT_ID" --transfer_location=US --format=prettyjson | jq -r ".[] | select(.displayName == \"$CONFIG_NAME\") | .name" || true)
 
 if [[ -z "$EXISTING_CONFIG" ]]; then
@@ -686,7 +611,6 @@ if [[ -z "$EXISTING_CONFIG" ]]; then
 
   bq mk --transfer_config \
     --project_id="$PROJECT_ID" \
-    --target_dataset="$GRAPH_DATASET" \
     --display_name="$CONFIG_NAME" \
     --schedule="every 1 hours" \
     --data_source=scheduled_query \
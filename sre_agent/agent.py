@@ -54,14 +54,14 @@ override_feature_enabled(FeatureName.JSON_SCHEMA_FOR_FUNC_DECL, True)
 
 import asyncio
 import functools
+import importlib
 import json
 import logging
+import threading
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 from typing import Any
 
-# Determine environment settings for Agent initialization
-import google.auth
 from google.adk.agents import BaseAgent, LlmAgent
 from google.adk.tools import AgentTool  # type: ignore[attr-defined]
 from google.adk.tools.base_toolset import BaseToolset
@@ -75,6 +75,7 @@ from .auth import (
     set_current_project_id,
     set_current_user_id,
 )
+from .core.agent_registry import AgentRegistry, get_agent_registry
 from .core.router import route_request
 
 # Council tools
@@ -83,217 +84,20 @@ from .memory.factory import get_memory_manager
 from .model_config import get_model_name
 from .prompt import GREETING_PROMPT, SRE_AGENT_PROMPT
 from .schema import BaseToolResponse, InvestigationPhase, ToolStatus
-
-# Import sub-agents
-from .sub_agents import (
-    # Agent debugging sub-agent
-    agent_debugger,
-    # Trace analysis sub-agents
-    aggregate_analyzer,
-    # Alert analysis sub-agents
-    alert_analyst,
-    get_metrics_analyst,
-    get_metrics_analyzer,
-    get_research_agent_tool,
-    # Log analysis sub-agents
-    log_analyst,
-    metrics_analyst,
-    metrics_analyzer,
-    root_cause_analyst,
-    trace_analyst,
-)
-from .tools import (
-    add_finding_to_memory,
-    # Agent Trace Analysis
-    analyze_agent_token_usage,
-    # BigQuery tools
-    analyze_aggregate_metrics,
-    # Self-improvement tools
-    analyze_and_learn_from_traces,
-    # Additional BQ tools
-    analyze_bigquery_log_patterns,
-    # Critical path analysis tools
-    analyze_critical_path,
-    # SLO/SLI tools
-    analyze_error_budget_burn,
-    # GKE tools
-    analyze_hpa_events,
-    analyze_log_anomalies,
-    # SLO Analysis
-    analyze_multi_window_burn_rate,
-    analyze_node_conditions,
-    analyze_signal_correlation_strength,
-    analyze_trace_comprehensive,
-    analyze_trace_patterns,
-    analyze_upstream_downstream_impact,
-    build_call_graph,
-    build_cross_signal_timeline,
-    # Service dependency tools
-    build_service_dependency_graph,
-    calculate_critical_path_contribution,
-    calculate_series_stats,
-    calculate_span_durations,
-    compare_log_patterns,
-    compare_metric_windows,
-    compare_span_timings,
-    compare_time_periods,
-    # Investigation completion
-    complete_investigation,
-    compute_latency_statistics,
-    # Change Correlation
-    correlate_changes_with_incident,
-    # SLO correlation
-    correlate_incident_with_slo_impact,
-    correlate_logs_with_trace,
-    correlate_metrics_with_traces_via_exemplars,
-    # Cross-signal correlation tools
-    correlate_trace_with_kubernetes,
-    correlate_trace_with_metrics,
-    detect_agent_anti_patterns,
-    detect_all_sre_patterns,
-    detect_cascading_timeout,
-    detect_circular_dependencies,
-    detect_connection_pool_issues,
-    detect_latency_anomalies,
-    # Metrics analysis tools
-    detect_metric_anomalies,
-    detect_retry_storm,
-    detect_trend_changes,
-    # Discovery tools
-    discover_telemetry_sources,
-    # Remediation tools
-    estimate_remediation_risk,
-    # Exploration tools
-    explore_project_health,
-    extract_errors,
-    # Log pattern analysis tools
-    extract_log_patterns,
-    # Trace tools
-    fetch_trace,
-    fetch_web_page,
-    find_bottleneck_services,
-    find_example_traces,
-    find_exemplar_traces,
-    find_hidden_dependencies,
-    find_past_mistakes,
-    find_similar_past_incidents,
-    find_structural_differences,
-    find_successful_strategy,
-    # Remediation & Postmortem
-    generate_postmortem,
-    generate_remediation_suggestions,
-    get_alert,
-    # GKE tools
-    get_container_oom_events,
-    get_current_time,
-    get_gcloud_commands,
-    get_gke_cluster_health,
-    # SLO Golden Signals
-    get_golden_signals,
-    get_investigation_summary,
-    get_logs_for_trace,
-    get_pod_restart_events,
-    get_recommended_investigation_strategy,
-    get_slo_status,
-    get_trace_by_url,
-    get_workload_health_summary,
-    # GitHub Self-Healing tools
-    github_create_pull_request,
-    github_list_recent_commits,
-    github_read_file,
-    github_search_code,
-    list_agent_traces,
-    list_alert_policies,
-    # Alerting tools
-    list_alerts,
-    list_error_events,
-    # GCP direct API tools
-    list_gcp_projects,
-    list_log_entries,
-    list_metric_descriptors,
-    # SLO listing
-    list_slos,
-    list_time_series,
-    list_traces,
-    perform_causal_analysis,
-    # SLO prediction
-    predict_slo_violation,
-    query_data_agent,
-    # BigQuery Graph Tools
-    query_historical_trajectories,
-    query_promql,
-    reconstruct_agent_interaction,
-    # Research tools
-    search_memory,
-    select_traces_from_statistical_outliers,
-    select_traces_manually,
-    suggest_next_steps,
-    summarize_trace,
-    update_investigation_state,
-    validate_trace_quality,
-)
+from .sub_agents._init_env import init_sub_agent_env
 from .tools.common import adk_tool
 from .tools.config import get_tool_config_manager
 from .tools.mcp.gcp import (
     create_bigquery_mcp_toolset,
     create_logging_mcp_toolset,
     create_monitoring_mcp_toolset,
-    gcp_execute_sql,
     get_project_id_with_fallback,
-    mcp_get_table_info,
-    mcp_list_dataset_ids,
-    mcp_list_log_entries,
-    mcp_list_table_ids,
-    mcp_list_timeseries,
-    mcp_query_range,
 )
 from .tools.registry import get_tool_registry
-from .tools.reporting import synthesize_report
-
-# Sandbox Processing Tools
-from .tools.sandbox import (
-    execute_custom_analysis_in_sandbox,
-    get_sandbox_status,
-    summarize_log_entries_in_sandbox,
-    summarize_metric_descriptors_in_sandbox,
-    summarize_time_series_in_sandbox,
-    summarize_traces_in_sandbox,
-)
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
-# Determine environment settings for Agent initialization
-project_id = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GCP_PROJECT_ID")
-
-# Fallback: Try to get project from Application Default Credentials
-if not project_id:
-    try:
-        _, project_id = google.auth.default()
-        if project_id:
-            logger.info(f"🚀 Discovered project ID from credentials: {project_id}")
-    except Exception as e:
-        logger.debug(f"Could not discover project ID from credentials: {e}")
-
-location = os.environ.get("GCP_LOCATION") or os.environ.get(
-    "GOOGLE_CLOUD_LOCATION", "us-central1"
-)
-use_vertex = os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "true").lower() == "true"
-
-# Ensure Environment is configured for SDKs
-if project_id:
-    os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
-    os.environ["GCP_PROJECT_ID"] = project_id
-
-if project_id and os.environ.get("SRE_AGENT_DEPLOYMENT_MODE") != "true":
-    try:
-        import vertexai  # Deferred: saves ~40 s when agent.py is imported in tests
-
-        vertexai.init(project=project_id, location=location)
-        logger.info(f"✅ Initialized Vertex AI: {project_id} @ {location}")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Vertex AI: {e}")
-
 
 def emojify_agent(agent: LlmAgent | BaseAgent | Any) -> LlmAgent | BaseAgent | Any:
     """Wraps an LlmAgent or BaseAgent to add logging, credential injection, and OTel bridging.
@@ -590,6 +394,8 @@ async def run_aggregate_analysis(
         # 1. Auto-Discovery if needed
         if not dataset_id or not table_name:
             logger.info("Dataset or table not provided. Running discovery...")
+            from .tools import discover_telemetry_sources
+
             discovery_result = await discover_telemetry_sources(
                 tool_context=tool_context
             )
@@ -622,7 +428,7 @@ async def run_aggregate_analysis(
                 dataset_id = trace_table_full
                 table_name = "_AllSpans"
 
-        result = await AgentTool(aggregate_analyzer).run_async(
+        result = await AgentTool(_agent("aggregate_analyzer")).run_async(
             args={
                 "request": f"""
 Analyze trace data in BigQuery:
@@ -703,10 +509,10 @@ Compare them and report your findings on Latency, Errors, and Structure.
     if tool_context is None:
         raise ValueError("tool_context is required for run_async")
     results = await asyncio.gather(
-        AgentTool(trace_analyst).run_async(
+        AgentTool(_agent("trace_analyst")).run_async(
             args={"request": prompt}, tool_context=tool_context
         ),
-        AgentTool(log_analyst).run_async(
+        AgentTool(_agent("log_analyst")).run_async(
             args={"request": prompt}, tool_context=tool_context
         ),
         return_exceptions=True,
@@ -781,7 +587,7 @@ Determine the root cause (causality), check for recent changes (deployments), an
 """
 
     try:
-        result = await AgentTool(root_cause_analyst).run_async(
+        result = await AgentTool(_agent("root_cause_analyst")).run_async(
             args={"request": prompt}, tool_context=tool_context
         )
         return BaseToolResponse(
@@ -818,7 +624,7 @@ async def run_log_pattern_analysis(
     logger.info(f"Running log pattern analysis for filter: {log_filter}")
 
     try:
-        result = await AgentTool(log_analyst).run_async(
+        result = await AgentTool(_agent("log_analyst")).run_async(
             args={
                 "request": f"""
 Analyze log patterns and find anomalies:
@@ -1091,261 +897,495 @@ Please analyze the relevant telemetry data and provide your findings as a struct
 # Tool Registry for Configuration
 # ============================================================================
 
-TOOL_NAME_MAP = {
-    # Observability
-    "fetch_trace": fetch_trace,
-    "list_log_entries": list_log_entries,
-    "query_promql": query_promql,
-    "list_slos": list_slos,
-    "list_traces": list_traces,
-    "get_logs_for_trace": get_logs_for_trace,
-    "get_trace_by_url": get_trace_by_url,
-    "summarize_trace": summarize_trace,
-    "get_golden_signals": get_golden_signals,
-    "list_gcp_projects": list_gcp_projects,
-    "list_metric_descriptors": list_metric_descriptors,
-    # Analysis
-    "calculate_span_durations": calculate_span_durations,
-    "find_bottleneck_services": find_bottleneck_services,
-    "correlate_logs_with_trace": correlate_logs_with_trace,
-    "analyze_critical_path": analyze_critical_path,
-    "build_call_graph": build_call_graph,
-    "build_service_dependency_graph": build_service_dependency_graph,
-    "build_cross_signal_timeline": build_cross_signal_timeline,
-    "analyze_trace_patterns": analyze_trace_patterns,
-    "find_structural_differences": find_structural_differences,
-    "find_hidden_dependencies": find_hidden_dependencies,
-    # Metrics
-    "detect_metric_anomalies": detect_metric_anomalies,
-    "list_time_series": list_time_series,
-    "compare_metric_windows": compare_metric_windows,
-    "analyze_signal_correlation_strength": analyze_signal_correlation_strength,
-    "analyze_error_budget_burn": analyze_error_budget_burn,
-    "predict_slo_violation": predict_slo_violation,
-    # GKE / Infrastructure
-    "get_gke_cluster_health": get_gke_cluster_health,
-    "analyze_node_conditions": analyze_node_conditions,
-    "analyze_hpa_events": analyze_hpa_events,
-    "get_pod_restart_events": get_pod_restart_events,
-    "get_container_oom_events": get_container_oom_events,
-    "get_workload_health_summary": get_workload_health_summary,
-    # Alerts
-    "list_alerts": list_alerts,
-    "list_alert_policies": list_alert_policies,
-    "get_alert": get_alert,
-    # Advanced Diagnostics
-    "perform_causal_analysis": perform_causal_analysis,
-    "analyze_upstream_downstream_impact": analyze_upstream_downstream_impact,
-    "correlate_trace_with_kubernetes": correlate_trace_with_kubernetes,
-    "correlate_trace_with_metrics": correlate_trace_with_metrics,
-    "calculate_series_stats": calculate_series_stats,
-    "detect_trend_changes": detect_trend_changes,
-    # Pattern Analysis
-    "extract_log_patterns": extract_log_patterns,
-    "compare_log_patterns": compare_log_patterns,
-    "detect_all_sre_patterns": detect_all_sre_patterns,
-    "analyze_log_anomalies": analyze_log_anomalies,
-    "analyze_bigquery_log_patterns": analyze_bigquery_log_patterns,
-    # BigQuery Graph
-    "query_historical_trajectories": query_historical_trajectories,
-    "find_successful_strategy": find_successful_strategy,
-    "find_past_mistakes": find_past_mistakes,
-    # Root Cause
-    "detect_cascading_timeout": detect_cascading_timeout,
-    "detect_retry_storm": detect_retry_storm,
-    "detect_connection_pool_issues": detect_connection_pool_issues,
-    "detect_circular_dependencies": detect_circular_dependencies,
-    "find_similar_past_incidents": find_similar_past_incidents,
-    # Remediation & Postmortem
-    "generate_remediation_suggestions": generate_remediation_suggestions,
-    "generate_postmortem": generate_postmortem,
-    "estimate_remediation_risk": estimate_remediation_risk,
-    "get_gcloud_commands": get_gcloud_commands,
-    # SLO Multi-Window Burn Rate
-    "analyze_multi_window_burn_rate": analyze_multi_window_burn_rate,
-    # Change Correlation
-    "correlate_changes_with_incident": correlate_changes_with_incident,
-    # Specialized Analysis
-    "analyze_aggregate_metrics": analyze_aggregate_metrics,
-    "calculate_critical_path_contribution": calculate_critical_path_contribution,
-    "compare_span_timings": compare_span_timings,
-    "compare_time_periods": compare_time_periods,
-    "compute_latency_statistics": compute_latency_statistics,
-    "correlate_incident_with_slo_impact": correlate_incident_with_slo_impact,
-    "correlate_metrics_with_traces_via_exemplars": correlate_metrics_with_traces_via_exemplars,
-    "detect_latency_anomalies": detect_latency_anomalies,
-    "extract_errors": extract_errors,
-    "find_example_traces": find_example_traces,
-    "find_exemplar_traces": find_exemplar_traces,
-    "get_current_time": get_current_time,
-    "get_slo_status": get_slo_status,
-    "list_error_events": list_error_events,
-    "validate_trace_quality": validate_trace_quality,
-    "analyze_trace_comprehensive": analyze_trace_comprehensive,
-    # Agent Debugging
-    "list_agent_traces": list_agent_traces,
-    "reconstruct_agent_interaction": reconstruct_agent_interaction,
-    "analyze_agent_token_usage": analyze_agent_token_usage,
-    "detect_agent_anti_patterns": detect_agent_anti_patterns,
-    # MCP Tools
-    "gcp_execute_sql": gcp_execute_sql,
-    "mcp_list_dataset_ids": mcp_list_dataset_ids,
-    "mcp_list_table_ids": mcp_list_table_ids,
-    "mcp_get_table_info": mcp_get_table_info,
-    "mcp_list_log_entries": mcp_list_log_entries,
-    "mcp_list_timeseries": mcp_list_timeseries,
-    "mcp_query_range": mcp_query_range,
-    # Exploration
-    "explore_project_health": explore_project_health,
-    # Discovery
-    "discover_telemetry_sources": discover_telemetry_sources,
-    # CA Data Agent
-    "query_data_agent": query_data_agent,
-    # Reporting
-    "synthesize_report": synthesize_report,
-    # Orchestration
-    "run_aggregate_analysis": run_aggregate_analysis,
-    "run_triage_analysis": run_triage_analysis,
-    "run_deep_dive_analysis": run_deep_dive_analysis,
-    "select_traces_manually": select_traces_manually,
-    "select_traces_from_statistical_outliers": select_traces_from_statistical_outliers,
-    "run_log_pattern_analysis": run_log_pattern_analysis,
-    # Council
-    "run_council_investigation": run_council_investigation,
-    "classify_investigation_mode": classify_investigation_mode,
-    # Router
-    "route_request": route_request,
-    # Investigation
-    "update_investigation_state": update_investigation_state,
-    "get_investigation_summary": get_investigation_summary,
-    # Memory & Self-Improvement
-    "add_finding_to_memory": add_finding_to_memory,
-    "search_memory": search_memory,
-    "complete_investigation": complete_investigation,
-    "get_recommended_investigation_strategy": get_recommended_investigation_strategy,
-    "analyze_and_learn_from_traces": analyze_and_learn_from_traces,
-    "suggest_next_steps": suggest_next_steps,
-    # Online Research
-    "fetch_web_page": fetch_web_page,
-    # GitHub Self-Healing
-    "github_read_file": github_read_file,
-    "github_search_code": github_search_code,
-    "github_list_recent_commits": github_list_recent_commits,
-    "github_create_pull_request": github_create_pull_request,
-    # Sandbox Processing
-    "summarize_metric_descriptors_in_sandbox": summarize_metric_descriptors_in_sandbox,
-    "summarize_time_series_in_sandbox": summarize_time_series_in_sandbox,
-    "summarize_log_entries_in_sandbox": summarize_log_entries_in_sandbox,
-    "summarize_traces_in_sandbox": summarize_traces_in_sandbox,
-    "execute_custom_analysis_in_sandbox": execute_custom_analysis_in_sandbox,
-    "get_sandbox_status": get_sandbox_status,
-}
+_TOOL_SETS = ("TOOL_NAME_MAP", "base_tools", "slim_tools")
+_tool_sets_lock = threading.Lock()
+
+
+def _load_tool_sets() -> None:
+    """Build ``TOOL_NAME_MAP``, ``base_tools`` and ``slim_tools`` once.
+
+    Importing the tool functions loads the analysis stack (BigQuery and
+    Cloud Trace/Logging/Monitoring clients, Drain3, numpy), so the tool sets
+    are built on first access rather than at module import.
+    """
+    with _tool_sets_lock:
+        if "TOOL_NAME_MAP" in globals():
+            return
+        from .tools import (
+            add_finding_to_memory,
+            # Agent Trace Analysis
+            analyze_agent_token_usage,
+            # BigQuery tools
+            analyze_aggregate_metrics,
+            # Self-improvement tools
+            analyze_and_learn_from_traces,
+            # Additional BQ tools
+            analyze_bigquery_log_patterns,
+            # Critical path analysis tools
+            analyze_critical_path,
+            # SLO/SLI tools
+            analyze_error_budget_burn,
+            # GKE tools
+            analyze_hpa_events,
+            analyze_log_anomalies,
+            # SLO Analysis
+            analyze_multi_window_burn_rate,
+            analyze_node_conditions,
+            analyze_signal_correlation_strength,
+            analyze_trace_comprehensive,
+            analyze_trace_patterns,
+            analyze_upstream_downstream_impact,
+            build_call_graph,
+            build_cross_signal_timeline,
+            # Service dependency tools
+            build_service_dependency_graph,
+            calculate_critical_path_contribution,
+            calculate_series_stats,
+            calculate_span_durations,
+            compare_log_patterns,
+            compare_metric_windows,
+            compare_span_timings,
+            compare_time_periods,
+            # Investigation completion
+            complete_investigation,
+            compute_latency_statistics,
+            # Change Correlation
+            correlate_changes_with_incident,
+            # SLO correlation
+            correlate_incident_with_slo_impact,
+            correlate_logs_with_trace,
+            correlate_metrics_with_traces_via_exemplars,
+            # Cross-signal correlation tools
+            correlate_trace_with_kubernetes,
+            correlate_trace_with_metrics,
+            detect_agent_anti_patterns,
+            detect_all_sre_patterns,
+            detect_cascading_timeout,
+            detect_circular_dependencies,
+            detect_connection_pool_issues,
+            detect_latency_anomalies,
+            # Metrics analysis tools
+            detect_metric_anomalies,
+            detect_retry_storm,
+            detect_trend_changes,
+            # Discovery tools
+            discover_telemetry_sources,
+            # Remediation tools
+            estimate_remediation_risk,
+            # Exploration tools
+            explore_project_health,
+            extract_errors,
+            # Log pattern analysis tools
+            extract_log_patterns,
+            # Trace tools
+            fetch_trace,
+            fetch_web_page,
+            find_bottleneck_services,
+            find_example_traces,
+            find_exemplar_traces,
+            find_hidden_dependencies,
+            find_past_mistakes,
+            find_similar_past_incidents,
+            find_structural_differences,
+            find_successful_strategy,
+            # Remediation & Postmortem
+            generate_postmortem,
+            generate_remediation_suggestions,
+            get_alert,
+            # GKE tools
+            get_container_oom_events,
+            get_current_time,
+            get_gcloud_commands,
+            get_gke_cluster_health,
+            # SLO Golden Signals
+            get_golden_signals,
+            get_investigation_summary,
+            get_logs_for_trace,
+            get_pod_restart_events,
+            get_recommended_investigation_strategy,
+            get_slo_status,
+            get_trace_by_url,
+            get_workload_health_summary,
+            # GitHub Self-Healing tools
+            github_create_pull_request,
+            github_list_recent_commits,
+            github_read_file,
+            github_search_code,
+            list_agent_traces,
+            list_alert_policies,
+            # Alerting tools
+            list_alerts,
+            list_error_events,
+            # GCP direct API tools
+            list_gcp_projects,
+            list_log_entries,
+            list_metric_descriptors,
+            # SLO listing
+            list_slos,
+            list_time_series,
+            list_traces,
+            perform_causal_analysis,
+            # SLO prediction
+            predict_slo_violation,
+            query_data_agent,
+            # BigQuery Graph Tools
+            query_historical_trajectories,
+            query_promql,
+            reconstruct_agent_interaction,
+            # Research tools
+            search_memory,
+            select_traces_from_statistical_outliers,
+            select_traces_manually,
+            suggest_next_steps,
+            summarize_trace,
+            update_investigation_state,
+            validate_trace_quality,
+        )
+        from .tools.mcp.gcp import (
+            gcp_execute_sql,
+            mcp_get_table_info,
+            mcp_list_dataset_ids,
+            mcp_list_log_entries,
+            mcp_list_table_ids,
+            mcp_list_timeseries,
+            mcp_query_range,
+        )
+        from .tools.reporting import synthesize_report
+
+        # Sandbox Processing Tools
+        from .tools.sandbox import (
+            execute_custom_analysis_in_sandbox,
+            get_sandbox_status,
+            summarize_log_entries_in_sandbox,
+            summarize_metric_descriptors_in_sandbox,
+            summarize_time_series_in_sandbox,
+            summarize_traces_in_sandbox,
+        )
 
-# Register the tool map for dynamic instruction generation
-get_tool_registry().set_tool_map(TOOL_NAME_MAP)
-
-# Common tools for all agents
-base_tools: list[Any] = [
-    # Observability
-    explore_project_health,
-    fetch_trace,
-    list_traces,
-    get_trace_by_url,
-    list_log_entries,
-    get_logs_for_trace,
-    get_current_time,
-    query_promql,
-    list_slos,
-    get_golden_signals,
-    # Analysis
-    calculate_span_durations,
-    find_bottleneck_services,
-    correlate_logs_with_trace,
-    analyze_critical_path,
-    analyze_signal_correlation_strength,
-    analyze_trace_comprehensive,
-    summarize_trace,
-    # GKE / Infrastructure
-    get_gke_cluster_health,
-    analyze_node_conditions,
-    analyze_hpa_events,
-    get_pod_restart_events,
-    get_container_oom_events,
-    get_workload_health_summary,
-    # Alerts
-    list_alerts,
-    list_alert_policies,
-    get_alert,
-    # Metrics
-    detect_metric_anomalies,
-    detect_trend_changes,
-    list_time_series,
-    list_metric_descriptors,
-    # Log pattern tools
-    extract_log_patterns,
-    compare_log_patterns,
-    analyze_log_anomalies,
-    # Discovery
-    discover_telemetry_sources,
-    # MCP Tools
-    gcp_execute_sql,
-    mcp_list_dataset_ids,
-    mcp_list_table_ids,
-    mcp_get_table_info,
-    mcp_list_log_entries,
-    mcp_list_timeseries,
-    mcp_query_range,
-    # BigQuery Analysis Tools
-    analyze_aggregate_metrics,
-    find_exemplar_traces,
-    analyze_bigquery_log_patterns,
-    # CA Data Agent
-    query_data_agent,
-    # Router (call FIRST to determine handling strategy)
-    route_request,
-    # Orchestration tools
-    run_aggregate_analysis,
-    run_triage_analysis,
-    run_deep_dive_analysis,
-    run_log_pattern_analysis,
-    run_council_investigation,
-    classify_investigation_mode,
-    synthesize_report,
-    list_gcp_projects,
-    # Investigation tools
-    update_investigation_state,
-    get_investigation_summary,
-    # Memory & Self-Improvement tools
-    add_finding_to_memory,
-    search_memory,
-    complete_investigation,
-    get_recommended_investigation_strategy,
-    analyze_and_learn_from_traces,
-    suggest_next_steps,
-    # Change Correlation
-    correlate_changes_with_incident,
-    # Remediation tools
-    generate_remediation_suggestions,
-    generate_postmortem,
-    estimate_remediation_risk,
-    get_gcloud_commands,
-    # SLO Multi-Window Burn Rate
-    analyze_multi_window_burn_rate,
-    # Online Research
-    fetch_web_page,
-    # GitHub Self-Healing
-    github_read_file,
-    github_search_code,
-    github_list_recent_commits,
-    github_create_pull_request,
-    # Sandbox Processing Tools
-    summarize_metric_descriptors_in_sandbox,
-    summarize_time_series_in_sandbox,
-    summarize_log_entries_in_sandbox,
-    summarize_traces_in_sandbox,
-    execute_custom_analysis_in_sandbox,
-    get_sandbox_status,
-]
+        tool_name_map: dict[str, Any] = {
+            # Observability
+            "fetch_trace": fetch_trace,
+            "list_log_entries": list_log_entries,
+            "query_promql": query_promql,
+            "list_slos": list_slos,
+            "list_traces": list_traces,
+            "get_logs_for_trace": get_logs_for_trace,
+            "get_trace_by_url": get_trace_by_url,
+            "summarize_trace": summarize_trace,
+            "get_golden_signals": get_golden_signals,
+            "list_gcp_projects": list_gcp_projects,
+            "list_metric_descriptors": list_metric_descriptors,
+            # Analysis
+            "calculate_span_durations": calculate_span_durations,
+            "find_bottleneck_services": find_bottleneck_services,
+            "correlate_logs_with_trace": correlate_logs_with_trace,
+            "analyze_critical_path": analyze_critical_path,
+            "build_call_graph": build_call_graph,
+            "build_service_dependency_graph": build_service_dependency_graph,
+            "build_cross_signal_timeline": build_cross_signal_timeline,
+            "analyze_trace_patterns": analyze_trace_patterns,
+            "find_structural_differences": find_structural_differences,
+            "find_hidden_dependencies": find_hidden_dependencies,
+            # Metrics
+            "detect_metric_anomalies": detect_metric_anomalies,
+            "list_time_series": list_time_series,
+            "compare_metric_windows": compare_metric_windows,
+            "analyze_signal_correlation_strength": analyze_signal_correlation_strength,
+            "analyze_error_budget_burn": analyze_error_budget_burn,
+            "predict_slo_violation": predict_slo_violation,
+            # GKE / Infrastructure
+            "get_gke_cluster_health": get_gke_cluster_health,
+            "analyze_node_conditions": analyze_node_conditions,
+            "analyze_hpa_events": analyze_hpa_events,
+            "get_pod_restart_events": get_pod_restart_events,
+            "get_container_oom_events": get_container_oom_events,
+            "get_workload_health_summary": get_workload_health_summary,
+            # Alerts
+            "list_alerts": list_alerts,
+            "list_alert_policies": list_alert_policies,
+            "get_alert": get_alert,
+            # Advanced Diagnostics
+            "perform_causal_analysis": perform_causal_analysis,
+            "analyze_upstream_downstream_impact": analyze_upstream_downstream_impact,
+            "correlate_trace_with_kubernetes": correlate_trace_with_kubernetes,
+            "correlate_trace_with_metrics": correlate_trace_with_metrics,
+            "calculate_series_stats": calculate_series_stats,
+            "detect_trend_changes": detect_trend_changes,
+            # Pattern Analysis
+            "extract_log_patterns": extract_log_patterns,
+            "compare_log_patterns": compare_log_patterns,
+            "detect_all_sre_patterns": detect_all_sre_patterns,
+            "analyze_log_anomalies": analyze_log_anomalies,
+            "analyze_bigquery_log_patterns": analyze_bigquery_log_patterns,
+            # BigQuery Graph
+            "query_historical_trajectories": query_historical_trajectories,
+            "find_successful_strategy": find_successful_strategy,
+            "find_past_mistakes": find_past_mistakes,
+            # Root Cause
+            "detect_cascading_timeout": detect_cascading_timeout,
+            "detect_retry_storm": detect_retry_storm,
+            "detect_connection_pool_issues": detect_connection_pool_issues,
+            "detect_circular_dependencies": detect_circular_dependencies,
+            "find_similar_past_incidents": find_similar_past_incidents,
+            # Remediation & Postmortem
+            "generate_remediation_suggestions": generate_remediation_suggestions,
+            "generate_postmortem": generate_postmortem,
+            "estimate_remediation_risk": estimate_remediation_risk,
+            "get_gcloud_commands": get_gcloud_commands,
+            # SLO Multi-Window Burn Rate
+            "analyze_multi_window_burn_rate": analyze_multi_window_burn_rate,
+            # Change Correlation
+            "correlate_changes_with_incident": correlate_changes_with_incident,
+            # Specialized Analysis
+            "analyze_aggregate_metrics": analyze_aggregate_metrics,
+            "calculate_critical_path_contribution": calculate_critical_path_contribution,
+            "compare_span_timings": compare_span_timings,
+            "compare_time_periods": compare_time_periods,
+            "compute_latency_statistics": compute_latency_statistics,
+            "correlate_incident_with_slo_impact": correlate_incident_with_slo_impact,
+            "correlate_metrics_with_traces_via_exemplars": correlate_metrics_with_traces_via_exemplars,
+            "detect_latency_anomalies": detect_latency_anomalies,
+            "extract_errors": extract_errors,
+            "find_example_traces": find_example_traces,
+            "find_exemplar_traces": find_exemplar_traces,
+            "get_current_time": get_current_time,
+            "get_slo_status": get_slo_status,
+            "list_error_events": list_error_events,
+            "validate_trace_quality": validate_trace_quality,
+            "analyze_trace_comprehensive": analyze_trace_comprehensive,
+            # Agent Debugging
+            "list_agent_traces": list_agent_traces,
+            "reconstruct_agent_interaction": reconstruct_agent_interaction,
+            "analyze_agent_token_usage": analyze_agent_token_usage,
+            "detect_agent_anti_patterns": detect_agent_anti_patterns,
+            # MCP Tools
+            "gcp_execute_sql": gcp_execute_sql,
+            "mcp_list_dataset_ids": mcp_list_dataset_ids,
+            "mcp_list_table_ids": mcp_list_table_ids,
+            "mcp_get_table_info": mcp_get_table_info,
+            "mcp_list_log_entries": mcp_list_log_entries,
+            "mcp_list_timeseries": mcp_list_timeseries,
+            "mcp_query_range": mcp_query_range,
+            # Exploration
+            "explore_project_health": explore_project_health,
+            # Discovery
+            "discover_telemetry_sources": discover_telemetry_sources,
+            # CA Data Agent
+            "query_data_agent": query_data_agent,
+            # Reporting
+            "synthesize_report": synthesize_report,
+            # Orchestration
+            "run_aggregate_analysis": run_aggregate_analysis,
+            "run_triage_analysis": run_triage_analysis,
+            "run_deep_dive_analysis": run_deep_dive_analysis,
+            "select_traces_manually": select_traces_manually,
+            "select_traces_from_statistical_outliers": select_traces_from_statistical_outliers,
+            "run_log_pattern_analysis": run_log_pattern_analysis,
+            # Council
+            "run_council_investigation": run_council_investigation,
+            "classify_investigation_mode": classify_investigation_mode,
+            # Router
+            "route_request": route_request,
+            # Investigation
+            "update_investigation_state": update_investigation_state,
+            "get_investigation_summary": get_investigation_summary,
+            # Memory & Self-Improvement
+            "add_finding_to_memory": add_finding_to_memory,
+            "search_memory": search_memory,
+            "complete_investigation": complete_investigation,
+            "get_recommended_investigation_strategy": get_recommended_investigation_strategy,
+            "analyze_and_learn_from_traces": analyze_and_learn_from_traces,
+            "suggest_next_steps": suggest_next_steps,
+            # Online Research
+            "fetch_web_page": fetch_web_page,
+            # GitHub Self-Healing
+            "github_read_file": github_read_file,
+            "github_search_code": github_search_code,
+            "github_list_recent_commits": github_list_recent_commits,
+            "github_create_pull_request": github_create_pull_request,
+            # Sandbox Processing
+            "summarize_metric_descriptors_in_sandbox": summarize_metric_descriptors_in_sandbox,
+            "summarize_time_series_in_sandbox": summarize_time_series_in_sandbox,
+            "summarize_log_entries_in_sandbox": summarize_log_entries_in_sandbox,
+            "summarize_traces_in_sandbox": summarize_traces_in_sandbox,
+            "execute_custom_analysis_in_sandbox": execute_custom_analysis_in_sandbox,
+            "get_sandbox_status": get_sandbox_status,
+        }
+
+        # Register the tool map for dynamic instruction generation
+        get_tool_registry().set_tool_map(tool_name_map)
+
+        # Common tools for all agents
+        full_tools: list[Any] = [
+            # Observability
+            explore_project_health,
+            fetch_trace,
+            list_traces,
+            get_trace_by_url,
+            list_log_entries,
+            get_logs_for_trace,
+            get_current_time,
+            query_promql,
+            list_slos,
+            get_golden_signals,
+            # Analysis
+            calculate_span_durations,
+            find_bottleneck_services,
+            correlate_logs_with_trace,
+            analyze_critical_path,
+            analyze_signal_correlation_strength,
+            analyze_trace_comprehensive,
+            summarize_trace,
+            # GKE / Infrastructure
+            get_gke_cluster_health,
+            analyze_node_conditions,
+            analyze_hpa_events,
+            get_pod_restart_events,
+            get_container_oom_events,
+            get_workload_health_summary,
+            # Alerts
+            list_alerts,
+            list_alert_policies,
+            get_alert,
+            # Metrics
+            detect_metric_anomalies,
+            detect_trend_changes,
+            list_time_series,
+            list_metric_descriptors,
+            # Log pattern tools
+            extract_log_patterns,
+            compare_log_patterns,
+            analyze_log_anomalies,
+            # Discovery
+            discover_telemetry_sources,
+            # MCP Tools
+            gcp_execute_sql,
+            mcp_list_dataset_ids,
+            mcp_list_table_ids,
+            mcp_get_table_info,
+            mcp_list_log_entries,
+            mcp_list_timeseries,
+            mcp_query_range,
+            # BigQuery Analysis Tools
+            analyze_aggregate_metrics,
+            find_exemplar_traces,
+            analyze_bigquery_log_patterns,
+            # CA Data Agent
+            query_data_agent,
+            # Router (call FIRST to determine handling strategy)
+            route_request,
+            # Orchestration tools
+            run_aggregate_analysis,
+            run_triage_analysis,
+            run_deep_dive_analysis,
+            run_log_pattern_analysis,
+            run_council_investigation,
+            classify_investigation_mode,
+            synthesize_report,
+            list_gcp_projects,
+            # Investigation tools
+            update_investigation_state,
+            get_investigation_summary,
+            # Memory & Self-Improvement tools
+            add_finding_to_memory,
+            search_memory,
+            complete_investigation,
+            get_recommended_investigation_strategy,
+            analyze_and_learn_from_traces,
+            suggest_next_steps,
+            # Change Correlation
+            correlate_changes_with_incident,
+            # Remediation tools
+            generate_remediation_suggestions,
+            generate_postmortem,
+            estimate_remediation_risk,
+            get_gcloud_commands,
+            # SLO Multi-Window Burn Rate
+            analyze_multi_window_burn_rate,
+            # Online Research
+            fetch_web_page,
+            # GitHub Self-Healing
+            github_read_file,
+            github_search_code,
+            github_list_recent_commits,
+            github_create_pull_request,
+            # Sandbox Processing Tools
+            summarize_metric_descriptors_in_sandbox,
+            summarize_time_series_in_sandbox,
+            summarize_log_entries_in_sandbox,
+            summarize_traces_in_sandbox,
+            execute_custom_analysis_in_sandbox,
+            get_sandbox_status,
+        ]
+
+        # Slim orchestrator tool set — used when SRE_AGENT_SLIM_TOOLS=true
+        # These are the only tools the root agent needs when council mode is active.
+        # All specialist tools are delegated to panel agents.
+        # OPT-2: Includes essential direct-retrieval tools so the root agent can
+        # handle DIRECT-tier routing without sub-agent overhead.
+        orchestrator_tools: list[Any] = [
+            # Router (call FIRST to determine handling strategy)
+            route_request,
+            # Council orchestration
+            run_council_investigation,
+            classify_investigation_mode,
+            # Legacy orchestration (kept for backward compat)
+            run_aggregate_analysis,
+            run_triage_analysis,
+            run_deep_dive_analysis,
+            run_log_pattern_analysis,
+            synthesize_report,
+            # Direct-retrieval tools (OPT-2: needed for DIRECT routing tier)
+            fetch_trace,
+            list_traces,
+            get_trace_by_url,
+            list_log_entries,
+            get_logs_for_trace,
+            query_promql,
+            list_time_series,
+            list_metric_descriptors,
+            list_alerts,
+            get_alert,
+            list_alert_policies,
+            summarize_trace,
+            get_golden_signals,
+            # Project management
+            list_gcp_projects,
+            explore_project_health,
+            get_current_time,
+            # Investigation state
+            update_investigation_state,
+            get_investigation_summary,
+            # Memory & Self-Improvement
+            add_finding_to_memory,
+            search_memory,
+            complete_investigation,
+            get_recommended_investigation_strategy,
+            analyze_and_learn_from_traces,
+            suggest_next_steps,
+            # Discovery
+            discover_telemetry_sources,
+            # Online Research
+            fetch_web_page,
+            # GitHub Self-Healing
+            github_read_file,
+            github_search_code,
+            github_list_recent_commits,
+            github_create_pull_request,
+        ]
+
+        globals().update(
+            TOOL_NAME_MAP=tool_name_map,
+            base_tools=full_tools,
+            slim_tools=orchestrator_tools,
+        )
+
+
+def _tool_set(name: str) -> Any:
+    """Return a tool set by module attribute name, building it if needed."""
+    if name not in globals():
+        _load_tool_sets()
+    return globals()[name]
 
 
 def get_enabled_tools() -> list[Any]:
@@ -1356,75 +1396,19 @@ def get_enabled_tools() -> list[Any]:
     """
     manager = get_tool_config_manager()
     enabled_tool_names = set(manager.get_enabled_tools())
+    tool_name_map = _tool_set("TOOL_NAME_MAP")
 
     enabled_tools = []
-    for tool_name in TOOL_NAME_MAP:
+    for tool_name in tool_name_map:
         if tool_name in enabled_tool_names:
-            enabled_tools.append(TOOL_NAME_MAP[tool_name])
+            enabled_tools.append(tool_name_map[tool_name])
 
     logger.info(
-        f"Loaded {len(enabled_tools)} enabled tools out of {len(TOOL_NAME_MAP)} total"
+        f"Loaded {len(enabled_tools)} enabled tools out of {len(tool_name_map)} total"
     )
     return enabled_tools
 
 
-# Slim orchestrator tool set — used when SRE_AGENT_SLIM_TOOLS=true
-# These are the only tools the root agent needs when council mode is active.
-# All specialist tools are delegated to panel agents.
-# OPT-2: Includes essential direct-retrieval tools so the root agent can
-# handle DIRECT-tier routing without sub-agent overhead.
-slim_tools: list[Any] = [
-    # Router (call FIRST to determine handling strategy)
-    route_request,
-    # Council orchestration
-    run_council_investigation,
-    classify_investigation_mode,
-    # Legacy orchestration (kept for backward compat)
-    run_aggregate_analysis,
-    run_triage_analysis,
-    run_deep_dive_analysis,
-    run_log_pattern_analysis,
-    synthesize_report,
-    # Direct-retrieval tools (OPT-2: needed for DIRECT routing tier)
-    fetch_trace,
-    list_traces,
-    get_trace_by_url,
-    list_log_entries,
-    get_logs_for_trace,
-    query_promql,
-    list_time_series,
-    list_metric_descriptors,
-    list_alerts,
-    get_alert,
-    list_alert_policies,
-    summarize_trace,
-    get_golden_signals,
-    # Project management
-    list_gcp_projects,
-    explore_project_health,
-    get_current_time,
-    # Investigation state
-    update_investigation_state,
-    get_investigation_summary,
-    # Memory & Self-Improvement
-    add_finding_to_memory,
-    search_memory,
-    complete_investigation,
-    get_recommended_investigation_strategy,
-    analyze_and_learn_from_traces,
-    suggest_next_steps,
-    # Discovery
-    discover_telemetry_sources,
-    # Online Research
-    fetch_web_page,
-    # GitHub Self-Healing
-    github_read_file,
-    github_search_code,
-    github_list_recent_commits,
-    github_create_pull_request,
-]
-
-
 _tool_to_name_cache: dict[Any, str] | None = None
 
 
@@ -1432,7 +1416,7 @@ def _get_tool_to_name_map() -> dict[Any, str]:
     """Get cached reverse lookup from tool function to tool name."""
     global _tool_to_name_cache
     if _tool_to_name_cache is None:
-        _tool_to_name_cache = {v: k for k, v in TOOL_NAME_MAP.items()}
+        _tool_to_name_cache = {v: k for k, v in _tool_set("TOOL_NAME_MAP").items()}
     return _tool_to_name_cache
 
 
@@ -1450,11 +1434,14 @@ def get_enabled_base_tools() -> list[Any]:
     """
     # OPT-1: Slim tools is now the DEFAULT.
     if os.environ.get("SRE_AGENT_SLIM_TOOLS", "true").lower() != "false":
+        slim_tools = _tool_set("slim_tools")
         logger.debug(f"Slim tools mode enabled: {len(slim_tools)} tools")
         return list(slim_tools)
 
     manager = get_tool_config_manager()
     enabled_tool_names = set(manager.get_enabled_tools())
+    tool_name_map = _tool_set("TOOL_NAME_MAP")
+    base_tools = _tool_set("base_tools")
 
     # Reverse lookup: tool function -> tool name (cached at module level)
     tool_to_name = _get_tool_to_name_map()
@@ -1474,7 +1461,7 @@ def get_enabled_base_tools() -> list[Any]:
         # 2. It's not in TOOL_NAME_MAP (orchestration tools/built-ins)
         if (
             tool_name is None
-            or tool_name not in TOOL_NAME_MAP
+            or tool_name not in tool_name_map
             or tool_name in enabled_tool_names
         ):
             enabled_base_tools.append(tool)
@@ -1518,6 +1505,7 @@ from google.adk.tools.load_memory_tool import load_memory_tool
 from google.adk.tools.preload_memory_tool import preload_memory_tool
 
 from .core.large_payload_handler import handle_large_payload
+from .core.loop_monitor import attributed
 from .core.model_callbacks import after_model_callback, before_model_callback
 from .core.tool_callbacks import truncate_tool_output_callback
 from .memory.callbacks import (
@@ -1528,6 +1516,7 @@ from .memory.callbacks import (
 )
 
 
+@attributed("callback:after_tool")
 async def composite_after_tool_callback(
     tool: Any,
     args: dict[str, Any],
@@ -1564,20 +1553,58 @@ async def composite_after_tool_callback(
     return working_response
 
 
-# Build the full tool set: base tools + ADK memory tools + Research
-# Research must be a tool in ADK because it requires a dedicated LlmAgent internally limit bypass
-_agent_tools: list[Any] = [
-    *get_enabled_base_tools(),
-    preload_memory_tool,
-    load_memory_tool,
-    get_research_agent_tool(),
-]
+# Sub-agents exposed as attributes of this module: (defining module, attribute).
+# ``metrics_analyst`` is an alias of ``metrics_analyzer``; the ``get_*``
+# entries are accessor functions, wrapped by :func:`emojify_agent`. Modules
+# are imported directly because ``sub_agents.agent_debugger`` is shadowed by
+# its submodule once that is imported.
+_SUB_AGENTS: dict[str, tuple[str, str]] = {
+    "aggregate_analyzer": ("trace", "aggregate_analyzer"),
+    "trace_analyst": ("trace", "trace_analyst"),
+    "log_analyst": ("logs", "log_analyst"),
+    "metrics_analyzer": ("metrics", "metrics_analyzer"),
+    "metrics_analyst": ("metrics", "metrics_analyzer"),
+    "get_metrics_analyzer": ("metrics", "get_metrics_analyzer"),
+    "get_metrics_analyst": ("metrics", "get_metrics_analyst"),
+    "alert_analyst": ("alerts", "alert_analyst"),
+    "root_cause_analyst": ("root_cause", "root_cause_analyst"),
+    "agent_debugger": ("agent_debugger", "agent_debugger"),
+}
+
+
+def _sub_agent_factory(registry: AgentRegistry, name: str) -> Any:
+    module_name, attr = _SUB_AGENTS[name]
+
+    def build() -> Any:
+        if attr != name:
+            return registry.get(attr)
+        module = importlib.import_module(f".sub_agents.{module_name}", __package__)
+        sub_agent = getattr(module, attr)
+        _inject_global_credentials(sub_agent)
+        return emojify_agent(sub_agent)
+
+    return build
+
 
-# Create the main SRE Agent
-sre_agent = LlmAgent(
-    name="sre_agent",
-    model=get_model_name("fast"),
-    description="""SRE Agent - Google Cloud Observability & Reliability Expert.
+def _build_sre_agent(registry: AgentRegistry) -> LlmAgent | BaseAgent | Any:
+    """Build the main SRE Agent with its tools and sub-agents."""
+    from .sub_agents.research import get_research_agent_tool
+
+    init_sub_agent_env()
+
+    # Build the full tool set: base tools + ADK memory tools + Research
+    # Research must be a tool in ADK because it requires a dedicated LlmAgent internally limit bypass
+    agent_tools: list[Any] = [
+        *get_enabled_base_tools(),
+        preload_memory_tool,
+        load_memory_tool,
+        get_research_agent_tool(),
+    ]
+
+    agent = LlmAgent(
+        name="sre_agent",
+        model=get_model_name("fast"),
+        description="""SRE Agent - Google Cloud Observability & Reliability Expert.
 
 Capabilities:
 - Orchestrates a "Council of Experts" for multi-stage incident analysis (Aggregate -> Triage -> Deep Dive)
@@ -1599,62 +1626,48 @@ Direct Tools:
 - Council: run_council_investigation
 - Memory: preload_memory (auto), load_memory (on-demand), search_memory, add_finding_to_memory
 - Self-improvement: analyze_and_learn_from_traces, complete_investigation""",
-    # OPT-7: Dynamic prompt assembly — timestamp is injected per-turn
-    # instead of being baked in at import time. ADK LlmAgent supports
-    # callable instructions that receive ReadonlyContext.
-    # OPT-11: Greeting prompt injected so the agent knows how to handle
-    # the GREETING routing tier without additional tool calls.
-    instruction=lambda ctx: (
-        f"{SRE_AGENT_PROMPT}\n\n"
-        f"<greeting_persona>\n"
-        f"When route_request returns tier='greeting', use this persona:\n"
-        f"{GREETING_PROMPT}\n"
-        f"</greeting_persona>\n\n"
-        f"{get_tool_registry().generate_dynamic_tool_descriptions([getattr(t, '__name__', str(t)) for t in _agent_tools])}\n\n"
-        f"<current_time>{datetime.now(timezone.utc).isoformat()}</current_time>"
-    ),
-    tools=_agent_tools,
-    # Model callbacks for cost tracking and token budget enforcement
-    before_model_callback=before_model_callback,
-    after_model_callback=after_model_callback,
-    # Tool callbacks for automatic memory-driven learning and safety truncation
-    before_tool_callback=before_tool_memory_callback,
-    after_tool_callback=composite_after_tool_callback,
-    on_tool_error_callback=on_tool_error_memory_callback,
-    # Agent callback for automatic memory persistence after each turn
-    after_agent_callback=after_agent_memory_callback,
-    # Sub-agents for specialized analysis (automatically invoked based on task)
-    sub_agents=[
-        # Trace analysis sub-agents
-        aggregate_analyzer,
-        trace_analyst,
-        # Log analysis sub-agents
-        log_analyst,
-        # Metrics analysis sub-agents
-        metrics_analyzer,
-        alert_analyst,
-        # Deep Dive
-        root_cause_analyst,
-        # Agent Debugging
-        agent_debugger,
-    ],
-)
-
-# Export as root_agent for ADK CLI compatibility
-root_agent = emojify_agent(sre_agent)
-
-# Emojify all sub-agents as well
-aggregate_analyzer = emojify_agent(aggregate_analyzer)  # type: ignore[assignment]
-trace_analyst = emojify_agent(trace_analyst)  # type: ignore[assignment]
-log_analyst = emojify_agent(log_analyst)  # type: ignore[assignment]
-metrics_analyzer = emojify_agent(metrics_analyzer)  # type: ignore[assignment]
-metrics_analyst = emojify_agent(metrics_analyst)  # type: ignore[assignment]
-get_metrics_analyzer = emojify_agent(get_metrics_analyzer)  # type: ignore[assignment]
-get_metrics_analyst = emojify_agent(get_metrics_analyst)  # type: ignore[assignment]
-alert_analyst = emojify_agent(alert_analyst)  # type: ignore[assignment]
-
-root_cause_analyst = emojify_agent(root_cause_analyst)  # type: ignore[assignment]
-agent_debugger = emojify_agent(agent_debugger)  # type: ignore[assignment]
+        # OPT-7: Dynamic prompt assembly — timestamp is injected per-turn
+        # instead of being baked in at import time. ADK LlmAgent supports
+        # callable instructions that receive ReadonlyContext.
+        # OPT-11: Greeting prompt injected so the agent knows how to handle
+        # the GREETING routing tier without additional tool calls.
+        instruction=lambda ctx: (
+            f"{SRE_AGENT_PROMPT}\n\n"
+            f"<greeting_persona>\n"
+            f"When route_request returns tier='greeting', use this persona:\n"
+            f"{GREETING_PROMPT}\n"
+            f"</greeting_persona>\n\n"
+            f"{get_tool_registry().generate_dynamic_tool_descriptions([getattr(t, '__name__', str(t)) for t in agent_tools])}\n\n"
+            f"<current_time>{datetime.now(timezone.utc).isoformat()}</current_time>"
+        ),
+        tools=agent_tools,
+        # Model callbacks for cost tracking and token budget enforcement
+        before_model_callback=before_model_callback,
+        after_model_callback=after_model_callback,
+        # Tool callbacks for automatic memory-driven learning and safety truncation
+        before_tool_callback=before_tool_memory_callback,
+        after_tool_callback=composite_after_tool_callback,
+        on_tool_error_callback=on_tool_error_memory_callback,
+        # Agent callback for automatic memory persistence after each turn
+        after_agent_callback=after_agent_memory_callback,
+        # Sub-agents for specialized analysis (automatically invoked based on task)
+        sub_agents=[
+            # Trace analysis sub-agents
+            registry.get("aggregate_analyzer"),
+            registry.get("trace_analyst"),
+            # Log analysis sub-agents
+            registry.get("log_analyst"),
+            # Metrics analysis sub-agents
+            registry.get("metrics_analyzer"),
+            registry.get("alert_analyst"),
+            # Deep Dive
+            registry.get("root_cause_analyst"),
+            # Agent Debugging
+            registry.get("agent_debugger"),
+        ],
+    )
+    _inject_global_credentials(agent)
+    return emojify_agent(agent)
 
 
 # ============================================================================
@@ -1697,8 +1710,7 @@ def _inject_global_credentials(agent_to_patch: Any, force: bool = False) -> Any:
 
             # Use the Base Agent project for Vertex AI Generation (to avoid 403s on cross-projects)
             # The SRE analysis context (logs/traces) will independently use get_current_project_id()
-            base_project = project_id  # The one initialized at module scope
-            base_location = location or "us-central1"
+            base_project, base_location = init_sub_agent_env()
 
             # Use Vertex AI by default for these models
             os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "true"
@@ -1751,18 +1763,38 @@ def _inject_global_credentials(agent_to_patch: Any, force: bool = False) -> Any:
         return None
 
 
-# Apply injection to main agent and all sub-agents
-_inject_global_credentials(sre_agent)
-for _sa in [
-    aggregate_analyzer,
-    trace_analyst,
-    log_analyst,
-    metrics_analyst,
-    metrics_analyzer,
-    alert_analyst,
-    root_cause_analyst,
-]:
-    _inject_global_credentials(_sa)
+def register_default_agents(registry: AgentRegistry) -> None:
+    """Register the SRE Agent and its sub-agents with ``registry``.
+
+    Sub-agents are registered first, so warming up the registry in order
+    builds them before the root agent that binds them.
+    """
+    for name in _SUB_AGENTS:
+        registry.register(name, _sub_agent_factory(registry, name))
+    registry.register("sre_agent", functools.partial(_build_sre_agent, registry))
+    # Export as root_agent for ADK CLI compatibility
+    registry.register("root_agent", lambda: registry.get("sre_agent"))
+
+
+def _agent(name: str) -> Any:
+    """Return a registered agent, building it on first use."""
+    return get_agent_registry().get(name)
+
+
+_AGENT_ATTRS = frozenset({"sre_agent", "root_agent", *_SUB_AGENTS})
+
+
+def __getattr__(name: str) -> Any:
+    """Build agents and tool sets on first access (PEP 562).
+
+    ``root_agent``, ``sre_agent``, the sub-agents, ``TOOL_NAME_MAP``,
+    ``base_tools`` and ``slim_tools`` used to be built at import time.
+    """
+    if name in _TOOL_SETS:
+        return _tool_set(name)
+    if name in _AGENT_ATTRS:
+        return _agent(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -1809,7 +1841,8 @@ def create_configured_agent(
 
     # Return the existing root_agent since sub-agents are already bound to it.
     # Tool filtering is applied at runtime through get_enabled_base_tools().
-    return root_agent
+    root: LlmAgent | BaseAgent = _agent("root_agent")
+    return root
 
 
 async def get_agent_with_mcp_tools(
@@ -1840,4 +1873,5 @@ async def get_agent_with_mcp_tools(
         logger.info(f"Agent initialized with {len(enabled_tools)} enabled tools")
 
     # Return the existing root_agent since sub-agents are already bound to it
-    return root_agent
+    root: LlmAgent | BaseAgent = _agent("root_agent")
+    return root
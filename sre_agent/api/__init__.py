@@ -1,10 +1,33 @@
 """SRE Agent API module.
 
 This module provides modular FastAPI routers refactored from the monolithic server.py.
+
+Exports are resolved lazily (PEP 562): tool modules import
+``sre_agent.api.helpers.dashboard_queue``, and an eager import of the app
+here would pull every router (and the agent stack behind them) into any
+process that merely loads a tool.
 """
 
-from .app import create_app
-from .dependencies import get_session_manager, get_tool_context
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "create_app": (".app", "create_app"),
+    "get_session_manager": (".dependencies", "get_session_manager"),
+    "get_tool_context": (".dependencies", "get_tool_context"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy-load API symbols on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_path, __package__)
+        value = getattr(module, attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "create_app",
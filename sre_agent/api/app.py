@@ -84,6 +84,20 @@ def create_app(
     app.include_router(agent_graph_setup_router)
     app.include_router(evals_router)
 
+    # Warm the replica in the background; /ready reports when it is done
+    app.router.add_event_handler("startup", _start_warm_up)
+    app.router.add_event_handler("shutdown", _stop_warm_up)
+
+    # Measure event-loop lag and attribute blocking calls (/api/debug/loop)
+    app.router.add_event_handler("startup", _start_loop_monitor)
+    app.router.add_event_handler("shutdown", _stop_loop_monitor)
+
+    # Apply deferred memory writes (tool lessons, mistakes) before exiting
+    app.router.add_event_handler("shutdown", _flush_memory_writes)
+    app.router.add_event_handler("shutdown", _close_session_journals)
+    app.router.add_event_handler("shutdown", _close_telemetry_catalog)
+    app.router.add_event_handler("shutdown", _stop_tool_pool)
+
     # Register tool test functions
     register_all_test_functions()
     logger.info("Tool configuration manager initialized")
@@ -145,6 +159,76 @@ def create_app(
     return app
 
 
+async def _start_warm_up() -> None:
+    """Start the startup warm-up tasks without delaying liveness."""
+    from sre_agent.core.startup import get_startup_orchestrator
+
+    get_startup_orchestrator().start()
+
+
+async def _stop_warm_up() -> None:
+    """Cancel unfinished warm-up tasks and snapshot warm state for next boot."""
+    from sre_agent.core.startup import get_startup_orchestrator, save_warm_state
+
+    orchestrator = get_startup_orchestrator()
+    await orchestrator.stop()
+    save_warm_state(orchestrator.config)
+
+
+async def _start_loop_monitor() -> None:
+    """Start the event-loop monitor on the serving loop."""
+    from sre_agent.core.loop_monitor import get_loop_monitor
+
+    monitor = get_loop_monitor()
+    if monitor.config.enabled:
+        monitor.start()
+
+
+async def _stop_loop_monitor() -> None:
+    """Detach the event-loop monitor."""
+    from sre_agent.core import loop_monitor
+
+    monitor = loop_monitor._monitor
+    if monitor is not None:
+        await monitor.stop()
+
+
+async def _flush_memory_writes() -> None:
+    """Flush the memory write-behind queue on shutdown."""
+    from sre_agent.memory.write_behind import get_memory_writer
+
+    try:
+        await get_memory_writer().close()
+    except Exception as e:
+        logger.warning(f"Failed to flush deferred memory writes: {e}")
+
+
+async def _close_session_journals() -> None:
+    """Persist session events still queued by in-flight streams on shutdown."""
+    from sre_agent.services import session as session_module
+
+    # Only touch the manager if one was created; don't build one to close it.
+    manager = session_module._session_manager
+    if manager is not None:
+        await manager.close_journals()
+
+
+async def _close_telemetry_catalog() -> None:
+    """Stop background telemetry discovery and close its HTTP client."""
+    from sre_agent.services import telemetry_catalog
+
+    catalog = telemetry_catalog._catalog
+    if catalog is not None:
+        await catalog.close()
+
+
+async def _stop_tool_pool() -> None:
+    """Terminate the worker processes behind cpu-heavy tools."""
+    from sre_agent.tools.common.execution import reset_tool_process_pool
+
+    reset_tool_process_pool()
+
+
 def _apply_mcp_patch() -> None:
     """Apply Pydantic bridge for MCP ClientSession."""
     try:
@@ -13,7 +13,7 @@ import os
 import uuid
 from typing import Any, cast
 
-from sre_agent.tools.analysis import genui_adapter
+from sre_agent.tools.analysis.genui_pipeline import WidgetPatcher, transform_widget
 
 logger = logging.getLogger(__name__)
 
@@ -301,15 +301,28 @@ WIDGET_CATEGORY_MAP: dict[str, str] = {
 }
 
 
-def create_dashboard_event(tool_name: str, result: Any) -> str | None:
+def create_dashboard_event(
+    tool_name: str, result: Any, patcher: WidgetPatcher | None = None
+) -> str | None:
     """Create a dashboard data event for the frontend investigation panel.
 
     This sends tool result data through a separate, simple channel that
     does not depend on the A2UI protocol. The frontend can consume this
     directly without any unwrapping logic.
 
+    Widget payloads are memoized and capped to the widget's display budget
+    (see :mod:`sre_agent.tools.analysis.genui_pipeline`).
+
+    Args:
+        tool_name: Name of the tool that produced the result.
+        result: The raw tool result.
+        patcher: The stream's patcher; when given, a widget whose data only
+            grew is sent as a ``dashboard_patch`` and an unchanged one is
+            not sent again.
+
     Returns:
-        JSON string of dashboard event, or None if tool has no dashboard mapping.
+        JSON string of dashboard event, or None if tool has no dashboard
+        mapping or the widget already shows this data.
     """
     widget_type = TOOL_WIDGET_MAP.get(tool_name)
     if not widget_type:
@@ -351,27 +364,24 @@ def create_dashboard_event(tool_name: str, result: Any) -> str | None:
 
         widget_data: dict[str, Any] | list[Any] | None = None
 
-        if widget_type == "x-sre-trace-waterfall":
-            widget_data = genui_adapter.transform_trace(result)
-        elif widget_type == "x-sre-metric-chart":
-            widget_data = genui_adapter.transform_metrics(result)
-        elif widget_type == "x-sre-metrics-dashboard":
-            widget_data = genui_adapter.transform_metrics_dashboard(result)
-        elif widget_type == "x-sre-log-entries-viewer":
+        if widget_type == "x-sre-log-entries-viewer":
             logger.info(f"📋 Transforming log entries for tool: {tool_name}")
-            widget_data = genui_adapter.transform_log_entries(result)
+            widget_data = transform_widget(widget_type, result)
             if widget_data:
                 logger.info(
                     f"✅ Transformed {len(widget_data.get('entries', []))} log entries"
                 )
             else:
                 logger.warning(f"❌ Log transformation failed for tool: {tool_name}")
-        elif widget_type == "x-sre-log-pattern-viewer":
-            widget_data = genui_adapter.transform_log_patterns(result)
-        elif widget_type == "x-sre-remediation-plan":
-            widget_data = genui_adapter.transform_remediation(result)
-        elif widget_type == "x-sre-incident-timeline":
-            widget_data = genui_adapter.transform_alerts_to_timeline(result)
+        elif widget_type in (
+            "x-sre-trace-waterfall",
+            "x-sre-metric-chart",
+            "x-sre-metrics-dashboard",
+            "x-sre-log-pattern-viewer",
+            "x-sre-remediation-plan",
+            "x-sre-incident-timeline",
+        ):
+            widget_data = transform_widget(widget_type, result)
         elif widget_type == "x-sre-council-synthesis":
             # Council synthesis results pass through as-is (already structured)
             widget_data = result if isinstance(result, dict) else {"raw": result}
@@ -391,6 +401,8 @@ def create_dashboard_event(tool_name: str, result: Any) -> str | None:
             "tool_name": tool_name,
             "data": widget_data,
         }
+        if patcher is not None:
+            return patcher.encode(event)
         return json.dumps(event, default=str)
 
     except Exception as e:
@@ -434,32 +446,22 @@ def create_exploration_dashboard_events(result: Any) -> list[str]:
         return []
 
     # Signal key -> (widget_type, category, transform_fn)
-    signal_map: list[tuple[str, str, str, Any]] = [
-        (
-            "alerts",
-            "x-sre-incident-timeline",
-            "alerts",
-            genui_adapter.transform_alerts_to_timeline,
-        ),
-        (
-            "logs",
-            "x-sre-log-entries-viewer",
-            "logs",
-            genui_adapter.transform_log_entries,
-        ),
-        ("traces", "x-sre-trace-waterfall", "traces", None),  # pass-through list
-        ("metrics", "x-sre-metric-chart", "metrics", genui_adapter.transform_metrics),
+    signal_map: list[tuple[str, str, str, bool]] = [
+        ("alerts", "x-sre-incident-timeline", "alerts", True),
+        ("logs", "x-sre-log-entries-viewer", "logs", True),
+        ("traces", "x-sre-trace-waterfall", "traces", False),  # one per trace
+        ("metrics", "x-sre-metric-chart", "metrics", True),
     ]
 
     events: list[str] = []
-    for signal_key, widget_type, category, transform_fn in signal_map:
+    for signal_key, widget_type, category, transform in signal_map:
         signal_data = result.get(signal_key)
         if not signal_data:
             continue
 
         try:
-            if transform_fn is not None:
-                widget_data = transform_fn(signal_data)
+            if transform:
+                widget_data = transform_widget(widget_type, signal_data)
                 if not widget_data:
                     continue
 
@@ -474,7 +476,7 @@ def create_exploration_dashboard_events(result: Any) -> list[str]:
             elif signal_key == "traces" and isinstance(signal_data, list):
                 # Special handling for multiple traces: yield one event per trace
                 for trace in signal_data:
-                    widget_data = genui_adapter.transform_trace(trace)
+                    widget_data = transform_widget(widget_type, trace)
                     if not widget_data or not widget_data.get("spans"):
                         continue
 
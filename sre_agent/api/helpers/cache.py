@@ -3,7 +3,10 @@ import os
 import time
 from collections.abc import Callable
 from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from sre_agent.core.shared_state import SharedStore
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -15,12 +18,24 @@ def async_ttl_cache(
     """A simple TTL memory cache for async functions.
 
     Caches the results of the wrapped function based on its arguments.
-    Entries expire after `ttl_seconds`.
+    Entries expire after `ttl_seconds`. When a shared state backend is
+    configured (see :mod:`sre_agent.core.shared_state`), local misses are
+    looked up in it and JSON-serializable results are written to it, so
+    uvicorn workers share results instead of each repeating the query.
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         cache: dict[str, tuple[float, Any]] = {}
         lock = asyncio.Lock()
+        shared: list[SharedStore | None] = []
+
+        def shared_store() -> "SharedStore | None":
+            if not shared:
+                from sre_agent.core.shared_state import get_shared_store
+
+                store = get_shared_store("ttl_cache")
+                shared.append(store if store.is_shared else None)
+            return shared[0]
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -57,11 +72,25 @@ def async_ttl_cache(
                     if now - timestamp <= ttl_seconds:
                         return result  # type: ignore
 
+            store = shared_store()
+            shared_key = f"{func.__module__}.{cache_key}"
+            if store is not None:
+                result = await asyncio.to_thread(store.get, shared_key)
+                if result is not None:
+                    async with lock:
+                        cache[cache_key] = (time.time(), result)
+                    return result  # type: ignore
+
             # Not cached or expired, call the function
             result = await func(*args, **kwargs)  # type: ignore
 
             async with lock:
                 cache[cache_key] = (time.time(), result)
+            if store is not None:
+                try:
+                    await asyncio.to_thread(store.set, shared_key, result, ttl_seconds)
+                except (TypeError, ValueError):
+                    pass  # Not JSON-serializable; cached locally only
 
             return result  # type: ignore
 
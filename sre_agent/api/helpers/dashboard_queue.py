@@ -6,6 +6,11 @@ This module provides a ContextVar-based queue so that @adk_tool-decorated
 functions can enqueue dashboard-relevant results, and the router can drain
 them when it next yields control.
 
+The ContextVar only holds the request's channel ID; the results live on a
+bounded :class:`~sre_agent.api.helpers.event_bus.SessionEventBus`, so tasks
+that copied the context before a drain still publish to the same queue, and
+abandoned requests are cleaned up by the bus TTL.
+
 Usage:
     # Router (event_generator): initialise at start of request
     init_dashboard_queue()
@@ -16,58 +21,81 @@ Usage:
     # Router: after processing each ADK event batch
     for tool_name, result in drain_dashboard_queue():
         ...
+
+    # Router: when the stream ends
+    close_dashboard_queue()
 """
 
 from __future__ import annotations
 
 import contextvars
 import logging
+import uuid
 from typing import Any
 
+from sre_agent.api.helpers.event_bus import SessionEventBus
+
 logger = logging.getLogger(__name__)
 
-# Per-request queue of (tool_name, raw_result) pairs.
+# Per-request channel ID on the dashboard event bus.
 # None means the queue has not been initialised for this context.
-_dashboard_queue: contextvars.ContextVar[list[tuple[str, Any]] | None] = (
-    contextvars.ContextVar("_dashboard_queue", default=None)
+_dashboard_channel: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "_dashboard_channel", default=None
 )
 
+# (tool_name, raw_result) pairs per request. Results are not coalesced: the
+# router matches queued results one-for-one against inline-emitted ones.
+_dashboard_bus: SessionEventBus[tuple[str, Any]] = SessionEventBus("dashboard")
+
+
+def get_dashboard_event_bus() -> SessionEventBus[tuple[str, Any]]:
+    """Return the bus backing the per-request dashboard queues."""
+    return _dashboard_bus
+
 
 def init_dashboard_queue() -> None:
     """Initialise an empty dashboard queue for the current async context.
 
     Call this once at the start of each request handler (event_generator).
+    Channels that are never closed expire after the bus TTL.
     """
-    _dashboard_queue.set([])
+    previous = _dashboard_channel.get(None)
+    if previous is not None:
+        _dashboard_bus.close_session(previous)
+    _dashboard_channel.set(uuid.uuid4().hex)
 
 
 def queue_tool_result(tool_name: str, result: Any) -> None:
     """Enqueue a tool result for later dashboard event creation.
 
     Safe to call even when no queue has been initialised (e.g. in tests
-    or CLI mode) -- the call is silently ignored.
+    or CLI mode) -- the call is silently ignored. When the request's queue
+    is full the oldest pending result is dropped.
 
     Args:
         tool_name: Name of the tool that produced the result.
         result: The raw tool result (may be BaseToolResponse, dict, str, etc.).
     """
-    q = _dashboard_queue.get(None)
-    if q is None:
+    channel = _dashboard_channel.get(None)
+    if channel is None:
         return
-    q.append((tool_name, result))
+    _dashboard_bus.publish(channel, (tool_name, result))
 
 
 def drain_dashboard_queue() -> list[tuple[str, Any]]:
     """Drain all queued tool results and return them.
 
     Returns an empty list if the queue was never initialised or is empty.
-    Uses atomic swap to prevent losing events added between copy and clear.
     """
-    q = _dashboard_queue.get(None)
-    if not q:
+    channel = _dashboard_channel.get(None)
+    if channel is None:
         return []
-    # Atomic swap: replace the list with a fresh one so concurrent
-    # queue_tool_result() calls append to the new list, not the one
-    # we are about to return.
-    _dashboard_queue.set([])
-    return q
+    return _dashboard_bus.drain(channel)
+
+
+def close_dashboard_queue() -> None:
+    """Discard the current context's queue (call when the request ends)."""
+    channel = _dashboard_channel.get(None)
+    if channel is not None:
+        _dashboard_bus.close_session(channel)
+        _dashboard_channel.set(None)
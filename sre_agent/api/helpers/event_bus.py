@@ -0,0 +1,250 @@
+"""Bounded per-session event bus shared by the UI side channels.
+
+Memory toasts and dashboard results are produced by tools and callbacks and
+drained by the streaming endpoint between runner events. Both used to sit in
+unbounded per-session containers, so a chatty tool loop, or a client that
+disconnected before its queue was cleaned up, could pile up events forever.
+
+:class:`SessionEventBus` gives every session a bounded channel:
+
+- **Bounded buffers**: at most ``max_events_per_session`` pending events per
+  subscriber. On overflow the oldest (default) or the newest event is
+  dropped, according to :class:`OverflowPolicy`.
+- **Coalescing**: an optional ``coalesce_key`` maps events to a key; a new
+  event with the same key replaces the pending one (latest wins), e.g. one
+  pending "tool tracked" toast per session instead of one per tool call.
+- **Fan-out**: events go to every subscriber of the session. Consumers that
+  drain without subscribing share the implicit default subscriber.
+- **TTL cleanup**: sessions with no publish or drain for
+  ``session_ttl_seconds`` are dropped, as is the least recently active
+  session beyond ``max_sessions``.
+- **Metrics**: :meth:`SessionEventBus.stats` reports queue depth and
+  published/dropped/coalesced/expired counters.
+
+All operations are thread-safe and O(1) per event (expiry is amortised), so
+tools running in worker threads can publish directly.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Subscriber that drains a session when no explicit subscription exists.
+DEFAULT_SUBSCRIBER = "default"
+
+
+class OverflowPolicy(str, Enum):
+    """What to drop when a subscriber's buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"  # Keep the most recent events
+    DROP_NEWEST = "drop_newest"  # Reject the incoming event
+
+
+@dataclass(frozen=True)
+class EventBusConfig:
+    """Limits for :class:`SessionEventBus`.
+
+    Attributes:
+        max_events_per_session: Pending events kept per subscriber.
+        overflow: Which event to drop when a buffer is full.
+        session_ttl_seconds: Idle time after which a session is dropped.
+        max_sessions: Sessions kept at once; least recently active go first.
+    """
+
+    max_events_per_session: int = 256
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    session_ttl_seconds: float = 30 * 60
+    max_sessions: int = 10_000
+
+    @classmethod
+    def from_env(cls) -> EventBusConfig:
+        """Build a config from ``SRE_AGENT_EVENT_BUS_*`` environment variables."""
+        return cls(
+            max_events_per_session=int(
+                os.environ.get("SRE_AGENT_EVENT_BUS_MAX_EVENTS", "256")
+            ),
+            overflow=OverflowPolicy(
+                os.environ.get("SRE_AGENT_EVENT_BUS_OVERFLOW", "drop_oldest")
+            ),
+            session_ttl_seconds=float(
+                os.environ.get("SRE_AGENT_EVENT_BUS_TTL_SECONDS", "1800")
+            ),
+        )
+
+
+@dataclass
+class _Channel(Generic[T]):
+    """Per-session buffers, one per subscriber."""
+
+    subscribers: dict[str, OrderedDict[Hashable, T]] = field(default_factory=dict)
+    last_active: float = 0.0
+
+
+class SessionEventBus(Generic[T]):
+    """Bounded, coalescing, fan-out event channels keyed by session ID."""
+
+    def __init__(
+        self,
+        name: str,
+        config: EventBusConfig | None = None,
+        coalesce_key: Callable[[T], Hashable | None] | None = None,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            name: Label used in logs and stats.
+            config: Buffer and expiry limits (defaults from the environment).
+            coalesce_key: Maps an event to a key; pending events with the
+                same key are replaced by the newer one. ``None`` keys (or no
+                function) never coalesce.
+        """
+        self.name = name
+        self.config = config or EventBusConfig.from_env()
+        self._coalesce_key = coalesce_key
+        self._channels: OrderedDict[str, _Channel[T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._subscriber_ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.expired = 0
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def publish(self, session_id: str, event: T) -> bool:
+        """Deliver ``event`` to every subscriber of ``session_id``.
+
+        Args:
+            session_id: Target session.
+            event: The event.
+
+        Returns:
+            False if the event was dropped by every subscriber buffer.
+        """
+        coalesce = self._coalesce_key(event) if self._coalesce_key else None
+        now = time.monotonic()
+        with self._lock:
+            channel = self._touch(session_id, now)
+            key: Hashable = ("c", coalesce) if coalesce is not None else next(self._seq)
+            delivered = False
+            for buffer in channel.subscribers.values():
+                delivered = self._push(buffer, key, event) or delivered
+            self.published += 1
+            self._expire(now)
+        return delivered
+
+    def _push(self, buffer: OrderedDict[Hashable, T], key: Hashable, event: T) -> bool:
+        if key in buffer:
+            del buffer[key]
+            buffer[key] = event
+            self.coalesced += 1
+            return True
+        if len(buffer) >= self.config.max_events_per_session:
+            self.dropped += 1
+            if self.config.overflow is OverflowPolicy.DROP_NEWEST:
+                return False
+            buffer.popitem(last=False)
+        buffer[key] = event
+        return True
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def subscribe(self, session_id: str) -> str:
+        """Add a subscriber that receives events published from now on.
+
+        Returns:
+            The subscriber ID to pass to :meth:`drain`.
+        """
+        subscriber = f"sub-{next(self._subscriber_ids)}"
+        with self._lock:
+            channel = self._touch(session_id, time.monotonic())
+            channel.subscribers[subscriber] = OrderedDict()
+        return subscriber
+
+    def unsubscribe(self, session_id: str, subscriber: str) -> None:
+        """Remove a subscriber and its pending events."""
+        with self._lock:
+            channel = self._channels.get(session_id)
+            if channel is not None:
+                channel.subscribers.pop(subscriber, None)
+
+    def drain(self, session_id: str, subscriber: str = DEFAULT_SUBSCRIBER) -> list[T]:
+        """Remove and return a subscriber's pending events, oldest first."""
+        with self._lock:
+            channel = self._channels.get(session_id)
+            if channel is None:
+                return []
+            buffer = channel.subscribers.get(subscriber)
+            if not buffer:
+                return []
+            channel.subscribers[subscriber] = OrderedDict()
+            self._touch(session_id, time.monotonic())
+        return list(buffer.values())
+
+    def close_session(self, session_id: str) -> None:
+        """Drop a session's channel and all pending events."""
+        with self._lock:
+            self._channels.pop(session_id, None)
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def _touch(self, session_id: str, now: float) -> _Channel[T]:
+        channel = self._channels.get(session_id)
+        if channel is None:
+            channel = _Channel(subscribers={DEFAULT_SUBSCRIBER: OrderedDict()})
+            self._channels[session_id] = channel
+        else:
+            self._channels.move_to_end(session_id)
+        channel.last_active = now
+        return channel
+
+    def _expire(self, now: float) -> None:
+        # Channels are in last-active order, so idle ones are at the front.
+        ttl = self.config.session_ttl_seconds
+        while self._channels:
+            session_id, oldest = next(iter(self._channels.items()))
+            idle = now - oldest.last_active > ttl
+            if not idle and len(self._channels) <= self.config.max_sessions:
+                return
+            del self._channels[session_id]
+            self.expired += 1
+            logger.debug(f"Expired {self.name} event channel for {session_id}")
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and drop counters for status endpoints."""
+        with self._lock:
+            depths = [
+                len(buffer)
+                for channel in self._channels.values()
+                for buffer in channel.subscribers.values()
+            ]
+            return {
+                "name": self.name,
+                "sessions": len(self._channels),
+                "pending": sum(depths),
+                "max_depth": max(depths, default=0),
+                "published": self.published,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "expired": self.expired,
+            }
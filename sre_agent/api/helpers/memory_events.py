@@ -18,16 +18,17 @@ Event Schema:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import threading
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Hashable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+from sre_agent.api.helpers.event_bus import EventBusConfig, SessionEventBus
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,21 +83,33 @@ class MemoryEvent:
         )
 
 
+def _memory_coalesce_key(event: MemoryEvent) -> Hashable | None:
+    """Coalesce tool-tracking toasts: only the latest one per session matters."""
+    if event.action is MemoryAction.TOOL_TRACKED:
+        return event.action
+    return None
+
+
 class MemoryEventBus:
     """Thread-safe event bus for memory events.
 
     Events are queued and can be consumed by the streaming endpoint.
-    Each session has its own event queue.
+    Each session has its own bounded channel on a :class:`SessionEventBus`;
+    tool-tracking events are coalesced and idle sessions expire.
     """
 
     _instance: MemoryEventBus | None = None
     _instance_lock: threading.Lock = threading.Lock()
-    _lock: asyncio.Lock
 
-    def __init__(self) -> None:
-        """Initialize the event bus."""
-        self._queues: dict[str, asyncio.Queue[MemoryEvent]] = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, config: EventBusConfig | None = None) -> None:
+        """Initialize the event bus.
+
+        Args:
+            config: Buffer and expiry limits (defaults from the environment).
+        """
+        self._bus: SessionEventBus[MemoryEvent] = SessionEventBus(
+            "memory", config, coalesce_key=_memory_coalesce_key
+        )
         self._enabled = True  # Can be disabled via config
 
     @classmethod
@@ -117,13 +130,6 @@ class MemoryEventBus:
         """Enable or disable memory events."""
         self._enabled = enabled
 
-    async def get_queue(self, session_id: str) -> asyncio.Queue[MemoryEvent]:
-        """Get or create a queue for a session."""
-        async with self._lock:
-            if session_id not in self._queues:
-                self._queues[session_id] = asyncio.Queue()
-            return self._queues[session_id]
-
     async def emit(self, session_id: str | None, event: MemoryEvent) -> None:
         """Emit a memory event to the queue.
 
@@ -131,54 +137,35 @@ class MemoryEventBus:
             session_id: The session to emit to. If None, uses "global".
             event: The memory event to emit.
         """
-        if not self._enabled:
-            return
-
-        sid = session_id or "global"
-        queue = await self.get_queue(sid)
-        await queue.put(event)
-        logger.debug(f"Memory event emitted: {event.action.value} - {event.title}")
+        self.emit_sync(session_id, event)
 
     def emit_sync(self, session_id: str | None, event: MemoryEvent) -> None:
-        """Synchronously emit a memory event (creates task in background).
+        """Synchronously emit a memory event.
 
-        This is useful for callbacks that can't be async.
+        Publishing never blocks, so this is safe from sync callbacks and
+        worker threads.
         """
         if not self._enabled:
             return
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Store task reference to prevent GC (per ruff RUF006)
-                task = asyncio.create_task(self.emit(session_id, event))
-                task.add_done_callback(
-                    lambda t: None
-                )  # Prevent unhandled exception warning
-            else:
-                loop.run_until_complete(self.emit(session_id, event))
-        except RuntimeError:
-            # No event loop, skip
-            logger.debug("No event loop available for memory event")
+        self._bus.publish(session_id or "global", event)
+        logger.debug(f"Memory event emitted: {event.action.value} - {event.title}")
 
     async def drain_events(self, session_id: str) -> AsyncGenerator[MemoryEvent, None]:
         """Drain all pending events for a session.
 
         This is non-blocking - returns immediately if no events are pending.
         """
-        queue = await self.get_queue(session_id)
-        while not queue.empty():
-            try:
-                event = queue.get_nowait()
-                yield event
-            except asyncio.QueueEmpty:
-                break
+        for event in self._bus.drain(session_id):
+            yield event
 
     async def cleanup_session(self, session_id: str) -> None:
         """Remove a session's queue when done."""
-        async with self._lock:
-            if session_id in self._queues:
-                del self._queues[session_id]
+        self._bus.close_session(session_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and drop counters."""
+        return self._bus.stats()
 
 
 # Singleton accessor
@@ -0,0 +1,410 @@
+"""NDJSON stream transport for the local chat endpoint.
+
+Every chat stream used to poll ``raw_request.is_disconnected()`` every 100 ms
+from a side task, ``json.dumps`` each text chunk, tool event and dashboard
+event into its own ``str`` line (re-encoded to bytes by Starlette), and probe
+every event part through repeated ``getattr``/``dict.get`` fallbacks. This
+module gives the router three pieces instead:
+
+- :func:`normalize_event` converts a runner event once into a list of typed
+  :class:`StreamPart` items. ADK ``Event``/``Part`` objects take a direct
+  attribute fast path; dicts and other shapes keep the tolerant fallbacks.
+- :class:`NDJSONStream` encodes frames with ``pydantic_core.to_json`` (the
+  Rust serializer pydantic already ships) into a per-stream ``bytearray`` and
+  hands the router one ``bytes`` chunk per runner event. Consecutive text
+  deltas are merged into a single text frame; across partial (streaming)
+  events they are held for up to ``text_flush_window_ms``.
+  :func:`with_flush_deadlines` wakes the router when that window expires
+  before the next event arrives, so held text never waits on a slow event.
+- :func:`cancel_on_disconnect` waits on the ASGI receive channel for the
+  ``http.disconnect`` message and cancels the streaming task, so idle streams
+  cost nothing until the client actually goes away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, TypeVar
+
+from google.adk.events import Event
+from google.genai import types
+from pydantic_core import to_json
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PartKind(str, Enum):
+    """Kinds of content the chat stream renders."""
+
+    TEXT = "text"
+    THOUGHT = "thought"
+    TOOL_CALL = "tool_call"
+    TOOL_RESPONSE = "tool_response"
+
+
+@dataclass(frozen=True)
+class StreamPart:
+    """One renderable piece of a runner event.
+
+    Attributes:
+        kind: What the part carries.
+        text: Text or thought content.
+        tool_name: Tool name for tool calls and responses.
+        args: Raw tool call arguments.
+        result: Raw tool response payload.
+        call_id: ADK function call/response ID, if any.
+    """
+
+    kind: PartKind
+    text: str = ""
+    tool_name: str = ""
+    args: Any = None
+    result: Any = None
+    call_id: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Event normalization
+# ---------------------------------------------------------------------------
+
+
+def normalize_event(event: Any) -> list[StreamPart]:
+    """Convert a runner event into the parts the chat stream renders.
+
+    Args:
+        event: An ADK ``Event``, or a dict/object with the same shape.
+
+    Returns:
+        Parts in render order (per event part: text, thought, tool call,
+        tool response). Empty if the event has nothing to show.
+    """
+    if isinstance(event, Event):
+        content = event.content
+        parts: list[StreamPart] = []
+        for part in (content.parts if content else None) or []:
+            if isinstance(part, types.Part):
+                _normalize_adk_part(part, parts)
+            else:
+                _normalize_part(part, parts)
+        return parts
+    return _normalize_generic_event(event)
+
+
+def _normalize_adk_part(part: types.Part, out: list[StreamPart]) -> None:
+    # ``Part.thought`` is a flag on ADK parts; thought text arrives as text.
+    if part.text:
+        out.append(StreamPart(PartKind.TEXT, text=part.text))
+    fc = part.function_call
+    if fc is not None and fc.name:
+        out.append(
+            StreamPart(
+                PartKind.TOOL_CALL, tool_name=fc.name, args=fc.args, call_id=fc.id
+            )
+        )
+    fr = part.function_response
+    if fr is not None and fr.name:
+        out.append(
+            StreamPart(
+                PartKind.TOOL_RESPONSE,
+                tool_name=fr.name,
+                result=fr.response or None,
+                call_id=fr.id,
+            )
+        )
+
+
+def _field(obj: Any, name: str) -> Any:
+    value = getattr(obj, name, None)
+    if value is None and isinstance(obj, Mapping):
+        value = obj.get(name)
+    return value
+
+
+def _normalize_generic_event(event: Any) -> list[StreamPart]:
+    parts: list[Any] = []
+    content = _field(event, "content")
+    if content:
+        raw_parts = _field(content, "parts") or []
+        parts = raw_parts if isinstance(raw_parts, list) else [raw_parts]
+
+    # Some event shapes carry a tool call or response directly.
+    if not parts:
+        fc = getattr(event, "function_call", None)
+        fr = getattr(event, "function_response", None)
+        if fc or fr:
+            parts = [{"function_call": fc} if fc else {"function_response": fr}]
+
+    out: list[StreamPart] = []
+    for part in parts:
+        _normalize_part(part, out)
+    return out
+
+
+def _normalize_part(part: Any, out: list[StreamPart]) -> None:
+    text = _field(part, "text")
+    if text and isinstance(text, str):
+        out.append(StreamPart(PartKind.TEXT, text=text))
+
+    thought = _field(part, "thought")
+    if thought and isinstance(thought, str):
+        out.append(StreamPart(PartKind.THOUGHT, text=thought))
+
+    fc = _field(part, "function_call")
+    if fc:
+        tool_name = (
+            fc.get("name") if isinstance(fc, dict) else getattr(fc, "name", None)
+        )
+        if tool_name and isinstance(tool_name, str):
+            out.append(
+                StreamPart(
+                    PartKind.TOOL_CALL,
+                    tool_name=tool_name,
+                    args=_field(fc, "args"),
+                    call_id=_field(fc, "id"),
+                )
+            )
+
+    fr = _field(part, "function_response")
+    if fr:
+        tool_name = (
+            fr.get("name") if isinstance(fr, dict) else getattr(fr, "name", None)
+        )
+        if tool_name and isinstance(tool_name, str):
+            out.append(
+                StreamPart(
+                    PartKind.TOOL_RESPONSE,
+                    tool_name=tool_name,
+                    result=_field(fr, "response") or _field(fr, "result"),
+                    call_id=_field(fr, "id"),
+                )
+            )
+
+
+# ---------------------------------------------------------------------------
+# NDJSON encoding
+# ---------------------------------------------------------------------------
+
+
+def encode_event(payload: Any) -> bytes:
+    """Encode one NDJSON frame (JSON document plus newline)."""
+    return to_json(payload) + b"\n"
+
+
+@dataclass(frozen=True)
+class StreamTransportConfig:
+    """Coalescing limits for :class:`NDJSONStream`.
+
+    Attributes:
+        text_flush_window_ms: How long text deltas from partial events may be
+            held to merge with later deltas. 0 flushes after every event.
+        max_text_chars: Pending text size that forces a flush.
+    """
+
+    text_flush_window_ms: float = 25.0
+    max_text_chars: int = 4096
+
+    @classmethod
+    def from_env(cls) -> StreamTransportConfig:
+        """Build a config from ``SRE_AGENT_STREAM_*`` environment variables."""
+        return cls(
+            text_flush_window_ms=float(
+                os.environ.get("SRE_AGENT_STREAM_TEXT_WINDOW_MS", "25")
+            ),
+            max_text_chars=int(
+                os.environ.get("SRE_AGENT_STREAM_MAX_TEXT_CHARS", "4096")
+            ),
+        )
+
+
+class NDJSONStream:
+    """Per-stream frame buffer with text-delta coalescing.
+
+    Frames are appended with :meth:`write`, :meth:`write_line` and
+    :meth:`write_text`, and collected into one chunk with :meth:`take`.
+    Frame order is preserved: pending text is flushed before any other frame.
+    """
+
+    def __init__(self, config: StreamTransportConfig | None = None) -> None:
+        """Initialize the stream.
+
+        Args:
+            config: Coalescing limits (defaults from the environment).
+        """
+        self.config = config or StreamTransportConfig.from_env()
+        self._window = self.config.text_flush_window_ms / 1000
+        self._buffer = bytearray()
+        self._text: list[str] = []
+        self._text_chars = 0
+        self._text_since = 0.0
+        self.frames = 0
+        self.chunks = 0
+        self.coalesced = 0
+
+    def write(self, payload: dict[str, Any]) -> None:
+        """Append a JSON frame."""
+        self._flush_text()
+        self._buffer += to_json(payload)
+        self._buffer += b"\n"
+        self.frames += 1
+
+    def write_line(self, line: str) -> None:
+        """Append a frame that is already JSON-encoded."""
+        self._flush_text()
+        self._buffer += line.encode()
+        self._buffer += b"\n"
+        self.frames += 1
+
+    def write_text(self, text: str) -> None:
+        """Append a text delta, merging it with pending text."""
+        if self._text:
+            self.coalesced += 1
+        else:
+            self._text_since = time.monotonic()
+        self._text.append(text)
+        self._text_chars += len(text)
+        if self._text_chars >= self.config.max_text_chars:
+            self._flush_text()
+
+    def take(self, final: bool = True) -> bytes | None:
+        """Return the buffered frames as one chunk.
+
+        Args:
+            final: False while a response is still streaming (partial
+                events); pending text is then held until the flush window
+                has elapsed.
+
+        Returns:
+            The chunk to send, or None if nothing is ready.
+        """
+        if self._text and (
+            final or time.monotonic() - self._text_since >= self._window
+        ):
+            self._flush_text()
+        if not self._buffer:
+            return None
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        self.chunks += 1
+        return chunk
+
+    def flush_delay(self) -> float | None:
+        """Seconds until held text is due, or None if no text is held."""
+        if not self._text:
+            return None
+        return max(0.0, self._text_since + self._window - time.monotonic())
+
+    def stats(self) -> dict[str, int]:
+        """Return frame and chunk counters."""
+        return {
+            "frames": self.frames,
+            "chunks": self.chunks,
+            "coalesced": self.coalesced,
+        }
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        text = self._text[0] if len(self._text) == 1 else "".join(self._text)
+        self._text.clear()
+        self._text_chars = 0
+        self._buffer += to_json({"type": "text", "content": text})
+        self._buffer += b"\n"
+        self.frames += 1
+
+
+async def with_flush_deadlines(
+    events: AsyncIterator[T], stream: NDJSONStream
+) -> AsyncIterator[T | None]:
+    """Yield ``events``, plus None whenever ``stream``'s held text is due.
+
+    On None the caller should ``stream.take(final=False)`` and send the
+    chunk.  ``events`` is drained by a single pump task, one event ahead of
+    the caller: timing out a wait on ``__anext__`` directly would close the
+    generator, and a task per step would split its context across tasks.
+
+    Args:
+        events: Source events (e.g. the runner's turn).
+        stream: Stream whose text flush window sets the deadlines.
+    """
+    if stream.config.text_flush_window_ms <= 0:
+        async for event in events:
+            yield event
+        return
+
+    queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize=1)
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                await queue.put((True, event))
+        except Exception as e:
+            await queue.put((False, e))
+            return
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put((False, None))
+
+    pump_task = asyncio.ensure_future(pump())
+    try:
+        while True:
+            try:
+                is_event, item = await asyncio.wait_for(
+                    queue.get(), stream.flush_delay()
+                )
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if is_event:
+                yield item
+            elif item is None:
+                return
+            else:
+                raise item
+    finally:
+        pump_task.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Disconnect detection
+# ---------------------------------------------------------------------------
+
+
+async def cancel_on_disconnect(
+    request: Request, task: asyncio.Task[Any] | None, label: str = ""
+) -> None:
+    """Cancel ``task`` once the client disconnects.
+
+    Blocks on the ASGI receive channel until ``http.disconnect`` arrives (the
+    request body has already been read by the endpoint), so there is no
+    polling loop per stream. Run it as a side task and cancel it when the
+    stream ends.
+
+    Args:
+        request: The streaming request.
+        task: The task producing the stream.
+        label: Context for the log message (e.g. the session ID).
+    """
+    try:
+        while True:
+            message = await request.receive()
+            if message.get("type") == "http.disconnect":
+                break
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.debug(f"Disconnect watch unavailable for {label}: {e}")
+        return
+    if task is not None and not task.done():
+        logger.warning(f"🔌 Client disconnected for {label}. Cancelling agent task.")
+        task.cancel()
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 # Track if we have already logged a successful health check to reduce log noise
 # Default to True to suppress the very first health check log (unless it fails)
 _HEALTH_SUCCESS_LOGGED = True
+_READY_LAST_STATUS: int | None = None
 
 
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -86,6 +87,13 @@ async def tracing_middleware(request: Request, call_next: Any) -> Any:
                 # On failure, flag it so we log the next success
                 _HEALTH_SUCCESS_LOGGED = False
 
+        # Readiness probes return 503 while the replica warms up; log only
+        # changes of status rather than every probe.
+        if request.url.path == "/ready":
+            global _READY_LAST_STATUS
+            should_log = response.status_code != _READY_LAST_STATUS
+            _READY_LAST_STATUS = response.status_code
+
         if should_log:
             log_msg = (
                 f"🌐 Request End: {request.method} {request.url.path} - {response.status_code} "
@@ -115,6 +123,25 @@ async def tracing_middleware(request: Request, call_next: Any) -> Any:
         raise
 
 
+async def loop_attribution_middleware(request: Request, call_next: Any) -> Any:
+    """Attribute event-loop time spent serving a request to its route."""
+    from sre_agent.core.loop_monitor import activity
+
+    scope = request.scope
+    method = request.method
+
+    def route_label() -> str:
+        # Resolved when a stall is reported: the router stores the matched
+        # route in the shared scope, so the template (not the raw path, with
+        # its IDs) is used once routing has run.
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        return f"route:{method} {path}"
+
+    with activity(route_label):
+        return await call_next(request)
+
+
 async def auth_middleware(request: Request, call_next: Any) -> Any:
     """Middleware to extract Authorization header and set credentials context."""
     from google.oauth2.credentials import Credentials
@@ -314,5 +341,8 @@ def configure_middleware(app: FastAPI) -> None:
     # Register auth middleware
     app.middleware("http")(auth_middleware)
 
+    # Attribute blocking calls to routes (wraps auth and the route itself)
+    app.middleware("http")(loop_attribution_middleware)
+
     # Register tracing middleware (must be the last added to be the first executed - outermost)
     app.middleware("http")(tracing_middleware)
@@ -37,6 +37,14 @@ from google.genai.types import Content, Part
 from pydantic import BaseModel, ConfigDict
 
 from sre_agent.api.helpers.memory_events import get_memory_event_bus
+from sre_agent.api.helpers.stream_transport import (
+    NDJSONStream,
+    PartKind,
+    cancel_on_disconnect,
+    encode_event,
+    normalize_event,
+    with_flush_deadlines,
+)
 from sre_agent.auth import (
     encrypt_token,
     get_current_credentials_or_none,
@@ -57,6 +65,7 @@ from sre_agent.services.agent_engine_client import (
     is_remote_mode,
 )
 from sre_agent.services.session import get_session_service
+from sre_agent.services.telemetry_catalog import get_telemetry_catalog
 from sre_agent.suggestions import generate_contextual_suggestions
 from sre_agent.tools.synthetic.demo_chat_responses import (
     get_demo_suggestions,
@@ -216,6 +225,7 @@ async def _handle_remote_agent(
         create_tool_response_events,
         normalize_tool_args,
     )
+    from sre_agent.tools.analysis.genui_pipeline import WidgetPatcher
 
     client = get_agent_engine_client()
     if client is None:
@@ -229,6 +239,7 @@ async def _handle_remote_agent(
     async def remote_event_generator() -> AsyncGenerator[str, None]:
         """Stream events from remote Agent Engine."""
         pending_tool_calls: list[dict[str, Any]] = []
+        patcher = WidgetPatcher()
 
         # Emit trace_info so the frontend can deep-link to Cloud Trace
         trace_info = get_current_trace_info(project_id=project_id)
@@ -357,7 +368,9 @@ async def _handle_remote_agent(
                                 for evt in create_exploration_dashboard_events(result):
                                     yield evt + "\n"
                             else:
-                                dash_evt = create_dashboard_event(tool_name, result)
+                                dash_evt = create_dashboard_event(
+                                    tool_name, result, patcher
+                                )
                                 if dash_evt:
                                     yield dash_evt + "\n"
 
@@ -486,6 +499,7 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
     from sre_agent.agent import root_agent
     from sre_agent.api.helpers import get_current_trace_info
     from sre_agent.api.helpers.dashboard_queue import (
+        close_dashboard_queue,
         drain_dashboard_queue,
         init_dashboard_queue,
     )
@@ -496,6 +510,7 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
         create_tool_response_events,
         normalize_tool_args,
     )
+    from sre_agent.tools.analysis.genui_pipeline import WidgetPatcher
 
     # Lazy init runner
     if not hasattr(root_agent, "_runner"):
@@ -600,7 +615,7 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
         await session_manager.append_event(session, user_event)
 
         # 3. Stream Response
-        async def event_generator() -> AsyncGenerator[str, None]:
+        async def event_generator() -> AsyncGenerator[bytes, None]:
             # Propagate authentication context into the generator.
             # This is CRITICAL for StreamingResponse because the middleware's finally block
             # clears the ContextVars before the generator starts yielding.
@@ -627,86 +642,80 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
             # (inline) and the dashboard queue (from @adk_tool decorator).
             inline_emitted_counts: dict[str, int] = {}
 
+            # Sends widgets that only grew as patches, and drops repeats
+            patcher = WidgetPatcher()
+
             # --- DEBUG UI TEST PATTERN ---
             if "DEBUG_UI_TEST" in last_msg_text:
                 logger.info("🧪 Triggering DEBUG_UI_TEST mock sequence")
-                yield json.dumps({"type": "session", "session_id": session.id}) + "\n"
+                yield encode_event({"type": "session", "session_id": session.id})
 
                 # Test: Simple 'tool-log' Alias + Waterfall Control
-                yield (
-                    json.dumps(
-                        {
-                            "type": "text",
-                            "content": "### Test: Simple 'tool-log' Alias + BUTTON Control\nExpecting: GREEN/CYAN BOX or BUTTON",
-                        }
-                    )
-                    + "\n"
+                yield encode_event(
+                    {
+                        "type": "text",
+                        "content": "### Test: Simple 'tool-log' Alias + BUTTON Control\nExpecting: GREEN/CYAN BOX or BUTTON",
+                    }
                 )
 
                 sid = uuid.uuid4().hex
                 cid = f"tool-log-{sid[:8]}"
 
                 # Atomic Init with Alias & Redundant Types & Button
-                yield (
-                    json.dumps(
-                        {
-                            "type": "a2ui",
-                            "message": {
-                                "beginRendering": {
-                                    "surfaceId": sid,
-                                    "root": cid,
-                                    "components": [
-                                        {
-                                            "id": cid,
-                                            "type": "tool-log",  # Root Level Type
-                                            "component": {
+                yield encode_event(
+                    {
+                        "type": "a2ui",
+                        "message": {
+                            "beginRendering": {
+                                "surfaceId": sid,
+                                "root": cid,
+                                "components": [
+                                    {
+                                        "id": cid,
+                                        "type": "tool-log",  # Root Level Type
+                                        "component": {
+                                            "type": "tool-log",
+                                            "componentType": "tool-log",
+                                            "tool-log": {
                                                 "type": "tool-log",
-                                                "componentType": "tool-log",
-                                                "tool-log": {
-                                                    "type": "tool-log",
-                                                    "tool_name": "alias_test",
-                                                    "status": "running",
-                                                },
+                                                "tool_name": "alias_test",
+                                                "status": "running",
                                             },
-                                        }
-                                    ],
-                                }
-                            },
-                        }
-                    )
-                    + "\n"
+                                        },
+                                    }
+                                ],
+                            }
+                        },
+                    }
                 )
 
                 # Sequenced: Marker AFTER data
-                yield json.dumps({"type": "ui", "surface_id": sid}) + "\n"
-                yield (
-                    json.dumps(
-                        {
-                            "type": "a2ui",
-                            "message": {
-                                "surfaceUpdate": {
-                                    "surfaceId": sid,
-                                    "components": [
-                                        {
-                                            "id": cid,
+                yield encode_event({"type": "ui", "surface_id": sid})
+                yield encode_event(
+                    {
+                        "type": "a2ui",
+                        "message": {
+                            "surfaceUpdate": {
+                                "surfaceId": sid,
+                                "components": [
+                                    {
+                                        "id": cid,
+                                        "type": "tool-log",
+                                        "component": {
                                             "type": "tool-log",
-                                            "component": {
+                                            "componentType": "tool-log",
+                                            "tool-log": {
                                                 "type": "tool-log",
-                                                "componentType": "tool-log",
-                                                "tool-log": {
-                                                    "type": "tool-log",
-                                                    "tool_name": "alias_test",
-                                                    "status": "completed",  # Update to completed
-                                                    "result": "Local UI test successful",
-                                                },
+                                                "tool_name": "alias_test",
+                                                "status": "completed",  # Update to completed
+                                                "result": "Local UI test successful",
                                             },
-                                        }
-                                    ],
-                                }
-                            },
-                        }
-                    )
-                    + "\n"
+                                        },
+                                    }
+                                ],
+                            }
+                        },
+                    }
                 )
 
                 # Test Button (Core Catalog)
@@ -714,41 +723,38 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
                 cid_btn = f"btn-{sid_btn[:8]}"
 
                 # Sequencing: DATA FIRST
-                yield (
-                    json.dumps(
-                        {
-                            "type": "a2ui",
-                            "message": {
-                                "beginRendering": {
-                                    "surfaceId": sid_btn,
-                                    "root": cid_btn,
-                                    "components": [
-                                        {
-                                            "id": cid_btn,
+                yield encode_event(
+                    {
+                        "type": "a2ui",
+                        "message": {
+                            "beginRendering": {
+                                "surfaceId": sid_btn,
+                                "root": cid_btn,
+                                "components": [
+                                    {
+                                        "id": cid_btn,
+                                        "type": "button",
+                                        "component": {
                                             "type": "button",
-                                            "component": {
-                                                "type": "button",
-                                                "label": "CORE BUTTON TEST",
-                                                "actionId": "test_action",
-                                            },
-                                        }
-                                    ],
-                                }
-                            },
-                        }
-                    )
-                    + "\n"
+                                            "label": "CORE BUTTON TEST",
+                                            "actionId": "test_action",
+                                        },
+                                    }
+                                ],
+                            }
+                        },
+                    }
                 )
 
                 # Sequencing: MARKER SECOND
-                yield json.dumps({"type": "ui", "surface_id": sid_btn}) + "\n"
+                yield encode_event({"type": "ui", "surface_id": sid_btn})
 
                 return
             # -----------------------------
 
             # Send session ID first
-            session_init_evt = (
-                json.dumps({"type": "session", "session_id": session.id}) + "\n"
+            session_init_evt = encode_event(
+                {"type": "session", "session_id": session.id}
             )
             logger.info(f"📤 Initializing session stream: {session.id}")
             yield session_init_evt
@@ -756,7 +762,7 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
             # Emit trace_info so the frontend can deep-link to Cloud Trace
             trace_info = get_current_trace_info(project_id=effective_project_id)
             if trace_info:
-                yield json.dumps(trace_info) + "\n"
+                yield encode_event(trace_info)
 
             # Refresh session to ensure we have the latest state
             active_session = session
@@ -779,210 +785,139 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
                 except Exception as e:
                     logger.warning(f"⚠️ Failed to auto-name session: {e}")
 
-            # Start a background task to monitor client disconnection.
-            # This ensures the agent run is cancelled immediately (with CancelledError)
-            # when the client disconnects, even if the StreamResponse hasn't yet
-            # polled the generator. The 0.1s interval matches test expectations.
-            current_task = asyncio.current_task()
+            # Cancel the agent run as soon as the client disconnects, even if
+            # StreamingResponse is not currently pulling from this generator.
+            # The watcher waits for the ASGI http.disconnect message (no polling).
+            checker_task = asyncio.create_task(
+                cancel_on_disconnect(
+                    raw_request, asyncio.current_task(), f"session {session.id}"
+                )
+            )
 
-            async def disconnect_checker() -> None:
-                try:
-                    while not await raw_request.is_disconnected():
-                        await asyncio.sleep(0.1)
-                    if current_task:
-                        logger.warning(
-                            f"🔌 Client disconnected for session {session.id}. Cancelling agent task."
-                        )
-                        current_task.cancel()
-                except asyncio.CancelledError:
-                    pass
+            # Events are acknowledged on the in-memory session right away and
+            # persisted in the background so storage latency stays off the
+            # stream; the journal is flushed at turn end and closed below.
+            journal = session_manager.open_journal(active_session)
 
-            checker_task = asyncio.create_task(disconnect_checker())
+            # Frames are buffered per runner event and sent as one chunk.
+            stream = NDJSONStream()
 
             try:
                 # Iterate through agent events from the Runner
                 # create domain context for the run
+                sources = (
+                    get_telemetry_catalog().peek(effective_project_id)
+                    if effective_project_id
+                    else None
+                )
                 domain_ctx = DomainContext(
                     project_id=effective_project_id,
                     investigation_phase=inv_state.phase.value if inv_state else None,
+                    telemetry_sources=sources.describe() if sources else None,
                 )
-                async for event in runner.run_turn(
-                    session=active_session,
-                    user_message=last_msg_text,
-                    user_id=effective_user_id,
-                    project_id=effective_project_id,
-                    domain_context=domain_ctx,
+                async for event in with_flush_deadlines(
+                    runner.run_turn(
+                        session=active_session,
+                        user_message=last_msg_text,
+                        user_id=effective_user_id,
+                        project_id=effective_project_id,
+                        domain_context=domain_ctx,
+                    ),
+                    stream,
                 ):
-                    logger.debug(
-                        f"📥 Received event from runner: {str(event)[:500]}..."
-                    )
-
-                    # Persist generated event
-                    await session_manager.append_event(active_session, event)
+                    if event is None:
+                        # Held text reached its flush window before the
+                        # next event arrived.
+                        if chunk := stream.take(final=False):
+                            yield chunk
+                        continue
 
-                    # 1. Extract parts from content if available
-                    parts = []
-                    content = getattr(event, "content", None) or (
-                        isinstance(event, dict) and event.get("content")
-                    )
+                    logger.debug("📥 Received event from runner: %.500s...", event)
 
-                    if content:
-                        raw_parts = getattr(content, "parts", []) or (
-                            isinstance(content, dict) and content.get("parts", [])
-                        )
-                        # Normalize to a list of parts
-                        if isinstance(raw_parts, list):
-                            parts = raw_parts
-                        else:
-                            parts = [raw_parts]
-
-                    # 2. If no content parts, check if the event itself is a direct tool response or call
-                    # Some ADK event types might have these as direct attributes
-                    if not parts:
-                        fc = getattr(event, "function_call", None)
-                        fr = getattr(event, "function_response", None)
-                        if fc or fr:
-                            parts = [
-                                {"function_call": fc}
-                                if fc
-                                else {"function_response": fr}
-                            ]
+                    # Persist generated event (write-behind)
+                    await journal.append(event)
 
+                    parts = normalize_event(event)
                     if not parts:
                         logger.debug(
-                            f"[INFO] Skipping event with no parts: {type(event).__name__}"
+                            "[INFO] Skipping event with no parts: %s",
+                            type(event).__name__,
                         )
-                        continue
 
                     for part in parts:
-                        logger.debug(f"🔍 Processing part: {str(part)[:500]}...")
+                        logger.debug("🔍 Processing part: %.500s...", part)
 
                         # A. Handle Text
-                        text = getattr(part, "text", None)
-                        if text is None and isinstance(part, dict):
-                            text = part.get("text")
-
-                        if text and isinstance(text, str):
-                            logger.info(f"📤 Yielding text: {str(text)[:50]}...")
-                            yield json.dumps({"type": "text", "content": text}) + "\n"
+                        if part.kind is PartKind.TEXT:
+                            logger.info("📤 Yielding text: %.50s...", part.text)
+                            stream.write_text(part.text)
 
                         # B. Handle Thought (Reasoning)
-                        thought = getattr(part, "thought", None)
-                        if thought is None and isinstance(part, dict):
-                            thought = part.get("thought")
-
-                        if thought and isinstance(thought, str):
-                            # logger.info(f"🧠 Yielding reasoning thought: {str(thought)[:50]}...")
-                            formatted_thought = f"\n\n**Thought**: {thought}\n\n"
-                            yield (
-                                json.dumps(
-                                    {"type": "text", "content": formatted_thought}
-                                )
-                                + "\n"
-                            )
+                        elif part.kind is PartKind.THOUGHT:
+                            stream.write_text(f"\n\n**Thought**: {part.text}\n\n")
 
                         # C. Handle Tool Calls
-                        fc = getattr(part, "function_call", None)
-                        if fc is None and isinstance(part, dict):
-                            fc = part.get("function_call")
-
-                        if fc:
-                            tool_name = (
-                                getattr(fc, "name", None)
-                                if not isinstance(fc, dict)
-                                else fc.get("name")
+                        elif part.kind is PartKind.TOOL_CALL:
+                            tool_name = part.tool_name
+                            tool_args = normalize_tool_args(part.args)
+                            logger.info(
+                                f"🛠️ Tool Call: {tool_name} args={str(tool_args)[:100]}..."
                             )
-                            if tool_name and isinstance(tool_name, str):
-                                tool_args_raw = (
-                                    getattr(fc, "args", None)
-                                    if not isinstance(fc, dict)
-                                    else fc.get("args")
-                                )
-                                tool_args = normalize_tool_args(tool_args_raw)
-                                # Extract function call id for robust matching
-                                fc_id = (
-                                    getattr(fc, "id", None)
-                                    if not isinstance(fc, dict)
-                                    else fc.get("id")
-                                )
-
-                                logger.info(
-                                    f"🛠️ Tool Call: {tool_name} args={str(tool_args)[:100]}..."
-                                )
-                                _call_id, events = create_tool_call_events(
-                                    tool_name,
-                                    tool_args,
-                                    pending_tool_calls,
-                                    fc_id=fc_id,
-                                )
-
-                                for evt_str in events:
-                                    yield evt_str + "\n"
+                            _call_id, events = create_tool_call_events(
+                                tool_name,
+                                tool_args,
+                                pending_tool_calls,
+                                fc_id=part.call_id,
+                            )
+                            for evt_str in events:
+                                stream.write_line(evt_str)
 
                         # D. Handle Tool Responses
-                        fr = getattr(part, "function_response", None)
-                        if fr is None and isinstance(part, dict):
-                            fr = part.get("function_response")
-
-                        if fr:
-                            tool_name = (
-                                getattr(fr, "name", None)
-                                if not isinstance(fr, dict)
-                                else fr.get("name")
+                        elif part.kind is PartKind.TOOL_RESPONSE:
+                            tool_name = part.tool_name
+                            result = part.result
+                            logger.info(f"✅ Tool Response: {tool_name}")
+                            _resp_id, events = create_tool_response_events(
+                                tool_name,
+                                result,
+                                pending_tool_calls,
+                                fr_id=part.call_id,
                             )
-                            if tool_name and isinstance(tool_name, str):
-                                result = (
-                                    getattr(fr, "response", None)
-                                    or getattr(fr, "result", None)
-                                    if not isinstance(fr, dict)
-                                    else (fr.get("response") or fr.get("result"))
-                                )
-                                # Extract function response id for robust matching
-                                fr_id = (
-                                    getattr(fr, "id", None)
-                                    if not isinstance(fr, dict)
-                                    else fr.get("id")
-                                )
+                            for evt_str in events:
+                                stream.write_line(evt_str)
 
-                                logger.info(f"✅ Tool Response: {tool_name}")
-                                _resp_id, events = create_tool_response_events(
-                                    tool_name, result, pending_tool_calls, fr_id=fr_id
+                            # Separate dashboard data event
+                            if tool_name == "explore_project_health":
+                                for evt in create_exploration_dashboard_events(result):
+                                    logger.info(
+                                        f"📊 Dashboard event (inline) for {tool_name}"
+                                    )
+                                    stream.write_line(evt)
+                                inline_emitted_counts[tool_name] = (
+                                    inline_emitted_counts.get(tool_name, 0) + 1
                                 )
-                                for evt_str in events:
-                                    yield evt_str + "\n"
-
-                                # Separate dashboard data event
-                                if tool_name == "explore_project_health":
-                                    for evt in create_exploration_dashboard_events(
-                                        result
-                                    ):
-                                        logger.info(
-                                            f"📊 Dashboard event (inline) for {tool_name}"
-                                        )
-                                        yield evt + "\n"
+                            else:
+                                dash_evt = create_dashboard_event(
+                                    tool_name, result, patcher
+                                )
+                                if dash_evt:
+                                    logger.info(
+                                        f"📊 Dashboard event (inline) for {tool_name}"
+                                    )
+                                    stream.write_line(dash_evt)
                                     inline_emitted_counts[tool_name] = (
                                         inline_emitted_counts.get(tool_name, 0) + 1
                                     )
-                                else:
-                                    dash_evt = create_dashboard_event(tool_name, result)
-                                    if dash_evt:
-                                        logger.info(
-                                            f"📊 Dashboard event (inline) for {tool_name}"
-                                        )
-                                        yield dash_evt + "\n"
-                                        inline_emitted_counts[tool_name] = (
-                                            inline_emitted_counts.get(tool_name, 0) + 1
-                                        )
-
-                                # Memory events for UI visibility (toasts)
-                                event_bus = get_memory_event_bus()
-                                async for mem_event in event_bus.drain_events(
-                                    session.id or "global"
-                                ):
-                                    logger.info(
-                                        f"🧠 Memory event: {mem_event.action.value}"
-                                    )
-                                    yield mem_event.to_json() + "\n"
+
+                            # Memory events for UI visibility (toasts)
+                            event_bus = get_memory_event_bus()
+                            async for mem_event in event_bus.drain_events(
+                                session.id or "global"
+                            ):
+                                logger.info(
+                                    f"🧠 Memory event: {mem_event.action.value}"
+                                )
+                                stream.write_line(mem_event.to_json())
 
                     # ── Drain dashboard event queue ──────────────────────
                     # The @adk_tool decorator queues dashboard-relevant
@@ -1001,18 +936,30 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
                                 logger.info(
                                     f"📊 Dashboard event (queued) for {queued_name}"
                                 )
-                                yield evt + "\n"
+                                stream.write_line(evt)
                         else:
                             dash_evt = create_dashboard_event(
-                                queued_name, queued_result
+                                queued_name, queued_result, patcher
                             )
                             if dash_evt:
                                 logger.info(
                                     f"📊 Dashboard event (queued) for {queued_name}"
                                 )
-                                yield dash_evt + "\n"
+                                stream.write_line(dash_evt)
+
+                    # Partial (streaming) events may hold text briefly so
+                    # small deltas go out as one frame.
+                    chunk = stream.take(
+                        final=getattr(event, "partial", None) is not True
+                    )
+                    if chunk:
+                        yield chunk
+
+                if chunk := stream.take():
+                    yield chunk
 
                 # 4. Post-run Cleanup & Memory Sync
+                await journal.flush()
                 try:
                     # Sync findings and observations to Long-term Memory Bank
                     # This makes the investigation searchable in future sessions
@@ -1022,18 +969,25 @@ async def chat_agent(request: AgentRequest, raw_request: Request) -> StreamingRe
 
             except Exception as e:
                 logger.error(f"🔥 Error in agent run: {e}", exc_info=True)
-                yield (
-                    json.dumps(
-                        {
-                            "type": "text",
-                            "content": "\n\n**Error executing agent:** An internal error occurred.",
-                        }
-                    )
-                    + "\n"
+                # Send what the turn produced before the failure first.
+                if chunk := stream.take():
+                    yield chunk
+                yield encode_event(
+                    {
+                        "type": "text",
+                        "content": "\n\n**Error executing agent:** An internal error occurred.",
+                    }
                 )
             finally:
                 if "checker_task" in locals() and not checker_task.done():
                     checker_task.cancel()
+                close_dashboard_queue()
+                if "journal" in locals():
+                    # Shielded so a client disconnect still persists the turn.
+                    try:
+                        await asyncio.shield(journal.close())
+                    except Exception as e:
+                        logger.warning(f"⚠️ Failed to close session journal: {e}")
 
         return StreamingResponse(event_generator(), media_type="application/x-ndjson")
 
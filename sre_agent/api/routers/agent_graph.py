@@ -7,16 +7,19 @@ trajectory diagrams.
 
 import asyncio
 import functools
+import json
 import logging
 import os
 import re
 import subprocess
 from collections import defaultdict
+from collections.abc import AsyncGenerator
 from typing import Any
 from urllib.parse import unquote
 
 import anyio
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from pydantic import BaseModel, ConfigDict
@@ -24,7 +27,13 @@ from pydantic import BaseModel, ConfigDict
 from sre_agent.api.helpers.bq_discovery import get_linked_log_dataset
 from sre_agent.api.helpers.cache import async_ttl_cache
 from sre_agent.auth import GLOBAL_CONTEXT_CREDENTIALS, is_guest_mode
-from sre_agent.tools.synthetic.demo_data_generator import DemoDataGenerator
+from sre_agent.services.agent_graph_rollup import (
+    RollupTarget,
+    build_hourly_source_sql,
+    get_rollup_maintainer,
+)
+from sre_agent.services.session_trajectory import SessionTrajectoryAssembler
+from sre_agent.tools.synthetic.demo_dataset import get_demo_dataset
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["agent_graph"], prefix="/api/v1/graph")
@@ -245,9 +254,10 @@ async def get_topology(
     """Return aggregated topology nodes and edges for React Flow.
 
     For time ranges >= 1 hour the pre-aggregated ``agent_graph_hourly``
-    table is used.  For ranges < 1 hour the raw
-    ``agent_topology_nodes`` / ``agent_topology_edges`` views are
-    queried instead.
+    table is used for closed hours, with hours past the rollup watermark
+    (at least the current open hour) aggregated from raw edges.  For
+    ranges < 1 hour the raw ``agent_topology_nodes`` /
+    ``agent_topology_edges`` views are queried instead.
 
     Args:
         project_id: GCP project that owns the BigQuery dataset.
@@ -264,7 +274,7 @@ async def get_topology(
         React Flow consumption.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_topology(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -296,6 +306,20 @@ async def get_topology(
                 start_time=start_time,
                 end_time=end_time,
             )
+            # Closed hours come from the agent_graph_hourly rollup; hours
+            # past its watermark (including the open one) from raw edges.
+            try:
+                watermark = await anyio.to_thread.run_sync(
+                    get_rollup_maintainer().get_watermark,
+                    RollupTarget(project_id, dataset),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Rollup watermark unavailable for {project_id}.{dataset}, "
+                    f"reading raw edges: {e}"
+                )
+                watermark = None
+            hourly_source = build_hourly_source_sql(project_id, dataset, watermark)
             # The agent_graph_hourly table is edge-centric.
             # We derive both nodes and edges from it in a single query.
             query = f"""
@@ -310,7 +334,7 @@ async def get_topology(
                             AS avg_duration_ms,
                         SUM(error_count) AS error_count,
                         SUM(edge_tokens) AS total_tokens
-                    FROM `{project_id}.{dataset}.agent_graph_hourly` AS h
+                    FROM ({hourly_source}) AS h
                     WHERE {time_filter} {service_name_clause}
                     GROUP BY source_id, source_type, target_id, target_type
                     {"HAVING SUM(h.error_count) > 0" if errors_only else ""}
@@ -353,7 +377,7 @@ async def get_topology(
                         AS avg_duration_ms,
                     SUM(error_count) AS error_count,
                     SUM(edge_tokens) AS total_tokens
-                FROM `{project_id}.{dataset}.agent_graph_hourly` AS h
+                FROM ({hourly_source}) AS h
                 WHERE {time_filter} {service_name_clause}
                 GROUP BY source_id, target_id
                 {"HAVING SUM(h.error_count) > 0" if errors_only else ""}
@@ -529,7 +553,7 @@ async def get_trajectories(
         formatted for Nivo Sankey consumption with loop annotations.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_trajectories(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -711,7 +735,7 @@ async def get_node_detail(
         A dict with detailed node metrics and recent payloads.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_node_detail(node_id=unquote(logical_node_id), hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -981,7 +1005,7 @@ async def get_edge_detail(
         A dict with detailed edge metrics.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_edge_detail(
             source_id=unquote(source_id),
             target_id=unquote(target_id),
@@ -1103,7 +1127,7 @@ async def get_timeseries(
         time-series points.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_timeseries(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1183,7 +1207,7 @@ async def get_timeseries(
 async def get_trace_logs(trace_id: str, project_id: str) -> dict[str, Any]:
     """Fetch logs from Cloud Logging for a specific trace ID."""
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_trace_logs(trace_id=trace_id)
 
     _validate_identifier(project_id, "project_id")
@@ -1227,7 +1251,7 @@ async def get_span_details(
 ) -> dict[str, Any]:
     """Fetch rich details (including errors and correlated logs) for a specific span."""
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_span_details(trace_id=trace_id, span_id=span_id)
 
     _validate_identifier(project_id, "project_id")
@@ -1381,7 +1405,7 @@ async def get_agent_registry(
         A dict with an ``agents`` list containing aggregated stats.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_registry_agents(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1490,7 +1514,7 @@ async def get_tool_registry(
         A dict with a ``tools`` list containing aggregated stats.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_registry_tools(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1597,7 +1621,7 @@ async def get_dashboard_kpis(
         A dict with a ``kpis`` object containing values and trends.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_kpis(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1742,7 +1766,7 @@ async def get_dashboard_timeseries(
         A dict with ``latency``, ``qps``, and ``tokens`` arrays.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_timeseries(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1859,7 +1883,7 @@ async def get_dashboard_models(
         A dict with a ``modelCalls`` list of per-model stats.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_models(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -1954,7 +1978,7 @@ async def get_dashboard_tools(
         A dict with a ``toolCalls`` list of per-tool stats.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_tools(hours=hours)
 
     _validate_identifier(project_id, "project_id")
@@ -2047,7 +2071,7 @@ async def get_dashboard_logs(
         A dict with an ``agentLogs`` list of log entries.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_logs(hours=hours, limit=limit)
 
     _validate_identifier(project_id, "project_id")
@@ -2166,7 +2190,7 @@ async def get_dashboard_sessions(
     session-level metrics like turns, total latency, and tokens.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_sessions(hours=hours, limit=limit)
 
     _validate_identifier(project_id, "project_id")
@@ -2275,7 +2299,7 @@ async def get_dashboard_traces(
     trace-level metrics like status, duration, and tokens.
     """
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_dashboard_traces(hours=hours, limit=limit)
 
     _validate_identifier(project_id, "project_id")
@@ -2392,7 +2416,7 @@ async def get_context_graph(
     from datetime import timedelta
 
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_context_graph(session_id=session_id)
 
     _validate_identifier(project_id, "project_id")
@@ -2554,6 +2578,43 @@ async def get_context_graph(
         ) from exc
 
 
+async def _query_session_spans(
+    project_id: str, dataset: str, session_id: str
+) -> list[Any]:
+    """Load the ``agent_spans_raw`` rows of a session in chronological order."""
+    client = _get_bq_client(project_id)
+
+    query = f"""
+        SELECT
+            r.trace_id,
+            r.span_id,
+            r.parent_id,
+            r.start_time,
+            r.node_type,
+            r.node_label,
+            r.duration_ms,
+            r.status_code,
+            r.status_desc,
+            r.input_tokens,
+            r.output_tokens,
+            r.request_model
+        FROM `{project_id}.{dataset}.agent_spans_raw` r
+        WHERE r.session_id = @session_id
+        ORDER BY r.start_time ASC
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("session_id", "STRING", session_id),
+        ]
+    )
+
+    return list(
+        await anyio.to_thread.run_sync(
+            functools.partial(client.query_and_wait, query, job_config=job_config)
+        )
+    )
+
+
 @router.get("/session/{session_id}/trajectory")
 async def get_session_trajectory(
     session_id: str,
@@ -2563,7 +2624,7 @@ async def get_session_trajectory(
 ) -> dict[str, Any]:
     """Return the chronological trajectory of spans and logs for a session."""
     if is_guest_mode():
-        gen = DemoDataGenerator()
+        gen = get_demo_dataset()
         return gen.get_session_trajectory(session_id=session_id)
 
     _validate_identifier(project_id, "project_id")
@@ -2571,161 +2632,58 @@ async def get_session_trajectory(
     _validate_identifier(trace_dataset, "trace_dataset")
 
     try:
-        client = _get_bq_client(project_id)
-
-        query = f"""
-            SELECT
-                r.trace_id,
-                r.span_id,
-                r.parent_id,
-                r.start_time,
-                r.node_type,
-                r.node_label,
-                r.duration_ms,
-                r.status_code,
-                r.status_desc,
-                r.input_tokens,
-                r.output_tokens,
-                r.request_model
-            FROM `{project_id}.{dataset}.agent_spans_raw` r
-            WHERE r.session_id = @session_id
-            ORDER BY r.start_time ASC
-        """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("session_id", "STRING", session_id),
-            ]
-        )
-
-        span_rows = list(
-            await anyio.to_thread.run_sync(
-                functools.partial(client.query_and_wait, query, job_config=job_config)
-            )
-        )
-
+        span_rows = await _query_session_spans(project_id, dataset, session_id)
         if not span_rows:
             return {"sessionId": session_id, "trajectory": []}
 
-        trace_ids = list(set([r.trace_id for r in span_rows if r.trace_id]))
-
-        # 1. Fetch trace data from Cloud Trace directly
-        import asyncio
-
-        from sre_agent.tools.clients.trace import _fetch_trace_sync
-
-        trace_spans_map = {}
-
-        async def fetch_one_trace(tid: str) -> None:
-            try:
-                t_data = await anyio.to_thread.run_sync(
-                    _fetch_trace_sync, project_id, tid
-                )
-                if isinstance(t_data, dict) and "spans" in t_data:
-                    for s in t_data["spans"]:
-                        trace_spans_map[s["span_id"]] = s.get("labels", {})
-            except Exception as e:
-                logger.warning(f"Failed to fetch trace {tid} from Cloud Trace: {e}")
-
-        if trace_ids:
-            await asyncio.gather(*(fetch_one_trace(tid) for tid in trace_ids))
-
-        # 2. Fetch logs from Cloud Logging directly
-        logs_by_span = defaultdict(list)
-        from sre_agent.tools.clients.logging import _list_log_entries_sync
-
-        try:
-            if trace_ids:
-                # Max 20 trace IDs per filter to avoid expression too long, but usually we have just 1-5 traces
-                # Split traces into batches of 10
-                async def fetch_log_batch(batch_traces: list[str]) -> None:
-                    try:
-                        trace_conditions = " OR ".join(
-                            [
-                                f'trace="projects/{project_id}/traces/{t}"'
-                                for t in batch_traces
-                            ]
-                        )
-
-                        log_res = await anyio.to_thread.run_sync(
-                            _list_log_entries_sync,
-                            project_id,
-                            trace_conditions,
-                            2000,
-                            None,
-                            None,
-                        )
+        assembler = SessionTrajectoryAssembler(project_id)
+        trajectory = await assembler.assemble(span_rows)
+        return {"sessionId": session_id, "trajectory": trajectory}
 
-                        if isinstance(log_res, dict) and "entries" in log_res:
-                            for entry in log_res["entries"]:
-                                if entry.get("span_id"):
-                                    logs_by_span[entry["span_id"]].append(
-                                        {
-                                            "timestamp": entry.get("timestamp"),
-                                            "severity": entry.get("severity"),
-                                            "payload": entry.get("payload"),
-                                        }
-                                    )
-                    except Exception as exc:
-                        logger.warning(f"Failed to fetch log batch: {exc}")
-
-                batches = [trace_ids[i : i + 10] for i in range(0, len(trace_ids), 10)]
-                await asyncio.gather(*(fetch_log_batch(b) for b in batches))
-        except Exception as exc:
-            logger.warning(
-                f"Failed to fetch correlated logs for session {session_id} from Cloud Logging: {exc}"
-            )
+    except NotFound as exc:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "NOT_SETUP",
+                "detail": "BigQuery agent graph is not configured for this project.",
+            },
+        ) from exc
+    except Exception as exc:
+        logger.exception("Failed to fetch session trajectory")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch session trajectory: {exc!s}",
+        ) from exc
 
-        trajectory = []
-        for row in span_rows:
-            evaluations: list[dict[str, Any]] = []
 
-            # Since evaluations are recorded as events (gen_ai.evaluation.result) and not extracted into agent_spans_raw,
-            # we default to an empty list here unless we parse timeEvents directly from Cloud Trace in the future.
+@router.get("/session/{session_id}/trajectory/stream")
+async def stream_session_trajectory(
+    session_id: str,
+    project_id: str,
+    dataset: str = "agentops",
+    trace_dataset: str = "traces",
+) -> StreamingResponse:
+    """Stream a session trajectory as NDJSON while traces and logs resolve.
 
-            labels = trace_spans_map.get(row.span_id, {})
+    The first line carries every step without trace labels or logs; later
+    ``trace`` and ``logs`` lines carry re-rendered steps that replace earlier
+    ones by ``spanId``. A final ``complete`` line ends the stream.
+    """
+    if is_guest_mode():
+        demo = get_demo_dataset().get_session_trajectory(session_id=session_id)
 
-            input_tokens = int(row.input_tokens) if row.input_tokens else 0
-            output_tokens = int(row.output_tokens) if row.output_tokens else 0
-            status_desc = str(row.status_desc) if row.status_desc else None
+        async def demo_events() -> AsyncGenerator[str, None]:
+            yield json.dumps({"type": "spans", **demo}) + "\n"
+            yield json.dumps({"type": "complete", "sessionId": session_id}) + "\n"
 
-            trajectory.append(
-                {
-                    "traceId": row.trace_id,
-                    "spanId": row.span_id,
-                    "parentSpanId": row.parent_id or None,
-                    "startTime": row.start_time.isoformat() if row.start_time else None,
-                    "nodeType": row.node_type,
-                    "nodeLabel": row.node_label,
-                    "durationMs": row.duration_ms,
-                    "statusCode": row.status_code,
-                    "statusMessage": status_desc,
-                    "inputTokens": input_tokens,
-                    "outputTokens": output_tokens,
-                    "totalTokens": input_tokens + output_tokens,
-                    "model": row.request_model or None,
-                    "prompt": labels.get("gen_ai.prompt")
-                    or labels.get("gen_ai.request.message")
-                    or labels.get("gcp.vertex.agent.llm_request"),
-                    "completion": labels.get("gen_ai.completion")
-                    or labels.get("gen_ai.response.message")
-                    or labels.get("gcp.vertex.agent.llm_response"),
-                    "systemMessage": labels.get("gen_ai.system.message")
-                    or labels.get("gen_ai.system"),
-                    "toolInput": labels.get("tool.input")
-                    or labels.get("gen_ai.tool.input")
-                    or labels.get("tool_input")
-                    or labels.get("gcp.vertex.agent.tool_call_args"),
-                    "toolOutput": labels.get("tool.output")
-                    or labels.get("gen_ai.tool.output")
-                    or labels.get("tool_output")
-                    or labels.get("gcp.vertex.agent.tool_response"),
-                    "evaluations": evaluations,
-                    "logs": logs_by_span.get(row.span_id, []),
-                }
-            )
+        return StreamingResponse(demo_events(), media_type="application/x-ndjson")
 
-        return {"sessionId": session_id, "trajectory": trajectory}
+    _validate_identifier(project_id, "project_id")
+    _validate_identifier(dataset, "dataset")
+    _validate_identifier(trace_dataset, "trace_dataset")
 
+    try:
+        span_rows = await _query_session_spans(project_id, dataset, session_id)
     except NotFound as exc:
         raise HTTPException(
             status_code=404,
@@ -2740,3 +2698,16 @@ async def get_session_trajectory(
             status_code=500,
             detail=f"Failed to fetch session trajectory: {exc!s}",
         ) from exc
+
+    assembler = SessionTrajectoryAssembler(project_id)
+
+    async def events() -> AsyncGenerator[str, None]:
+        try:
+            async for event in assembler.stream(span_rows):
+                yield json.dumps({"sessionId": session_id, **event}, default=str)
+                yield "\n"
+        except Exception as exc:
+            logger.exception("Failed while streaming session trajectory")
+            yield json.dumps({"type": "error", "detail": str(exc)}) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
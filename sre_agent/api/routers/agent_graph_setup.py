@@ -2,6 +2,7 @@ import logging
 import re
 from typing import Any
 
+import anyio
 import httpx
 from fastapi import APIRouter, HTTPException
 from google.api_core.exceptions import Forbidden, NotFound
@@ -9,6 +10,21 @@ from google.cloud import bigquery
 from pydantic import BaseModel, ConfigDict
 
 from sre_agent.auth import GLOBAL_CONTEXT_CREDENTIALS, is_guest_mode
+from sre_agent.services.agent_graph_rollup import (
+    LEGACY_SCHEDULED_QUERY_NAME,
+    SCHEDULED_REFRESH_NAME,
+    WATERMARK_TABLE,
+    RollupConfig,
+    RollupTarget,
+    build_scheduled_refresh_sql,
+    build_watermark_table_sql,
+    get_rollup_maintainer,
+)
+from sre_agent.tools.analysis.bigquery.otel_schema import (
+    FLAT_SPANS_TABLE,
+    build_flat_spans_view_sql,
+    register_otel_table,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -304,6 +320,8 @@ async def execute_schema_step(step: str, req: SchemaStepRequest) -> dict[str, An
         "backfill",
         "registries",
         "scheduled_query",
+        "rollup_state",
+        "spans_flat",
     ]
     if step not in valid_steps:
         raise HTTPException(status_code=400, detail=f"Invalid schema step: {step}")
@@ -573,43 +591,30 @@ async def execute_schema_step(step: str, req: SchemaStepRequest) -> dict[str, An
             run_query(sql2)
             return {"status": "success", "message": "Created registries."}
 
+        elif step == "rollup_state":
+            run_query(build_watermark_table_sql(RollupTarget(pd, gd)))
+            return {
+                "status": "success",
+                "message": f"Created {WATERMARK_TABLE}.",
+            }
+
+        elif step == "spans_flat":
+            run_query(build_flat_spans_view_sql(pd, gd, td))
+            flat_ref = f"{pd}.{gd}.{FLAT_SPANS_TABLE}"
+            register_otel_table(f"{pd}.{td}", "_AllSpans", flat_ref)
+            return {"status": "success", "message": f"Created {FLAT_SPANS_TABLE}."}
+
         elif step == "scheduled_query":
             import json
             import subprocess
 
-            # Define the SQL for the scheduled query (incremental hourly update)
-            hourly_sql = f"""
-            INSERT INTO `{pd}.{gd}.agent_graph_hourly`
-            WITH RawEdges AS (
-              SELECT e.trace_id, e.session_id, TIMESTAMP_TRUNC(n_dst.start_time, HOUR) as time_bucket, e.source_node_id as source_id, n_src.node_type as source_type,
-                e.destination_node_id as target_id, n_dst.node_type as target_type, e.edge_weight as call_count, e.total_duration_ms, e.total_tokens,
-                e.error_count as edge_error_count, n_dst.total_input_tokens as input_tokens, n_dst.total_output_tokens as output_tokens, n_dst.service_name, n_dst.start_time,
-                n_dst.node_description
-              FROM `{pd}.{gd}.agent_topology_edges` e
-              JOIN `{pd}.{gd}.agent_topology_nodes` n_dst ON e.trace_id = n_dst.trace_id AND e.destination_node_id = n_dst.logical_node_id
-              JOIN `{pd}.{gd}.agent_topology_nodes` n_src ON e.trace_id = n_src.trace_id AND e.source_node_id = n_src.logical_node_id
-              WHERE n_dst.start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 2 HOUR)
-                AND n_dst.start_time < TIMESTAMP_TRUNC(CURRENT_TIMESTAMP(), HOUR)
-            ),
-            CostPaths AS (
-              SELECT re.*, COALESCE(input_tokens, 0) * CASE WHEN target_id LIKE '%flash%' THEN 0.00000015 WHEN target_id LIKE '%2.5-pro%' THEN 0.00000125 WHEN target_id LIKE '%1.5-pro%' THEN 0.00000125 ELSE 0.0000005 END + COALESCE(output_tokens, 0) * CASE WHEN target_id LIKE '%flash%' THEN 0.0000006 WHEN target_id LIKE '%2.5-pro%' THEN 0.00001 WHEN target_id LIKE '%1.5-pro%' THEN 0.000005 ELSE 0.000002 END AS span_cost
-              FROM RawEdges re
-            ),
-            ExistingBuckets AS (
-              SELECT DISTINCT time_bucket FROM `{pd}.{gd}.agent_graph_hourly`
-              WHERE time_bucket >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 2 HOUR)
-            ),
-            NewPaths AS (
-              SELECT cp.* FROM CostPaths cp
-              LEFT JOIN ExistingBuckets eb ON cp.time_bucket = eb.time_bucket
-              WHERE eb.time_bucket IS NULL
+            # The scheduled query runs the same watermark-bounded MERGE as
+            # /rollup/refresh, so the two never write duplicate hourly rows.
+            hourly_sql = build_scheduled_refresh_sql(
+                RollupTarget(pd, gd), RollupConfig.from_env()
             )
-            SELECT time_bucket, source_id, target_id, source_type, target_type, SUM(call_count) AS call_count, SUM(edge_error_count) AS error_count, SUM(total_tokens) AS edge_tokens, SUM(input_tokens) AS input_tokens, SUM(output_tokens) AS output_tokens, ROUND(SUM(span_cost), 6) AS total_cost, SUM(total_duration_ms) AS sum_duration_ms, ROUND(MAX(total_duration_ms), 2) AS max_p95_duration_ms, COUNT(DISTINCT session_id) AS unique_sessions, CAST(NULL AS STRING) AS sample_error, SUM(total_tokens) AS node_total_tokens, SUM(input_tokens) AS node_input_tokens, SUM(output_tokens) AS node_output_tokens, SUM(edge_error_count) > 0 AS node_has_error, SUM(total_duration_ms) AS node_sum_duration_ms, ROUND(MAX(total_duration_ms), 2) AS node_max_p95_duration_ms, SUM(edge_error_count) AS node_error_count, SUM(call_count) AS node_call_count, ROUND(SUM(span_cost), 6) AS node_total_cost, ANY_VALUE(node_description) AS node_description, SUM(IF(target_type = 'Tool', call_count, 0)) AS tool_call_count, SUM(IF(target_type = 'LLM', call_count, 0)) AS llm_call_count, SUM(COALESCE(input_tokens, 0) + COALESCE(output_tokens, 0)) AS downstream_total_tokens, ROUND(SUM(span_cost), 6) AS downstream_total_cost, SUM(IF(target_type = 'Tool', call_count, 0)) AS downstream_tool_call_count, SUM(IF(target_type = 'LLM', call_count, 0)) AS downstream_llm_call_count, ARRAY_AGG(DISTINCT session_id IGNORE NULLS) AS session_ids, ANY_VALUE(service_name) AS service_name
-            FROM NewPaths GROUP BY time_bucket, source_id, target_id, source_type, target_type;
-            """
-
-            config_name = "Agent Graph Hourly Refresh"
-            # Check if it already exists using bq ls
+            config_name = SCHEDULED_REFRESH_NAME
+            exists = False
             try:
                 ls_cmd = [
                     "bq",
@@ -624,22 +629,33 @@ async def execute_schema_step(step: str, req: SchemaStepRequest) -> dict[str, An
                 )
                 configs = json.loads(ls_proc.stdout)
                 for config in configs:
-                    if config.get("displayName") == config_name:
-                        return {
-                            "status": "success",
-                            "message": f"Scheduled query '{config_name}' already exists.",
-                        }
+                    if config.get("displayName") == LEGACY_SCHEDULED_QUERY_NAME:
+                        # Retire the legacy INSERT-based refresh.
+                        subprocess.run(
+                            ["bq", "rm", "-f", "--transfer_config", config["name"]],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                        )
+                        logger.info(f"Removed legacy scheduled query {config['name']}")
+                    elif config.get("displayName") == config_name:
+                        exists = True
             except Exception as e:
                 logger.warning(f"Failed to check for existing scheduled query: {e}")
+            if exists:
+                return {
+                    "status": "success",
+                    "message": f"Scheduled query '{config_name}' already exists.",
+                }
 
-            # Create it
+            # Create it. The script names its own tables, so no destination
+            # dataset is set.
             params = json.dumps({"query": hourly_sql})
             mk_cmd = [
                 "bq",
                 "mk",
                 "--transfer_config",
                 f"--project_id={pd}",
-                f"--target_dataset={gd}",
                 f"--display_name={config_name}",
                 "--schedule=every 1 hours",
                 "--data_source=scheduled_query",
@@ -669,3 +685,69 @@ async def execute_schema_step(step: str, req: SchemaStepRequest) -> dict[str, An
     except Exception as exc:
         logger.exception(f"Unhandled error in schema step {step}")
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/rollup/status")
+async def get_rollup_status(
+    project_id: str, dataset: str = "agentops"
+) -> dict[str, Any]:
+    """Report freshness of the incrementally maintained agent_graph_hourly."""
+    if is_guest_mode():
+        return {"project_id": project_id, "dataset": dataset, "status": "fresh"}
+    _validate_identifier(project_id, "project_id")
+    _validate_identifier(dataset, "dataset")
+
+    maintainer = get_rollup_maintainer()
+    try:
+        return await anyio.to_thread.run_sync(
+            maintainer.get_status, RollupTarget(project_id, dataset)
+        )
+    except NotFound as exc:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Rollup state table not found in '{dataset}'. Run the rollup_state setup step.",
+        ) from exc
+    except Forbidden as exc:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Permission denied to read BigQuery dataset '{dataset}'. Require roles/bigquery.dataViewer.",
+        ) from exc
+
+
+class RollupRefreshRequest(BaseModel):
+    """Request schema for an incremental agent_graph_hourly refresh."""
+
+    model_config = ConfigDict(extra="forbid")
+    project_id: str
+    graph_dataset: str = "agentops"
+
+
+@router.post("/rollup/refresh")
+async def refresh_rollup(req: RollupRefreshRequest) -> dict[str, Any]:
+    """MERGE closed hours since the last watermark into agent_graph_hourly."""
+    if is_guest_mode():
+        return {"status": "success", "message": "Rollup refreshed (demo mode)."}
+    _validate_identifier(req.project_id, "project_id")
+    _validate_identifier(req.graph_dataset, "graph_dataset")
+
+    maintainer = get_rollup_maintainer()
+    try:
+        result = await anyio.to_thread.run_sync(
+            maintainer.refresh, RollupTarget(req.project_id, req.graph_dataset)
+        )
+    except NotFound as exc:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Rollup tables not found in '{req.graph_dataset}'. Run the hourly and rollup_state setup steps.",
+        ) from exc
+    except Forbidden as exc:
+        raise HTTPException(
+            status_code=403,
+            detail="Permission denied to execute BigQuery DML. Require roles/bigquery.dataEditor.",
+        ) from exc
+    except Exception as exc:
+        logger.exception("Rollup refresh failed.")
+        raise HTTPException(
+            status_code=500, detail=f"Rollup refresh failed: {exc!s}"
+        ) from exc
+    return {"status": "success", **result.to_dict()}
@@ -8,11 +8,12 @@ creation, and Cloud Monitoring integration.
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from sre_agent.auth import is_guest_mode
 from sre_agent.services.dashboard_service import get_dashboard_service
+from sre_agent.services.dashboard_store import MAX_PAGE_SIZE, DashboardConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,9 @@ class UpdateDashboardBody(BaseModel):
     filters: list[dict[str, Any]] | None = None
     time_range: dict[str, Any] | None = None
     labels: dict[str, str] | None = None
+    expected_version: int | None = Field(
+        default=None, description="Reject the update if the dashboard has changed"
+    )
 
 
 class AddPanelBody(BaseModel):
@@ -66,6 +70,7 @@ class AddPanelBody(BaseModel):
     thresholds: list[dict[str, Any]] | None = None
     datasource: dict[str, Any] | None = None
     text_content: dict[str, Any] | None = None
+    expected_version: int | None = None
 
 
 class UpdatePanelPositionBody(BaseModel):
@@ -77,6 +82,16 @@ class UpdatePanelPositionBody(BaseModel):
     y: int
     width: int
     height: int
+    expected_version: int | None = None
+
+
+class PanelDataBody(BaseModel):
+    """Request body for resolving the data behind a dashboard's panels."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    project_id: str | None = None
+    minutes_ago: int = Field(default=60, ge=1, le=60 * 24 * 30)
 
 
 class ProvisionTemplateBody(BaseModel):
@@ -206,21 +221,35 @@ _DEMO_TEMPLATES: list[dict[str, str]] = [
 # ---------------------------------------------------------------------------
 
 
+def _conflict(e: DashboardConflictError) -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail={"message": str(e), "current_version": e.actual},
+    )
+
+
 @router.get("")
 async def list_dashboards(
     project_id: str | None = None,
     include_cloud: bool = True,
-    page_size: int = 50,
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    page_token: str | None = None,
+    owner: str | None = None,
 ) -> dict[str, Any]:
-    """List all dashboards."""
+    """List all dashboards, most recently updated first."""
     if is_guest_mode():
         return {"dashboards": [_DEMO_DASHBOARD]}
     service = get_dashboard_service()
-    return await service.list_dashboards(
-        project_id=project_id,
-        include_cloud=include_cloud,
-        page_size=page_size,
-    )
+    try:
+        return await service.list_dashboards(
+            project_id=project_id,
+            include_cloud=include_cloud,
+            page_size=page_size,
+            page_token=page_token,
+            owner=owner,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/{dashboard_id}")
@@ -266,8 +295,13 @@ async def update_dashboard(
     if is_guest_mode():
         return {"id": dashboard_id, "status": "updated (demo mode)"}
     service = get_dashboard_service()
-    updates = body.model_dump(exclude_none=True)
-    result = await service.update_dashboard(dashboard_id, updates)
+    updates = body.model_dump(exclude_none=True, exclude={"expected_version"})
+    try:
+        result = await service.update_dashboard(
+            dashboard_id, updates, expected_version=body.expected_version
+        )
+    except DashboardConflictError as e:
+        raise _conflict(e) from e
     if not result:
         raise HTTPException(status_code=404, detail="Dashboard not found")
     return result
@@ -302,8 +336,13 @@ async def add_panel(
             "status": "added (demo mode)",
         }
     service = get_dashboard_service()
-    panel_data = body.model_dump(exclude_none=True)
-    result = await service.add_panel(dashboard_id, panel_data)
+    panel_data = body.model_dump(exclude_none=True, exclude={"expected_version"})
+    try:
+        result = await service.add_panel(
+            dashboard_id, panel_data, expected_version=body.expected_version
+        )
+    except DashboardConflictError as e:
+        raise _conflict(e) from e
     if not result:
         raise HTTPException(status_code=404, detail="Dashboard not found")
     return result
@@ -313,6 +352,7 @@ async def add_panel(
 async def remove_panel(
     dashboard_id: str,
     panel_id: str,
+    expected_version: int | None = None,
 ) -> dict[str, Any]:
     """Remove a panel from a dashboard."""
     if is_guest_mode():
@@ -322,7 +362,12 @@ async def remove_panel(
             "status": "removed (demo mode)",
         }
     service = get_dashboard_service()
-    result = await service.remove_panel(dashboard_id, panel_id)
+    try:
+        result = await service.remove_panel(
+            dashboard_id, panel_id, expected_version=expected_version
+        )
+    except DashboardConflictError as e:
+        raise _conflict(e) from e
     if not result:
         raise HTTPException(status_code=404, detail="Dashboard not found")
     return result
@@ -348,12 +393,43 @@ async def update_panel_position(
         "width": body.width,
         "height": body.height,
     }
-    result = await service.update_panel_position(dashboard_id, panel_id, grid_position)
+    try:
+        result = await service.update_panel_position(
+            dashboard_id,
+            panel_id,
+            grid_position,
+            expected_version=body.expected_version,
+        )
+    except DashboardConflictError as e:
+        raise _conflict(e) from e
     if not result:
         raise HTTPException(status_code=404, detail="Dashboard not found")
     return result
 
 
+@router.post("/{dashboard_id}/data")
+async def get_panel_data(
+    dashboard_id: str,
+    body: PanelDataBody | None = None,
+) -> dict[str, Any]:
+    """Fetch the data behind every panel of a dashboard.
+
+    Identical panel queries are fetched once, log panels over the same
+    stream share one query, and results are reused across loads within the
+    same time window.
+    """
+    if is_guest_mode():
+        return {"panels": {}, "stats": {}}
+    body = body or PanelDataBody()
+    service = get_dashboard_service()
+    result = await service.resolve_panel_data(
+        dashboard_id, project_id=body.project_id, minutes_ago=body.minutes_ago
+    )
+    if result is None:
+        raise HTTPException(status_code=404, detail="Dashboard not found")
+    return result
+
+
 # ---------------------------------------------------------------------------
 # OOTB Dashboard Template Endpoints
 # ---------------------------------------------------------------------------
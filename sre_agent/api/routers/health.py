@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from sre_agent.tools.common.debug import (
     get_debug_summary,
@@ -22,6 +23,19 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok", "version": VERSION}
 
 
+@router.get("/ready")
+async def readiness_check() -> JSONResponse:
+    """Readiness probe: 503 until startup warm-up has finished.
+
+    Unlike ``/health`` (liveness), this only succeeds once the replica can
+    serve at steady-state latency. The body reports per-task progress.
+    """
+    from sre_agent.core.startup import get_startup_orchestrator
+
+    readiness = get_startup_orchestrator().readiness()
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
 @router.get("/api/debug")
 async def debug_info() -> Any:
     """Debug endpoint for diagnosing telemetry and authentication issues.
@@ -52,3 +66,17 @@ async def debug_info() -> Any:
             "view_traces": "Navigate to Cloud Console > Trace > Trace list",
         },
     }
+
+
+@router.get("/api/debug/loop")
+async def debug_loop(limit: int = 10) -> dict[str, Any]:
+    """Event-loop health: lag percentiles, top blockers and recent stalls.
+
+    Blockers are the tool, route or callback that was running on the loop
+    when it stalled, with the innermost project frame as the site. Tune the
+    detector with SRE_AGENT_LOOP_MONITOR_INTERVAL_MS and
+    SRE_AGENT_LOOP_BLOCK_THRESHOLD_MS.
+    """
+    from sre_agent.core.loop_monitor import get_loop_monitor
+
+    return get_loop_monitor().snapshot(limit=max(1, min(limit, 100)))
@@ -270,7 +270,7 @@ async def analyze_logs(payload: LogAnalyzeRequest) -> Any:
 
         # 2. Extract patterns from the fetched entries
         pattern_result = await extract_log_patterns(
-            log_entries=log_entries,
+            log_entries_json=log_entries,
         )
         return _unwrap_tool_result(pattern_result)
     except (HTTPException, UserFacingError):
@@ -72,7 +72,10 @@ The EUC (End User Credentials) flow works as follows:
 - Credentials are NOT persisted to disk; only held in memory during request
 """
 
+import asyncio
 import contextvars
+import dataclasses
+import hashlib
 import logging
 import os
 import threading
@@ -225,6 +228,44 @@ def _cache_token_info(token: str, info: "TokenInfo") -> None:
         _token_cache[token] = (time.time() + TOKEN_CACHE_TTL, info)
 
 
+def _shared_token_store() -> Any | None:
+    from .core.shared_state import get_shared_store
+
+    store = get_shared_store("token_info")
+    return store if store.is_shared else None
+
+
+def _shared_token_key(token: str) -> str:
+    # Never write bearer tokens themselves to shared storage.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def _get_shared_token_info(token: str) -> "TokenInfo | None":
+    """Looks up a validation made by another worker and caches it locally."""
+    store = _shared_token_store()
+    if store is None:
+        return None
+    data = await asyncio.to_thread(store.get, _shared_token_key(token))
+    if data is None:
+        return None
+    info = TokenInfo(**data)
+    _cache_token_info(token, info)
+    return info
+
+
+async def _share_token_info(token: str, info: "TokenInfo") -> None:
+    """Publishes a valid token's info to the other workers."""
+    store = _shared_token_store()
+    if store is None or not info.valid:
+        return
+    ttl = TOKEN_CACHE_TTL
+    if info.expires_in > 0:
+        ttl = min(ttl, info.expires_in)
+    await asyncio.to_thread(
+        store.set, _shared_token_key(token), dataclasses.asdict(info), ttl
+    )
+
+
 def set_current_credentials(creds: Credentials) -> None:
     """Sets the credentials for the current context."""
     _credentials_context.set(creds)
@@ -799,7 +840,9 @@ async def validate_access_token(access_token: str) -> TokenInfo:
     This function is cached to prevent high-latency network calls on every request.
     """
     # 1. Check cache first
-    cached = _get_cached_token_info(access_token)
+    cached = _get_cached_token_info(access_token) or await _get_shared_token_info(
+        access_token
+    )
     if cached:
         return cached
 
@@ -824,6 +867,7 @@ async def validate_access_token(access_token: str) -> TokenInfo:
                     audience=data.get("aud"),
                 )
                 _cache_token_info(access_token, info)
+                await _share_token_info(access_token, info)
                 return info
             elif response.status_code == 400:
                 # Token is invalid or expired
@@ -853,7 +897,9 @@ async def validate_id_token(id_token_str: str) -> TokenInfo:
     require a network call (public keys are cached by the library).
     """
     # Check cache first
-    cached = _get_cached_token_info(id_token_str)
+    cached = _get_cached_token_info(id_token_str) or await _get_shared_token_info(
+        id_token_str
+    )
     if cached:
         return cached
 
@@ -876,6 +922,7 @@ async def validate_id_token(id_token_str: str) -> TokenInfo:
             audience=idinfo.get("aud"),
         )
         _cache_token_info(id_token_str, info)
+        await _share_token_info(id_token_str, info)
         return info
     except ValueError as e:
         # Invalid token
@@ -0,0 +1,208 @@
+"""Lazy, memoized construction of agents.
+
+Importing :mod:`sre_agent.agent` used to build the root agent, every
+sub-agent and their tool lists, importing the whole analysis stack
+(BigQuery, Cloud Trace/Logging/Monitoring clients, Vertex AI) on the way.
+Every process that touched the module, including each test run and each
+Cloud Run cold start, paid for it before serving anything.
+
+:class:`AgentRegistry` maps agent names to factories. An agent is built the
+first time it is requested and memoized afterwards; factories may request
+the agents they depend on. :meth:`AgentRegistry.warm_up` builds everything
+ahead of traffic, so a readiness probe can run it instead of the first user
+request.
+
+Usage::
+
+    registry = get_agent_registry()
+    root = registry.get("root_agent")
+    timings = await warm_up_agents()
+
+Agents are bound to a single parent by ADK, so factories of agents that are
+attached to a parent must return the same instance on every call; the
+registry only guarantees each factory is invoked once per registry.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRegistry:
+    """Named agent factories whose results are built on first use."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._factories: dict[str, Callable[[], Any]] = {}
+        self._instances: dict[str, Any] = {}
+        self._locks: dict[str, threading.RLock] = {}
+        self._lock = threading.Lock()
+        self._building = threading.local()
+        self.build_seconds: dict[str, float] = {}
+        self.failures: dict[str, str] = {}
+
+    def register(
+        self, name: str, factory: Callable[[], Any], replace: bool = False
+    ) -> None:
+        """Register the factory that builds ``name``.
+
+        Args:
+            name: Agent name used for lookups.
+            factory: Zero-argument callable returning the agent.
+            replace: Allow replacing an existing registration. Any instance
+                already built for ``name`` is dropped.
+
+        Raises:
+            ValueError: If ``name`` is already registered and ``replace`` is
+                False.
+        """
+        with self._lock:
+            if name in self._factories and not replace:
+                raise ValueError(f"Agent {name!r} is already registered")
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+            self._locks.setdefault(name, threading.RLock())
+
+    def names(self) -> list[str]:
+        """Registered agent names, in registration order."""
+        with self._lock:
+            return list(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        """Whether ``name`` has already been built."""
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        """Return the agent registered as ``name``, building it if needed.
+
+        A factory that raises is not memoized; the next call retries it.
+
+        Args:
+            name: Registered agent name.
+
+        Returns:
+            The memoized agent.
+
+        Raises:
+            KeyError: If ``name`` is not registered.
+            RuntimeError: If factories depend on each other in a cycle.
+        """
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            factory = self._factories.get(name)
+            entry_lock = self._locks.get(name)
+        if factory is None or entry_lock is None:
+            raise KeyError(f"Unknown agent {name!r}")
+
+        building: set[str] = getattr(self._building, "names", set())
+        if name in building:
+            raise RuntimeError(f"Circular agent dependency on {name!r}")
+
+        with entry_lock:
+            if name in self._instances:
+                return self._instances[name]
+            self._building.names = building | {name}
+            start = time.perf_counter()
+            try:
+                instance = factory()
+            except Exception as e:
+                self.failures[name] = str(e)
+                raise
+            finally:
+                self._building.names = building
+            elapsed = time.perf_counter() - start
+            self._instances[name] = instance
+            self.build_seconds[name] = elapsed
+            self.failures.pop(name, None)
+        logger.debug(f"Built agent {name} in {elapsed * 1000:.0f}ms")
+        return instance
+
+    def warm_up(self, names: Iterable[str] | None = None) -> dict[str, float]:
+        """Build agents ahead of traffic.
+
+        Failures are logged and recorded in :attr:`failures` rather than
+        raised, so one broken agent does not keep the others cold.
+
+        Args:
+            names: Agents to build; defaults to every registered agent.
+
+        Returns:
+            Seconds spent in each factory that ran, including the
+            dependencies it built. Agents that were already built are
+            omitted.
+        """
+        timings: dict[str, float] = {}
+        for name in list(names) if names is not None else self.names():
+            if self.is_built(name):
+                continue
+            start = time.perf_counter()
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.warning(f"Agent warm-up failed for {name}: {e}")
+                continue
+            timings[name] = time.perf_counter() - start
+        return timings
+
+    async def awarm_up(self, names: Iterable[str] | None = None) -> dict[str, float]:
+        """Run :meth:`warm_up` in a worker thread."""
+        return await asyncio.to_thread(self.warm_up, names)
+
+    def stats(self) -> dict[str, Any]:
+        """Return registered, built and failed agents with build times."""
+        return {
+            "registered": self.names(),
+            "built": dict(self.build_seconds),
+            "failed": dict(self.failures),
+        }
+
+
+_registry: AgentRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """Get the process-wide registry with the SRE Agent's agents registered."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = AgentRegistry()
+                # Lazy import: the agent module registers its own factories.
+                from sre_agent.agent import register_default_agents
+
+                register_default_agents(registry)
+                _registry = registry
+    return _registry
+
+
+async def warm_up_agents(names: Iterable[str] | None = None) -> dict[str, float]:
+    """Build the SRE Agent's agents ahead of traffic (readiness hook).
+
+    Args:
+        names: Agents to build; defaults to all of them.
+
+    Returns:
+        Seconds spent building each agent that was still cold.
+    """
+    return await get_agent_registry().awarm_up(names)
+
+
+def reset_agent_registry() -> None:
+    """Drop the process-wide registry (for tests).
+
+    Agents already bound to a parent cannot be rebuilt in the same process,
+    so tests that reset the registry should only request agents they
+    register themselves.
+    """
+    global _registry
+    _registry = None
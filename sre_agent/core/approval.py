@@ -1,17 +1,23 @@
 """Human-in-the-Loop Approval Workflow.
 
 Implements the approval mechanism for write operations that require
-human confirmation before execution.
+human confirmation before execution. Approval state is kept in a shared
+state store (see :mod:`sre_agent.core.shared_state`), so decisions work
+whichever uvicorn worker receives them.
 """
 
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:
+    from sre_agent.core.shared_state import SharedStore
+
 
 class ApprovalStatus(str, Enum):
     """Status of an approval request."""
@@ -86,37 +92,105 @@ class ApprovalState:
         return len(self.pending_requests) > 0
 
 
+# How long a session's approval state is kept after its last change.
+_STATE_TTL_SECONDS = 86400.0
+
+
+def _encode_state(state: ApprovalState) -> dict[str, Any]:
+    return {
+        "pending": {
+            k: r.model_dump(mode="json") for k, r in state.pending_requests.items()
+        },
+        "completed": {
+            k: e.model_dump(mode="json") for k, e in state.completed_requests.items()
+        },
+    }
+
+
+def _decode_state(data: dict[str, Any] | None) -> ApprovalState:
+    if not data:
+        return ApprovalState()
+    return ApprovalState(
+        pending_requests={
+            k: HumanApprovalRequest.model_validate(v)
+            for k, v in data["pending"].items()
+        },
+        completed_requests={
+            k: HumanApprovalEvent.model_validate(v)
+            for k, v in data["completed"].items()
+        },
+    )
+
+
 class ApprovalManager:
-    """Manages approval requests and their lifecycle."""
+    """Manages approval requests and their lifecycle.
+
+    Per-session state lives in a :class:`~sre_agent.core.shared_state.SharedStore`
+    and every change is an atomic update, so with a shared backend a request
+    created on one uvicorn worker can be approved through another.
+    """
 
-    def __init__(self, expiration_seconds: int = 300) -> None:
+    def __init__(
+        self, expiration_seconds: int = 300, store: "SharedStore | None" = None
+    ) -> None:
         """Initialize the approval manager.
 
         Args:
             expiration_seconds: Time before requests expire (default 5 minutes)
+            store: Where session state is kept; defaults to a private
+                in-process store.
         """
+        from sre_agent.core.shared_state import InProcessStore
+
         self.expiration_seconds = expiration_seconds
-        self._states: dict[str, ApprovalState] = {}
-        self._lock = threading.Lock()
+        self._store: SharedStore = store or InProcessStore("approvals")
 
     def __getstate__(self) -> dict[str, Any]:
-        """Exclude lock from pickling."""
+        """Exclude a shared store's connections from pickling."""
         state = self.__dict__.copy()
-        if "_lock" in state:
-            del state["_lock"]
+        if self._store.is_shared:
+            state["_store"] = None
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        """Restore state and re-initialize lock."""
+        """Restore state and reattach the shared store."""
         self.__dict__.update(state)
-        self._lock = threading.Lock()
+        if self._store is None:
+            from sre_agent.core.shared_state import get_shared_store
+
+            self._store = get_shared_store("approvals")
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether state lives in a shared store, so every call does I/O.
+
+        Callers on the event loop should then run the manager's methods in a
+        thread (``asyncio.to_thread``).
+        """
+        return self._store.is_shared
 
     def get_state(self, session_id: str) -> ApprovalState:
-        """Get or create approval state for a session (thread-safe)."""
-        with self._lock:
-            if session_id not in self._states:
-                self._states[session_id] = ApprovalState()
-            return self._states[session_id]
+        """Get a snapshot of the approval state of a session.
+
+        Change the state through the manager's methods; edits to the
+        snapshot are not saved.
+        """
+        return _decode_state(self._store.get(session_id))
+
+    def _mutate(
+        self, session_id: str, fn: Callable[[ApprovalState], None]
+    ) -> ApprovalState:
+        """Apply ``fn`` to the session's state atomically and return the result."""
+        result = ApprovalState()
+
+        def apply(data: dict[str, Any] | None) -> dict[str, Any]:
+            nonlocal result
+            result = _decode_state(data)
+            fn(result)
+            return _encode_state(result)
+
+        self._store.update(session_id, apply, ttl_seconds=_STATE_TTL_SECONDS)
+        return result
 
     def create_request(
         self,
@@ -159,8 +233,7 @@ class ApprovalManager:
             expires_at=expires_at.isoformat(),
         )
 
-        state = self.get_state(session_id)
-        state.add_request(request)
+        self._mutate(session_id, lambda state: state.add_request(request))
         return request
 
     def process_decision(
@@ -186,39 +259,45 @@ class ApprovalManager:
         Raises:
             ValueError: If the request is not found or already processed
         """
-        state = self.get_state(session_id)
-        request = state.get_pending(request_id)
+        now = datetime.now(timezone.utc)
+        status = ApprovalStatus.APPROVED if approved else ApprovalStatus.REJECTED
 
-        if request is None:
-            if request_id in state.completed_requests:
-                raise ValueError(f"Request {request_id} has already been processed")
-            raise ValueError(f"Request {request_id} not found")
+        def decide(state: ApprovalState) -> None:
+            request = state.get_pending(request_id)
 
-        # Check expiration
-        now = datetime.now(timezone.utc)
-        if request.expires_at:
-            expires = datetime.fromisoformat(request.expires_at)
-            if now > expires:
-                event = HumanApprovalEvent(
+            if request is None:
+                if request_id in state.completed_requests:
+                    raise ValueError(f"Request {request_id} has already been processed")
+                raise ValueError(f"Request {request_id} not found")
+
+            # Check expiration
+            if request.expires_at:
+                expires = datetime.fromisoformat(request.expires_at)
+                if now > expires:
+                    state.complete_request(
+                        HumanApprovalEvent(
+                            request_id=request_id,
+                            status=ApprovalStatus.EXPIRED,
+                            approver_id="system",
+                            decided_at=now.isoformat(),
+                            comment="Request expired before decision",
+                        )
+                    )
+                    return
+
+            state.complete_request(
+                HumanApprovalEvent(
                     request_id=request_id,
-                    status=ApprovalStatus.EXPIRED,
-                    approver_id="system",
+                    status=status,
+                    approver_id=approver_id,
                     decided_at=now.isoformat(),
-                    comment="Request expired before decision",
+                    comment=comment,
                 )
-                state.complete_request(event)
-                raise ValueError(f"Request {request_id} has expired")
-
-        status = ApprovalStatus.APPROVED if approved else ApprovalStatus.REJECTED
-        event = HumanApprovalEvent(
-            request_id=request_id,
-            status=status,
-            approver_id=approver_id,
-            decided_at=now.isoformat(),
-            comment=comment,
-        )
+            )
 
-        state.complete_request(event)
+        event = self._mutate(session_id, decide).completed_requests[request_id]
+        if event.status == ApprovalStatus.EXPIRED:
+            raise ValueError(f"Request {request_id} has expired")
         return event
 
     def get_pending_requests(self, session_id: str) -> list[HumanApprovalRequest]:
@@ -232,24 +311,27 @@ class ApprovalManager:
         Returns:
             Number of requests expired
         """
-        state = self.get_state(session_id)
         now = datetime.now(timezone.utc)
         expired_count = 0
 
-        for request_id, request in list(state.pending_requests.items()):
-            if request.expires_at:
-                expires = datetime.fromisoformat(request.expires_at)
-                if now > expires:
-                    event = HumanApprovalEvent(
-                        request_id=request_id,
-                        status=ApprovalStatus.EXPIRED,
-                        approver_id="system",
-                        decided_at=now.isoformat(),
-                        comment="Request expired",
-                    )
-                    state.complete_request(event)
-                    expired_count += 1
-
+        def expire(state: ApprovalState) -> None:
+            nonlocal expired_count
+            expired_count = 0
+            for request_id, request in list(state.pending_requests.items()):
+                if request.expires_at:
+                    expires = datetime.fromisoformat(request.expires_at)
+                    if now > expires:
+                        event = HumanApprovalEvent(
+                            request_id=request_id,
+                            status=ApprovalStatus.EXPIRED,
+                            approver_id="system",
+                            decided_at=now.isoformat(),
+                            comment="Request expired",
+                        )
+                        state.complete_request(event)
+                        expired_count += 1
+
+        self._mutate(session_id, expire)
         return expired_count
 
 
@@ -264,5 +346,7 @@ def get_approval_manager() -> ApprovalManager:
     if _approval_manager is None:
         with _approval_manager_lock:
             if _approval_manager is None:
-                _approval_manager = ApprovalManager()
+                from sre_agent.core.shared_state import get_shared_store
+
+                _approval_manager = ApprovalManager(store=get_shared_store("approvals"))
     return _approval_manager
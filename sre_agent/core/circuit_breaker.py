@@ -9,6 +9,25 @@ States:
     OPEN: Circuit is tripped, calls fail fast without execution
     HALF_OPEN: Testing if the service has recovered
 
+Breakers are keyed by scope and error class.  A scope is usually
+``"<backend>:<project>"`` (see :func:`scope_key`), so a quota error on one
+project's Cloud Logging only opens the circuit for that project, and only for
+quota errors: a ``pre_call`` for the scope is blocked while any of its
+error-class breakers is open.  Client-side errors (bad arguments, missing
+permissions) and local throttling are counted but never trip a breaker.
+Plain string keys such as tool names still work as single-breaker scopes.
+
+State is sharded across a fixed set of locks by scope, so checks for
+different backends and projects do not contend.
+
+With a shared state backend (see :mod:`sre_agent.core.shared_state`), a
+breaker that opens in one worker publishes its ``open_until`` time, and the
+other workers fail fast for that scope and error class until then instead of
+each rediscovering the outage. Published marks are re-read at most every
+``_SHARED_REFRESH_SECONDS`` per scope. On the event loop (every tool
+``pre_call``) the re-read and the publishing happen in the background and
+checks use the marks last read.
+
 Based on: https://martinfowler.com/bliki/CircuitBreaker.html
 """
 
@@ -17,11 +36,23 @@ import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sre_agent.core.shared_state import SharedStore
 
 logger = logging.getLogger(__name__)
 
 
+_NUM_LOCK_SHARDS = 16
+
+# Error class of the per-scope aggregate breaker used by unclassified callers.
+_AGGREGATE = ""
+
+# How long a worker reuses the open marks it read from shared state.
+_SHARED_REFRESH_SECONDS = 1.0
+
+
 class CircuitState(str, Enum):
     """States of a circuit breaker."""
 
@@ -30,6 +61,86 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"
 
 
+class ErrorClass(str, Enum):
+    """Coarse classes of backend errors, each with its own breaker."""
+
+    QUOTA = "quota"
+    THROTTLED = "throttled"
+    UNAVAILABLE = "unavailable"
+    TIMEOUT = "timeout"
+    PERMISSION = "permission"
+    CLIENT = "client"
+    INTERNAL = "internal"
+
+
+# Error classes that indicate a degraded backend rather than a bad request.
+TRIPPING_ERROR_CLASSES: frozenset[ErrorClass] = frozenset(
+    {ErrorClass.QUOTA, ErrorClass.UNAVAILABLE, ErrorClass.TIMEOUT, ErrorClass.INTERNAL}
+)
+
+# Checked in order; exception class names first, then message fragments.
+_ERROR_CLASS_PATTERNS: tuple[tuple[ErrorClass, tuple[str, ...]], ...] = (
+    # Rejected by the local limiter (see ``core.resilience``), not the backend.
+    (ErrorClass.THROTTLED, ("backendoverloadederror", "throttled locally")),
+    (
+        ErrorClass.QUOTA,
+        (
+            "resourceexhausted",
+            "resource_exhausted",
+            "toomanyrequests",
+            "429",
+            "quota",
+            "rate limit",
+        ),
+    ),
+    (ErrorClass.TIMEOUT, ("deadlineexceeded", "timeout", "timed out", "deadline")),
+    (
+        ErrorClass.UNAVAILABLE,
+        (
+            "serviceunavailable",
+            "connectionerror",
+            "503",
+            "502",
+            "unavailable",
+            "connection",
+        ),
+    ),
+    (
+        ErrorClass.PERMISSION,
+        ("permissiondenied", "forbidden", "unauthenticated", "403", "401"),
+    ),
+    (
+        ErrorClass.CLIENT,
+        ("invalidargument", "notfound", "badrequest", "400", "404", "invalid"),
+    ),
+)
+
+
+def classify_error(error: BaseException | str) -> ErrorClass:
+    """Map an exception or error message to an :class:`ErrorClass`."""
+    if isinstance(error, BaseException):
+        if isinstance(error, TimeoutError):
+            return ErrorClass.TIMEOUT
+        if isinstance(error, ConnectionError):
+            return ErrorClass.UNAVAILABLE
+        text = f"{type(error).__name__} {error}".lower()
+    else:
+        text = error.lower()
+    for error_class, fragments in _ERROR_CLASS_PATTERNS:
+        if any(fragment in text for fragment in fragments):
+            return error_class
+    return ErrorClass.INTERNAL
+
+
+def scope_key(backend: str, project: str | None) -> str:
+    """Breaker scope for one backend API in one project."""
+    return f"{backend}:{project or '*'}"
+
+
+def _status_key(scope: str, error_class: str) -> str:
+    return f"{scope}:{error_class}" if error_class else scope
+
+
 @dataclass
 class CircuitBreakerConfig:
     """Configuration for a circuit breaker instance.
@@ -69,7 +180,7 @@ class CircuitBreakerOpenError(Exception):
         """Initialize the open circuit error.
 
         Args:
-            tool_name: The name of the tool being called.
+            tool_name: The tool name or breaker key that is open.
             retry_after_seconds: How long to wait before retrying.
         """
         self.tool_name = tool_name
@@ -81,16 +192,20 @@ class CircuitBreakerOpenError(Exception):
 
 
 class CircuitBreakerRegistry:
-    """Registry managing circuit breakers for all tools.
+    """Registry managing circuit breakers per scope and error class.
 
-    Thread-safe singleton that tracks circuit state per tool name.
+    Thread-safe singleton. State for a scope is guarded by one of
+    ``_NUM_LOCK_SHARDS`` locks chosen by hashing the scope.
     """
 
     _instance: "CircuitBreakerRegistry | None" = None
-    _breakers: dict[str, CircuitBreakerState]
+    _breakers: dict[str, dict[str, CircuitBreakerState]]
     _configs: dict[str, CircuitBreakerConfig]
     _default_config: CircuitBreakerConfig
-    _lock: threading.Lock
+    _shards: tuple[threading.Lock, ...]
+    _shared: "SharedStore | None"
+    _shared_marks: dict[str, tuple[float, dict[str, float]]]
+    _refreshing: set[str]
 
     def __new__(cls) -> "CircuitBreakerRegistry":
         """Singleton constructor for the registry."""
@@ -99,7 +214,12 @@ class CircuitBreakerRegistry:
             cls._instance._breakers = {}
             cls._instance._configs = {}
             cls._instance._default_config = CircuitBreakerConfig()
-            cls._instance._lock = threading.Lock()
+            cls._instance._shards = tuple(
+                threading.Lock() for _ in range(_NUM_LOCK_SHARDS)
+            )
+            cls._instance._shared = _shared_circuit_store()
+            cls._instance._shared_marks = {}
+            cls._instance._refreshing = set()
         return cls._instance
 
     @classmethod
@@ -107,121 +227,276 @@ class CircuitBreakerRegistry:
         """Reset the singleton (for testing)."""
         cls._instance = None
 
-    def configure(self, tool_name: str, config: CircuitBreakerConfig) -> None:
-        """Set custom configuration for a specific tool."""
-        self._configs[tool_name] = config
+    def _lock_for(self, scope: str) -> threading.Lock:
+        return self._shards[hash(scope) % len(self._shards)]
 
-    def _get_config(self, tool_name: str) -> CircuitBreakerConfig:
-        """Get configuration for a tool, falling back to default."""
-        return self._configs.get(tool_name, self._default_config)
+    def configure(self, name: str, config: CircuitBreakerConfig) -> None:
+        """Set custom configuration.
 
-    def _get_state(self, tool_name: str) -> CircuitBreakerState:
-        """Get or create state for a tool."""
-        if tool_name not in self._breakers:
-            self._breakers[tool_name] = CircuitBreakerState()
-        return self._breakers[tool_name]
+        Args:
+            name: A tool name or scope, a ``"<scope>:<error class>"`` key, or a
+                backend name applying to all of that backend's scopes.
+            config: Configuration to use.
+        """
+        self._configs[name] = config
+
+    def _get_config(
+        self, scope: str, error_class: str = _AGGREGATE
+    ) -> CircuitBreakerConfig:
+        """Get configuration for a breaker, falling back to backend then default."""
+        for name in (_status_key(scope, error_class), scope, scope.split(":", 1)[0]):
+            config = self._configs.get(name)
+            if config is not None:
+                return config
+        return self._default_config
+
+    def _get_scope(self, scope: str) -> dict[str, CircuitBreakerState]:
+        """Get or create the breakers of a scope (caller holds its lock)."""
+        breakers = self._breakers.get(scope)
+        if breakers is None:
+            breakers = self._breakers.setdefault(
+                scope, {_AGGREGATE: CircuitBreakerState()}
+            )
+        return breakers
+
+    def _get_state(
+        self, scope: str, error_class: str = _AGGREGATE
+    ) -> CircuitBreakerState:
+        """Get or create state for one breaker (caller holds its lock)."""
+        breakers = self._get_scope(scope)
+        if error_class not in breakers:
+            breakers[error_class] = CircuitBreakerState()
+        return breakers[error_class]
 
     def pre_call(self, tool_name: str) -> bool:
         """Check if a call should proceed. Returns True if allowed.
 
+        Args:
+            tool_name: Tool name or scope (see :func:`scope_key`). The call is
+                blocked while any breaker of the scope is open.
+
         Raises:
             CircuitBreakerOpenError: If the circuit is open and not ready to retry.
         """
-        with self._lock:
-            state = self._get_state(tool_name)
-            config = self._get_config(tool_name)
+        scope = tool_name
+        marks = self._read_marks(scope) if self._shared is not None else {}
+        with self._lock_for(scope):
+            breakers = self._get_scope(scope)
+            breakers[_AGGREGATE].total_calls += 1
             now = time.time()
-
-            state.total_calls += 1
-
-            if state.state == CircuitState.CLOSED:
-                return True
-
-            if state.state == CircuitState.OPEN:
-                elapsed = now - state.last_failure_time
-                if elapsed >= config.recovery_timeout_seconds:
-                    # Transition to half-open
-                    state.state = CircuitState.HALF_OPEN
-                    state.half_open_calls = 0
-                    state.success_count = 0
-                    state.last_state_change = now
-                    logger.info(
-                        f"Circuit breaker HALF_OPEN for '{tool_name}' "
-                        f"(after {elapsed:.1f}s recovery timeout)"
-                    )
-                    return True
-                else:
-                    remaining = config.recovery_timeout_seconds - elapsed
-                    state.total_short_circuits += 1
-                    raise CircuitBreakerOpenError(tool_name, remaining)
-
-            if state.state == CircuitState.HALF_OPEN:
-                if state.half_open_calls < config.half_open_max_calls:
-                    state.half_open_calls += 1
-                    return True
-                else:
+            for error_class, state in breakers.items():
+                self._check(scope, error_class, state, now)
+            for error_class, open_until in marks.items():
+                local = breakers.get(error_class)
+                if open_until > now and (
+                    local is None or local.state == CircuitState.CLOSED
+                ):
+                    # Opened by another worker.
+                    breakers[_AGGREGATE].total_short_circuits += 1
                     raise CircuitBreakerOpenError(
-                        tool_name, config.recovery_timeout_seconds
+                        _status_key(scope, error_class), open_until - now
                     )
-
             return True
 
+    def _check(
+        self, scope: str, error_class: str, state: CircuitBreakerState, now: float
+    ) -> None:
+        """Apply the state machine for one breaker; raise if it blocks."""
+        name = _status_key(scope, error_class)
+        config = self._get_config(scope, error_class)
+
+        if state.state == CircuitState.OPEN:
+            elapsed = now - state.last_failure_time
+            if elapsed >= config.recovery_timeout_seconds:
+                # Transition to half-open
+                state.state = CircuitState.HALF_OPEN
+                state.half_open_calls = 0
+                state.success_count = 0
+                state.last_state_change = now
+                logger.info(
+                    f"Circuit breaker HALF_OPEN for '{name}' "
+                    f"(after {elapsed:.1f}s recovery timeout)"
+                )
+                return
+            remaining = config.recovery_timeout_seconds - elapsed
+            state.total_short_circuits += 1
+            raise CircuitBreakerOpenError(name, remaining)
+
+        if state.state == CircuitState.HALF_OPEN:
+            if state.half_open_calls < config.half_open_max_calls:
+                state.half_open_calls += 1
+                return
+            raise CircuitBreakerOpenError(name, config.recovery_timeout_seconds)
+
     def record_success(self, tool_name: str) -> None:
-        """Record a successful call."""
-        with self._lock:
-            state = self._get_state(tool_name)
-
-            if state.state == CircuitState.HALF_OPEN:
-                state.success_count += 1
-                config = self._get_config(tool_name)
-                if state.success_count >= config.success_threshold:
-                    state.state = CircuitState.CLOSED
-                    state.failure_count = 0
-                    state.success_count = 0
-                    state.last_state_change = time.time()
-                    logger.info(f"Circuit breaker CLOSED for '{tool_name}' (recovered)")
-            elif state.state == CircuitState.CLOSED:
-                # Reset failure count on success
-                if state.failure_count > 0:
-                    state.failure_count = max(0, state.failure_count - 1)
-
-    def record_failure(self, tool_name: str) -> None:
-        """Record a failed call."""
-        with self._lock:
-            state = self._get_state(tool_name)
-            config = self._get_config(tool_name)
-            now = time.time()
+        """Record a successful call for every breaker of the scope."""
+        scope = tool_name
+        closed: list[str] = []
+        with self._lock_for(scope):
+            for error_class, state in self._get_scope(scope).items():
+                if state.state == CircuitState.HALF_OPEN:
+                    state.success_count += 1
+                    config = self._get_config(scope, error_class)
+                    if state.success_count >= config.success_threshold:
+                        closed.append(error_class)
+                        state.state = CircuitState.CLOSED
+                        state.failure_count = 0
+                        state.success_count = 0
+                        state.last_state_change = time.time()
+                        logger.info(
+                            f"Circuit breaker CLOSED for "
+                            f"'{_status_key(scope, error_class)}' (recovered)"
+                        )
+                elif state.state == CircuitState.CLOSED:
+                    # Reset failure count on success
+                    if state.failure_count > 0:
+                        state.failure_count = max(0, state.failure_count - 1)
+        if closed and self._shared is not None:
+            self._publish(scope, {error_class: None for error_class in closed})
+
+    def record_failure(
+        self, tool_name: str, error_class: ErrorClass | None = None
+    ) -> None:
+        """Record a failed call.
+
+        Args:
+            tool_name: Tool name or scope.
+            error_class: Class of the error. Non-tripping classes are only
+                counted; ``None`` records on the scope's aggregate breaker.
+        """
+        scope = tool_name
+        opened: dict[str, float | None] = {}
+        with self._lock_for(scope):
+            self._get_scope(scope)[_AGGREGATE].total_failures += 1
+            if error_class is None:
+                cls_key = _AGGREGATE
+                open_until = self._trip(scope, _AGGREGATE, count_total=False)
+            elif error_class in TRIPPING_ERROR_CLASSES:
+                cls_key = error_class.value
+                open_until = self._trip(scope, cls_key)
+            else:
+                open_until = None
+            if open_until is not None and self._shared is not None:
+                opened[cls_key] = open_until
+        if opened:
+            self._publish(scope, opened)
+
+    # ── Shared open marks ────────────────────────────────────────────
+
+    def _read_marks(self, scope: str) -> dict[str, float]:
+        """Open marks published for ``scope``, re-read at most once a second."""
+        from sre_agent.core.shared_state import on_event_loop, run_in_background
+
+        now = time.time()
+        cached = self._shared_marks.get(scope)
+        if cached is not None and now - cached[0] < _SHARED_REFRESH_SECONDS:
+            return cached[1]
+        if not on_event_loop():
+            return self._fetch_marks(scope)
+        if scope not in self._refreshing:
+            self._refreshing.add(scope)
+            run_in_background(self._fetch_marks, scope)
+        return cached[1] if cached is not None else {}
+
+    def _fetch_marks(self, scope: str) -> dict[str, float]:
+        """Read the marks of ``scope`` from shared state (blocking)."""
+        assert self._shared is not None
+        cached = self._shared_marks.get(scope)
+        try:
+            marks: dict[str, float] = self._shared.get(scope) or {}
+        except Exception as e:
+            logger.debug(f"Could not read shared circuit state for {scope}: {e}")
+            marks = cached[1] if cached is not None else {}
+        finally:
+            self._refreshing.discard(scope)
+        self._shared_marks[scope] = (time.time(), marks)
+        return marks
+
+    def _publish(self, scope: str, changes: dict[str, float | None]) -> None:
+        """Merge open (``open_until``) or closed (None) breakers into shared state."""
+        assert self._shared is not None
+        now = time.time()
+
+        def merge(marks: dict[str, float] | None) -> dict[str, float] | None:
+            merged = {k: v for k, v in (marks or {}).items() if v > now}
+            for error_class, open_until in changes.items():
+                if open_until is None:
+                    merged.pop(error_class, None)
+                else:
+                    merged[error_class] = open_until
+            return merged or None
+
+        ttl = max((v for v in changes.values() if v is not None), default=now) - now
+        try:
+            self._shared.update_in_background(scope, merge, ttl_seconds=max(ttl, 1.0))
+        except Exception as e:
+            logger.debug(f"Could not publish shared circuit state for {scope}: {e}")
+        # Keep serving the merged marks, but re-read them on the next check.
+        cached = self._shared_marks.get(scope)
+        self._shared_marks[scope] = (0.0, merge(cached[1] if cached else None) or {})
+
+    def _trip(
+        self, scope: str, error_class: str, count_total: bool = True
+    ) -> float | None:
+        """Advance one breaker after a failure (caller holds the lock).
+
+        Returns:
+            When the breaker may be retried, if this failure opened it.
+        """
+        state = self._get_state(scope, error_class)
+        config = self._get_config(scope, error_class)
+        name = _status_key(scope, error_class)
+        now = time.time()
 
+        if count_total:
             state.total_failures += 1
 
-            if state.state == CircuitState.HALF_OPEN:
-                # Recovery failed, re-open the circuit
+        if state.state == CircuitState.HALF_OPEN:
+            # Recovery failed, re-open the circuit
+            state.state = CircuitState.OPEN
+            state.last_failure_time = now
+            state.last_state_change = now
+            logger.warning(
+                f"Circuit breaker re-OPENED for '{name}' "
+                "(failed during half-open recovery)"
+            )
+            return now + config.recovery_timeout_seconds
+        if state.state == CircuitState.CLOSED:
+            state.failure_count += 1
+            state.last_failure_time = now
+            if state.failure_count >= config.failure_threshold:
                 state.state = CircuitState.OPEN
-                state.last_failure_time = now
                 state.last_state_change = now
                 logger.warning(
-                    f"Circuit breaker re-OPENED for '{tool_name}' "
-                    "(failed during half-open recovery)"
+                    f"Circuit breaker OPENED for '{name}' "
+                    f"({state.failure_count} consecutive failures)"
                 )
-            elif state.state == CircuitState.CLOSED:
-                state.failure_count += 1
-                state.last_failure_time = now
-                if state.failure_count >= config.failure_threshold:
-                    state.state = CircuitState.OPEN
-                    state.last_state_change = now
-                    logger.warning(
-                        f"Circuit breaker OPENED for '{tool_name}' "
-                        f"({state.failure_count} consecutive failures)"
-                    )
+                return now + config.recovery_timeout_seconds
+        return None
+
+    def get_status(
+        self, tool_name: str, error_class: ErrorClass | None = None
+    ) -> dict[str, Any]:
+        """Get current status of a circuit breaker.
 
-    def get_status(self, tool_name: str) -> dict[str, Any]:
-        """Get current status of a circuit breaker."""
-        state = self._get_state(tool_name)
-        config = self._get_config(tool_name)
+        Args:
+            tool_name: Tool name or scope.
+            error_class: Breaker within the scope; ``None`` for the aggregate.
+        """
+        scope = tool_name
+        cls_key = error_class.value if error_class is not None else _AGGREGATE
+        with self._lock_for(scope):
+            state = self._get_state(scope, cls_key)
+            return self._status(scope, cls_key, state)
+
+    def _status(
+        self, scope: str, error_class: str, state: CircuitBreakerState
+    ) -> dict[str, Any]:
+        config = self._get_config(scope, error_class)
         now = time.time()
 
         status: dict[str, Any] = {
-            "tool_name": tool_name,
+            "tool_name": _status_key(scope, error_class),
             "state": state.state.value,
             "failure_count": state.failure_count,
             "total_calls": state.total_calls,
@@ -240,19 +515,37 @@ class CircuitBreakerRegistry:
 
         return status
 
+    def _snapshot(self) -> list[tuple[str, str, CircuitBreakerState]]:
+        return [
+            (scope, error_class, state)
+            for scope, breakers in list(self._breakers.items())
+            for error_class, state in list(breakers.items())
+        ]
+
     def get_all_status(self) -> dict[str, dict[str, Any]]:
-        """Get status of all tracked circuit breakers."""
-        return {name: self.get_status(name) for name in sorted(self._breakers)}
+        """Get status of all tracked circuit breakers, keyed by breaker name."""
+        statuses = {
+            _status_key(scope, error_class): self._status(scope, error_class, state)
+            for scope, error_class, state in self._snapshot()
+        }
+        return dict(sorted(statuses.items()))
 
     def get_open_circuits(self) -> list[str]:
-        """Get names of all tools with open circuits."""
+        """Get names of all breakers with open circuits."""
         return [
-            name
-            for name, state in self._breakers.items()
+            _status_key(scope, error_class)
+            for scope, error_class, state in self._snapshot()
             if state.state == CircuitState.OPEN
         ]
 
 
+def _shared_circuit_store() -> "SharedStore | None":
+    from sre_agent.core.shared_state import get_shared_store
+
+    store = get_shared_store("circuit_breakers")
+    return store if store.is_shared else None
+
+
 def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
     """Get the global circuit breaker registry singleton."""
     return CircuitBreakerRegistry()
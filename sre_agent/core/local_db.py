@@ -0,0 +1,358 @@
+"""Shared SQLite access layer for local persistence.
+
+Local memory, preferences and the mistake store each used to open a fresh
+SQLite connection per call, in rollback-journal mode, and commit (fsync)
+every write on its own, so concurrent local investigations serialized on
+``database is locked`` retries. :class:`LocalDatabase` replaces that with:
+
+- A small pool of long-lived reader connections in WAL mode, so reads never
+  block on the writer.
+- One dedicated writer thread that drains queued write jobs and commits them
+  in batches (group commit). Every job runs in its own savepoint, so one
+  failing job does not roll back the others.
+- Tuned pragmas (``synchronous=NORMAL``, ``mmap``, in-memory temp store) and a
+  large per-connection prepared statement cache.
+- Async wrappers: reads run in a worker thread, and writes await the writer's
+  future without occupying a thread.
+
+Usage::
+
+    db = get_local_database(".sre_agent_memory.db")
+    await db.awrite(lambda conn: conn.execute("INSERT ...", params))
+    rows = await db.aread(lambda conn: conn.execute("SELECT ...").fetchall())
+
+Write jobs must not call ``commit()``/``rollback()`` or ``executescript()``;
+transactions are owned by the writer thread.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Pragmas applied to every connection, including SQLAlchemy/aiosqlite ones.
+PRAGMAS: tuple[tuple[str, str], ...] = (
+    ("journal_mode", "WAL"),
+    # Durable across application crashes; only an OS crash can lose the
+    # last group commit. fsync happens at checkpoints, not every commit.
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", "5000"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-16000"),  # 16 MiB
+    ("mmap_size", str(256 * 1024 * 1024)),
+    ("foreign_keys", "ON"),
+)
+
+
+def pragma_statements() -> list[str]:
+    """Return the ``PRAGMA`` statements applied to local connections."""
+    return [f"PRAGMA {name}={value}" for name, value in PRAGMAS]
+
+
+@dataclass(frozen=True)
+class LocalDatabaseConfig:
+    """Tuning for :class:`LocalDatabase`.
+
+    Attributes:
+        readers: Maximum number of pooled reader connections.
+        max_batch: Maximum write jobs committed in one transaction.
+        group_commit_window_ms: How long the writer waits for more jobs
+            after the first one before committing.
+        statement_cache: Prepared statements cached per connection.
+        busy_timeout_seconds: Lock wait before SQLite reports busy.
+    """
+
+    readers: int = 4
+    max_batch: int = 128
+    group_commit_window_ms: float = 2.0
+    statement_cache: int = 256
+    busy_timeout_seconds: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> "LocalDatabaseConfig":
+        """Build a config from ``SRE_AGENT_SQLITE_*`` environment variables."""
+        return cls(
+            readers=int(os.environ.get("SRE_AGENT_SQLITE_READERS", "4")),
+            max_batch=int(os.environ.get("SRE_AGENT_SQLITE_MAX_BATCH", "128")),
+            group_commit_window_ms=float(
+                os.environ.get("SRE_AGENT_SQLITE_COMMIT_WINDOW_MS", "2")
+            ),
+        )
+
+
+_STOP = object()
+
+
+class LocalDatabase:
+    """Pooled readers plus a group-committing writer thread for one file."""
+
+    def __init__(self, path: str, config: LocalDatabaseConfig | None = None) -> None:
+        """Open the database.
+
+        Args:
+            path: SQLite database file.
+            config: Pool and batching limits (defaults from the environment).
+        """
+        self.path = path
+        self.config = config or LocalDatabaseConfig.from_env()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue[Any] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        self.batches = 0
+        self.jobs_committed = 0
+        self.max_batch_seen = 0
+        # Create the file and switch it to WAL before any reader opens it.
+        self._writer_conn = self._open()
+        self._inode = _inode(path)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.config.busy_timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,  # transactions are managed explicitly
+            cached_statements=self.config.statement_cache,
+        )
+        for statement in pragma_statements():
+            conn.execute(statement)
+        return conn
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._reader_count < self.config.readers
+            if can_open:
+                self._reader_count += 1
+        if can_open:
+            try:
+                return self._open()
+            except Exception:
+                with self._lock:
+                    self._reader_count -= 1
+                raise
+        return self._readers.get()
+
+    def read(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn`` with a pooled reader connection (blocking)."""
+        if self._closed:
+            raise RuntimeError(f"Local database {self.path} is closed")
+        conn = self._acquire_reader()
+        try:
+            return fn(conn)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+
+    async def aread(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn`` with a pooled reader connection in a worker thread."""
+        return await asyncio.to_thread(self.read, fn)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def submit(
+        self, fn: Callable[[sqlite3.Connection], T]
+    ) -> "concurrent.futures.Future[T]":
+        """Queue a write job; the future resolves once its batch commits."""
+        if self._closed:
+            raise RuntimeError(f"Local database {self.path} is closed")
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        self._ensure_writer()
+        self._jobs.put((fn, future))
+        return future
+
+    def write(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a write job and wait for its commit (blocking)."""
+        return self.submit(fn).result()
+
+    async def awrite(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a write job and await its commit."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def execute(self, sql: str, params: tuple[Any, ...] | dict[str, Any] = ()) -> int:
+        """Execute one write statement and return the affected row count."""
+        return self.write(lambda conn: conn.execute(sql, params).rowcount)
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop,
+                    name=f"sqlite-writer-{os.path.basename(self.path)}",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        window = self.config.group_commit_window_ms / 1000
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                return
+            batch = [job]
+            deadline = time.monotonic() + window
+            stop = False
+            while len(batch) < self.config.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    job = (
+                        self._jobs.get(timeout=remaining)
+                        if remaining > 0
+                        else self._jobs.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stop = True
+                    break
+                batch.append(job)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: list[Any]) -> None:
+        conn = self._writer_conn
+        outcomes: list[tuple[concurrent.futures.Future[Any], Any, BaseException | None]]
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT job")
+                try:
+                    result = fn(conn)
+                except BaseException as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    outcomes.append((future, None, e))
+                else:
+                    conn.execute("RELEASE job")
+                    outcomes.append((future, result, None))
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.error(
+                f"Group commit of {len(batch)} jobs to {self.path} failed: {e}"
+            )
+            if conn.in_transaction:
+                conn.rollback()
+            for _, future in batch:
+                if future.done():
+                    continue
+                if future.running() or future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.jobs_committed += len(outcomes)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def is_stale(self) -> bool:
+        """Whether the file was deleted or replaced since it was opened."""
+        return _inode(self.path) != self._inode
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool and group-commit counters for status endpoints."""
+        return {
+            "path": self.path,
+            "readers": self._reader_count,
+            "pending_writes": self._jobs.qsize(),
+            "batches": self.batches,
+            "jobs_committed": self.jobs_committed,
+            "max_batch": self.max_batch_seen,
+        }
+
+    def close(self) -> None:
+        """Flush queued writes and close all connections."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._jobs.put(_STOP)
+            self._writer.join(timeout=10)
+        self._writer_conn.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _inode(path: str) -> int | None:
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return None
+
+
+_databases: dict[str, LocalDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def get_local_database(path: str) -> LocalDatabase:
+    """Return the shared :class:`LocalDatabase` for ``path``.
+
+    A database whose file was deleted or replaced (e.g. by tests or a manual
+    reset) is closed and reopened.
+    """
+    key = os.path.abspath(path)
+    with _databases_lock:
+        db = _databases.get(key)
+        if db is not None and db.is_stale():
+            logger.info(f"Reopening local database {path}: file was replaced")
+            db.close()
+            db = None
+        if db is None:
+            db = LocalDatabase(path)
+            _databases[key] = db
+        return db
+
+
+def close_local_databases() -> None:
+    """Close every shared database (at exit, and for tests)."""
+    with _databases_lock:
+        databases = list(_databases.values())
+        _databases.clear()
+    for db in databases:
+        try:
+            db.close()
+        except Exception as e:
+            logger.warning(f"Failed to close local database {db.path}: {e}")
+
+
+atexit.register(close_local_databases)
@@ -0,0 +1,588 @@
+"""Event-loop lag monitor and blocking-call detector.
+
+Every request on a replica shares one event loop, so a synchronous call made
+from a coroutine (a BigQuery ``result()``, a credential refresh, a SQLite
+query) stalls every other stream for as long as it runs. :class:`LoopMonitor`
+measures that continuously:
+
+- a heartbeat coroutine sleeps for ``interval_ms`` and records how late it
+  wakes up (the event-loop lag);
+- a watchdog thread notices when the heartbeat is overdue by more than
+  ``threshold_ms`` and samples the loop thread's stack while it is still
+  blocked, along with the activity labels of the task that is running.
+
+Activity labels come from :func:`enter_activity` / :func:`attributed`:
+``@adk_tool`` labels its calls ``tool:<name>``, the API middleware labels
+requests ``route:<method> <path>`` and agent callbacks are labelled
+``callback:<name>``. Labels nest (``route:... > tool:...``) and are inherited
+by tasks spawned while they are active. When the loop resumes, the stall is
+attributed to the innermost label and the innermost project frame of the
+sampled stack, aggregated per (blocker, site), and exported as the
+``sre_agent.event_loop.lag`` and ``sre_agent.event_loop.blocked`` histograms.
+``GET /api/debug/loop`` lists the top blockers.
+
+:func:`blocking_budget` turns the same machinery into a test assertion::
+
+    async with blocking_budget(50):
+        await some_tool(...)  # EventLoopBlockedError if it blocks > 50ms
+
+Configuration (``LoopMonitorConfig.from_env``):
+    SRE_AGENT_LOOP_MONITOR: "false" disables the monitor.
+    SRE_AGENT_LOOP_MONITOR_INTERVAL_MS: Heartbeat interval (50).
+    SRE_AGENT_LOOP_BLOCK_THRESHOLD_MS: Lag reported as a blocking call (100).
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+import weakref
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+UNATTRIBUTED = "unattributed"
+
+# A label is a string, or a callable resolved when a stall is reported (used
+# for request routes, which are only known once routing has run).
+Label = str | Callable[[], str]
+
+_activity: contextvars.ContextVar[tuple[Label, ...]] = contextvars.ContextVar(
+    "loop_activity", default=()
+)
+
+# The watchdog thread cannot read another task's ContextVars, so the labels of
+# each task are mirrored here whenever they change on the loop thread.
+_task_activity: "weakref.WeakKeyDictionary[asyncio.Task[Any], tuple[Label, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Frames under the project root are reported relative to it.
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LIBRARY_DIRS = tuple(
+    {
+        os.path.abspath(path)
+        for key in ("stdlib", "platstdlib", "purelib", "platlib")
+        if (path := sysconfig.get_paths().get(key))
+    }
+)
+_STACK_LIMIT = 20
+# Frames that only wrap the blocking code (tool decorator, attribution).
+_WRAPPER_FILES = (
+    os.path.join("sre_agent", "core", "loop_monitor.py"),
+    os.path.join("sre_agent", "tools", "common", "decorators.py"),
+)
+_MAX_SAMPLES = 200
+
+
+# =============================================================================
+# Attribution
+# =============================================================================
+
+
+def _publish(labels: tuple[Label, ...]) -> None:
+    """Mirror the current task's labels for the watchdog thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:  # no running loop (e.g. a worker thread)
+        return
+    if task is None:
+        return
+    if labels:
+        _task_activity[task] = labels
+    else:
+        _task_activity.pop(task, None)
+
+
+def enter_activity(label: Label) -> contextvars.Token[tuple[Label, ...]]:
+    """Attribute event-loop time to ``label`` until :func:`exit_activity`.
+
+    Args:
+        label: Activity name, e.g. ``"tool:fetch_trace"``.
+
+    Returns:
+        A token to pass to :func:`exit_activity`.
+    """
+    labels = (*_activity.get(), label)
+    token = _activity.set(labels)
+    _publish(labels)
+    return token
+
+
+def exit_activity(token: contextvars.Token[tuple[Label, ...]]) -> None:
+    """Restore the activity that was current before :func:`enter_activity`."""
+    _activity.reset(token)
+    _publish(_activity.get())
+
+
+@contextlib.contextmanager
+def activity(label: Label) -> Iterator[None]:
+    """Context manager form of :func:`enter_activity`."""
+    token = enter_activity(label)
+    try:
+        yield
+    finally:
+        exit_activity(token)
+
+
+def attributed(label: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator attributing a sync or async function's loop time to ``label``.
+
+    Example:
+        @attributed("callback:before_model")
+        def before_model_callback(callback_context, llm_request): ...
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with activity(label):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with activity(label):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
+def current_activity() -> list[str]:
+    """Return the activity labels of the current context, outermost first."""
+    return [_label_text(label) for label in _activity.get()]
+
+
+def _label_text(label: Label) -> str:
+    if isinstance(label, str):
+        return label
+    try:
+        return label()
+    except Exception:
+        return UNATTRIBUTED
+
+
+def _task_factory(previous: Callable[..., Any] | None) -> Callable[..., Any]:
+    """Build a task factory that registers new tasks under their creator's labels.
+
+    ``BaseHTTPMiddleware`` runs the route in a child task, so without this the
+    route label would only cover the middleware's own task.
+    """
+
+    def factory(
+        loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        task: asyncio.Future[Any]
+        if previous is not None:
+            task = previous(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        labels = _activity.get()
+        if labels and isinstance(task, asyncio.Task):
+            _task_activity[task] = labels
+        return task
+
+    factory._loop_monitor_previous = previous  # type: ignore[attr-defined]
+    return factory
+
+
+# =============================================================================
+# Monitor
+# =============================================================================
+
+
+@dataclass
+class LoopMonitorConfig:
+    """Configuration for the event-loop monitor."""
+
+    enabled: bool = True
+    interval_ms: float = 50.0
+    threshold_ms: float = 100.0
+    max_recent_stalls: int = 50
+    lag_window: int = 1200
+
+    @classmethod
+    def from_env(cls) -> "LoopMonitorConfig":
+        """Build a config from ``SRE_AGENT_LOOP_*`` environment variables."""
+        return cls(
+            enabled=os.environ.get("SRE_AGENT_LOOP_MONITOR", "true").lower() != "false",
+            interval_ms=float(
+                os.environ.get("SRE_AGENT_LOOP_MONITOR_INTERVAL_MS", "50")
+            ),
+            threshold_ms=float(
+                os.environ.get("SRE_AGENT_LOOP_BLOCK_THRESHOLD_MS", "100")
+            ),
+        )
+
+
+@dataclass
+class Stall:
+    """One period during which the event loop was blocked."""
+
+    blocker: str
+    site: str
+    duration_ms: float
+    activity: list[str] = field(default_factory=list)
+    stack: list[str] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the debug endpoint."""
+        data = asdict(self)
+        data["duration_ms"] = round(self.duration_ms, 1)
+        return data
+
+
+@dataclass
+class _Sample:
+    """What the loop thread was doing when the watchdog caught it blocked."""
+
+    activity: list[str]
+    site: str
+    stack: list[str]
+
+
+def _is_library(filename: str) -> bool:
+    return filename.startswith(_LIBRARY_DIRS) or filename.startswith("<")
+
+
+def _frame_text(frame: traceback.FrameSummary) -> str:
+    filename = frame.filename
+    if filename.startswith(_ROOT_DIR + os.sep):
+        filename = os.path.relpath(filename, _ROOT_DIR)
+    return f"{filename}:{frame.lineno} in {frame.name}"
+
+
+def _blocking_site(stack: list[traceback.FrameSummary]) -> str:
+    """Pick the innermost frame outside libraries and attribution wrappers."""
+    for frame in reversed(stack):
+        if not _is_library(frame.filename) and not frame.filename.endswith(
+            _WRAPPER_FILES
+        ):
+            return _frame_text(frame)
+    return _frame_text(stack[-1]) if stack else "unknown"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+class LoopMonitor:
+    """Measures event-loop lag and attributes blocking calls.
+
+    Start it from a coroutine running on the loop to watch; stop it from the
+    same loop.
+    """
+
+    def __init__(
+        self, config: LoopMonitorConfig | None = None, *, export: bool = True
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            config: Monitor configuration (defaults to ``from_env``).
+            export: Record measurements to the OpenTelemetry histograms.
+        """
+        self.config = config or LoopMonitorConfig.from_env()
+        self._export = export
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._due = 0.0  # perf_counter() time of the next heartbeat
+        self._pending: list[_Sample] = []
+        self._lags: deque[float] = deque(maxlen=self.config.lag_window)
+        self._recent: deque[Stall] = deque(maxlen=self.config.max_recent_stalls)
+        self._blockers: dict[tuple[str, str], dict[str, Any]] = {}
+        self._factory: Callable[..., Any] | None = None
+        self.stall_count = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is attached to a loop."""
+        return self._heartbeat_task is not None
+
+    @property
+    def stalls(self) -> list[Stall]:
+        """Recent stalls, oldest first."""
+        return list(self._recent)
+
+    def start(self) -> None:
+        """Attach to the running event loop. Must be called from that loop."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._factory = _task_factory(loop.get_task_factory())
+        loop.set_task_factory(self._factory)
+
+        self._stop.clear()
+        self._due = time.perf_counter()
+        self._heartbeat_task = loop.create_task(
+            self._heartbeat(), name="loop-monitor-heartbeat"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.debug(
+            f"Event loop monitor started (interval {self.config.interval_ms:g}ms, "
+            f"threshold {self.config.threshold_ms:g}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Detach from the loop, reporting a stall that just ended."""
+        if not self.running:
+            return
+        # A block that ended right before this call has not woken the
+        # heartbeat yet; account for it here.
+        overdue_ms = (time.perf_counter() - self._due) * 1000
+        if overdue_ms >= self.config.threshold_ms:
+            self._record_lag(overdue_ms)
+        task = self._heartbeat_task
+        self._halt()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _halt(self) -> None:
+        """Stop the heartbeat and watchdog and restore the loop's task factory."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+        loop = self._loop
+        if loop is not None and loop.get_task_factory() is self._factory:
+            loop.set_task_factory(self._factory._loop_monitor_previous)  # type: ignore[union-attr]
+        self._heartbeat_task = None
+        self._watchdog = None
+        self._loop = None
+
+    async def _heartbeat(self) -> None:
+        interval = self.config.interval_ms / 1000
+        while True:
+            self._record_lag(max(0.0, time.perf_counter() - self._due) * 1000)
+            with self._lock:
+                self._due = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+
+    def _watch(self) -> None:
+        """Watchdog thread: sample the loop thread for as long as it is blocked."""
+        threshold = self.config.threshold_ms / 1000
+        poll = max(0.001, min(self.config.interval_ms / 1000, threshold) / 4)
+        while not self._stop.wait(poll):
+            with self._lock:
+                due = self._due
+            if time.perf_counter() - due < threshold:
+                continue
+            sample = self._sample()
+            with self._lock:
+                if self._due == due and len(self._pending) < _MAX_SAMPLES:
+                    self._pending.append(sample)
+
+    def _sample(self) -> _Sample:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        stack = traceback.extract_stack(frame) if frame is not None else []
+        labels: tuple[Label, ...] = ()
+        loop = self._loop
+        if loop is not None:
+            # Reads the loop's current-task slot; safe from another thread.
+            task = asyncio.current_task(loop)
+            if task is not None:
+                labels = _task_activity.get(task, ())
+        return _Sample(
+            activity=[_label_text(label) for label in labels],
+            site=_blocking_site(stack),
+            stack=[_frame_text(f) for f in stack[-_STACK_LIMIT:]],
+        )
+
+    def _record_lag(self, lag_ms: float) -> None:
+        self._lags.append(lag_ms)
+        if self._export:
+            self._histogram("sre_agent.event_loop.lag", "Event loop lag").record(lag_ms)
+        if lag_ms >= self.config.threshold_ms:
+            self._record_stall(lag_ms)
+        elif self._pending:
+            with self._lock:
+                self._pending = []
+
+    def _record_stall(self, lag_ms: float) -> None:
+        with self._lock:
+            samples, self._pending = self._pending, []
+        if samples:
+            # Back-to-back blocking calls show up as one stall; blame the
+            # call the watchdog caught most often.
+            counts = Counter((tuple(s.activity), s.site) for s in samples)
+            dominant = counts.most_common(1)[0][0]
+            sample = next(
+                s for s in reversed(samples) if (tuple(s.activity), s.site) == dominant
+            )
+        else:
+            # The loop was slow, but no single call was caught blocking it.
+            sample = _Sample(activity=[], site="unknown", stack=[])
+        stall = Stall(
+            blocker=sample.activity[-1] if sample.activity else UNATTRIBUTED,
+            site=sample.site,
+            duration_ms=lag_ms,
+            activity=sample.activity,
+            stack=sample.stack,
+        )
+        self.stall_count += 1
+        self._recent.append(stall)
+
+        entry = self._blockers.setdefault(
+            (stall.blocker, stall.site),
+            {"blocker": stall.blocker, "site": stall.site, "count": 0},
+        )
+        entry["count"] += 1
+        entry["total_ms"] = entry.get("total_ms", 0.0) + lag_ms
+        entry["max_ms"] = max(entry.get("max_ms", 0.0), lag_ms)
+        entry["stack"] = stall.stack
+
+        if self._export:
+            self._histogram(
+                "sre_agent.event_loop.blocked", "Event loop time lost to blocking calls"
+            ).record(lag_ms, {"blocker": stall.blocker, "site": stall.site})
+        logger.warning(
+            f"🐢 Event loop blocked for {lag_ms:.0f}ms by {stall.blocker} "
+            f"at {stall.site}"
+        )
+
+    @staticmethod
+    def _histogram(name: str, description: str) -> Any:
+        from sre_agent.tools.common.telemetry import get_histogram
+
+        return get_histogram(name, unit="ms", description=description)
+
+    def top_blockers(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Blocking sites ranked by total loop time lost."""
+        ranked = sorted(
+            self._blockers.values(), key=lambda e: e["total_ms"], reverse=True
+        )
+        return [
+            {
+                **entry,
+                "total_ms": round(entry["total_ms"], 1),
+                "max_ms": round(entry["max_ms"], 1),
+            }
+            for entry in ranked[:limit]
+        ]
+
+    def snapshot(self, limit: int = 10) -> dict[str, Any]:
+        """Summarize lag and blocking for the debug endpoint."""
+        lags = sorted(self._lags)
+        return {
+            "running": self.running,
+            "interval_ms": self.config.interval_ms,
+            "threshold_ms": self.config.threshold_ms,
+            "lag_ms": {
+                "samples": len(lags),
+                "p50": round(_percentile(lags, 0.50), 1),
+                "p99": round(_percentile(lags, 0.99), 1),
+                "max": round(lags[-1], 1) if lags else 0.0,
+            },
+            "stalls": self.stall_count,
+            "top_blockers": self.top_blockers(limit),
+            "recent_stalls": [s.to_dict() for s in list(self._recent)[-limit:]],
+        }
+
+
+# =============================================================================
+# Test mode
+# =============================================================================
+
+
+class EventLoopBlockedError(AssertionError):
+    """Raised by :func:`blocking_budget` when the loop was blocked too long."""
+
+    def __init__(self, stall: Stall, budget_ms: float) -> None:
+        """Initialize the error.
+
+        Args:
+            stall: The longest stall observed.
+            budget_ms: The budget it exceeded.
+        """
+        self.stall = stall
+        self.budget_ms = budget_ms
+        super().__init__(
+            f"Event loop blocked for {stall.duration_ms:.0f}ms "
+            f"(budget {budget_ms:g}ms) by {stall.blocker} at {stall.site}"
+        )
+
+
+@contextlib.asynccontextmanager
+async def blocking_budget(
+    budget_ms: float, *, interval_ms: float | None = None
+) -> AsyncIterator[LoopMonitor]:
+    """Fail if the event loop is blocked for longer than ``budget_ms``.
+
+    Runs a dedicated fine-grained monitor for the duration of the block and
+    raises :class:`EventLoopBlockedError` for the longest stall over budget.
+
+    Args:
+        budget_ms: Longest acceptable stall.
+        interval_ms: Heartbeat interval (default: a quarter of the budget,
+            between 1 and 10ms).
+
+    Yields:
+        The monitor, for inspecting lag after the block.
+    """
+    config = LoopMonitorConfig(
+        interval_ms=interval_ms or max(1.0, min(10.0, budget_ms / 4)),
+        threshold_ms=budget_ms,
+    )
+    monitor = LoopMonitor(config, export=False)
+    monitor.start()
+    try:
+        yield monitor
+    finally:
+        await monitor.stop()
+    if monitor.stalls:
+        raise EventLoopBlockedError(
+            max(monitor.stalls, key=lambda s: s.duration_ms), budget_ms
+        )
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_monitor: LoopMonitor | None = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """Get the process-wide monitor (not started until the app starts it)."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopMonitor()
+    return _monitor
+
+
+def reset_loop_monitor() -> None:
+    """Detach and drop the singleton monitor (for testing)."""
+    global _monitor
+    if _monitor is not None and _monitor.running:
+        _monitor._halt()
+    _monitor = None
@@ -26,15 +26,19 @@ import os
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.genai import types as genai_types
 
+from sre_agent.core.loop_monitor import attributed
 from sre_agent.core.summarizer import get_summarizer
 
+if TYPE_CHECKING:
+    from sre_agent.core.shared_state import SharedStore
+
 logger = logging.getLogger(__name__)
 
 # Token budget environment variable (0 = unlimited)
@@ -70,10 +74,20 @@ class UsageTracker:
     """Thread-safe accumulator for model usage across a session.
 
     Tracks per-agent and aggregate token usage, cost, and call counts.
-    Can enforce a configurable token budget.
+    Can enforce a configurable token budget. With a ``shared`` store, totals
+    are also accumulated there and reported across all uvicorn workers, so
+    the budget and usage summary do not depend on which worker answers.
+
+    The model callbacks run on the event loop, so there the shared totals
+    are published in the background and read from a local view refreshed
+    in the background at most once per ``_SHARED_REFRESH_SECONDS``. Until
+    the first refresh lands, this worker's own totals are reported.
     """
 
+    shared: "SharedStore | None" = field(default=None, repr=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _shared_view: tuple[float, dict[str, Any]] | None = field(default=None, repr=False)
+    _refreshing: bool = field(default=False, repr=False)
     _calls: list[ModelCallMetrics] = field(default_factory=list)
     _total_input_tokens: int = 0
     _total_output_tokens: int = 0
@@ -101,38 +115,112 @@ class UsageTracker:
             )
             self._per_agent_calls[agent] = self._per_agent_calls.get(agent, 0) + 1
 
+        if self.shared is not None:
+            view = self._shared_view
+            if view is not None:
+                # Count this call locally until the next refresh includes it.
+                self._shared_view = (view[0], _add_call(view[1], metrics))
+            try:
+                self.shared.update_in_background(
+                    _SHARED_TOTALS_KEY, lambda totals: _add_call(totals, metrics)
+                )
+            except Exception as e:
+                logger.debug(f"Could not share model usage: {e}")
+
+    def _shared_summary(self) -> dict[str, Any] | None:
+        """Usage accumulated by every worker, if a shared store is set."""
+        if self.shared is None:
+            return None
+        from sre_agent.core.shared_state import on_event_loop
+
+        if not on_event_loop():
+            return self._read_shared()
+        view = self._shared_view
+        if view is None or time.time() - view[0] >= _SHARED_REFRESH_SECONDS:
+            self._refresh_in_background()
+        return view[1] if view is not None else None
+
+    def _read_shared(self) -> dict[str, Any] | None:
+        """Read the shared totals (blocking) and remember them as the view."""
+        assert self.shared is not None
+        try:
+            totals: dict[str, Any] | None = self.shared.get(_SHARED_TOTALS_KEY)
+        except Exception as e:
+            logger.debug(f"Could not read shared model usage: {e}")
+            return None
+        summary = totals or _add_call(None, None)
+        self._shared_view = (time.time(), summary)
+        return summary
+
+    def _refresh_in_background(self) -> None:
+        from sre_agent.core.shared_state import run_in_background
+
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def refresh() -> None:
+            try:
+                self._read_shared()
+            finally:
+                self._refreshing = False
+
+        run_in_background(refresh)
+
     @property
     def total_input_tokens(self) -> int:
         """Total input tokens across all calls."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return int(shared["total_input_tokens"])
         with self._lock:
             return self._total_input_tokens
 
     @property
     def total_output_tokens(self) -> int:
         """Total output tokens across all calls."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return int(shared["total_output_tokens"])
         with self._lock:
             return self._total_output_tokens
 
     @property
     def total_tokens(self) -> int:
         """Total tokens (input + output) across all calls."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return int(shared["total_tokens"])
         with self._lock:
             return self._total_input_tokens + self._total_output_tokens
 
     @property
     def total_cost_usd(self) -> float:
         """Total estimated cost in USD."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return float(shared["estimated_cost_usd"])
         with self._lock:
             return self._total_cost_usd
 
     @property
     def total_calls(self) -> int:
         """Total number of model calls."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return int(shared["total_calls"])
         with self._lock:
             return self._total_calls
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of usage across all agents."""
+        shared = self._shared_summary()
+        if shared is not None:
+            return {
+                **shared,
+                "estimated_cost_usd": round(shared["estimated_cost_usd"], 6),
+            }
         with self._lock:
             return {
                 "total_calls": self._total_calls,
@@ -155,8 +243,7 @@ class UsageTracker:
         budget = _get_token_budget()
         if budget <= 0:
             return False
-        with self._lock:
-            return (self._total_input_tokens + self._total_output_tokens) > budget
+        return self.total_tokens > budget
 
     def reset(self) -> None:
         """Reset all tracked metrics."""
@@ -169,6 +256,48 @@ class UsageTracker:
             self._per_agent_input.clear()
             self._per_agent_output.clear()
             self._per_agent_calls.clear()
+        self._shared_view = None
+        if self.shared is not None:
+            self.shared.delete(_SHARED_TOTALS_KEY)
+
+
+_SHARED_TOTALS_KEY = "totals"
+# How stale the shared usage view may get on the event loop.
+_SHARED_REFRESH_SECONDS = 1.0
+
+
+def _add_call(
+    totals: dict[str, Any] | None, metrics: ModelCallMetrics | None
+) -> dict[str, Any]:
+    """Add one call to a :meth:`UsageTracker.get_summary`-shaped dict."""
+    totals = totals or {
+        "total_calls": 0,
+        "total_input_tokens": 0,
+        "total_output_tokens": 0,
+        "total_tokens": 0,
+        "estimated_cost_usd": 0.0,
+        "per_agent": {},
+    }
+    if metrics is None:
+        return totals
+    per_agent = dict(totals["per_agent"])
+    agent = per_agent.get(
+        metrics.agent_name, {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+    )
+    per_agent[metrics.agent_name] = {
+        "calls": agent["calls"] + 1,
+        "input_tokens": agent["input_tokens"] + metrics.input_tokens,
+        "output_tokens": agent["output_tokens"] + metrics.output_tokens,
+    }
+    tokens = metrics.input_tokens + metrics.output_tokens
+    return {
+        "total_calls": totals["total_calls"] + 1,
+        "total_input_tokens": totals["total_input_tokens"] + metrics.input_tokens,
+        "total_output_tokens": totals["total_output_tokens"] + metrics.output_tokens,
+        "total_tokens": totals["total_tokens"] + tokens,
+        "estimated_cost_usd": totals["estimated_cost_usd"] + metrics.estimated_cost_usd,
+        "per_agent": per_agent,
+    }
 
 
 # Module-level singleton
@@ -182,7 +311,10 @@ def get_usage_tracker() -> UsageTracker:
     if _usage_tracker is None:
         with _tracker_lock:
             if _usage_tracker is None:
-                _usage_tracker = UsageTracker()
+                from sre_agent.core.shared_state import get_shared_store
+
+                store = get_shared_store("model_usage")
+                _usage_tracker = UsageTracker(shared=store if store.is_shared else None)
     return _usage_tracker
 
 
@@ -227,6 +359,7 @@ def _estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     return input_cost + output_cost
 
 
+@attributed("callback:before_model")
 def before_model_callback(
     callback_context: CallbackContext,
     llm_request: LlmRequest,
@@ -426,6 +559,7 @@ def _compact_llm_contents(contents: list[genai_types.Content]) -> str:
     return result
 
 
+@attributed("callback:after_model")
 def after_model_callback(
     callback_context: CallbackContext,
     llm_response: LlmResponse,
@@ -3,12 +3,19 @@
 Implements the safety layer that intercepts and validates tool calls
 before execution. Note: Currently in experimental mode; rejections are
 disabled to gather data, but warnings and approval requests are still generated.
+
+``TOOL_POLICIES`` and the tool configuration are compiled into an immutable
+decision table, so evaluating a call is a dict lookup that returns a
+pre-built, frozen ``PolicyDecision``. Only write and admin tools run the
+argument-dependent risk predicates in ``RISK_RULES``.
 """
 
 import logging
 import threading
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -708,8 +715,148 @@ TOOL_POLICIES: dict[str, ToolPolicy] = {
 }
 
 
+# Argument-dependent risk rules, applied to write and admin tools only. Each
+# predicate inspects the raw tool arguments; decisions for every combination
+# of matching rules are built when the policy table is compiled.
+RiskPredicate = Callable[[dict[str, Any]], bool]
+
+
+def _force_enabled(tool_args: dict[str, Any]) -> bool:
+    return "force" in tool_args and bool(tool_args.get("force"))
+
+
+def _mentions_all(value: Any) -> bool:
+    """Whether ``"all"`` appears in any key or scalar value of ``value``."""
+    if isinstance(value, dict):
+        return any(_mentions_all(k) or _mentions_all(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(_mentions_all(v) for v in value)
+    return "all" in str(value).lower()
+
+
+RISK_RULES: tuple[tuple[str, RiskPredicate], ...] = (
+    ("Force flag enabled - bypasses safety checks", _force_enabled),
+    ("Operation may affect multiple resources", _mentions_all),
+)
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """Pre-built decisions for one tool.
+
+    Read-only tools resolve to ``decision`` directly. Write and admin tools
+    resolve to an entry of ``risk_decisions``, indexed by a bitmask of the
+    ``RISK_RULES`` that match the call's arguments.
+    """
+
+    policy: ToolPolicy
+    enabled: bool
+    decision: PolicyDecision | None = None
+    risk_decisions: tuple[PolicyDecision, ...] = ()
+
+    def resolve(self, tool_args: dict[str, Any]) -> PolicyDecision:
+        """Return the decision for a call with ``tool_args``."""
+        if self.decision is not None:
+            return self.decision
+        mask = 0
+        for bit, (_, predicate) in enumerate(RISK_RULES):
+            if predicate(tool_args):
+                mask |= 1 << bit
+        return self.risk_decisions[mask]
+
+
+@dataclass(frozen=True)
+class PolicyTable:
+    """Immutable decision table indexed by tool name."""
+
+    entries: Mapping[str, CompiledPolicy]
+    config_version: Any = None
+
+
+def _format_risk_assessment(policy: ToolPolicy, factors: list[str]) -> str:
+    assessment = f"""
+Risk Assessment for {policy.name}:
+- Category: {policy.category.value}
+- Description: {policy.description}
+- Factors: {"; ".join(factors)}
+- Recommendation: Review arguments carefully before approval
+"""
+    return assessment.strip()
+
+
+def compile_policy(policy: ToolPolicy, enabled: bool = True) -> CompiledPolicy:
+    """Pre-build every decision a call to ``policy.name`` can produce.
+
+    Args:
+        policy: Tool policy.
+        enabled: Whether the tool is enabled in the tool configuration.
+
+    Returns:
+        The compiled policy.
+    """
+    if policy.access_level == ToolAccessLevel.READ_ONLY:
+        reason = "Read-only operation - allowed."
+        if not enabled:
+            reason += " (allowing anyway as policy checks are disabled)"
+        decision = PolicyDecision(
+            tool_name=policy.name,
+            allowed=True,
+            requires_approval=False,
+            reason=reason,
+            access_level=policy.access_level,
+        )
+        return CompiledPolicy(policy=policy, enabled=enabled, decision=decision)
+
+    if policy.access_level == ToolAccessLevel.WRITE:
+        reason = f"Write operation requires human approval. Risk: {policy.risk_level}"
+    else:  # ADMIN
+        # Admin tools are now allowed but require approval for safety
+        reason = (
+            f"Admin operation allowed (Policy checks disabled). {policy.description}"
+        )
+
+    risk_decisions = []
+    for mask in range(1 << len(RISK_RULES)):
+        factors = [f"Base risk level: {policy.risk_level}"]
+        factors.extend(
+            label for bit, (label, _) in enumerate(RISK_RULES) if mask & (1 << bit)
+        )
+        risk_decisions.append(
+            PolicyDecision(
+                tool_name=policy.name,
+                allowed=True,
+                requires_approval=True,
+                reason=reason,
+                access_level=policy.access_level,
+                risk_assessment=_format_risk_assessment(policy, factors),
+            )
+        )
+    return CompiledPolicy(
+        policy=policy, enabled=enabled, risk_decisions=tuple(risk_decisions)
+    )
+
+
+def _get_tool_config_manager() -> Any | None:
+    try:
+        from sre_agent.tools.config import get_tool_config_manager
+
+        return get_tool_config_manager()
+    except ImportError:
+        # Fallback if tools package is not available (e.g. minimal core tests)
+        logger.debug("Tools config manager not available, skipping enabled checks")
+    except Exception as e:
+        logger.warning(f"Error loading tool configuration: {e}")
+    return None
+
+
 class PolicyEngine:
-    """Evaluates tool calls against security policies."""
+    """Evaluates tool calls against security policies.
+
+    Policies and the tool configuration are compiled into a
+    :class:`PolicyTable` of pre-built decisions. The table is rebuilt when
+    the tool configuration version changes (a tool is enabled or disabled)
+    or after :meth:`invalidate`.
+    """
 
     def __init__(self, policies: dict[str, ToolPolicy] | None = None) -> None:
         """Initialize the policy engine.
@@ -718,11 +865,72 @@ class PolicyEngine:
             policies: Optional custom policies (defaults to TOOL_POLICIES)
         """
         self.policies = policies or TOOL_POLICIES
+        self._table: PolicyTable | None = None
+        self._manager: Any | None = None
+        self._compile_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Exclude the lock and the compiled table from pickling."""
+        state = self.__dict__.copy()
+        state.pop("_compile_lock", None)
+        state.pop("_table", None)
+        state.pop("_manager", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore state; the table is recompiled on the next evaluation."""
+        self.__dict__.update(state)
+        self._table = None
+        self._manager = None
+        self._compile_lock = threading.Lock()
 
     def get_policy(self, tool_name: str) -> ToolPolicy | None:
         """Get the policy for a tool."""
         return self.policies.get(tool_name)
 
+    def invalidate(self) -> None:
+        """Drop the compiled table; it is rebuilt on the next evaluation."""
+        self._table = None
+
+    def _config_version(self) -> Any:
+        manager = self._manager
+        if manager is None:
+            return None
+        try:
+            return manager.version
+        except Exception:
+            return None
+
+    def compile(self) -> PolicyTable:
+        """Build the decision table from the policies and tool configuration."""
+        with self._compile_lock:
+            manager = _get_tool_config_manager()
+            self._manager = manager
+            version = self._config_version()
+            entries: dict[str, CompiledPolicy] = {}
+            for name, policy in self.policies.items():
+                enabled = True
+                if manager is not None:
+                    try:
+                        enabled = bool(manager.is_enabled(name))
+                    except Exception as e:
+                        logger.warning(
+                            f"Error checking tool configuration for {name}: {e}"
+                        )
+                entries[name] = compile_policy(policy, enabled)
+            table = PolicyTable(
+                entries=MappingProxyType(entries), config_version=version
+            )
+            self._table = table
+            logger.debug(f"Compiled policy table with {len(entries)} tools")
+            return table
+
+    def _get_table(self) -> PolicyTable:
+        table = self._table
+        if table is None or table.config_version != self._config_version():
+            table = self.compile()
+        return table
+
     def evaluate(
         self,
         tool_name: str,
@@ -741,10 +949,10 @@ class PolicyEngine:
         Returns:
             PolicyDecision indicating whether the call is allowed
         """
-        policy = self.get_policy(tool_name)
+        compiled = self._get_table().entries.get(tool_name)
 
         # Unknown tools are allowed by default (Warning only)
-        if policy is None:
+        if compiled is None:
             logger.warning(f"Unknown tool: {tool_name} - allowing by default")
             return PolicyDecision(
                 tool_name=tool_name,
@@ -755,69 +963,19 @@ class PolicyEngine:
             )
 
         # Check if project context requirement (Warning only in loose mode)
-        if policy.requires_project_context and not project_id:
+        if compiled.policy.requires_project_context and not project_id:
             logger.warning(
                 f"Tool {tool_name} requires project context but none provided. Proceeding anyway as requested."
             )
             # We used to reject here, but removing the check as requested by user.
 
-        # Dynamic Tool Filtering: Check if tool is disabled in config
-        manager = None
-        try:
-            from sre_agent.tools.config import get_tool_config_manager
-
-            manager = get_tool_config_manager()
-            if not manager.is_enabled(tool_name):
-                logger.info(
-                    f"Tool {tool_name} is disabled in configuration - allowing anyway as policy checks are disabled"
-                )
-        except ImportError:
-            # Fallback if tools package is not available (e.g. minimal core tests)
-            logger.debug(
-                f"Tools config manager not available, skipping enabled check for {tool_name}"
+        # Dynamic Tool Filtering: disabled tools are still allowed for now
+        if not compiled.enabled:
+            logger.info(
+                f"Tool {tool_name} is disabled in configuration - allowing anyway as policy checks are disabled"
             )
-        except Exception as e:
-            logger.warning(f"Error checking tool configuration for {tool_name}: {e}")
-
-        # Evaluate based on access level
-        if policy.access_level == ToolAccessLevel.READ_ONLY:
-            reason = "Read-only operation - allowed."
-            try:
-                if manager and not manager.is_enabled(tool_name):
-                    reason += " (allowing anyway as policy checks are disabled)"
-            except Exception:
-                pass
 
-            return PolicyDecision(
-                tool_name=tool_name,
-                allowed=True,
-                requires_approval=False,
-                reason=reason,
-                access_level=policy.access_level,
-            )
-
-        elif policy.access_level == ToolAccessLevel.WRITE:
-            risk_assessment = self._assess_risk(tool_name, tool_args, policy)
-            return PolicyDecision(
-                tool_name=tool_name,
-                allowed=True,
-                requires_approval=True,
-                reason=f"Write operation requires human approval. Risk: {policy.risk_level}",
-                access_level=policy.access_level,
-                risk_assessment=risk_assessment,
-            )
-
-        else:  # ADMIN
-            # Admin tools are now allowed but require approval for safety
-            risk_assessment = self._assess_risk(tool_name, tool_args, policy)
-            return PolicyDecision(
-                tool_name=tool_name,
-                allowed=True,
-                requires_approval=True,
-                reason=f"Admin operation allowed (Policy checks disabled). {policy.description}",
-                access_level=policy.access_level,
-                risk_assessment=risk_assessment,
-            )
+        return compiled.resolve(tool_args)
 
     def _assess_risk(
         self, tool_name: str, tool_args: dict[str, Any], policy: ToolPolicy
@@ -832,27 +990,9 @@ class PolicyEngine:
         Returns:
             Risk assessment string
         """
-        risk_factors = []
-
-        # Base risk from policy
-        risk_factors.append(f"Base risk level: {policy.risk_level}")
-
-        # Check for dangerous arguments
-        if "force" in tool_args and tool_args.get("force"):
-            risk_factors.append("Force flag enabled - bypasses safety checks")
-
-        if "all" in str(tool_args).lower():
-            risk_factors.append("Operation may affect multiple resources")
-
-        # Build assessment
-        assessment = f"""
-Risk Assessment for {tool_name}:
-- Category: {policy.category.value}
-- Description: {policy.description}
-- Factors: {"; ".join(risk_factors)}
-- Recommendation: Review arguments carefully before approval
-"""
-        return assessment.strip()
+        factors = [f"Base risk level: {policy.risk_level}"]
+        factors.extend(label for label, predicate in RISK_RULES if predicate(tool_args))
+        return _format_risk_assessment(policy, factors)
 
     def get_tools_by_category(self, category: ToolCategory) -> list[str]:
         """Get all tool names in a category."""
@@ -34,6 +34,7 @@ class DomainContext:
     investigation_phase: str | None = None
     custom_constraints: list[str] = field(default_factory=list)
     mistake_lessons: str | None = None
+    telemetry_sources: str | None = None
 
 
 @dataclass
@@ -155,6 +156,12 @@ For every investigation step:
                     "All queries must target this project unless explicitly requested otherwise."
                 )
 
+            # Known BigQuery telemetry sources (from the telemetry catalog)
+            if domain_context.telemetry_sources:
+                context_parts.append(
+                    f"### Telemetry Sources\n{domain_context.telemetry_sources}"
+                )
+
             # Active alerts
             if domain_context.active_alerts:
                 alerts_text = "\n".join(
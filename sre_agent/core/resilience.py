@@ -0,0 +1,454 @@
+"""Adaptive concurrency limits and per-project quotas for GCP backends.
+
+Circuit breakers (:mod:`sre_agent.core.circuit_breaker`) react after a
+backend has failed.  This module keeps the agent from overloading backends
+in the first place:
+
+- Each backend API gets an :class:`AdaptiveConcurrencyLimiter` using AIMD:
+  the in-flight limit grows by one per window of fast successful calls and
+  shrinks multiplicatively on quota errors, timeouts or slow calls.
+- Each ``(backend, project)`` pair gets a :class:`TokenBucket` modelling the
+  Cloud API per-project request quota, so the agent throttles itself
+  instead of collecting 429s.
+
+:class:`GuardedClient` applies both around every API method of a GAPIC client
+and is returned by :mod:`sre_agent.tools.clients.factory`.  Calls rejected
+locally raise :class:`BackendOverloadedError`.
+
+Configuration (environment variables):
+    SRE_AGENT_ADAPTIVE_LIMITS: Set to ``false`` to disable client guarding.
+    SRE_AGENT_QUOTA_QPS_<BACKEND>: Per-project requests/second for a backend,
+        e.g. ``SRE_AGENT_QUOTA_QPS_LOGGING=2``.
+"""
+
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .circuit_breaker import ErrorClass, classify_error
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_RE = re.compile(r"projects/([^/]+)")
+_REQUEST_PROJECT_FIELDS = ("name", "parent", "project_id", "project_name")
+
+# Error classes that mean the backend wants us to send less.
+_OVERLOAD_ERROR_CLASSES = frozenset(
+    {ErrorClass.QUOTA, ErrorClass.TIMEOUT, ErrorClass.UNAVAILABLE}
+)
+
+# Client methods that issue API requests.
+_API_METHOD_PREFIXES = (
+    "list_",
+    "get_",
+    "query_",
+    "batch_",
+    "search_",
+    "create_",
+    "update_",
+    "delete_",
+    "tail_",
+    "write_",
+)
+_NON_API_METHODS = frozenset({"get_mtls_endpoint_and_cert_source"})
+
+
+class BackendOverloadedError(Exception):
+    """Raised when a call is rejected locally by a quota or concurrency limit."""
+
+    def __init__(
+        self,
+        backend: str,
+        project: str | None,
+        reason: str,
+        retry_after_seconds: float,
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            backend: Backend API name.
+            project: Project the call targeted, if known.
+            reason: Which limit rejected the call.
+            retry_after_seconds: Suggested wait before retrying.
+        """
+        self.backend = backend
+        self.project = project
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"Backend '{backend}' throttled locally for project "
+            f"'{project or '*'}' ({reason}). Retry after {retry_after_seconds:.1f}s."
+        )
+
+
+@dataclass(frozen=True)
+class AdaptiveLimitConfig:
+    """AIMD parameters for a backend's concurrency limit.
+
+    Attributes:
+        initial_limit: In-flight calls allowed before any feedback.
+        min_limit: Floor for the limit.
+        max_limit: Ceiling for the limit.
+        latency_target_ms: Calls slower than this count as overload.
+        backoff_ratio: Multiplier applied to the limit on overload.
+        decrease_cooldown_seconds: Minimum time between two decreases, so a
+            burst of errors from one overload episode backs off only once.
+        acquire_timeout_seconds: Maximum wait for a free slot.
+    """
+
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 64
+    latency_target_ms: float = 5000.0
+    backoff_ratio: float = 0.7
+    decrease_cooldown_seconds: float = 1.0
+    acquire_timeout_seconds: float = 30.0
+
+
+@dataclass(frozen=True)
+class QuotaConfig:
+    """Per-project request quota of a backend.
+
+    Attributes:
+        requests_per_second: Sustained request rate.
+        burst: Bucket capacity.
+    """
+
+    requests_per_second: float
+    burst: float
+
+
+# Approximate per-project read quotas of the Cloud APIs the agent calls.
+DEFAULT_QUOTAS: dict[str, QuotaConfig] = {
+    "logging": QuotaConfig(requests_per_second=1.0, burst=10),
+    "monitoring": QuotaConfig(requests_per_second=50.0, burst=100),
+    "cloudtrace": QuotaConfig(requests_per_second=5.0, burst=30),
+    "clouderrorreporting": QuotaConfig(requests_per_second=10.0, burst=20),
+}
+_FALLBACK_QUOTA = QuotaConfig(requests_per_second=20.0, burst=40)
+
+
+def quota_for(backend: str) -> QuotaConfig:
+    """Return the quota for ``backend``, honouring environment overrides."""
+    default = DEFAULT_QUOTAS.get(backend, _FALLBACK_QUOTA)
+    override = os.environ.get(f"SRE_AGENT_QUOTA_QPS_{backend.upper()}")
+    if not override:
+        return default
+    try:
+        rate = float(override)
+    except ValueError:
+        logger.warning(f"Ignoring invalid quota override for {backend}: {override}")
+        return default
+    return QuotaConfig(requests_per_second=rate, burst=max(default.burst, rate))
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate_per_second: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_second: Refill rate.
+            capacity: Maximum tokens.
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_take(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` if available.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds until they
+            will be available (nothing is taken).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            if self.rate <= 0:
+                return float("inf")
+            return (tokens - self._tokens) / self.rate
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter for one backend."""
+
+    def __init__(self, name: str, config: AdaptiveLimitConfig | None = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            name: Backend name, for logs and stats.
+            config: AIMD parameters.
+        """
+        self.name = name
+        self.config = config or AdaptiveLimitConfig()
+        self._limit = float(self.config.initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return max(self.config.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting."""
+        with self._cond:
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait up to ``timeout`` seconds for a slot."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._in_flight < self.limit, timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency_ms: float, overloaded: bool = False) -> None:
+        """Return a slot and adjust the limit from the call's outcome.
+
+        Args:
+            latency_ms: Duration of the call.
+            overloaded: Whether the backend signalled overload (429, timeout).
+        """
+        cfg = self.config
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if overloaded or latency_ms > cfg.latency_target_ms:
+                now = time.monotonic()
+                if now - self._last_decrease >= cfg.decrease_cooldown_seconds:
+                    self._last_decrease = now
+                    self._limit = max(
+                        float(cfg.min_limit), self._limit * cfg.backoff_ratio
+                    )
+                    logger.info(
+                        f"Concurrency limit for '{self.name}' decreased to "
+                        f"{self.limit} (overloaded={overloaded}, "
+                        f"latency={latency_ms:.0f}ms)"
+                    )
+            else:
+                # Additive increase: +1 per window of `limit` successes.
+                self._limit = min(
+                    float(cfg.max_limit), self._limit + 1.0 / max(self._limit, 1.0)
+                )
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        """Return limiter state for status endpoints."""
+        return {"limit": self.limit, "in_flight": self._in_flight}
+
+
+class ResilienceManager:
+    """Owns the per-backend limiters and per-project quota buckets."""
+
+    def __init__(
+        self,
+        limit_config: AdaptiveLimitConfig | None = None,
+        max_quota_wait_seconds: float = 2.0,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            limit_config: AIMD parameters shared by all backends.
+            max_quota_wait_seconds: Longest a call waits for quota before
+                being rejected with :class:`BackendOverloadedError`.
+        """
+        self.limit_config = limit_config or AdaptiveLimitConfig()
+        self.max_quota_wait_seconds = max_quota_wait_seconds
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, backend: str) -> AdaptiveConcurrencyLimiter:
+        """Return the limiter of ``backend``."""
+        limiter = self._limiters.get(backend)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.setdefault(
+                    backend, AdaptiveConcurrencyLimiter(backend, self.limit_config)
+                )
+        return limiter
+
+    def bucket(self, backend: str, project: str | None) -> TokenBucket:
+        """Return the quota bucket of ``backend`` in ``project``."""
+        key = (backend, project or "*")
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            quota = quota_for(backend)
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    key, TokenBucket(quota.requests_per_second, quota.burst)
+                )
+        return bucket
+
+    def _take_quota(self, backend: str, project: str | None) -> None:
+        bucket = self.bucket(backend, project)
+        deadline = time.monotonic() + self.max_quota_wait_seconds
+        while True:
+            wait = bucket.try_take()
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                raise BackendOverloadedError(backend, project, "quota", wait)
+            time.sleep(wait)
+
+    @contextmanager
+    def guard(self, backend: str, project: str | None) -> Iterator[None]:
+        """Run the enclosed backend call under quota and concurrency limits.
+
+        Blocks; call from worker threads, as the GCP clients are used.
+
+        Raises:
+            BackendOverloadedError: If quota or a concurrency slot is not
+                available in time.
+        """
+        self._take_quota(backend, project)
+        limiter = self.limiter(backend)
+        if not limiter.acquire(self.limit_config.acquire_timeout_seconds):
+            raise BackendOverloadedError(
+                backend,
+                project,
+                f"concurrency limit {limiter.limit}",
+                self.limit_config.acquire_timeout_seconds,
+            )
+        start = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except Exception as e:
+            overloaded = classify_error(e) in _OVERLOAD_ERROR_CLASSES
+            raise
+        finally:
+            limiter.release((time.monotonic() - start) * 1000, overloaded)
+
+    def stats(self) -> dict[str, Any]:
+        """Return limiter state per backend."""
+        return {name: lim.stats() for name, lim in sorted(self._limiters.items())}
+
+
+def _request_fields(candidate: Any) -> list[tuple[str, Any]]:
+    if isinstance(candidate, str):
+        return [("", candidate)]
+    if isinstance(candidate, list | tuple):
+        return [("", value) for value in candidate]
+    if isinstance(candidate, dict):
+        get = candidate.get
+    else:
+        get = functools.partial(getattr, candidate)
+    fields = [(f, get(f, None)) for f in _REQUEST_PROJECT_FIELDS]
+    return fields + [("", v) for v in get("resource_names", None) or []]
+
+
+def project_from_request(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+    """Best-effort extraction of the target project from a GAPIC call."""
+    fields: list[tuple[str, Any]] = []
+    for candidate in (kwargs.get("request"), *args):
+        if candidate is not None:
+            fields += _request_fields(candidate)
+    fields += [(f, kwargs.get(f)) for f in _REQUEST_PROJECT_FIELDS]
+    fields += [("", v) for v in kwargs.get("resource_names") or []]
+    for field_name, value in fields:
+        if not isinstance(value, str) or not value:
+            continue
+        match = _PROJECT_RE.search(value)
+        if match:
+            return match.group(1)
+        if field_name == "project_id":
+            return value
+    return None
+
+
+class GuardedClient:
+    """Proxy applying :meth:`ResilienceManager.guard` to a client's API calls."""
+
+    def __init__(
+        self,
+        client: Any,
+        backend: str,
+        manager: ResilienceManager | None = None,
+    ) -> None:
+        """Wrap ``client``.
+
+        Args:
+            client: GAPIC client instance.
+            backend: Backend name used for limits and quotas.
+            manager: Manager to use; the process-wide one by default.
+        """
+        self._client = client
+        self._backend = backend
+        self._manager = manager
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying client."""
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the client, guarding API methods."""
+        attr = getattr(self._client, name)
+        if (
+            not callable(attr)
+            or not name.startswith(_API_METHOD_PREFIXES)
+            or name in _NON_API_METHODS
+        ):
+            return attr
+        return self._guarded(attr)
+
+    def _guarded(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            manager = self._manager or get_resilience_manager()
+            with manager.guard(self._backend, project_from_request(args, kwargs)):
+                return method(*args, **kwargs)
+
+        return call
+
+
+def is_adaptive_limiting_enabled() -> bool:
+    """Whether GCP clients are wrapped in :class:`GuardedClient`."""
+    return os.environ.get("SRE_AGENT_ADAPTIVE_LIMITS", "true").lower() != "false"
+
+
+_manager: ResilienceManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_resilience_manager() -> ResilienceManager:
+    """Return the process-wide resilience manager."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ResilienceManager()
+    return _manager
+
+
+def reset_resilience_manager() -> None:
+    """Drop the process-wide manager (for testing)."""
+    global _manager
+    with _manager_lock:
+        _manager = None
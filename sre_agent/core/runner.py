@@ -9,9 +9,9 @@ import logging
 import os
 import time
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
 from google.adk.agents import BaseAgent, LlmAgent
 from google.adk.events import Event, EventActions
@@ -42,6 +42,8 @@ from sre_agent.core.prompt_composer import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class RunnerConfig:
@@ -150,6 +152,14 @@ class Runner:
         self._active_executions = {}
         self._executions_lock = asyncio.Lock()
 
+    async def _call_approvals(
+        self, method: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Call the approval manager, in a thread if its store does I/O."""
+        if self.approval_manager.is_shared:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
     async def run_turn(
         self,
         session: Session,
@@ -219,7 +229,9 @@ class Runner:
                 enhanced_message = user_message
 
             # Step 3: Check for pending approvals
-            pending = self.approval_manager.get_pending_requests(session_id)
+            pending = await self._call_approvals(
+                self.approval_manager.get_pending_requests, session_id
+            )
             if pending:
                 yield self._create_approval_pending_event(pending)
                 return
@@ -379,6 +391,10 @@ class Runner:
                 context_block.append(f"Project: {domain_context.project_id}")
             if domain_context.investigation_phase:
                 context_block.append(f"Phase: {domain_context.investigation_phase}")
+            if domain_context.telemetry_sources:
+                context_block.append(
+                    f"Telemetry sources:\n{domain_context.telemetry_sources}"
+                )
             if context_block:
                 parts.append("[DOMAIN CONTEXT]\n" + "\n".join(context_block))
 
@@ -570,7 +586,8 @@ This operation is not allowed. Please use a read-only alternative or request ele
         """Create event for approval request."""
         from google.genai import types
 
-        request = self.approval_manager.create_request(
+        request = await self._call_approvals(
+            self.approval_manager.create_request,
             session_id=exec_ctx.session_id,
             user_id=exec_ctx.user_id,
             tool_name=decision.tool_name,
@@ -663,7 +680,8 @@ Please approve or reject this operation to continue.
             True if processed successfully
         """
         try:
-            self.approval_manager.process_decision(
+            await self._call_approvals(
+                self.approval_manager.process_decision,
                 session_id=session_id,
                 request_id=request_id,
                 approved=approved,
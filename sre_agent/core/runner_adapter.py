@@ -107,9 +107,13 @@ class RunnerAgentAdapter(LlmAgent):
                 InvestigationState.from_dict(inv_state_dict) if inv_state_dict else None
             )
 
+            from sre_agent.services.telemetry_catalog import get_telemetry_catalog
+
+            sources = get_telemetry_catalog().peek(project_id) if project_id else None
             domain_ctx = DomainContext(
                 project_id=project_id,
                 investigation_phase=inv_state.phase.value if inv_state else None,
+                telemetry_sources=sources.describe() if sources else None,
             )
 
             async for event in self.runner.run_turn(
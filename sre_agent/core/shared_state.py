@@ -0,0 +1,698 @@
+"""State shared between uvicorn workers.
+
+``server.py`` runs ``WEB_CONCURRENCY`` worker processes, but caches, token
+validations, circuit breakers, usage counters and approval requests used to
+live in process-global dicts. Each worker saw a fraction of the cache hits,
+repeated token validation and backend queries, and could disagree with its
+siblings about open circuits or pending approvals (an approval created on
+one worker could not be decided on another).
+
+:class:`SharedStore` is a namespaced key-value interface with TTLs and an
+atomic read-modify-write (:meth:`SharedStore.update`). Values must be
+JSON-compatible and are treated as immutable: write changes back with
+``set``/``update`` rather than mutating what ``get`` returned.
+
+Backends (``SRE_AGENT_SHARED_STATE``):
+
+- ``memory`` (default): :class:`InProcessStore`, one dict per process.
+  Behaves like the previous globals.
+- ``sqlite``: :class:`SQLiteStore` on ``SRE_AGENT_SHARED_STATE_PATH``,
+  shared by every worker on the host. Writes go through the group-committing
+  writer of :mod:`sre_agent.core.local_db`, whose ``BEGIN IMMEDIATE``
+  transactions make ``update`` atomic across processes.
+- ``shm``: ``sqlite`` on a file in ``/dev/shm``, i.e. RAM-backed shared
+  memory for a single host, without disk I/O.
+- ``kv``: :class:`KVStore` on a network key-value service
+  (``SRE_AGENT_SHARED_STATE_URL``, Redis protocol), shared across hosts.
+  Tests use :class:`FakeKVClient`.
+
+Consumers keep a local tier where reads are hot and consult the shared
+store only when :attr:`SharedStore.is_shared` is true. Store calls block
+(SQLite group commit, network round trips), so code on the event loop
+either awaits them through ``asyncio.to_thread`` or, where eventual
+consistency is enough, hands them to :func:`run_in_background` /
+:meth:`SharedStore.update_in_background` and serves a local view.
+
+Usage::
+
+    store = get_shared_store("approvals")
+    store.set("key", {"a": 1}, ttl_seconds=60)
+    store.update("counter", lambda v: (v or 0) + 1)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+_MAX_CAS_RETRIES = 50
+
+
+def _expiry(ttl_seconds: float | None) -> float | None:
+    return None if ttl_seconds is None else time.time() + ttl_seconds
+
+
+def on_event_loop() -> bool:
+    """Whether the caller runs on a thread with a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+_background: ThreadPoolExecutor | None = None
+_background_lock = threading.Lock()
+
+
+def run_in_background(fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+    """Run blocking store I/O on the shared-state thread, in submission order.
+
+    Failures are logged, not raised.
+    """
+    global _background
+    if _background is None:
+        with _background_lock:
+            if _background is None:
+                _background = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="shared-state"
+                )
+    future = _background.submit(fn, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def wait_for_background(timeout: float | None = 5.0) -> None:
+    """Block until work already passed to :func:`run_in_background` is done."""
+    if _background is not None:
+        _background.submit(lambda: None).result(timeout)
+
+
+class SharedStore(ABC):
+    """Namespaced key-value store with TTLs and atomic updates."""
+
+    #: Whether other worker processes see this store's writes.
+    is_shared: bool = True
+
+    def __init__(self, namespace: str) -> None:
+        """Initialize a view of one namespace."""
+        self.namespace = namespace
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the live value of ``key``, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``, optionally expiring."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        """Atomically replace the value of ``key`` with ``fn(current)``.
+
+        ``fn`` may run more than once on optimistic backends and must not have
+        side effects. Returning None deletes the key; raising aborts the
+        update and propagates.
+
+        Returns:
+            The new value.
+        """
+
+    @abstractmethod
+    def keys(self) -> list[str]:
+        """Return the live keys of the namespace."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every key of the namespace."""
+
+    def update_in_background(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """:meth:`update` without waiting for it when called on the event loop.
+
+        Process-local stores, and callers off the loop, update synchronously.
+        """
+        if self.is_shared and on_event_loop():
+            run_in_background(self.update, key, fn, ttl_seconds)
+        else:
+            self.update(key, fn, ttl_seconds)
+
+    def incr(
+        self, key: str, amount: float = 1, ttl_seconds: float | None = None
+    ) -> float:
+        """Atomically add ``amount`` to a numeric value and return the result."""
+        result = self.update(key, lambda v: (v or 0) + amount, ttl_seconds)
+        return float(result or 0)
+
+
+# ── In-process ───────────────────────────────────────────────────────
+
+
+class InProcessStore(SharedStore):
+    """Process-local store; values are kept by reference, not serialized."""
+
+    is_shared = False
+
+    def __init__(self, namespace: str = "") -> None:
+        """Initialize an empty namespace."""
+        super().__init__(namespace)
+        self._data: dict[str, tuple[float | None, Any]] = {}
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Exclude the lock from pickling (agents are deep-copied on deploy)."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore state and re-create the lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _live(self, key: str, now: float) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and now >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Any | None:
+        """Return the live value of ``key``."""
+        with self._lock:
+            return self._live(key, time.time())
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``."""
+        with self._lock:
+            self._data[key] = (_expiry(ttl_seconds), value)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        """Apply ``fn`` under the store lock."""
+        with self._lock:
+            value = fn(self._live(key, time.time()))
+            if value is None:
+                self._data.pop(key, None)
+            else:
+                self._data[key] = (_expiry(ttl_seconds), value)
+            return value
+
+    def keys(self) -> list[str]:
+        """Return the live keys."""
+        now = time.time()
+        with self._lock:
+            return [k for k in list(self._data) if self._live(k, now) is not None]
+
+    def clear(self) -> None:
+        """Remove every key."""
+        with self._lock:
+            self._data.clear()
+
+
+# ── SQLite (single host) ─────────────────────────────────────────────
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS shared_state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+_UPSERT_SQL = """
+INSERT INTO shared_state (namespace, key, value, expires_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(namespace, key) DO UPDATE SET
+    value = excluded.value,
+    expires_at = excluded.expires_at
+"""
+
+_LIVE = "(expires_at IS NULL OR expires_at > ?)"
+
+# Expired rows are purged after this many writes through one store.
+_PURGE_EVERY = 512
+
+
+def _log_failure(future: "Future[Any]") -> None:
+    if future.exception() is not None:
+        logger.warning(f"Shared state operation failed: {future.exception()}")
+
+
+class SQLiteStore(SharedStore):
+    """Store backed by a SQLite file shared by the workers of one host."""
+
+    def __init__(self, namespace: str, path: str) -> None:
+        """Open (and create if needed) the shared-state table in ``path``."""
+        from sre_agent.core.local_db import get_local_database
+
+        super().__init__(namespace)
+        self.path = path
+        self._db = get_local_database(path)
+        self._db.write(lambda conn: conn.execute(_CREATE_TABLE_SQL))
+        self._writes = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the live value of ``key``."""
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                "SELECT value FROM shared_state "
+                f"WHERE namespace = ? AND key = ? AND {_LIVE}",
+                (self.namespace, key, time.time()),
+            ).fetchall()
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Queue an upsert; it commits with the writer's next batch.
+
+        The write is not awaited, so an immediate ``get`` may still miss it;
+        use :meth:`update` when the caller must read its own write.
+        """
+        row = (self.namespace, key, json.dumps(value), _expiry(ttl_seconds))
+        self._db.submit(lambda conn: conn.execute(_UPSERT_SQL, row)).add_done_callback(
+            _log_failure
+        )
+        self._count_write()
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        self._db.write(
+            lambda conn: conn.execute(
+                "DELETE FROM shared_state WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+        )
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        """Apply ``fn`` inside one write transaction."""
+
+        def job(conn: Any) -> Any | None:
+            row = conn.execute(
+                "SELECT value FROM shared_state "
+                f"WHERE namespace = ? AND key = ? AND {_LIVE}",
+                (self.namespace, key, time.time()),
+            ).fetchone()
+            value = fn(json.loads(row[0]) if row else None)
+            if value is None:
+                conn.execute(
+                    "DELETE FROM shared_state WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+            else:
+                conn.execute(
+                    _UPSERT_SQL,
+                    (self.namespace, key, json.dumps(value), _expiry(ttl_seconds)),
+                )
+            return value
+
+        result = self._db.write(job)
+        self._count_write()
+        return result
+
+    def keys(self) -> list[str]:
+        """Return the live keys."""
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                f"SELECT key FROM shared_state WHERE namespace = ? AND {_LIVE}",
+                (self.namespace, time.time()),
+            ).fetchall()
+        )
+        return [row[0] for row in rows]
+
+    def clear(self) -> None:
+        """Remove every key of the namespace."""
+        self._db.write(
+            lambda conn: conn.execute(
+                "DELETE FROM shared_state WHERE namespace = ?", (self.namespace,)
+            )
+        )
+
+    def _count_write(self) -> None:
+        self._writes += 1
+        if self._writes % _PURGE_EVERY == 0:
+            now = time.time()
+            self._db.submit(
+                lambda conn: conn.execute(
+                    "DELETE FROM shared_state WHERE expires_at <= ?", (now,)
+                )
+            ).add_done_callback(_log_failure)
+
+
+# ── Network key-value service ────────────────────────────────────────
+
+
+class KVClient(Protocol):
+    """Minimal client for a network key-value service."""
+
+    def get(self, key: str) -> str | None:
+        """Return the raw value of ``key``."""
+        ...
+
+    def set(self, key: str, value: str, ttl_seconds: float | None) -> None:
+        """Store a raw value."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        ...
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: str | None,
+        value: str | None,
+        ttl_seconds: float | None,
+    ) -> bool:
+        """Replace ``key`` (None deletes) only if it still equals ``expected``."""
+        ...
+
+    def scan(self, prefix: str) -> list[str]:
+        """Return the keys starting with ``prefix``."""
+        ...
+
+
+class FakeKVClient:
+    """In-memory :class:`KVClient` standing in for the network service in tests.
+
+    Attributes:
+        requests: Number of calls made, i.e. the load on the service.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty keyspace."""
+        self._data: dict[str, tuple[float | None, str]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _live(self, key: str) -> str | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] is not None and time.time() >= entry[0]:
+            del self._data[key]
+            return None
+        return entry[1]
+
+    def get(self, key: str) -> str | None:
+        """Return the raw value of ``key``."""
+        with self._lock:
+            self.requests += 1
+            return self._live(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float | None) -> None:
+        """Store a raw value."""
+        with self._lock:
+            self.requests += 1
+            self._data[key] = (_expiry(ttl_seconds), value)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        with self._lock:
+            self.requests += 1
+            self._data.pop(key, None)
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: str | None,
+        value: str | None,
+        ttl_seconds: float | None,
+    ) -> bool:
+        """Replace ``key`` only if it still equals ``expected``."""
+        with self._lock:
+            self.requests += 1
+            if self._live(key) != expected:
+                return False
+            if value is None:
+                self._data.pop(key, None)
+            else:
+                self._data[key] = (_expiry(ttl_seconds), value)
+            return True
+
+    def scan(self, prefix: str) -> list[str]:
+        """Return the live keys starting with ``prefix``."""
+        with self._lock:
+            self.requests += 1
+            return [
+                k
+                for k in list(self._data)
+                if k.startswith(prefix) and self._live(k) is not None
+            ]
+
+
+class RedisKVClient:
+    """:class:`KVClient` for a Redis-protocol service (requires ``redis``)."""
+
+    def __init__(self, url: str) -> None:
+        """Connect to ``url`` (e.g. ``redis://10.0.0.3:6379/0``)."""
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "SRE_AGENT_SHARED_STATE=kv requires the 'redis' package"
+            ) from e
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> str | None:
+        """Return the raw value of ``key``."""
+        value: str | None = self._redis.get(key)
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: float | None) -> None:
+        """Store a raw value."""
+        px = int(ttl_seconds * 1000) if ttl_seconds is not None else None
+        self._redis.set(key, value, px=px)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        self._redis.delete(key)
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: str | None,
+        value: str | None,
+        ttl_seconds: float | None,
+    ) -> bool:
+        """Replace ``key`` under ``WATCH``; False if it changed meanwhile."""
+        import redis
+
+        with self._redis.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) != expected:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                if value is None:
+                    pipe.delete(key)
+                else:
+                    px = int(ttl_seconds * 1000) if ttl_seconds is not None else None
+                    pipe.set(key, value, px=px)
+                pipe.execute()
+                return True
+            except redis.WatchError:
+                return False
+
+    def scan(self, prefix: str) -> list[str]:
+        """Return the keys starting with ``prefix``."""
+        return list(self._redis.scan_iter(match=f"{prefix}*"))
+
+
+class KVStore(SharedStore):
+    """Store on a network key-value service, shared across hosts."""
+
+    def __init__(self, namespace: str, client: KVClient) -> None:
+        """Initialize a namespace view over ``client``."""
+        super().__init__(namespace)
+        self._client = client
+        self._prefix = f"sre_agent:{namespace}:"
+
+    def get(self, key: str) -> Any | None:
+        """Return the live value of ``key``."""
+        raw = self._client.get(self._prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``."""
+        self._client.set(self._prefix + key, json.dumps(value), ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key``."""
+        self._client.delete(self._prefix + key)
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        """Apply ``fn`` with optimistic compare-and-set retries.
+
+        Raises:
+            RuntimeError: If the key kept changing for too many attempts.
+        """
+        full_key = self._prefix + key
+        for _ in range(_MAX_CAS_RETRIES):
+            raw = self._client.get(full_key)
+            value = fn(None if raw is None else json.loads(raw))
+            new_raw = None if value is None else json.dumps(value)
+            if self._client.compare_and_set(full_key, raw, new_raw, ttl_seconds):
+                return value
+        raise RuntimeError(f"Contention updating shared state key {full_key}")
+
+    def keys(self) -> list[str]:
+        """Return the live keys of the namespace."""
+        return [k[len(self._prefix) :] for k in self._client.scan(self._prefix)]
+
+    def clear(self) -> None:
+        """Remove every key of the namespace."""
+        for key in self._client.scan(self._prefix):
+            self._client.delete(key)
+
+
+# ── Configuration and access ─────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class SharedStateConfig:
+    """Shared state backend selection.
+
+    Attributes:
+        backend: ``memory``, ``sqlite``, ``shm`` or ``kv``.
+        path: SQLite file for the ``sqlite`` backend (the ``shm`` backend
+            places the same file name under ``/dev/shm``).
+        url: Service URL for the ``kv`` backend.
+    """
+
+    backend: str = "memory"
+    path: str = ".sre_agent_shared_state.db"
+    url: str = ""
+
+    @classmethod
+    def from_env(cls) -> "SharedStateConfig":
+        """Build a config from ``SRE_AGENT_SHARED_STATE*`` variables."""
+        return cls(
+            backend=os.environ.get("SRE_AGENT_SHARED_STATE", "memory").lower(),
+            path=os.environ.get(
+                "SRE_AGENT_SHARED_STATE_PATH", ".sre_agent_shared_state.db"
+            ),
+            url=os.environ.get("SRE_AGENT_SHARED_STATE_URL", ""),
+        )
+
+
+_stores: dict[str, SharedStore] = {}
+_stores_lock = threading.Lock()
+_config: SharedStateConfig | None = None
+_kv_client: KVClient | None = None
+
+
+def _create_store(namespace: str, config: SharedStateConfig) -> SharedStore:
+    global _kv_client
+    if config.backend == "sqlite":
+        return SQLiteStore(namespace, config.path)
+    if config.backend == "shm":
+        return SQLiteStore(
+            namespace, os.path.join("/dev/shm", os.path.basename(config.path))
+        )
+    if config.backend == "kv":
+        if _kv_client is None:
+            _kv_client = RedisKVClient(config.url)
+        return KVStore(namespace, _kv_client)
+    if config.backend != "memory":
+        logger.warning(f"Unknown shared state backend {config.backend!r}; using memory")
+    return InProcessStore(namespace)
+
+
+def get_shared_store(namespace: str) -> SharedStore:
+    """Get the process-wide store for ``namespace`` on the configured backend.
+
+    A backend that cannot be opened falls back to in-process state, so a
+    misconfigured backend degrades to the old per-worker behavior instead of
+    failing requests.
+    """
+    store = _stores.get(namespace)
+    if store is None:
+        global _config
+        with _stores_lock:
+            store = _stores.get(namespace)
+            if store is None:
+                if _config is None:
+                    _config = SharedStateConfig.from_env()
+                try:
+                    store = _create_store(namespace, _config)
+                except Exception as e:
+                    logger.warning(
+                        f"Shared state backend {_config.backend!r} unavailable "
+                        f"for {namespace}: {e}; using in-process state"
+                    )
+                    store = InProcessStore(namespace)
+                _stores[namespace] = store
+    return store
+
+
+def configure_shared_state(
+    config: SharedStateConfig, kv_client: KVClient | None = None
+) -> None:
+    """Select the backend explicitly (e.g. a :class:`FakeKVClient` in tests).
+
+    Stores created earlier are dropped; consumers that already hold one keep
+    using it.
+    """
+    global _config, _kv_client
+    with _stores_lock:
+        _config = config
+        _kv_client = kv_client
+        _stores.clear()
+
+
+def reset_shared_state() -> None:
+    """Forget the configured backend and its stores (for testing)."""
+    global _config, _kv_client
+    wait_for_background()
+    with _stores_lock:
+        _config = None
+        _kv_client = None
+        _stores.clear()
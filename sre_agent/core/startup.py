@@ -0,0 +1,457 @@
+"""Startup orchestration: warm a replica before it takes traffic.
+
+A fresh replica used to make its first request pay for everything at once:
+building the agents and their tool sets, compiling the intent classifier's
+keyword patterns, creating the GCP clients, importing Drain3, initializing
+the memory and session services and loading tool configs. ``/health``
+reported healthy immediately, so autoscaled instances received traffic while
+still cold.
+
+:class:`StartupOrchestrator` runs named warm-up tasks during the FastAPI
+lifespan. Each task starts as soon as the tasks it depends on have
+succeeded, independent tasks run concurrently (synchronous ones in worker
+threads), and every task has its own timeout. A task whose dependency failed
+is skipped. :meth:`StartupOrchestrator.readiness` reports progress for the
+``/ready`` endpoint, which returns 503 until every required task has
+finished; ``/health`` stays a pure liveness check.
+
+Warm state (telemetry catalog entries) can be snapshotted to
+``SRE_AGENT_WARM_STATE_PATH`` on shutdown and restored on the next boot.
+
+Usage::
+
+    orchestrator = get_startup_orchestrator()
+    orchestrator.start()          # in a startup handler
+    orchestrator.readiness()      # {"ready": False, "progress": 0.4, ...}
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class TaskState(str, Enum):
+    """Lifecycle of a warm-up task."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    SKIPPED = "skipped"
+
+
+_FINISHED = frozenset(
+    {TaskState.READY, TaskState.FAILED, TaskState.TIMED_OUT, TaskState.SKIPPED}
+)
+
+
+@dataclass
+class WarmUpTask:
+    """A named unit of startup work.
+
+    Attributes:
+        name: Unique task name.
+        run: Zero-argument callable or coroutine function. Synchronous
+            callables run in a worker thread.
+        depends_on: Tasks that must succeed before this one starts.
+        timeout_seconds: Time allowed for the task; ``None`` uses the
+            orchestrator default.
+        required: Whether readiness waits for this task to succeed. Optional
+            tasks only improve latency; their failure is reported but does
+            not keep the replica unready.
+    """
+
+    name: str
+    run: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+    timeout_seconds: float | None = None
+    required: bool = True
+    state: TaskState = TaskState.PENDING
+    duration_seconds: float | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class StartupConfig:
+    """Startup orchestration settings.
+
+    Attributes:
+        enabled: Run warm-up tasks at startup. When disabled the replica is
+            ready immediately.
+        task_timeout_seconds: Default per-task timeout.
+        snapshot_path: JSON file for the warm-state snapshot; empty disables
+            snapshotting.
+        snapshot_max_age_seconds: Snapshots older than this are ignored.
+    """
+
+    enabled: bool = True
+    task_timeout_seconds: float = 60.0
+    snapshot_path: str = ""
+    snapshot_max_age_seconds: float = 86400.0
+
+    @classmethod
+    def from_env(cls) -> "StartupConfig":
+        """Build a config from ``SRE_AGENT_WARM_*`` variables."""
+        return cls(
+            enabled=os.environ.get("SRE_AGENT_WARM_UP", "true").lower() == "true",
+            task_timeout_seconds=float(
+                os.environ.get("SRE_AGENT_WARM_UP_TIMEOUT_SECONDS", "60")
+            ),
+            snapshot_path=os.environ.get("SRE_AGENT_WARM_STATE_PATH", ""),
+            snapshot_max_age_seconds=float(
+                os.environ.get("SRE_AGENT_WARM_STATE_MAX_AGE_SECONDS", "86400")
+            ),
+        )
+
+
+class StartupOrchestrator:
+    """Runs dependency-ordered warm-up tasks and tracks readiness."""
+
+    def __init__(self, config: StartupConfig | None = None) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            config: Settings (defaults from the environment).
+        """
+        self.config = config or StartupConfig.from_env()
+        self.tasks: dict[str, WarmUpTask] = {}
+        self._run_task: asyncio.Task[None] | None = None
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    def add(self, task: WarmUpTask) -> None:
+        """Register a task.
+
+        Raises:
+            ValueError: If the name is taken, or a dependency is unknown.
+        """
+        if task.name in self.tasks:
+            raise ValueError(f"Warm-up task {task.name!r} is already registered")
+        missing = [dep for dep in task.depends_on if dep not in self.tasks]
+        if missing:
+            # Requiring dependencies first also rules out cycles.
+            raise ValueError(
+                f"Warm-up task {task.name!r} depends on unknown tasks {missing}"
+            )
+        self.tasks[task.name] = task
+
+    # ── Running ──────────────────────────────────────────────────────
+
+    def start(self) -> asyncio.Task[None]:
+        """Run the tasks in the background of the running event loop."""
+        if self._run_task is None:
+            self._run_task = asyncio.create_task(self.run())
+        return self._run_task
+
+    async def run(self) -> None:
+        """Run every task, each as soon as its dependencies have succeeded."""
+        self._started_at = time.monotonic()
+        done: dict[str, asyncio.Event] = {name: asyncio.Event() for name in self.tasks}
+
+        async def run_one(task: WarmUpTask) -> None:
+            try:
+                for dep in task.depends_on:
+                    await done[dep].wait()
+                failed = [
+                    dep
+                    for dep in task.depends_on
+                    if self.tasks[dep].state != TaskState.READY
+                ]
+                if failed:
+                    task.state = TaskState.SKIPPED
+                    task.error = f"dependencies did not succeed: {failed}"
+                    return
+                await self._execute(task)
+            finally:
+                done[task.name].set()
+
+        try:
+            await asyncio.gather(*(run_one(task) for task in self.tasks.values()))
+        finally:
+            self._finished_at = time.monotonic()
+        readiness = self.readiness()
+        logger.info(
+            f"Startup warm-up finished in {readiness['elapsed_seconds']:.2f}s "
+            f"(ready={readiness['ready']})"
+        )
+
+    async def _execute(self, task: WarmUpTask) -> None:
+        timeout = task.timeout_seconds or self.config.task_timeout_seconds
+        task.state = TaskState.RUNNING
+        start = time.monotonic()
+        try:
+            if inspect.iscoroutinefunction(task.run):
+                await asyncio.wait_for(task.run(), timeout)
+            else:
+                # A timed-out thread keeps running; only the wait is abandoned.
+                await asyncio.wait_for(asyncio.to_thread(task.run), timeout)
+        except asyncio.TimeoutError:
+            task.state = TaskState.TIMED_OUT
+            task.error = f"timed out after {timeout:.0f}s"
+            logger.warning(f"Warm-up task {task.name} timed out after {timeout}s")
+        except Exception as e:
+            task.state = TaskState.FAILED
+            task.error = str(e)
+            logger.warning(f"Warm-up task {task.name} failed: {e}")
+        else:
+            task.state = TaskState.READY
+            logger.debug(
+                f"Warm-up task {task.name} done in {time.monotonic() - start:.2f}s"
+            )
+        finally:
+            task.duration_seconds = time.monotonic() - start
+
+    async def stop(self) -> None:
+        """Cancel tasks that are still running (on shutdown)."""
+        if self._run_task is not None and not self._run_task.done():
+            self._run_task.cancel()
+            try:
+                await self._run_task
+            except asyncio.CancelledError:
+                pass
+
+    # ── Readiness ────────────────────────────────────────────────────
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every required task has succeeded."""
+        return all(
+            task.state == TaskState.READY
+            for task in self.tasks.values()
+            if task.required
+        )
+
+    def readiness(self) -> dict[str, Any]:
+        """Return readiness and per-task progress for the ``/ready`` endpoint."""
+        finished = sum(task.state in _FINISHED for task in self.tasks.values())
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.monotonic()) - self._started_at
+        return {
+            "ready": self.is_ready,
+            "progress": finished / len(self.tasks) if self.tasks else 1.0,
+            "elapsed_seconds": round(elapsed, 3),
+            "tasks": {
+                task.name: {
+                    "state": task.state.value,
+                    "required": task.required,
+                    "duration_seconds": (
+                        None
+                        if task.duration_seconds is None
+                        else round(task.duration_seconds, 3)
+                    ),
+                    "error": task.error,
+                }
+                for task in self.tasks.values()
+            },
+        }
+
+
+# ── Warm state snapshot ──────────────────────────────────────────────
+
+
+def load_warm_state(path: str, max_age_seconds: float) -> dict[str, Any] | None:
+    """Read a warm-state snapshot, ignoring missing, stale or foreign files."""
+    try:
+        with open(path) as f:
+            state: dict[str, Any] = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable warm-state snapshot {path}: {e}")
+        return None
+    if state.get("version") != SNAPSHOT_VERSION:
+        return None
+    if time.time() - float(state.get("written_at", 0)) > max_age_seconds:
+        logger.info(f"Ignoring stale warm-state snapshot {path}")
+        return None
+    return state
+
+
+def restore_warm_state(config: StartupConfig) -> int:
+    """Prime in-memory caches from the snapshot.
+
+    Returns:
+        Number of telemetry catalog entries restored.
+    """
+    if not config.snapshot_path:
+        return 0
+    state = load_warm_state(config.snapshot_path, config.snapshot_max_age_seconds)
+    if state is None:
+        return 0
+    from sre_agent.services.telemetry_catalog import get_telemetry_catalog
+
+    restored = get_telemetry_catalog().prime(state.get("telemetry_catalog", []))
+    logger.info(f"Restored {restored} telemetry catalog entries from snapshot")
+    return restored
+
+
+def save_warm_state(config: StartupConfig) -> bool:
+    """Write the warm-state snapshot, atomically.
+
+    Returns:
+        Whether a snapshot was written.
+    """
+    if not config.snapshot_path:
+        return False
+    from sre_agent.services import telemetry_catalog
+
+    # Don't create a catalog just to snapshot it.
+    catalog = telemetry_catalog._catalog
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "written_at": time.time(),
+        "telemetry_catalog": catalog.snapshot() if catalog is not None else [],
+    }
+    tmp_path = f"{config.snapshot_path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, config.snapshot_path)
+    except OSError as e:
+        logger.warning(f"Failed to write warm-state snapshot: {e}")
+        return False
+    return True
+
+
+# ── Default tasks ────────────────────────────────────────────────────
+
+
+def _compile_intent_classifier() -> None:
+    from sre_agent.council.intent_classifier import (
+        _compile_keyword_patterns,
+        classify_routing,
+    )
+
+    _compile_keyword_patterns()
+    classify_routing("why is checkout latency high")
+
+
+def _create_gcp_clients() -> None:
+    from sre_agent.tools.clients.factory import (
+        get_alert_policy_client,
+        get_logging_client,
+        get_monitoring_client,
+        get_trace_client,
+    )
+
+    get_trace_client()
+    get_logging_client()
+    get_monitoring_client()
+    get_alert_policy_client()
+
+
+def _load_log_pattern_miner() -> None:
+    from sre_agent.tools.analysis.logs.patterns import LogPatternExtractor
+
+    LogPatternExtractor().add_log("warm-up request 42 took 3ms")
+
+
+def _start_tool_pool() -> None:
+    from sre_agent.tools.common.execution import get_tool_process_pool
+
+    pool = get_tool_process_pool()
+    if pool is not None:
+        pool.warm_up(
+            (
+                "sre_agent.tools.analysis.logs.patterns",
+                "sre_agent.tools.analysis.metrics.anomaly_detection",
+            )
+        )
+
+
+def _warm_sandbox_workers() -> None:
+    from sre_agent.tools.sandbox.executor import is_local_execution_enabled
+
+    if not is_local_execution_enabled():
+        return
+    from sre_agent.tools.sandbox.worker_pool import get_local_worker_pool
+
+    get_local_worker_pool().warm()
+
+
+def _init_memory() -> None:
+    from sre_agent.memory.factory import get_adk_memory_service, get_memory_manager
+
+    get_memory_manager()
+    get_adk_memory_service()
+
+
+def _init_session_service() -> None:
+    from sre_agent.services.session import get_session_service
+
+    get_session_service()
+
+
+def _load_tool_configs() -> None:
+    from sre_agent.tools.config import get_tool_config_manager
+
+    get_tool_config_manager()
+
+
+async def _build_agents() -> None:
+    from sre_agent.core.agent_registry import get_agent_registry
+
+    registry = get_agent_registry()
+    await registry.awarm_up()
+    if registry.failures:
+        raise RuntimeError(f"agents failed to build: {sorted(registry.failures)}")
+
+
+def default_warm_up_tasks(config: StartupConfig) -> list[WarmUpTask]:
+    """The SRE Agent's warm-up tasks, in dependency order."""
+    return [
+        WarmUpTask("warm_state", lambda: restore_warm_state(config), required=False),
+        WarmUpTask("tool_configs", _load_tool_configs),
+        WarmUpTask("intent_classifier", _compile_intent_classifier),
+        WarmUpTask("gcp_clients", _create_gcp_clients),
+        WarmUpTask("log_patterns", _load_log_pattern_miner, required=False),
+        WarmUpTask("tool_pool", _start_tool_pool, required=False),
+        WarmUpTask("sandbox_workers", _warm_sandbox_workers, required=False),
+        WarmUpTask("memory", _init_memory),
+        WarmUpTask("session_service", _init_session_service),
+        WarmUpTask(
+            "agents",
+            _build_agents,
+            depends_on=("tool_configs",),
+            timeout_seconds=max(config.task_timeout_seconds, 180.0),
+        ),
+    ]
+
+
+_orchestrator: StartupOrchestrator | None = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_startup_orchestrator() -> StartupOrchestrator:
+    """Get the process-wide orchestrator with the default tasks registered."""
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                orchestrator = StartupOrchestrator()
+                if orchestrator.config.enabled:
+                    for task in default_warm_up_tasks(orchestrator.config):
+                        orchestrator.add(task)
+                _orchestrator = orchestrator
+    return _orchestrator
+
+
+def reset_startup_orchestrator() -> None:
+    """Reset the singleton (for testing)."""
+    global _orchestrator
+    _orchestrator = None
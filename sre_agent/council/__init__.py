@@ -5,32 +5,49 @@ This package implements the Parallel Council architecture for the SRE Agent:
 - A critic agent for cross-critique of panel findings
 - A debate loop with confidence gating for convergence
 - Investigation modes: Fast, Standard, Debate
+
+Exports are resolved lazily (PEP 562): the panel tool sets import every
+analysis tool, which the router and mode classifier do not need.
 """
 
-from .critic import create_critic
-from .debate import create_debate_pipeline
-from .intent_classifier import (
-    ClassificationResult,
-    SignalType,
-    classify_intent,
-    classify_intent_with_signal,
-)
-from .mode_router import classify_investigation_mode
-from .panels import (
-    create_alerts_panel,
-    create_logs_panel,
-    create_metrics_panel,
-    create_trace_panel,
-)
-from .parallel_council import create_council_pipeline
-from .schemas import (
-    CouncilConfig,
-    CouncilResult,
-    CriticReport,
-    InvestigationMode,
-    PanelFinding,
-)
-from .synthesizer import create_synthesizer
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "ClassificationResult": (".intent_classifier", "ClassificationResult"),
+    "CouncilConfig": (".schemas", "CouncilConfig"),
+    "CouncilResult": (".schemas", "CouncilResult"),
+    "CriticReport": (".schemas", "CriticReport"),
+    "InvestigationMode": (".schemas", "InvestigationMode"),
+    "PanelFinding": (".schemas", "PanelFinding"),
+    "SignalType": (".intent_classifier", "SignalType"),
+    "classify_intent": (".intent_classifier", "classify_intent"),
+    "classify_intent_with_signal": (
+        ".intent_classifier",
+        "classify_intent_with_signal",
+    ),
+    "classify_investigation_mode": (".mode_router", "classify_investigation_mode"),
+    "create_alerts_panel": (".panels", "create_alerts_panel"),
+    "create_council_pipeline": (".parallel_council", "create_council_pipeline"),
+    "create_critic": (".critic", "create_critic"),
+    "create_debate_pipeline": (".debate", "create_debate_pipeline"),
+    "create_logs_panel": (".panels", "create_logs_panel"),
+    "create_metrics_panel": (".panels", "create_metrics_panel"),
+    "create_synthesizer": (".synthesizer", "create_synthesizer"),
+    "create_trace_panel": (".panels", "create_trace_panel"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy-load council symbols on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_path, __package__)
+        value = getattr(module, attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ClassificationResult",
@@ -6,10 +6,16 @@ Implements the debate investigation mode:
 3. Loop: critic → panels (re-analyze with feedback) → synthesizer
 4. Loop exits when confidence >= threshold or max iterations reached
 5. Convergence tracking records confidence progression per round
+
+Debate rounds are selective: only the panels the critic disputes re-run,
+the others carry their previous finding forward.  Read-only tool results
+are memoized per investigation, so re-run panels replay identical queries
+from the initial round instead of hitting the backends again.
 """
 
 import json
 import logging
+import re
 import time
 from typing import Any
 
@@ -25,8 +31,23 @@ from .panels import (
     create_trace_panel,
 )
 from .schemas import CouncilConfig
-from .state import COUNCIL_SYNTHESIS, CRITIC_REPORT, DEBATE_CONVERGENCE_HISTORY
+from .state import (
+    ALERTS_FINDING,
+    COUNCIL_SYNTHESIS,
+    CRITIC_REPORT,
+    DATA_FINDING,
+    DEBATE_CONVERGENCE_HISTORY,
+    DEBATE_DISPUTED_PANELS,
+    LOGS_FINDING,
+    METRICS_FINDING,
+    TRACE_FINDING,
+)
 from .synthesizer import create_synthesizer
+from .tool_memo import (
+    get_tool_result_memo,
+    memo_after_tool_callback,
+    memo_before_tool_callback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +55,74 @@ logger = logging.getLogger(__name__)
 # Re-export under the old name for backward compatibility with any external readers.
 CONVERGENCE_STATE_KEY = DEBATE_CONVERGENCE_HISTORY
 
+# Panel name → finding state key, in pipeline order.
+PANEL_FINDING_KEYS: dict[str, str] = {
+    "trace": TRACE_FINDING,
+    "metrics": METRICS_FINDING,
+    "logs": LOGS_FINDING,
+    "alerts": ALERTS_FINDING,
+    "data": DATA_FINDING,
+}
+
+# Fallback keyword routing for critic reports without ``disputed_panels``.
+_PANEL_KEYWORDS: dict[str, re.Pattern[str]] = {
+    "trace": re.compile(r"\btrac(e|es|ing)\b|\bspans?\b|latency", re.IGNORECASE),
+    "metrics": re.compile(
+        r"\bmetrics?\b|time.?series|\bslos?\b|\bcpu\b|memory", re.IGNORECASE
+    ),
+    "logs": re.compile(r"\blogs?\b|\blogging\b|log entr", re.IGNORECASE),
+    "alerts": re.compile(r"\balert|\bincidents?\b|\bpolic(y|ies)\b", re.IGNORECASE),
+    "data": re.compile(r"bigquery|\bsql\b|data panel|\bfleet\b", re.IGNORECASE),
+}
+
+
+def _load_critic(state: Any) -> dict[str, Any] | None:
+    """Return the critic report from state as a dict, or None."""
+    critic_raw = state.get(CRITIC_REPORT)
+    if critic_raw is None:
+        return None
+    if isinstance(critic_raw, dict):
+        return critic_raw
+    try:
+        critic = json.loads(critic_raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return critic if isinstance(critic, dict) else None
+
+
+def resolve_disputed_panels(critic: dict[str, Any]) -> set[str]:
+    """Determine which panels must re-run after a critic round.
+
+    Uses the critic's explicit ``disputed_panels`` when present. Otherwise
+    each gap/contradiction is routed to panels by keyword; an issue that
+    matches no panel disputes all of them, so nothing is silently dropped.
+
+    Args:
+        critic: Parsed critic report.
+
+    Returns:
+        Panel names from ``PANEL_FINDING_KEYS``; empty when there are no issues.
+    """
+    explicit = {
+        str(p).lower().removesuffix("_panel")
+        for p in critic.get("disputed_panels") or []
+    } & PANEL_FINDING_KEYS.keys()
+    if explicit:
+        return explicit
+
+    issues = [*critic.get("gaps", []), *critic.get("contradictions", [])]
+    disputed: set[str] = set()
+    for issue in issues:
+        matched = {
+            name
+            for name, pattern in _PANEL_KEYWORDS.items()
+            if pattern.search(str(issue))
+        }
+        if not matched:
+            return set(PANEL_FINDING_KEYS)
+        disputed |= matched
+    return disputed
+
 
 def _build_confidence_gate(
     config: CouncilConfig,
@@ -177,6 +266,9 @@ def _build_convergence_tracker(
             "round_duration_ms": round(round_duration_ms, 2),
             "threshold": config.confidence_threshold,
             "converged": confidence >= config.confidence_threshold,
+            "panels_rerun": list(
+                callback_context.state.get(DEBATE_DISPUTED_PANELS, [])
+            ),
         }
         history.append(round_record)
         callback_context.state[CONVERGENCE_STATE_KEY] = history
@@ -261,6 +353,96 @@ def _make_debate_round_callback(panel_name: str) -> Any:
     return inject_critic_context
 
 
+def _make_critic_context_injector(panel_name: str) -> Any:
+    """Return a ``before_model_callback`` that adds critic feedback to the request.
+
+    Appends the block built by :func:`_make_debate_round_callback` as a user
+    turn. Unlike returning it from a ``before_agent_callback`` — which ADK
+    treats as the agent's final response and skips the panel — the panel
+    still runs, now with the critic's points in its context.
+
+    Args:
+        panel_name: Human-readable panel identifier for log messages.
+
+    Returns:
+        A sync ``before_model_callback`` that always returns ``None``.
+    """
+    build_context = _make_debate_round_callback(panel_name)
+
+    def inject(callback_context: Any, llm_request: Any) -> None:
+        content = build_context(callback_context)
+        if content is not None:
+            content.role = "user"
+            llm_request.contents.append(content)
+        return None
+
+    return inject
+
+
+def _make_carry_forward_callback(panel_name: str, finding_key: str) -> Any:
+    """Return a ``before_agent_callback`` that skips undisputed debate panels.
+
+    A panel is skipped when the critic did not dispute it and it already has
+    a finding in state; that finding is carried forward unchanged to the
+    synthesizer.
+
+    Args:
+        panel_name: Panel name as used in ``PANEL_FINDING_KEYS``.
+        finding_key: State key holding the panel's finding.
+
+    Returns:
+        A sync ``before_agent_callback`` compatible with ADK ``LlmAgent``.
+    """
+
+    def carry_forward(callback_context: Any) -> genai_types.Content | None:
+        state = callback_context.state
+        disputed = state.get(DEBATE_DISPUTED_PANELS)
+        if disputed is None or panel_name in disputed:
+            return None
+        if state.get(finding_key) is None:
+            return None
+        logger.debug(f"[{panel_name}] Not disputed; carrying finding forward")
+        return genai_types.Content(
+            parts=[
+                genai_types.Part(
+                    text=f"{panel_name} panel finding carried forward (not disputed)."
+                )
+            ]
+        )
+
+    return carry_forward
+
+
+def _record_disputed_panels(callback_context: Any) -> None:
+    """``after_agent_callback`` for the critic: store the panels to re-run."""
+    critic = _load_critic(callback_context.state)
+    # Unparseable critic output: re-run everything rather than guess.
+    disputed = (
+        resolve_disputed_panels(critic)
+        if critic is not None
+        else set(PANEL_FINDING_KEYS)
+    )
+    callback_context.state[DEBATE_DISPUTED_PANELS] = sorted(disputed)
+    logger.info(f"Debate critic disputed panels: {sorted(disputed) or 'none'}")
+
+
+def _clear_tool_memo(callback_context: Any) -> None:
+    """``after_agent_callback`` for the pipeline: drop the investigation memo."""
+    invocation_id = getattr(callback_context, "invocation_id", None)
+    if isinstance(invocation_id, str):
+        get_tool_result_memo().clear(invocation_id)
+
+
+def _with_tool_memo(panel: Any) -> Any:
+    """Copy ``panel`` with tool-result memoization callbacks attached."""
+    return panel.model_copy(
+        update={
+            "before_tool_callback": memo_before_tool_callback,
+            "after_tool_callback": memo_after_tool_callback,
+        }
+    )
+
+
 def create_debate_pipeline(config: CouncilConfig | None = None) -> SequentialAgent:
     """Create the debate investigation pipeline.
 
@@ -268,7 +450,8 @@ def create_debate_pipeline(config: CouncilConfig | None = None) -> SequentialAge
     1. Initial parallel panel analysis → synthesis
     2. A LoopAgent that repeatedly:
        a. Runs the critic to cross-examine findings
-       b. Re-runs panels with critic feedback available in state
+       b. Re-runs the disputed panels with critic feedback; the others
+          carry their findings forward
        c. Re-synthesizes with updated findings
        Until confidence >= threshold or max_iterations reached.
 
@@ -286,55 +469,62 @@ def create_debate_pipeline(config: CouncilConfig | None = None) -> SequentialAge
         name="initial_panels",
         description="Initial parallel panel analysis before debate.",
         sub_agents=[
-            create_trace_panel(),
-            create_metrics_panel(),
-            create_logs_panel(),
-            create_alerts_panel(),
-            create_data_panel(),
+            _with_tool_memo(create_trace_panel()),
+            _with_tool_memo(create_metrics_panel()),
+            _with_tool_memo(create_logs_panel()),
+            _with_tool_memo(create_alerts_panel()),
+            _with_tool_memo(create_data_panel()),
         ],
     )
     initial_synthesizer = create_synthesizer()
 
-    # Build debate-round panels with critic-context injection callbacks.
-    # Each panel receives the critic's gaps/contradictions as a prefixed
-    # context block so it focuses re-investigation rather than blind re-querying.
+    # Debate-round panels: undisputed panels are skipped and keep their
+    # finding; disputed panels get the critic's gaps/contradictions injected
+    # into their model request so they re-investigate in a targeted way.
     def _debate_panel(factory: Any, name: str) -> Any:
-        panel = factory()
-        critic_cb = _make_debate_round_callback(name)
-        existing_cb = panel.before_agent_callback
-        if existing_cb is not None:
-
-            def composed(
-                ctx: Any, existing: Any = existing_cb, critic: Any = critic_cb
-            ) -> Any:
-                result = critic(ctx)
-                return result if result is not None else existing(ctx)
-
-            panel = panel.model_copy(update={"before_agent_callback": composed})
-        else:
-            panel = panel.model_copy(update={"before_agent_callback": critic_cb})
-        return panel
+        panel = _with_tool_memo(factory())
+        model_callbacks = [_make_critic_context_injector(name)]
+        existing = panel.before_model_callback
+        if isinstance(existing, list):
+            model_callbacks.extend(existing)
+        elif existing is not None:
+            model_callbacks.append(existing)
+        return panel.model_copy(
+            update={
+                "before_agent_callback": _make_carry_forward_callback(
+                    name, PANEL_FINDING_KEYS[name]
+                ),
+                "before_model_callback": model_callbacks,
+            }
+        )
+
+    critic = create_critic()
+    critic = critic.model_copy(update={"after_agent_callback": _record_disputed_panels})
 
-    # Debate loop: critic → re-run panels (with critic injection) → re-synthesize
+    # Debate loop: critic → re-run disputed panels → re-synthesize
     # Uses both before_agent_callback (confidence gate) and
     # after_agent_callback (convergence tracking) for full observability.
     debate_loop = LoopAgent(
         name="debate_loop",
         description=(
-            "Iterative debate: critic cross-examines, panels re-analyze with "
-            "targeted critic feedback, synthesizer re-evaluates until convergence."
+            "Iterative debate: critic cross-examines, disputed panels re-analyze "
+            "with targeted critic feedback, synthesizer re-evaluates until "
+            "convergence."
         ),
         sub_agents=[
-            create_critic(),
+            critic,
             ParallelAgent(
                 name="debate_panels",
                 description="Re-run panels focusing on critic-identified gaps/contradictions.",
                 sub_agents=[
-                    _debate_panel(create_trace_panel, "trace"),
-                    _debate_panel(create_metrics_panel, "metrics"),
-                    _debate_panel(create_logs_panel, "logs"),
-                    _debate_panel(create_alerts_panel, "alerts"),
-                    _debate_panel(create_data_panel, "data"),
+                    _debate_panel(factory, name)
+                    for factory, name in (
+                        (create_trace_panel, "trace"),
+                        (create_metrics_panel, "metrics"),
+                        (create_logs_panel, "logs"),
+                        (create_alerts_panel, "alerts"),
+                        (create_data_panel, "data"),
+                    )
                 ],
             ),
             create_synthesizer(),
@@ -352,4 +542,5 @@ def create_debate_pipeline(config: CouncilConfig | None = None) -> SequentialAge
             "iterative critique and re-analysis until convergence."
         ),
         sub_agents=[initial_panels, initial_synthesizer, debate_loop],
+        after_agent_callback=_clear_tool_memo,
     )
@@ -6,9 +6,14 @@ Composes a SequentialAgent that:
 
 The pipeline writes structured findings to session state via output_key,
 allowing the synthesizer to read all panel outputs.
+
+Panels run under per-panel wall-clock, token and tool-call budgets, and the
+synthesizer starts once a quorum of panels has reported (see
+:mod:`.scheduler`), so council latency is bounded by ``CouncilConfig``
+rather than by the slowest panel.
 """
 
-from google.adk.agents import ParallelAgent, SequentialAgent
+from google.adk.agents import SequentialAgent
 
 from .panels import (
     create_alerts_panel,
@@ -17,6 +22,11 @@ from .panels import (
     create_metrics_panel,
     create_trace_panel,
 )
+from .scheduler import (
+    BudgetedParallelAgent,
+    CouncilPipeline,
+    tool_budget_before_tool_callback,
+)
 from .schemas import CouncilConfig
 from .synthesizer import create_synthesizer
 
@@ -47,7 +57,9 @@ def create_council_pipeline(config: CouncilConfig | None = None) -> SequentialAg
     """Create the parallel council pipeline.
 
     The pipeline runs 5 specialist panels concurrently, then a synthesizer
-    that merges their findings into a CouncilResult.
+    that merges their findings into a CouncilResult. Each panel is bounded
+    by the config's panel budgets; the synthesizer starts on ``quorum``
+    findings and later findings are streamed as amendments.
 
     Args:
         config: Council configuration. Uses defaults if not provided.
@@ -58,32 +70,41 @@ def create_council_pipeline(config: CouncilConfig | None = None) -> SequentialAg
     if config is None:
         config = CouncilConfig()
 
-    # Create the 5 specialist panels
-    trace_panel = create_trace_panel()
-    metrics_panel = create_metrics_panel()
-    logs_panel = create_logs_panel()
-    alerts_panel = create_alerts_panel()
-    data_panel = create_data_panel()
+    # Create the 5 specialist panels; tool calls count against panel budgets.
+    trace_panel, metrics_panel, logs_panel, alerts_panel, data_panel = (
+        factory().model_copy(
+            update={"before_tool_callback": tool_budget_before_tool_callback}
+        )
+        for factory in (
+            create_trace_panel,
+            create_metrics_panel,
+            create_logs_panel,
+            create_alerts_panel,
+            create_data_panel,
+        )
+    )
 
-    # Run all panels in parallel
-    parallel_panels = ParallelAgent(
+    # Run all panels in parallel, each under its budget
+    parallel_panels = BudgetedParallelAgent(
         name="parallel_panels",
         description=(
             "Runs Trace, Metrics, Logs, Alerts, and Data panels concurrently. "
             "Each panel writes its PanelFinding to session state."
         ),
         sub_agents=[trace_panel, metrics_panel, logs_panel, alerts_panel, data_panel],
+        council_config=config,
     )
 
     # Synthesize findings
     synthesizer = create_synthesizer()
 
-    # Sequential: panels first, then synthesize
-    return SequentialAgent(
+    # Panels first, then synthesize (early once quorum is reached)
+    return CouncilPipeline(
         name="council_pipeline",
         description=(
             "Parallel council investigation pipeline. Runs 5 specialist "
             "panels concurrently, then synthesizes their findings."
         ),
         sub_agents=[parallel_panels, synthesizer],
+        council_config=config,
     )
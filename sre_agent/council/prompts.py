@@ -245,11 +245,14 @@ You MUST output a valid JSON object matching this schema:
   "agreements": ["<points where multiple panels converge>"],
   "contradictions": ["<conflicting findings between panels>"],
   "gaps": ["<missing analysis or uninvestigated signals>"],
+  "disputed_panels": ["<panels that must re-investigate: trace|metrics|logs|alerts|data>"],
   "revised_confidence": 0.0-1.0
 }}
 ```
 A contradiction between panels is MORE valuable than an agreement —
 it signals the need for deeper investigation.
+List in `disputed_panels` only the panels whose findings a gap or
+contradiction actually concerns; all other panels keep their findings.
 </output>
 """
 
@@ -0,0 +1,393 @@
+"""Deadline-aware panel scheduling for the parallel council.
+
+A plain ``ParallelAgent`` makes the synthesizer wait for every panel, so
+the slowest panel (typically a large BigQuery scan in the Data panel)
+sets the latency of the whole investigation.  The scheduler here bounds
+council latency by configuration instead:
+
+- Every panel gets a :class:`PanelBudget`: a wall-clock limit after which
+  it is cancelled, plus token and tool-call limits after which its tool
+  calls are refused so the model concludes with the evidence it has.
+- Once ``quorum`` panels have completed, the synthesizer starts after at
+  most ``quorum_grace_seconds``; stragglers keep running next to it until
+  their wall-clock limit.
+- Findings of panels that finish after the synthesizer started are
+  streamed as amendment events and recorded under ``COUNCIL_AMENDMENTS``.
+- The final status of every panel is written to ``COUNCIL_PANEL_STATUS``.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import Counter
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+from google.adk.agents import BaseAgent, ParallelAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.utils.context_utils import Aclosing
+from google.genai import types as genai_types
+
+from .schemas import CouncilConfig
+from .state import COUNCIL_AMENDMENTS, COUNCIL_PANEL_STATUS
+
+logger = logging.getLogger(__name__)
+
+
+class PanelStatus:
+    """Final status values recorded per panel in ``COUNCIL_PANEL_STATUS``."""
+
+    COMPLETED = "completed"
+    LATE = "late"
+    TIMED_OUT = "timed_out"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class PanelBudget:
+    """Resource limits applied to each council panel.
+
+    Attributes:
+        wall_clock_seconds: Time after which a running panel is cancelled.
+        max_tokens: LLM tokens after which the panel's tool calls are refused.
+        max_tool_calls: Tool calls a panel may make.
+    """
+
+    wall_clock_seconds: float
+    max_tokens: int
+    max_tool_calls: int
+
+    @classmethod
+    def from_config(cls, config: CouncilConfig) -> "PanelBudget":
+        """Derive panel budgets from a council configuration."""
+        return cls(
+            wall_clock_seconds=float(
+                min(config.panel_timeout_seconds, config.timeout_seconds)
+            ),
+            max_tokens=config.panel_max_tokens,
+            max_tool_calls=config.panel_max_tool_calls,
+        )
+
+
+@dataclass
+class _InvocationBudget:
+    max_tool_calls: int
+    calls: Counter[str] = field(default_factory=Counter)
+    exhausted: set[str] = field(default_factory=set)
+
+
+_budgets: dict[str, _InvocationBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def _register_budget(invocation_id: str, max_tool_calls: int) -> None:
+    with _budgets_lock:
+        _budgets[invocation_id] = _InvocationBudget(max_tool_calls)
+
+
+def _release_budget(invocation_id: str) -> None:
+    with _budgets_lock:
+        _budgets.pop(invocation_id, None)
+
+
+def _exhaust_budget(invocation_id: str, agent_name: str) -> None:
+    with _budgets_lock:
+        budget = _budgets.get(invocation_id)
+        if budget is not None:
+            budget.exhausted.add(agent_name)
+
+
+def tool_budget_before_tool_callback(
+    tool: Any,
+    args: dict[str, Any],
+    tool_context: Any,
+) -> dict[str, Any] | None:
+    """Refuse tool calls of panels that have used up their budget.
+
+    A no-op outside a scheduled council run.
+
+    Returns:
+        An error response (which skips the tool call), or None.
+    """
+    invocation_id = getattr(tool_context, "invocation_id", None)
+    agent_name = getattr(tool_context, "agent_name", None)
+    with _budgets_lock:
+        budget = _budgets.get(invocation_id) if invocation_id else None
+        if budget is None or not agent_name:
+            return None
+        if (
+            agent_name not in budget.exhausted
+            and budget.calls[agent_name] < budget.max_tool_calls
+        ):
+            budget.calls[agent_name] += 1
+            return None
+        budget.exhausted.add(agent_name)
+    logger.info(f"[{agent_name}] Panel budget exhausted; refusing {tool.name}")
+    return {
+        "status": "error",
+        "error": (
+            "Panel budget exhausted. Do not call more tools; report your "
+            "finding with the evidence gathered so far."
+        ),
+    }
+
+
+def _branch_context(
+    parent: BaseAgent, agent: BaseAgent, ctx: InvocationContext
+) -> InvocationContext:
+    """Isolated branch context for a panel, as ``ParallelAgent`` builds it."""
+    branch_ctx = ctx.model_copy()
+    suffix = f"{parent.name}.{agent.name}"
+    branch_ctx.branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+    return branch_ctx
+
+
+def _finding_summary(raw: Any) -> str:
+    finding = raw
+    if isinstance(raw, str):
+        try:
+            finding = json.loads(raw)
+        except json.JSONDecodeError:
+            return raw[:300]
+    if isinstance(finding, dict):
+        return str(finding.get("summary") or "")[:300]
+    return ""
+
+
+class PanelScheduler:
+    """Runs council panels under budgets, optionally with early synthesis."""
+
+    def __init__(
+        self,
+        owner: BaseAgent,
+        panels: list[BaseAgent],
+        config: CouncilConfig,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            owner: Agent on whose behalf events are emitted.
+            panels: Panel agents to run concurrently.
+            config: Council configuration supplying budgets and quorum.
+        """
+        self.owner = owner
+        self.panels = panels
+        self.config = config
+        self.budget = PanelBudget.from_config(config)
+        self.status: dict[str, str] = {}
+        self.tokens: Counter[str] = Counter()
+
+    async def _pump(
+        self,
+        source: str,
+        events: AsyncGenerator[Event, None],
+        queue: "asyncio.Queue[tuple[str, Event | None, asyncio.Event | None]]",
+        invocation_id: str,
+    ) -> None:
+        """Forward one agent's events, waiting for each to be consumed.
+
+        Like ``ParallelAgent``, an agent only continues once the runner has
+        persisted its previous event, so its next LLM call sees it.
+        """
+        try:
+            async with Aclosing(events) as agen:
+                async for event in agen:
+                    usage = event.usage_metadata
+                    if usage is not None and usage.total_token_count:
+                        self.tokens[source] += usage.total_token_count
+                        if self.tokens[source] >= self.budget.max_tokens:
+                            _exhaust_budget(invocation_id, source)
+                    resume = asyncio.Event()
+                    await queue.put((source, event, resume))
+                    await resume.wait()
+        except Exception as e:
+            logger.warning(f"Council agent {source} failed: {e}")
+            self.status[source] = PanelStatus.FAILED
+        finally:
+            queue.put_nowait((source, None, None))
+
+    def _amendment_event(self, ctx: InvocationContext, panel: BaseAgent) -> Event:
+        output_key = getattr(panel, "output_key", None)
+        raw = ctx.session.state.get(output_key) if output_key else None
+        record = {"panel": panel.name, "summary": _finding_summary(raw)}
+        amendments = [*ctx.session.state.get(COUNCIL_AMENDMENTS, []), record]
+        logger.info(f"Council amendment: late finding from {panel.name}")
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.owner.name,
+            branch=ctx.branch,
+            content=genai_types.Content(
+                role="model",
+                parts=[
+                    genai_types.Part(
+                        text=(
+                            f"Amendment: {panel.name} reported after synthesis "
+                            f"started. {record['summary']}"
+                        ).strip()
+                    )
+                ],
+            ),
+            actions=EventActions(state_delta={COUNCIL_AMENDMENTS: amendments}),
+        )
+
+    async def run(
+        self, ctx: InvocationContext, synthesizer: BaseAgent | None = None
+    ) -> AsyncGenerator[Event, None]:
+        """Run the panels, and the synthesizer once quorum or deadline allows.
+
+        Args:
+            ctx: Invocation context of the owning agent.
+            synthesizer: Agent started on a quorum of findings, or None to
+                only run the panels.
+
+        Yields:
+            Panel, synthesizer and amendment events, then a status event.
+        """
+        loop = asyncio.get_running_loop()
+        hard_deadline = loop.time() + self.budget.wall_clock_seconds
+        quorum = min(self.config.quorum, len(self.panels))
+        panels_by_name = {panel.name: panel for panel in self.panels}
+        queue: asyncio.Queue[tuple[str, Event | None, asyncio.Event | None]] = (
+            asyncio.Queue()
+        )
+        _register_budget(ctx.invocation_id, self.budget.max_tool_calls)
+
+        pending: dict[str, asyncio.Task[None]] = {
+            panel.name: asyncio.create_task(
+                self._pump(
+                    panel.name,
+                    panel.run_async(_branch_context(self.owner, panel, ctx)),
+                    queue,
+                    ctx.invocation_id,
+                )
+            )
+            for panel in self.panels
+        }
+        synth_name = synthesizer.name if synthesizer is not None else None
+        synth_task: asyncio.Task[None] | None = None
+        synth_running = synthesizer is not None
+        quorum_at: float | None = None
+        completed = 0
+        try:
+            while pending or synth_running:
+                now = loop.time()
+                if now >= hard_deadline and pending:
+                    for name, task in pending.items():
+                        task.cancel()
+                        self.status[name] = PanelStatus.TIMED_OUT
+                        logger.warning(
+                            f"Panel {name} cancelled after "
+                            f"{self.budget.wall_clock_seconds:g}s"
+                        )
+                    pending.clear()
+
+                if synthesizer is not None and synth_task is None:
+                    quorum_due = (
+                        quorum_at is not None
+                        and now >= quorum_at + self.config.quorum_grace_seconds
+                    )
+                    if not pending or quorum_due:
+                        if pending:
+                            logger.info(
+                                f"Council quorum reached ({completed}/"
+                                f"{len(self.panels)}); synthesizing while "
+                                f"{sorted(pending)} finish"
+                            )
+                        synth_task = asyncio.create_task(
+                            self._pump(
+                                synthesizer.name,
+                                synthesizer.run_async(ctx),
+                                queue,
+                                ctx.invocation_id,
+                            )
+                        )
+                wake: float | None = hard_deadline if pending else None
+                if synthesizer is not None and synth_task is None and quorum_at:
+                    grace_end = quorum_at + self.config.quorum_grace_seconds
+                    wake = grace_end if wake is None else min(wake, grace_end)
+                try:
+                    source, event, resume = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=None if wake is None else max(0.0, wake - now),
+                    )
+                except asyncio.TimeoutError:
+                    continue
+
+                if event is not None:
+                    yield event
+                    if resume is not None:
+                        resume.set()
+                    continue
+
+                # A source finished.
+                if source == synth_name:
+                    synth_running = False
+                    continue
+                if pending.pop(source, None) is None:
+                    continue  # already cancelled
+                if self.status.get(source) == PanelStatus.FAILED:
+                    continue
+                completed += 1
+                if quorum_at is None and completed >= quorum:
+                    quorum_at = loop.time()
+                if synth_task is None:
+                    self.status[source] = PanelStatus.COMPLETED
+                else:
+                    self.status[source] = PanelStatus.LATE
+                    yield self._amendment_event(ctx, panels_by_name[source])
+        finally:
+            for task in pending.values():
+                task.cancel()
+            if synth_task is not None:
+                synth_task.cancel()
+            _release_budget(ctx.invocation_id)
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.owner.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={COUNCIL_PANEL_STATUS: self.status}),
+        )
+
+
+class BudgetedParallelAgent(ParallelAgent):
+    """``ParallelAgent`` that enforces per-panel budgets.
+
+    Run on its own it waits for all panels or their wall-clock limit;
+    inside a :class:`CouncilPipeline` the pipeline drives it so the
+    synthesizer can start on a quorum of findings.
+    """
+
+    council_config: CouncilConfig = CouncilConfig()
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        scheduler = PanelScheduler(self, list(self.sub_agents), self.council_config)
+        async with Aclosing(scheduler.run(ctx)) as agen:
+            async for event in agen:
+                yield event
+
+
+class CouncilPipeline(SequentialAgent):
+    """Council pipeline of ``[BudgetedParallelAgent, synthesizer]``.
+
+    Starts the synthesizer as soon as a quorum of panels has completed
+    instead of after the slowest panel.
+    """
+
+    council_config: CouncilConfig = CouncilConfig()
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        panels_agent, synthesizer = self.sub_agents
+        scheduler = PanelScheduler(
+            panels_agent, list(panels_agent.sub_agents), self.council_config
+        )
+        async with Aclosing(scheduler.run(ctx, synthesizer)) as agen:
+            async for event in agen:
+                yield event
@@ -100,6 +100,14 @@ class CriticReport(BaseModel):
         default_factory=list,
         description="Missing analysis or uncovered areas.",
     )
+    disputed_panels: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Panels whose findings the gaps/contradictions call into question "
+            "('trace', 'metrics', 'logs', 'alerts', 'data'). Only these panels "
+            "re-run in the next debate round."
+        ),
+    )
     revised_confidence: float = Field(
         ge=0.0,
         le=1.0,
@@ -176,6 +184,39 @@ class CouncilConfig(BaseModel):
         le=600,
         description="Maximum wall-clock time for the investigation.",
     )
+    panel_timeout_seconds: int = Field(
+        default=60,
+        ge=5,
+        le=600,
+        description=(
+            "Wall-clock budget per panel; a panel still running after this "
+            "is cancelled. Capped by timeout_seconds."
+        ),
+    )
+    panel_max_tokens: int = Field(
+        default=200_000,
+        ge=1_000,
+        description="LLM token budget per panel before its tool calls are refused.",
+    )
+    panel_max_tool_calls: int = Field(
+        default=15,
+        ge=1,
+        description="Tool-call budget per panel.",
+    )
+    quorum: int = Field(
+        default=3,
+        ge=1,
+        le=5,
+        description="Completed panels needed before synthesis may start early.",
+    )
+    quorum_grace_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        description=(
+            "How long to keep waiting for the remaining panels once quorum "
+            "is reached; later findings are streamed as amendments."
+        ),
+    )
 
 
 # =============================================================================
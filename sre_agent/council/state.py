@@ -48,6 +48,14 @@ ALL_PANEL_FINDING_KEYS: tuple[str, ...] = (
 COUNCIL_SYNTHESIS: str = "council_synthesis"
 """Session state key written by the synthesizer agent."""
 
+COUNCIL_PANEL_STATUS: str = "council_panel_status"
+"""Session state key mapping each panel agent name to its final scheduling
+status (completed, late, timed_out or failed)."""
+
+COUNCIL_AMENDMENTS: str = "council_amendments"
+"""Session state key holding findings of panels that completed after the
+synthesizer had started."""
+
 CRITIC_REPORT: str = "critic_report"
 """Session state key written by the critic agent."""
 
@@ -58,6 +66,10 @@ CRITIC_REPORT: str = "critic_report"
 DEBATE_CONVERGENCE_HISTORY: str = "debate_convergence_history"
 """Session state key holding the list of convergence records across debate rounds."""
 
+DEBATE_DISPUTED_PANELS: str = "debate_disputed_panels"
+"""Session state key holding the panel names the critic disputed in the latest
+round. Only these panels re-run; the others carry their findings forward."""
+
 # ---------------------------------------------------------------------------
 # Investigation context keys — populated by CouncilOrchestrator
 # ---------------------------------------------------------------------------
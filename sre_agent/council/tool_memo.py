@@ -0,0 +1,190 @@
+"""Per-investigation memo of panel tool results for debate rounds.
+
+Debate rounds re-run panels that usually repeat the exact same
+``fetch_trace``, ``list_log_entries`` or ``list_time_series`` calls as the
+initial round.  The memo records successful results of read-only tools,
+keyed by the ADK invocation (one investigation), tool name and canonical
+arguments, and replays them for identical invocations later in the same
+investigation via ``before_tool_callback``.
+
+Usage::
+
+    panel = panel.model_copy(
+        update={
+            "before_tool_callback": memo_before_tool_callback,
+            "after_tool_callback": memo_after_tool_callback,
+        }
+    )
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# READ_ONLY tools that still must not be replayed: they touch investigation
+# state, or (arbitrary SQL) may have side effects.
+NON_MEMOIZABLE_TOOLS: frozenset[str] = frozenset(
+    {"get_investigation_summary", "update_investigation_state", "gcp_execute_sql"}
+)
+
+
+def is_memoizable(tool_name: str) -> bool:
+    """Whether results of ``tool_name`` may be replayed within an investigation.
+
+    Only tools the policy engine classifies as ``READ_ONLY`` qualify; write,
+    admin and unknown tools always run.
+    """
+    if tool_name in NON_MEMOIZABLE_TOOLS:
+        return False
+    from sre_agent.core.policy_engine import ToolAccessLevel, get_policy_engine
+
+    policy = get_policy_engine().get_policy(tool_name)
+    return policy is not None and policy.access_level == ToolAccessLevel.READ_ONLY
+
+
+def _is_success(response: Any) -> bool:
+    if not isinstance(response, dict):
+        return False
+    if response.get("error"):
+        return False
+    status = response.get("status")
+    return status is None or str(status).lower() == "success"
+
+
+class ToolResultMemo:
+    """Bounded memo of tool results grouped by investigation.
+
+    Investigations are evicted least-recently-used first; each investigation
+    keeps at most ``max_entries`` results.
+    """
+
+    def __init__(self, max_investigations: int = 64, max_entries: int = 256) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_investigations: Investigations kept before LRU eviction.
+            max_entries: Results kept per investigation.
+        """
+        self.max_investigations = max_investigations
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, dict[str, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(tool_name: str, args: dict[str, Any]) -> str:
+        """Canonical key for a tool invocation."""
+        return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+    def get(
+        self, investigation_id: str, tool_name: str, args: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Return the recorded result of an identical earlier invocation."""
+        key = self.make_key(tool_name, args)
+        with self._lock:
+            entries = self._data.get(investigation_id)
+            result = entries.get(key) if entries is not None else None
+            if result is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(investigation_id)
+            self.hits += 1
+            return result
+
+    def put(
+        self,
+        investigation_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        result: dict[str, Any],
+    ) -> None:
+        """Record a tool result for later replay."""
+        key = self.make_key(tool_name, args)
+        with self._lock:
+            entries = self._data.setdefault(investigation_id, {})
+            self._data.move_to_end(investigation_id)
+            if key not in entries and len(entries) >= self.max_entries:
+                return
+            entries[key] = result
+            while len(self._data) > self.max_investigations:
+                self._data.popitem(last=False)
+
+    def clear(self, investigation_id: str) -> None:
+        """Forget all results of one investigation."""
+        with self._lock:
+            self._data.pop(investigation_id, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "investigations": len(self._data),
+            }
+
+
+_memo = ToolResultMemo()
+
+
+def get_tool_result_memo() -> ToolResultMemo:
+    """Return the process-wide tool result memo."""
+    return _memo
+
+
+def reset_tool_result_memo() -> None:
+    """Replace the process-wide memo with an empty one (for testing)."""
+    global _memo
+    _memo = ToolResultMemo()
+
+
+def _investigation_id(context: Any) -> str | None:
+    invocation_id = getattr(context, "invocation_id", None)
+    return invocation_id if isinstance(invocation_id, str) else None
+
+
+async def memo_before_tool_callback(
+    tool: Any,
+    args: dict[str, Any],
+    tool_context: Any,
+) -> dict[str, Any] | None:
+    """Replay the result of an identical earlier call in this investigation.
+
+    Returns:
+        The recorded result (which skips the tool call), or None.
+    """
+    tool_name = getattr(tool, "name", str(tool))
+    investigation_id = _investigation_id(tool_context)
+    if investigation_id is None or not is_memoizable(tool_name):
+        return None
+    result = get_tool_result_memo().get(investigation_id, tool_name, args)
+    if result is not None:
+        logger.debug(f"Replaying memoized result for {tool_name}")
+    return result
+
+
+async def memo_after_tool_callback(
+    tool: Any,
+    args: dict[str, Any],
+    tool_context: Any,
+    tool_response: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Record successful read-only tool results for later replay.
+
+    Returns:
+        None (does not modify the response).
+    """
+    tool_name = getattr(tool, "name", str(tool))
+    investigation_id = _investigation_id(tool_context)
+    if (
+        investigation_id is not None
+        and is_memoizable(tool_name)
+        and _is_success(tool_response)
+    ):
+        get_tool_result_memo().put(investigation_id, tool_name, args, tool_response)
+    return None
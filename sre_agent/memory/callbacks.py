@@ -10,8 +10,13 @@ Key Features:
 - after_tool_success_callback: Records significant successful findings
 - on_tool_error_memory_callback: Records tool exceptions
 - Real-time event emission for UI visibility (toasts)
+
+Memory writes and mistake-learner updates are handed to the write-behind
+pipeline (``sre_agent.memory.write_behind``) so they never delay the tool
+result; only cheap classification and event emission happen inline.
 """
 
+import hashlib
 import json
 import logging
 from typing import Any
@@ -22,6 +27,8 @@ from sre_agent.api.helpers.memory_events import (
     create_tool_tracking_event,
     get_memory_event_bus,
 )
+from sre_agent.core.loop_monitor import attributed
+from sre_agent.memory.write_behind import MemoryWrite, get_memory_writer
 
 logger = logging.getLogger(__name__)
 
@@ -226,6 +233,55 @@ def _extract_success_finding(
     )
 
 
+def _finding_key(user_id: str | None, description: str) -> str:
+    """Dedupe key for a finding write: the same text for the same user."""
+    digest = hashlib.sha256(description.encode()).hexdigest()
+    return f"finding:{user_id}:{digest}"
+
+
+async def _defer_finding(
+    tool_name: str,
+    description: str,
+    session_id: str | None,
+    user_id: str | None,
+) -> None:
+    """Queue a HIGH-confidence finding write through the MemoryManager."""
+    from sre_agent.memory.factory import get_memory_manager
+    from sre_agent.schema import Confidence
+
+    manager = get_memory_manager()
+    await get_memory_writer().submit(
+        MemoryWrite(
+            kind="finding",
+            run=lambda: manager.add_finding(
+                description=description,
+                source_tool=tool_name,
+                confidence=Confidence.HIGH,
+                session_id=session_id,
+                user_id=user_id,
+            ),
+            key=_finding_key(user_id, description),
+        )
+    )
+
+
+async def _defer_learner_update(
+    method: str,
+    **kwargs: Any,
+) -> None:
+    """Queue an ordered MistakeLearner update (``on_tool_failure`` etc.)."""
+    from sre_agent.memory.mistake_learner import get_mistake_learner
+
+    learner = get_mistake_learner()
+    await get_memory_writer().submit(
+        MemoryWrite(
+            kind="mistake",
+            run=lambda: getattr(learner, method)(**kwargs),
+            ordered=True,
+        )
+    )
+
+
 def _get_session_id_from_context(tool_context: Any) -> str | None:
     """Extract session_id from tool context for event routing."""
     inv_ctx = getattr(tool_context, "invocation_context", None) or getattr(
@@ -237,6 +293,7 @@ def _get_session_id_from_context(tool_context: Any) -> str | None:
     return None
 
 
+@attributed("callback:before_tool_memory")
 async def before_tool_memory_callback(
     tool: Any,
     args: dict[str, Any],
@@ -264,15 +321,14 @@ async def before_tool_memory_callback(
         manager = get_memory_manager()
 
         # Record the tool call for pattern tracking
-        manager.record_tool_call(tool_name)
-        sequence_length = len(manager._current_tool_sequence)
+        session_id = _get_session_id_from_context(tool_context)
+        sequence_length = manager.record_tool_call(tool_name, session_id)
         logger.debug(f"Recorded tool call: {tool_name} (#{sequence_length})")
 
         # Emit tracking event for UI visibility (only for significant tools)
         # Skip common/noisy tools to avoid toast spam
         noisy_tools = {"get_current_time", "preload_memory", "load_memory"}
         if tool_name not in noisy_tools:
-            session_id = _get_session_id_from_context(tool_context)
             event_bus = get_memory_event_bus()
             event = create_tool_tracking_event(tool_name, sequence_length)
             await event_bus.emit(session_id, event)
@@ -341,27 +397,13 @@ async def after_tool_memory_callback(
             error_msg = str(tool_response.get("error", ""))[:100]
             logger.info(f"Recording tool failure lesson for {tool_name}")
 
-            from sre_agent.memory.factory import get_memory_manager
-
-            manager = get_memory_manager()
             _, session_id, user_id = get_context()
-
-            from sre_agent.schema import Confidence
-
-            await manager.add_finding(
-                description=lesson,
-                source_tool=tool_name,
-                confidence=Confidence.HIGH,
-                session_id=session_id,
-                user_id=user_id,
-            )
+            await _defer_finding(tool_name, lesson, session_id, user_id)
 
             # Record structured mistake for self-improving loop
             try:
-                from sre_agent.memory.mistake_learner import get_mistake_learner
-
-                learner = get_mistake_learner()
-                await learner.on_tool_failure(
+                await _defer_learner_update(
+                    "on_tool_failure",
                     tool_name=tool_name,
                     args=args,
                     error_message=error_msg,
@@ -382,11 +424,9 @@ async def after_tool_memory_callback(
         status = tool_response.get("status", "")
         if isinstance(status, str) and status.lower() == "success":
             try:
-                from sre_agent.memory.mistake_learner import get_mistake_learner
-
-                learner = get_mistake_learner()
                 _, session_id, user_id = get_context()
-                await learner.on_tool_success(
+                await _defer_learner_update(
+                    "on_tool_success",
                     tool_name=tool_name,
                     args=args,
                     session_id=session_id,
@@ -403,20 +443,8 @@ async def after_tool_memory_callback(
             )
             logger.info(f"Recording successful finding from {tool_name}")
 
-            from sre_agent.memory.factory import get_memory_manager
-
-            manager = get_memory_manager()
             _, session_id, user_id = get_context()
-
-            from sre_agent.schema import Confidence
-
-            await manager.add_finding(
-                description=finding,
-                source_tool=tool_name,
-                confidence=Confidence.HIGH,
-                session_id=session_id,
-                user_id=user_id,
-            )
+            await _defer_finding(tool_name, finding, session_id, user_id)
 
             # Emit event for UI visibility
             event_bus = get_memory_event_bus()
@@ -441,6 +469,7 @@ async def after_tool_memory_callback(
     return None
 
 
+@attributed("callback:on_tool_error_memory")
 async def on_tool_error_memory_callback(
     tool: Any,
     args: dict[str, Any],
@@ -475,10 +504,6 @@ async def on_tool_error_memory_callback(
         lesson = _extract_error_lesson(tool_name, args, error)
         logger.info(f"Recording tool error lesson for {tool_name}")
 
-        from sre_agent.memory.factory import get_memory_manager
-
-        manager = get_memory_manager()
-
         inv_ctx = getattr(tool_context, "invocation_context", None) or getattr(
             tool_context, "_invocation_context", None
         )
@@ -497,22 +522,12 @@ async def on_tool_error_memory_callback(
             except Exception:
                 user_id = "system"
 
-        from sre_agent.schema import Confidence
-
-        await manager.add_finding(
-            description=lesson,
-            source_tool=tool_name,
-            confidence=Confidence.HIGH,
-            session_id=session_id,
-            user_id=user_id,
-        )
+        await _defer_finding(tool_name, lesson, session_id, user_id)
 
         # Record structured mistake for self-improving loop
         try:
-            from sre_agent.memory.mistake_learner import get_mistake_learner
-
-            learner = get_mistake_learner()
-            await learner.on_tool_exception(
+            await _defer_learner_update(
+                "on_tool_exception",
                 tool_name=tool_name,
                 args=args,
                 error=error,
@@ -535,6 +550,7 @@ async def on_tool_error_memory_callback(
     return None
 
 
+@attributed("callback:after_agent_memory")
 async def after_agent_memory_callback(callback_context: Any) -> None:
     """Automatically persist session to memory after each agent turn.
 
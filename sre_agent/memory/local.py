@@ -5,19 +5,118 @@ It implements the same interface but uses SQLite for persistence.
 
 Key Features:
 - STRICT User Isolation (user_id is mandatory)
-- SQLite storage (.sre_agent_memory.db)
+- SQLite storage (``SRE_AGENT_MEMORY_DB``, default .sre_agent_memory.db)
+  through the shared WAL connection pool and group-commit writer of
+  ``core.local_db``
 - JSON metadata support
+- FTS5 full-text index with BM25 ranking, kept in sync by triggers
+- Hashed n-gram vectors for hybrid (lexical + fuzzy) scoring without
+  heavy embedding dependencies
+- User, app and time filters applied in SQL rather than client-side
 """
 
+import hashlib
 import json
 import logging
+import math
+import re
 import sqlite3
 import uuid
+import zlib
+from array import array
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
+from sre_agent.core.local_db import get_local_database
+
 logger = logging.getLogger(__name__)
 
+# Dimensionality of the hashed n-gram vectors.
+VECTOR_DIMS = 256
+# BM25 candidates fetched per requested result before hybrid re-ranking.
+_CANDIDATE_MULTIPLIER = 5
+# Most recent rows scanned by vector similarity when BM25 finds too little.
+_VECTOR_SCAN_LIMIT = 1000
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-cased word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def hashed_ngram_vector(text: str, dims: int = VECTOR_DIMS) -> list[float]:
+    """Embed text as an L2-normalized vector of hashed word and trigram counts.
+
+    Character trigrams make near-misses (``timeout`` vs ``timeouts``,
+    ``OOMKilled`` vs ``OOM killed``) score close to each other, which a
+    purely lexical index cannot do.
+
+    Args:
+        text: Text to embed.
+        dims: Vector dimensionality.
+
+    Returns:
+        A list of ``dims`` floats.
+    """
+    vec = [0.0] * dims
+    for token in tokenize(text):
+        vec[zlib.crc32(token.encode()) % dims] += 1.0
+        padded = f"#{token}#"
+        for i in range(len(padded) - 2):
+            vec[zlib.crc32(padded[i : i + 3].encode()) % dims] += 0.5
+    norm = math.sqrt(sum(v * v for v in vec))
+    return [v / norm for v in vec] if norm else vec
+
+
+def _pack_vector(vec: list[float]) -> bytes:
+    return array("f", vec).tobytes()
+
+
+def _cosine(query_vec: list[float], blob: bytes | None) -> float:
+    """Cosine similarity between a normalized query vector and a stored one."""
+    if not blob:
+        return 0.0
+    vec = array("f")
+    vec.frombytes(blob)
+    if len(vec) != len(query_vec):
+        return 0.0
+    return max(0.0, sum(a * b for a, b in zip(query_vec, vec, strict=True)))
+
+
+def build_fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query of OR-ed prefix terms.
+
+    Every token is quoted, so user input can never inject FTS5 syntax.
+    """
+    tokens = dict.fromkeys(tokenize(query))
+    return " OR ".join(f'"{token}"*' for token in tokens)
+
+
+def scope_tokens(user_id: str, app_name: str = "") -> str:
+    """Opaque FTS tokens identifying a memory's user and app.
+
+    Indexing these next to the content lets FTS5 intersect a query with a
+    single short doclist per scope instead of ranking every user's matches
+    and filtering afterwards.
+    """
+    tokens = [_scope_token("u", user_id)]
+    if app_name:
+        tokens.append(_scope_token("a", app_name))
+    return " ".join(tokens)
+
+
+def _scope_token(prefix: str, value: str) -> str:
+    return prefix + hashlib.sha1(value.encode()).hexdigest()[:16]
+
+
+def _sql_timestamp(value: datetime) -> str:
+    """Format ``value`` like SQLite's ``CURRENT_TIMESTAMP`` (UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
 
 @dataclass
 class LocalMemoryItem:
@@ -26,46 +125,121 @@ class LocalMemoryItem:
     id: str
     content: str
     metadata: dict[str, Any]
-    score: float = 1.0  # Placeholder for local search output
+    score: float = 1.0  # Hybrid relevance in [0, 1]; 1.0 for recency listings
 
 
 class LocalMemoryService:
     """SQLite-based implementation of Memory Service."""
 
-    def __init__(self, db_path: str = ".sre_agent_memory.db"):
+    def __init__(
+        self,
+        db_path: str = ".sre_agent_memory.db",
+        vector_weight: float = 0.3,
+    ):
         """Initialize the local memory service.
 
         Args:
             db_path: Path to the SQLite database file.
+            vector_weight: Weight of vector similarity in the hybrid score
+                (0 disables vectors and ranks by BM25 alone).
         """
         self.db_path = db_path
+        self.vector_weight = min(max(vector_weight, 0.0), 1.0)
+        self._db = get_local_database(db_path)
         self._init_db()
 
     def _init_db(self) -> None:
-        """Initialize the database schema."""
+        """Initialize the database schema, migrating older databases."""
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS memories (
-                        id TEXT PRIMARY KEY,
-                        user_id TEXT NOT NULL,
-                        session_id TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        metadata TEXT DEFAULT '{}',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                # Index for fast filtering by user
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_memories_user
-                    ON memories(user_id, created_at DESC)
-                """)
-                conn.commit()
+            self._db.write(self._create_schema)
             logger.info(f"✅ Local Memory Service initialized at {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize local memory DB: {e}")
             raise
 
+    @classmethod
+    def _create_schema(cls, conn: sqlite3.Connection) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS memories (
+                id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                content TEXT NOT NULL,
+                metadata TEXT DEFAULT '{}',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                app_name TEXT NOT NULL DEFAULT '',
+                scope_tokens TEXT NOT NULL DEFAULT '',
+                embedding BLOB
+            )
+        """)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(memories)")}
+        if "app_name" not in columns:
+            conn.execute(
+                "ALTER TABLE memories ADD COLUMN app_name TEXT NOT NULL DEFAULT ''"
+            )
+        if "embedding" not in columns:
+            conn.execute("ALTER TABLE memories ADD COLUMN embedding BLOB")
+        if "scope_tokens" not in columns:
+            conn.execute(
+                "ALTER TABLE memories ADD COLUMN scope_tokens TEXT NOT NULL DEFAULT ''"
+            )
+            conn.create_function("scope_tokens", 2, scope_tokens)
+            conn.execute(
+                "UPDATE memories SET scope_tokens = scope_tokens(user_id, app_name)"
+            )
+        # Index for fast filtering by user
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_user
+            ON memories(user_id, created_at DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_app_user
+            ON memories(app_name, user_id, created_at DESC)
+        """)
+        cls._init_fts(conn)
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> None:
+        """Create the FTS5 index over ``memories`` and its sync triggers."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'"
+        ).fetchone()
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                content,
+                scope_tokens,
+                content='memories',
+                content_rowid='rowid',
+                tokenize='porter unicode61'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_insert
+            AFTER INSERT ON memories BEGIN
+                INSERT INTO memories_fts(rowid, content, scope_tokens)
+                VALUES (new.rowid, new.content, new.scope_tokens);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_delete
+            AFTER DELETE ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, scope_tokens)
+                VALUES ('delete', old.rowid, old.content, old.scope_tokens);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_fts_update
+            AFTER UPDATE OF content, scope_tokens ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, scope_tokens)
+                VALUES ('delete', old.rowid, old.content, old.scope_tokens);
+                INSERT INTO memories_fts(rowid, content, scope_tokens)
+                VALUES (new.rowid, new.content, new.scope_tokens);
+            END
+        """)
+        if not exists:
+            # Index rows written before the FTS table existed.
+            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+
     async def save_memory(
         self,
         session_id: str,
@@ -77,7 +251,8 @@ class LocalMemoryService:
         Args:
             session_id: The session identifier.
             memory_content: The text content to save.
-            metadata: Optional metadata (MUST include user_id).
+            metadata: Optional metadata (MUST include user_id; ``app_name`` is
+                indexed for filtering when present).
 
         Returns:
             The ID of the saved memory.
@@ -92,20 +267,25 @@ class LocalMemoryService:
             raise PermissionError("user_id is required for saving memory")
 
         memory_id = str(uuid.uuid4())
-
+        app_name = str(metadata.get("app_name") or "")
+
+        row = (
+            memory_id,
+            user_id,
+            session_id,
+            memory_content,
+            json.dumps(metadata),
+            app_name,
+            scope_tokens(user_id, app_name),
+            _pack_vector(hashed_ngram_vector(memory_content)),
+        )
         try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
-                conn.execute(
-                    "INSERT INTO memories (id, user_id, session_id, content, metadata) VALUES (?, ?, ?, ?, ?)",
-                    (
-                        memory_id,
-                        user_id,
-                        session_id,
-                        memory_content,
-                        json.dumps(metadata),
-                    ),
+            await self._db.awrite(
+                lambda conn: conn.execute(
+                    "INSERT INTO memories (id, user_id, session_id, content, metadata, app_name, scope_tokens, embedding) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    row,
                 )
-                conn.commit()
+            )
             return memory_id
         except Exception as e:
             logger.error(f"Failed to save local memory: {e}")
@@ -116,55 +296,144 @@ class LocalMemoryService:
         session_id: str | None = None,
         query: str = "",
         limit: int = 5,
+        *,
+        user_id: str | None = None,
+        app_name: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
     ) -> list[LocalMemoryItem]:
-        """Search for memories.
+        """Search for memories ranked by BM25, blended with vector similarity.
 
-        NOTE: Local search is currently keyword-based (LIKE %query%),
-        not semantic, as full embeddings require heavy local deps.
+        Candidates come from the FTS5 index (prefix match on any query
+        token, intersected with the user/app scope tokens), are filtered by
+        time in SQL, then re-ranked by
+        ``(1 - vector_weight) * bm25 + vector_weight * cosine``. When the
+        index yields too few matches, the most recent rows in scope are
+        scored by vector similarity alone, which catches near-miss wording.
+        An empty query lists the most recent memories.
 
-        Filtering by user_id will happen in the MemoryManager layer
-        (which retrieves specific metadata), but we also support
-        optimizing it here if we passed user_id explicitly.
+        Without ``user_id`` results are NOT user-scoped: twice ``limit`` rows
+        are returned and the caller (``MemoryManager``) must filter them.
 
-        Since strict interface in manager.py calls `search_memory(session_id, query, limit)`,
-        we return broad results and let Manager filter, OR we rely on session_id if provided.
+        Args:
+            session_id: Unused; kept for interface compatibility.
+            query: Free-text query.
+            limit: Maximum number of results.
+            user_id: Restrict to this user's memories.
+            app_name: Restrict to memories saved with this ``app_name``.
+            since: Only memories created at or after this time.
+            until: Only memories created before this time.
 
-        However, MemoryManager implementation of `get_relevant_findings` does STRICT
-        client-side filtering after retrieval.
+        Returns:
+            Matching memories, best first.
         """
-        results = []
-        try:
-            with sqlite3.connect(self.db_path, timeout=10.0) as conn:
-                # Simple keyword search
-                cursor = conn.execute(
-                    """
-                    SELECT id, content, metadata
-                    FROM memories
-                    WHERE content LIKE ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                    """,
-                    (f"%{query}%", limit * 2),  # Fetch extra to account for filtering
-                )
+        fetch = limit if user_id else limit * 2
+        filters: list[str] = []
+        params: list[Any] = []
+        if user_id:
+            filters.append("m.user_id = ?")
+            params.append(user_id)
+        if app_name:
+            filters.append("m.app_name = ?")
+            params.append(app_name)
+        if since is not None:
+            filters.append("m.created_at >= ?")
+            params.append(_sql_timestamp(since))
+        if until is not None:
+            filters.append("m.created_at < ?")
+            params.append(_sql_timestamp(until))
+
+        fts_query = build_fts_query(query)
+        match = f"{{content}}: ({fts_query})"
+        if user_id:
+            match += f" AND {{scope_tokens}}: {_scope_token('u', user_id)}"
+        if app_name:
+            match += f" AND {{scope_tokens}}: {_scope_token('a', app_name)}"
+
+        def _search(conn: sqlite3.Connection) -> list[LocalMemoryItem]:
+            if not fts_query:
+                rows = self._recent(conn, filters, params, fetch)
+                return [self._to_item(row, 1.0) for row in rows]
+            return self._ranked(conn, match, query, filters, params, fetch)
 
-                for row in cursor:
-                    try:
-                        meta = json.loads(row[2])
-                    except json.JSONDecodeError:
-                        meta = {}
-
-                    results.append(
-                        LocalMemoryItem(
-                            id=row[0],
-                            content=row[1],
-                            metadata=meta,
-                            score=1.0,  # Dummy score for exact match
-                        )
-                    )
+        try:
+            return await self._db.aread(_search)
         except Exception as e:
             logger.error(f"Failed to search local memory: {e}")
+            return []
+
+    @staticmethod
+    def _recent(
+        conn: sqlite3.Connection, filters: list[str], params: list[Any], limit: int
+    ) -> list[tuple[Any, ...]]:
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        cursor = conn.execute(
+            f"""
+            SELECT m.id, m.content, m.metadata, m.embedding
+            FROM memories m
+            {where}
+            ORDER BY m.created_at DESC, m.rowid DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        return list(cursor)
 
-        return results
+    def _ranked(
+        self,
+        conn: sqlite3.Connection,
+        match: str,
+        query: str,
+        filters: list[str],
+        params: list[Any],
+        limit: int,
+    ) -> list[LocalMemoryItem]:
+        where = "".join(f" AND {f}" for f in filters)
+        candidates = limit * _CANDIDATE_MULTIPLIER if self.vector_weight else limit
+        rows = conn.execute(
+            f"""
+            SELECT m.id, m.content, m.metadata, m.embedding,
+                   bm25(memories_fts, 1.0, 0.0) AS rank
+            FROM memories_fts
+            JOIN memories m ON m.rowid = memories_fts.rowid
+            WHERE memories_fts MATCH ?{where}
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (match, *params, candidates),
+        ).fetchall()
+
+        # bm25() is lower-is-better; normalize to [0, 1] within the candidates.
+        best = max((-row[4] for row in rows), default=0.0) or 1.0
+        scored: dict[str, tuple[float, tuple[Any, ...]]] = {
+            row[0]: (max(-row[4], 0.0) / best, row) for row in rows
+        }
+
+        if not self.vector_weight:
+            return [self._to_item(row, score) for score, row in scored.values()]
+
+        query_vec = hashed_ngram_vector(query)
+        weight = self.vector_weight
+        ranked = [
+            ((1 - weight) * lexical + weight * _cosine(query_vec, row[3]), row)
+            for lexical, row in scored.values()
+        ]
+        if len(ranked) < limit:
+            for row in self._recent(conn, filters, params, _VECTOR_SCAN_LIMIT):
+                if row[0] not in scored:
+                    ranked.append((weight * _cosine(query_vec, row[3]), row))
+        ranked.sort(key=lambda pair: pair[0], reverse=True)
+        return [self._to_item(row, score) for score, row in ranked[:limit] if score]
+
+    @staticmethod
+    def _to_item(row: tuple[Any, ...], score: float) -> LocalMemoryItem:
+        try:
+            meta = json.loads(row[2])
+        except json.JSONDecodeError:
+            meta = {}
+        return LocalMemoryItem(
+            id=row[0], content=row[1], metadata=meta, score=round(score, 6)
+        )
 
     async def add_session_to_memory(self, session: Any) -> None:
         """Store session events in long-term memory.
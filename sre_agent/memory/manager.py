@@ -17,6 +17,7 @@ from google.adk.memory import VertexAiMemoryBankService
 from sre_agent.schema import Confidence, InvestigationPhase, MemoryItem
 
 from .sanitizer import MemorySanitizer
+from .tool_sequence import SessionToolTracker
 
 logger = logging.getLogger(__name__)
 
@@ -109,8 +110,8 @@ class MemoryManager:
         self._current_state = InvestigationPhase.INITIATED
         self._findings_cache: list[MemoryItem] = []
 
-        # Learning pattern cache: tracks tool calls in current session
-        self._current_tool_sequence: list[str] = []
+        # Learning pattern cache: tracks tool calls per session
+        self._tool_tracker = SessionToolTracker()
         self._learned_patterns: list[InvestigationPattern] = []
 
     def _check_init_memory_service(self) -> None:
@@ -143,7 +144,9 @@ class MemoryManager:
             try:
                 from sre_agent.memory.local import LocalMemoryService
 
-                self.memory_service = LocalMemoryService()
+                self.memory_service = LocalMemoryService(
+                    os.environ.get("SRE_AGENT_MEMORY_DB", ".sre_agent_memory.db")
+                )
                 logger.info("✅ Local Memory Service initialized")
             except Exception as local_e:
                 logger.error(
@@ -252,11 +255,12 @@ class MemoryManager:
                 # ADK search_memory signature: (app_name, user_id, query)
                 # or (session_id, query, limit) for local
                 if hasattr(self.memory_service, "save_memory"):
-                    # LocalMemoryService / legacy
+                    # LocalMemoryService / legacy: ranked and user-scoped in SQL
                     memories = await self.memory_service.search_memory(
                         session_id=session_id,
                         query=query,
-                        limit=limit * 2,  # Fetch extra for client-side filtering
+                        limit=limit,
+                        user_id=user_id or "anonymous",
                     )
                 else:
                     # VertexAiMemoryBankService
@@ -382,13 +386,28 @@ class MemoryManager:
 
     # ── Learning Pattern System ──────────────────────────────────────
 
-    def record_tool_call(self, tool_name: str) -> None:
-        """Record a tool call in the current session sequence.
+    def record_tool_call(self, tool_name: str, session_id: str | None = None) -> int:
+        """Record a tool call in the session's tool sequence.
 
         Args:
             tool_name: Name of the tool that was called.
+            session_id: Session the call belongs to.
+
+        Returns:
+            Number of tool calls recorded for the session so far.
+        """
+        return self._tool_tracker.record(tool_name, session_id)
+
+    def get_tool_sequence(self, session_id: str | None = None) -> list[str]:
+        """Return the session's tool sequence with consecutive repeats collapsed.
+
+        Args:
+            session_id: Session to look up.
+
+        Returns:
+            The most recent tool calls of the session, oldest first.
         """
-        self._current_tool_sequence.append(tool_name)
+        return self._tool_tracker.sequence(session_id)
 
     async def learn_from_investigation(
         self,
@@ -414,10 +433,11 @@ class MemoryManager:
             session_id: Current session ID for persistence.
             user_id: User ID for isolation.
         """
+        tool_sequence = self._tool_tracker.sequence(session_id)
         pattern = InvestigationPattern(
             symptom_type=symptom_type,
             root_cause_category=root_cause_category,
-            tool_sequence=list(self._current_tool_sequence),
+            tool_sequence=tool_sequence,
             resolution_summary=resolution_summary,
         )
 
@@ -447,7 +467,7 @@ class MemoryManager:
                     f"[PATTERN] Symptom: {symptom_type} | "
                     f"Root Cause: {root_cause_category} | "
                     f"Resolution: {resolution_summary} | "
-                    f"Tools: {' -> '.join(self._current_tool_sequence)}"
+                    f"Tools: {' -> '.join(tool_sequence)}"
                 )
                 if hasattr(self.memory_service, "save_memory"):
                     # Save to user's scope
@@ -458,7 +478,7 @@ class MemoryManager:
                             "type": "investigation_pattern",
                             "symptom_type": symptom_type,
                             "root_cause_category": root_cause_category,
-                            "tool_sequence": json.dumps(self._current_tool_sequence),
+                            "tool_sequence": json.dumps(tool_sequence),
                             "confidence": str(pattern.confidence),
                             "user_id": user_id or "anonymous",
                         },
@@ -474,7 +494,7 @@ class MemoryManager:
                             "type": "investigation_pattern",
                             "symptom_type": symptom_type,
                             "root_cause_category": root_cause_category,
-                            "tool_sequence": json.dumps(self._current_tool_sequence),
+                            "tool_sequence": json.dumps(tool_sequence),
                             "confidence": str(pattern.confidence),
                             "user_id": "system_shared_patterns",
                         },
@@ -622,9 +642,13 @@ class MemoryManager:
         results.sort(key=lambda p: (p.confidence, p.occurrence_count), reverse=True)
         return results
 
-    def reset_session_tracking(self) -> None:
-        """Reset the tool call sequence for a new session/investigation."""
-        self._current_tool_sequence = []
+    def reset_session_tracking(self, session_id: str | None = None) -> None:
+        """Reset the tool call sequence for a new session/investigation.
+
+        Args:
+            session_id: Session whose tool sequence is cleared.
+        """
+        self._tool_tracker.reset(session_id)
         self._current_state = InvestigationPhase.INITIATED
 
     async def learn_tool_error_pattern(
@@ -10,10 +10,13 @@ Architecture:
   Vertex AI Memory Bank in production and ``LocalMemoryService`` (SQLite)
   in local/dev mode. This ensures a single storage backend, proper user
   isolation, and semantic search via Vertex AI Vector Search.
-- **Session cache**: An in-memory dict (keyed by fingerprint) provides
-  fast deduplication and occurrence counting within the current process
-  lifetime. The cache is populated from writes and is not authoritative
-  across restarts — the Memory Bank is the source of truth.
+- **Indexed table**: The process-wide store also keeps every record in a
+  local SQLite ``mistakes`` table keyed by fingerprint, with secondary
+  indexes on tool and category ordered by occurrence count. Records are
+  stored as structured JSON, so reloading them needs no text parsing.
+- **Working set**: A bounded LRU of recently used records (with tool,
+  category and top-K indexes) provides fast deduplication and occurrence
+  counting. Count increments are written behind to the table.
 
 Key Features:
 - Fingerprint-based deduplication (same mistake increments count, not duplicates)
@@ -23,12 +26,20 @@ Key Features:
 - User isolation via MemoryManager's user_id enforcement
 """
 
+import asyncio
+import bisect
 import hashlib
+import heapq
 import json
 import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from typing import Any
 
+from sre_agent.core.local_db import LocalDatabase, get_local_database
 from sre_agent.schema import Confidence, MistakeCategory, MistakeRecord
 
 logger = logging.getLogger(__name__)
@@ -46,6 +57,66 @@ _MISTAKE_PREFIX = "[MISTAKE]"
 # Prefix used for correction entries.
 _CORRECTION_PREFIX = "[CORRECTION]"
 
+# Records kept in the in-memory working set of a store.
+DEFAULT_MAX_CACHED_MISTAKES = 1024
+
+_UPSERT_SQL = """
+    INSERT INTO mistakes
+        (fingerprint, tool_name, category, occurrence_count, corrected,
+         last_seen, record)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(fingerprint) DO UPDATE SET
+        occurrence_count = excluded.occurrence_count,
+        corrected = excluded.corrected,
+        last_seen = excluded.last_seen,
+        record = excluded.record
+"""
+
+
+def _create_mistakes_table(conn: sqlite3.Connection) -> None:
+    """Create the ``mistakes`` table and its lookup indexes."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS mistakes (
+            fingerprint TEXT PRIMARY KEY,
+            tool_name TEXT NOT NULL,
+            category TEXT NOT NULL,
+            occurrence_count INTEGER NOT NULL,
+            corrected INTEGER NOT NULL DEFAULT 0,
+            last_seen TEXT NOT NULL,
+            record TEXT NOT NULL
+        )
+        """
+    )
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS idx_mistakes_tool "
+        "ON mistakes(tool_name, occurrence_count DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_mistakes_category "
+        "ON mistakes(category, occurrence_count DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_mistakes_count "
+        "ON mistakes(occurrence_count DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_mistakes_corrected "
+        "ON mistakes(occurrence_count DESC) WHERE corrected = 1",
+    ):
+        conn.execute(statement)
+
+
+def _decode_records(rows: list[tuple[str]]) -> list[MistakeRecord]:
+    """Decode ``record`` JSON columns, skipping rows that fail validation."""
+    records = []
+    for (raw,) in rows:
+        try:
+            records.append(MistakeRecord.model_validate_json(raw))
+        except ValueError:
+            logger.debug("Skipping undecodable mistake row", exc_info=True)
+    return records
+
+
+def _log_persist_failure(future: "Future[Any]") -> None:
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Failed to persist mistake record: {error}")
+
 
 def _compute_fingerprint(
     tool_name: str,
@@ -174,21 +245,189 @@ def _format_mistake_for_memory(record: MistakeRecord) -> str:
     return "\n".join(parts)
 
 
+class _WorkingSet:
+    """LRU-bounded mistake records with secondary indexes.
+
+    Records are indexed by tool, category and correction status, and kept in
+    a list ranked by occurrence count, so lookups never scan the whole set.
+    """
+
+    def __init__(self, max_records: int) -> None:
+        self.max_records = max_records
+        self._records: OrderedDict[str, MistakeRecord] = OrderedDict()
+        self._by_tool: dict[str, set[str]] = {}
+        self._by_category: dict[MistakeCategory, set[str]] = {}
+        self._corrected: set[str] = set()
+        # Sorted (-occurrence_count, seq, fingerprint); seq keeps ties in
+        # first-recorded order.
+        self._ranked: list[tuple[int, int, str]] = []
+        self._rank_keys: dict[str, tuple[int, int, str]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._records
+
+    def get(self, fingerprint: str) -> MistakeRecord | None:
+        record = self._records.get(fingerprint)
+        if record is not None:
+            self._records.move_to_end(fingerprint)
+        return record
+
+    def put(self, record: MistakeRecord) -> None:
+        fp = record.fingerprint
+        previous = self._records.get(fp)
+        if previous is not None:
+            seq = self._rank_keys[fp][1]
+            self._unindex(previous)
+        else:
+            self._seq += 1
+            seq = self._seq
+        self._records[fp] = record
+        self._records.move_to_end(fp)
+        self._by_tool.setdefault(record.tool_name, set()).add(fp)
+        self._by_category.setdefault(record.category, set()).add(fp)
+        if record.correction is not None:
+            self._corrected.add(fp)
+        key = (-record.occurrence_count, seq, fp)
+        bisect.insort(self._ranked, key)
+        self._rank_keys[fp] = key
+        while len(self._records) > self.max_records:
+            _, evicted = self._records.popitem(last=False)
+            self._unindex(evicted)
+
+    def _unindex(self, record: MistakeRecord) -> None:
+        fp = record.fingerprint
+        self._by_tool.get(record.tool_name, set()).discard(fp)
+        self._by_category.get(record.category, set()).discard(fp)
+        self._corrected.discard(fp)
+        key = self._rank_keys.pop(fp, None)
+        if key is not None:
+            index = bisect.bisect_left(self._ranked, key)
+            if index < len(self._ranked) and self._ranked[index] == key:
+                del self._ranked[index]
+
+    def top(self, limit: int) -> list[MistakeRecord]:
+        return [self._records[fp] for _, _, fp in self._ranked[:limit]]
+
+    def top_of(self, fingerprints: set[str], limit: int) -> list[MistakeRecord]:
+        keys = heapq.nsmallest(limit, (self._rank_keys[fp] for fp in fingerprints))
+        return [self._records[fp] for _, _, fp in keys]
+
+    def for_tool(self, tool_name: str) -> set[str]:
+        return self._by_tool.get(tool_name, set())
+
+    def for_category(self, category: MistakeCategory) -> set[str]:
+        return self._by_category.get(category, set())
+
+    def corrected(self) -> set[str]:
+        return self._corrected
+
+
 class MistakeMemoryStore:
     """Mistake store backed by the existing MemoryManager pipeline.
 
-    Uses an in-memory session cache for fast deduplication and occurrence
-    counting, and delegates persistence to ``MemoryManager`` which routes
-    to Vertex AI Memory Bank (production) or LocalMemoryService (local).
+    Keeps a bounded in-memory working set (LRU over fingerprints, with
+    secondary indexes on tool and category and a maintained ranking by
+    occurrence count) for fast deduplication and lookups, and delegates
+    persistence to ``MemoryManager`` which routes to Vertex AI Memory Bank
+    (production) or LocalMemoryService (local).
+
+    With ``db_path`` set, every record is also kept in an indexed SQLite
+    ``mistakes`` table keyed by fingerprint (stored as structured JSON), so
+    lessons survive restarts and evictions and per-tool lookups stay
+    index range scans as they accumulate.
 
     All write operations require ``session_id`` and ``user_id`` so that
     the Memory Bank enforces strict user isolation.
     """
 
-    def __init__(self) -> None:
-        """Initialize the store with an empty session cache."""
-        # fingerprint -> MistakeRecord (mutable via dict replacement)
-        self._cache: dict[str, MistakeRecord] = {}
+    def __init__(
+        self,
+        db_path: str | None = None,
+        max_cached: int = DEFAULT_MAX_CACHED_MISTAKES,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite file for the indexed ``mistakes`` table. Without
+                it, records live only in the bounded working set.
+            max_cached: Records kept in the in-memory working set.
+        """
+        self._cache = _WorkingSet(max_cached)
+        self._db: LocalDatabase | None = None
+        if db_path:
+            self._db = get_local_database(db_path)
+            self._db.write(_create_mistakes_table)
+
+    # ── Persistence helpers ──────────────────────────────────────────
+
+    def _persist(self, record: MistakeRecord) -> "Future[Any] | None":
+        """Upsert ``record`` into the table via the group-commit writer."""
+        if self._db is None:
+            return None
+        row = (
+            record.fingerprint,
+            record.tool_name,
+            record.category.value,
+            record.occurrence_count,
+            int(record.correction is not None),
+            record.last_seen,
+            record.model_dump_json(),
+        )
+        future = self._db.submit(lambda conn: conn.execute(_UPSERT_SQL, row))
+        future.add_done_callback(_log_persist_failure)
+        return future
+
+    async def _lookup(self, fingerprint: str) -> MistakeRecord | None:
+        record = self._cache.get(fingerprint)
+        if record is not None or self._db is None:
+            return record
+        rows = await self._db.aread(
+            lambda conn: conn.execute(
+                "SELECT record FROM mistakes WHERE fingerprint = ?", (fingerprint,)
+            ).fetchall()
+        )
+        record = _decode_records(rows)[0] if rows else None
+        if record is not None:
+            self._cache.put(record)
+        return record
+
+    async def _query(
+        self,
+        where: str,
+        params: tuple[Any, ...],
+        cached: set[str] | None,
+        limit: int,
+    ) -> list[MistakeRecord]:
+        """Top ``limit`` records by occurrence count from table and cache.
+
+        Cached records are fresher than table rows (count increments are
+        written behind), so they take precedence on conflicts.
+        """
+        candidates = (
+            self._cache.top(limit)
+            if cached is None
+            else self._cache.top_of(cached, limit)
+        )
+        if self._db is None:
+            return candidates
+        rows = await self._db.aread(
+            lambda conn: conn.execute(
+                f"SELECT record FROM mistakes {where} "
+                "ORDER BY occurrence_count DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        )
+        merged = {r.fingerprint: r for r in _decode_records(rows)}
+        merged.update((r.fingerprint, r) for r in candidates)
+        for fp in list(merged):
+            if fp in self._cache and cached is not None and fp not in cached:
+                # Cached copy moved out of this selection (e.g. corrected).
+                del merged[fp]
+        return sorted(merged.values(), key=lambda r: -r.occurrence_count)[:limit]
 
     # ── Write Operations ─────────────────────────────────────────────
 
@@ -203,9 +442,9 @@ class MistakeMemoryStore:
     ) -> MistakeRecord:
         """Record a mistake, deduplicating by fingerprint.
 
-        If a mistake with the same fingerprint already exists in the
-        session cache, increments its occurrence count. On first
-        occurrence, also persists to the Memory Bank via MemoryManager.
+        If a mistake with the same fingerprint already exists, increments
+        its occurrence count. On first occurrence, also persists to the
+        Memory Bank via MemoryManager.
 
         Args:
             tool_name: Tool that produced the error.
@@ -223,22 +462,18 @@ class MistakeMemoryStore:
         fingerprint = _compute_fingerprint(tool_name, resolved_category, error_message)
         now = datetime.now(timezone.utc).isoformat()
 
-        existing = self._cache.get(fingerprint)
+        existing = await self._lookup(fingerprint)
         if existing:
             # Increment occurrence — replace frozen record with new count
-            updated = MistakeRecord(
-                tool_name=existing.tool_name,
-                category=existing.category,
-                error_message=existing.error_message,
-                failed_args=safe_args,
-                correction=existing.correction,
-                corrected_args=existing.corrected_args,
-                occurrence_count=existing.occurrence_count + 1,
-                first_seen=existing.first_seen,
-                last_seen=now,
-                fingerprint=fingerprint,
+            updated = existing.model_copy(
+                update={
+                    "failed_args": safe_args,
+                    "occurrence_count": existing.occurrence_count + 1,
+                    "last_seen": now,
+                }
             )
-            self._cache[fingerprint] = updated
+            self._cache.put(updated)
+            self._persist(updated)
             logger.info(
                 "Mistake reinforced: %s/%s (count=%d)",
                 tool_name,
@@ -260,7 +495,10 @@ class MistakeMemoryStore:
             last_seen=now,
             fingerprint=fingerprint,
         )
-        self._cache[fingerprint] = record
+        self._cache.put(record)
+        pending = self._persist(record)
+        if pending is not None:
+            await asyncio.wrap_future(pending)
 
         # Persist through MemoryManager
         try:
@@ -317,24 +555,16 @@ class MistakeMemoryStore:
         fingerprint = _compute_fingerprint(tool_name, resolved_category, error_message)
         safe_corrected = _sanitize_args(corrected_args)
 
-        existing = self._cache.get(fingerprint)
+        existing = await self._lookup(fingerprint)
         if not existing:
             return False
 
         # Update cache with correction
-        updated = MistakeRecord(
-            tool_name=existing.tool_name,
-            category=existing.category,
-            error_message=existing.error_message,
-            failed_args=existing.failed_args,
-            correction=correction,
-            corrected_args=safe_corrected,
-            occurrence_count=existing.occurrence_count,
-            first_seen=existing.first_seen,
-            last_seen=existing.last_seen,
-            fingerprint=fingerprint,
+        updated = existing.model_copy(
+            update={"correction": correction, "corrected_args": safe_corrected}
         )
-        self._cache[fingerprint] = updated
+        self._cache.put(updated)
+        self._persist(updated)
 
         # Persist the correction to Memory Bank
         try:
@@ -377,7 +607,7 @@ class MistakeMemoryStore:
         tool_name: str,
         limit: int = MAX_TOOL_ADVICE,
     ) -> list[MistakeRecord]:
-        """Retrieve past mistakes for a specific tool from the session cache.
+        """Retrieve past mistakes for a specific tool.
 
         Returns the most frequent mistakes first, enabling the advisor
         to warn the agent about the most common pitfalls.
@@ -389,9 +619,12 @@ class MistakeMemoryStore:
         Returns:
             List of MistakeRecords ordered by occurrence count (descending).
         """
-        matches = [r for r in self._cache.values() if r.tool_name == tool_name]
-        matches.sort(key=lambda r: r.occurrence_count, reverse=True)
-        return matches[:limit]
+        return await self._query(
+            "WHERE tool_name = ?",
+            (tool_name,),
+            self._cache.for_tool(tool_name),
+            limit,
+        )
 
     async def get_top_mistakes(
         self,
@@ -407,9 +640,7 @@ class MistakeMemoryStore:
         Returns:
             List of MistakeRecords ordered by occurrence count (descending).
         """
-        all_records = list(self._cache.values())
-        all_records.sort(key=lambda r: r.occurrence_count, reverse=True)
-        return all_records[:limit]
+        return await self._query("", (), None, limit)
 
     async def get_mistakes_by_category(
         self,
@@ -425,9 +656,12 @@ class MistakeMemoryStore:
         Returns:
             List of MistakeRecords for the category.
         """
-        matches = [r for r in self._cache.values() if r.category == category]
-        matches.sort(key=lambda r: r.occurrence_count, reverse=True)
-        return matches[:limit]
+        return await self._query(
+            "WHERE category = ?",
+            (category.value,),
+            self._cache.for_category(category),
+            limit,
+        )
 
     async def get_corrected_mistakes(
         self,
@@ -444,28 +678,35 @@ class MistakeMemoryStore:
         Returns:
             List of MistakeRecords that have corrections attached.
         """
-        corrected = [r for r in self._cache.values() if r.correction is not None]
-        corrected.sort(key=lambda r: r.occurrence_count, reverse=True)
-        return corrected[:limit]
+        return await self._query(
+            "WHERE corrected = 1", (), self._cache.corrected(), limit
+        )
 
     async def count_mistakes(self) -> int:
-        """Return the total number of unique mistakes in the session cache.
+        """Return the total number of unique mistakes.
 
         Returns:
             Count of distinct mistake fingerprints.
         """
-        return len(self._cache)
+        if self._db is None:
+            return len(self._cache)
+        count: int = await self._db.aread(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM mistakes").fetchone()[0]
+        )
+        return count
 
     async def load_from_memory_bank(
         self,
         session_id: str | None = None,
         user_id: str | None = None,
     ) -> int:
-        """Pre-populate the session cache from the Memory Bank.
+        """Pre-populate the working set from the table and the Memory Bank.
 
-        Searches the Memory Bank for previously stored mistakes and loads
-        them into the in-memory cache. This is called at session start to
-        bootstrap the self-improving loop with cross-session knowledge.
+        Warms the working set with the most frequent structured records from
+        the local table, then searches the Memory Bank for previously stored
+        mistakes (e.g. written by other replicas) and parses any that are not
+        known yet. This is called at session start to bootstrap the
+        self-improving loop with cross-session knowledge.
 
         Args:
             session_id: Session ID for scoping the search.
@@ -475,6 +716,15 @@ class MistakeMemoryStore:
             Number of mistakes loaded from the Memory Bank.
         """
         loaded = 0
+        if self._db is not None:
+            try:
+                stored = await self._query("", (), None, MAX_PROMPT_LESSONS * 2)
+                for stored_record in reversed(stored):
+                    if stored_record.fingerprint not in self._cache:
+                        self._cache.put(stored_record)
+                        loaded += 1
+            except Exception:
+                logger.debug("Failed to load mistakes from table", exc_info=True)
         try:
             from sre_agent.memory.factory import get_memory_manager
 
@@ -490,8 +740,9 @@ class MistakeMemoryStore:
                 if _MISTAKE_PREFIX not in desc and _CORRECTION_PREFIX not in desc:
                     continue
                 record = self._parse_memory_finding(desc, finding)
-                if record and record.fingerprint not in self._cache:
-                    self._cache[record.fingerprint] = record
+                if record and await self._lookup(record.fingerprint) is None:
+                    self._cache.put(record)
+                    self._persist(record)
                     loaded += 1
             if loaded:
                 logger.info("Loaded %d past mistakes from Memory Bank", loaded)
@@ -572,10 +823,15 @@ _store: MistakeMemoryStore | None = None
 def get_mistake_store() -> MistakeMemoryStore:
     """Get or create the global MistakeMemoryStore singleton.
 
+    Records are persisted to ``SRE_AGENT_MISTAKE_DB`` (default
+    ``.sre_agent_memory.db``); an empty value keeps them in memory only.
+
     Returns:
         The MistakeMemoryStore instance.
     """
     global _store
     if _store is None:
-        _store = MistakeMemoryStore()
+        _store = MistakeMemoryStore(
+            db_path=os.environ.get("SRE_AGENT_MISTAKE_DB", ".sre_agent_memory.db")
+        )
     return _store
@@ -0,0 +1,136 @@
+"""Session-scoped tool sequence tracking for investigation pattern learning.
+
+``MemoryManager`` is a process-wide singleton, so a single list of tool calls
+mixed the calls of every concurrent investigation and grew until the next
+``complete_investigation``. :class:`SessionToolTracker` keeps one bounded
+trace per session instead:
+
+- Each session holds a ring buffer of its most recent calls, so a runaway
+  investigation cannot grow memory without bound.
+- Sessions are kept in LRU order; idle sessions expire after a TTL and the
+  least recently active session is evicted when ``max_sessions`` is reached.
+
+Every operation on the hot path (``record``) is O(1).
+"""
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+# Most recent tool calls kept per session.
+DEFAULT_MAX_CALLS_PER_SESSION = 200
+
+# Sessions tracked at once; the least recently active is evicted beyond this.
+DEFAULT_MAX_SESSIONS = 1000
+
+# Idle time after which a session's trace is dropped.
+DEFAULT_SESSION_TTL_SECONDS = 6 * 60 * 60
+
+# Key used for calls that arrive without a session ID.
+_NO_SESSION = ""
+
+
+@dataclass
+class SessionToolTrace:
+    """Bounded record of the tool calls made in one session.
+
+    Attributes:
+        calls: Most recent tool calls, oldest first.
+        total_calls: Calls recorded, including ones no longer in ``calls``.
+        last_seen: Monotonic time of the most recent call.
+    """
+
+    calls: deque[str]
+    total_calls: int = 0
+    last_seen: float = 0.0
+
+    def record(self, tool_name: str, now: float) -> None:
+        """Append a call."""
+        self.calls.append(tool_name)
+        self.total_calls += 1
+        self.last_seen = now
+
+    def compact_sequence(self) -> list[str]:
+        """Return the calls with consecutive repeats collapsed.
+
+        Retries and pagination (``fetch_trace`` x5) say nothing about the
+        investigation strategy, so ``a, a, b, a`` becomes ``a, b, a``.
+        """
+        sequence: list[str] = []
+        for tool_name in self.calls:
+            if not sequence or sequence[-1] != tool_name:
+                sequence.append(tool_name)
+        return sequence
+
+
+class SessionToolTracker:
+    """LRU of per-session tool traces with TTL eviction."""
+
+    def __init__(
+        self,
+        max_calls_per_session: int = DEFAULT_MAX_CALLS_PER_SESSION,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            max_calls_per_session: Ring buffer size for each session.
+            max_sessions: Maximum sessions tracked at once.
+            ttl_seconds: Idle time after which a session is dropped.
+        """
+        self.max_calls_per_session = max_calls_per_session
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, SessionToolTrace] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of tracked sessions."""
+        return len(self._sessions)
+
+    def record(self, tool_name: str, session_id: str | None = None) -> int:
+        """Record a tool call for a session.
+
+        Args:
+            tool_name: Name of the tool that was called.
+            session_id: Session the call belongs to.
+
+        Returns:
+            Number of calls recorded for the session so far.
+        """
+        now = time.monotonic()
+        key = session_id or _NO_SESSION
+        trace = self._sessions.get(key)
+        if trace is None:
+            trace = SessionToolTrace(calls=deque(maxlen=self.max_calls_per_session))
+            self._sessions[key] = trace
+        else:
+            self._sessions.move_to_end(key)
+        trace.record(tool_name, now)
+        self._evict(now)
+        return trace.total_calls
+
+    def get(self, session_id: str | None = None) -> SessionToolTrace | None:
+        """Return the live trace for a session, if any."""
+        trace = self._sessions.get(session_id or _NO_SESSION)
+        if trace is None or time.monotonic() - trace.last_seen > self.ttl_seconds:
+            return None
+        return trace
+
+    def sequence(self, session_id: str | None = None) -> list[str]:
+        """Return the compact tool sequence for a session."""
+        trace = self.get(session_id)
+        return trace.compact_sequence() if trace else []
+
+    def reset(self, session_id: str | None = None) -> None:
+        """Forget a session's trace (e.g. when its investigation completes)."""
+        self._sessions.pop(session_id or _NO_SESSION, None)
+
+    def _evict(self, now: float) -> None:
+        # Sessions are in last-active order, so expired ones are at the front.
+        while self._sessions:
+            key, oldest = next(iter(self._sessions.items()))
+            expired = now - oldest.last_seen > self.ttl_seconds
+            if not expired and len(self._sessions) <= self.max_sessions:
+                return
+            del self._sessions[key]
@@ -0,0 +1,235 @@
+"""Write-behind pipeline for memory side effects of tool calls.
+
+The after-tool memory callbacks used to await Memory Bank / SQLite writes and
+mistake-learner updates inline, so memory latency was added to every tool
+call before its result reached the model. Callbacks now enqueue those writes
+on a bounded queue and return immediately; a background worker drains the
+queue and applies the writes in batches.
+
+Batching rules:
+- A batch closes when it reaches ``max_batch`` writes or ``flush_interval_ms``
+  after its first write, whichever comes first.
+- Writes with the same ``key`` (e.g. the same lesson for the same user) are
+  collapsed to the first one in the batch.
+- Unordered writes (findings) are applied concurrently; ordered writes
+  (mistake-learner updates, where a success can only be recognised as a
+  self-correction after the failure was recorded) are applied one at a time
+  in submission order.
+- When the queue is full, new writes are dropped and counted rather than
+  blocking the tool call.
+
+``flush()`` waits for everything queued so far, which makes the pipeline
+deterministic in tests, and ``close()`` flushes on shutdown. Setting
+``SRE_AGENT_MEMORY_WRITE_BEHIND=false`` applies writes inline instead.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MemoryWriteBehindConfig:
+    """Tuning for :class:`MemoryWriteBehind`.
+
+    Attributes:
+        enabled: Queue writes; when False, writes are applied inline.
+        max_queue: Maximum queued writes before new ones are dropped.
+        max_batch: Maximum writes applied per batch.
+        flush_interval_ms: How long a batch stays open for more writes.
+    """
+
+    enabled: bool = True
+    max_queue: int = 1000
+    max_batch: int = 64
+    flush_interval_ms: float = 50.0
+
+    @classmethod
+    def from_env(cls) -> "MemoryWriteBehindConfig":
+        """Build a config from ``SRE_AGENT_MEMORY_WRITE_BEHIND*`` variables."""
+        return cls(
+            enabled=os.environ.get("SRE_AGENT_MEMORY_WRITE_BEHIND", "true").lower()
+            != "false",
+            max_queue=int(
+                os.environ.get("SRE_AGENT_MEMORY_WRITE_BEHIND_QUEUE", "1000")
+            ),
+            max_batch=int(os.environ.get("SRE_AGENT_MEMORY_WRITE_BEHIND_BATCH", "64")),
+            flush_interval_ms=float(
+                os.environ.get("SRE_AGENT_MEMORY_WRITE_BEHIND_FLUSH_MS", "50")
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class MemoryWrite:
+    """A deferred memory side effect.
+
+    Attributes:
+        kind: Short label for logs and stats (e.g. ``"finding"``).
+        run: Coroutine factory that performs the write.
+        key: Dedupe key; writes sharing a key within a batch collapse.
+        ordered: Apply in submission order relative to other ordered writes.
+    """
+
+    kind: str
+    run: Callable[[], Awaitable[Any]]
+    key: str | None = None
+    ordered: bool = False
+
+
+class MemoryWriteBehind:
+    """Bounded queue plus a batching background worker for memory writes."""
+
+    def __init__(self, config: MemoryWriteBehindConfig | None = None) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            config: Queue and batching limits (defaults from the environment).
+        """
+        self.config = config or MemoryWriteBehindConfig.from_env()
+        self._queue: asyncio.Queue[MemoryWrite] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.enqueued = 0
+        self.dropped = 0
+        self.deduped = 0
+        self.applied = 0
+        self.failed = 0
+        self.batches = 0
+
+    def _ensure_worker(self) -> asyncio.Queue[MemoryWrite]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # Queues and tasks are bound to one loop; start fresh on a new one.
+            self._queue = asyncio.Queue(maxsize=self.config.max_queue)
+            self._loop = loop
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, write: MemoryWrite) -> bool:
+        """Queue ``write`` without waiting for it to be applied.
+
+        Args:
+            write: The deferred write.
+
+        Returns:
+            False if the queue was full and the write was dropped.
+        """
+        if not self.config.enabled:
+            await self._apply(write)
+            return True
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait(write)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                f"Memory write-behind queue full ({self.config.max_queue}); "
+                f"dropped {write.kind} write (total dropped: {self.dropped})"
+            )
+            return False
+        self.enqueued += 1
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far has been applied."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush queued writes and stop the worker."""
+        await self.flush()
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue and batching counters for status endpoints."""
+        return {
+            "enabled": self.config.enabled,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "deduped": self.deduped,
+            "applied": self.applied,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    async def _run(self, queue: asyncio.Queue[MemoryWrite]) -> None:
+        window = self.config.flush_interval_ms / 1000
+        while True:
+            batch = [await queue.get()]
+            try:
+                if window > 0 and queue.qsize() < self.config.max_batch - 1:
+                    await asyncio.sleep(window)
+                while len(batch) < self.config.max_batch:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                await self._apply_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _apply_batch(self, batch: list[MemoryWrite]) -> None:
+        seen: set[str] = set()
+        unordered: list[MemoryWrite] = []
+        ordered: list[MemoryWrite] = []
+        for write in batch:
+            if write.key is not None:
+                if write.key in seen:
+                    self.deduped += 1
+                    continue
+                seen.add(write.key)
+            (ordered if write.ordered else unordered).append(write)
+
+        async def apply_in_order() -> None:
+            for write in ordered:
+                await self._apply(write)
+
+        await asyncio.gather(*(self._apply(w) for w in unordered), apply_in_order())
+        self.batches += 1
+
+    async def _apply(self, write: MemoryWrite) -> None:
+        try:
+            await write.run()
+        except Exception:
+            self.failed += 1
+            logger.debug(f"Deferred {write.kind} memory write failed", exc_info=True)
+        else:
+            self.applied += 1
+
+
+_writer: MemoryWriteBehind | None = None
+
+
+def get_memory_writer() -> MemoryWriteBehind:
+    """Get or create the global MemoryWriteBehind singleton.
+
+    Returns:
+        The MemoryWriteBehind instance.
+    """
+    global _writer
+    if _writer is None:
+        _writer = MemoryWriteBehind()
+    return _writer
+
+
+def reset_memory_writer() -> None:
+    """Drop the global MemoryWriteBehind (for tests)."""
+    global _writer
+    _writer = None
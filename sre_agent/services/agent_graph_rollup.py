@@ -0,0 +1,767 @@
+"""Incremental maintenance of the ``agent_graph_hourly`` rollup table.
+
+The Agent Graph setup creates ``agent_graph_hourly`` (partitioned by day,
+clustered by service/source/target) but nothing kept it current from Python.
+This module tracks a per (project, dataset) *watermark* — the exclusive upper
+bound of hours that are fully materialized — and on each refresh recomputes
+only the closed hours since that watermark with a single ``MERGE``.  The
+hourly BigQuery scheduled query created by the setup runs the same refresh
+as a script (:func:`build_scheduled_refresh_sql`).
+
+Late-arriving spans are handled by re-processing a configurable horizon of
+hours *before* the watermark on every run, so a span that lands in BigQuery
+an hour after its start time still ends up in the right bucket.
+
+The current (open) hour is never materialized.  Readers use
+:func:`build_hourly_source_sql` to union the rollup with the raw
+``agent_topology_edges`` view for everything at or after the watermark.
+
+Run as ``python -m sre_agent.services.agent_graph_rollup PROJECT DATASET``
+to print the scheduled refresh script; the setup shell script uses this so
+the scheduled MERGE is generated from the same source as the backend's.
+
+Backends:
+    BigQueryRollupBackend: Production backend (MERGE + watermark table).
+    SqliteRollupBackend: Local SQL engine stand-in for tests and dev.
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_TABLE = "agent_graph_hourly"
+WATERMARK_TABLE = "agent_graph_rollup_state"
+RAW_EDGES_VIEW = "agent_topology_edges"
+NODES_VIEW = "agent_topology_nodes"
+# BigQuery scheduled query that runs the refresh script every hour.
+SCHEDULED_REFRESH_NAME = "Agent Graph Hourly Rollup"
+# Earlier setups scheduled a plain INSERT under this name; it must not run
+# next to the MERGE or it writes a second set of rows for each hour.
+LEGACY_SCHEDULED_QUERY_NAME = "Agent Graph Hourly Refresh"
+
+# Columns shared by the rollup and the raw tail (see build_hourly_source_sql).
+_MERGE_KEY_COLUMNS = (
+    "time_bucket",
+    "source_id",
+    "target_id",
+    "source_type",
+    "target_type",
+)
+
+
+class RollupFreshness(str, Enum):
+    """Freshness of the hourly rollup relative to the last closed hour."""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    UNINITIALIZED = "uninitialized"
+
+
+@dataclass(frozen=True)
+class RollupTarget:
+    """A (project, dataset) pair whose rollup is maintained."""
+
+    project_id: str
+    dataset: str
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used for watermarks and locks."""
+        return f"{self.project_id}.{self.dataset}"
+
+
+@dataclass
+class RollupConfig:
+    """Configuration for rollup maintenance.
+
+    Attributes:
+        reprocess_horizon_hours: Closed hours before the watermark that are
+            recomputed on every run to absorb late-arriving spans.
+        initial_lookback_hours: Window materialized on the first run when no
+            watermark exists yet.
+        max_hours_per_run: Upper bound on hours advanced in a single run so a
+            long outage does not turn into one giant MERGE.
+        stale_after_hours: Lag (watermark vs. open hour) above which the
+            rollup is reported as stale.
+        watermark_ttl_seconds: How long a watermark read from the backend is
+            reused before re-reading it; the scheduled query advances the
+            watermark out of process.
+    """
+
+    reprocess_horizon_hours: int = 2
+    initial_lookback_hours: int = 720
+    max_hours_per_run: int = 72
+    stale_after_hours: float = 2.0
+    watermark_ttl_seconds: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "RollupConfig":
+        """Build a config from ``AGENT_GRAPH_ROLLUP_*`` environment variables."""
+        return cls(
+            reprocess_horizon_hours=int(
+                os.getenv("AGENT_GRAPH_ROLLUP_REPROCESS_HOURS", "2")
+            ),
+            initial_lookback_hours=int(
+                os.getenv("AGENT_GRAPH_ROLLUP_INITIAL_LOOKBACK_HOURS", "720")
+            ),
+            max_hours_per_run=int(os.getenv("AGENT_GRAPH_ROLLUP_MAX_HOURS", "72")),
+            stale_after_hours=float(
+                os.getenv("AGENT_GRAPH_ROLLUP_STALE_AFTER_HOURS", "2")
+            ),
+            watermark_ttl_seconds=float(
+                os.getenv("AGENT_GRAPH_ROLLUP_WATERMARK_TTL_SECONDS", "60")
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class RollupWindow:
+    """Half-open ``[start, end)`` range of closed hours to recompute."""
+
+    start: datetime
+    end: datetime
+
+    @property
+    def hours(self) -> int:
+        """Number of hourly buckets in the window."""
+        return int((self.end - self.start).total_seconds() // 3600)
+
+
+@dataclass(frozen=True)
+class RollupRunResult:
+    """Outcome of a single refresh run."""
+
+    target: RollupTarget
+    window: RollupWindow | None
+    previous_watermark: datetime | None
+    watermark: datetime | None
+    rows_merged: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for API responses."""
+        return {
+            "project_id": self.target.project_id,
+            "dataset": self.target.dataset,
+            "window_start": _iso(self.window.start) if self.window else None,
+            "window_end": _iso(self.window.end) if self.window else None,
+            "hours_processed": self.window.hours if self.window else 0,
+            "previous_watermark": _iso(self.previous_watermark),
+            "watermark": _iso(self.watermark),
+            "rows_merged": self.rows_merged,
+        }
+
+
+class RollupBackend(Protocol):
+    """Storage operations the maintainer needs from a SQL engine."""
+
+    def get_watermark(self, target: RollupTarget) -> datetime | None:
+        """Return the persisted watermark, or None if never run."""
+        ...
+
+    def set_watermark(self, target: RollupTarget, watermark: datetime) -> None:
+        """Persist the watermark for ``target``."""
+        ...
+
+    def merge_hours(self, target: RollupTarget, window: RollupWindow) -> int:
+        """Recompute all buckets in ``window`` from raw edges; return rows merged."""
+        ...
+
+
+def floor_hour(ts: datetime) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _iso(ts: datetime | None) -> str | None:
+    return ts.isoformat() if ts else None
+
+
+def _bq_ts(ts: datetime) -> str:
+    return f"TIMESTAMP('{floor_hour(ts).strftime('%Y-%m-%d %H:%M:%S')} UTC')"
+
+
+# ---------------------------------------------------------------------------
+# SQL generation (BigQuery)
+# ---------------------------------------------------------------------------
+
+_COST_EXPR = (
+    "COALESCE(input_tokens, 0) * CASE WHEN target_id LIKE '%flash%' THEN 0.00000015 "
+    "WHEN target_id LIKE '%2.5-pro%' THEN 0.00000125 WHEN target_id LIKE '%1.5-pro%' "
+    "THEN 0.00000125 ELSE 0.0000005 END + COALESCE(output_tokens, 0) * CASE WHEN "
+    "target_id LIKE '%flash%' THEN 0.0000006 WHEN target_id LIKE '%2.5-pro%' THEN "
+    "0.00001 WHEN target_id LIKE '%1.5-pro%' THEN 0.000005 ELSE 0.000002 END"
+)
+
+
+def _edges_with_nodes_sql(project_id: str, dataset: str) -> str:
+    """``FROM`` clause resolving edge endpoints to their topology nodes.
+
+    Node types, the bucket time and the service come from the nodes table, so
+    the rollup and the raw tail of :func:`build_hourly_source_sql` agree.
+    """
+    return f"""FROM `{project_id}.{dataset}.{RAW_EDGES_VIEW}` e
+      JOIN `{project_id}.{dataset}.{NODES_VIEW}` n_dst
+        ON e.trace_id = n_dst.trace_id AND e.destination_node_id = n_dst.logical_node_id
+      LEFT JOIN `{project_id}.{dataset}.{NODES_VIEW}` n_src
+        ON e.trace_id = n_src.trace_id AND e.source_node_id = n_src.logical_node_id"""
+
+
+def build_rollup_select_sql(target: RollupTarget, window: RollupWindow) -> str:
+    """Build the aggregation that produces ``agent_graph_hourly`` rows.
+
+    Mirrors the setup ``backfill`` step but is bounded to ``window`` so that
+    BigQuery prunes partitions of the underlying ``agent_spans_raw`` view.
+    """
+    return _rollup_select_sql(target, _bq_ts(window.start), _bq_ts(window.end))
+
+
+def _rollup_select_sql(target: RollupTarget, start: str, end: str) -> str:
+    return f"""
+    WITH RawEdges AS (
+      SELECT e.trace_id, e.session_id, TIMESTAMP_TRUNC(n_dst.start_time, HOUR) AS time_bucket,
+        e.source_node_id AS source_id, n_src.node_type AS source_type,
+        e.destination_node_id AS target_id, n_dst.node_type AS target_type,
+        e.edge_weight AS call_count, e.total_duration_ms, e.total_tokens,
+        e.error_count AS edge_error_count, n_dst.total_input_tokens AS input_tokens,
+        n_dst.total_output_tokens AS output_tokens, n_dst.service_name, n_dst.node_description
+      {_edges_with_nodes_sql(target.project_id, target.dataset)}
+      WHERE n_dst.start_time >= {start}
+        AND n_dst.start_time < {end}
+    ),
+    CostPaths AS (
+      SELECT re.*, {_COST_EXPR} AS span_cost FROM RawEdges re
+    )
+    SELECT time_bucket, source_id, target_id, source_type, target_type,
+      SUM(call_count) AS call_count, SUM(edge_error_count) AS error_count,
+      SUM(total_tokens) AS edge_tokens, SUM(input_tokens) AS input_tokens,
+      SUM(output_tokens) AS output_tokens, ROUND(SUM(span_cost), 6) AS total_cost,
+      SUM(total_duration_ms) AS sum_duration_ms, ROUND(MAX(total_duration_ms), 2) AS max_p95_duration_ms,
+      COUNT(DISTINCT session_id) AS unique_sessions, CAST(NULL AS STRING) AS sample_error,
+      SUM(total_tokens) AS node_total_tokens, SUM(input_tokens) AS node_input_tokens,
+      SUM(output_tokens) AS node_output_tokens, SUM(edge_error_count) > 0 AS node_has_error,
+      SUM(total_duration_ms) AS node_sum_duration_ms, ROUND(MAX(total_duration_ms), 2) AS node_max_p95_duration_ms,
+      SUM(edge_error_count) AS node_error_count, SUM(call_count) AS node_call_count,
+      ROUND(SUM(span_cost), 6) AS node_total_cost, ANY_VALUE(node_description) AS node_description,
+      SUM(IF(target_type = 'Tool', call_count, 0)) AS tool_call_count,
+      SUM(IF(target_type = 'LLM', call_count, 0)) AS llm_call_count,
+      SUM(COALESCE(input_tokens, 0) + COALESCE(output_tokens, 0)) AS downstream_total_tokens,
+      ROUND(SUM(span_cost), 6) AS downstream_total_cost,
+      SUM(IF(target_type = 'Tool', call_count, 0)) AS downstream_tool_call_count,
+      SUM(IF(target_type = 'LLM', call_count, 0)) AS downstream_llm_call_count,
+      ARRAY_AGG(DISTINCT session_id IGNORE NULLS) AS session_ids,
+      ANY_VALUE(service_name) AS service_name
+    FROM CostPaths
+    GROUP BY time_bucket, source_id, target_id, source_type, target_type
+    """
+
+
+_ROLLUP_VALUE_COLUMNS = (
+    "call_count",
+    "error_count",
+    "edge_tokens",
+    "input_tokens",
+    "output_tokens",
+    "total_cost",
+    "sum_duration_ms",
+    "max_p95_duration_ms",
+    "unique_sessions",
+    "sample_error",
+    "node_total_tokens",
+    "node_input_tokens",
+    "node_output_tokens",
+    "node_has_error",
+    "node_sum_duration_ms",
+    "node_max_p95_duration_ms",
+    "node_error_count",
+    "node_call_count",
+    "node_total_cost",
+    "node_description",
+    "tool_call_count",
+    "llm_call_count",
+    "downstream_total_tokens",
+    "downstream_total_cost",
+    "downstream_tool_call_count",
+    "downstream_llm_call_count",
+    "session_ids",
+    "service_name",
+)
+
+
+def build_merge_sql(target: RollupTarget, window: RollupWindow) -> str:
+    """Build the ``MERGE`` that replaces every bucket inside ``window``.
+
+    Matched keys are updated, new keys inserted, and keys that no longer
+    appear in the recomputed source (e.g. after a span was re-parented) are
+    deleted — but only inside the window, so older partitions are untouched.
+    """
+    return _merge_sql(target, _bq_ts(window.start), _bq_ts(window.end))
+
+
+def _merge_sql(target: RollupTarget, start: str, end: str) -> str:
+    pd, gd = target.project_id, target.dataset
+    on_clause = " AND ".join(
+        f"T.{col} IS NOT DISTINCT FROM S.{col}" for col in _MERGE_KEY_COLUMNS
+    )
+    update_clause = ", ".join(f"{col} = S.{col}" for col in _ROLLUP_VALUE_COLUMNS)
+    return f"""
+    MERGE `{pd}.{gd}.{ROLLUP_TABLE}` T
+    USING ({_rollup_select_sql(target, start, end)}) S
+    ON {on_clause}
+    WHEN MATCHED THEN UPDATE SET {update_clause}
+    WHEN NOT MATCHED BY TARGET THEN INSERT ROW
+    WHEN NOT MATCHED BY SOURCE
+      AND T.time_bucket >= {start}
+      AND T.time_bucket < {end}
+    THEN DELETE
+    """
+
+
+def _set_watermark_sql(target: RollupTarget, watermark: str) -> str:
+    return f"""
+    MERGE `{target.project_id}.{target.dataset}.{WATERMARK_TABLE}` T
+    USING (SELECT '{target.key}' AS target, {watermark} AS watermark) S
+    ON T.target = S.target
+    WHEN MATCHED THEN UPDATE SET watermark = S.watermark, updated_at = CURRENT_TIMESTAMP()
+    WHEN NOT MATCHED THEN INSERT (target, watermark, updated_at)
+      VALUES (S.target, S.watermark, CURRENT_TIMESTAMP())
+    """
+
+
+def build_watermark_table_sql(target: RollupTarget) -> str:
+    """DDL for the watermark bookkeeping table."""
+    return f"""
+    CREATE TABLE IF NOT EXISTS `{target.project_id}.{target.dataset}.{WATERMARK_TABLE}` (
+      target STRING NOT NULL, watermark TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    ) OPTIONS (description = 'Watermarks for incremental agent_graph_hourly maintenance');
+    """
+
+
+def build_scheduled_refresh_sql(
+    target: RollupTarget, config: RollupConfig | None = None
+) -> str:
+    """Build the BigQuery script run by the hourly scheduled query.
+
+    Performs the same watermark-bounded ``MERGE`` as
+    :meth:`AgentGraphRollupMaintainer.refresh` (same window planning), so the
+    scheduled query and on-demand ``/rollup/refresh`` calls can run side by
+    side without writing duplicate rows.
+    """
+    cfg = config or RollupConfig()
+    watermark_ref = f"`{target.project_id}.{target.dataset}.{WATERMARK_TABLE}`"
+    return f"""
+    DECLARE watermark, window_start, window_end TIMESTAMP;
+    DECLARE open_hour TIMESTAMP DEFAULT TIMESTAMP_TRUNC(CURRENT_TIMESTAMP(), HOUR);
+    {build_watermark_table_sql(target).strip()}
+    SET watermark = (
+      SELECT MAX(watermark) FROM {watermark_ref} WHERE target = '{target.key}'
+    );
+    SET window_start = IFNULL(
+      TIMESTAMP_SUB(watermark, INTERVAL {cfg.reprocess_horizon_hours} HOUR),
+      TIMESTAMP_SUB(open_hour, INTERVAL {cfg.initial_lookback_hours} HOUR)
+    );
+    SET window_end = LEAST(
+      open_hour,
+      TIMESTAMP_ADD(IFNULL(watermark, window_start), INTERVAL {cfg.max_hours_per_run} HOUR)
+    );
+    IF window_start < window_end THEN
+      {_merge_sql(target, "window_start", "window_end").strip()};
+      {_set_watermark_sql(target, "GREATEST(window_end, IFNULL(watermark, window_end))").strip()};
+    END IF;
+    """
+
+
+def build_hourly_source_sql(
+    project_id: str, dataset: str, watermark: datetime | None = None
+) -> str:
+    """Build a subquery exposing hourly rows with a raw tail for open hours.
+
+    Rows before the watermark come from ``agent_graph_hourly``; rows at or
+    after it are aggregated on the fly from ``agent_topology_edges`` joined to
+    ``agent_topology_nodes`` exactly as the rollup does.  Without a watermark
+    no hour is known to be merged, so every row is read raw.
+
+    The result exposes ``time_bucket, source_id, source_type, target_id,
+    target_type, call_count, sum_duration_ms, error_count, edge_tokens,
+    service_name`` so it can replace the table in ``FROM`` clauses.
+    """
+    raw_tail = f"""
+      SELECT TIMESTAMP_TRUNC(n_dst.start_time, HOUR) AS time_bucket,
+        e.source_node_id AS source_id, n_src.node_type AS source_type,
+        e.destination_node_id AS target_id, n_dst.node_type AS target_type,
+        e.edge_weight AS call_count, e.total_duration_ms AS sum_duration_ms,
+        e.error_count, e.total_tokens AS edge_tokens, n_dst.service_name
+      {_edges_with_nodes_sql(project_id, dataset)}
+    """
+    if watermark is None:
+        return raw_tail
+    boundary = _bq_ts(watermark)
+    return f"""
+      SELECT time_bucket, source_id, source_type, target_id, target_type,
+        call_count, sum_duration_ms, error_count, edge_tokens, service_name
+      FROM `{project_id}.{dataset}.{ROLLUP_TABLE}`
+      WHERE time_bucket < {boundary}
+      UNION ALL{raw_tail.rstrip()}
+      WHERE n_dst.start_time >= {boundary}
+    """
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class BigQueryRollupBackend:
+    """Rollup backend running MERGE statements on BigQuery."""
+
+    def __init__(self, client_factory: Callable[[str], Any]) -> None:
+        """Initialize with a ``project_id -> bigquery.Client`` factory."""
+        self._client_factory = client_factory
+
+    def _query(self, target: RollupTarget, sql: str) -> Any:
+        return self._client_factory(target.project_id).query_and_wait(sql)
+
+    def ensure_watermark_table(self, target: RollupTarget) -> None:
+        """Create the watermark table if it does not exist."""
+        self._query(target, build_watermark_table_sql(target))
+
+    def get_watermark(self, target: RollupTarget) -> datetime | None:
+        """Read the watermark row for ``target``."""
+        sql = f"""
+        SELECT MAX(watermark) AS watermark
+        FROM `{target.project_id}.{target.dataset}.{WATERMARK_TABLE}`
+        WHERE target = '{target.key}'
+        """
+        for row in self._query(target, sql):
+            value = row.get("watermark") if hasattr(row, "get") else row[0]
+            if isinstance(value, datetime):
+                return floor_hour(value)
+        return None
+
+    def set_watermark(self, target: RollupTarget, watermark: datetime) -> None:
+        """Upsert the watermark row for ``target``."""
+        self._query(target, _set_watermark_sql(target, _bq_ts(watermark)))
+
+    def merge_hours(self, target: RollupTarget, window: RollupWindow) -> int:
+        """Run the bounded MERGE and return the affected row count."""
+        client = self._client_factory(target.project_id)
+        result = client.query_and_wait(build_merge_sql(target, window))
+        return int(getattr(result, "num_dml_affected_rows", None) or 0)
+
+
+_SQLITE_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class SqliteRollupBackend:
+    """Local SQL engine stand-in with the same semantics as the BigQuery MERGE.
+
+    Uses ``INSERT ... ON CONFLICT DO UPDATE`` for matched/unmatched-by-target
+    rows and a bounded ``DELETE`` for rows not matched by source.  Timestamps
+    are stored as UTC ``YYYY-MM-DD HH:MM:SS`` strings.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        """Initialize with an open connection and create the schema."""
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS {RAW_EDGES_VIEW} (
+                    trace_id TEXT, session_id TEXT, start_time TEXT NOT NULL,
+                    source_node_id TEXT, destination_node_id TEXT,
+                    edge_weight INTEGER, total_duration_ms REAL, total_tokens INTEGER,
+                    error_count INTEGER, service_name TEXT
+                );
+                CREATE TABLE IF NOT EXISTS {ROLLUP_TABLE} (
+                    time_bucket TEXT NOT NULL, source_id TEXT, target_id TEXT,
+                    source_type TEXT, target_type TEXT, call_count INTEGER,
+                    error_count INTEGER, edge_tokens INTEGER, sum_duration_ms REAL,
+                    unique_sessions INTEGER, service_name TEXT,
+                    PRIMARY KEY (time_bucket, source_id, target_id, source_type, target_type)
+                );
+                CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+                    target TEXT PRIMARY KEY, watermark TEXT NOT NULL, updated_at TEXT NOT NULL
+                );
+                """
+            )
+
+    def get_watermark(self, target: RollupTarget) -> datetime | None:
+        """Read the watermark row for ``target``."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT watermark FROM {WATERMARK_TABLE} WHERE target = ?",
+                (target.key,),
+            ).fetchone()
+        if not row:
+            return None
+        return datetime.strptime(row[0], _SQLITE_TS_FORMAT).replace(tzinfo=timezone.utc)
+
+    def set_watermark(self, target: RollupTarget, watermark: datetime) -> None:
+        """Upsert the watermark row for ``target``."""
+        now = datetime.now(timezone.utc).strftime(_SQLITE_TS_FORMAT)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"""
+                INSERT INTO {WATERMARK_TABLE} (target, watermark, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(target) DO UPDATE SET
+                    watermark = excluded.watermark, updated_at = excluded.updated_at
+                """,
+                (target.key, floor_hour(watermark).strftime(_SQLITE_TS_FORMAT), now),
+            )
+
+    def merge_hours(self, target: RollupTarget, window: RollupWindow) -> int:
+        """Recompute all buckets in ``window`` inside one transaction."""
+        start = window.start.strftime(_SQLITE_TS_FORMAT)
+        end = window.end.strftime(_SQLITE_TS_FORMAT)
+        source_sql = f"""
+            SELECT strftime('%Y-%m-%d %H:00:00', start_time) AS time_bucket,
+                source_node_id AS source_id, destination_node_id AS target_id,
+                substr(source_node_id, 1, instr(source_node_id, '::') - 1) AS source_type,
+                substr(destination_node_id, 1, instr(destination_node_id, '::') - 1)
+                    AS target_type,
+                SUM(edge_weight) AS call_count, SUM(error_count) AS error_count,
+                SUM(total_tokens) AS edge_tokens, SUM(total_duration_ms) AS sum_duration_ms,
+                COUNT(DISTINCT session_id) AS unique_sessions, MAX(service_name) AS service_name
+            FROM {RAW_EDGES_VIEW}
+            WHERE start_time >= :start AND start_time < :end
+            GROUP BY 1, 2, 3, 4, 5
+        """
+        with self._lock, self._conn:
+            # WHEN NOT MATCHED BY SOURCE (bounded to the window) THEN DELETE
+            self._conn.execute(
+                f"""
+                DELETE FROM {ROLLUP_TABLE}
+                WHERE time_bucket >= :start AND time_bucket < :end
+                  AND (time_bucket, source_id, target_id, source_type, target_type)
+                      NOT IN (SELECT time_bucket, source_id, target_id,
+                                     source_type, target_type FROM ({source_sql}))
+                """,
+                {"start": start, "end": end},
+            )
+            # WHEN MATCHED THEN UPDATE / WHEN NOT MATCHED BY TARGET THEN INSERT
+            cursor = self._conn.execute(
+                f"""
+                INSERT INTO {ROLLUP_TABLE} (
+                    time_bucket, source_id, target_id, source_type, target_type,
+                    call_count, error_count, edge_tokens, sum_duration_ms,
+                    unique_sessions, service_name
+                )
+                SELECT * FROM ({source_sql}) WHERE true
+                ON CONFLICT (time_bucket, source_id, target_id, source_type, target_type)
+                DO UPDATE SET
+                    call_count = excluded.call_count,
+                    error_count = excluded.error_count,
+                    edge_tokens = excluded.edge_tokens,
+                    sum_duration_ms = excluded.sum_duration_ms,
+                    unique_sessions = excluded.unique_sessions,
+                    service_name = excluded.service_name
+                """,
+                {"start": start, "end": end},
+            )
+            return int(cursor.rowcount)
+
+
+# ---------------------------------------------------------------------------
+# Maintainer
+# ---------------------------------------------------------------------------
+
+
+class AgentGraphRollupMaintainer:
+    """Keeps ``agent_graph_hourly`` incrementally up to date per target.
+
+    Thread-safe: concurrent refreshes of the same target are serialized so
+    two replicas' worth of requests never MERGE the same window twice in
+    one process.
+    """
+
+    def __init__(
+        self,
+        backend: RollupBackend,
+        config: RollupConfig | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initialize the maintainer.
+
+        Args:
+            backend: SQL backend implementing watermark and MERGE operations.
+            config: Maintenance configuration (defaults to env-derived).
+            clock: Injectable ``now()`` for tests; defaults to UTC wall clock.
+        """
+        self._backend = backend
+        self._config = config or RollupConfig.from_env()
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        # target key -> (watermark, clock time it was read from the backend)
+        self._watermarks: dict[str, tuple[datetime | None, datetime]] = {}
+        self._last_runs: dict[str, RollupRunResult] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @property
+    def config(self) -> RollupConfig:
+        """Active maintenance configuration."""
+        return self._config
+
+    def _lock_for(self, target: RollupTarget) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(target.key, threading.Lock())
+
+    def open_hour_start(self) -> datetime:
+        """Start of the current, still-open hour."""
+        return floor_hour(self._clock())
+
+    def plan_window(self, watermark: datetime | None) -> RollupWindow | None:
+        """Compute the closed-hour window to recompute for a watermark.
+
+        Returns:
+            The window, or None when there is nothing closed to process.
+        """
+        cfg = self._config
+        last_closed_end = self.open_hour_start()
+        if watermark is None:
+            start = last_closed_end - timedelta(hours=cfg.initial_lookback_hours)
+            progress_from = start
+        else:
+            watermark = floor_hour(watermark)
+            start = watermark - timedelta(hours=cfg.reprocess_horizon_hours)
+            progress_from = watermark
+        end = min(
+            last_closed_end, progress_from + timedelta(hours=cfg.max_hours_per_run)
+        )
+        if start >= end:
+            return None
+        return RollupWindow(start=start, end=end)
+
+    def get_watermark(self, target: RollupTarget) -> datetime | None:
+        """Return the watermark, re-reading the backend once the TTL expires.
+
+        The scheduled query advances the watermark outside this process, so
+        a cached value is only reused for ``watermark_ttl_seconds``.
+        """
+        now = self._clock()
+        cached = self._watermarks.get(target.key)
+        if cached is not None:
+            watermark, read_at = cached
+            age = (now - read_at).total_seconds()
+            if 0 <= age < self._config.watermark_ttl_seconds:
+                return watermark
+        watermark = self._backend.get_watermark(target)
+        self._watermarks[target.key] = (watermark, now)
+        return watermark
+
+    def refresh(self, target: RollupTarget) -> RollupRunResult:
+        """Recompute closed hours since the watermark and advance it."""
+        with self._lock_for(target):
+            previous = self._backend.get_watermark(target)
+            self._watermarks[target.key] = (previous, self._clock())
+            window = self.plan_window(previous)
+            if window is None:
+                result = RollupRunResult(
+                    target=target,
+                    window=None,
+                    previous_watermark=previous,
+                    watermark=previous,
+                )
+            else:
+                rows = self._backend.merge_hours(target, window)
+                new_watermark = (
+                    max(window.end, previous) if previous is not None else window.end
+                )
+                self._backend.set_watermark(target, new_watermark)
+                self._watermarks[target.key] = (new_watermark, self._clock())
+                result = RollupRunResult(
+                    target=target,
+                    window=window,
+                    previous_watermark=previous,
+                    watermark=new_watermark,
+                    rows_merged=rows,
+                )
+                logger.info(
+                    f"Rolled up {window.hours}h for {target.key} "
+                    f"({rows} rows, watermark -> {new_watermark.isoformat()})"
+                )
+            self._last_runs[target.key] = result
+            return result
+
+    def get_status(self, target: RollupTarget) -> dict[str, Any]:
+        """Report rollup freshness for ``target``."""
+        watermark = self.get_watermark(target)
+        open_hour = self.open_hour_start()
+        if watermark is None:
+            freshness = RollupFreshness.UNINITIALIZED
+            lag_hours: float | None = None
+        else:
+            lag_hours = max(0.0, (open_hour - watermark).total_seconds() / 3600)
+            freshness = (
+                RollupFreshness.FRESH
+                if lag_hours <= self._config.stale_after_hours
+                else RollupFreshness.STALE
+            )
+        last_run = self._last_runs.get(target.key)
+        return {
+            "project_id": target.project_id,
+            "dataset": target.dataset,
+            "status": freshness.value,
+            "watermark": _iso(watermark),
+            "open_hour_start": _iso(open_hour),
+            "lag_hours": lag_hours,
+            "raw_fallback_from": _iso(watermark),
+            "reprocess_horizon_hours": self._config.reprocess_horizon_hours,
+            "last_run": last_run.to_dict() if last_run else None,
+        }
+
+
+_maintainer: AgentGraphRollupMaintainer | None = None
+
+
+def get_rollup_maintainer() -> AgentGraphRollupMaintainer:
+    """Get the process-wide BigQuery-backed rollup maintainer."""
+    global _maintainer
+    if _maintainer is None:
+        from google.cloud import bigquery
+
+        from sre_agent.auth import GLOBAL_CONTEXT_CREDENTIALS
+
+        def _client(project_id: str) -> Any:
+            return bigquery.Client(
+                project=project_id, credentials=GLOBAL_CONTEXT_CREDENTIALS
+            )
+
+        _maintainer = AgentGraphRollupMaintainer(BigQueryRollupBackend(_client))
+    return _maintainer
+
+
+def reset_rollup_maintainer() -> None:
+    """Reset the singleton (for testing)."""
+    global _maintainer
+    _maintainer = None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the scheduled refresh script for a (project, dataset) target."""
+    parser = argparse.ArgumentParser(
+        description="Print the agent_graph_hourly scheduled refresh script."
+    )
+    parser.add_argument("project_id")
+    parser.add_argument("dataset")
+    args = parser.parse_args(argv)
+    target = RollupTarget(args.project_id, args.dataset)
+    print(build_scheduled_refresh_sql(target, RollupConfig.from_env()).strip())
+
+
+if __name__ == "__main__":
+    main()
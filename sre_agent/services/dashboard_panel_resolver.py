@@ -0,0 +1,434 @@
+"""Batched data resolution for dashboard panels.
+
+Loading a dashboard used to issue one backend call per panel query, even when
+several panels chart the same metric with different aggregations or show the
+same log stream. :class:`PanelQueryResolver` plans all panel queries of a
+dashboard first and then runs the minimum set of backend calls:
+
+- Metric queries are keyed by filter only (aggregation and grouping are
+  display options), PromQL queries by expression and step, and trace
+  queries by filter, so identical queries collapse into one call.
+- Log queries with the same filter, resource type and severity levels
+  collapse into one call. Panels with different severities are fetched
+  separately so each gets its own ``log_limit`` entries.
+- Time windows are aligned to ``cache_window_seconds`` so every panel, and
+  every dashboard loaded within the same window, shares one result per
+  backend query. Results are cached per credential principal and concurrent
+  loads share in-flight calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class QueryKind(str, Enum):
+    """Backends a panel query can target."""
+
+    METRICS = "metrics"
+    PROMQL = "promql"
+    LOGS = "logs"
+    TRACES = "traces"
+
+
+@dataclass(frozen=True)
+class BackendQuery:
+    """One deduplicated backend call.
+
+    Attributes:
+        kind: Target backend.
+        project_id: Project to query.
+        expression: Filter string, or PromQL expression for ``PROMQL``.
+        minutes_ago: Lookback window.
+        step: PromQL resolution step.
+        severities: Log severities to fetch; empty fetches all.
+        limit: Maximum log entries or traces.
+    """
+
+    kind: QueryKind
+    project_id: str | None
+    expression: str
+    minutes_ago: int
+    step: str = "60s"
+    severities: frozenset[str] = frozenset()
+    limit: int = 0
+
+
+@dataclass
+class PanelQueryRef:
+    """Where one panel query's data comes from.
+
+    Attributes:
+        panel_id: The panel.
+        ref_id: The query's ``ref_id`` (or its index within the panel).
+        query: The backend call that serves it.
+        severities: Severities this panel shows (logs only; empty is all).
+    """
+
+    panel_id: str
+    ref_id: str
+    query: BackendQuery
+    severities: frozenset[str] = frozenset()
+
+
+@dataclass
+class ResolutionPlan:
+    """Panel queries of one dashboard mapped onto backend calls."""
+
+    refs: list[PanelQueryRef] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def queries(self) -> list[BackendQuery]:
+        """The distinct backend calls, in first-use order."""
+        return list(dict.fromkeys(ref.query for ref in self.refs))
+
+
+@dataclass(frozen=True)
+class PanelResolverConfig:
+    """Tuning for :class:`PanelQueryResolver`.
+
+    Attributes:
+        cache_window_seconds: Width of the aligned time window results are
+            shared within.
+        log_limit: Log entries fetched per log query.
+        trace_limit: Traces fetched per trace query.
+        max_cached: Cached backend results kept.
+    """
+
+    cache_window_seconds: float = 60.0
+    log_limit: int = 200
+    trace_limit: int = 20
+    max_cached: int = 512
+
+    @classmethod
+    def from_env(cls) -> PanelResolverConfig:
+        """Build a config from ``SRE_AGENT_PANEL_*`` environment variables."""
+        return cls(
+            cache_window_seconds=float(
+                os.environ.get("SRE_AGENT_PANEL_CACHE_WINDOW_SECONDS", "60")
+            ),
+            log_limit=int(os.environ.get("SRE_AGENT_PANEL_LOG_LIMIT", "200")),
+            trace_limit=int(os.environ.get("SRE_AGENT_PANEL_TRACE_LIMIT", "20")),
+        )
+
+
+Fetcher = Callable[[BackendQuery, datetime], Awaitable[Any]]
+
+
+def _panel_queries(panel: dict[str, Any]) -> list[dict[str, Any]]:
+    queries = panel.get("queries") or []
+    return [q for q in queries if isinstance(q, dict) and not q.get("hidden")]
+
+
+def plan_dashboard(
+    dashboard: dict[str, Any],
+    project_id: str | None,
+    minutes_ago: int,
+    config: PanelResolverConfig | None = None,
+) -> ResolutionPlan:
+    """Map every visible panel query onto a deduplicated backend call.
+
+    Args:
+        dashboard: Dashboard document.
+        project_id: Project to query (defaults to the dashboard's).
+        minutes_ago: Lookback window for every panel.
+        config: Limits for log and trace queries.
+
+    Returns:
+        The plan. Queries with no supported datasource are counted as skipped.
+    """
+    config = config or PanelResolverConfig()
+    project_id = project_id or dashboard.get("project_id")
+    plan = ResolutionPlan()
+
+    for panel in dashboard.get("panels", []):
+        panel_id = str(panel.get("id", ""))
+        for index, query in enumerate(_panel_queries(panel)):
+            ref_id = str(query.get("ref_id") or index)
+            datasource = (query.get("datasource") or {}).get("type")
+            monitoring = query.get("cloud_monitoring") or {}
+            prometheus = query.get("prometheus") or {}
+            logs = query.get("logs") or {}
+            if prometheus.get("expr") or monitoring.get("promql_query"):
+                backend = BackendQuery(
+                    QueryKind.PROMQL,
+                    project_id,
+                    prometheus.get("expr") or monitoring["promql_query"],
+                    minutes_ago,
+                    step=prometheus.get("step") or "60s",
+                )
+            elif monitoring.get("filter_str"):
+                backend = BackendQuery(
+                    QueryKind.METRICS, project_id, monitoring["filter_str"], minutes_ago
+                )
+            elif datasource == "tempo" and logs.get("filter_str") is not None:
+                backend = BackendQuery(
+                    QueryKind.TRACES,
+                    project_id,
+                    logs["filter_str"],
+                    minutes_ago,
+                    limit=config.trace_limit,
+                )
+            elif logs.get("filter_str") is not None:
+                expression = logs["filter_str"]
+                if logs.get("resource_type"):
+                    expression = (
+                        f'({expression}) AND resource.type="{logs["resource_type"]}"'
+                        if expression
+                        else f'resource.type="{logs["resource_type"]}"'
+                    )
+                severities = frozenset(
+                    s.upper() for s in logs.get("severity_levels") or []
+                )
+                backend = BackendQuery(
+                    QueryKind.LOGS,
+                    project_id,
+                    expression,
+                    minutes_ago,
+                    severities=severities,
+                    limit=config.log_limit,
+                )
+                plan.refs.append(PanelQueryRef(panel_id, ref_id, backend, severities))
+                continue
+            else:
+                plan.skipped += 1
+                continue
+            plan.refs.append(PanelQueryRef(panel_id, ref_id, backend))
+    return plan
+
+
+def _log_filter(query: BackendQuery, start: datetime) -> str:
+    clauses = [f'timestamp>="{start.isoformat()}"']
+    if query.expression:
+        clauses.insert(0, f"({query.expression})")
+    if query.severities:
+        clauses.append(
+            "(" + " OR ".join(f"severity={s}" for s in sorted(query.severities)) + ")"
+        )
+    return " AND ".join(clauses)
+
+
+def _unwrap(result: Any) -> Any:
+    from sre_agent.schema import BaseToolResponse
+
+    if isinstance(result, BaseToolResponse):
+        if result.error:
+            raise RuntimeError(result.error)
+        return result.result
+    return result
+
+
+async def _fetch_metrics(query: BackendQuery, start: datetime) -> Any:
+    from sre_agent.tools import list_time_series
+    from sre_agent.tools.analysis import genui_adapter
+
+    # list_time_series only looks back from now; widen the lookback so the
+    # series still starts at the aligned window start.
+    elapsed = (datetime.now(timezone.utc) - start).total_seconds()
+    raw = _unwrap(
+        await list_time_series(
+            filter_str=query.expression,
+            minutes_ago=max(query.minutes_ago, math.ceil(elapsed / 60)),
+            project_id=query.project_id,
+        )
+    )
+    return genui_adapter.transform_metrics(raw)
+
+
+async def _fetch_promql(query: BackendQuery, start: datetime) -> Any:
+    from sre_agent.tools import query_promql
+    from sre_agent.tools.analysis import genui_adapter
+
+    raw = _unwrap(
+        await query_promql(
+            query=query.expression,
+            start=start.isoformat(),
+            end=(start + timedelta(minutes=query.minutes_ago)).isoformat(),
+            step=query.step,
+            project_id=query.project_id,
+        )
+    )
+    return genui_adapter.transform_metrics(raw)
+
+
+async def _fetch_logs(query: BackendQuery, start: datetime) -> Any:
+    from sre_agent.tools import list_log_entries
+
+    raw = _unwrap(
+        await list_log_entries(
+            filter_str=_log_filter(query, start),
+            project_id=query.project_id,
+            limit=query.limit,
+        )
+    )
+    if isinstance(raw, dict):
+        return list(raw.get("entries", []))
+    return raw if isinstance(raw, list) else []
+
+
+async def _fetch_traces(query: BackendQuery, start: datetime) -> Any:
+    from sre_agent.tools import list_traces
+
+    return _unwrap(
+        await list_traces(
+            project_id=query.project_id,
+            start_time=start.isoformat(),
+            limit=query.limit,
+            filter_str=query.expression,
+        )
+    )
+
+
+DEFAULT_FETCHERS: Mapping[QueryKind, Fetcher] = {
+    QueryKind.METRICS: _fetch_metrics,
+    QueryKind.PROMQL: _fetch_promql,
+    QueryKind.LOGS: _fetch_logs,
+    QueryKind.TRACES: _fetch_traces,
+}
+
+
+class PanelQueryResolver:
+    """Resolves panel data with deduplicated, window-cached backend calls."""
+
+    def __init__(
+        self,
+        config: PanelResolverConfig | None = None,
+        fetchers: Mapping[QueryKind, Fetcher] | None = None,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            config: Window and limit tuning (defaults from the environment).
+            fetchers: Backend call per query kind (defaults to the tools).
+        """
+        self.config = config or PanelResolverConfig.from_env()
+        self._fetchers = dict(fetchers or DEFAULT_FETCHERS)
+        self._results: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self.backend_calls = 0
+        self.cache_hits = 0
+
+    def _window(self) -> tuple[int, datetime]:
+        """Return the current window number and its aligned end time."""
+        width = max(self.config.cache_window_seconds, 0.001)
+        window = int(time.time() // width)
+        return window, datetime.fromtimestamp(window * width, tz=timezone.utc)
+
+    async def resolve(
+        self,
+        dashboard: dict[str, Any],
+        project_id: str | None = None,
+        minutes_ago: int = 60,
+    ) -> dict[str, Any]:
+        """Fetch the data behind every panel of ``dashboard``.
+
+        Args:
+            dashboard: Dashboard document.
+            project_id: Project to query (defaults to the dashboard's).
+            minutes_ago: Lookback window for every panel.
+
+        Returns:
+            ``{"panels": {panel_id: [{"ref_id", "kind", "data" | "error"}]},
+            "stats": {...}}``. A failing backend call only fails the panel
+            queries it serves.
+        """
+        from sre_agent.services.telemetry_catalog import current_principal
+
+        plan = plan_dashboard(dashboard, project_id, minutes_ago, self.config)
+        window, end = self._window()
+        principal = current_principal()
+        calls_before, hits_before = self.backend_calls, self.cache_hits
+
+        queries = plan.queries
+        outcomes = await asyncio.gather(
+            *(self._run(q, principal, window, end) for q in queries),
+            return_exceptions=True,
+        )
+        results = dict(zip(queries, outcomes, strict=True))
+
+        panels: dict[str, list[dict[str, Any]]] = {}
+        for ref in plan.refs:
+            outcome = results[ref.query]
+            item: dict[str, Any] = {"ref_id": ref.ref_id, "kind": ref.query.kind.value}
+            if isinstance(outcome, BaseException):
+                item["error"] = str(outcome)
+            else:
+                item["data"] = outcome
+            panels.setdefault(ref.panel_id, []).append(item)
+
+        return {
+            "panels": panels,
+            "stats": {
+                "panel_queries": len(plan.refs),
+                "backend_queries": len(queries),
+                "backend_calls": self.backend_calls - calls_before,
+                "cache_hits": self.cache_hits - hits_before,
+                "skipped": plan.skipped,
+            },
+        }
+
+    async def _run(
+        self, query: BackendQuery, principal: str, window: int, end: datetime
+    ) -> Any:
+        key = (principal, window, query)
+        future = self._results.get(key)
+        if future is not None:
+            self.cache_hits += 1
+            return await asyncio.shield(future)
+        self.backend_calls += 1
+        start = end - timedelta(minutes=query.minutes_ago)
+        future = asyncio.ensure_future(self._fetchers[query.kind](query, start))
+        self._results[key] = future
+        future.add_done_callback(lambda f: self._settle(key, f, window))
+        return await asyncio.shield(future)
+
+    def _settle(
+        self, key: tuple[Any, ...], future: asyncio.Future[Any], window: int
+    ) -> None:
+        # Failures are not cached; the next load retries them.
+        if future.cancelled() or future.exception() is not None:
+            if self._results.get(key) is future:
+                del self._results[key]
+            if not future.cancelled():
+                logger.warning(
+                    f"Panel query {key[2].kind.value} failed: {future.exception()}"
+                )
+        # Drop results from earlier windows, oldest first.
+        for stale in [k for k in self._results if k[1] < window]:
+            if self._results[stale].done():
+                del self._results[stale]
+        while len(self._results) > self.config.max_cached:
+            oldest = next(iter(self._results))
+            del self._results[oldest]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
+
+
+_resolver: PanelQueryResolver | None = None
+
+
+def get_panel_resolver() -> PanelQueryResolver:
+    """Get the shared panel query resolver."""
+    global _resolver
+    if _resolver is None:
+        _resolver = PanelQueryResolver()
+    return _resolver
+
+
+def reset_panel_resolver() -> None:
+    """Drop the shared resolver and its cached results (for tests)."""
+    global _resolver
+    _resolver = None
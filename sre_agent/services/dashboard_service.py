@@ -7,28 +7,42 @@ spec defined in sre_agent.models.dashboard.
 Includes support for:
 - OOTB (out-of-the-box) dashboard templates for cloud services
 - Custom panel creation (metric charts, log panels, trace lists)
+
+Local dashboards are persisted in an indexed SQLite table
+(:class:`~sre_agent.services.dashboard_store.DashboardStore`) at
+``SRE_AGENT_DASHBOARD_DB`` (default ``.sre_agent_memory.db``). Replicas share
+dashboards only if that file is on a shared volume.
 """
 
 import copy
 import logging
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sre_agent.models.dashboard import DashboardSource
+from sre_agent.services.dashboard_store import DashboardStore
 
 logger = logging.getLogger(__name__)
 
-# In-memory dashboard store (replaced by DB in production)
-_dashboard_store: dict[str, dict[str, Any]] = {}
+# Cloud Monitoring dashboard listings are reused for this long.
+CLOUD_DASHBOARD_TTL_SECONDS = 60.0
 
 
 class DashboardService:
     """Service for managing dashboards."""
 
-    def __init__(self) -> None:
-        """Initialize the dashboard service."""
-        self._store = _dashboard_store
+    def __init__(self, store: DashboardStore | None = None) -> None:
+        """Initialize the dashboard service.
+
+        Args:
+            store: Dashboard persistence (defaults to ``SRE_AGENT_DASHBOARD_DB``).
+        """
+        self._store = store or DashboardStore(
+            os.environ.get("SRE_AGENT_DASHBOARD_DB", ".sre_agent_memory.db")
+        )
+        self._cloud_cache: dict[tuple[str, str], tuple[float, list[Any]]] = {}
 
     async def list_dashboards(
         self,
@@ -36,52 +50,52 @@ class DashboardService:
         include_cloud: bool = True,
         page_size: int = 50,
         page_token: str | None = None,
+        owner: str | None = None,
     ) -> dict[str, Any]:
         """List all dashboards (local + Cloud Monitoring).
 
+        Local dashboards are returned most recently updated first, one page
+        at a time. Cloud Monitoring dashboards carry no update time and are
+        appended to the first page, so single-page clients always see them.
+
         Args:
-            project_id: GCP project ID for cloud dashboards.
+            project_id: GCP project ID; filters local dashboards (dashboards
+                saved without a project are always included) and selects the
+                project for cloud dashboards.
             include_cloud: Whether to include Cloud Monitoring dashboards.
-            page_size: Maximum number of results.
-            page_token: Pagination token.
+            page_size: Maximum number of local results.
+            page_token: Pagination token from the previous page.
+            owner: Only local dashboards created by this user.
 
         Returns:
             Dict with dashboards list and pagination info.
-        """
-        dashboards: list[dict[str, Any]] = []
 
-        # Local dashboards
-        for dash_id, dash_data in self._store.items():
-            dashboards.append(
-                {
-                    "id": dash_id,
-                    "display_name": dash_data.get("display_name", "Untitled"),
-                    "description": dash_data.get("description", ""),
-                    "source": dash_data.get("source", DashboardSource.LOCAL.value),
-                    "panel_count": len(dash_data.get("panels", [])),
-                    "metadata": dash_data.get("metadata", {}),
-                    "labels": dash_data.get("labels", {}),
-                }
-            )
+        Raises:
+            ValueError: If ``page_token`` is malformed.
+        """
+        page = await self._store.list_page(
+            project_id=project_id,
+            owner=owner,
+            page_size=page_size,
+            page_token=page_token,
+        )
+        dashboards = page.dashboards
+        total_count = page.total_count
 
         # Cloud Monitoring dashboards
         if include_cloud and project_id:
             try:
-                cloud_dashboards = await self._list_cloud_dashboards(project_id)
-                dashboards.extend(cloud_dashboards)
+                cloud_dashboards = await self._cached_cloud_dashboards(project_id)
+                total_count += len(cloud_dashboards)
+                if not page_token:
+                    dashboards.extend(cloud_dashboards)
             except Exception as e:
                 logger.warning(f"Failed to fetch cloud dashboards: {e}")
 
-        # Sort by updated_at descending
-        dashboards.sort(
-            key=lambda d: d.get("metadata", {}).get("updated_at", ""),
-            reverse=True,
-        )
-
         return {
-            "dashboards": dashboards[:page_size],
-            "total_count": len(dashboards),
-            "next_page_token": None,
+            "dashboards": dashboards,
+            "total_count": total_count,
+            "next_page_token": page.next_page_token,
         }
 
     async def get_dashboard(self, dashboard_id: str) -> dict[str, Any] | None:
@@ -93,7 +107,7 @@ class DashboardService:
         Returns:
             Dashboard data dict or None if not found.
         """
-        return self._store.get(dashboard_id)
+        return await self._store.get(dashboard_id)
 
     async def create_dashboard(
         self,
@@ -123,6 +137,8 @@ class DashboardService:
         Returns:
             Created dashboard data.
         """
+        from sre_agent.auth import get_current_user_id
+
         dashboard_id = uuid.uuid4().hex[:12]
         now = datetime.now(timezone.utc).isoformat()
 
@@ -141,6 +157,7 @@ class DashboardService:
             "grid_columns": 24,
             "metadata": {
                 "created_at": now,
+                "created_by": get_current_user_id(),
                 "updated_at": now,
                 "version": 1,
                 "tags": [],
@@ -148,7 +165,7 @@ class DashboardService:
             },
         }
 
-        self._store[dashboard_id] = dashboard_data
+        await self._store.put(dashboard_data)
         logger.info(f"Created dashboard '{display_name}' with ID {dashboard_id}")
         return dashboard_data
 
@@ -156,35 +173,30 @@ class DashboardService:
         self,
         dashboard_id: str,
         updates: dict[str, Any],
+        expected_version: int | None = None,
     ) -> dict[str, Any] | None:
         """Update an existing dashboard.
 
         Args:
             dashboard_id: Dashboard identifier.
             updates: Fields to update.
+            expected_version: Version the updates are based on, if known.
 
         Returns:
             Updated dashboard data or None if not found.
-        """
-        dashboard = self._store.get(dashboard_id)
-        if not dashboard:
-            return None
-
-        now = datetime.now(timezone.utc).isoformat()
 
-        # Apply updates
-        for key, value in updates.items():
-            if value is not None and key not in ("id", "name", "source"):
-                dashboard[key] = value
+        Raises:
+            DashboardConflictError: If ``expected_version`` is stale.
+        """
 
-        # Update metadata
-        metadata = dashboard.get("metadata", {})
-        metadata["updated_at"] = now
-        metadata["version"] = metadata.get("version", 0) + 1
-        dashboard["metadata"] = metadata
+        def apply(dashboard: dict[str, Any]) -> None:
+            for key, value in updates.items():
+                if value is not None and key not in ("id", "name", "source"):
+                    dashboard[key] = value
 
-        self._store[dashboard_id] = dashboard
-        logger.info(f"Updated dashboard {dashboard_id}")
+        dashboard = await self._store.mutate(dashboard_id, apply, expected_version)
+        if dashboard is not None:
+            logger.info(f"Updated dashboard {dashboard_id}")
         return dashboard
 
     async def delete_dashboard(self, dashboard_id: str) -> bool:
@@ -196,8 +208,7 @@ class DashboardService:
         Returns:
             True if deleted, False if not found.
         """
-        if dashboard_id in self._store:
-            del self._store[dashboard_id]
+        if await self._store.delete(dashboard_id):
             logger.info(f"Deleted dashboard {dashboard_id}")
             return True
         return False
@@ -206,75 +217,68 @@ class DashboardService:
         self,
         dashboard_id: str,
         panel: dict[str, Any],
+        expected_version: int | None = None,
     ) -> dict[str, Any] | None:
         """Add a panel to a dashboard.
 
         Args:
             dashboard_id: Target dashboard ID.
             panel: Panel configuration dict.
+            expected_version: Version the edit is based on, if known.
 
         Returns:
             Updated dashboard or None if not found.
-        """
-        dashboard = self._store.get(dashboard_id)
-        if not dashboard:
-            return None
-
-        panels = list(dashboard.get("panels", []))
 
+        Raises:
+            DashboardConflictError: If ``expected_version`` is stale.
+        """
         # Auto-assign panel ID if not present
         if "id" not in panel:
             panel["id"] = f"panel-{uuid.uuid4().hex[:8]}"
 
-        # Auto-position if grid_position not set
-        if "grid_position" not in panel:
-            panel["grid_position"] = self._find_next_position(panels)
-
-        panels.append(panel)
-        dashboard["panels"] = panels
+        def apply(dashboard: dict[str, Any]) -> None:
+            panels = list(dashboard.get("panels", []))
+            # Auto-position if grid_position not set
+            if "grid_position" not in panel:
+                panel["grid_position"] = self._find_next_position(panels)
+            panels.append(panel)
+            dashboard["panels"] = panels
 
-        now = datetime.now(timezone.utc).isoformat()
-        metadata = dashboard.get("metadata", {})
-        metadata["updated_at"] = now
-        dashboard["metadata"] = metadata
-
-        self._store[dashboard_id] = dashboard
-        return dashboard
+        return await self._store.mutate(dashboard_id, apply, expected_version)
 
     async def remove_panel(
         self,
         dashboard_id: str,
         panel_id: str,
+        expected_version: int | None = None,
     ) -> dict[str, Any] | None:
         """Remove a panel from a dashboard.
 
         Args:
             dashboard_id: Dashboard ID.
             panel_id: Panel ID to remove.
+            expected_version: Version the edit is based on, if known.
 
         Returns:
             Updated dashboard or None if not found.
+
+        Raises:
+            DashboardConflictError: If ``expected_version`` is stale.
         """
-        dashboard = self._store.get(dashboard_id)
-        if not dashboard:
-            return None
 
-        panels = [p for p in dashboard.get("panels", []) if p.get("id") != panel_id]
-        dashboard["panels"] = panels
+        def apply(dashboard: dict[str, Any]) -> None:
+            dashboard["panels"] = [
+                p for p in dashboard.get("panels", []) if p.get("id") != panel_id
+            ]
 
-        now = datetime.now(timezone.utc).isoformat()
-        metadata = dashboard.get("metadata", {})
-        metadata["updated_at"] = now
-        dashboard["metadata"] = metadata
-
-        self._store[dashboard_id] = dashboard
-        return dashboard
+        return await self._store.mutate(dashboard_id, apply, expected_version)
 
     async def update_panel_position(
         self,
         dashboard_id: str,
         panel_id: str,
         grid_position: dict[str, int],
+        expected_version: int | None = None,
     ) -> dict[str, Any] | None:
         """Update a panel's position in the grid.
 
@@ -282,27 +286,45 @@ class DashboardService:
             dashboard_id: Dashboard ID.
             panel_id: Panel ID.
             grid_position: New position {x, y, width, height}.
+            expected_version: Version the edit is based on, if known.
 
         Returns:
             Updated dashboard or None if not found.
+
+        Raises:
+            DashboardConflictError: If ``expected_version`` is stale.
         """
-        dashboard = self._store.get(dashboard_id)
-        if not dashboard:
-            return None
 
-        panels = dashboard.get("panels", [])
-        for panel in panels:
-            if panel.get("id") == panel_id:
-                panel["grid_position"] = grid_position
-                break
+        def apply(dashboard: dict[str, Any]) -> None:
+            for panel in dashboard.get("panels", []):
+                if panel.get("id") == panel_id:
+                    panel["grid_position"] = grid_position
+                    break
 
-        now = datetime.now(timezone.utc).isoformat()
-        metadata = dashboard.get("metadata", {})
-        metadata["updated_at"] = now
-        dashboard["metadata"] = metadata
+        return await self._store.mutate(dashboard_id, apply, expected_version)
 
-        self._store[dashboard_id] = dashboard
-        return dashboard
+    async def resolve_panel_data(
+        self,
+        dashboard_id: str,
+        project_id: str | None = None,
+        minutes_ago: int = 60,
+    ) -> dict[str, Any] | None:
+        """Fetch the data behind every panel of a dashboard in one batch.
+
+        Args:
+            dashboard_id: Dashboard ID.
+            project_id: Project to query (defaults to the dashboard's).
+            minutes_ago: Lookback window for every panel.
+
+        Returns:
+            Panel data keyed by panel ID, or None if the dashboard is not found.
+        """
+        from sre_agent.services.dashboard_panel_resolver import get_panel_resolver
+
+        dashboard = await self._store.get(dashboard_id)
+        if dashboard is None:
+            return None
+        return await get_panel_resolver().resolve(dashboard, project_id, minutes_ago)
 
     def _find_next_position(self, panels: list[dict[str, Any]]) -> dict[str, int]:
         """Find the next available position in the grid."""
@@ -539,6 +561,19 @@ class DashboardService:
 
         return await self.add_panel(dashboard_id, panel)
 
+    async def _cached_cloud_dashboards(self, project_id: str) -> list[dict[str, Any]]:
+        """Return Cloud Monitoring dashboards, reusing a recent listing."""
+        from sre_agent.services.telemetry_catalog import current_principal
+
+        key = (project_id, current_principal())
+        cached = self._cloud_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < CLOUD_DASHBOARD_TTL_SECONDS:
+            return list(cached[1])
+        dashboards = await self._list_cloud_dashboards(project_id)
+        self._cloud_cache[key] = (now, dashboards)
+        return list(dashboards)
+
     async def _list_cloud_dashboards(self, project_id: str) -> list[dict[str, Any]]:
         """Fetch dashboards from Cloud Monitoring API."""
         try:
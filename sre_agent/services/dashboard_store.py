@@ -0,0 +1,292 @@
+"""Indexed SQLite persistence for local dashboards.
+
+Dashboards used to live in a module-level dict: they were lost on restart,
+and every listing scanned and copied the whole store. :class:`DashboardStore`
+keeps them in a ``dashboards`` table on the shared local database
+(:mod:`sre_agent.core.local_db`):
+
+- The full document is stored as JSON next to a small list summary, so
+  listings never decode panels.
+- ``project_id``, ``owner`` and ``updated_at`` are indexed; listings are
+  keyset-paginated on ``(updated_at, id)`` with an opaque cursor token.
+- Every mutation runs as one read-modify-write job on the database's writer
+  thread, so concurrent edits never lose updates. Callers that edit from a
+  client-side copy pass ``expected_version`` and get a
+  :class:`DashboardConflictError` if the dashboard changed in between.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sre_agent.core.local_db import get_local_database
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on summaries returned by one list_page call.
+MAX_PAGE_SIZE = 200
+
+_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS dashboards (
+        id TEXT PRIMARY KEY,
+        project_id TEXT,
+        owner TEXT,
+        updated_at TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        summary TEXT NOT NULL,
+        document TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_dashboards_updated "
+    "ON dashboards (updated_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_dashboards_project "
+    "ON dashboards (project_id, updated_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_dashboards_owner "
+    "ON dashboards (owner, updated_at DESC, id DESC)",
+)
+
+_UPSERT_SQL = """
+INSERT INTO dashboards (id, project_id, owner, updated_at, version, summary, document)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    project_id = excluded.project_id,
+    owner = excluded.owner,
+    updated_at = excluded.updated_at,
+    version = excluded.version,
+    summary = excluded.summary,
+    document = excluded.document
+"""
+
+
+class DashboardConflictError(Exception):
+    """A dashboard changed since the version the caller edited."""
+
+    def __init__(self, dashboard_id: str, expected: int, actual: int) -> None:
+        """Initialize the error.
+
+        Args:
+            dashboard_id: The edited dashboard.
+            expected: Version the caller based its edit on.
+            actual: Current stored version.
+        """
+        super().__init__(
+            f"Dashboard {dashboard_id} is at version {actual}, "
+            f"not {expected}; reload and retry"
+        )
+        self.dashboard_id = dashboard_id
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass
+class DashboardPage:
+    """One page of dashboard summaries.
+
+    Attributes:
+        dashboards: Summaries, most recently updated first.
+        total_count: Dashboards matching the filters across all pages.
+        next_page_token: Cursor for the next page, or None on the last one.
+    """
+
+    dashboards: list[dict[str, Any]]
+    total_count: int
+    next_page_token: str | None
+
+
+def _summary(document: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": document["id"],
+        "display_name": document.get("display_name", "Untitled"),
+        "description": document.get("description", ""),
+        "source": document.get("source", "local"),
+        "panel_count": len(document.get("panels", [])),
+        "metadata": document.get("metadata", {}),
+        "labels": document.get("labels", {}),
+    }
+
+
+def _row(document: dict[str, Any]) -> tuple[Any, ...]:
+    metadata = document.get("metadata", {})
+    return (
+        document["id"],
+        document.get("project_id"),
+        metadata.get("created_by"),
+        metadata.get("updated_at", ""),
+        metadata.get("version", 1),
+        json.dumps(_summary(document)),
+        json.dumps(document),
+    )
+
+
+def _encode_cursor(updated_at: str, dashboard_id: str) -> str:
+    raw = json.dumps([updated_at, dashboard_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(token: str) -> tuple[str, str]:
+    try:
+        updated_at, dashboard_id = json.loads(base64.urlsafe_b64decode(token))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page token: {token!r}") from e
+    return str(updated_at), str(dashboard_id)
+
+
+class DashboardStore:
+    """Dashboards persisted in an indexed SQLite table."""
+
+    def __init__(self, db_path: str) -> None:
+        """Open the store, creating the table and indexes if needed.
+
+        Args:
+            db_path: SQLite file (shared with the other local stores).
+        """
+        self._db = get_local_database(db_path)
+        self._db.write(self._create_schema)
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        for statement in _SCHEMA_SQL:
+            conn.execute(statement)
+
+    async def get(self, dashboard_id: str) -> dict[str, Any] | None:
+        """Return the full dashboard document, or None if it does not exist."""
+        rows = await self._db.aread(
+            lambda conn: conn.execute(
+                "SELECT document FROM dashboards WHERE id = ?", (dashboard_id,)
+            ).fetchall()
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    async def put(self, document: dict[str, Any]) -> None:
+        """Insert or replace a dashboard document."""
+        row = _row(document)
+        await self._db.awrite(lambda conn: conn.execute(_UPSERT_SQL, row))
+
+    async def delete(self, dashboard_id: str) -> bool:
+        """Delete a dashboard; return whether it existed."""
+        deleted: int = await self._db.awrite(
+            lambda conn: (
+                conn.execute(
+                    "DELETE FROM dashboards WHERE id = ?", (dashboard_id,)
+                ).rowcount
+            )
+        )
+        return deleted > 0
+
+    async def mutate(
+        self,
+        dashboard_id: str,
+        fn: Callable[[dict[str, Any]], None],
+        expected_version: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Apply ``fn`` to a dashboard atomically and bump its version.
+
+        ``fn`` receives the stored document and edits it in place. The read,
+        edit and write run as one job on the writer thread, so concurrent
+        mutations are serialized rather than overwriting each other.
+
+        Args:
+            dashboard_id: Dashboard to edit.
+            fn: In-place edit of the document.
+            expected_version: If set, the version the caller's edit is based
+                on; the edit is rejected if the stored version differs.
+
+        Returns:
+            The updated document, or None if the dashboard does not exist.
+
+        Raises:
+            DashboardConflictError: If ``expected_version`` is stale.
+        """
+
+        def job(conn: sqlite3.Connection) -> dict[str, Any] | None:
+            row = conn.execute(
+                "SELECT document FROM dashboards WHERE id = ?", (dashboard_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            document: dict[str, Any] = json.loads(row[0])
+            metadata = document.setdefault("metadata", {})
+            version = int(metadata.get("version", 1))
+            if expected_version is not None and expected_version != version:
+                raise DashboardConflictError(dashboard_id, expected_version, version)
+            fn(document)
+            metadata = document.setdefault("metadata", {})
+            metadata["updated_at"] = datetime.now(timezone.utc).isoformat()
+            metadata["version"] = version + 1
+            conn.execute(_UPSERT_SQL, _row(document))
+            return document
+
+        return await self._db.awrite(job)
+
+    async def list_page(
+        self,
+        project_id: str | None = None,
+        owner: str | None = None,
+        page_size: int = 50,
+        page_token: str | None = None,
+    ) -> DashboardPage:
+        """List dashboard summaries, most recently updated first.
+
+        Args:
+            project_id: Only dashboards of this project or of no project.
+            owner: Only dashboards created by this user.
+            page_size: Maximum summaries per page, capped at
+                ``MAX_PAGE_SIZE``.
+            page_token: Cursor returned with the previous page.
+
+        Returns:
+            The requested page.
+
+        Raises:
+            ValueError: If ``page_size`` is below 1 or ``page_token`` is
+                malformed.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        where: list[str] = []
+        params: list[Any] = []
+        if project_id is not None:
+            # Dashboards saved without a project belong to every project.
+            where.append("(project_id = ? OR project_id IS NULL)")
+            params.append(project_id)
+        if owner is not None:
+            where.append("owner = ?")
+            params.append(owner)
+        count_sql = "SELECT COUNT(*) FROM dashboards" + (
+            " WHERE " + " AND ".join(where) if where else ""
+        )
+        count_params = tuple(params)
+
+        if page_token:
+            where.append("(updated_at, id) < (?, ?)")
+            params.extend(_decode_cursor(page_token))
+        page_sql = (
+            "SELECT updated_at, id, summary FROM dashboards"
+            + (" WHERE " + " AND ".join(where) if where else "")
+            + " ORDER BY updated_at DESC, id DESC LIMIT ?"
+        )
+        params.append(page_size + 1)
+
+        def query(conn: sqlite3.Connection) -> tuple[int, list[Any]]:
+            total = conn.execute(count_sql, count_params).fetchone()[0]
+            return total, conn.execute(page_sql, params).fetchall()
+
+        total, rows = await self._db.aread(query)
+        next_token = None
+        if rows and len(rows) > page_size:
+            rows = rows[:page_size]
+            next_token = _encode_cursor(rows[-1][0], rows[-1][1])
+        return DashboardPage(
+            dashboards=[json.loads(summary) for _, _, summary in rows],
+            total_count=total,
+            next_page_token=next_token,
+        )
@@ -14,7 +14,7 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from google.adk.events import Event, EventActions
 from google.adk.sessions import (
@@ -23,9 +23,24 @@ from google.adk.sessions import (
     Session,
 )
 
+if TYPE_CHECKING:
+    from sre_agent.services.session_journal import SessionEventJournal
+
 logger = logging.getLogger(__name__)
 
 
+def _apply_local_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Give aiosqlite session connections the shared local pragmas (WAL etc.)."""
+    from sre_agent.core.local_db import pragma_statements
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in pragma_statements():
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
 @dataclass
 class SessionInfo:
     """Session information for API responses."""
@@ -73,6 +88,8 @@ class ADKSessionManager:
         self._session_service = self._create_session_service()
         # In-memory session cache: key is (user_id, session_id), value is (Session, timestamp)
         self._cache: dict[tuple[str, str], tuple[Session, float]] = {}
+        # Open write-behind journals for sessions that are streaming a turn
+        self._journals: dict[tuple[str, str], SessionEventJournal] = {}
         logger.info(
             f"ADKSessionManager initialized with {type(self._session_service).__name__} (app_name={self.app_name})"
         )
@@ -152,7 +169,15 @@ class ADKSessionManager:
                 db_path = os.getenv("SESSION_DB_PATH", ".sre_agent_sessions.db")
                 db_url = f"sqlite+aiosqlite:///{db_path}"
                 logger.info(f"Using DatabaseSessionService with SQLite: {db_path}")
-                return DatabaseSessionService(db_url=db_url)
+                service = DatabaseSessionService(db_url=db_url)
+                from sqlalchemy import event
+
+                event.listen(
+                    service.db_engine.sync_engine,
+                    "connect",
+                    _apply_local_sqlite_pragmas,
+                )
+                return service
             except Exception as e:
                 logger.warning(f"Failed to initialize DatabaseSessionService: {e}")
 
@@ -363,6 +388,14 @@ class ADKSessionManager:
             session: The ADK session to append to
             event: The event to append
         """
+        journal = self._journals.get((session.user_id, session.id))
+        if journal is not None:
+            if not journal.closed:
+                # Keep one ordered writer per session while a turn streams.
+                await journal.append(event, session)
+                await journal.flush()
+                return
+            await journal.flush()
         try:
             await self._session_service.append_event(session, event)
             # Update cache timestamp to keep it alive and fresh
@@ -374,6 +407,42 @@ class ADKSessionManager:
             else:
                 raise e
 
+    def open_journal(self, session: Session) -> "SessionEventJournal":
+        """Open a write-behind journal for events streamed into ``session``.
+
+        Events appended through the journal are applied to the in-memory
+        session immediately and persisted in order by a background task.
+
+        Args:
+            session: The session the current turn runs against.
+
+        Returns:
+            The session's journal (an already open one is reused).
+        """
+        from sre_agent.services.session_journal import SessionEventJournal
+
+        key = (session.user_id, session.id)
+        journal = self._journals.get(key)
+        if journal is None or journal.closed:
+            journal = SessionEventJournal(self, session)
+            self._journals[key] = journal
+        return journal
+
+    def _release_journal(self, journal: "SessionEventJournal") -> None:
+        key = (journal.session.user_id, journal.session.id)
+        if self._journals.get(key) is journal:
+            del self._journals[key]
+
+    async def close_journals(self) -> None:
+        """Flush and close every open journal (called on shutdown)."""
+        for journal in list(self._journals.values()):
+            try:
+                await journal.close()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to close session journal {journal.session.id}: {e}"
+                )
+
     async def update_session_state(
         self,
         session: Session,
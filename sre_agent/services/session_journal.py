@@ -0,0 +1,169 @@
+"""Write-behind journal for session events produced while streaming a turn.
+
+The chat stream used to ``await session_manager.append_event(...)`` for every
+runner event before yielding it, so each streamed chunk waited for a Vertex AI
+session API round trip or an SQLite commit. :class:`SessionEventJournal`
+splits the two halves of ``append_event``:
+
+- **Acknowledge**: the event is applied to the in-memory session immediately
+  (state delta + ``session.events``), exactly as ADK's base
+  ``append_event`` does. The agent reads ``session.events`` between LLM
+  calls in the same turn, so this half must stay synchronous.
+- **Persist**: a background task drains pending events in order and writes
+  them to the session service through a *shadow* copy of the session (same
+  ID and storage revision, no events), so the in-memory session is never
+  appended to twice. The storage revision is copied back after each write.
+
+The router flushes the journal at the end of every turn and closes it when
+the stream ends (including client disconnects); the app closes any journal
+still open on shutdown. While a journal is open, ``ADKSessionManager`` routes
+other writes to the same session through it, so storage sees one ordered
+writer per session.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import BaseSessionService
+
+if TYPE_CHECKING:
+    from sre_agent.services.session import ADKSessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class SessionEventJournal:
+    """Acknowledges session events in memory and persists them in order."""
+
+    def __init__(self, manager: "ADKSessionManager", session: Session) -> None:
+        """Initialize the journal.
+
+        Args:
+            manager: Session manager owning the storage backend.
+            session: The in-memory session events are acknowledged on.
+        """
+        self._manager = manager
+        self.session = session
+        self.closed = False
+        self._pending: deque[Event] = deque()
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: asyncio.Task[None] | None = None
+        self._shadow: Session | None = None
+        self.persisted = 0
+        self.failed = 0
+        self.batches = 0
+
+    async def append(self, event: Event, session: Session | None = None) -> Event:
+        """Apply ``event`` in memory now and queue it for persistence.
+
+        Args:
+            event: The event to append.
+            session: In-memory session object to apply it to (defaults to the
+                journal's session; another object for the same session may be
+                passed by writers that fetched their own copy).
+
+        Returns:
+            The event as applied (temp-scoped state removed).
+        """
+        if self.closed:
+            raise RuntimeError(f"Session journal for {self.session.id} is closed")
+        applied: Event = await BaseSessionService.append_event(
+            self._manager.session_service, session or self.session, event
+        )
+        if event.partial:
+            return applied
+        self._pending.append(applied)
+        self._idle.clear()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._run())
+        self._wake.set()
+        return applied
+
+    async def flush(self) -> None:
+        """Wait until every event appended so far has been persisted."""
+        if self._writer is None or self._writer.done():
+            # Nothing is draining (e.g. the writer was cancelled): write inline.
+            while self._pending:
+                await self._persist(self._pending.popleft())
+            self._idle.set()
+            return
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Flush pending events and stop the background writer."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self.flush()
+        finally:
+            writer, self._writer = self._writer, None
+            if writer is not None and not writer.done():
+                writer.cancel()
+            self._manager._release_journal(self)
+
+    def stats(self) -> dict[str, Any]:
+        """Return persistence counters."""
+        return {
+            "pending": len(self._pending),
+            "persisted": self.persisted,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self._pending:
+                batch = list(self._pending)
+                self._pending.clear()
+                for event in batch:
+                    await self._persist(event)
+                self.batches += 1
+            # No await between the emptiness check and this: appends made
+            # while persisting were drained above.
+            self._idle.set()
+
+    def _get_shadow(self) -> Session:
+        if self._shadow is None:
+            self._shadow = self.session.model_copy(
+                update={"events": [], "state": dict(self.session.state)}
+            )
+        return self._shadow
+
+    async def _persist(self, event: Event) -> None:
+        shadow = self._get_shadow()
+        try:
+            await self._manager.session_service.append_event(shadow, event)
+        except Exception as e:
+            self.failed += 1
+            if "NoneType" in str(e) or "not found" in str(e).lower():
+                logger.warning(
+                    "Could not persist event to session %s: %s", self.session.id, e
+                )
+            else:
+                logger.error(
+                    "Failed to persist event to session %s: %s", self.session.id, e
+                )
+            return
+        finally:
+            shadow.events.clear()
+        self.persisted += 1
+        # Keep the live session's storage revision current so later direct
+        # writes pass the stale-session check.
+        self.session.last_update_time = shadow.last_update_time
+        marker = getattr(shadow, "_storage_update_marker", None)
+        if marker is not None:
+            self.session._storage_update_marker = marker
+        self._manager._cache[(self.session.user_id, self.session.id)] = (
+            self.session,
+            time.time(),
+        )
@@ -0,0 +1,325 @@
+"""Bounded, cached and streamed session trajectory assembly.
+
+A session trajectory joins the agent spans recorded in BigQuery with the
+span labels stored in Cloud Trace (prompts, completions, tool payloads) and
+the correlated Cloud Logging entries.  Long sessions can reference hundreds
+of traces, so the assembler:
+
+- Fetches traces and logs under one process-wide
+  :class:`anyio.CapacityLimiter`, so trajectory requests together never
+  occupy more than ``max_concurrent_traces`` worker threads.
+- Serves traces already present in the shared :class:`DataCache` directly
+  from the event loop, without a thread hop or a limiter slot.
+- Looks up logs with a single ``trace=(... OR ...)`` filter per chunk of
+  trace IDs and follows ``next_page_token`` instead of one capped request
+  per batch of ten traces.
+- Yields partial results as each trace resolves, so the UI can render the
+  skeleton immediately and fill in details progressively.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+
+from sre_agent.tools.common.cache import get_data_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TrajectoryConfig:
+    """Limits applied while assembling a session trajectory.
+
+    Attributes:
+        max_concurrent_traces: Maximum trace and log fetches in flight across
+            all requests (sizes the shared limiter when it is created).
+        max_traces_per_log_filter: Trace IDs combined into one logging filter.
+        log_page_size: Entries requested per Cloud Logging page.
+        max_log_pages: Pages followed per filter before giving up.
+    """
+
+    max_concurrent_traces: int = 8
+    max_traces_per_log_filter: int = 100
+    log_page_size: int = 1000
+    max_log_pages: int = 5
+
+    @classmethod
+    def from_env(cls) -> "TrajectoryConfig":
+        """Build a config from ``TRAJECTORY_*`` environment variables."""
+        return cls(
+            max_concurrent_traces=int(
+                os.environ.get("TRAJECTORY_MAX_CONCURRENT_TRACES", "8")
+            ),
+            max_traces_per_log_filter=int(
+                os.environ.get("TRAJECTORY_MAX_TRACES_PER_LOG_FILTER", "100")
+            ),
+            log_page_size=int(os.environ.get("TRAJECTORY_LOG_PAGE_SIZE", "1000")),
+            max_log_pages=int(os.environ.get("TRAJECTORY_MAX_LOG_PAGES", "5")),
+        )
+
+
+def build_trace_log_filter(project_id: str, trace_ids: Iterable[str]) -> str:
+    """Build one Cloud Logging filter matching any of ``trace_ids``."""
+    values = " OR ".join(f'"projects/{project_id}/traces/{t}"' for t in trace_ids)
+    return f"trace=({values})"
+
+
+def build_trajectory_step(
+    row: Any,
+    labels: dict[str, Any] | None = None,
+    logs: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Render one ``agent_spans_raw`` row as a trajectory step.
+
+    Args:
+        row: BigQuery row from ``agent_spans_raw``.
+        labels: Cloud Trace span labels, if already resolved.
+        logs: Correlated log entries for the span, if already resolved.
+    """
+    labels = labels or {}
+    input_tokens = int(row.input_tokens) if row.input_tokens else 0
+    output_tokens = int(row.output_tokens) if row.output_tokens else 0
+    status_desc = str(row.status_desc) if row.status_desc else None
+
+    # Evaluations are recorded as events (gen_ai.evaluation.result) and are not
+    # extracted into agent_spans_raw, so they default to an empty list here.
+    evaluations: list[dict[str, Any]] = []
+
+    return {
+        "traceId": row.trace_id,
+        "spanId": row.span_id,
+        "parentSpanId": row.parent_id or None,
+        "startTime": row.start_time.isoformat() if row.start_time else None,
+        "nodeType": row.node_type,
+        "nodeLabel": row.node_label,
+        "durationMs": row.duration_ms,
+        "statusCode": row.status_code,
+        "statusMessage": status_desc,
+        "inputTokens": input_tokens,
+        "outputTokens": output_tokens,
+        "totalTokens": input_tokens + output_tokens,
+        "model": row.request_model or None,
+        "prompt": labels.get("gen_ai.prompt")
+        or labels.get("gen_ai.request.message")
+        or labels.get("gcp.vertex.agent.llm_request"),
+        "completion": labels.get("gen_ai.completion")
+        or labels.get("gen_ai.response.message")
+        or labels.get("gcp.vertex.agent.llm_response"),
+        "systemMessage": labels.get("gen_ai.system.message")
+        or labels.get("gen_ai.system"),
+        "toolInput": labels.get("tool.input")
+        or labels.get("gen_ai.tool.input")
+        or labels.get("tool_input")
+        or labels.get("gcp.vertex.agent.tool_call_args"),
+        "toolOutput": labels.get("tool.output")
+        or labels.get("gen_ai.tool.output")
+        or labels.get("tool_output")
+        or labels.get("gcp.vertex.agent.tool_response"),
+        "evaluations": evaluations,
+        "logs": logs or [],
+    }
+
+
+def _labels_by_span(trace_data: Any) -> dict[str, dict[str, Any]]:
+    if isinstance(trace_data, str):
+        try:
+            trace_data = json.loads(trace_data)
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(trace_data, dict) or "spans" not in trace_data:
+        return {}
+    return {s["span_id"]: s.get("labels", {}) for s in trace_data["spans"]}
+
+
+_fetch_limiter: anyio.CapacityLimiter | None = None
+
+
+def get_fetch_limiter(total_tokens: int) -> anyio.CapacityLimiter:
+    """Return the limiter shared by every trajectory request.
+
+    Created on first use, from inside the event loop, with ``total_tokens``
+    slots.  A per-request limiter would let N concurrent requests use N
+    times the threads, since passing ``limiter=`` bypasses anyio's default
+    thread limiter.
+    """
+    global _fetch_limiter
+    if _fetch_limiter is None:
+        _fetch_limiter = anyio.CapacityLimiter(max(1, total_tokens))
+    return _fetch_limiter
+
+
+def reset_fetch_limiter() -> None:
+    """Drop the shared limiter (for testing)."""
+    global _fetch_limiter
+    _fetch_limiter = None
+
+
+class SessionTrajectoryAssembler:
+    """Assembles one session trajectory from BigQuery rows, traces and logs.
+
+    Instances are per request: they accumulate resolved labels and logs so
+    the final trajectory can be rebuilt after streaming.
+    """
+
+    def __init__(self, project_id: str, config: TrajectoryConfig | None = None):
+        """Initialize the assembler.
+
+        Args:
+            project_id: GCP project owning the traces and logs.
+            config: Concurrency and paging limits.
+        """
+        self.project_id = project_id
+        self.config = config or TrajectoryConfig.from_env()
+        self._labels: dict[str, dict[str, Any]] = {}
+        self._logs: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.failed_traces: list[str] = []
+        self.cache_hits = 0
+
+    async def _fetch_trace_labels(
+        self, trace_id: str, limiter: anyio.CapacityLimiter
+    ) -> dict[str, dict[str, Any]]:
+        from sre_agent.tools.clients.trace import _fetch_trace_sync
+
+        cached = get_data_cache().get(f"trace:{trace_id}")
+        if cached:
+            self.cache_hits += 1
+            return _labels_by_span(cached)
+        try:
+            trace_data = await anyio.to_thread.run_sync(
+                _fetch_trace_sync, self.project_id, trace_id, limiter=limiter
+            )
+        except Exception as e:
+            logger.warning(f"Failed to fetch trace {trace_id} from Cloud Trace: {e}")
+            self.failed_traces.append(trace_id)
+            return {}
+        if isinstance(trace_data, dict) and "error" in trace_data:
+            logger.warning(
+                f"Failed to fetch trace {trace_id} from Cloud Trace: "
+                f"{trace_data['error']}"
+            )
+            self.failed_traces.append(trace_id)
+        return _labels_by_span(trace_data)
+
+    async def _fetch_log_chunk(
+        self, trace_ids: list[str], limiter: anyio.CapacityLimiter
+    ) -> dict[str, list[dict[str, Any]]]:
+        from sre_agent.tools.clients.logging import _list_log_entries_sync
+
+        filter_str = build_trace_log_filter(self.project_id, trace_ids)
+        logs: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        page_token: str | None = None
+        for _ in range(self.config.max_log_pages):
+            try:
+                res = await anyio.to_thread.run_sync(
+                    _list_log_entries_sync,
+                    self.project_id,
+                    filter_str,
+                    self.config.log_page_size,
+                    page_token,
+                    None,
+                    limiter=limiter,
+                )
+            except Exception as exc:
+                logger.warning(f"Failed to fetch log page: {exc}")
+                break
+            if not isinstance(res, dict):
+                break
+            for entry in res.get("entries", []):
+                if entry.get("span_id"):
+                    logs[entry["span_id"]].append(
+                        {
+                            "timestamp": entry.get("timestamp"),
+                            "severity": entry.get("severity"),
+                            "payload": entry.get("payload"),
+                        }
+                    )
+            page_token = res.get("next_page_token")
+            if not page_token:
+                break
+        return logs
+
+    async def stream(self, span_rows: list[Any]) -> AsyncIterator[dict[str, Any]]:
+        """Yield trajectory events as the underlying data resolves.
+
+        Events, in order:
+
+        - ``{"type": "spans", "trajectory": [...]}``: every step, without
+          trace labels or logs.
+        - ``{"type": "trace", "traceId": ..., "steps": [...]}``: the steps of
+          one trace, re-rendered with its labels, once per resolved trace.
+        - ``{"type": "logs", "steps": [...]}``: steps that gained log entries,
+          once per log filter chunk.
+        - ``{"type": "complete", ...}``: summary of the assembly.
+        """
+        rows_by_trace: dict[str, list[Any]] = defaultdict(list)
+        for row in span_rows:
+            if row.trace_id:
+                rows_by_trace[row.trace_id].append(row)
+        rows_by_span = {row.span_id: row for row in span_rows}
+
+        yield {"type": "spans", "trajectory": self.trajectory(span_rows)}
+
+        trace_ids = list(rows_by_trace)
+        limiter = get_fetch_limiter(self.config.max_concurrent_traces)
+
+        async def trace_job(tid: str) -> tuple[str, Any]:
+            return "trace", (tid, await self._fetch_trace_labels(tid, limiter))
+
+        async def log_job(chunk: list[str]) -> tuple[str, Any]:
+            return "logs", await self._fetch_log_chunk(chunk, limiter)
+
+        size = max(1, self.config.max_traces_per_log_filter)
+        jobs = [asyncio.ensure_future(trace_job(tid)) for tid in trace_ids]
+        jobs += [
+            asyncio.ensure_future(log_job(trace_ids[i : i + size]))
+            for i in range(0, len(trace_ids), size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(jobs):
+                kind, payload = await next_done
+                if kind == "trace":
+                    tid, labels = payload
+                    self._labels.update(labels)
+                    yield {
+                        "type": "trace",
+                        "traceId": tid,
+                        "steps": self.trajectory(rows_by_trace[tid]),
+                    }
+                else:
+                    for span_id, entries in payload.items():
+                        self._logs[span_id].extend(entries)
+                    rows = [rows_by_span[s] for s in payload if s in rows_by_span]
+                    if rows:
+                        yield {"type": "logs", "steps": self.trajectory(rows)}
+        finally:
+            for job in jobs:
+                job.cancel()
+
+        yield {
+            "type": "complete",
+            "traceCount": len(trace_ids),
+            "failedTraces": self.failed_traces,
+            "cacheHits": self.cache_hits,
+        }
+
+    def trajectory(self, span_rows: Iterable[Any]) -> list[dict[str, Any]]:
+        """Render ``span_rows`` with everything resolved so far."""
+        return [
+            build_trajectory_step(
+                row, self._labels.get(row.span_id), self._logs.get(row.span_id)
+            )
+            for row in span_rows
+        ]
+
+    async def assemble(self, span_rows: list[Any]) -> list[dict[str, Any]]:
+        """Resolve everything and return the complete trajectory."""
+        async for _event in self.stream(span_rows):
+            pass
+        return self.trajectory(span_rows)
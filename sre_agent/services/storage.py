@@ -3,7 +3,8 @@
 Provides persistence for user preferences (project selection, tool config).
 Uses simple key-value storage - NOT ADK session state.
 
-For local development: JSON file storage
+For local development: SQLite (shared WAL pool, see ``core.local_db``) at
+``SRE_AGENT_PREFERENCES_DB`` (default ``.sre_agent_preferences.db``)
 For Cloud Run: Firestore
 
 ADK sessions should be used for conversation history, not preferences.
@@ -12,11 +13,13 @@ ADK sessions should be used for conversation history, not preferences.
 import json
 import logging
 import os
+import sqlite3
 import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from ..core.local_db import get_local_database
 from ..tools.common import json_dumps
 
 try:
@@ -93,6 +96,82 @@ class FilePreferencesBackend(PreferencesBackend):
             self._save()
 
 
+class SQLitePreferencesBackend(PreferencesBackend):
+    """SQLite-based preferences storage for local development.
+
+    Writes go through the shared group-commit writer, so a ``set`` updates
+    one row instead of rewriting every user's preferences. Preferences from
+    the legacy JSON file are imported the first time the table is created.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ".sre_agent_preferences.db",
+        legacy_json_path: str | None = ".sre_agent_preferences.json",
+    ) -> None:
+        """Initialize the backend and create the table if needed."""
+        self._db = get_local_database(db_path)
+        self._db.write(lambda conn: self._create_schema(conn, legacy_json_path))
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection, legacy_json_path: str | None) -> None:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'preferences'"
+        ).fetchone()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS preferences "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        if exists or not legacy_json_path:
+            return
+        path = Path(legacy_json_path)
+        if not path.exists():
+            return
+        try:
+            legacy = json.loads(path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to import legacy preferences: {e}")
+            return
+        if isinstance(legacy, dict):
+            conn.executemany(
+                "INSERT OR IGNORE INTO preferences (key, value) VALUES (?, ?)",
+                [(key, json_dumps(value)) for key, value in legacy.items()],
+            )
+            logger.info(f"Imported {len(legacy)} preferences from {path}")
+
+    async def get(self, key: str) -> Any | None:
+        """Get a preference value."""
+        row = await self._db.aread(
+            lambda conn: conn.execute(
+                "SELECT value FROM preferences WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError as e:
+            logger.warning(f"Corrupt preference {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: Any) -> None:
+        """Set a preference value."""
+        payload = json_dumps(value)
+        await self._db.awrite(
+            lambda conn: conn.execute(
+                "INSERT INTO preferences (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, payload),
+            )
+        )
+
+    async def delete(self, key: str) -> None:
+        """Delete a preference value."""
+        await self._db.awrite(
+            lambda conn: conn.execute("DELETE FROM preferences WHERE key = ?", (key,))
+        )
+
+
 class FirestorePreferencesBackend(PreferencesBackend):
     """Firestore-based preferences storage for Cloud Run."""
 
@@ -152,7 +231,7 @@ class StorageService:
 
     Automatically selects the appropriate backend:
     - Firestore when running on Cloud Run (K_SERVICE env var set)
-    - File-based JSON for local development
+    - SQLite for local development (JSON file if SQLite is unavailable)
     """
 
     # Preference keys
@@ -179,6 +258,15 @@ class StorageService:
             except Exception as e:
                 logger.warning(f"Firestore unavailable, using file storage: {e}")
 
+        try:
+            backend = SQLitePreferencesBackend(
+                os.environ.get("SRE_AGENT_PREFERENCES_DB", ".sre_agent_preferences.db")
+            )
+            logger.info("Using SQLite preferences storage")
+            return backend
+        except Exception as e:
+            logger.warning(f"SQLite preferences unavailable, using file storage: {e}")
+
         logger.info("Using file-based preferences storage")
         return FilePreferencesBackend()
 
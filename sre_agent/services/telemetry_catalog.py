@@ -0,0 +1,743 @@
+"""Per-principal catalog of BigQuery telemetry sources.
+
+Telemetry source discovery used to happen ad hoc: the dashboard helpers in
+``api/helpers/bq_discovery.py`` opened a new ``httpx.AsyncClient`` per call,
+could refresh ADC credentials synchronously inside async code, and cached
+per project only; ``discover_telemetry_sources`` separately walked up to five
+datasets one at a time through MCP ``list_table_ids`` calls, once per session.
+
+:class:`TelemetryCatalog` replaces both with one cached lookup:
+
+- Discovery runs concurrently over a shared HTTP client. The linked
+  ``_Default`` log dataset, the linked trace dataset (Cloud Logging and Cloud
+  Observability bucket links) and the BigQuery dataset list are fetched in
+  parallel, then the tables of every candidate dataset, then the schemas of
+  the ``_AllSpans``/``_AllLogs`` tables that were found.
+- Results are keyed by (project, credential principal), so users with
+  different access never share a view of the project.
+- Entries are kept in a bounded in-memory LRU and persisted to the local
+  SQLite database, so restarts start warm. Entries older than
+  ``refresh_after_seconds`` are served immediately and refreshed in the
+  background; concurrent misses share a single discovery.
+
+Usage::
+
+    sources = await get_telemetry_catalog().get(project_id)
+    sources.trace_table  # "my-project.traces._AllSpans" or None
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import httpx
+
+from sre_agent.core.local_db import LocalDatabase, get_local_database
+
+logger = logging.getLogger(__name__)
+
+LOGGING_API = "https://logging.googleapis.com/v2"
+OBSERVABILITY_API = "https://observability.googleapis.com/v1"
+BIGQUERY_API = "https://bigquery.googleapis.com/bigquery/v2"
+
+TRACE_TABLE = "_AllSpans"
+LOG_TABLE = "_AllLogs"
+
+# Datasets probed when the project's datasets cannot be listed.
+FALLBACK_TRACE_DATASETS = ("traces", "obs_bucket_spans")
+OBSERVABILITY_LOCATIONS = ("global", "us")
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS telemetry_catalog (
+    project_id TEXT NOT NULL,
+    principal TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    discovered_at REAL NOT NULL,
+    PRIMARY KEY (project_id, principal)
+)
+"""
+
+_UPSERT_SQL = """
+INSERT INTO telemetry_catalog (project_id, principal, sources, discovered_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(project_id, principal) DO UPDATE SET
+    sources = excluded.sources,
+    discovered_at = excluded.discovered_at
+"""
+
+
+class DiscoveryError(Exception):
+    """Telemetry discovery could not inspect the project."""
+
+    def __init__(
+        self, message: str, error_type: str = "UNKNOWN", non_retryable: bool = False
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            message: What failed.
+            error_type: Machine-readable category (e.g. ``PERMISSION_DENIED``).
+            non_retryable: Whether retrying with the same credentials is futile.
+        """
+        super().__init__(message)
+        self.error_type = error_type
+        self.non_retryable = non_retryable
+
+
+@dataclass
+class TelemetrySources:
+    """Telemetry sources discovered for one project and principal.
+
+    Attributes:
+        project_id: The inspected project.
+        principal: Credential principal the discovery ran as.
+        log_dataset: Dataset linked to the ``_Default`` log bucket.
+        trace_dataset: Dataset holding trace spans.
+        trace_table: Fully qualified ``_AllSpans`` table, if found.
+        log_table: Fully qualified ``_AllLogs`` table, if found.
+        typed_trace_table: Fully qualified typed-column span table, if found.
+        schemas: Top-level column names per fully qualified table.
+        datasets_scanned: Datasets whose tables were listed.
+        discovered_at: Unix timestamp of the discovery.
+    """
+
+    project_id: str
+    principal: str
+    log_dataset: str | None = None
+    trace_dataset: str | None = None
+    trace_table: str | None = None
+    log_table: str | None = None
+    typed_trace_table: str | None = None
+    schemas: dict[str, list[str]] = field(default_factory=dict)
+    datasets_scanned: list[str] = field(default_factory=list)
+    discovered_at: float = field(default_factory=time.time)
+
+    @property
+    def mode(self) -> str:
+        """``bigquery`` if any export table exists, else ``api_fallback``."""
+        return "bigquery" if (self.trace_table or self.log_table) else "api_fallback"
+
+    def age(self) -> float:
+        """Seconds since discovery."""
+        return time.time() - self.discovered_at
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TelemetrySources:
+        """Deserialize from :meth:`to_dict` output."""
+        return cls(**data)
+
+    def describe(self) -> str:
+        """Render a short summary for agent prompts."""
+        if self.mode == "api_fallback":
+            return (
+                "No BigQuery telemetry export found; use the Trace and "
+                "Logging APIs directly."
+            )
+        lines = []
+        if self.trace_table:
+            lines.append(f"Traces: {self.trace_table}")
+        if self.typed_trace_table:
+            lines.append(f"Typed spans: {self.typed_trace_table}")
+        if self.log_table:
+            lines.append(f"Logs: {self.log_table}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class TelemetryCatalogConfig:
+    """Tuning for :class:`TelemetryCatalog`.
+
+    Attributes:
+        db_path: SQLite file for persisted entries; empty keeps them in memory.
+        refresh_after_seconds: Entry age that triggers a background refresh.
+        max_age_seconds: Entry age after which it is rediscovered inline.
+        max_datasets: Listed datasets whose tables are inspected.
+        concurrency: Maximum in-flight discovery requests.
+        max_entries: Entries kept in memory (LRU).
+        request_timeout_seconds: Timeout per discovery request.
+    """
+
+    db_path: str = ".sre_agent_memory.db"
+    refresh_after_seconds: float = 900.0
+    max_age_seconds: float = 86400.0
+    max_datasets: int = 20
+    concurrency: int = 8
+    max_entries: int = 256
+    request_timeout_seconds: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> TelemetryCatalogConfig:
+        """Build a config from ``SRE_AGENT_TELEMETRY_CATALOG_*`` variables."""
+        return cls(
+            db_path=os.environ.get(
+                "SRE_AGENT_TELEMETRY_CATALOG_DB", ".sre_agent_memory.db"
+            ),
+            refresh_after_seconds=float(
+                os.environ.get("SRE_AGENT_TELEMETRY_CATALOG_REFRESH_SECONDS", "900")
+            ),
+            max_age_seconds=float(
+                os.environ.get("SRE_AGENT_TELEMETRY_CATALOG_MAX_AGE_SECONDS", "86400")
+            ),
+            max_datasets=int(
+                os.environ.get("SRE_AGENT_TELEMETRY_CATALOG_MAX_DATASETS", "20")
+            ),
+            concurrency=int(
+                os.environ.get("SRE_AGENT_TELEMETRY_CATALOG_CONCURRENCY", "8")
+            ),
+        )
+
+
+def current_principal(credentials: Any | None = None) -> str:
+    """Identify the credentials the current request runs as.
+
+    Args:
+        credentials: Explicit end-user credentials (e.g. from a tool context);
+            defaults to the request's credentials.
+
+    Returns:
+        The user ID if known, a hash of the end-user token otherwise, or
+        ``adc`` for the service's default credentials.
+    """
+    from sre_agent.auth import get_current_credentials_or_none, get_current_user_id
+
+    user_id = get_current_user_id()
+    if user_id:
+        return user_id
+    creds = credentials or get_current_credentials_or_none()
+    token = getattr(creds, "token", None) if creds else None
+    if isinstance(token, str) and token:
+        return "token:" + hashlib.sha256(token.encode()).hexdigest()[:16]
+    return "adc"
+
+
+def _resolve_token() -> str | None:
+    """Return an access token for the current context (may refresh ADC)."""
+    from sre_agent.auth import GLOBAL_CONTEXT_CREDENTIALS
+
+    return GLOBAL_CONTEXT_CREDENTIALS.token
+
+
+def _dataset_from_link(link: dict[str, Any]) -> str:
+    uri = link.get("bigqueryDataset", {}).get("datasetId", "")
+    return str(uri).split("/")[-1]
+
+
+def _is_trace_link(link: dict[str, Any]) -> bool:
+    link_id = str(link.get("name", "")).split("/")[-1].lower()
+    uri = str(link.get("bigqueryDataset", {}).get("datasetId", "")).lower()
+    return any(word in text for word in ("trace", "span") for text in (link_id, uri))
+
+
+def _log_failure(future: Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Failed to persist telemetry catalog: {future.exception()}")
+
+
+class _Discovery:
+    """One discovery pass for a project, sharing a client and a semaphore."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        project_id: str,
+        token: str,
+        config: TelemetryCatalogConfig,
+    ) -> None:
+        self.client = client
+        self.project_id = project_id
+        self.config = config
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "x-goog-user-project": project_id,
+        }
+        self.semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def fetch(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """GET ``url``; return (status, JSON body), status 0 on transport errors."""
+        async with self.semaphore:
+            try:
+                resp = await self.client.get(
+                    url,
+                    params=params,
+                    headers=self.headers,
+                    timeout=self.config.request_timeout_seconds,
+                )
+            except httpx.HTTPError as e:
+                logger.debug(f"Telemetry discovery request failed ({url}): {e}")
+                return 0, {}
+        try:
+            body = resp.json()
+        except ValueError:
+            body = {}
+        return resp.status_code, body if isinstance(body, dict) else {}
+
+    async def links(self, url: str) -> list[dict[str, Any]]:
+        status, body = await self.fetch(url)
+        return list(body.get("links", [])) if status == 200 else []
+
+    async def linked_log_dataset(self) -> str | None:
+        url = (
+            f"{LOGGING_API}/projects/{self.project_id}/locations/global/"
+            "buckets/_Default/links"
+        )
+        for link in await self.links(url):
+            if dataset := _dataset_from_link(link):
+                return dataset
+        return None
+
+    async def linked_trace_dataset(self) -> str | None:
+        logging_links, observability_links = await asyncio.gather(
+            self._logging_trace_links(), self._observability_span_links()
+        )
+        for link in logging_links:
+            if _is_trace_link(link) and (dataset := _dataset_from_link(link)):
+                return dataset
+        for link in observability_links:
+            if dataset := _dataset_from_link(link):
+                return dataset
+        return None
+
+    async def _logging_trace_links(self) -> list[dict[str, Any]]:
+        url = f"{LOGGING_API}/projects/{self.project_id}/locations/-/buckets"
+        status, body = await self.fetch(url)
+        if status != 200:
+            return []
+        names = [b["name"] for b in body.get("buckets", []) if "name" in b]
+        per_bucket = await asyncio.gather(
+            *(self.links(f"{LOGGING_API}/{name}/links") for name in names)
+        )
+        return [link for links in per_bucket for link in links]
+
+    async def _observability_span_links(self) -> list[dict[str, Any]]:
+        listings = await asyncio.gather(
+            *(
+                self.fetch(
+                    f"{OBSERVABILITY_API}/projects/{self.project_id}/locations/"
+                    f"{location}/buckets"
+                )
+                for location in OBSERVABILITY_LOCATIONS
+            )
+        )
+        names = [
+            b["name"]
+            for status, body in listings
+            if status == 200
+            for b in body.get("buckets", [])
+            if "name" in b
+        ]
+        per_bucket = await asyncio.gather(
+            *(
+                self.links(f"{OBSERVABILITY_API}/{name}/datasets/Spans/links")
+                for name in names
+            )
+        )
+        return [link for links in per_bucket for link in links]
+
+    async def list_datasets(self) -> tuple[list[str] | None, int, str]:
+        """Return (dataset IDs or None on failure, HTTP status, error message)."""
+        status, body = await self.fetch(
+            f"{BIGQUERY_API}/projects/{self.project_id}/datasets",
+            params={"maxResults": 1000},
+        )
+        if status != 200:
+            message = body.get("error", {}).get("message", "") or "request failed"
+            return None, status, message
+        return (
+            [
+                d["datasetReference"]["datasetId"]
+                for d in body.get("datasets", [])
+                if "datasetReference" in d
+            ],
+            status,
+            "",
+        )
+
+    async def list_tables(self, dataset_id: str) -> list[str]:
+        status, body = await self.fetch(
+            f"{BIGQUERY_API}/projects/{self.project_id}/datasets/{dataset_id}/tables",
+            params={"maxResults": 1000},
+        )
+        if status != 200:
+            return []
+        return [
+            t["tableReference"]["tableId"]
+            for t in body.get("tables", [])
+            if "tableReference" in t
+        ]
+
+    async def table_columns(self, table: str) -> list[str]:
+        _, dataset_id, table_id = table.split(".")
+        status, body = await self.fetch(
+            f"{BIGQUERY_API}/projects/{self.project_id}/datasets/{dataset_id}/"
+            f"tables/{table_id}",
+            params={"fields": "schema"},
+        )
+        if status != 200:
+            return []
+        return [f["name"] for f in body.get("schema", {}).get("fields", [])]
+
+
+def _error_type(status: int) -> tuple[str, bool]:
+    if status == 401:
+        return "AUTH_ERROR", True
+    if status == 403:
+        return "PERMISSION_DENIED", True
+    if status == 404:
+        return "NOT_FOUND", True
+    return "UNAVAILABLE", False
+
+
+class TelemetryCatalog:
+    """Cached, persisted telemetry sources per (project, principal)."""
+
+    def __init__(
+        self,
+        config: TelemetryCatalogConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the catalog.
+
+        Args:
+            config: Tuning (defaults from the environment).
+            transport: HTTP transport for discovery requests (for testing).
+        """
+        self.config = config or TelemetryCatalogConfig.from_env()
+        self._transport = transport
+        self._entries: OrderedDict[tuple[str, str], TelemetrySources] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Task[TelemetrySources]] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._db: LocalDatabase | None = None
+        if self.config.db_path:
+            self._db = get_local_database(self.config.db_path)
+            self._db.write(lambda conn: conn.execute(_CREATE_TABLE_SQL))
+        self.hits = 0
+        self.misses = 0
+        self.discoveries = 0
+        self.refreshes = 0
+
+    # ── Lookup ───────────────────────────────────────────────────────
+
+    def peek(
+        self, project_id: str, principal: str | None = None
+    ) -> TelemetrySources | None:
+        """Return the in-memory entry without discovering or refreshing."""
+        key = (project_id, principal or current_principal())
+        sources = self._entries.get(key)
+        if sources is not None and sources.age() < self.config.max_age_seconds:
+            return sources
+        return None
+
+    async def get(
+        self,
+        project_id: str,
+        refresh: bool = False,
+        credentials: Any | None = None,
+    ) -> TelemetrySources:
+        """Return the telemetry sources for ``project_id``.
+
+        Fresh entries are returned from memory or the local database. Entries
+        older than ``refresh_after_seconds`` are returned as-is while a
+        background refresh runs; missing or expired entries are discovered
+        inline, sharing one discovery between concurrent callers.
+
+        Args:
+            project_id: The project to inspect.
+            refresh: Rediscover even if a fresh entry exists.
+            credentials: Explicit end-user credentials to discover with, for
+                callers outside the request context (e.g. Agent Engine tools).
+
+        Returns:
+            The discovered sources.
+
+        Raises:
+            DiscoveryError: If the project could not be inspected.
+        """
+        key = (project_id, current_principal(credentials))
+        sources = None if refresh else await self._lookup(key)
+        if sources is not None:
+            self.hits += 1
+            if sources.age() >= self.config.refresh_after_seconds:
+                self._schedule(key, credentials)
+            return sources
+        self.misses += 1
+        return await asyncio.shield(self._schedule(key, credentials))
+
+    async def _lookup(self, key: tuple[str, str]) -> TelemetrySources | None:
+        sources = self._entries.get(key)
+        if sources is None:
+            sources = await self._load(key)
+            if sources is not None:
+                self._remember(sources)
+        else:
+            self._entries.move_to_end(key)
+        if sources is not None and sources.age() < self.config.max_age_seconds:
+            return sources
+        return None
+
+    def _schedule(
+        self, key: tuple[str, str], credentials: Any | None
+    ) -> asyncio.Task[TelemetrySources]:
+        task = self._inflight.get(key)
+        if task is None:
+            if key in self._entries:
+                self.refreshes += 1
+            task = asyncio.create_task(self._refresh(key, credentials))
+            task.add_done_callback(lambda t: self._settle(key, t))
+            self._inflight[key] = task
+        return task
+
+    def _settle(self, key: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Telemetry discovery failed for {key[0]}: {task.exception()}")
+
+    async def _refresh(
+        self, key: tuple[str, str], credentials: Any | None
+    ) -> TelemetrySources:
+        project_id, principal = key
+        sources = await self._discover(project_id, principal, credentials)
+        self._remember(sources)
+        self._persist(sources)
+        return sources
+
+    def _remember(self, sources: TelemetrySources) -> None:
+        key = (sources.project_id, sources.principal)
+        self._entries[key] = sources
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return the fresh in-memory entries, serialized, for a warm start."""
+        return [
+            sources.to_dict()
+            for sources in self._entries.values()
+            if sources.age() < self.config.max_age_seconds
+        ]
+
+    def prime(self, entries: list[dict[str, Any]]) -> int:
+        """Load :meth:`snapshot` output into memory, skipping expired entries.
+
+        Returns:
+            Number of entries loaded.
+        """
+        loaded = 0
+        for data in entries:
+            try:
+                sources = TelemetrySources.from_dict(data)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable telemetry catalog entry: {e}")
+                continue
+            if sources.age() < self.config.max_age_seconds:
+                self._remember(sources)
+                loaded += 1
+        return loaded
+
+    # ── Persistence ──────────────────────────────────────────────────
+
+    async def _load(self, key: tuple[str, str]) -> TelemetrySources | None:
+        if self._db is None:
+            return None
+        rows = await self._db.aread(
+            lambda conn: conn.execute(
+                "SELECT sources FROM telemetry_catalog "
+                "WHERE project_id = ? AND principal = ?",
+                key,
+            ).fetchall()
+        )
+        if not rows:
+            return None
+        try:
+            return TelemetrySources.from_dict(json.loads(rows[0][0]))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable telemetry catalog entry: {e}")
+            return None
+
+    def _persist(self, sources: TelemetrySources) -> None:
+        if self._db is None:
+            return
+        row = (
+            sources.project_id,
+            sources.principal,
+            json.dumps(sources.to_dict()),
+            sources.discovered_at,
+        )
+        future = self._db.submit(lambda conn: conn.execute(_UPSERT_SQL, row))
+        future.add_done_callback(_log_failure)
+
+    # ── Discovery ────────────────────────────────────────────────────
+
+    def _http_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(transport=self._transport)
+            self._client_loop = loop
+        return self._client
+
+    async def _discover(
+        self, project_id: str, principal: str, credentials: Any | None = None
+    ) -> TelemetrySources:
+        start = time.perf_counter()
+        try:
+            token = getattr(credentials, "token", None) or await asyncio.to_thread(
+                _resolve_token
+            )
+        except Exception as e:
+            raise DiscoveryError(
+                f"Failed to get GCP credentials: {e}", "AUTH_ERROR", True
+            ) from e
+        if not token:
+            raise DiscoveryError("No GCP credentials available", "AUTH_ERROR", True)
+
+        self.discoveries += 1
+        run = _Discovery(self._http_client(), project_id, token, self.config)
+        sources = TelemetrySources(project_id=project_id, principal=principal)
+
+        # Phase 1: bucket links and the dataset list.
+        log_dataset, trace_dataset, (listed, status, error) = await asyncio.gather(
+            run.linked_log_dataset(), run.linked_trace_dataset(), run.list_datasets()
+        )
+        sources.log_dataset = log_dataset
+        sources.trace_dataset = trace_dataset
+
+        # Phase 2: tables of linked datasets first, then listed ones.
+        candidates = [d for d in (trace_dataset, log_dataset) if d]
+        if listed is None:
+            candidates.extend(FALLBACK_TRACE_DATASETS)
+        else:
+            candidates.extend(listed[: self.config.max_datasets])
+        candidates = list(dict.fromkeys(candidates))
+        tables = await asyncio.gather(*(run.list_tables(d) for d in candidates))
+
+        from sre_agent.tools.analysis.bigquery.otel_schema import FLAT_SPANS_TABLE
+
+        trace_at = log_at = flat_at = None
+        for dataset_id, table_ids in zip(candidates, tables, strict=True):
+            if listed is not None or table_ids:
+                sources.datasets_scanned.append(dataset_id)
+            if TRACE_TABLE in table_ids and trace_at is None:
+                trace_at = dataset_id
+            if LOG_TABLE in table_ids and log_at is None:
+                log_at = dataset_id
+            if FLAT_SPANS_TABLE in table_ids and (
+                flat_at is None or dataset_id == trace_at
+            ):
+                flat_at = dataset_id
+
+        if listed is None and not (trace_at or log_at or log_dataset):
+            error_type, non_retryable = _error_type(status)
+            raise DiscoveryError(
+                f"Failed to list BigQuery datasets in {project_id} "
+                f"(HTTP {status}): {error}",
+                error_type,
+                non_retryable,
+            )
+
+        if trace_at:
+            sources.trace_table = f"{project_id}.{trace_at}.{TRACE_TABLE}"
+            sources.trace_dataset = sources.trace_dataset or trace_at
+        if log_at:
+            sources.log_table = f"{project_id}.{log_at}.{LOG_TABLE}"
+            sources.log_dataset = sources.log_dataset or log_at
+        if flat_at:
+            sources.typed_trace_table = f"{project_id}.{flat_at}.{FLAT_SPANS_TABLE}"
+
+        # Phase 3: schemas of the export tables.
+        found = [
+            t
+            for t in (sources.trace_table, sources.log_table, sources.typed_trace_table)
+            if t
+        ]
+        columns = await asyncio.gather(*(run.table_columns(t) for t in found))
+        sources.schemas = {t: c for t, c in zip(found, columns, strict=True) if c}
+        sources.discovered_at = time.time()
+
+        logger.info(
+            f"🔭 Telemetry catalog: {project_id} ({sources.mode}) discovered in "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms across "
+            f"{len(candidates)} datasets"
+        )
+        return sources
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, int]:
+        """Return cache and discovery counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "discoveries": self.discoveries,
+            "refreshes": self.refreshes,
+            "inflight": len(self._inflight),
+        }
+
+    async def close(self) -> None:
+        """Cancel background refreshes and close the HTTP client."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+
+def typed_trace_table_for(trace_table: str) -> str | None:
+    """Return the typed span table discovered next to ``trace_table``.
+
+    Only the current principal's fresh in-memory entry for the table's
+    project is consulted, so one tenant's discovery never routes another
+    tenant's queries.
+
+    Args:
+        trace_table: Fully qualified ``_AllSpans`` table.
+
+    Returns:
+        The fully qualified typed table, or None if none was discovered.
+    """
+    if _catalog is None:
+        return None
+    sources = _catalog.peek(trace_table.split(".", 1)[0])
+    if sources is None or sources.trace_table != trace_table:
+        return None
+    return sources.typed_trace_table
+
+
+_catalog: TelemetryCatalog | None = None
+
+
+def get_telemetry_catalog() -> TelemetryCatalog:
+    """Get or create the process-wide telemetry catalog.
+
+    Entries are persisted to ``SRE_AGENT_TELEMETRY_CATALOG_DB`` (default
+    ``.sre_agent_memory.db``); an empty value keeps them in memory only.
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = TelemetryCatalog()
+    return _catalog
+
+
+def reset_telemetry_catalog() -> None:
+    """Reset the singleton (for testing)."""
+    global _catalog
+    _catalog = None
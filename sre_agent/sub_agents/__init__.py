@@ -1,20 +1,42 @@
-"""Sub-agents for the SRE Agent."""
-
-from .agent_debugger import agent_debugger
-from .alerts import alert_analyst
-from .logs import log_analyst
-from .metrics import (
-    get_metrics_analyst,
-    get_metrics_analyzer,
-    metrics_analyst,
-    metrics_analyzer,
-)
-from .research import get_research_agent_tool
-from .root_cause import root_cause_analyst
-from .trace import (
-    aggregate_analyzer,
-    trace_analyst,
-)
+"""Sub-agents for the SRE Agent.
+
+Each sub-agent module builds its agent (and imports its tool set) when it is
+first imported, so exports are resolved lazily (PEP 562). The root agent
+obtains them through :mod:`sre_agent.core.agent_registry`.
+
+Once ``sre_agent.sub_agents.agent_debugger`` has been imported, the package
+attribute of that name is the submodule; import the agent from the
+submodule itself.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "agent_debugger": (".agent_debugger", "agent_debugger"),
+    "aggregate_analyzer": (".trace", "aggregate_analyzer"),
+    "alert_analyst": (".alerts", "alert_analyst"),
+    "get_metrics_analyst": (".metrics", "get_metrics_analyst"),
+    "get_metrics_analyzer": (".metrics", "get_metrics_analyzer"),
+    "get_research_agent_tool": (".research", "get_research_agent_tool"),
+    "log_analyst": (".logs", "log_analyst"),
+    "metrics_analyst": (".metrics", "metrics_analyst"),
+    "metrics_analyzer": (".metrics", "metrics_analyzer"),
+    "root_cause_analyst": (".root_cause", "root_cause_analyst"),
+    "trace_analyst": (".trace", "trace_analyst"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy-load sub-agents on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_path, __package__)
+        value = getattr(module, attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "agent_debugger",
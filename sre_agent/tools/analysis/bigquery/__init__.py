@@ -9,6 +9,9 @@ Tools:
     - compare_time_periods: Compare before/after metrics
     - detect_trend_changes: Time series trend analysis
     - correlate_logs_with_trace: Log correlation for root cause
+
+Schema-aware SQL generation (typed ``otel_spans_flat`` columns instead of
+JSON extraction) lives in :mod:`.otel_schema`.
 """
 
 from .otel import (
@@ -18,11 +21,21 @@ from .otel import (
     detect_trend_changes,
     find_exemplar_traces,
 )
+from .otel_schema import (
+    OtelTableSchema,
+    register_otel_table,
+    resolve_log_schema,
+    resolve_span_schema,
+)
 
 __all__ = [
+    "OtelTableSchema",
     "analyze_aggregate_metrics",
     "compare_time_periods",
     "correlate_logs_with_trace",
     "detect_trend_changes",
     "find_exemplar_traces",
+    "register_otel_table",
+    "resolve_log_schema",
+    "resolve_span_schema",
 ]
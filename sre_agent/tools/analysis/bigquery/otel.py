@@ -26,6 +26,8 @@ from typing import Any
 from sre_agent.schema import BaseToolResponse, ToolStatus
 from sre_agent.tools.common.decorators import adk_tool
 
+from .otel_schema import resolve_log_schema, resolve_span_schema
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,15 +60,16 @@ def analyze_aggregate_metrics(
     Returns:
         Standardized response with SQL query and metadata for execution via BigQuery MCP.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    svc = schema.attr("service.name")
+
     where_conditions = [
         f"start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)",
         "parent_span_id IS NULL  -- Root spans only for aggregate metrics",
     ]
 
     if service_name:
-        where_conditions.append(
-            f"JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
-        )
+        where_conditions.append(f"{svc} = '{service_name}'")
 
     if operation_name:
         where_conditions.append(f"name = '{operation_name}'")
@@ -79,7 +82,7 @@ def analyze_aggregate_metrics(
 
     group_by_field = group_by
     if group_by == "service_name":
-        group_by_field = "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name')"
+        group_by_field = svc
     elif group_by == "operation_name":
         group_by_field = "name"
     elif group_by == "status_code":
@@ -97,7 +100,7 @@ SELECT
   ROUND(AVG(duration_nano / 1000000), 2) as avg_duration_ms,
   MIN(start_time) as first_seen,
   MAX(start_time) as last_seen
-FROM `{dataset_id}.{table_name}`
+FROM `{schema.table_ref}`
 WHERE {where_clause}
 GROUP BY {group_by}
 ORDER BY error_rate_pct DESC, p99_ms DESC
@@ -111,6 +114,7 @@ LIMIT 50
         result={
             "analysis_type": "aggregate_metrics",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": f"Aggregate metrics grouped by {group_by} for last {time_window_hours}h",
             "next_steps": [
                 "Execute this query using BigQuery MCP execute_sql tool",
@@ -151,15 +155,17 @@ def find_exemplar_traces(
     Returns:
         Standardized response with SQL query to find exemplar trace IDs.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    svc = schema.attr("service.name")
+    t_svc = schema.attr("service.name", "t")
+
     where_conditions = [
         f"start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)",
         "parent_span_id IS NULL",
     ]
 
     if service_name:
-        where_conditions.append(
-            f"JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
-        )
+        where_conditions.append(f"{svc} = '{service_name}'")
 
     if operation_name:
         where_conditions.append(f"name = '{operation_name}'")
@@ -171,18 +177,18 @@ def find_exemplar_traces(
 WITH duration_stats AS (
   SELECT
     APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)] as p95_ms
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE {where_clause}
 )
 SELECT
   t.trace_id,
   t.name as operation,
-  JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+  {t_svc} as service_name,
   ROUND(t.duration_nano / 1000000, 2) as duration_ms,
   t.status.code as status_code,
   t.start_time,
   ROUND((t.duration_nano / 1000000 - s.p95_ms) / s.p95_ms * 100, 2) as pct_above_p95
-FROM `{dataset_id}.{table_name}` t
+FROM `{schema.table_ref}` t
 CROSS JOIN duration_stats s
 WHERE {where_clause}
   AND t.duration_nano / 1000000 >= s.p95_ms
@@ -195,13 +201,13 @@ LIMIT {limit}
 SELECT
   trace_id,
   name as operation,
-  JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+  {svc} as service_name,
   ROUND(duration_nano / 1000000, 2) as duration_ms,
   status.code as status_code,
   status.message as error_message,
   start_time,
   'error_trace' as selection_reason
-FROM `{dataset_id}.{table_name}`
+FROM `{schema.table_ref}`
 WHERE {where_clause}
   AND status.code = 2  -- ERROR
 ORDER BY start_time DESC
@@ -213,18 +219,18 @@ LIMIT {limit}
 WITH duration_stats AS (
   SELECT
     APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(50)] as p50_ms
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE {where_clause}
 )
 SELECT
   t.trace_id,
   t.name as operation,
-  JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+  {t_svc} as service_name,
   ROUND(t.duration_nano / 1000000, 2) as duration_ms,
   t.status.code as status_code,
   t.start_time,
   'baseline_p50' as selection_reason
-FROM `{dataset_id}.{table_name}` t
+FROM `{schema.table_ref}` t
 CROSS JOIN duration_stats s
 WHERE {where_clause}
   AND t.status.code != 2  -- Not ERROR
@@ -239,19 +245,19 @@ WITH duration_stats AS (
   SELECT
     APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(50)] as p50_ms,
     APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)] as p95_ms
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE {where_clause}
 ),
 baseline_traces AS (
   SELECT
     t.trace_id,
     t.name as operation,
-    JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+    {t_svc} as service_name,
     ROUND(t.duration_nano / 1000000, 2) as duration_ms,
     t.status.code as status_code,
     t.start_time,
     'baseline_p50' as selection_reason
-  FROM `{dataset_id}.{table_name}` t
+  FROM `{schema.table_ref}` t
   CROSS JOIN duration_stats s
   WHERE {where_clause}
     AND t.status.code != 2
@@ -263,12 +269,12 @@ outlier_traces AS (
   SELECT
     t.trace_id,
     t.name as operation,
-    JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+    {t_svc} as service_name,
     ROUND(t.duration_nano / 1000000, 2) as duration_ms,
     t.status.code as status_code,
     t.start_time,
     'outlier_p95' as selection_reason
-  FROM `{dataset_id}.{table_name}` t
+  FROM `{schema.table_ref}` t
   CROSS JOIN duration_stats s
   WHERE {where_clause}
     AND t.duration_nano / 1000000 >= s.p95_ms
@@ -296,6 +302,7 @@ ORDER BY selection_reason, duration_ms
             "analysis_type": "exemplar_selection",
             "selection_strategy": selection_strategy,
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": f"Find {limit} exemplar traces using '{selection_strategy}' strategy",
             "next_steps": [
                 "Execute this query using BigQuery MCP execute_sql tool",
@@ -331,13 +338,18 @@ def correlate_logs_with_trace(
     Returns:
         Standardized response with SQL query to find correlated logs.
     """
+    trace_schema = resolve_span_schema(dataset_id, trace_table_name)
+    log_schema = resolve_log_schema(dataset_id, log_table_name)
+    trace_svc = trace_schema.attr("service.name")
+    l_svc = log_schema.attr("service.name", "l")
+
     query = f"""
 WITH trace_context AS (
   SELECT
     MIN(start_time) as trace_start,
     MAX(end_time) as trace_end,
-    ANY_VALUE(JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name')) as service_name
-  FROM `{dataset_id}.{trace_table_name}`
+    ANY_VALUE({trace_svc}) as service_name
+  FROM `{trace_schema.table_ref}`
   WHERE trace_id = '{trace_id}'
     AND parent_span_id IS NULL
 ),
@@ -346,10 +358,10 @@ direct_logs AS (
     l.time_unix_nano as timestamp,
     l.severity_text as severity,
     l.body.string_value as message,
-    JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name') as service,
+    {l_svc} as service,
     'direct_correlation' as correlation_type,
     l.trace_id
-  FROM `{dataset_id}.{log_table_name}` l
+  FROM `{log_schema.table_ref}` l
   WHERE l.trace_id = '{trace_id}'
 )
 """
@@ -361,12 +373,12 @@ nearby_logs AS (
     l.time_unix_nano as timestamp,
     l.severity_text as severity,
     l.body.string_value as message,
-    JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name') as service,
+    {l_svc} as service,
     'temporal_correlation' as correlation_type,
     l.trace_id
-  FROM `{dataset_id}.{log_table_name}` l
+  FROM `{log_schema.table_ref}` l
   CROSS JOIN trace_context t
-  WHERE JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name') = t.service_name
+  WHERE {l_svc} = t.service_name
     AND TIMESTAMP_MICROS(CAST(l.time_unix_nano / 1000 AS INT64)) >= TIMESTAMP_SUB(t.trace_start, INTERVAL {time_window_seconds} SECOND)
     AND TIMESTAMP_MICROS(CAST(l.time_unix_nano / 1000 AS INT64)) <= TIMESTAMP_ADD(t.trace_end, INTERVAL {time_window_seconds} SECOND)
     AND l.severity_text IN ('ERROR', 'ERROR2', 'ERROR3', 'ERROR4', 'FATAL', 'WARN')
@@ -392,6 +404,7 @@ ORDER BY timestamp
             "analysis_type": "log_correlation",
             "trace_id": trace_id,
             "sql_query": query.strip(),
+            "column_mode": trace_schema.mode,
             "description": f"Find logs correlated with trace {trace_id}",
             "next_steps": [
                 "Execute this query using BigQuery MCP execute_sql tool",
@@ -430,9 +443,12 @@ def compare_time_periods(
     Returns:
         Standardized response with SQL query comparing the two periods.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    svc = schema.attr("service.name")
+
     where_filter = ""
     if service_name:
-        where_filter += f"AND JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'\n  "
+        where_filter += f"AND {svc} = '{service_name}'\n  "
     if operation_name:
         where_filter += f"AND name = '{operation_name}'\n  "
 
@@ -447,7 +463,7 @@ WITH baseline_period AS (
     ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)], 2) as p95_ms,
     ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(99)], 2) as p99_ms,
     ROUND(AVG(duration_nano / 1000000), 2) as avg_ms
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {baseline_hours_ago_start} HOUR)
     AND start_time < TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {baseline_hours_ago_end} HOUR)
     AND parent_span_id IS NULL
@@ -463,7 +479,7 @@ anomaly_period AS (
     ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)], 2) as p95_ms,
     ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(99)], 2) as p99_ms,
     ROUND(AVG(duration_nano / 1000000), 2) as avg_ms
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {anomaly_hours_ago_start} HOUR)
     AND start_time < TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {anomaly_hours_ago_end} HOUR)
     AND parent_span_id IS NULL
@@ -498,6 +514,7 @@ ORDER BY period
         result={
             "analysis_type": "time_period_comparison",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "baseline_period": f"{baseline_hours_ago_start}h ago to {baseline_hours_ago_end}h ago",
             "anomaly_period": f"{anomaly_hours_ago_start}h ago to {anomaly_hours_ago_end}h ago",
             "description": "Compare metrics between baseline and anomaly time periods",
@@ -534,9 +551,12 @@ def detect_trend_changes(
     Returns:
         Standardized response with SQL query showing metric trends over time.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    svc = schema.attr("service.name")
+
     where_filter = ""
     if service_name:
-        where_filter = f"AND JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
+        where_filter = f"AND {svc} = '{service_name}'"
 
     if metric == "p95":
         metric_calc = "ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)], 2) as metric_value"
@@ -564,7 +584,7 @@ WITH time_buckets AS (
     TIMESTAMP_TRUNC(start_time, HOUR) as time_bucket,
     {metric_calc},
     COUNT(*) as sample_size
-  FROM `{dataset_id}.{table_name}`
+  FROM `{schema.table_ref}`
   WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
     AND parent_span_id IS NULL
     {where_filter}
@@ -609,6 +629,7 @@ ORDER BY time_bucket DESC
         result={
             "analysis_type": "trend_detection",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "metric": metric,
             "time_window_hours": time_window_hours,
             "bucket_hours": bucket_hours,
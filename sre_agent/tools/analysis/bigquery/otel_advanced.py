@@ -10,6 +10,7 @@ from typing import Any
 from sre_agent.schema import BaseToolResponse, ToolStatus
 
 from ...common import adk_tool
+from .otel_schema import resolve_span_schema
 
 logger = logging.getLogger(__name__)
 
@@ -36,14 +37,16 @@ def analyze_span_events(
     Returns:
         JSON with SQL query.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    t_svc = schema.attr("service.name", "t")
+    svc = schema.attr("service.name")
+
     where_conditions = [
         f"start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)",
         "ARRAY_LENGTH(events) > 0",
     ]
     if service_name:
-        where_conditions.append(
-            f"JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
-        )
+        where_conditions.append(f"{svc} = '{service_name}'")
 
     # If we filter by event name, we put it in the UNNEST check or outside
     # Usually easier to filter after UNNEST
@@ -57,13 +60,13 @@ def analyze_span_events(
 SELECT
   t.trace_id,
   t.span_id,
-  JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+  {t_svc} as service_name,
   event.name,
   event.time,
   JSON_EXTRACT_SCALAR(event.attributes, '$.exception.type') as `exception.type`,
   JSON_EXTRACT_SCALAR(event.attributes, '$.exception.message') as `exception.message`,
   JSON_EXTRACT_SCALAR(event.attributes, '$.exception.stacktrace') as `exception.stacktrace`
-FROM `{dataset_id}.{table_name}` t,
+FROM `{schema.table_ref}` t,
 UNNEST(events) as event
 WHERE {where_clause}
   {event_filter_clause}
@@ -75,6 +78,7 @@ LIMIT 100
         result={
             "analysis_type": "span_events",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze span events from OpenTelemetry data",
         },
     )
@@ -97,11 +101,14 @@ def analyze_exception_patterns(
         group_by: 'exception_type' or 'service_name'
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    t_svc = schema.attr("service.name", "t")
+
     group_expr = "JSON_EXTRACT_SCALAR(event.attributes, '$.exception.type')"
     group_alias = "exception_type"
 
     if group_by == "service_name":
-        group_expr = "JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name')"
+        group_expr = t_svc
         group_alias = "service_name"
 
     query = f"""
@@ -109,9 +116,9 @@ SELECT
   {group_expr} as {group_alias},
   COUNT(*) as exception_count,
   COUNT(DISTINCT t.trace_id) as affected_traces,
-  COUNT(DISTINCT JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name')) as affected_services,
+  COUNT(DISTINCT {t_svc}) as affected_services,
   STRING_AGG(DISTINCT JSON_EXTRACT_SCALAR(event.attributes, '$.exception.message') LIMIT 5) as sample_messages
-FROM `{dataset_id}.{table_name}` t,
+FROM `{schema.table_ref}` t,
 UNNEST(events) as event
 WHERE t.start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
   AND event.name = 'exception'
@@ -124,6 +131,7 @@ LIMIT 50
         result={
             "analysis_type": "exception_patterns",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze exception patterns",
         },
     )
@@ -146,14 +154,16 @@ def analyze_span_links(
         service_name: Optional filter for service name
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    t_svc = schema.attr("service.name", "t")
+    svc = schema.attr("service.name")
+
     where_conditions = [
         f"start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)",
         "ARRAY_LENGTH(links) > 0",
     ]
     if service_name:
-        where_conditions.append(
-            f"JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
-        )
+        where_conditions.append(f"{svc} = '{service_name}'")
 
     where_clause = " AND ".join(where_conditions)
 
@@ -161,13 +171,13 @@ def analyze_span_links(
 SELECT
   t.trace_id,
   t.span_id,
-  JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+  {t_svc} as service_name,
   link.trace_id as `link.trace_id`,
   link.span_id as `link.span_id`,
   JSON_EXTRACT_SCALAR(link.attributes, '$.type') as `link.type`,
   JSON_EXTRACT_SCALAR(link.attributes, '$.reason') as `link.reason`,
   TO_JSON_STRING(link.attributes) as `link.attributes`
-FROM `{dataset_id}.{table_name}` t,
+FROM `{schema.table_ref}` t,
 UNNEST(links) as link
 WHERE {where_clause}
 LIMIT 100
@@ -177,6 +187,7 @@ LIMIT 100
         result={
             "analysis_type": "span_links",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze span links",
         },
     )
@@ -197,13 +208,16 @@ def analyze_link_patterns(
         time_window_hours: Time window in hours
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    t_svc = schema.attr("service.name", "t")
+
     query = f"""
 SELECT
-  JSON_EXTRACT_SCALAR(t.resource.attributes, '$.service.name') as service_name,
+  {t_svc} as service_name,
   COUNTIF(ARRAY_LENGTH(links) > 0) as spans_with_links,
   SUM(ARRAY_LENGTH(links)) as total_links,
   ROUND(AVG(ARRAY_LENGTH(links)), 2) as avg_links_per_span
-FROM `{dataset_id}.{table_name}` t
+FROM `{schema.table_ref}` t
 WHERE t.start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
 GROUP BY 1
 ORDER BY total_links DESC
@@ -213,6 +227,7 @@ ORDER BY total_links DESC
         result={
             "analysis_type": "link_patterns",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze link patterns",
         },
     )
@@ -233,16 +248,19 @@ def analyze_instrumentation_libraries(
         time_window_hours: Time window in hours
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    svc = schema.attr("service.name")
+
     query = f"""
 SELECT
   instrumentation_scope.name as `instrumentation_scope.name`,
   instrumentation_scope.version as `instrumentation_scope.version`,
   instrumentation_scope.schema_url as `instrumentation_scope.schema_url`,
   COUNT(*) as span_count,
-  COUNT(DISTINCT JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name')) as service_count,
+  COUNT(DISTINCT {svc}) as service_count,
   COUNT(DISTINCT trace_id) as trace_count,
-  STRING_AGG(DISTINCT JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') LIMIT 5) as services_using
-FROM `{dataset_id}.{table_name}`
+  STRING_AGG(DISTINCT {svc} LIMIT 5) as services_using
+FROM `{schema.table_ref}`
 WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
 GROUP BY 1, 2, 3
 ORDER BY span_count DESC
@@ -252,6 +270,7 @@ ORDER BY span_count DESC
         result={
             "analysis_type": "instrumentation_libraries",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze instrumentation libraries",
         },
     )
@@ -274,18 +293,25 @@ def analyze_http_attributes(
         min_request_count: Minimum request count
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    http_method_col = schema.attr("http.method")
+    http_target_col = schema.attr("http.target")
+    http_status_code_col = schema.attr("http.status_code")
+    http_request_content_length_col = schema.attr("http.request_content_length")
+    http_response_content_length_col = schema.attr("http.response_content_length")
+
     query = f"""
 SELECT
-  JSON_EXTRACT_SCALAR(attributes, '$.http.method') as `http.method`,
-  JSON_EXTRACT_SCALAR(attributes, '$.http.target') as `http.target`,
-  JSON_EXTRACT_SCALAR(attributes, '$.http.status_code') as `http.status_code`,
+  {http_method_col} as `http.method`,
+  {http_target_col} as `http.target`,
+  {http_status_code_col} as `http.status_code`,
   COUNT(*) as request_count,
   ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(50)], 2) as p50_ms,
   ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)], 2) as p95_ms,
   ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(99)], 2) as p99_ms,
-  AVG(CAST(JSON_EXTRACT_SCALAR(attributes, '$.http.request_content_length') AS INT64)) as `http.request_content_length`,
-  AVG(CAST(JSON_EXTRACT_SCALAR(attributes, '$.http.response_content_length') AS INT64)) as `http.response_content_length`
-FROM `{dataset_id}.{table_name}`
+  AVG(CAST({http_request_content_length_col} AS INT64)) as `http.request_content_length`,
+  AVG(CAST({http_response_content_length_col} AS INT64)) as `http.response_content_length`
+FROM `{schema.table_ref}`
 WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
   AND kind = 2 -- SERVER
 GROUP BY 1, 2, 3
@@ -297,6 +323,7 @@ ORDER BY request_count DESC
         result={
             "analysis_type": "http_attributes",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze HTTP attributes",
         },
     )
@@ -319,23 +346,27 @@ def analyze_database_operations(
         db_system: Optional database system filter
         tool_context: Context object for tool execution.
     """
+    schema = resolve_span_schema(dataset_id, table_name)
+    db_system_col = schema.attr("db.system")
+    db_name_col = schema.attr("db.name")
+    db_operation_col = schema.attr("db.operation")
+    db_statement_col = schema.attr("db.statement")
+
     where_extra = ""
     if db_system:
-        where_extra = (
-            f"AND JSON_EXTRACT_SCALAR(attributes, '$.db.system') = '{db_system}'"
-        )
+        where_extra = f"AND {db_system_col} = '{db_system}'"
 
     query = f"""
 SELECT
-  JSON_EXTRACT_SCALAR(attributes, '$.db.system') as `db.system`,
-  JSON_EXTRACT_SCALAR(attributes, '$.db.name') as `db.name`,
-  JSON_EXTRACT_SCALAR(attributes, '$.db.operation') as `db.operation`,
+  {db_system_col} as `db.system`,
+  {db_name_col} as `db.name`,
+  {db_operation_col} as `db.operation`,
   COUNT(*) as call_count,
   ROUND(AVG(duration_nano / 1000000), 2) as avg_latency_ms,
   ROUND(APPROX_QUANTILES(duration_nano / 1000000, 100)[OFFSET(95)], 2) as p95_latency_ms,
-  STRING_AGG(DISTINCT JSON_EXTRACT_SCALAR(attributes, '$.db.statement') LIMIT 3) as sample_statements,
-  ANY_VALUE(JSON_EXTRACT_SCALAR(attributes, '$.db.statement')) as `db.statement`
-FROM `{dataset_id}.{table_name}`
+  STRING_AGG(DISTINCT {db_statement_col} LIMIT 3) as sample_statements,
+  ANY_VALUE({db_statement_col}) as `db.statement`
+FROM `{schema.table_ref}`
 WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
   AND kind = 3 -- CLIENT
   {where_extra}
@@ -347,6 +378,7 @@ ORDER BY call_count DESC
         result={
             "analysis_type": "database_operations",
             "sql_query": query.strip(),
+            "column_mode": schema.mode,
             "description": "Analyze database operations",
         },
     )
@@ -0,0 +1,259 @@
+"""Schema-aware column resolution for OpenTelemetry SQL generation.
+
+The raw ``_AllSpans`` / ``_AllLogs`` tables keep resource and span
+attributes in JSON columns, so every ``JSON_EXTRACT_SCALAR(...)`` predicate
+or grouping forces BigQuery to parse the JSON of every scanned row and
+defeats clustering.  When a denormalized table with typed columns exists
+(the setup-created ``otel_spans_flat`` materialized view, partitioned by
+``DATE(start_time)`` and clustered by ``service_name``), the SQL generators
+should read from it instead and reference the typed columns directly.
+
+This module keeps a small in-process registry of such tables, keyed by
+project-qualified dataset, and also routes to typed tables the telemetry
+catalog discovered for the calling principal. It exposes
+:class:`OtelTableSchema`, which renders attribute references either as a
+typed column or as the JSON extraction fallback::
+
+    schema = resolve_span_schema("proj.traces", "_AllSpans")
+    f"SELECT {schema.attr('service.name')} FROM `{schema.table_ref}`"
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+FLAT_SPANS_TABLE = "otel_spans_flat"
+
+
+@dataclass(frozen=True)
+class AttributeColumn:
+    """How an OTel attribute is stored in raw vs. flat tables."""
+
+    json_column: str
+    json_path: str
+    flat_column: str
+
+
+# Attributes referenced by the OTel SQL generators.
+SPAN_ATTRIBUTE_COLUMNS: dict[str, AttributeColumn] = {
+    "service.name": AttributeColumn(
+        "resource.attributes", '$."service.name"', "service_name"
+    ),
+    "host.name": AttributeColumn("resource.attributes", '$."host.name"', "host_name"),
+    "http.method": AttributeColumn("attributes", '$."http.method"', "http_method"),
+    "http.target": AttributeColumn("attributes", '$."http.target"', "http_target"),
+    "http.url": AttributeColumn("attributes", '$."http.url"', "http_url"),
+    "http.status_code": AttributeColumn(
+        "attributes", '$."http.status_code"', "http_status_code"
+    ),
+    "http.request_content_length": AttributeColumn(
+        "attributes",
+        '$."http.request_content_length"',
+        "http_request_content_length",
+    ),
+    "http.response_content_length": AttributeColumn(
+        "attributes",
+        '$."http.response_content_length"',
+        "http_response_content_length",
+    ),
+    "db.system": AttributeColumn("attributes", '$."db.system"', "db_system"),
+    "db.name": AttributeColumn("attributes", '$."db.name"', "db_name"),
+    "db.operation": AttributeColumn("attributes", '$."db.operation"', "db_operation"),
+    "db.statement": AttributeColumn("attributes", '$."db.statement"', "db_statement"),
+}
+
+ALL_FLAT_COLUMNS = frozenset(c.flat_column for c in SPAN_ATTRIBUTE_COLUMNS.values())
+
+
+@dataclass(frozen=True)
+class OtelTableSchema:
+    """Resolved table reference plus the typed attribute columns it offers.
+
+    Attributes:
+        table_ref: Table reference to use in ``FROM`` (without backticks).
+        typed_columns: Flat column names available on the table.
+    """
+
+    table_ref: str
+    typed_columns: frozenset[str] = frozenset()
+
+    @property
+    def is_flat(self) -> bool:
+        """Whether any attribute can be read from a typed column."""
+        return bool(self.typed_columns)
+
+    @property
+    def mode(self) -> str:
+        """Short label describing the column strategy, for tool results."""
+        return "typed_columns" if self.is_flat else "json_extract"
+
+    def attr(self, key: str, alias: str | None = None) -> str:
+        """Render a SQL expression reading the OTel attribute ``key``.
+
+        Args:
+            key: Attribute name, e.g. ``service.name``.
+            alias: Optional table alias to qualify the column with.
+
+        Returns:
+            The typed column when available, else the same ``JSON_VALUE``
+            extraction the flat view is built from.
+        """
+        column = SPAN_ATTRIBUTE_COLUMNS[key]
+        prefix = f"{alias}." if alias else ""
+        if column.flat_column in self.typed_columns:
+            return f"{prefix}{column.flat_column}"
+        return f"JSON_VALUE({prefix}{column.json_column}, '{column.json_path}')"
+
+
+_registry: dict[str, OtelTableSchema] = {}
+_registry_lock = threading.Lock()
+
+
+def _key(dataset_id: str, table_name: str) -> str:
+    return f"{dataset_id}.{table_name}"
+
+
+def _qualified(dataset_id: str) -> str | None:
+    """Prefix a bare dataset with the caller's project (None if unknown).
+
+    Uses the request's project or the configured default project; ADC
+    discovery is skipped since SQL generation must stay cheap.
+    """
+    if "." in dataset_id:
+        return dataset_id
+    from sre_agent.auth import get_current_project_id_or_none
+
+    project_id = (
+        get_current_project_id_or_none()
+        or os.environ.get("GOOGLE_CLOUD_PROJECT")
+        or os.environ.get("GCP_PROJECT_ID")
+    )
+    return f"{project_id}.{dataset_id}" if project_id else None
+
+
+def _lookup(dataset_id: str, table_name: str) -> OtelTableSchema | None:
+    """Find the typed table for ``dataset_id.table_name``, if any.
+
+    Registered tables win; otherwise the telemetry catalog entry of the
+    current project and principal is consulted.
+    """
+    qualified = _qualified(dataset_id)
+    if qualified is None:
+        return None
+    with _registry_lock:
+        schema = _registry.get(_key(qualified, table_name))
+    if schema is not None:
+        return schema
+    from sre_agent.services.telemetry_catalog import typed_trace_table_for
+
+    typed = typed_trace_table_for(_key(qualified, table_name))
+    if typed:
+        return OtelTableSchema(table_ref=typed, typed_columns=ALL_FLAT_COLUMNS)
+    return None
+
+
+def register_otel_table(
+    dataset_id: str,
+    table_name: str,
+    table_ref: str,
+    typed_columns: Iterable[str] = ALL_FLAT_COLUMNS,
+) -> OtelTableSchema:
+    """Route queries for ``dataset_id.table_name`` to a typed-column table.
+
+    The registry is process-wide, so keys must name the project: a tool
+    called with a bare dataset resolves it against its own project first.
+
+    Args:
+        dataset_id: Project-qualified dataset (e.g. ``proj.traces``).
+        table_name: Raw table the tools are called with (e.g. ``_AllSpans``).
+        table_ref: Fully qualified replacement table.
+        typed_columns: Flat columns the replacement exposes.
+
+    Returns:
+        The registered schema.
+
+    Raises:
+        ValueError: If ``dataset_id`` is not project-qualified.
+    """
+    if "." not in dataset_id:
+        raise ValueError(f"Dataset must be project-qualified: {dataset_id!r}")
+    schema = OtelTableSchema(
+        table_ref=table_ref,
+        typed_columns=frozenset(typed_columns) & ALL_FLAT_COLUMNS,
+    )
+    with _registry_lock:
+        _registry[_key(dataset_id, table_name)] = schema
+    logger.info(
+        f"Registered typed OTel table {table_ref} for {_key(dataset_id, table_name)}"
+    )
+    return schema
+
+
+def resolve_span_schema(dataset_id: str, table_name: str) -> OtelTableSchema:
+    """Resolve which table and columns to use for span queries.
+
+    Returns the registered (or catalog-discovered) typed table if one
+    exists, treats a direct reference to ``otel_spans_flat`` as fully typed,
+    and otherwise falls back to JSON extraction on the requested table.
+    """
+    schema = _lookup(dataset_id, table_name)
+    if schema is not None:
+        return schema
+    if table_name == FLAT_SPANS_TABLE:
+        return OtelTableSchema(
+            table_ref=_key(dataset_id, table_name), typed_columns=ALL_FLAT_COLUMNS
+        )
+    return OtelTableSchema(table_ref=_key(dataset_id, table_name))
+
+
+def resolve_log_schema(dataset_id: str, table_name: str) -> OtelTableSchema:
+    """Resolve which table and columns to use for OTel log queries."""
+    qualified = _qualified(dataset_id)
+    schema = None
+    if qualified is not None:
+        with _registry_lock:
+            schema = _registry.get(_key(qualified, table_name))
+    return schema or OtelTableSchema(table_ref=_key(dataset_id, table_name))
+
+
+def clear_otel_schema_registry() -> None:
+    """Forget all registered typed tables (for testing)."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def build_flat_spans_view_sql(
+    project_id: str,
+    target_dataset: str,
+    source_dataset: str,
+    source_table: str = "_AllSpans",
+) -> str:
+    """Build the DDL for the ``otel_spans_flat`` materialized view.
+
+    Pre-extracts every attribute in :data:`SPAN_ATTRIBUTE_COLUMNS` into a
+    typed column, partitions by day on ``start_time`` and clusters on
+    ``service_name`` (then ``name`` and ``trace_id`` for lookups).
+    """
+    extracted = ",\n      ".join(
+        f"JSON_VALUE({c.json_column}, '{c.json_path}') AS {c.flat_column}"
+        for c in SPAN_ATTRIBUTE_COLUMNS.values()
+    )
+    return f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS `{project_id}.{target_dataset}.{FLAT_SPANS_TABLE}`
+    PARTITION BY DATE(start_time)
+    CLUSTER BY service_name, name, trace_id
+    OPTIONS (
+      enable_refresh = true, refresh_interval_minutes = 5,
+      max_staleness = INTERVAL "30" MINUTE, allow_non_incremental_definition = true
+    ) AS
+    SELECT
+      trace_id, span_id, parent_span_id, name, kind, start_time, end_time,
+      duration_nano, status, events, links, instrumentation_scope,
+      attributes, resource,
+      {extracted}
+    FROM `{project_id}.{source_dataset}.{source_table}`
+    """
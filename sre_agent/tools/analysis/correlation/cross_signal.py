@@ -20,6 +20,7 @@ from typing import Any
 from sre_agent.schema import BaseToolResponse, ToolStatus
 
 from ...common import adk_tool
+from ..bigquery.otel_schema import resolve_log_schema, resolve_span_schema
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,10 @@ def correlate_trace_with_metrics(
         - recommended_metrics: PromQL queries to run for correlation
         - correlation_strategy: How to interpret the results
     """
+    trace_schema = resolve_span_schema(dataset_id, trace_table_name)
+    trace_svc = trace_schema.attr("service.name")
+    trace_host = trace_schema.attr("host.name")
+
     # Default SRE-relevant metrics to check
     if metrics_to_check is None:
         metrics_to_check = [
@@ -77,14 +82,14 @@ WITH trace_spans AS (
     span_id,
     parent_span_id,
     name as operation_name,
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.host.name') as host_name,
+    {trace_svc} as service_name,
+    {trace_host} as host_name,
     start_time,
     end_time,
     TIMESTAMP_DIFF(end_time, start_time, MILLISECOND) as duration_ms,
     status.code as status_code,
     kind as span_kind
-  FROM `{dataset_id}.{trace_table_name}`
+  FROM `{trace_schema.table_ref}`
   WHERE trace_id = '{trace_id}'
 )
 SELECT
@@ -185,6 +190,9 @@ def correlate_metrics_with_traces_via_exemplars(
     tool_context: Any = None,
 ) -> BaseToolResponse:
     """Uses exemplar-style analysis to find traces corresponding to metric outliers."""
+    trace_schema = resolve_span_schema(dataset_id, trace_table_name)
+    trace_svc = trace_schema.attr("service.name")
+
     percentile_offset = int(percentile_threshold)
 
     # SQL to find traces matching the latency distribution outliers
@@ -196,19 +204,19 @@ WITH latency_distribution AS (
     trace_id,
     span_id,
     name as operation_name,
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+    {trace_svc} as service_name,
     start_time,
     duration_nano / 1000000 as duration_ms,
     status.code as status_code,
     -- Calculate percentile ranking
     PERCENT_RANK() OVER (
-      PARTITION BY JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name')
+      PARTITION BY {trace_svc}
       ORDER BY duration_nano
     ) * 100 as percentile_rank
-  FROM `{dataset_id}.{trace_table_name}`
+  FROM `{trace_schema.table_ref}`
   WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
     AND parent_span_id IS NULL  -- Root spans only
-    AND JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'
+    AND {trace_svc} = '{service_name}'
     AND kind = 2  -- SERVER spans (incoming requests)
 ),
 -- Calculate histogram bucket boundaries (like Prometheus buckets)
@@ -326,6 +334,17 @@ def build_cross_signal_timeline(
     tool_context: Any = None,
 ) -> BaseToolResponse:
     """Builds a unified timeline correlating traces, logs, and metrics events."""
+    trace_schema = resolve_span_schema(dataset_id, trace_table_name)
+    log_schema = resolve_log_schema(dataset_id, log_table_name)
+    trace_svc = trace_schema.attr("service.name")
+    http_method_col = trace_schema.attr("http.method")
+    http_url_col = trace_schema.attr("http.url")
+    http_status_col = trace_schema.attr("http.status_code")
+    db_system_col = trace_schema.attr("db.system")
+    db_statement_col = trace_schema.attr("db.statement")
+    log_svc = log_schema.attr("service.name")
+    l_svc = log_schema.attr("service.name", "l")
+
     timeline_sql = f"""
 -- Build a unified timeline of trace spans and correlated logs
 -- This shows the sequence of events during request processing
@@ -339,7 +358,7 @@ WITH trace_spans AS (
     span_id,
     parent_span_id,
     name as event_name,
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+    {trace_svc} as service_name,
     CASE status.code
       WHEN 0 THEN 'UNSET'
       WHEN 1 THEN 'OK'
@@ -356,12 +375,12 @@ WITH trace_spans AS (
       ELSE 'UNKNOWN'
     END as span_kind,
     -- Extract key attributes for context
-    JSON_EXTRACT_SCALAR(attributes, '$.http.method') as http_method,
-    JSON_EXTRACT_SCALAR(attributes, '$.http.url') as http_url,
-    JSON_EXTRACT_SCALAR(attributes, '$.http.status_code') as http_status,
-    JSON_EXTRACT_SCALAR(attributes, '$.db.system') as db_system,
-    JSON_EXTRACT_SCALAR(attributes, '$.db.statement') as db_statement
-  FROM `{dataset_id}.{trace_table_name}`
+    {http_method_col} as http_method,
+    {http_url_col} as http_url,
+    {http_status_col} as http_status,
+    {db_system_col} as db_system,
+    {db_statement_col} as db_statement
+  FROM `{trace_schema.table_ref}`
   WHERE trace_id = '{trace_id}'
 ),
 trace_time_bounds AS (
@@ -381,7 +400,7 @@ direct_logs AS (
     span_id,
     NULL as parent_span_id,
     CONCAT('[', severity_text, '] ', COALESCE(body.string_value, '')) as event_name,
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+    {log_svc} as service_name,
     severity_text as status,
     NULL as duration_ms,
     'LOG' as span_kind,
@@ -390,7 +409,7 @@ direct_logs AS (
     NULL as http_status,
     NULL as db_system,
     NULL as db_statement
-  FROM `{dataset_id}.{log_table_name}`
+  FROM `{log_schema.table_ref}`
   WHERE trace_id = '{trace_id}'
 ),
 -- Logs temporally correlated (same service, same time window)
@@ -403,7 +422,7 @@ temporal_logs AS (
     l.span_id,
     NULL as parent_span_id,
     CONCAT('[', l.severity_text, '] ', COALESCE(l.body.string_value, '')) as event_name,
-    JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name') as service_name,
+    {l_svc} as service_name,
     l.severity_text as status,
     NULL as duration_ms,
     'LOG' as span_kind,
@@ -412,9 +431,9 @@ temporal_logs AS (
     NULL as http_status,
     NULL as db_system,
     NULL as db_statement
-  FROM `{dataset_id}.{log_table_name}` l
+  FROM `{log_schema.table_ref}` l
   CROSS JOIN trace_time_bounds t
-  WHERE JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name') IN UNNEST(t.trace_services)
+  WHERE {l_svc} IN UNNEST(t.trace_services)
     AND TIMESTAMP_MICROS(CAST(l.time_unix_nano / 1000 AS INT64))
         BETWEEN TIMESTAMP_SUB(t.trace_start, INTERVAL {time_buffer_seconds} SECOND)
             AND TIMESTAMP_ADD(t.trace_end, INTERVAL {time_buffer_seconds} SECOND)
@@ -457,6 +476,7 @@ ORDER BY event_time
         "analysis_type": "cross_signal_timeline",
         "trace_id": trace_id,
         "timeline_sql": timeline_sql.strip(),
+        "column_mode": trace_schema.mode,
         "event_types": {
             "SPAN": "Trace span (start of operation)",
             "LOG_DIRECT": "Log entry with matching trace_id (direct correlation)",
@@ -496,9 +516,16 @@ def analyze_signal_correlation_strength(
     tool_context: Any = None,
 ) -> BaseToolResponse:
     """Analyzes how well traces, logs, and metrics are correlated in the system."""
-    service_filter = ""
+    trace_schema = resolve_span_schema(dataset_id, trace_table_name)
+    log_schema = resolve_log_schema(dataset_id, log_table_name)
+    trace_svc = trace_schema.attr("service.name")
+    log_svc = log_schema.attr("service.name")
+
+    trace_filter = ""
+    log_filter = ""
     if service_name:
-        service_filter = f"AND JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = '{service_name}'"
+        trace_filter = f"AND {trace_svc} = '{service_name}'"
+        log_filter = f"AND {log_svc} = '{service_name}'"
 
     correlation_sql = f"""
 -- Analyze cross-signal correlation strength across the system
@@ -506,7 +533,7 @@ def analyze_signal_correlation_strength(
 
 WITH trace_stats AS (
   SELECT
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+    {trace_svc} as service_name,
     COUNT(DISTINCT trace_id) as total_traces,
     COUNT(*) as total_spans,
     COUNTIF(status.code = 2) as error_spans,
@@ -514,23 +541,23 @@ WITH trace_stats AS (
     COUNTIF(ARRAY_LENGTH(events) > 0) as spans_with_events,
     -- Check for span links (cross-trace correlation)
     COUNTIF(ARRAY_LENGTH(links) > 0) as spans_with_links
-  FROM `{dataset_id}.{trace_table_name}`
+  FROM `{trace_schema.table_ref}`
   WHERE start_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)
-    {service_filter}
+    {trace_filter}
   GROUP BY service_name
 ),
 log_stats AS (
   SELECT
-    JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') as service_name,
+    {log_svc} as service_name,
     COUNT(*) as total_logs,
     COUNTIF(trace_id IS NOT NULL) as logs_with_trace_id,
     COUNTIF(span_id IS NOT NULL) as logs_with_span_id,
     COUNTIF(severity_text IN ('ERROR', 'FATAL', 'CRITICAL')) as error_logs,
     -- Check if error logs have trace context
     COUNTIF(severity_text IN ('ERROR', 'FATAL', 'CRITICAL') AND trace_id IS NOT NULL) as error_logs_with_trace
-  FROM `{dataset_id}.{log_table_name}`
+  FROM `{log_schema.table_ref}`
   WHERE time_unix_nano >= UNIX_MICROS(TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {time_window_hours} HOUR)) * 1000
-    {service_filter}
+    {log_filter}
   GROUP BY service_name
 ),
 correlation_metrics AS (
@@ -1,8 +1,14 @@
-"""Adapter for transforming ADK tool outputs into GenUI-compatible schemas."""
+"""Adapter for transforming ADK tool outputs into GenUI-compatible schemas.
+
+Transforms that can produce large payloads (traces, metric series, log
+entries) accept an optional display budget. Dashboard events pass one (see
+:mod:`sre_agent.tools.analysis.genui_pipeline`); the REST endpoints that
+back the detail views do not.
+"""
 
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -24,8 +30,119 @@ COMPONENT_AGENT_TRACE = "x-sre-agent-trace"
 COMPONENT_AGENT_GRAPH = "x-sre-agent-graph"
 
 
-def transform_trace(trace_data: Any) -> dict[str, Any]:
-    """Transform Trace data for TraceWaterfall widget."""
+def _parse_time(t: Any) -> datetime | None:
+    if not t:
+        return None
+    return datetime.fromisoformat(str(t).replace("Z", "+00:00"))
+
+
+def downsample_spans(
+    spans: list[dict[str, Any]],
+    budget: int,
+    durations: dict[str, float] | None = None,
+) -> list[dict[str, Any]]:
+    """Keep at most ``budget`` spans of a trace, preserving its shape.
+
+    Error spans and spans with quality issues are kept first, then the
+    longest spans. Every kept span brings its ancestors along, so the
+    waterfall never shows a span whose parent was dropped.
+
+    Args:
+        spans: Transformed spans (``span_id``/``parent_span_id``/``status``).
+        budget: Maximum spans to keep.
+        durations: Span duration in milliseconds by span ID.
+
+    Returns:
+        The kept spans in their original order.
+    """
+    if budget <= 0 or len(spans) <= budget:
+        return spans
+    durations = durations or {}
+    by_id = {span["span_id"]: span for span in spans}
+
+    def priority(span: dict[str, Any]) -> tuple[bool, float]:
+        attributes = span.get("attributes", {})
+        flagged = span.get("status") == "ERROR" or "/agent/quality/type" in attributes
+        return (not flagged, -durations.get(span["span_id"], 0.0))
+
+    keep: set[str] = set()
+    for span in sorted(spans, key=priority):
+        chain: set[str] = set()
+        span_id: str | None = span["span_id"]
+        while span_id is not None and span_id in by_id:
+            if span_id in keep or span_id in chain:
+                break
+            chain.add(span_id)
+            span_id = by_id[span_id].get("parent_span_id")
+        if len(keep) + len(chain) > budget:
+            continue
+        keep.update(chain)
+        if len(keep) >= budget:
+            break
+    return [span for span in spans if span["span_id"] in keep]
+
+
+def downsample_points(
+    points: list[dict[str, Any]], budget: int
+) -> list[dict[str, Any]]:
+    """Reduce a time series to about ``budget`` points.
+
+    Points are split into ``budget // 2`` buckets and each bucket keeps its
+    minimum and maximum, so spikes survive. Anomalous points are always kept.
+
+    Args:
+        points: Points in time order, each with a ``value``.
+        budget: Target number of points.
+
+    Returns:
+        The kept points in their original order.
+    """
+    if budget <= 0 or len(points) <= budget:
+        return points
+
+    def value(index: int) -> float:
+        try:
+            return float(points[index].get("value", 0.0))
+        except (TypeError, ValueError):
+            return 0.0
+
+    buckets = max(budget // 2, 1)
+    size = len(points) / buckets
+    kept = {i for i, p in enumerate(points) if p.get("is_anomaly")}
+    for bucket in range(buckets):
+        indices = range(int(bucket * size), int((bucket + 1) * size))
+        if indices:
+            kept.add(min(indices, key=value))
+            kept.add(max(indices, key=value))
+    return [points[i] for i in sorted(kept)]
+
+
+def _trim_attributes(spans: list[dict[str, Any]], max_chars: int) -> None:
+    for span in spans:
+        attributes = span.get("attributes")
+        if not attributes:
+            continue
+        for key, value in attributes.items():
+            if isinstance(value, str) and len(value) > max_chars:
+                attributes[key] = value[:max_chars] + "…"
+
+
+def transform_trace(
+    trace_data: Any,
+    max_spans: int | None = None,
+    max_attribute_chars: int | None = None,
+) -> dict[str, Any]:
+    """Transform Trace data for TraceWaterfall widget.
+
+    Args:
+        trace_data: Trace, list of traces or trace summary from a tool.
+        max_spans: If set, downsample larger traces to this many spans.
+        max_attribute_chars: If set, truncate longer string attributes.
+
+    Returns:
+        Dict with ``trace_id`` and ``spans``. Downsampled traces also carry
+        ``truncated`` and ``total_span_count``.
+    """
     logger.info(f"📊 Transforming trace data, type: {type(trace_data)}")
 
     # Unwrap if wrapped in status/result (MCP format)
@@ -101,7 +218,7 @@ def transform_trace(trace_data: Any) -> dict[str, Any]:
 
             # Map labels to attributes (Flutter model expects 'attributes')
             if "labels" in span:
-                span["attributes"] = span.pop("labels", {})
+                span["attributes"] = dict(span.pop("labels", None) or {})
             elif "attributes" not in span:
                 span["attributes"] = {}
             else:
@@ -140,8 +257,6 @@ def transform_trace(trace_data: Any) -> dict[str, Any]:
             try:
                 # Calculate end_time
                 s_dt = datetime.fromisoformat(str(start_time).replace("Z", "+00:00"))
-                from datetime import timedelta
-
                 e_dt = s_dt + timedelta(milliseconds=float(duration_ms))
                 end_time = e_dt.isoformat()
 
@@ -169,10 +284,16 @@ def transform_trace(trace_data: Any) -> dict[str, Any]:
     # Add Trace Quality Analysis
     span_map = {s.get("span_id"): s for s in spans if s.get("span_id")}
 
-    def parse_time(t: Any) -> datetime | None:
-        if not t:
-            return None
-        return datetime.fromisoformat(str(t).replace("Z", "+00:00"))
+    # Parse every timestamp once; children compare against their parent's.
+    times: dict[str, tuple[datetime | None, datetime | None]] = {}
+    for span in spans:
+        try:
+            times[span["span_id"]] = (
+                _parse_time(span.get("start_time")),
+                _parse_time(span.get("end_time")),
+            )
+        except (ValueError, TypeError):
+            times[span["span_id"]] = (None, None)
 
     for span in spans:
         # Check specific trace quality issues
@@ -187,12 +308,9 @@ def transform_trace(trace_data: Any) -> dict[str, Any]:
 
         # 2. Clock Skew check (if not already orphaned)
         elif parent_id and parent_id in span_map:
-            parent = span_map[parent_id]
             try:
-                s_start = parse_time(span.get("start_time"))
-                s_end = parse_time(span.get("end_time"))
-                p_start = parse_time(parent.get("start_time"))
-                p_end = parse_time(parent.get("end_time"))
+                s_start, s_end = times[span["span_id"]]
+                p_start, p_end = times[parent_id]
 
                 if s_start and s_end and p_start and p_end:
                     if s_start < p_start or s_end > p_end:
@@ -206,11 +324,47 @@ def transform_trace(trace_data: Any) -> dict[str, Any]:
             span["attributes"]["/agent/quality/type"] = issue_type
             span["attributes"]["/agent/quality/issue"] = issue_message
 
-    return {"trace_id": trace_id, "spans": spans}
+    result: dict[str, Any] = {"trace_id": trace_id, "spans": spans}
+    if max_spans is not None and len(spans) > max_spans:
+        durations: dict[str, float] = {}
+        for span_id, (start, end) in times.items():
+            try:
+                if start and end:
+                    durations[span_id] = (end - start).total_seconds() * 1000
+            except TypeError:
+                continue
+        result["spans"] = downsample_spans(spans, max_spans, durations)
+        result["truncated"] = True
+        result["total_span_count"] = len(spans)
+    if max_attribute_chars is not None:
+        _trim_attributes(result["spans"], max_attribute_chars)
+    return result
+
+
+def transform_metrics(
+    metric_data: Any, max_points: int | None = None
+) -> dict[str, Any]:
+    """Transform Metric data for MetricCorrelationChart widget.
 
+    Args:
+        metric_data: Time series, PromQL or ADK metric result from a tool.
+        max_points: If set, downsample longer series to about this many points.
+
+    Returns:
+        Dict with ``metric_name``, ``points`` and ``labels``. Downsampled
+        series also carry ``truncated`` and ``total_point_count``.
+    """
+    result = _transform_metrics(metric_data)
+    points = result.get("points")
+    if max_points is not None and isinstance(points, list):
+        if len(points) > max_points:
+            result["points"] = downsample_points(points, max_points)
+            result["truncated"] = True
+            result["total_point_count"] = len(points)
+    return result
 
-def transform_metrics(metric_data: Any) -> dict[str, Any]:
-    """Transform Metric data for MetricCorrelationChart widget."""
+
+def _transform_metrics(metric_data: Any) -> dict[str, Any]:
     logger.info(f"📊 Transforming metric data, type: {type(metric_data)}")
 
     # Unwrap if wrapped in status/result (MCP format)
@@ -1095,6 +1249,7 @@ def create_demo_incident_timeline() -> dict[str, Any]:
 
 def transform_log_entries(
     log_data: dict[str, Any] | list[dict[str, Any]],
+    max_entries: int | None = None,
 ) -> dict[str, Any]:
     """Transform log entries data for LogEntriesViewer widget.
 
@@ -1104,6 +1259,7 @@ def transform_log_entries(
             - filter: Optional filter string used
             - project_id: Optional project ID
             - next_page_token: Optional pagination token
+        max_entries: If set, keep only the first this many entries.
 
     Returns:
         Dictionary formatted for the LogEntriesViewer widget.
@@ -1142,6 +1298,10 @@ def transform_log_entries(
     else:
         raw_entries = []
 
+    total_entries = len(raw_entries)
+    if max_entries is not None and total_entries > max_entries:
+        raw_entries = raw_entries[:max_entries]
+
     for entry in raw_entries:
         if not isinstance(entry, dict):
             continue
@@ -1188,7 +1348,7 @@ def transform_log_entries(
             }
         )
 
-    return {
+    result = {
         "entries": entries,
         "filter": log_data.get("filter") if isinstance(log_data, dict) else None,
         "project_id": log_data.get("project_id")
@@ -1198,6 +1358,10 @@ def transform_log_entries(
         if isinstance(log_data, dict)
         else None,
     }
+    if len(raw_entries) < total_entries:
+        result["truncated"] = True
+        result["total_entry_count"] = total_entries
+    return result
 
 
 def create_demo_log_entries() -> dict[str, Any]:
@@ -1428,33 +1592,35 @@ def transform_agent_trace(data: dict[str, Any]) -> dict[str, Any]:
     root_agent = data.get("root_agent_name")
     root_spans = data.get("root_spans", [])
 
-    # Compute the earliest start time for offset calculation
-    min_start_iso: str | None = None
+    # Pre-order (depth, span) list; an explicit stack keeps deep agent
+    # trees clear of the recursion limit.
+    ordered: list[tuple[int, dict[str, Any]]] = []
+    stack: list[tuple[int, dict[str, Any]]] = [(0, s) for s in reversed(root_spans)]
+    while stack:
+        depth, span = stack.pop()
+        ordered.append((depth, span))
+        stack.extend((depth + 1, c) for c in reversed(span.get("children", [])))
 
-    def _find_min_start(spans: list[dict[str, Any]]) -> None:
-        nonlocal min_start_iso
-        for span in spans:
-            start = span.get("start_time_iso", "")
-            if start and (min_start_iso is None or start < min_start_iso):
-                min_start_iso = start
-            _find_min_start(span.get("children", []))
-
-    _find_min_start(root_spans)
+    # Compute the earliest start time for offset calculation
+    starts = [s.get("start_time_iso", "") for _, s in ordered]
+    min_start_iso = min((s for s in starts if s), default=None)
+    s0: datetime | None = None
+    if min_start_iso:
+        try:
+            s0 = datetime.fromisoformat(min_start_iso.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            s0 = None
 
     # Flatten the tree with depth
     nodes: list[dict[str, Any]] = []
-
-    def _flatten(span: dict[str, Any], depth: int) -> None:
+    for depth, span in ordered:
         start_iso = span.get("start_time_iso", "")
         start_offset_ms = 0.0
-        if min_start_iso and start_iso:
+        if s0 is not None and start_iso:
             try:
-                from datetime import datetime
-
-                s0 = datetime.fromisoformat(min_start_iso.replace("Z", "+00:00"))
                 s1 = datetime.fromisoformat(start_iso.replace("Z", "+00:00"))
                 start_offset_ms = (s1 - s0).total_seconds() * 1000
-            except (ValueError, AttributeError):
+            except (ValueError, AttributeError, TypeError):
                 pass
 
         nodes.append(
@@ -1476,11 +1642,6 @@ def transform_agent_trace(data: dict[str, Any]) -> dict[str, Any]:
                 "status_code": span.get("status_code", 0),
             }
         )
-        for child in span.get("children", []):
-            _flatten(child, depth + 1)
-
-    for root in root_spans:
-        _flatten(root, 0)
 
     return {
         "trace_id": trace_id,
@@ -1597,11 +1758,12 @@ def transform_agent_graph(data: dict[str, Any]) -> dict[str, Any]:
         if has_error:
             edge["has_error"] = True
 
-    def _walk(
-        span: dict[str, Any],
-        parent_agent: str | None = None,
-        depth: int = 1,
-    ) -> None:
+    # Pre-order walk with an explicit stack: (span, parent_agent, depth).
+    stack: list[tuple[dict[str, Any], str | None, int]] = [
+        (root, None, 1) for root in reversed(root_spans)
+    ]
+    while stack:
+        span, parent_agent, depth = stack.pop()
         kind = span.get("kind", "unknown")
         agent_name = span.get("agent_name")
         tool_name = span.get("tool_name")
@@ -1609,6 +1771,7 @@ def transform_agent_graph(data: dict[str, Any]) -> dict[str, Any]:
         tokens = (span.get("input_tokens") or 0) + (span.get("output_tokens") or 0)
         has_error = span.get("status_code", 0) == 2
         duration = span.get("duration_ms", 0)
+        children = span.get("children", [])
 
         if kind in ("agent_invocation", "sub_agent_delegation") and agent_name:
             agent_node_id = f"agent:{agent_name}"
@@ -1647,9 +1810,8 @@ def transform_agent_graph(data: dict[str, Any]) -> dict[str, Any]:
                 )
 
             # Children of this agent are one depth level deeper
-            for child in span.get("children", []):
-                _walk(child, agent_name, depth + 1)
-            return
+            stack.extend((c, agent_name, depth + 1) for c in reversed(children))
+            continue
 
         if kind == "tool_execution" and tool_name:
             # Scope tool nodes per parent agent
@@ -1702,11 +1864,7 @@ def transform_agent_graph(data: dict[str, Any]) -> dict[str, Any]:
                     has_error,
                 )
 
-        for child in span.get("children", []):
-            _walk(child, parent_agent, depth)
-
-    for root in root_spans:
-        _walk(root)
+        stack.extend((c, parent_agent, depth) for c in reversed(children))
 
     # Compute children_count and expandable for agent nodes
     for node_id, node in node_map.items():
@@ -0,0 +1,322 @@
+"""Memoized, budgeted GenUI transforms for dashboard events.
+
+Large tool results used to be transformed into complete widget payloads for
+every dashboard event, often twice for the same result (once inline and once
+from the dashboard queue), and a 5k-span trace went out as a multi-megabyte
+event. This module puts three stages in front of
+:mod:`sre_agent.tools.analysis.genui_adapter`:
+
+1. :class:`TransformCache` memoizes transforms by result identity, falling
+   back to a content hash, so a result is transformed once however many
+   times it is emitted.
+2. :class:`DisplayBudget` caps spans, points and log entries per widget, so
+   payload size is bounded by what the widget can display.
+3. :class:`WidgetPatcher` remembers what each stream already sent per
+   widget and, when a widget's data only grew, emits a
+   ``dashboard_patch`` event with just the new items.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sre_agent.tools.analysis import genui_adapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DisplayBudget:
+    """Per-widget display limits applied to dashboard payloads.
+
+    Attributes:
+        max_spans: Spans per trace waterfall.
+        max_points: Points per metric chart.
+        max_log_entries: Entries per log viewer.
+        max_attribute_chars: Characters per span attribute value.
+    """
+
+    max_spans: int = 500
+    max_points: int = 720
+    max_log_entries: int = 500
+    max_attribute_chars: int = 256
+
+    @classmethod
+    def from_env(cls) -> DisplayBudget:
+        """Build a budget from ``SRE_AGENT_GENUI_*`` environment variables."""
+        return cls(
+            max_spans=int(os.environ.get("SRE_AGENT_GENUI_MAX_SPANS", "500")),
+            max_points=int(os.environ.get("SRE_AGENT_GENUI_MAX_POINTS", "720")),
+            max_log_entries=int(
+                os.environ.get("SRE_AGENT_GENUI_MAX_LOG_ENTRIES", "500")
+            ),
+            max_attribute_chars=int(
+                os.environ.get("SRE_AGENT_GENUI_MAX_ATTRIBUTE_CHARS", "256")
+            ),
+        )
+
+
+def _transforms(
+    budget: DisplayBudget,
+) -> dict[str, Callable[[Any], dict[str, Any]]]:
+    return {
+        genui_adapter.COMPONENT_TRACE_WATERFALL: lambda r: (
+            genui_adapter.transform_trace(
+                r,
+                max_spans=budget.max_spans,
+                max_attribute_chars=budget.max_attribute_chars,
+            )
+        ),
+        genui_adapter.COMPONENT_METRIC_CHART: lambda r: genui_adapter.transform_metrics(
+            r, max_points=budget.max_points
+        ),
+        genui_adapter.COMPONENT_METRICS_DASHBOARD: (
+            genui_adapter.transform_metrics_dashboard
+        ),
+        genui_adapter.COMPONENT_LOG_ENTRIES_VIEWER: lambda r: (
+            genui_adapter.transform_log_entries(r, max_entries=budget.max_log_entries)
+        ),
+        genui_adapter.COMPONENT_LOG_PATTERN_VIEWER: (
+            genui_adapter.transform_log_patterns
+        ),
+        genui_adapter.COMPONENT_REMEDIATION_PLAN: genui_adapter.transform_remediation,
+        genui_adapter.COMPONENT_INCIDENT_TIMELINE: (
+            genui_adapter.transform_alerts_to_timeline
+        ),
+    }
+
+
+def content_key(value: Any) -> str:
+    """Return a hash of a JSON-like value.
+
+    Pickling is several times faster than JSON encoding for large results.
+    Equal values built in a different key order hash differently, which only
+    costs a cache miss.
+    """
+    try:
+        encoded = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        encoded = json.dumps(value, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class TransformCache:
+    """Bounded LRU of widget transforms keyed by result identity or content.
+
+    Identity hits are free; the cache holds a reference to each keyed result
+    so its ``id()`` cannot be reused while cached. Results that arrive as
+    fresh but equal objects (the inline and queued copies of one tool
+    result) hit on their content hash instead.
+    """
+
+    def __init__(
+        self, budget: DisplayBudget | None = None, max_entries: int = 128
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            budget: Display limits for the transforms.
+            max_entries: Transformed results kept.
+        """
+        self.budget = budget or DisplayBudget.from_env()
+        self._transforms = _transforms(self.budget)
+        self._max_entries = max_entries
+        self._by_identity: OrderedDict[tuple[str, int], tuple[Any, str]] = OrderedDict()
+        self._by_content: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def supports(self, widget_type: str) -> bool:
+        """Whether ``widget_type`` has a registered transform."""
+        return widget_type in self._transforms
+
+    def transform(self, widget_type: str, result: Any) -> dict[str, Any]:
+        """Return the widget payload for ``result``, transforming at most once.
+
+        Callers must treat the returned payload as read-only; it is shared
+        with later hits.
+
+        Args:
+            widget_type: Widget component name.
+            result: Normalized tool result.
+
+        Returns:
+            The transformed payload.
+
+        Raises:
+            KeyError: If ``widget_type`` has no registered transform.
+        """
+        transform = self._transforms[widget_type]
+        identity = (widget_type, id(result))
+        with self._lock:
+            held = self._by_identity.get(identity)
+            if held is not None and held[0] is result:
+                key = held[1]
+                cached = self._by_content.get((widget_type, key))
+                if cached is not None:
+                    self._by_content.move_to_end((widget_type, key))
+                    self.hits += 1
+                    return cached
+
+        key = content_key(result)
+        with self._lock:
+            cached = self._by_content.get((widget_type, key))
+            if cached is not None:
+                self._by_content.move_to_end((widget_type, key))
+                self._remember(identity, result, key)
+                self.hits += 1
+                return cached
+
+        payload = transform(result)
+        with self._lock:
+            self.misses += 1
+            self._by_content[(widget_type, key)] = payload
+            self._remember(identity, result, key)
+            while len(self._by_content) > self._max_entries:
+                self._by_content.popitem(last=False)
+        return payload
+
+    def _remember(self, identity: tuple[str, int], result: Any, key: str) -> None:
+        self._by_identity[identity] = (result, key)
+        self._by_identity.move_to_end(identity)
+        while len(self._by_identity) > self._max_entries:
+            self._by_identity.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        with self._lock:
+            self._by_identity.clear()
+            self._by_content.clear()
+
+
+_cache: TransformCache | None = None
+
+
+def get_transform_cache() -> TransformCache:
+    """Get the process-wide transform cache."""
+    global _cache
+    if _cache is None:
+        _cache = TransformCache()
+    return _cache
+
+
+def reset_transform_cache() -> None:
+    """Drop the process-wide transform cache (for tests)."""
+    global _cache
+    _cache = None
+
+
+def transform_widget(widget_type: str, result: Any) -> dict[str, Any]:
+    """Transform ``result`` for ``widget_type`` through the shared cache."""
+    return get_transform_cache().transform(widget_type, result)
+
+
+# Widget type -> (list field that can grow, fields that identify the widget)
+_GROWABLE: dict[str, tuple[str, tuple[str, ...]]] = {
+    genui_adapter.COMPONENT_TRACE_WATERFALL: ("spans", ("trace_id",)),
+    genui_adapter.COMPONENT_LOG_ENTRIES_VIEWER: (
+        "entries",
+        ("filter", "project_id"),
+    ),
+    genui_adapter.COMPONENT_METRIC_CHART: ("points", ("metric_name", "labels")),
+}
+
+
+def widget_key(widget_type: str, data: Any) -> str | None:
+    """Return the identity of the widget ``data`` belongs to, if trackable."""
+    spec = _GROWABLE.get(widget_type)
+    if spec is None or not isinstance(data, dict):
+        return None
+    _, id_fields = spec
+    return f"{widget_type}:{content_key([data.get(f) for f in id_fields])}"
+
+
+class WidgetPatcher:
+    """Turns repeated dashboard events for one widget into patches.
+
+    One patcher lives for one response stream. For each widget it remembers
+    the payload it last sent; a later payload whose growable list extends
+    that one (and whose other fields only changed in scalars) goes out as a
+    ``dashboard_patch`` carrying just the new items. A payload identical to
+    the last one is not sent again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty patcher."""
+        self._sent: dict[str, dict[str, Any]] = {}
+        self.patches = 0
+        self.duplicates = 0
+
+    def encode(self, event: dict[str, Any]) -> str | None:
+        """Encode a ``dashboard`` event as a full event, a patch or nothing.
+
+        Args:
+            event: Dashboard event with ``widget_type`` and ``data``.
+
+        Returns:
+            The JSON line to send, or None if the widget already shows it.
+        """
+        widget_type = event.get("widget_type", "")
+        data = event.get("data")
+        key = widget_key(widget_type, data)
+        if key is None or not isinstance(data, dict):
+            return json.dumps(event, default=str)
+
+        field, _ = _GROWABLE[widget_type]
+        previous = self._sent.get(key)
+        self._sent[key] = data
+        if previous is not None:
+            patch = _growth(previous, data, field)
+            if patch is not None:
+                items, changed = patch
+                if not items and not changed:
+                    self.duplicates += 1
+                    return None
+                self.patches += 1
+                return json.dumps(
+                    {
+                        "type": "dashboard_patch",
+                        "category": event.get("category"),
+                        "widget_type": widget_type,
+                        "tool_name": event.get("tool_name"),
+                        "widget_key": key,
+                        "field": field,
+                        "items": items,
+                        "set": changed,
+                    },
+                    default=str,
+                )
+        return json.dumps({**event, "widget_key": key}, default=str)
+
+
+def _growth(
+    previous: dict[str, Any], current: dict[str, Any], field: str
+) -> tuple[list[Any], dict[str, Any]] | None:
+    """Return (new items, changed scalars) if ``current`` only grew ``previous``."""
+    old_items = previous.get(field)
+    new_items = current.get(field)
+    if not isinstance(old_items, list) or not isinstance(new_items, list):
+        return None
+    if len(new_items) < len(old_items) or new_items[: len(old_items)] != old_items:
+        return None
+    changed: dict[str, Any] = {}
+    for name in previous.keys() | current.keys():
+        if name == field or previous.get(name) == current.get(name):
+            continue
+        value = current.get(name)
+        if isinstance(value, (dict, list)) or isinstance(
+            previous.get(name), (dict, list)
+        ):
+            return None
+        changed[name] = value
+    return new_items[len(old_items) :], changed
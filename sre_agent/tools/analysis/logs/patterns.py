@@ -21,7 +21,7 @@ from drain3.template_miner_config import TemplateMinerConfig
 
 from sre_agent.schema import BaseToolResponse, ToolStatus
 
-from ...common import adk_tool
+from ...common import ExecutionClass, adk_tool
 from .extraction import extract_log_message
 
 logger = logging.getLogger(__name__)
@@ -372,7 +372,7 @@ def compare_patterns(
     )
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.CPU_HEAVY)
 def extract_log_patterns(
     log_entries_json: str,
     max_patterns: int = 30,
@@ -432,7 +432,7 @@ def extract_log_patterns(
     )
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.CPU_HEAVY)
 def compare_log_patterns(
     baseline_entries_json: str,
     comparison_entries_json: str,
@@ -534,7 +534,7 @@ def compare_log_patterns(
     )
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.CPU_HEAVY)
 def analyze_log_anomalies(
     log_entries_json: str,
     focus_on_errors: bool = True,
@@ -6,12 +6,13 @@ from typing import Any
 from sre_agent.schema import BaseToolResponse, ToolStatus
 
 from ...common.decorators import adk_tool
+from ...common.execution import ExecutionClass
 from .statistics import calculate_series_stats
 
 logger = logging.getLogger(__name__)
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.CPU_HEAVY)
 def detect_metric_anomalies(
     data_points: list[float],
     threshold_sigma: float = 3.0,
@@ -10,7 +10,7 @@ from typing import Any, cast
 from sre_agent.schema import BaseToolResponse, ToolStatus
 
 from ...clients.trace import fetch_trace_data
-from ...common import adk_tool
+from ...common import ExecutionClass, adk_tool
 
 logger = logging.getLogger(__name__)
 
@@ -487,7 +487,7 @@ def analyze_critical_path(
     return BaseToolResponse(status=ToolStatus.SUCCESS, result=result)
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.IO)
 def perform_causal_analysis(
     baseline_trace_id: str,
     target_trace_id: str,
@@ -637,7 +637,7 @@ def perform_causal_analysis(
     )
 
 
-@adk_tool
+@adk_tool(execution=ExecutionClass.IO)
 def analyze_trace_patterns(
     trace_ids: list[str],
     lookback_window_minutes: int = 60,
@@ -10,6 +10,10 @@ The credential resolution order is:
 1. Explicit tool_context (if provided via get_*_client_with_context)
 2. ContextVar (set by middleware)
 3. Default credentials (service account)
+
+Clients are wrapped in :class:`~sre_agent.core.resilience.GuardedClient`, so
+every API call is subject to the backend's adaptive concurrency limit and the
+target project's quota bucket (disable with ``SRE_AGENT_ADAPTIVE_LIMITS=false``).
 """
 
 import logging
@@ -22,6 +26,7 @@ from google.cloud.logging_v2.services.logging_service_v2 import LoggingServiceV2
 from ...auth import (
     GLOBAL_CONTEXT_CREDENTIALS,
 )
+from ...core.resilience import GuardedClient, is_adaptive_limiting_enabled
 
 if TYPE_CHECKING:
     from google.adk.tools.tool_context import ToolContext
@@ -38,6 +43,7 @@ def _get_client(
     name: str,
     client_class: type[T],
     tool_context: "ToolContext | None" = None,
+    backend: str | None = None,
 ) -> T:
     """Helper for thread-safe lazy initialization of clients.
 
@@ -48,6 +54,8 @@ def _get_client(
         name: Unique name/key for the client instance.
         client_class: The client class to instantiate.
         tool_context: Optional ADK ToolContext for session-based credentials.
+        backend: Backend API name for concurrency limits and quotas;
+            defaults to ``name``.
 
     Returns:
         The initialized client instance.
@@ -65,7 +73,10 @@ def _get_client(
         if name not in _clients:
             logger.debug(f"Initializing context-aware {name} client")
             # All clients use the same context-aware credentials proxy
-            _clients[name] = client_class(credentials=GLOBAL_CONTEXT_CREDENTIALS)  # type: ignore[call-arg]
+            client: Any = client_class(credentials=GLOBAL_CONTEXT_CREDENTIALS)  # type: ignore[call-arg]
+            if is_adaptive_limiting_enabled():
+                client = GuardedClient(client, backend or name)
+            _clients[name] = client
 
     return cast(T, _clients[name])
 
@@ -78,7 +89,9 @@ def get_trace_client(
     Args:
         tool_context: Optional ADK ToolContext for session-based credentials.
     """
-    return _get_client("trace", trace_v1.TraceServiceClient, tool_context)
+    return _get_client(
+        "trace", trace_v1.TraceServiceClient, tool_context, backend="cloudtrace"
+    )
 
 
 def get_logging_client(
@@ -108,7 +121,10 @@ def get_alert_policy_client(
 ) -> monitoring_v3.AlertPolicyServiceClient:
     """Returns a Cloud Monitoring Alert Policy client, using user credentials if available."""
     return _get_client(
-        "alert_policies", monitoring_v3.AlertPolicyServiceClient, tool_context
+        "alert_policies",
+        monitoring_v3.AlertPolicyServiceClient,
+        tool_context,
+        backend="monitoring",
     )
 
 
@@ -122,4 +138,5 @@ def get_error_reporting_client(
         "error_reporting",
         errorreporting_v1beta1.ErrorStatsServiceClient,
         tool_context,
+        backend="clouderrorreporting",
     )
@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 from typing import Any, cast
 
+from fastapi.concurrency import run_in_threadpool
 from google.auth.transport.requests import AuthorizedSession
 from google.cloud import monitoring_v3
 
@@ -35,6 +36,27 @@ def _get_authorized_session(tool_context: Any = None) -> AuthorizedSession:
     return AuthorizedSession(creds)  # type: ignore[no-untyped-call]
 
 
+def _fetch_time_series(
+    client: Any,
+    project_name: str,
+    filter_str: str,
+    interval: monitoring_v3.TimeInterval,
+) -> list[Any]:
+    """Fetch all pages of a time-series query.
+
+    Blocks on the network and on the client's quota and concurrency guard,
+    so async tools run it in a thread.
+    """
+    return list(
+        client.list_time_series(
+            name=project_name,
+            filter=filter_str,
+            interval=interval,
+            view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+        )
+    )
+
+
 @adk_tool
 async def list_slos(
     project_id: str | None = None,
@@ -289,11 +311,8 @@ async def analyze_error_budget_burn(
         project_name = f"projects/{project_id}"
 
         try:
-            results = client.list_time_series(
-                name=project_name,
-                filter=filter_str,
-                interval=interval,
-                view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,  # type: ignore
+            results = await run_in_threadpool(
+                _fetch_time_series, client, project_name, filter_str, interval
             )
 
             compliance_points = []
@@ -433,13 +452,8 @@ async def get_golden_signals(
 
         for filter_str in latency_filters:
             try:
-                results = list(
-                    client.list_time_series(
-                        name=project_name,
-                        filter=filter_str,
-                        interval=interval,
-                        view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,  # type: ignore
-                    )
+                results = await run_in_threadpool(
+                    _fetch_time_series, client, project_name, filter_str, interval
                 )
                 if results:
                     latency_values = []
@@ -484,13 +498,8 @@ async def get_golden_signals(
 
         for filter_str in traffic_filters:
             try:
-                results = list(
-                    client.list_time_series(
-                        name=project_name,
-                        filter=filter_str,
-                        interval=interval,
-                        view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,  # type: ignore
-                    )
+                results = await run_in_threadpool(
+                    _fetch_time_series, client, project_name, filter_str, interval
                 )
                 if results:
                     total_requests = 0
@@ -523,13 +532,8 @@ async def get_golden_signals(
 
         for filter_str in error_filters:
             try:
-                results = list(
-                    client.list_time_series(
-                        name=project_name,
-                        filter=filter_str,
-                        interval=interval,
-                        view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,  # type: ignore
-                    )
+                results = await run_in_threadpool(
+                    _fetch_time_series, client, project_name, filter_str, interval
                 )
                 if results:
                     total_errors = 0
@@ -576,13 +580,8 @@ async def get_golden_signals(
 
         for filter_str in saturation_filters:
             try:
-                results = list(
-                    client.list_time_series(
-                        name=project_name,
-                        filter=filter_str,
-                        interval=interval,
-                        view=monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,  # type: ignore
-                    )
+                results = await run_in_threadpool(
+                    _fetch_time_series, client, project_name, filter_str, interval
                 )
                 if results:
                     cpu_values = []
@@ -33,6 +33,7 @@ from sre_agent.auth import (
     get_credentials_from_tool_context,
     get_current_project_id,
 )
+from sre_agent.core.resilience import GuardedClient, is_adaptive_limiting_enabled
 from sre_agent.schema import BaseToolResponse, ToolStatus
 from sre_agent.tools.common import adk_tool
 from sre_agent.tools.common.cache import get_data_cache
@@ -149,10 +150,17 @@ def get_current_time() -> str:
 
 
 def get_trace_client(credentials: Any = None) -> trace_v1.TraceServiceClient:
-    """Gets a Cloud Trace API client."""
+    """Gets a Cloud Trace API client.
+
+    Like the factory clients, it is wrapped in a ``GuardedClient`` so calls
+    share the ``cloudtrace`` concurrency limit and per-project quota.
+    """
     # OPT-12: Zero-Trust Identity Propagation
     creds = credentials or GLOBAL_CONTEXT_CREDENTIALS
-    return trace_v1.TraceServiceClient(credentials=creds)
+    client = trace_v1.TraceServiceClient(credentials=creds)
+    if not is_adaptive_limiting_enabled():
+        return client
+    return cast(trace_v1.TraceServiceClient, GuardedClient(client, "cloudtrace"))
 
 
 def _get_ts_val(ts_proto: Any) -> float:
@@ -10,11 +10,13 @@ from .debug import (
     log_telemetry_state,
 )
 from .decorators import adk_tool, prepare_tools
+from .execution import ExecutionClass
 from .serialization import gcp_json_default, json_dumps
 from .telemetry import log_tool_call
 
 __all__ = [
     "DataCache",
+    "ExecutionClass",
     "adk_tool",
     "enable_debug_mode",
     "gcp_json_default",
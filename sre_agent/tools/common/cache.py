@@ -3,7 +3,10 @@
 import logging
 import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sre_agent.core.shared_state import SharedStore
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,12 @@ class DataCache:
     Thread Safety:
         All operations use a threading.Lock to ensure thread-safe access.
 
+    Worker Sharing:
+        With a ``shared`` store (see :mod:`sre_agent.core.shared_state`),
+        local misses fall through to it and puts are written to both, so
+        uvicorn workers reuse each other's API results. Values that are not
+        JSON-serializable stay local.
+
     Memory Management:
         Expired entries are automatically removed during get() operations.
         When the cache reaches max_size, expired entries are evicted before
@@ -34,7 +43,12 @@ class DataCache:
         >>> data = cache.get("trace999")  # Returns None (not found)
     """
 
-    def __init__(self, ttl_seconds: int = 300, max_size: int = 1000) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_size: int = 1000,
+        shared: "SharedStore | None" = None,
+    ) -> None:
         """Initialize the data cache.
 
         Args:
@@ -43,8 +57,10 @@ class DataCache:
             max_size: Maximum number of entries to hold. When the cache
                      reaches this limit, expired entries are evicted before
                      accepting a new entry. Default is 1000 entries.
+            shared: Optional store shared with other workers.
         """
         self._cache: dict[str, dict[str, Any]] = {}
+        self.shared = shared
         self._lock = threading.Lock()
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
@@ -73,10 +89,15 @@ class DataCache:
                     # Entry expired, remove it
                     logger.debug(f"Cache EXPIRED for key {key}")
                     del self._cache[key]
-                    return None
             else:
                 logger.debug(f"Cache MISS for key {key}")
-                return None
+        if self.shared is None:
+            return None
+        data = self.shared.get(key)
+        if data is not None:
+            logger.debug(f"Shared cache HIT for key {key}")
+            self._put_local(key, data)
+        return data
 
     def put(self, key: str, data: Any) -> None:
         """Cache data with expiration.
@@ -88,6 +109,14 @@ class DataCache:
             key: The cache key.
             data: The data to cache.
         """
+        self._put_local(key, data)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, data, ttl_seconds=self.ttl_seconds)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not sharing cache key {key}: {e}")
+
+    def _put_local(self, key: str, data: Any) -> None:
         with self._lock:
             # Enforce size limit: evict expired entries when at capacity
             if key not in self._cache and len(self._cache) >= self.max_size:
@@ -111,11 +140,13 @@ class DataCache:
             logger.debug(f"Cached key {key} (TTL={self.ttl_seconds}s)")
 
     def clear(self) -> None:
-        """Clear all cached entries."""
+        """Clear all cached entries, including shared ones."""
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
             logger.info(f"Cache cleared ({count} entries removed)")
+        if self.shared is not None:
+            self.shared.clear()
 
     def size(self) -> int:
         """Get the number of cached entries.
@@ -171,8 +202,9 @@ class DataCache:
             }
 
 
-# Global singleton instance
-_data_cache = DataCache()
+# Global singleton instance, created on first use
+_data_cache: DataCache | None = None
+_data_cache_lock = threading.Lock()
 
 
 def get_data_cache() -> DataCache:
@@ -189,4 +221,12 @@ def get_data_cache() -> DataCache:
         >>> cache = get_data_cache()
         >>> cache.put("key123", data)
     """
+    global _data_cache
+    if _data_cache is None:
+        with _data_cache_lock:
+            if _data_cache is None:
+                from sre_agent.core.shared_state import get_shared_store
+
+                store = get_shared_store("data_cache")
+                _data_cache = DataCache(shared=store if store.is_shared else None)
     return _data_cache
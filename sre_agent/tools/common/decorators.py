@@ -9,6 +9,7 @@ import time
 from collections.abc import Callable
 from typing import Any
 
+from .execution import CpuQuotaExceededError, ExecutionClass, run_tool_body
 from .serialization import normalize_obj
 
 logger = logging.getLogger(__name__)
@@ -29,47 +30,49 @@ except Exception:  # pragma: no cover - import may fail in minimal envs
         """No-op fallback when dashboard queue is unavailable."""
 
 
-# Tools that interact with external GCP APIs and should be circuit-protected.
-# Pure analysis tools (no I/O) are excluded to avoid unnecessary overhead.
-_CIRCUIT_BREAKER_TOOL_PREFIXES: frozenset[str] = frozenset(
-    {
-        "fetch_trace",
-        "list_traces",
-        "find_example_traces",
-        "get_trace_by_url",
-        "list_log_entries",
-        "get_logs_for_trace",
-        "list_error_events",
-        "list_time_series",
-        "query_promql",
-        "list_alerts",
-        "get_alert",
-        "list_alert_policies",
-        "list_metric_descriptors",
-        "list_slos",
-        "get_slo_status",
-        "get_gke_cluster_health",
-        "analyze_node_conditions",
-        "get_pod_restart_events",
-        "analyze_hpa_events",
-        "get_container_oom_events",
-        "get_workload_health_summary",
-        "list_gcp_projects",
-        "gcp_execute_sql",
-        "mcp_list_log_entries",
-        "mcp_list_timeseries",
-        "mcp_query_range",
-        "mcp_list_dataset_ids",
-        "mcp_list_table_ids",
-        "mcp_get_table_info",
-        "search_google",
-        "fetch_web_page",
-        "github_read_file",
-        "github_search_code",
-        "github_list_recent_commits",
-        "github_create_pull_request",
-    }
-)
+# Tools that interact with external APIs and should be circuit-protected,
+# mapped to the backend API they call. Breakers are keyed by
+# (backend, project, error class), so failures in one project or of one kind
+# do not block unrelated calls. Pure analysis tools (no I/O) are excluded to
+# avoid unnecessary overhead.
+_TOOL_BACKENDS: dict[str, str] = {
+    "fetch_trace": "cloudtrace",
+    "list_traces": "cloudtrace",
+    "find_example_traces": "cloudtrace",
+    "get_trace_by_url": "cloudtrace",
+    "list_log_entries": "logging",
+    "get_logs_for_trace": "logging",
+    "list_error_events": "clouderrorreporting",
+    "list_time_series": "monitoring",
+    "query_promql": "monitoring",
+    "list_alerts": "monitoring",
+    "get_alert": "monitoring",
+    "list_alert_policies": "monitoring",
+    "list_metric_descriptors": "monitoring",
+    "list_slos": "monitoring",
+    "get_slo_status": "monitoring",
+    "get_gke_cluster_health": "container",
+    "analyze_node_conditions": "container",
+    "get_pod_restart_events": "container",
+    "analyze_hpa_events": "container",
+    "get_container_oom_events": "container",
+    "get_workload_health_summary": "container",
+    "list_gcp_projects": "cloudresourcemanager",
+    "gcp_execute_sql": "bigquery",
+    "mcp_list_log_entries": "mcp_logging",
+    "mcp_list_timeseries": "mcp_monitoring",
+    "mcp_query_range": "mcp_monitoring",
+    "mcp_list_dataset_ids": "mcp_bigquery",
+    "mcp_list_table_ids": "mcp_bigquery",
+    "mcp_get_table_info": "mcp_bigquery",
+    "search_google": "web",
+    "fetch_web_page": "web",
+    "github_read_file": "github",
+    "github_search_code": "github",
+    "github_list_recent_commits": "github",
+    "github_create_pull_request": "github",
+}
+_CIRCUIT_BREAKER_TOOL_PREFIXES: frozenset[str] = frozenset(_TOOL_BACKENDS)
 
 
 def _is_circuit_breaker_enabled() -> bool:
@@ -112,10 +115,34 @@ def _is_tool_failure(result: Any) -> bool:
     return False
 
 
+def _tool_error_text(result: Any) -> str:
+    """Return the error message carried by a failed tool result."""
+    if isinstance(result, str):
+        try:
+            data = json.loads(result)
+        except (json.JSONDecodeError, ValueError):
+            return result
+        return str(data.get("error", "")) if isinstance(data, dict) else result
+    if isinstance(result, dict):
+        return str(result.get("error", ""))
+    return str(getattr(result, "error", "") or "")
+
+
+def _breaker_scope(tool_name: str, kwargs: dict[str, Any]) -> str:
+    """Circuit breaker scope (backend and project) for a tool call."""
+    from sre_agent.auth import get_current_project_id_or_none
+    from sre_agent.core.circuit_breaker import scope_key
+
+    project = kwargs.get("project_id") or get_current_project_id_or_none()
+    return scope_key(_TOOL_BACKENDS[tool_name], project)
+
+
 def adk_tool(
     func: Callable[..., Any] | None = None,
     *,
     skip_summarization: bool = False,
+    execution: ExecutionClass | str | None = None,
+    cpu_quota_seconds: float | None = None,
 ) -> Callable[..., Any]:
     """Decorator to mark a function as an ADK tool.
 
@@ -127,6 +154,10 @@ def adk_tool(
     - Circuit breaker integration for external API tools
     - Tool result validation (BaseToolResponse normalization)
     - Optional skip_summarization flag (OPT-8)
+    - Execution class scheduling: ``io`` and ``cpu-heavy`` bodies run off the
+      event loop (see ``tools/common/execution.py``)
+    - Event-loop attribution: blocking calls are reported as ``tool:<name>``
+      (see ``core/loop_monitor.py``)
 
     Args:
         func: The function to decorate (when used without parentheses).
@@ -135,6 +166,13 @@ def adk_tool(
             agent consumption rather than user display. The flag is stored as
             ``_skip_summarization`` on the wrapper and consumed by
             ``prepare_tools()`` when building agent tool lists.
+        execution: ``ExecutionClass`` (or its value) describing the body.
+            Defaults to ``io`` for ``async def`` tools and ``cpu-light`` for
+            plain ``def`` tools, which run inline as before. Synchronous
+            ``io`` tools run in a thread and ``cpu-heavy`` tools in the tool
+            process pool; both are exposed as ``async def`` wrappers.
+        cpu_quota_seconds: CPU-time quota for ``cpu-heavy`` calls. Defaults
+            to ``SRE_AGENT_CPU_QUOTA_SECONDS``.
 
     Example:
         @adk_tool
@@ -144,10 +182,19 @@ def adk_tool(
         @adk_tool(skip_summarization=True)
         async def list_time_series(filter_str: str) -> dict:
             ...
+
+        @adk_tool(execution=ExecutionClass.CPU_HEAVY)
+        def extract_log_patterns(log_entries_json: str) -> BaseToolResponse:
+            ...
     """
 
     def _decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
-        return _build_adk_tool_wrapper(fn, skip_summarization=skip_summarization)
+        return _build_adk_tool_wrapper(
+            fn,
+            skip_summarization=skip_summarization,
+            execution=execution,
+            cpu_quota_seconds=cpu_quota_seconds,
+        )
 
     # Support both @adk_tool and @adk_tool(skip_summarization=True)
     if func is not None:
@@ -158,9 +205,33 @@ def adk_tool(
 
 
 def _build_adk_tool_wrapper(
-    func: Callable[..., Any], *, skip_summarization: bool = False
+    func: Callable[..., Any],
+    *,
+    skip_summarization: bool = False,
+    execution: ExecutionClass | str | None = None,
+    cpu_quota_seconds: float | None = None,
 ) -> Callable[..., Any]:
     """Internal: build the actual wrapper for @adk_tool."""
+    is_async = inspect.iscoroutinefunction(func)
+    if execution is None:
+        execution_class = ExecutionClass.IO if is_async else ExecutionClass.CPU_LIGHT
+    else:
+        execution_class = ExecutionClass(execution)
+    # Bodies that must leave the event loop get an async wrapper.
+    offload = execution_class is ExecutionClass.CPU_HEAVY or (
+        not is_async and execution_class is ExecutionClass.IO
+    )
+
+    async def call_body(*args: Any, **kwargs: Any) -> Any:
+        if offload:
+            return await run_tool_body(
+                func,
+                execution_class,
+                args,
+                kwargs,
+                cpu_quota_seconds=cpu_quota_seconds,
+            )
+        return await func(*args, **kwargs)
 
     def should_skip_logging() -> bool:
         """Check if we should skip logging due to native instrumentation."""
@@ -192,9 +263,10 @@ def _build_adk_tool_wrapper(
         if not should_skip_logging():
             logger.info(f"🛠️  Tool Call: '{tool_name}' | Args: {arg_str}")
 
-        # Circuit breaker pre-call check
+        # Circuit breaker pre-call check, scoped to (backend, project)
         use_cb = _should_use_circuit_breaker(tool_name)
         registry = None
+        cb_scope = ""
         if use_cb:
             try:
                 from sre_agent.core.circuit_breaker import (
@@ -203,11 +275,12 @@ def _build_adk_tool_wrapper(
                 )
 
                 registry = get_circuit_breaker_registry()
-                registry.pre_call(tool_name)
+                cb_scope = _breaker_scope(tool_name, kwargs)
+                registry.pre_call(cb_scope)
             except CircuitBreakerOpenError as e:
                 duration_ms = (time.time() - start_time) * 1000
                 logger.warning(
-                    f"⚡ Circuit OPEN for '{tool_name}' | "
+                    f"⚡ Circuit OPEN for '{tool_name}' ({e.tool_name}) | "
                     f"Retry after {e.retry_after_seconds:.1f}s | "
                     f"Duration: {duration_ms:.2f}ms"
                 )
@@ -216,24 +289,30 @@ def _build_adk_tool_wrapper(
                 return BaseToolResponse(
                     status=ToolStatus.ERROR,
                     error=(
-                        f"Circuit breaker OPEN for '{tool_name}'. "
+                        f"Circuit breaker OPEN for '{tool_name}' ({e.tool_name}). "
                         f"The service appears degraded. "
                         f"Retry after {e.retry_after_seconds:.0f}s. "
                         "DO NOT retry immediately — use an alternative tool or wait."
                     ),
                     metadata={
                         "circuit_breaker": True,
+                        "circuit": e.tool_name,
                         "retry_after_seconds": e.retry_after_seconds,
                         "non_retryable": True,
                     },
                 )
             except Exception as cb_err:
                 # Circuit breaker itself should never block tool execution
+                registry = None
                 logger.debug(
                     f"Circuit breaker check failed for '{tool_name}': {cb_err}"
                 )
 
         auth_tokens = []
+        # Event-loop time spent in this call is attributed to the tool
+        from sre_agent.core.loop_monitor import enter_activity, exit_activity
+
+        activity_token = enter_activity(f"tool:{tool_name}")
         try:
             # OPT-12: Zero-Trust Identity Propagation
             # Propagate end-user IAM identity and trace context from tool_context
@@ -243,7 +322,23 @@ def _build_adk_tool_wrapper(
 
                 auth_tokens = set_auth_context_from_tool_context(tool_context)
 
-            result = await func(*args, **kwargs)
+            try:
+                result = await call_body(*args, **kwargs)
+            except CpuQuotaExceededError as e:
+                from sre_agent.schema import BaseToolResponse, ToolStatus
+
+                result = BaseToolResponse(
+                    status=ToolStatus.ERROR,
+                    error=(
+                        f"{e}. Narrow the input (shorter time range, fewer "
+                        "entries) instead of retrying the same call."
+                    ),
+                    metadata={
+                        "cpu_quota_exceeded": True,
+                        "cpu_quota_seconds": e.quota_seconds,
+                        "non_retryable": True,
+                    },
+                )
             duration_ms = (time.time() - start_time) * 1000
 
             # Check if the result indicates a tool-level error
@@ -255,7 +350,11 @@ def _build_adk_tool_wrapper(
                 )
                 # Record failure in circuit breaker
                 if use_cb and registry:
-                    registry.record_failure(tool_name)
+                    from sre_agent.core.circuit_breaker import classify_error
+
+                    registry.record_failure(
+                        cb_scope, classify_error(_tool_error_text(result))
+                    )
             else:
                 if not should_skip_logging():
                     logger.info(
@@ -263,7 +362,7 @@ def _build_adk_tool_wrapper(
                     )
                 # Record success in circuit breaker
                 if use_cb and registry:
-                    registry.record_success(tool_name)
+                    registry.record_success(cb_scope)
 
             # Do NOT normalize BaseToolResponse objects, legacy to keep for others
             from sre_agent.schema import BaseToolResponse
@@ -302,7 +401,9 @@ def _build_adk_tool_wrapper(
 
             # Record crash in circuit breaker
             if use_cb and registry:
-                registry.record_failure(tool_name)
+                from sre_agent.core.circuit_breaker import classify_error
+
+                registry.record_failure(cb_scope, classify_error(e))
 
             raise e
         finally:
@@ -311,6 +412,7 @@ def _build_adk_tool_wrapper(
                 from sre_agent.auth import reset_auth_context
 
                 reset_auth_context(auth_tokens)
+            exit_activity(activity_token)
 
     @functools.wraps(func)
     def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -334,6 +436,10 @@ def _build_adk_tool_wrapper(
             logger.info(f"🛠️  Tool Call: '{tool_name}' | Args: {arg_str}")
 
         auth_tokens = []
+        # Event-loop time spent in this call is attributed to the tool
+        from sre_agent.core.loop_monitor import enter_activity, exit_activity
+
+        activity_token = enter_activity(f"tool:{tool_name}")
         try:
             # OPT-12: Zero-Trust Identity Propagation
             # Propagate end-user IAM identity and trace context from tool_context
@@ -394,12 +500,15 @@ def _build_adk_tool_wrapper(
                 from sre_agent.auth import reset_auth_context
 
                 reset_auth_context(auth_tokens)
+            exit_activity(activity_token)
 
-    if inspect.iscoroutinefunction(func):
+    if is_async or offload:
         async_wrapper._skip_summarization = skip_summarization  # type: ignore[attr-defined]
+        async_wrapper._execution_class = execution_class  # type: ignore[attr-defined]
         return async_wrapper
     else:
         sync_wrapper._skip_summarization = skip_summarization  # type: ignore[attr-defined]
+        sync_wrapper._execution_class = execution_class  # type: ignore[attr-defined]
         return sync_wrapper
 
 
@@ -0,0 +1,586 @@
+"""Execution classes for tools and the process pool behind CPU-heavy tools.
+
+ADK awaits ``async def`` tools and calls plain ``def`` tools inline, so a
+synchronous tool that mines 50k log lines blocks every stream on the replica
+for as long as it runs. ``@adk_tool(execution=...)`` declares how a tool's
+body should be scheduled:
+
+- ``io``: waits on the network. Synchronous bodies run in a thread
+  (``asyncio.to_thread``), which carries auth and trace context along.
+- ``cpu-light``: cheap pure-Python work. Runs inline, as before.
+- ``cpu-heavy``: long pure-Python work. Runs in :class:`ToolProcessPool`, a
+  small set of long-lived worker processes, so it neither blocks the event
+  loop nor competes for its GIL.
+
+Calls into the pool send only a reference to the tool (module and qualified
+name) plus the pickled arguments over a dedicated pipe, so nothing but data
+crosses the process boundary. Cancelling the awaiting task kills the worker
+running the call; a replacement is started on demand. Each call runs under a
+CPU-time quota (``SIGPROF`` interval timer in the worker, plus a wall-clock
+backstop in the parent), and the caller's OpenTelemetry context is injected
+into the worker so spans created there join the request's trace.
+
+Tools whose arguments cannot be pickled, or that are not importable by name
+(e.g. defined inside a function), fall back to a thread.
+
+Configuration (``ToolPoolConfig.from_env``):
+    SRE_AGENT_CPU_POOL: "false" runs cpu-heavy tools in threads instead.
+    SRE_AGENT_CPU_POOL_WORKERS: Worker processes (default: min(4, CPUs)).
+    SRE_AGENT_CPU_QUOTA_SECONDS: Default per-call CPU-time quota (30).
+    SRE_AGENT_CPU_POOL_MAX_TASKS: Calls served before a worker is recycled.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import importlib
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.connection import Connection
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# The parent kills a worker whose call has not returned after this multiple
+# of its CPU quota; covers C extensions that never yield to the signal handler.
+_WALL_CLOCK_FACTOR = 3.0
+_POLL_INTERVAL_SECONDS = 0.05
+
+
+class ExecutionClass(str, Enum):
+    """How a tool's body is scheduled relative to the event loop."""
+
+    IO = "io"
+    CPU_LIGHT = "cpu-light"
+    CPU_HEAVY = "cpu-heavy"
+
+
+class CpuQuotaExceededError(Exception):
+    """Raised when a pooled tool call exceeds its CPU-time quota."""
+
+    def __init__(self, tool_name: str, quota_seconds: float) -> None:
+        """Initialize the error.
+
+        Args:
+            tool_name: Name of the tool that was stopped.
+            quota_seconds: The quota it exceeded.
+        """
+        self.tool_name = tool_name
+        self.quota_seconds = quota_seconds
+        super().__init__(
+            f"Tool '{tool_name}' exceeded its CPU-time quota of {quota_seconds:g}s"
+        )
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a pool worker exits while running a call."""
+
+
+class _TransferError(Exception):
+    """Arguments could not be sent to a worker."""
+
+
+@dataclass
+class ToolPoolConfig:
+    """Configuration for the CPU-heavy tool pool."""
+
+    enabled: bool = True
+    max_workers: int = 2
+    cpu_quota_seconds: float = 30.0
+    max_tasks_per_worker: int = 500
+    start_method: str = "spawn"
+
+    @classmethod
+    def from_env(cls) -> "ToolPoolConfig":
+        """Build a config from ``SRE_AGENT_CPU_*`` environment variables."""
+        return cls(
+            enabled=os.environ.get("SRE_AGENT_CPU_POOL", "true").lower() != "false",
+            max_workers=max(
+                1,
+                int(
+                    os.environ.get(
+                        "SRE_AGENT_CPU_POOL_WORKERS", min(4, os.cpu_count() or 1)
+                    )
+                ),
+            ),
+            cpu_quota_seconds=float(
+                os.environ.get("SRE_AGENT_CPU_QUOTA_SECONDS", "30")
+            ),
+            max_tasks_per_worker=int(
+                os.environ.get("SRE_AGENT_CPU_POOL_MAX_TASKS", "500")
+            ),
+            # forkserver avoids forking a parent that already runs gRPC threads.
+            start_method=(
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            ),
+        )
+
+
+# =============================================================================
+# Worker process side
+# =============================================================================
+
+
+class _QuotaTimer:
+    """Per-call CPU-time limit inside a worker, based on ``ITIMER_PROF``."""
+
+    supported = hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def __init__(self) -> None:
+        self.fired = False
+        if self.supported:
+            signal.signal(signal.SIGPROF, self._on_expired)
+
+    def _on_expired(self, signum: int, frame: Any) -> None:
+        self.fired = True
+        raise CpuQuotaExceededError("", 0)
+
+    @contextlib.contextmanager
+    def limit(self, seconds: float) -> Iterator[None]:
+        self.fired = False
+        if self.supported and seconds > 0:
+            signal.setitimer(signal.ITIMER_PROF, seconds)
+        try:
+            yield
+        finally:
+            if self.supported:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+
+
+def _resolve(module_name: str, qualname: str) -> Callable[..., Any]:
+    """Import a tool by name and strip its ``@adk_tool`` wrapper."""
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return getattr(obj, "__wrapped__", obj)  # type: ignore[no-any-return]
+
+
+def _import_modules(modules: tuple[str, ...]) -> int:
+    """Worker warm-up: import tool modules before their first call."""
+    for module in modules:
+        importlib.import_module(module)
+    return len(modules)
+
+
+@contextlib.contextmanager
+def _trace_context(carrier: dict[str, str], name: str) -> Iterator[None]:
+    """Continue the caller's trace inside the worker."""
+    try:
+        from opentelemetry import context, propagate, trace
+    except ImportError:  # pragma: no cover - OTel is a core dependency
+        yield
+        return
+    token = context.attach(propagate.extract(carrier))
+    try:
+        with trace.get_tracer(__name__).start_as_current_span(f"cpu_pool {name}"):
+            yield
+    finally:
+        context.detach(token)
+
+
+def _worker_main(conn: Connection) -> None:
+    """Serve calls from the parent until the pipe closes."""
+    # Ctrl-C is the parent's business; it terminates workers on shutdown.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    timer = _QuotaTimer()
+    while True:
+        try:
+            data = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        start = time.process_time()
+        status = "ok"
+        value: Any = None
+        try:
+            (module_name, qualname), args, kwargs, carrier, quota = pickle.loads(data)
+            fn = _resolve(module_name, qualname)
+            with _trace_context(carrier, qualname), timer.limit(quota):
+                value = fn(*args, **kwargs)
+                if asyncio.iscoroutine(value):
+                    value = asyncio.run(value)
+        except BaseException as e:
+            status, value = "error", e
+            with contextlib.suppress(Exception):
+                e.__traceback_text__ = traceback.format_exc()  # type: ignore[attr-defined]
+        if timer.fired:
+            status, value = "quota", None
+        cpu_seconds = time.process_time() - start
+        try:
+            payload = pickle.dumps(
+                (status, value, cpu_seconds), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception as e:
+            payload = pickle.dumps(
+                ("error", RuntimeError(f"Unpicklable tool result: {e}"), cpu_seconds)
+            )
+        try:
+            conn.send_bytes(payload)
+        except (BrokenPipeError, OSError):
+            return
+
+
+# =============================================================================
+# Parent side
+# =============================================================================
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, ctx: Any) -> None:
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn,), name="sre-agent-tool-worker"
+        )
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def kill(self) -> None:
+        with contextlib.suppress(Exception):
+            self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+
+
+class ToolProcessPool:
+    """Long-lived worker processes for CPU-heavy tool calls.
+
+    One dispatcher thread per worker sends a call, waits for its reply and
+    watches for cancellation and the wall-clock backstop, so the event loop
+    only ever awaits a future. Calls beyond ``max_workers`` queue in the
+    dispatcher executor until a worker frees up.
+    """
+
+    def __init__(self, config: ToolPoolConfig | None = None) -> None:
+        """Initialize the pool. Workers start on first use or ``warm_up``.
+
+        Args:
+            config: Pool configuration. Defaults to ``ToolPoolConfig.from_env()``.
+        """
+        self.config = config or ToolPoolConfig.from_env()
+        self._ctx = multiprocessing.get_context(self.config.start_method)
+        self._idle: list[_Worker] = []
+        self._busy: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._dispatch = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="sre-agent-tool-dispatch",
+        )
+        self._closed = False
+        self.calls = 0
+        self.killed = 0
+
+    # -- worker bookkeeping ---------------------------------------------------
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Tool process pool is shut down")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    self._busy.add(worker)
+                    return worker
+                worker.kill()
+        worker = _Worker(self._ctx)
+        with self._lock:
+            self._busy.add(worker)
+        return worker
+
+    def _checkin(self, worker: _Worker) -> None:
+        worker.tasks += 1
+        with self._lock:
+            self._busy.discard(worker)
+            if (
+                not self._closed
+                and worker.tasks < self.config.max_tasks_per_worker
+                and worker.process.is_alive()
+            ):
+                self._idle.append(worker)
+                return
+        worker.kill()
+
+    def _discard(self, worker: _Worker) -> None:
+        with self._lock:
+            self._busy.discard(worker)
+            self.killed += 1
+        worker.kill()
+
+    @property
+    def worker_pids(self) -> list[int]:
+        """PIDs of live workers, idle or busy."""
+        with self._lock:
+            workers = [*self._idle, *self._busy]
+        return [w.process.pid for w in workers if w.process.pid is not None]
+
+    def warm_up(self, modules: tuple[str, ...] = ()) -> int:
+        """Start every worker and import ``modules`` ahead of the first call.
+
+        Args:
+            modules: Tool modules to import in the workers.
+
+        Returns:
+            Number of live workers.
+        """
+        with self._lock:
+            missing = self.config.max_workers - len(self._idle) - len(self._busy)
+        for _ in range(missing):
+            worker = _Worker(self._ctx)
+            with self._lock:
+                self._idle.append(worker)
+        jobs = [
+            self._dispatch.submit(
+                self._call,
+                (__name__, "_import_modules"),
+                (modules,),
+                {},
+                {},
+                0.0,
+                "warm_up",
+                threading.Event(),
+            )
+            for _ in range(self.config.max_workers)
+        ]
+        for job in jobs:
+            job.result()
+        return len(self.worker_pids)
+
+    # -- calls ------------------------------------------------------------------
+
+    def _call(
+        self,
+        ref: tuple[str, str],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        carrier: dict[str, str],
+        quota: float,
+        name: str,
+        cancelled: threading.Event,
+    ) -> tuple[Any, float]:
+        """Dispatcher thread: run one call on one worker."""
+        try:
+            payload = pickle.dumps(
+                (ref, args, kwargs, carrier, quota), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception as e:
+            raise _TransferError(str(e)) from e
+        if cancelled.is_set():
+            raise concurrent.futures.CancelledError()
+
+        worker = self._checkout()
+        deadline = time.monotonic() + quota * _WALL_CLOCK_FACTOR if quota > 0 else None
+        try:
+            worker.conn.send_bytes(payload)
+            while not worker.conn.poll(_POLL_INTERVAL_SECONDS):
+                if cancelled.is_set():
+                    logger.info(f"Cancelling '{name}': killing worker")
+                    self._discard(worker)
+                    raise concurrent.futures.CancelledError()
+                if deadline is not None and time.monotonic() > deadline:
+                    logger.warning(f"'{name}' overran its wall-clock backstop")
+                    self._discard(worker)
+                    raise CpuQuotaExceededError(name, quota)
+                if not worker.process.is_alive():
+                    self._discard(worker)
+                    raise WorkerCrashedError(
+                        f"Worker exited with code {worker.process.exitcode} "
+                        f"while running '{name}'"
+                    )
+            reply = worker.conn.recv_bytes()
+        except (EOFError, OSError) as e:
+            self._discard(worker)
+            raise WorkerCrashedError(f"Worker lost while running '{name}'") from e
+        self._checkin(worker)
+        self.calls += 1
+        try:
+            status, value, cpu_seconds = pickle.loads(reply)
+        except Exception as e:
+            # e.g. an exception type whose __init__ does not round-trip
+            raise RuntimeError(f"Could not decode the result of '{name}': {e}") from e
+
+        if status == "quota":
+            raise CpuQuotaExceededError(name, quota)
+        if status == "error":
+            remote = getattr(value, "__traceback_text__", "")
+            if remote and hasattr(value, "add_note"):
+                value.add_note(f"Traceback from tool worker:\n{remote}")
+            raise value
+        return value, cpu_seconds
+
+    async def run(
+        self,
+        ref: tuple[str, str],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        cpu_quota_seconds: float | None = None,
+        name: str | None = None,
+    ) -> Any:
+        """Run ``module.qualname(*args, **kwargs)`` in a worker.
+
+        Args:
+            ref: ``(module, qualname)`` of a module-level function. An
+                ``@adk_tool`` wrapper is unwrapped in the worker.
+            args: Positional arguments (pickled).
+            kwargs: Keyword arguments (pickled).
+            cpu_quota_seconds: CPU-time limit for this call; 0 disables it.
+                Defaults to the pool's configured quota.
+            name: Name used in logs and errors. Defaults to the qualname.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            CpuQuotaExceededError: The call used more than its CPU quota.
+            WorkerCrashedError: The worker died while running the call.
+        """
+        quota = (
+            self.config.cpu_quota_seconds
+            if cpu_quota_seconds is None
+            else cpu_quota_seconds
+        )
+        carrier: dict[str, str] = {}
+        with contextlib.suppress(Exception):
+            from opentelemetry import propagate
+
+            propagate.inject(carrier)
+
+        cancelled = threading.Event()
+        future = self._dispatch.submit(
+            self._call,
+            ref,
+            args,
+            kwargs or {},
+            carrier,
+            quota,
+            name or ref[1],
+            cancelled,
+        )
+        try:
+            value, cpu_seconds = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        _annotate_span(cpu_seconds)
+        return value
+
+    def shutdown(self) -> None:
+        """Stop all workers. Calls still running raise ``WorkerCrashedError``."""
+        with self._lock:
+            self._closed = True
+            workers = [*self._idle, *self._busy]
+            self._idle.clear()
+        for worker in workers:
+            worker.kill()
+        self._dispatch.shutdown(wait=False, cancel_futures=True)
+
+
+def _annotate_span(cpu_seconds: float) -> None:
+    """Record the worker's CPU time on the caller's active span."""
+    with contextlib.suppress(Exception):
+        from opentelemetry import trace
+
+        trace.get_current_span().set_attribute("tool.cpu_time_seconds", cpu_seconds)
+
+
+# =============================================================================
+# Dispatch used by @adk_tool
+# =============================================================================
+
+
+def function_ref(func: Callable[..., Any]) -> tuple[str, str] | None:
+    """``(module, qualname)`` if ``func`` can be imported by name, else None."""
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", "")
+    if not module or not qualname or "<locals>" in qualname or module == "__main__":
+        return None
+    return module, qualname
+
+
+async def run_tool_body(
+    func: Callable[..., Any],
+    execution: ExecutionClass,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    *,
+    cpu_quota_seconds: float | None = None,
+) -> Any:
+    """Run a tool's undecorated body according to its execution class.
+
+    Args:
+        func: The undecorated tool function.
+        execution: Its execution class.
+        args: Positional arguments.
+        kwargs: Keyword arguments. ``tool_context`` is not sent to workers;
+            ``@adk_tool`` has already applied the identity it carries.
+        cpu_quota_seconds: Per-tool CPU quota for pooled calls.
+
+    Returns:
+        The tool's return value.
+    """
+    if execution is ExecutionClass.CPU_HEAVY:
+        pool = get_tool_process_pool()
+        ref = function_ref(func)
+        if pool is not None and ref is not None:
+            worker_kwargs = {k: v for k, v in kwargs.items() if k != "tool_context"}
+            try:
+                return await pool.run(
+                    ref,
+                    args,
+                    worker_kwargs,
+                    cpu_quota_seconds=cpu_quota_seconds,
+                    name=func.__name__,
+                )
+            except _TransferError as e:
+                logger.debug(
+                    f"'{func.__name__}' arguments not transferable ({e}); "
+                    "running in a thread"
+                )
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await asyncio.to_thread(functools.partial(func, *args, **kwargs))
+
+
+_pool: ToolProcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_process_pool() -> ToolProcessPool | None:
+    """Get the process-wide tool pool, or None when it is disabled."""
+    global _pool
+    if _pool is None:
+        config = ToolPoolConfig.from_env()
+        if not config.enabled:
+            return None
+        with _pool_lock:
+            if _pool is None:
+                _pool = ToolProcessPool(config)
+    return _pool
+
+
+def reset_tool_process_pool() -> None:
+    """Shut down and drop the singleton pool (also used on app shutdown)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(reset_tool_process_pool)
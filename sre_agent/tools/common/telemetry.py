@@ -769,5 +769,42 @@ def log_evaluation_result(
         return False
 
 
+# ============================================================================
+# Metrics
+# ============================================================================
+# Instruments are created once per name against the global MeterProvider, so
+# they export wherever the process has configured metrics (and are no-ops
+# otherwise).
+
+_histograms: dict[str, Any] = {}
+
+
+def get_meter() -> Any:
+    """Returns the OpenTelemetry meter for SRE Agent instruments."""
+    from opentelemetry import metrics
+
+    return metrics.get_meter("sre_agent")
+
+
+def get_histogram(name: str, unit: str = "ms", description: str = "") -> Any:
+    """Returns a cached OpenTelemetry histogram.
+
+    Args:
+        name: Instrument name (e.g. ``sre_agent.event_loop.lag``).
+        unit: Unit of the recorded values.
+        description: Human-readable description of the instrument.
+
+    Returns:
+        The histogram; ``record(value, attributes)`` records a measurement.
+    """
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = get_meter().create_histogram(
+            name, unit=unit, description=description
+        )
+        _histograms[name] = histogram
+    return histogram
+
+
 # Backwards compatibility alias
 configure_logging = setup_telemetry
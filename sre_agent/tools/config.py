@@ -1102,6 +1102,9 @@ class ToolConfigManager:
             return
 
         self._configs: dict[str, ToolConfig] = {}
+        # Bumped on every enable/disable change so consumers such as the
+        # policy engine can cheaply detect a stale compiled view.
+        self._version = 0
         self._test_functions: dict[
             str, Callable[[], Coroutine[Any, Any, ToolTestResult]]
         ] = {}
@@ -1151,6 +1154,7 @@ class ToolConfigManager:
                             details=test_data.get("details", {}),
                         )
 
+            self._version += 1
             logger.info(f"Loaded tool configuration from {CONFIG_FILE_PATH}")
         except Exception as e:
             logger.warning(f"Failed to load tool configuration: {e}")
@@ -1179,6 +1183,11 @@ class ToolConfigManager:
         except Exception as e:
             logger.error(f"Failed to save tool configuration: {e}")
 
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever a tool's enabled state changes."""
+        return self._version
+
     def get_all_configs(self) -> list[ToolConfig]:
         """Get all tool configurations."""
         return list(self._configs.values())
@@ -1197,6 +1206,7 @@ class ToolConfigManager:
             return False
 
         self._configs[tool_name].enabled = enabled
+        self._version += 1
         self._save_config()
         logger.info(f"Tool '{tool_name}' {'enabled' if enabled else 'disabled'}")
         return True
@@ -1,7 +1,9 @@
-"""Discovery tool for BigQuery telemetry sources using MCP.
+"""Discovery tool for BigQuery telemetry sources.
 
-This tool acts as the "Entry Point" for Stage 0 analysis. It intelligently scans
-the project's BigQuery datasets to find the standard Cloud Observability export tables:
+This tool acts as the "Entry Point" for Stage 0 analysis. It resolves the
+project's standard Cloud Observability export tables from the telemetry
+catalog, which scans the project's BigQuery datasets once per credential
+principal and keeps the result cached:
 - `_AllSpans`: For trace data.
 - `_AllLogs`: For log data.
 
@@ -14,12 +16,9 @@ import logging
 from typing import Any
 
 from sre_agent.schema import BaseToolResponse, ToolStatus
+from sre_agent.services.telemetry_catalog import DiscoveryError, get_telemetry_catalog
 from sre_agent.tools.common import adk_tool
-from sre_agent.tools.mcp.gcp import (
-    call_mcp_tool_with_retry,
-    create_bigquery_mcp_toolset,
-    get_project_id_with_fallback,
-)
+from sre_agent.tools.mcp.gcp import get_project_id_with_fallback
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +31,8 @@ async def discover_telemetry_sources(
     """Discover BigQuery datasets containing observability data.
 
     This tool scans the project for datasets that contain standard Cloud Observability
-    linked tables: `_AllSpans` (for traces) and `_AllLogs` (for logs).
+    linked tables: `_AllSpans` (for traces) and `_AllLogs` (for logs), along with
+    their column names. Results are cached per project and credential principal.
 
     Args:
         project_id: GCP project ID. If not provided, uses default credentials.
@@ -42,10 +42,8 @@ async def discover_telemetry_sources(
         Standardized response containing discovered telemetry sources.
     """
     logger.info("ENTER discover_telemetry_sources")
-    from sre_agent.tools.mcp.gcp import set_mcp_tool_context
+    from sre_agent.auth import get_credentials_from_tool_context
 
-    if tool_context:
-        set_mcp_tool_context(tool_context)
     pid = project_id or get_project_id_with_fallback()
     if not pid:
         return BaseToolResponse(
@@ -58,23 +56,12 @@ async def discover_telemetry_sources(
             },
         )
 
-    # 1. List Datasets
-    logger.info(f"Calling list_dataset_ids for project {pid}")
-    list_datasets_result = await call_mcp_tool_with_retry(
-        create_bigquery_mcp_toolset,
-        "list_dataset_ids",
-        {"project_id": pid},
-        tool_context,
-        project_id=pid,
-    )
-    logger.info(f"list_dataset_ids result: {list_datasets_result}")
-
-    if list_datasets_result.get("status") != "success":
-        error_msg = list_datasets_result.get("error", "Unknown error")
-        error_type = list_datasets_result.get("error_type", "UNKNOWN")
-        is_non_retryable = list_datasets_result.get("non_retryable", False)
-
-        logger.warning(f"Failed to list datasets: {error_msg} (type={error_type})")
+    try:
+        sources = await get_telemetry_catalog().get(
+            pid, credentials=get_credentials_from_tool_context(tool_context)
+        )
+    except DiscoveryError as e:
+        logger.warning(f"Telemetry discovery failed: {e} (type={e.error_type})")
 
         # Provide actionable guidance based on the fallback
         return BaseToolResponse(
@@ -85,12 +72,12 @@ async def discover_telemetry_sources(
                 "mode": "api_fallback",
             },
             metadata={
-                "error_type": error_type,
-                "non_retryable": is_non_retryable,
+                "error_type": e.error_type,
+                "non_retryable": e.non_retryable,
             },
             error=(
                 f"BigQuery discovery failed - switching to direct API mode. "
-                f"Error: {error_msg}. "
+                f"Error: {e}. "
                 "NEXT STEPS: Use direct API tools instead of BigQuery: "
                 "- For traces: use fetch_trace or list_traces "
                 "- For logs: use list_log_entries "
@@ -99,72 +86,15 @@ async def discover_telemetry_sources(
             ),
         )
 
-    datasets = list_datasets_result.get("result", [])
-    if isinstance(datasets, dict):
-        # Handle wrapped response (common in MCP)
-        # Try common keys like 'datasets', 'ids', or 'names'
-        datasets = (
-            datasets.get("datasets")
-            or datasets.get("ids")
-            or datasets.get("names")
-            or []
-        )
-
-    if not isinstance(datasets, list):
-        # Handle potential string or other unexpected formats
-        logger.warning(f"Unexpected dataset format: {type(datasets)} - {datasets}")
-        datasets = []
-
-    trace_table = None
-    log_table = None
-    scanned_datasets = []
-
-    # 2. Scan each dataset for tables
-    # IMPACT: Limiting to first 5 datasets to prevent execution timeout during discovery
-    for dataset_id in datasets[:5]:
-        scanned_datasets.append(dataset_id)
-
-        # Optimization: Stop if both found
-        if trace_table and log_table:
-            break
-
-        logger.info(f"Scanning dataset: {dataset_id}")
-        list_tables_result = await call_mcp_tool_with_retry(
-            create_bigquery_mcp_toolset,
-            "list_table_ids",
-            {"dataset_id": dataset_id, "project_id": pid},
-            tool_context,
-            project_id=pid,
-        )
-
-        if list_tables_result.get("status") != "success":
-            logger.warning(
-                f"Failed to list tables for {dataset_id}: {list_tables_result.get('error')}"
-            )
-            continue
-
-        tables = list_tables_result.get("result", [])
-        if not isinstance(tables, list):
-            continue
-
-        # Check for target tables
-        if "_AllSpans" in tables:
-            trace_table = f"{pid}.{dataset_id}._AllSpans"
-            logger.info(f"Found trace table: {trace_table}")
-
-        if "_AllLogs" in tables:
-            log_table = f"{pid}.{dataset_id}._AllLogs"
-            logger.info(f"Found log table: {log_table}")
-
-    mode = "bigquery" if (trace_table or log_table) else "api_fallback"
-
     return BaseToolResponse(
         status=ToolStatus.SUCCESS,
         result={
-            "trace_table": trace_table,
-            "log_table": log_table,
-            "mode": mode,
-            "datasets_scanned": scanned_datasets,
+            "trace_table": sources.trace_table,
+            "log_table": sources.log_table,
+            "typed_trace_table": sources.typed_trace_table,
+            "mode": sources.mode,
+            "datasets_scanned": sources.datasets_scanned,
             "project_id": pid,
+            "schemas": sources.schemas,
         },
     )
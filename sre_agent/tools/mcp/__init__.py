@@ -15,15 +15,14 @@ Direct API Tools:
 - Logging: list_log_entries, get_logs_for_trace
 - Monitoring: list_time_series
 - Error Reporting: list_error_events
+
+The direct API tools are re-exported lazily (PEP 562) so that importing the
+MCP helpers does not load the Cloud Logging, Monitoring and Trace clients.
 """
 
-from ..clients.logging import (
-    get_logs_for_trace,
-    list_error_events,
-    list_log_entries,
-)
-from ..clients.monitoring import list_time_series
-from ..clients.trace import get_current_time
+import importlib
+from typing import Any
+
 from .gcp import (
     call_mcp_tool_with_retry,
     create_bigquery_mcp_toolset,
@@ -35,6 +34,26 @@ from .gcp import (
     mcp_query_range,
 )
 
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "get_current_time": ("..clients.trace", "get_current_time"),
+    "get_logs_for_trace": ("..clients.logging", "get_logs_for_trace"),
+    "list_error_events": ("..clients.logging", "list_error_events"),
+    "list_log_entries": ("..clients.logging", "list_log_entries"),
+    "list_time_series": ("..clients.monitoring", "list_time_series"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy-load the direct API tools on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_path, __package__)
+        value = getattr(module, attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "call_mcp_tool_with_retry",
     # MCP toolset factories
@@ -180,7 +180,7 @@ async def complete_investigation(
     await manager.update_state(InvestigationPhase.RESOLVED, session_id=session_id)
 
     # Learn from the investigation
-    tool_sequence = list(manager._current_tool_sequence)
+    tool_sequence = manager.get_tool_sequence(session_id)
     await manager.learn_from_investigation(
         symptom_type=symptom_type,
         root_cause_category=root_cause_category,
@@ -208,7 +208,7 @@ async def complete_investigation(
             logger.warning(f"Failed to sync session to memory: {e}")
 
     # Reset for next investigation
-    manager.reset_session_tracking()
+    manager.reset_session_tracking(session_id)
 
     return BaseToolResponse(
         status=ToolStatus.SUCCESS,
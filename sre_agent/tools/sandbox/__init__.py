@@ -16,7 +16,8 @@ Execution Modes:
        Uses cloud-based sandboxes for secure, isolated execution.
 
     2. Local Mode (set SRE_AGENT_LOCAL_EXECUTION=true):
-       Uses Python exec() locally for development/testing.
+       Runs code in a pool of pre-warmed local worker processes with
+       per-job working directories, timeouts and memory caps.
        NOTE: Less secure than Agent Engine sandbox.
 
 Usage:
@@ -42,6 +43,9 @@ Environment Variables:
     SRE_AGENT_SANDBOX_RESOURCE_NAME: Optional pre-created sandbox resource name.
     SRE_AGENT_SANDBOX_TTL: Sandbox time-to-live in seconds (default: 3600).
     SRE_AGENT_ID: When set, auto-enables Agent Engine sandbox mode.
+    SRE_AGENT_SANDBOX_WORKERS: Local worker processes (default: min(4, CPUs)).
+    SRE_AGENT_SANDBOX_TIMEOUT_SECONDS: Local wall-clock limit per job (default: 60).
+    SRE_AGENT_SANDBOX_MAX_RSS_MB: Local worker memory cap (default: 1024).
 
 References:
     - https://docs.cloud.google.com/agent-builder/agent-engine/code-execution/overview
@@ -91,6 +95,7 @@ from .schemas import (
     SandboxLanguage,
     TimeSeriesSummary,
 )
+from .worker_pool import LocalWorkerPool, WorkerPoolConfig, get_local_worker_pool
 
 __all__ = [
     "DATA_PROCESSING_TEMPLATES",
@@ -98,6 +103,7 @@ __all__ = [
     "CodeExecutionRequest",
     "DataProcessingResult",
     "LocalCodeExecutor",
+    "LocalWorkerPool",
     "LogEntrySummary",
     "MachineConfig",
     "MetricDescriptorSummary",
@@ -109,10 +115,12 @@ __all__ = [
     "SandboxFile",
     "SandboxLanguage",
     "TimeSeriesSummary",
+    "WorkerPoolConfig",
     "clear_execution_logs",
     "execute_custom_analysis_in_sandbox",
     "get_agent_engine_resource_name",
     "get_code_executor",
+    "get_local_worker_pool",
     "get_recent_execution_logs",
     "get_sandbox_resource_name",
     "get_sandbox_status",
@@ -0,0 +1,144 @@
+"""Worker process entry point for the local sandbox pool.
+
+Runs as a standalone script (``python _local_worker.py``) so that starting a
+worker does not import the ``sre_agent`` package.  NumPy and pandas are
+imported once at startup so jobs start warm.
+
+Protocol: the parent writes one JSON job per line to stdin
+(``{"id", "code", "workdir"}``); the worker answers with JSON lines on its
+original stdout: ``ready`` once at startup, then ``stdout``/``stderr`` chunks
+while a job runs and a final ``done`` carrying ``error`` (or null).
+
+This module must only use the standard library.
+"""
+
+import gc
+import json
+import os
+import sys
+from typing import Any, TextIO
+
+_CHUNK_SIZE = 4096
+
+SAFE_BUILTIN_NAMES = (
+    "print",
+    "len",
+    "range",
+    "enumerate",
+    "zip",
+    "map",
+    "filter",
+    "sorted",
+    "reversed",
+    "list",
+    "dict",
+    "set",
+    "tuple",
+    "str",
+    "int",
+    "float",
+    "bool",
+    "min",
+    "max",
+    "sum",
+    "abs",
+    "round",
+    "isinstance",
+    "hasattr",
+    "getattr",
+    "open",  # Needed for file I/O
+    "__import__",  # Needed for imports
+)
+
+
+class _Channel:
+    """Serializes protocol messages onto the worker's original stdout."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def send(self, message: dict[str, Any]) -> None:
+        self._stream.write(json.dumps(message) + "\n")
+        self._stream.flush()
+
+
+class _StreamWriter:
+    """File-like object forwarding user output to the parent in chunks."""
+
+    def __init__(self, channel: _Channel, job_id: str, kind: str) -> None:
+        self._channel = channel
+        self._job_id = job_id
+        self._kind = kind
+        self._buffer: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        self._buffer.append(text)
+        self._size += len(text)
+        if "\n" in text or self._size >= _CHUNK_SIZE:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self._buffer:
+            data = "".join(self._buffer)
+            self._buffer, self._size = [], 0
+            self._channel.send({"id": self._job_id, "type": self._kind, "data": data})
+
+    def isatty(self) -> bool:
+        return False
+
+
+def _safe_builtins() -> dict[str, Any]:
+    import builtins
+
+    namespace = {name: getattr(builtins, name) for name in SAFE_BUILTIN_NAMES}
+    namespace.update({"None": None, "True": True, "False": False})
+    return namespace
+
+
+def _run_job(channel: _Channel, job: dict[str, Any], idle_dir: str) -> None:
+    job_id = job["id"]
+    out = _StreamWriter(channel, job_id, "stdout")
+    err = _StreamWriter(channel, job_id, "stderr")
+    error: str | None = None
+    saved = sys.stdout, sys.stderr
+    try:
+        # Only this worker process changes directory; the server never does.
+        os.chdir(job["workdir"])
+        namespace: dict[str, Any] = {"__builtins__": _safe_builtins()}
+        sys.stdout, sys.stderr = out, err
+        exec(compile(job["code"], "<sandbox>", "exec"), namespace)
+    except BaseException as e:  # user code may raise anything, incl. SystemExit
+        error = str(e) or type(e).__name__
+    finally:
+        sys.stdout, sys.stderr = saved
+        out.flush()
+        err.flush()
+        os.chdir(idle_dir)
+        gc.collect()
+    channel.send({"id": job_id, "type": "done", "error": error})
+
+
+def main() -> None:
+    # Keep the protocol on a private copy of stdout and point fd 1 at stderr,
+    # so stray writes from C extensions cannot corrupt the channel.
+    channel = _Channel(os.fdopen(os.dup(1), "w", buffering=1))
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    for module in ("numpy", "pandas"):
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+
+    idle_dir = os.getcwd()
+    channel.send({"type": "ready", "pid": os.getpid()})
+    for line in sys.stdin:
+        if line.strip():
+            _run_job(channel, json.loads(line), idle_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,12 @@ from .schemas import (
     SandboxExecutionLog,
     SandboxFile,
 )
+from .worker_pool import (
+    JobResult,
+    LocalWorkerPool,
+    OutputCallback,
+    get_local_worker_pool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -117,8 +123,8 @@ def is_remote_mode() -> bool:
 def is_local_execution_enabled() -> bool:
     """Check if local code execution is enabled.
 
-    Local execution uses Python's exec() in a restricted namespace.
-    This is less secure than Agent Engine sandbox but allows testing locally.
+    Local execution runs Python code in pooled worker processes with a
+    restricted namespace. This is less secure than Agent Engine sandbox but allows testing locally.
     """
     return os.environ.get(LOCAL_EXECUTION_KEY, "false").lower() == "true"
 
@@ -504,8 +510,10 @@ with open("input_data.json", "r") as f:
 class LocalCodeExecutor:
     """Local code executor for development environments.
 
-    This executor runs Python code locally using exec() in a restricted namespace.
-    It provides similar functionality to SandboxExecutor but without cloud infrastructure.
+    This executor runs Python code in a pool of pre-warmed worker processes
+    (see :mod:`.worker_pool`) with a restricted builtins namespace, a per-job
+    working directory, a wall-clock timeout and a memory cap. It provides
+    similar functionality to SandboxExecutor but without cloud infrastructure.
 
     SECURITY NOTE: This executor does NOT provide the same isolation as Agent Engine
     sandboxes. It should only be used in trusted development environments.
@@ -515,29 +523,34 @@ class LocalCodeExecutor:
         output = await executor.execute_code("print('Hello')")
     """
 
-    def __init__(self) -> None:
-        """Initialize the local code executor."""
-        self._temp_dir: str | None = None
+    def __init__(self, pool: LocalWorkerPool | None = None) -> None:
+        """Initialize the local code executor.
+
+        Args:
+            pool: Worker pool to run code in. Defaults to the shared pool.
+        """
+        self._pool = pool
 
     async def execute_code(
         self,
         code: str,
         input_files: list[SandboxFile] | None = None,
         ttl_extension_seconds: int | None = None,
+        on_output: OutputCallback | None = None,
     ) -> CodeExecutionOutput:
-        """Execute code locally using Python's exec().
+        """Execute code in a local worker process.
 
         Args:
             code: Python code to execute.
             input_files: Optional files to make available.
             ttl_extension_seconds: Ignored (for API compatibility).
+            on_output: Optional ``(stream, text)`` callback for streamed output.
+                Called from a worker thread, not the event loop.
 
         Returns:
             CodeExecutionOutput with stdout, stderr, and output files.
         """
-        import io
-        import tempfile
-        from contextlib import redirect_stderr, redirect_stdout
+        import anyio
 
         start_time = time.time()
 
@@ -551,120 +564,53 @@ class LocalCodeExecutor:
             )
         )
 
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
-        output_files: list[SandboxFile] = []
-
+        pool = self._pool or get_local_worker_pool()
+        files = {f.name: f.content for f in input_files or []}
         try:
-            # Create a temporary directory for file I/O
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Write input files
-                if input_files:
-                    for f in input_files:
-                        file_path = os.path.join(temp_dir, f.name)
-                        with open(file_path, "wb") as fh:
-                            fh.write(f.content)
-
-                # Change to temp directory for file operations
-                original_cwd = os.getcwd()
-                os.chdir(temp_dir)
-
-                try:
-                    # Create restricted namespace with safe builtins
-                    safe_builtins = {
-                        "print": print,
-                        "len": len,
-                        "range": range,
-                        "enumerate": enumerate,
-                        "zip": zip,
-                        "map": map,
-                        "filter": filter,
-                        "sorted": sorted,
-                        "reversed": reversed,
-                        "list": list,
-                        "dict": dict,
-                        "set": set,
-                        "tuple": tuple,
-                        "str": str,
-                        "int": int,
-                        "float": float,
-                        "bool": bool,
-                        "None": None,
-                        "True": True,
-                        "False": False,
-                        "min": min,
-                        "max": max,
-                        "sum": sum,
-                        "abs": abs,
-                        "round": round,
-                        "isinstance": isinstance,
-                        "hasattr": hasattr,
-                        "getattr": getattr,
-                        "open": open,  # Needed for file I/O
-                        "__import__": __import__,  # Needed for imports
-                    }
-
-                    namespace: dict[str, Any] = {"__builtins__": safe_builtins}
-
-                    # Execute code with captured output
-                    with (
-                        redirect_stdout(stdout_capture),
-                        redirect_stderr(stderr_capture),
-                    ):
-                        exec(code, namespace)
-
-                    # Check for output files
-                    for filename in os.listdir(temp_dir):
-                        if filename.startswith("output") or filename.endswith(".json"):
-                            file_path = os.path.join(temp_dir, filename)
-                            if os.path.isfile(file_path):
-                                with open(file_path, "rb") as fh:
-                                    output_files.append(
-                                        SandboxFile(name=filename, content=fh.read())
-                                    )
-
-                finally:
-                    os.chdir(original_cwd)
-
-            duration_ms = (time.time() - start_time) * 1000
-            output = CodeExecutionOutput(
-                stdout=stdout_capture.getvalue(),
-                stderr=stderr_capture.getvalue(),
-                output_files=output_files,
-            )
-
-            # Emit completion event
-            _emit_event(
-                SandboxExecutionEvent(
-                    event_type=SandboxEventType.CODE_EXECUTION_COMPLETED,
-                    execution_mode="local",
-                    duration_ms=duration_ms,
-                    output_summary=f"stdout: {len(output.stdout)} chars, {len(output_files)} output files",
-                )
-            )
-
-            return output
-
+            result = await anyio.to_thread.run_sync(pool.run, code, files, on_output)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            result = JobResult(error=f"Local execution backend failed: {e}")
             logger.error(f"Local code execution failed: {e}", exc_info=True)
 
-            # Emit failure event
+        duration_ms = (time.time() - start_time) * 1000
+        output_files = [
+            SandboxFile(name=name, content=content)
+            for name, content in result.output_files.items()
+        ]
+
+        if result.error:
+            logger.warning(f"Local code execution failed: {result.error}")
             _emit_event(
                 SandboxExecutionEvent(
                     event_type=SandboxEventType.CODE_EXECUTION_FAILED,
                     execution_mode="local",
                     duration_ms=duration_ms,
-                    error_message=str(e),
+                    error_message=result.error,
                 )
             )
-
             return CodeExecutionOutput(
-                stdout=stdout_capture.getvalue(),
-                stderr=stderr_capture.getvalue(),
-                execution_error=str(e),
+                stdout=result.stdout,
+                stderr=result.stderr,
+                output_files=output_files,
+                execution_error=result.error,
             )
 
+        # Emit completion event
+        _emit_event(
+            SandboxExecutionEvent(
+                event_type=SandboxEventType.CODE_EXECUTION_COMPLETED,
+                execution_mode="local",
+                duration_ms=duration_ms,
+                output_summary=f"stdout: {len(result.stdout)} chars, {len(output_files)} output files",
+            )
+        )
+
+        return CodeExecutionOutput(
+            stdout=result.stdout,
+            stderr=result.stderr,
+            output_files=output_files,
+        )
+
     async def execute_data_processing(
         self,
         data: list[dict[str, Any]] | dict[str, Any],
@@ -1003,7 +949,7 @@ async def process_data_in_sandbox(
 
     Automatically selects the appropriate executor based on environment:
     - Agent Engine mode: Uses cloud sandbox for isolation
-    - Local mode with SRE_AGENT_LOCAL_EXECUTION=true: Uses local Python exec()
+    - Local mode with SRE_AGENT_LOCAL_EXECUTION=true: Uses the local worker pool
 
     All execution events are logged and can be retrieved via get_recent_execution_logs()
     for transparency into sandbox operations.
@@ -0,0 +1,381 @@
+"""Pool of pre-warmed worker processes for local code execution.
+
+:class:`LocalCodeExecutor` used to ``exec`` code on the event-loop thread after
+a process-wide ``os.chdir``, so a heavy pandas job froze every request on the
+replica and concurrent sessions raced on the working directory.  This pool
+runs each job in a separate, already started worker process instead:
+
+- Workers run ``_local_worker.py`` as a plain script with NumPy and pandas
+  imported up front, and are reused across jobs.
+- Every job gets its own working directory; only the worker process changes
+  directory, never the server.
+- Input files are written once into the job directory, which lives on
+  ``/dev/shm`` when available, so workers read them straight from shared
+  memory instead of receiving them over a pipe.
+- A wall-clock timeout and a resident-set-size cap are enforced by the parent;
+  a worker that exceeds either is killed and replaced.
+- stdout/stderr are streamed back in chunks while the job runs.
+
+All methods block and are meant to be called via ``anyio.to_thread``.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "_local_worker.py")
+_POLL_INTERVAL_SECONDS = 0.05
+
+OutputCallback = Callable[[str, str], None]
+
+
+@dataclass(frozen=True)
+class WorkerPoolConfig:
+    """Limits for the local sandbox worker pool.
+
+    Attributes:
+        max_workers: Maximum number of worker processes.
+        timeout_seconds: Wall-clock limit per job.
+        max_rss_mb: Resident memory cap per worker (Linux only).
+        max_jobs_per_worker: Jobs a worker runs before it is recycled.
+        startup_timeout_seconds: Time allowed for a worker to become ready.
+        job_root: Parent directory for per-job working directories.
+    """
+
+    max_workers: int = 4
+    timeout_seconds: float = 60.0
+    max_rss_mb: int = 1024
+    max_jobs_per_worker: int = 100
+    startup_timeout_seconds: float = 30.0
+    job_root: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "WorkerPoolConfig":
+        """Build a config from ``SRE_AGENT_SANDBOX_*`` environment variables."""
+        return cls(
+            max_workers=int(
+                os.environ.get(
+                    "SRE_AGENT_SANDBOX_WORKERS", str(min(4, os.cpu_count() or 1))
+                )
+            ),
+            timeout_seconds=float(
+                os.environ.get("SRE_AGENT_SANDBOX_TIMEOUT_SECONDS", "60")
+            ),
+            max_rss_mb=int(os.environ.get("SRE_AGENT_SANDBOX_MAX_RSS_MB", "1024")),
+            max_jobs_per_worker=int(
+                os.environ.get("SRE_AGENT_SANDBOX_MAX_JOBS_PER_WORKER", "100")
+            ),
+            job_root=os.environ.get("SRE_AGENT_SANDBOX_JOB_ROOT"),
+        )
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job run in a worker process."""
+
+    stdout: str = ""
+    stderr: str = ""
+    output_files: dict[str, bytes] = field(default_factory=dict)
+    error: str | None = None
+    duration_ms: float = 0.0
+
+
+def _default_job_root() -> str:
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _rss_bytes(pid: int) -> int | None:
+    """Return the resident set size of ``pid``, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class _Worker:
+    """One worker process plus the thread reading its protocol messages."""
+
+    def __init__(self, startup_timeout: float) -> None:
+        self.jobs_run = 0
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=tempfile.gettempdir(),
+        )
+        self.messages: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._read, name=f"sandbox-worker-{self.pid}", daemon=True
+        )
+        self._reader.start()
+        try:
+            ready = self.messages.get(timeout=startup_timeout)
+        except queue.Empty:
+            ready = None
+        if not ready or ready.get("type") != "ready":
+            self.kill()
+            raise RuntimeError("Sandbox worker failed to start")
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def _read(self) -> None:
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            try:
+                self.messages.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f"Ignoring malformed sandbox worker output: {line!r}")
+        self.messages.put(None)  # EOF: the worker exited
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def send(self, job: dict[str, Any]) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.write(json.dumps(job) + "\n")
+        self.process.stdin.flush()
+
+    def kill(self) -> None:
+        if self.alive():
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Sandbox worker {self.pid} did not exit after kill")
+
+
+class LocalWorkerPool:
+    """Runs sandbox code in a bounded pool of warm worker processes."""
+
+    def __init__(self, config: WorkerPoolConfig | None = None) -> None:
+        """Initialize the pool. Workers start lazily or via :meth:`warm`."""
+        self.config = config or WorkerPoolConfig.from_env()
+        self.job_root = self.config.job_root or _default_job_root()
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = 0
+        self._closed = False
+
+    def warm(self, count: int | None = None) -> None:
+        """Start up to ``count`` workers ahead of the first job."""
+        target = min(count or self.config.max_workers, self.config.max_workers)
+        while True:
+            with self._lock:
+                if self._started >= target:
+                    return
+                self._started += 1
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        try:
+            return _Worker(self.config.startup_timeout_seconds)
+        except Exception:
+            with self._lock:
+                self._started -= 1
+            raise
+
+    def _acquire(self) -> _Worker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_spawn = self._started < self.config.max_workers
+                    if can_spawn:
+                        self._started += 1
+                if can_spawn:
+                    return self._spawn()
+                try:
+                    # Re-check capacity periodically: a busy worker may be
+                    # discarded instead of returned to the idle queue.
+                    worker = self._idle.get(timeout=_POLL_INTERVAL_SECONDS * 4)
+                except queue.Empty:
+                    continue
+            if worker.alive():
+                return worker
+            self._discard(worker)
+
+    def _release(self, worker: _Worker) -> None:
+        if (
+            self._closed
+            or not worker.alive()
+            or worker.jobs_run >= self.config.max_jobs_per_worker
+        ):
+            self._discard(worker)
+        else:
+            self._idle.put(worker)
+
+    def _discard(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._started -= 1
+
+    def run(
+        self,
+        code: str,
+        input_files: dict[str, bytes] | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> JobResult:
+        """Run ``code`` in a worker and wait for it to finish.
+
+        Args:
+            code: Python source to execute.
+            input_files: File name to content, placed in the job directory.
+            on_output: Called with ``(stream, text)`` as output arrives.
+
+        Returns:
+            The job's output; ``error`` is set on failure, timeout or OOM.
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox worker pool is shut down")
+
+        start = time.monotonic()
+        workdir = tempfile.mkdtemp(prefix="sandbox-job-", dir=self.job_root)
+        try:
+            for name, content in (input_files or {}).items():
+                path = os.path.join(workdir, os.path.basename(name))
+                with open(path, "wb") as fh:
+                    fh.write(content)
+
+            result = self._run_in_worker(code, workdir, on_output)
+
+            for filename in os.listdir(workdir):
+                if input_files and filename in input_files:
+                    continue
+                if filename.startswith("output") or filename.endswith(".json"):
+                    path = os.path.join(workdir, filename)
+                    if os.path.isfile(path):
+                        with open(path, "rb") as fh:
+                            result.output_files[filename] = fh.read()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        result.duration_ms = (time.monotonic() - start) * 1000
+        return result
+
+    def _run_in_worker(
+        self, code: str, workdir: str, on_output: OutputCallback | None
+    ) -> JobResult:
+        worker = self._acquire()
+        job_id = uuid.uuid4().hex
+        result = JobResult()
+        stdout: list[str] = []
+        stderr: list[str] = []
+        deadline = time.monotonic() + self.config.timeout_seconds
+        max_rss = self.config.max_rss_mb * 1024 * 1024
+        healthy = False
+        try:
+            worker.send({"id": job_id, "code": code, "workdir": workdir})
+            worker.jobs_run += 1
+            while True:
+                if time.monotonic() > deadline:
+                    result.error = (
+                        f"Execution timed out after {self.config.timeout_seconds:g}s"
+                    )
+                    break
+                rss = _rss_bytes(worker.pid)
+                if rss is not None and rss > max_rss:
+                    result.error = (
+                        f"Execution exceeded memory limit of {self.config.max_rss_mb}MB"
+                    )
+                    break
+                try:
+                    msg = worker.messages.get(timeout=_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    continue
+                if msg is None:
+                    result.error = "Sandbox worker exited unexpectedly"
+                    break
+                if msg.get("id") != job_id:
+                    continue
+                kind = msg.get("type")
+                if kind in ("stdout", "stderr"):
+                    (stdout if kind == "stdout" else stderr).append(msg["data"])
+                    if on_output:
+                        try:
+                            on_output(kind, msg["data"])
+                        except Exception as e:
+                            logger.warning(f"Sandbox output callback failed: {e}")
+                elif kind == "done":
+                    result.error = msg.get("error")
+                    healthy = True
+                    break
+        except (BrokenPipeError, OSError) as e:
+            result.error = f"Sandbox worker failed: {e}"
+        finally:
+            if healthy:
+                self._release(worker)
+            else:
+                logger.warning(
+                    f"Killing sandbox worker {worker.pid}: {result.error or 'error'}"
+                )
+                self._discard(worker)
+
+        result.stdout = "".join(stdout)
+        result.stderr = "".join(stderr)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool occupancy for status endpoints."""
+        return {
+            "max_workers": self.config.max_workers,
+            "started": self._started,
+            "idle": self._idle.qsize(),
+            "job_root": self.job_root,
+        }
+
+    def shutdown(self) -> None:
+        """Kill all idle workers; busy workers are killed when released."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(worker)
+
+
+_pool: LocalWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_local_worker_pool() -> LocalWorkerPool:
+    """Return the process-wide worker pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = LocalWorkerPool()
+                atexit.register(_pool.shutdown)
+    return _pool
+
+
+def reset_local_worker_pool() -> None:
+    """Shut down and forget the process-wide pool (for testing)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
@@ -2,7 +2,7 @@
 
 Provides synthetic responses for all BigQuery API endpoints so the Explorer
 panel works without a real BigQuery connection.  The span data is sourced from
-:class:`DemoDataGenerator` and flattened into ``_AllSpans``-compatible rows.
+the shared demo dataset (:func:`get_demo_dataset`) and flattened into ``_AllSpans``-compatible rows.
 """
 
 from __future__ import annotations
@@ -27,9 +27,9 @@ def _get_all_rows() -> list[dict[str, Any]]:
     if _CACHED_ROWS is not None:
         return _CACHED_ROWS
 
-    from sre_agent.tools.synthetic.demo_data_generator import DemoDataGenerator
+    from sre_agent.tools.synthetic.demo_dataset import get_demo_dataset
 
-    gen = DemoDataGenerator(seed=42)
+    gen = get_demo_dataset()
     rows: list[dict[str, Any]] = []
     for trace in gen.get_all_traces():
         for span in trace["spans"]:
@@ -1,17 +1,25 @@
 """Deterministic demo data generator for the Cymbal Shops AI Shopping Assistant.
 
 Produces ~400 traces across ~80 sessions over a 7-day window.  All data is
-generated lazily on first access and cached.  The output formats match exactly
-what the AgentOps UI expects from the backend API endpoints.
+generated lazily on first access and cached, together with indexes by
+session, trace, span, service and time.  Endpoint responses are memoized per
+instance, so a shared instance (see :mod:`.demo_dataset`) answers repeated
+requests without recomputation.  The output formats match exactly what the
+AgentOps UI expects from the backend API endpoints.
 """
 
 from __future__ import annotations
 
+import bisect
+import functools
 import math
 import random
 import statistics
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 from sre_agent.tools.synthetic.cymbal_assistant import (
     AGENTS,
@@ -599,6 +607,34 @@ def _percentile(values: list[float], pct: float) -> float:
 # Main generator class
 # ---------------------------------------------------------------------------
 
+_RESPONSE_CACHE_SIZE = 512
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _memoized(method: _F) -> _F:
+    """Memoize an endpoint method per instance, keyed by its arguments.
+
+    The corpus is immutable once generated, so responses only depend on the
+    arguments.  Callers must treat returned dicts as read-only.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: DemoDataGenerator, *args: Any, **kwargs: Any) -> Any:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        with self._response_lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+        result = method(self, *args, **kwargs)
+        with self._response_lock:
+            self._responses[key] = result
+            if len(self._responses) > _RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
 
 class DemoDataGenerator:
     """Deterministic demo data generator for Cymbal Shops.
@@ -609,9 +645,38 @@ class DemoDataGenerator:
 
     def __init__(self, seed: int = 42) -> None:
         """Initialize with a deterministic random seed."""
+        self._seed = seed
         self._rng = random.Random(seed)
         self._sessions: list[dict[str, Any]] | None = None
         self._traces: list[dict[str, Any]] | None = None
+        self._index_lock = threading.Lock()
+        self._trace_by_id: dict[str, dict[str, Any]] | None = None
+        self._traces_by_session: dict[str, list[dict[str, Any]]] = {}
+        self._trace_ids_by_service: dict[str, frozenset[str]] = {}
+        self._span_by_id: dict[tuple[str, str], dict[str, Any]] = {}
+        self._response_lock = threading.Lock()
+        self._responses: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+
+    @classmethod
+    def from_corpus(
+        cls,
+        sessions: list[dict[str, Any]],
+        traces: list[dict[str, Any]],
+        seed: int = 42,
+    ) -> DemoDataGenerator:
+        """Create a generator around an already generated corpus."""
+        gen = cls(seed=seed)
+        gen._sessions = sessions
+        gen._traces = traces
+        return gen
+
+    def _call_rng(self, *key: str) -> random.Random:
+        """Deterministic RNG for per-call synthetic values (e.g. eval scores).
+
+        Seeded from the call arguments rather than the shared generator state,
+        so responses do not depend on how many requests came before.
+        """
+        return random.Random(":".join((str(self._seed), *key)))
 
     # ------------------------------------------------------------------
     # Internal: deterministic hex IDs
@@ -925,6 +990,56 @@ class DemoDataGenerator:
             self._traces = self._generate_traces()
         return self._traces
 
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def _ensure_indexes(self) -> None:
+        """Build the session, trace, span and service indexes once."""
+        if self._trace_by_id is not None:
+            return
+        traces = self.get_all_traces()
+        with self._index_lock:
+            if self._trace_by_id is not None:
+                return
+            by_session: dict[str, list[dict[str, Any]]] = defaultdict(list)
+            by_service: dict[str, set[str]] = defaultdict(set)
+            by_span: dict[tuple[str, str], dict[str, Any]] = {}
+            for trace in traces:
+                by_session[trace["session_id"]].append(trace)
+                for span in trace["spans"]:
+                    by_span[(trace["trace_id"], span["span_id"])] = span
+                    service = span["resource"]["attributes"].get("service.name")
+                    if service:
+                        by_service[service].add(trace["trace_id"])
+            self._traces_by_session = dict(by_session)
+            self._trace_ids_by_service = {
+                k: frozenset(v) for k, v in by_service.items()
+            }
+            self._span_by_id = by_span
+            self._trace_by_id = {t["trace_id"]: t for t in traces}
+
+    def get_trace(self, trace_id: str) -> dict[str, Any] | None:
+        """Return a trace by ID."""
+        self._ensure_indexes()
+        assert self._trace_by_id is not None
+        return self._trace_by_id.get(trace_id)
+
+    def get_session_traces(self, session_id: str) -> list[dict[str, Any]]:
+        """Return the traces of a session in chronological order."""
+        self._ensure_indexes()
+        return self._traces_by_session.get(session_id, [])
+
+    def _traces_between(
+        self, start: datetime, end: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Return traces with ``start <= timestamp < end`` via binary search."""
+        traces = self.get_all_traces()
+        key: Callable[[dict[str, Any]], datetime] = lambda t: t["timestamp"]  # noqa: E731
+        lo = bisect.bisect_left(traces, start, key=key)
+        hi = len(traces) if end is None else bisect.bisect_left(traces, end, key=key)
+        return traces[lo:hi]
+
     # ------------------------------------------------------------------
     # Filtering helpers
     # ------------------------------------------------------------------
@@ -936,17 +1051,11 @@ class DemoDataGenerator:
         errors_only: bool = False,
     ) -> list[dict[str, Any]]:
         """Filter traces by time window and optional service name."""
-        cutoff = _END_TIME - timedelta(hours=hours)
-        traces = [t for t in self.get_all_traces() if t["timestamp"] >= cutoff]
+        traces = self._traces_between(_END_TIME - timedelta(hours=hours))
         if service_name:
-            traces = [
-                t
-                for t in traces
-                if any(
-                    s["resource"]["attributes"].get("service.name") == service_name
-                    for s in t["spans"]
-                )
-            ]
+            self._ensure_indexes()
+            ids = self._trace_ids_by_service.get(service_name, frozenset())
+            traces = [t for t in traces if t["trace_id"] in ids]
         if errors_only:
             traces = [
                 t for t in traces if any(s["status"]["code"] == 2 for s in t["spans"])
@@ -960,8 +1069,7 @@ class DemoDataGenerator:
     def _previous_period_traces(self, hours: float) -> list[dict[str, Any]]:
         """Get traces from the period *before* the current window for trend calculations."""
         end = _END_TIME - timedelta(hours=hours)
-        start = end - timedelta(hours=hours)
-        return [t for t in self.get_all_traces() if start <= t["timestamp"] < end]
+        return self._traces_between(end - timedelta(hours=hours), end)
 
     # ------------------------------------------------------------------
     # Span-level helpers
@@ -1024,6 +1132,7 @@ class DemoDataGenerator:
     # Graph endpoints
     # ------------------------------------------------------------------
 
+    @_memoized
     def get_topology(
         self,
         hours: float = 168,
@@ -1165,6 +1274,7 @@ class DemoDataGenerator:
 
         return {"nodes": nodes, "edges": edges}
 
+    @_memoized
     def get_trajectories(
         self,
         hours: float = 168,
@@ -1208,6 +1318,7 @@ class DemoDataGenerator:
 
         return {"nodes": nodes, "links": links, "loopTraces": []}
 
+    @_memoized
     def get_node_detail(
         self, node_id: str, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1304,6 +1415,7 @@ class DemoDataGenerator:
             "recentPayloads": recent_payloads,
         }
 
+    @_memoized
     def get_edge_detail(
         self,
         source_id: str,
@@ -1380,6 +1492,7 @@ class DemoDataGenerator:
             "outputTokens": output_tokens,
         }
 
+    @_memoized
     def get_timeseries(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1446,12 +1559,13 @@ class DemoDataGenerator:
 
         return {"series": series}
 
+    @_memoized
     def get_context_graph(self, session_id: str) -> dict[str, Any]:
         """Synthesize a complex Context Graph for the UI from session traces.
 
         Matches the { nodes: ContextNode[], edges: ContextEdge[] } format expected by ContextGraphViewer.
         """
-        traces = [t for t in self.get_all_traces() if t["session_id"] == session_id]
+        traces = self.get_session_traces(session_id)
         if not traces:
             return {"nodes": [], "edges": []}
 
@@ -1565,6 +1679,7 @@ class DemoDataGenerator:
     # Dashboard endpoints
     # ------------------------------------------------------------------
 
+    @_memoized
     def get_dashboard_kpis(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1618,6 +1733,7 @@ class DemoDataGenerator:
             }
         }
 
+    @_memoized
     def get_dashboard_timeseries(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1702,6 +1818,7 @@ class DemoDataGenerator:
             "tokens": token_series,
         }
 
+    @_memoized
     def get_dashboard_models(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1746,6 +1863,7 @@ class DemoDataGenerator:
 
         return {"modelCalls": model_calls}
 
+    @_memoized
     def get_dashboard_tools(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1781,6 +1899,7 @@ class DemoDataGenerator:
 
         return {"toolCalls": tool_calls}
 
+    @_memoized
     def get_dashboard_logs(
         self, hours: float = 168, limit: int = 2000, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1826,6 +1945,7 @@ class DemoDataGenerator:
 
         return {"agentLogs": logs}
 
+    @_memoized
     def get_dashboard_sessions(
         self, hours: float = 168, limit: int = 2000, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1886,6 +2006,7 @@ class DemoDataGenerator:
 
         return {"agentSessions": agent_sessions}
 
+    @_memoized
     def get_dashboard_traces(
         self, hours: float = 168, limit: int = 2000, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1931,6 +2052,7 @@ class DemoDataGenerator:
     # Registry endpoints
     # ------------------------------------------------------------------
 
+    @_memoized
     def get_registry_agents(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -1997,6 +2119,7 @@ class DemoDataGenerator:
 
         return {"agents": agents_list}
 
+    @_memoized
     def get_registry_tools(
         self, hours: float = 168, service_name: str | None = None
     ) -> dict[str, Any]:
@@ -2042,50 +2165,48 @@ class DemoDataGenerator:
     # Detail endpoints
     # ------------------------------------------------------------------
 
+    @_memoized
     def get_span_details(self, trace_id: str, span_id: str) -> dict[str, Any]:
         """Return detailed info for a specific span."""
-        for trace in self.get_all_traces():
-            if trace["trace_id"] != trace_id:
-                continue
-            for span in trace["spans"]:
-                if span["span_id"] != span_id:
-                    continue
-                exceptions = []
-                evaluations = []
-                for evt in span.get("events", []):
-                    if evt.get("name") == "exception":
-                        evt_attrs = evt.get("attributes", {})
-                        exceptions.append(
-                            {
-                                "message": evt_attrs.get("exception.message", ""),
-                                "stacktrace": evt_attrs.get("exception.stacktrace", ""),
-                                "type": evt_attrs.get("exception.type", ""),
-                            }
-                        )
+        self._ensure_indexes()
+        span = self._span_by_id.get((trace_id, span_id))
+        if span is not None:
+            exceptions = []
+            evaluations = []
+            for evt in span.get("events", []):
+                if evt.get("name") == "exception":
+                    evt_attrs = evt.get("attributes", {})
+                    exceptions.append(
+                        {
+                            "message": evt_attrs.get("exception.message", ""),
+                            "stacktrace": evt_attrs.get("exception.stacktrace", ""),
+                            "type": evt_attrs.get("exception.type", ""),
+                        }
+                    )
 
-                # Generate synthetic eval data for LLM spans
-                is_llm = span.get("attributes", {}).get("gen_ai.system") is not None
-                if is_llm:
-                    rng = self._rng
-                    for metric in ["coherence", "groundedness", "fluency", "safety"]:
-                        evaluations.append(
-                            {
-                                "metricName": metric,
-                                "score": round(rng.uniform(0.6, 1.0), 3),
-                                "explanation": f"Demo: {metric} score for this LLM call.",
-                            }
-                        )
+            # Generate synthetic eval data for LLM spans
+            is_llm = span.get("attributes", {}).get("gen_ai.system") is not None
+            if is_llm:
+                rng = self._call_rng(trace_id, span_id)
+                for metric in ["coherence", "groundedness", "fluency", "safety"]:
+                    evaluations.append(
+                        {
+                            "metricName": metric,
+                            "score": round(rng.uniform(0.6, 1.0), 3),
+                            "explanation": f"Demo: {metric} score for this LLM call.",
+                        }
+                    )
 
-                return {
-                    "traceId": trace_id,
-                    "spanId": span_id,
-                    "statusCode": span["status"]["code"],
-                    "statusMessage": span["status"]["message"],
-                    "exceptions": exceptions,
-                    "evaluations": evaluations,
-                    "attributes": span["attributes"],
-                    "logs": [],
-                }
+            return {
+                "traceId": trace_id,
+                "spanId": span_id,
+                "statusCode": span["status"]["code"],
+                "statusMessage": span["status"]["message"],
+                "exceptions": exceptions,
+                "evaluations": evaluations,
+                "attributes": span["attributes"],
+                "logs": [],
+            }
         return {
             "traceId": trace_id,
             "spanId": span_id,
@@ -2097,11 +2218,11 @@ class DemoDataGenerator:
             "logs": [],
         }
 
+    @_memoized
     def get_trace_logs(self, trace_id: str) -> dict[str, Any]:
         """Return synthetic logs for a specific trace."""
-        for trace in self.get_all_traces():
-            if trace["trace_id"] != trace_id:
-                continue
+        trace = self.get_trace(trace_id)
+        if trace is not None:
             logs: list[dict[str, Any]] = []
             for span in trace["spans"]:
                 attrs = span.get("attributes", {})
@@ -2135,12 +2256,12 @@ class DemoDataGenerator:
 
         return {"traceId": trace_id, "logs": []}
 
+    @_memoized
     def get_session_trajectory(self, session_id: str) -> dict[str, Any]:
         """Return the unaggregated chronological trajectory for a session."""
         spans = []
-        for trace in self.get_all_traces():
-            if trace["session_id"] == session_id:
-                spans.extend(trace["spans"])
+        for trace in self.get_session_traces(session_id):
+            spans.extend(trace["spans"])
 
         if not spans:
             return {"sessionId": session_id, "trajectory": []}
@@ -2165,7 +2286,7 @@ class DemoDataGenerator:
             evaluations = []
             is_llm = attrs.get("gen_ai.system") is not None
             if is_llm:
-                rng = self._rng
+                rng = self._call_rng(s["trace_id"], s["span_id"])
                 for metric in ["coherence", "groundedness", "fluency", "safety"]:
                     evaluations.append(
                         {
@@ -0,0 +1,116 @@
+"""Shared, precomputed demo dataset for guest mode.
+
+Guest-mode endpoints used to construct a fresh :class:`DemoDataGenerator` per
+request, regenerating every session, trace and span from seed 42 on each
+dashboard refresh.  This module owns one process-wide generator instead: the
+corpus is generated once, indexed (by session, trace, span, service and
+time) and its endpoint responses are memoized.
+
+Setting ``DEMO_DATASET_SNAPSHOT`` to a file path persists the generated
+corpus as JSON, so later cold starts load it instead of regenerating it.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any
+
+from sre_agent.tools.synthetic.demo_data_generator import DemoDataGenerator
+
+logger = logging.getLogger(__name__)
+
+DEMO_SEED = 42
+SNAPSHOT_ENV_VAR = "DEMO_DATASET_SNAPSHOT"
+# Bump when the generator output changes so stale snapshots are ignored.
+SNAPSHOT_FORMAT_VERSION = 1
+
+_dataset: DemoDataGenerator | None = None
+_lock = threading.Lock()
+
+
+def _encode(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{**r, "timestamp": r["timestamp"].isoformat()} for r in records]
+
+
+def _decode(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{**r, "timestamp": datetime.fromisoformat(r["timestamp"])} for r in records]
+
+
+def save_snapshot(gen: DemoDataGenerator, path: str, seed: int = DEMO_SEED) -> None:
+    """Write the generated corpus to ``path`` atomically."""
+    payload = {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "seed": seed,
+        "sessions": _encode(gen.get_sessions()),
+        "traces": _encode(gen.get_all_traces()),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_snapshot(path: str, seed: int = DEMO_SEED) -> DemoDataGenerator | None:
+    """Load a corpus snapshot, or return None if missing or incompatible."""
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable demo dataset snapshot {path}: {e}")
+        return None
+    if payload.get("version") != SNAPSHOT_FORMAT_VERSION or payload.get("seed") != seed:
+        logger.info(f"Ignoring outdated demo dataset snapshot {path}")
+        return None
+    return DemoDataGenerator.from_corpus(
+        _decode(payload["sessions"]), _decode(payload["traces"]), seed=seed
+    )
+
+
+def _build() -> DemoDataGenerator:
+    path = os.environ.get(SNAPSHOT_ENV_VAR)
+    if path:
+        gen = load_snapshot(path)
+        if gen is not None:
+            logger.info(f"Loaded demo dataset snapshot from {path}")
+            return gen
+
+    gen = DemoDataGenerator(seed=DEMO_SEED)
+    gen.get_all_traces()
+    if path:
+        try:
+            save_snapshot(gen, path)
+            logger.info(f"Saved demo dataset snapshot to {path}")
+        except OSError as e:
+            logger.warning(f"Failed to save demo dataset snapshot to {path}: {e}")
+    return gen
+
+
+def get_demo_dataset() -> DemoDataGenerator:
+    """Return the shared, indexed demo dataset, building it on first use.
+
+    Returned responses are shared between requests and must not be mutated.
+    """
+    global _dataset
+    if _dataset is None:
+        with _lock:
+            if _dataset is None:
+                _dataset = _build()
+    return _dataset
+
+
+def reset_demo_dataset() -> None:
+    """Drop the shared dataset (for testing)."""
+    global _dataset
+    with _lock:
+        _dataset = None
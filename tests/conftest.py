@@ -1,6 +1,7 @@
 """Shared test fixtures for SRE Agent tests."""
 
 import os
+import tempfile
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -27,7 +28,37 @@ def sanitize_environment():
 
     # Use InMemorySessionService for tests to prevent parallel DB locking conflicts
     os.environ["USE_DATABASE_SESSIONS"] = "false"
+
+    # Keep the mistake store in memory so lessons don't leak between runs
+    os.environ["SRE_AGENT_MISTAKE_DB"] = ""
+
+    # Keep discovered telemetry sources in memory for the same reason
+    os.environ["SRE_AGENT_TELEMETRY_CATALOG_DB"] = ""
+
+    # Run cpu-heavy tools in threads; test_execution.py covers the process pool
+    os.environ["SRE_AGENT_CPU_POOL"] = "false"
+
+    # Don't watch the TestClient loop; test_loop_monitor.py covers the monitor
+    os.environ["SRE_AGENT_LOOP_MONITOR"] = "false"
+
+    # Local SQLite files (dashboards, preferences, memory fallback, shared
+    # state) go to a temp dir, never the working tree
+    db_dir = tempfile.mkdtemp(prefix="sre-agent-tests-")
+    os.environ["SRE_AGENT_DASHBOARD_DB"] = os.path.join(db_dir, "dashboards.db")
+    os.environ["SRE_AGENT_PREFERENCES_DB"] = os.path.join(db_dir, "preferences.db")
+    os.environ["SRE_AGENT_MEMORY_DB"] = os.path.join(db_dir, "memory.db")
+    os.environ["SRE_AGENT_SHARED_STATE_PATH"] = os.path.join(db_dir, "shared_state.db")
+    yield
+
+
+@pytest.fixture(autouse=True)
+def fresh_telemetry_catalog():
+    """Start every test with an empty telemetry source catalog."""
+    from sre_agent.services.telemetry_catalog import reset_telemetry_catalog
+
+    reset_telemetry_catalog()
     yield
+    reset_telemetry_catalog()
 
 
 def generate_trace_id() -> str:
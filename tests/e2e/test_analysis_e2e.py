@@ -167,14 +167,15 @@ def test_compare_span_timings_e2e(good_trace_json, bad_trace_json, mock_fetch_tr
     assert root_diff["diff_ms"] > 500  # 1500ms vs normal
 
 
-def test_analyze_trace_patterns_e2e(bad_trace_json, mock_fetch_trace):
+@pytest.mark.asyncio
+async def test_analyze_trace_patterns_e2e(bad_trace_json, mock_fetch_trace):
     """
     Test pattern analysis on a set of bad traces.
     """
     # Simulate multiple bad traces to trigger pattern detection
     traces = [bad_trace_json, bad_trace_json, bad_trace_json]
 
-    res = analyze_trace_patterns(traces, project_id="test-p")
+    res = await analyze_trace_patterns(traces, project_id="test-p")
     assert res.status == ToolStatus.SUCCESS
     data = res.result
 
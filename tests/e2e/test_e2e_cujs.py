@@ -79,14 +79,15 @@ class TestCUJ_IncidentInvestigation:
         assert "entries" in logs
         assert len(logs["entries"]) > 0
 
-    def test_log_pattern_analysis_in_incident(
+    @pytest.mark.asyncio
+    async def test_log_pattern_analysis_in_incident(
         self, baseline_period_logs, incident_period_logs
     ):
         """Test log pattern analysis identifies incident cause."""
         from sre_agent.tools.analysis.logs.patterns import compare_log_patterns
 
         # Compare baseline vs incident logs
-        result = compare_log_patterns(
+        result = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
         )
@@ -190,7 +191,8 @@ class TestCUJ_ErrorDiagnosis:
     6. Agent suggests remediation steps
     """
 
-    def test_error_pattern_detection(self):
+    @pytest.mark.asyncio
+    async def test_error_pattern_detection(self):
         """Test that error patterns are properly detected."""
         from sre_agent.tools.analysis.logs.patterns import analyze_log_anomalies
 
@@ -221,7 +223,7 @@ class TestCUJ_ErrorDiagnosis:
                 }
             )
 
-        result = analyze_log_anomalies(logs, focus_on_errors=True)
+        result = await analyze_log_anomalies(logs, focus_on_errors=True)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -249,7 +251,10 @@ class TestCUJ_ProactiveMonitoring:
     6. Agent provides quick triage summary
     """
 
-    def test_quick_triage_workflow(self, baseline_period_logs, incident_period_logs):
+    @pytest.mark.asyncio
+    async def test_quick_triage_workflow(
+        self, baseline_period_logs, incident_period_logs
+    ):
         """Test the quick triage workflow for alert response."""
         from sre_agent.tools.analysis.logs.patterns import (
             compare_log_patterns,
@@ -257,7 +262,7 @@ class TestCUJ_ProactiveMonitoring:
         )
 
         # Step 1: Quick pattern extraction
-        res = extract_log_patterns(incident_period_logs, max_patterns=10)
+        res = await extract_log_patterns(incident_period_logs, max_patterns=10)
         assert res.status == ToolStatus.SUCCESS
         current_patterns = res.result
 
@@ -266,7 +271,7 @@ class TestCUJ_ProactiveMonitoring:
         assert len(current_patterns["top_patterns"]) <= 10
 
         # Step 2: Compare with baseline
-        res2 = compare_log_patterns(
+        res2 = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
         )
@@ -362,7 +367,8 @@ class TestCUJ_HistoricalComparison:
     5. Agent reports whether behavior is within normal range
     """
 
-    def test_time_period_comparison(self):
+    @pytest.mark.asyncio
+    async def test_time_period_comparison(self):
         """Test comparing two time periods."""
         from sre_agent.tools.analysis.logs.patterns import compare_log_patterns
 
@@ -395,7 +401,7 @@ class TestCUJ_HistoricalComparison:
             )
 
         # Compare periods
-        result = compare_log_patterns(
+        result = await compare_log_patterns(
             baseline_entries_json=baseline_logs,
             comparison_entries_json=current_logs,
         )
@@ -13,7 +13,8 @@ class TestStopButtonCancellation(unittest.IsolatedAsyncioTestCase):
         """
         Verify that:
         1. genui_chat starts a stream.
-        2. When raw_request.is_disconnected() returns True, the agent loop is cancelled.
+        2. When the ASGI receive channel reports http.disconnect, the agent loop
+           is cancelled.
         """
         from starlette.requests import Request
 
@@ -23,7 +24,6 @@ class TestStopButtonCancellation(unittest.IsolatedAsyncioTestCase):
 
         # Mock Request
         mock_raw_request = MagicMock(spec=Request)
-        mock_raw_request.is_disconnected = AsyncMock(return_value=False)
 
         # Mock Session Service
         with (
@@ -50,6 +50,7 @@ class TestStopButtonCancellation(unittest.IsolatedAsyncioTestCase):
             mock_session_service.get_session.return_value = mock_session
             mock_session_service.create_session.return_value = mock_session
             mock_session_service.session_service = AsyncMock()
+            mock_session_service.open_journal = MagicMock(return_value=AsyncMock())
             mock_get_session_service.return_value = mock_session_service
 
             # Setup InvocationContext instance
@@ -81,15 +82,13 @@ class TestStopButtonCancellation(unittest.IsolatedAsyncioTestCase):
             )
 
             # --- CLIENT DISCONNECT SIMULATION ---
-            # Return False a few times, then True to simulate disconnect
-            is_disconnected_responses = [False] * 2 + [True]
+            # The receive channel blocks while the client is connected, then
+            # delivers http.disconnect.
+            async def receive():
+                await asyncio.sleep(0.3)
+                return {"type": "http.disconnect"}
 
-            async def side_effect_is_disconnected():
-                if is_disconnected_responses:
-                    return is_disconnected_responses.pop(0)
-                return True
-
-            mock_raw_request.is_disconnected.side_effect = side_effect_is_disconnected
+            mock_raw_request.receive = receive
 
             # Call Endpoint
             response = await genui_chat(chat_req, mock_raw_request)
@@ -133,6 +133,7 @@ class TestE2EIntegration:
             mock_session.id = "s1"
             mock_session.state = {}
             mock_service.get_session.return_value = mock_session
+            mock_service.open_journal = MagicMock(return_value=AsyncMock())
             mock_get_service.return_value = mock_service
 
             mock_runner = MagicMock()
@@ -155,6 +156,6 @@ class TestE2EIntegration:
             # Verify stream contains rejection
             content = ""
             async for chunk in response.body_iterator:
-                content += chunk
+                content += chunk.decode()
 
             assert "Policy Rejection" in content
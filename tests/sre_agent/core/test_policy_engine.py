@@ -1,11 +1,13 @@
 """Tests for the Policy Engine."""
 
+import copy
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from sre_agent.core.policy_engine import (
+    TOOL_POLICIES,
     PolicyDecision,
     PolicyEngine,
     ToolAccessLevel,
@@ -252,3 +254,98 @@ class TestPolicyDecision:
 
         with pytest.raises(ValidationError):  # Pydantic frozen model
             decision.allowed = False  # type: ignore[misc]
+
+
+class TestCompiledPolicyTable:
+    """Tests for the precompiled decision table."""
+
+    @pytest.fixture
+    def manager(self):
+        """Tool config manager stub with a change version."""
+        mock_manager = MagicMock()
+        mock_manager.version = 1
+        mock_manager.is_enabled.return_value = True
+        with patch(
+            "sre_agent.tools.config.get_tool_config_manager", return_value=mock_manager
+        ):
+            yield mock_manager
+
+    def test_read_only_decision_is_prebuilt(self, manager: MagicMock) -> None:
+        """Read-only tools return the same frozen decision on every call."""
+        engine = PolicyEngine()
+        first = engine.evaluate("fetch_trace", {"trace_id": "a"}, project_id="p")
+        second = engine.evaluate("fetch_trace", {"trace_id": "b"}, project_id="p")
+
+        assert first is second
+        # The config is consulted only while compiling, not per call.
+        assert manager.is_enabled.call_count == len(engine.policies)
+
+    def test_risk_rules_match_nested_arguments(self, manager: MagicMock) -> None:
+        """Risk factors are derived from the call's arguments."""
+        engine = PolicyEngine()
+        plain = engine.evaluate("restart_pod", {"pod_name": "a"}, project_id="p")
+        broad = engine.evaluate(
+            "restart_pod", {"selector": {"scope": ["ALL"]}}, project_id="p"
+        )
+
+        assert plain.risk_assessment is not None
+        assert "multiple resources" not in plain.risk_assessment
+        assert broad.risk_assessment is not None
+        assert "multiple resources" in broad.risk_assessment
+
+    def test_assess_risk_matches_compiled_decision(self, manager: MagicMock) -> None:
+        """The standalone assessment agrees with the compiled table."""
+        engine = PolicyEngine()
+        args = {"pod_name": "a", "force": True}
+        decision = engine.evaluate("restart_pod", args, project_id="p")
+        policy = engine.get_policy("restart_pod")
+        assert policy is not None
+
+        assert decision.risk_assessment == engine._assess_risk(
+            "restart_pod", args, policy
+        )
+
+    def test_table_rebuilt_on_config_change(self, manager: MagicMock) -> None:
+        """Disabling a tool bumps the config version and recompiles the table."""
+        engine = PolicyEngine()
+        before = engine.evaluate("fetch_trace", {}, project_id="p")
+        assert "allowing anyway" not in before.reason
+
+        manager.is_enabled.side_effect = lambda name: name != "fetch_trace"
+        manager.version = 2
+        after = engine.evaluate("fetch_trace", {}, project_id="p")
+
+        assert after.allowed is True
+        assert "allowing anyway" in after.reason
+
+    def test_invalidate_recompiles(self, manager: MagicMock) -> None:
+        """Invalidating picks up changes to the policy registry."""
+        engine = PolicyEngine(policies=dict(TOOL_POLICIES))
+        engine.evaluate("fetch_trace", {}, project_id="p")
+        engine.policies["custom_tool"] = ToolPolicy(
+            name="custom_tool",
+            access_level=ToolAccessLevel.WRITE,
+            category=ToolCategory.MUTATION,
+            description="Custom",
+        )
+        assert "Unknown tool" in engine.evaluate("custom_tool", {}).reason
+
+        engine.invalidate()
+        assert engine.evaluate("custom_tool", {}).requires_approval is True
+
+    def test_table_is_read_only(self, manager: MagicMock) -> None:
+        """The compiled table cannot be mutated."""
+        table = PolicyEngine().compile()
+        with pytest.raises(TypeError):
+            table.entries["fetch_trace"] = table.entries["list_traces"]  # type: ignore[index]
+
+    def test_compiled_engine_is_deepcopyable(self, manager: MagicMock) -> None:
+        """Deployment deep-copies the agent, including its policy engine."""
+        engine = PolicyEngine()
+        decision = engine.evaluate("fetch_trace", {}, project_id="p")
+
+        clone = copy.deepcopy(engine)
+
+        assert clone._table is None
+        assert clone.evaluate("fetch_trace", {}, project_id="p") == decision
+        assert clone._compile_lock is not engine._compile_lock
@@ -180,6 +180,19 @@ class TestPromptComposer:
         text = content.parts[0].text
         assert "Learned Lessons" not in text
 
+    def test_compose_developer_role_with_telemetry_sources(
+        self, composer: PromptComposer
+    ) -> None:
+        """Test composing developer role with catalogued telemetry sources."""
+        domain_context = DomainContext(
+            telemetry_sources="Traces: my-project.traces._AllSpans"
+        )
+        content = composer.compose_developer_role(domain_context)
+
+        text = content.parts[0].text
+        assert "### Telemetry Sources" in text
+        assert "my-project.traces._AllSpans" in text
+
     def test_compose_user_role_simple(self, composer: PromptComposer) -> None:
         """Test composing user role with simple message."""
         content = composer.compose_user_role(
@@ -6,146 +6,53 @@ from sre_agent.api.helpers.bq_discovery import (
     get_linked_log_dataset,
     get_linked_trace_dataset,
 )
+from sre_agent.services.telemetry_catalog import DiscoveryError, TelemetrySources
 
 
 @pytest.fixture
-def mock_httpx_client():
-    with patch("httpx.AsyncClient") as mock:
-        mock.return_value = AsyncMock()
-        yield mock
-
-
-@pytest.fixture
-def mock_google_auth():
-    with patch("google.auth.default") as mock_default:
-        mock_creds = MagicMock()
-        mock_creds.token = "fake-token"
-        mock_default.return_value = (mock_creds, "project-id")
-        yield mock_default
+def mock_catalog():
+    catalog = MagicMock()
+    catalog.get = AsyncMock(
+        return_value=TelemetrySources(
+            project_id="project-123",
+            principal="adc",
+            log_dataset="my_logs",
+            trace_dataset="my_traces",
+        )
+    )
+    with patch(
+        "sre_agent.api.helpers.bq_discovery.get_telemetry_catalog",
+        return_value=catalog,
+    ):
+        yield catalog
 
 
 @pytest.mark.asyncio
-async def test_get_linked_log_dataset_success(mock_httpx_client, mock_google_auth):
-    mock_client_instance = mock_httpx_client.return_value.__aenter__.return_value
-    mock_client_instance.get.return_value = MagicMock(
-        status_code=200,
-        json=lambda: {
-            "links": [
-                {
-                    "bigqueryDataset": {
-                        "datasetId": "bigquery.googleapis.com/projects/p/datasets/my_logs"
-                    }
-                }
-            ]
-        },
-    )
-
+async def test_get_linked_log_dataset_success(mock_catalog):
     result = await get_linked_log_dataset("project-123")
-    assert result == "my_logs"
 
-    # Verify URL
-    assert "logging.googleapis.com" in mock_client_instance.get.call_args[0][0]
-    assert "_Default/links" in mock_client_instance.get.call_args[0][0]
+    assert result == "my_logs"
+    mock_catalog.get.assert_awaited_once_with("project-123")
 
 
 @pytest.mark.asyncio
-async def test_get_linked_trace_dataset_success(mock_httpx_client, mock_google_auth):
-    mock_client_instance = mock_httpx_client.return_value.__aenter__.return_value
-
-    # Configure responses for list buckets and then list links
-    # 1. List buckets for global (empty)
-    # 2. List buckets for us (contains one)
-    # 3. List links for that one bucket
-
-    responses = [
-        MagicMock(status_code=200, json=lambda: {"buckets": []}),  # global list
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "buckets": [{"name": "projects/p/locations/us/buckets/trace-bucket"}]
-            },
-        ),  # us list
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "links": [
-                    {
-                        "bigqueryDataset": {
-                            "datasetId": "bigquery.googleapis.com/projects/p/datasets/trace_data"
-                        }
-                    }
-                ]
-            },
-        ),  # link list
-    ]
-    mock_client_instance.get.side_effect = responses
-
+async def test_get_linked_trace_dataset_success(mock_catalog):
     result = await get_linked_trace_dataset("project-123")
-    assert result == "trace_data"
-
-    # Verify we hit the observability API
-    # Call 1: global buckets
-    # Call 2: us buckets
-    # Call 3: datasets/Spans/links
-    assert mock_client_instance.get.call_count == 3
-    assert (
-        "observability.googleapis.com"
-        in mock_client_instance.get.call_args_list[2][0][0]
-    )
-    assert (
-        "trace-bucket/datasets/Spans/links"
-        in mock_client_instance.get.call_args_list[2][0][0]
-    )
+
+    assert result == "my_traces"
 
 
 @pytest.mark.asyncio
-async def test_get_linked_trace_dataset_logging_scan(
-    mock_httpx_client, mock_google_auth
-):
-    mock_client_instance = mock_httpx_client.return_value.__aenter__.return_value
-
-    # 1. List buckets -> returns one
-    # 2. Get links for that bucket -> returns a trace-like link
-    responses = [
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "buckets": [
-                    {"name": "projects/p/locations/global/buckets/trace-bucket"}
-                ]
-            },
-        ),
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "links": [
-                    {
-                        "name": "projects/p/locations/global/buckets/trace-bucket/links/my-traces",
-                        "bigqueryDataset": {
-                            "datasetId": "bigquery.googleapis.com/projects/p/datasets/traces"
-                        },
-                    }
-                ]
-            },
-        ),
-    ]
-    mock_client_instance.get.side_effect = responses
+async def test_get_linked_trace_dataset_not_found(mock_catalog):
+    mock_catalog.get.return_value = TelemetrySources("project-123", "adc")
 
-    result = await get_linked_trace_dataset("project-123")
-    assert result == "traces"
+    assert await get_linked_trace_dataset("project-123") is None
+    assert await get_linked_log_dataset("project-123") is None
 
 
 @pytest.mark.asyncio
-async def test_get_linked_trace_dataset_fallback(mock_httpx_client, mock_google_auth):
-    mock_client_instance = mock_httpx_client.return_value.__aenter__.return_value
-    # All API calls return empty
-    mock_client_instance.get.return_value = MagicMock(status_code=200, json=lambda: {})
-
-    with patch("google.cloud.bigquery.Client") as mock_bq:
-        mock_bq_instance = mock_bq.return_value
-        # Mock traces._AllSpans working
-        mock_bq_instance.get_table.return_value = MagicMock()
-
-        result = await get_linked_trace_dataset("project-123")
-        assert result == "traces"
-        mock_bq_instance.get_table.assert_called_with("project-123.traces._AllSpans")
+async def test_discovery_failure_returns_none(mock_catalog):
+    mock_catalog.get.side_effect = DiscoveryError("denied", "PERMISSION_DENIED")
+
+    assert await get_linked_log_dataset("project-123") is None
+    assert await get_linked_trace_dataset("project-123") is None
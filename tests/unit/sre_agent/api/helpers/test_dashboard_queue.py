@@ -9,7 +9,9 @@ from __future__ import annotations
 import contextvars
 
 from sre_agent.api.helpers.dashboard_queue import (
+    close_dashboard_queue,
     drain_dashboard_queue,
+    get_dashboard_event_bus,
     init_dashboard_queue,
     queue_tool_result,
 )
@@ -132,3 +134,37 @@ class TestInitDashboardQueue:
         queue_tool_result("tool", "val")
         items = drain_dashboard_queue()
         assert items == [("tool", "val")]
+
+
+class TestDashboardQueueLifecycle:
+    """Tests for bounding and cleanup of per-request queues."""
+
+    def test_close_discards_pending_results(self) -> None:
+        init_dashboard_queue()
+        queue_tool_result("tool", "val")
+
+        close_dashboard_queue()
+
+        assert drain_dashboard_queue() == []
+        queue_tool_result("after_close", "ignored")
+        assert drain_dashboard_queue() == []
+
+    def test_copied_context_publishes_to_same_queue_after_drain(self) -> None:
+        """Sub-agent tasks run in context copies taken before the drain."""
+        init_dashboard_queue()
+        child = contextvars.copy_context()
+        assert drain_dashboard_queue() == []
+
+        child.run(queue_tool_result, "sub_agent_tool", {"ok": True})
+
+        assert drain_dashboard_queue() == [("sub_agent_tool", {"ok": True})]
+
+    def test_queue_is_bounded(self) -> None:
+        init_dashboard_queue()
+        limit = get_dashboard_event_bus().config.max_events_per_session
+        for i in range(limit + 10):
+            queue_tool_result("chatty_tool", i)
+
+        items = drain_dashboard_queue()
+        assert len(items) == limit
+        assert items[-1] == ("chatty_tool", limit + 9)
@@ -0,0 +1,147 @@
+"""Tests for the bounded per-session event bus."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+from sre_agent.api.helpers.event_bus import (
+    EventBusConfig,
+    OverflowPolicy,
+    SessionEventBus,
+)
+
+
+def _bus(**kwargs: object) -> SessionEventBus[str]:
+    return SessionEventBus("test", EventBusConfig(**kwargs))  # type: ignore[arg-type]
+
+
+class TestBoundsAndOverflow:
+    """Tests for bounded buffers and drop policies."""
+
+    def test_drop_oldest_keeps_latest_events(self) -> None:
+        bus = _bus(max_events_per_session=3)
+        for i in range(5):
+            bus.publish("s1", f"e{i}")
+
+        assert bus.drain("s1") == ["e2", "e3", "e4"]
+        assert bus.stats()["dropped"] == 2
+
+    def test_drop_newest_rejects_incoming_events(self) -> None:
+        bus = _bus(max_events_per_session=2, overflow=OverflowPolicy.DROP_NEWEST)
+        results = [bus.publish("s1", f"e{i}") for i in range(3)]
+
+        assert results == [True, True, False]
+        assert bus.drain("s1") == ["e0", "e1"]
+
+    def test_drain_empties_the_buffer(self) -> None:
+        bus = _bus()
+        bus.publish("s1", "a")
+
+        assert bus.drain("s1") == ["a"]
+        assert bus.drain("s1") == []
+        assert bus.drain("unknown") == []
+
+    def test_high_rate_producers_stay_bounded(self) -> None:
+        bus = _bus(max_events_per_session=50)
+
+        def produce(worker: int) -> None:
+            for i in range(2000):
+                bus.publish(f"session-{worker % 2}", f"{worker}:{i}")
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = bus.stats()
+        assert stats["published"] == 16_000
+        assert stats["max_depth"] == 50
+        assert stats["dropped"] == 16_000 - 2 * 50
+        assert len(bus.drain("session-0")) == 50
+
+
+class TestCoalescing:
+    """Tests for latest-wins coalescing."""
+
+    def test_same_key_replaces_pending_event(self) -> None:
+        bus: SessionEventBus[tuple[str, int]] = SessionEventBus(
+            "test", EventBusConfig(), coalesce_key=lambda e: e[0]
+        )
+        bus.publish("s1", ("cpu", 1))
+        bus.publish("s1", ("mem", 1))
+        bus.publish("s1", ("cpu", 2))
+
+        assert bus.drain("s1") == [("mem", 1), ("cpu", 2)]
+        assert bus.stats()["coalesced"] == 1
+
+    def test_none_key_never_coalesces(self) -> None:
+        bus: SessionEventBus[str] = SessionEventBus(
+            "test", EventBusConfig(), coalesce_key=lambda e: None
+        )
+        bus.publish("s1", "a")
+        bus.publish("s1", "a")
+
+        assert bus.drain("s1") == ["a", "a"]
+
+
+class TestFanOut:
+    """Tests for multiple subscribers per session."""
+
+    def test_each_subscriber_gets_every_event(self) -> None:
+        bus = _bus()
+        first = bus.subscribe("s1")
+        second = bus.subscribe("s1")
+        bus.publish("s1", "a")
+        bus.publish("s1", "b")
+
+        assert bus.drain("s1", first) == ["a", "b"]
+        assert bus.drain("s1", second) == ["a", "b"]
+        assert bus.drain("s1") == ["a", "b"]
+
+    def test_unsubscribed_buffer_is_released(self) -> None:
+        bus = _bus()
+        subscriber = bus.subscribe("s1")
+        bus.unsubscribe("s1", subscriber)
+        bus.publish("s1", "a")
+
+        assert bus.drain("s1", subscriber) == []
+        assert bus.stats()["pending"] == 1
+
+
+class TestExpiry:
+    """Tests for TTL and LRU cleanup of orphaned sessions."""
+
+    def test_idle_sessions_expire(self) -> None:
+        bus = _bus(session_ttl_seconds=60)
+        with patch("sre_agent.api.helpers.event_bus.time.monotonic") as clock:
+            clock.return_value = 0.0
+            bus.publish("abandoned", "a")
+            clock.return_value = 30.0
+            bus.publish("active", "b")
+            clock.return_value = 61.0
+            bus.publish("active", "c")
+
+        assert bus.drain("abandoned") == []
+        assert bus.drain("active") == ["b", "c"]
+        assert bus.stats()["expired"] == 1
+
+    def test_least_recently_active_session_is_evicted(self) -> None:
+        bus = _bus(max_sessions=2)
+        bus.publish("s1", "a")
+        bus.publish("s2", "b")
+        bus.publish("s1", "c")
+        bus.publish("s3", "d")
+
+        assert bus.stats()["sessions"] == 2
+        assert bus.drain("s2") == []
+        assert bus.drain("s1") == ["a", "c"]
+
+    def test_close_session_discards_events(self) -> None:
+        bus = _bus()
+        bus.publish("s1", "a")
+        bus.close_session("s1")
+
+        assert bus.drain("s1") == []
+        assert bus.stats()["sessions"] == 0
@@ -180,6 +180,42 @@ class TestMemoryEventBus:
 
         assert len(events) == 0
 
+    @pytest.mark.asyncio
+    async def test_tool_tracking_events_are_coalesced(self) -> None:
+        """Only the latest tool-tracking toast per session is kept."""
+        bus = MemoryEventBus()
+
+        for i in range(1, 4):
+            await bus.emit("tracked", create_tool_tracking_event(f"tool_{i}", i))
+        await bus.emit(
+            "tracked", create_failure_learning_event("t", "invalid filter", "lesson")
+        )
+
+        events = [evt async for evt in bus.drain_events("tracked")]
+
+        assert [e.action for e in events] == [
+            MemoryAction.TOOL_TRACKED,
+            MemoryAction.STORED,
+        ]
+        assert events[0].tool_name == "tool_3"
+        assert bus.stats()["coalesced"] == 2
+
+    def test_emit_sync_without_event_loop(self) -> None:
+        """emit_sync publishes directly, even outside an event loop."""
+        bus = MemoryEventBus()
+
+        bus.emit_sync(
+            "sync-session",
+            MemoryEvent(
+                action=MemoryAction.STORED,
+                category=MemoryCategory.SUCCESS,
+                title="Sync",
+                description="Test",
+            ),
+        )
+
+        assert bus.stats()["pending"] == 1
+
 
 class TestEventCreationHelpers:
     """Tests for event creation helper functions."""
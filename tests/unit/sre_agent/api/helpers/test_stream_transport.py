@@ -0,0 +1,228 @@
+"""Tests for the NDJSON chat stream transport."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.adk.events import Event
+from google.genai import types
+
+from sre_agent.api.helpers.stream_transport import (
+    NDJSONStream,
+    PartKind,
+    StreamTransportConfig,
+    cancel_on_disconnect,
+    encode_event,
+    normalize_event,
+    with_flush_deadlines,
+)
+
+
+def _frames(chunk: bytes | None) -> list[dict]:
+    assert chunk is not None
+    return [json.loads(line) for line in chunk.decode().splitlines()]
+
+
+class TestNormalizeEvent:
+    """Tests for converting runner events into typed parts."""
+
+    def test_adk_event_parts(self) -> None:
+        event = Event(
+            author="sre_agent",
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part.from_text(text="Checking traces"),
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id="fc-1", name="fetch_trace", args={"trace_id": "t1"}
+                        )
+                    ),
+                    types.Part(
+                        function_response=types.FunctionResponse(
+                            id="fc-1", name="fetch_trace", response={"spans": 3}
+                        )
+                    ),
+                ],
+            ),
+        )
+
+        parts = normalize_event(event)
+
+        assert [p.kind for p in parts] == [
+            PartKind.TEXT,
+            PartKind.TOOL_CALL,
+            PartKind.TOOL_RESPONSE,
+        ]
+        assert parts[0].text == "Checking traces"
+        assert parts[1].tool_name == "fetch_trace"
+        assert parts[1].args == {"trace_id": "t1"}
+        assert parts[2].result == {"spans": 3}
+        assert parts[2].call_id == "fc-1"
+
+    def test_dict_event_with_thought(self) -> None:
+        event = {"content": {"parts": [{"text": "hi", "thought": "plan first"}]}}
+
+        parts = normalize_event(event)
+
+        assert [(p.kind, p.text) for p in parts] == [
+            (PartKind.TEXT, "hi"),
+            (PartKind.THOUGHT, "plan first"),
+        ]
+
+    def test_direct_function_response_attribute(self) -> None:
+        event = MagicMock(spec=["content", "function_call", "function_response"])
+        event.content = None
+        event.function_call = None
+        event.function_response = {"name": "list_alerts", "result": ["a1"]}
+
+        (part,) = normalize_event(event)
+
+        assert part.kind is PartKind.TOOL_RESPONSE
+        assert part.result == ["a1"]
+
+    def test_unrecognised_shapes_yield_nothing(self) -> None:
+        assert normalize_event(MagicMock()) == []
+        assert normalize_event(Event(author="sre_agent")) == []
+
+
+class TestNDJSONStream:
+    """Tests for frame encoding and text coalescing."""
+
+    def test_frames_keep_order_and_merge_text(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig())
+        stream.write_text("Hello ")
+        stream.write_text("world")
+        stream.write({"type": "tool_call", "tool_name": "fetch_trace"})
+        stream.write_line('{"type": "memory"}')
+
+        frames = _frames(stream.take())
+
+        assert frames == [
+            {"type": "text", "content": "Hello world"},
+            {"type": "tool_call", "tool_name": "fetch_trace"},
+            {"type": "memory"},
+        ]
+        assert stream.take() is None
+        assert stream.stats()["coalesced"] == 1
+
+    def test_partial_text_is_held_within_window(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=50))
+        clock = "sre_agent.api.helpers.stream_transport.time.monotonic"
+        with patch(clock, return_value=10.0):
+            stream.write_text("a")
+            assert stream.take(final=False) is None
+        with patch(clock, return_value=10.02):
+            stream.write_text("b")
+            assert stream.take(final=False) is None
+        with patch(clock, return_value=10.06):
+            frames = _frames(stream.take(final=False))
+
+        assert frames == [{"type": "text", "content": "ab"}]
+
+    def test_zero_window_flushes_every_event(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=0))
+        stream.write_text("a")
+
+        assert _frames(stream.take(final=False)) == [{"type": "text", "content": "a"}]
+
+    def test_large_pending_text_is_flushed(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(max_text_chars=4))
+        stream.write_text("abcd")
+        stream.write_text("e")
+
+        assert _frames(stream.take()) == [
+            {"type": "text", "content": "abcd"},
+            {"type": "text", "content": "e"},
+        ]
+
+    def test_non_ascii_is_utf8_encoded(self) -> None:
+        assert encode_event({"content": "p99 ↑ 40%"}) == (
+            '{"content":"p99 ↑ 40%"}\n'.encode()
+        )
+
+
+class TestFlushDeadlines:
+    """Tests for flushing held text when no event arrives in time."""
+
+    @pytest.mark.asyncio
+    async def test_held_text_is_flushed_while_waiting_for_next_event(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=20))
+        release = asyncio.Event()
+
+        async def events():
+            yield "partial"
+            await release.wait()
+            yield "final"
+
+        seen = []
+        async for event in with_flush_deadlines(events(), stream):
+            seen.append(event)
+            if event == "partial":
+                stream.write_text("held")
+                assert stream.take(final=False) is None
+            elif event is None:
+                assert _frames(stream.take(final=False)) == [
+                    {"type": "text", "content": "held"}
+                ]
+                release.set()
+
+        assert seen == ["partial", None, "final"]
+
+    @pytest.mark.asyncio
+    async def test_no_wakeups_without_held_text(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=1))
+
+        async def events():
+            yield 1
+            await asyncio.sleep(0.02)
+            yield 2
+
+        assert [e async for e in with_flush_deadlines(events(), stream)] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_source_errors_propagate(self) -> None:
+        stream = NDJSONStream(StreamTransportConfig(text_flush_window_ms=20))
+
+        async def events():
+            yield 1
+            raise RuntimeError("runner failed")
+
+        seen = []
+        with pytest.raises(RuntimeError, match="runner failed"):
+            async for event in with_flush_deadlines(events(), stream):
+                seen.append(event)
+        assert seen == [1]
+
+
+class TestCancelOnDisconnect:
+    """Tests for event-driven disconnect detection."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_message_cancels_task(self) -> None:
+        messages = iter([{"type": "http.request"}, {"type": "http.disconnect"}])
+        request = MagicMock()
+
+        async def receive() -> dict:
+            await asyncio.sleep(0)
+            return next(messages)
+
+        request.receive = receive
+        target = asyncio.create_task(asyncio.sleep(10))
+
+        await cancel_on_disconnect(request, target, "session s1")
+
+        with pytest.raises(asyncio.CancelledError):
+            await target
+
+    @pytest.mark.asyncio
+    async def test_unusable_receive_channel_is_ignored(self) -> None:
+        request = MagicMock()
+        request.receive = MagicMock(side_effect=RuntimeError("no channel"))
+        target = asyncio.create_task(asyncio.sleep(0))
+
+        await cancel_on_disconnect(request, target, "session s1")
+
+        await target
+        assert not target.cancelled()
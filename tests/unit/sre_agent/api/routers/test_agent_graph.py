@@ -1,5 +1,7 @@
 """Tests for the agent graph topology and trajectory endpoints."""
 
+import json
+from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,6 +20,20 @@ from sre_agent.api.routers.agent_graph import (
     router,
 )
 
+WATERMARK = datetime(2026, 3, 1, 9, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def rollup_maintainer():
+    """Stub the rollup maintainer so topology never reads a real watermark."""
+    maintainer = MagicMock()
+    maintainer.get_watermark.return_value = WATERMARK
+    with patch(
+        "sre_agent.api.routers.agent_graph.get_rollup_maintainer",
+        return_value=maintainer,
+    ):
+        yield maintainer
+
 
 @pytest.fixture
 def client() -> TestClient:
@@ -150,6 +166,53 @@ class TestTopologyEndpoint:
         assert len(data["nodes"]) == 1
         assert len(data["edges"]) == 1
 
+    @patch("sre_agent.api.routers.agent_graph._get_bq_client")
+    def test_hourly_path_splits_at_backend_watermark(
+        self,
+        mock_client_fn: MagicMock,
+        client: TestClient,
+        rollup_maintainer: MagicMock,
+    ) -> None:
+        """The rollup/raw boundary is the watermark read from the backend."""
+        bq = MagicMock()
+        mock_client_fn.return_value = bq
+        bq.query_and_wait.return_value = _mock_query_result([])
+
+        client.get(
+            "/api/v1/graph/topology",
+            params={"project_id": "test-project", "hours": 24},
+        )
+
+        rollup_maintainer.get_watermark.assert_called()
+        queries = [c.args[0] for c in bq.query_and_wait.call_args_list]
+        assert all(
+            "time_bucket < TIMESTAMP('2026-03-01 09:00:00 UTC')" in q for q in queries
+        )
+
+    @patch("sre_agent.api.routers.agent_graph._get_bq_client")
+    def test_hourly_path_reads_raw_without_watermark(
+        self,
+        mock_client_fn: MagicMock,
+        client: TestClient,
+        rollup_maintainer: MagicMock,
+    ) -> None:
+        """An unknown watermark must not hide closed but unmerged hours."""
+        bq = MagicMock()
+        mock_client_fn.return_value = bq
+        bq.query_and_wait.return_value = _mock_query_result([])
+        rollup_maintainer.get_watermark.side_effect = RuntimeError("no state table")
+
+        resp = client.get(
+            "/api/v1/graph/topology",
+            params={"project_id": "test-project", "hours": 24},
+        )
+
+        assert resp.status_code == 200
+        queries = [c.args[0] for c in bq.query_and_wait.call_args_list]
+        assert queries
+        assert not any("agent_graph_hourly" in q for q in queries)
+        assert all("agent_topology_edges" in q for q in queries)
+
     @patch("sre_agent.api.routers.agent_graph._get_bq_client")
     def test_node_format_react_flow(
         self, mock_client_fn: MagicMock, client: TestClient
@@ -2351,9 +2414,14 @@ class TestLogDatasetDiscovery:
     @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
     @patch("google.auth.default")
     @patch("google.auth.transport.requests.Request")
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
     @pytest.mark.anyio
     async def test_discovers_dataset_from_logging_api(
-        self, mock_request: MagicMock, mock_auth: MagicMock, mock_get: AsyncMock
+        self,
+        mock_request: MagicMock,
+        mock_auth: MagicMock,
+        mock_get: AsyncMock,
+        anyio_backend: str,
     ) -> None:
         from sre_agent.api.routers.agent_graph import get_linked_log_dataset
 
@@ -2366,16 +2434,16 @@ class TestLogDatasetDiscovery:
         }
         mock_get.return_value = mock_resp
 
-        # Cache is bypassed automatically in pytest
-
-        dataset = await get_linked_log_dataset("test-project")
+        with patch(
+            "sre_agent.services.telemetry_catalog._resolve_token",
+            return_value="fake-token",
+        ):
+            dataset = await get_linked_log_dataset("test-project")
         assert dataset == "my_logs"
 
         # Verify the URL
-        url = mock_get.call_args[0][0]
-        assert "locations/global/buckets/_Default/links" in url
-
-        # Verify the URL
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        assert any("locations/global/buckets/_Default/links" in u for u in urls)
 
 
 class TestSessionTrajectoryEndpoint:
@@ -2466,3 +2534,51 @@ class TestSessionTrajectoryEndpoint:
     ) -> None:
         resp = client.get("/api/v1/graph/session/session-123/trajectory")
         assert resp.status_code == 422
+
+    @patch("sre_agent.api.routers.agent_graph._get_bq_client")
+    @patch("sre_agent.tools.clients.logging._list_log_entries_sync")
+    @patch("sre_agent.tools.clients.trace._fetch_trace_sync")
+    def test_stream_emits_ndjson_events(
+        self,
+        mock_fetch_trace: MagicMock,
+        mock_list_logs: MagicMock,
+        mock_bq_client_fn: MagicMock,
+        client: TestClient,
+    ) -> None:
+        """Streaming endpoint should emit the skeleton, trace updates, then complete."""
+        bq = MagicMock()
+        mock_bq_client_fn.return_value = bq
+        bq.query_and_wait.return_value = _mock_query_result(
+            [
+                _make_row(
+                    trace_id="test-trace-2",
+                    span_id="span-456",
+                    parent_id=None,
+                    start_time=None,
+                    node_type="Tool",
+                    node_label="fetch_logs",
+                    duration_ms=5.0,
+                    status_code=0,
+                    status_desc=None,
+                    input_tokens=None,
+                    output_tokens=None,
+                    request_model=None,
+                )
+            ]
+        )
+        mock_fetch_trace.return_value = {
+            "spans": [{"span_id": "span-456", "labels": {"tool.input": "{}"}}]
+        }
+        mock_list_logs.return_value = {"entries": []}
+
+        resp = client.get(
+            "/api/v1/graph/session/session-456/trajectory/stream",
+            params={"project_id": "test-project"},
+        )
+
+        assert resp.status_code == 200
+        events = [json.loads(line) for line in resp.text.splitlines() if line]
+        assert [e["type"] for e in events] == ["spans", "trace", "complete"]
+        assert events[0]["trajectory"][0]["toolInput"] is None
+        assert events[1]["steps"][0]["toolInput"] == "{}"
+        assert events[2]["sessionId"] == "session-456"
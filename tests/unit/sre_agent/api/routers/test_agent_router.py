@@ -23,6 +23,7 @@ def mock_agent_deps():
         ) as m_suggest,
     ):
         session_service = AsyncMock()
+        session_service.open_journal = MagicMock(return_value=AsyncMock())
         m_session.return_value = session_service
         m_remote.return_value = False
         m_suggest.return_value = ["suggest1"]
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from sre_agent.api.routers.dashboards import router
+from sre_agent.services.dashboard_store import DashboardConflictError
 
 
 @pytest.fixture()
@@ -233,6 +234,64 @@ class TestDashboardRouter:
         )
         assert response.status_code == 200
 
+    @patch("sre_agent.api.routers.dashboards.get_dashboard_service")
+    def test_stale_panel_edit_returns_409(
+        self, mock_get_service: Any, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        mock_service.add_panel.side_effect = DashboardConflictError("d1", 1, 3)
+        mock_get_service.return_value = mock_service
+        response = client.post(
+            "/api/dashboards/d1/panels",
+            json={"title": "New Panel", "expected_version": 1},
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"]["current_version"] == 3
+        assert mock_service.add_panel.await_args.kwargs["expected_version"] == 1
+
+    @patch("sre_agent.api.routers.dashboards.get_dashboard_service")
+    def test_list_dashboards_bad_page_token_returns_400(
+        self, mock_get_service: Any, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        mock_service.list_dashboards.side_effect = ValueError("Invalid page token")
+        mock_get_service.return_value = mock_service
+        response = client.get("/api/dashboards?page_token=bogus")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("page_size", [0, -1, 201])
+    @patch("sre_agent.api.routers.dashboards.get_dashboard_service")
+    def test_list_dashboards_out_of_range_page_size_returns_422(
+        self,
+        mock_get_service: Any,
+        page_size: int,
+        client: TestClient,
+        mock_service: AsyncMock,
+    ) -> None:
+        mock_get_service.return_value = mock_service
+        response = client.get(f"/api/dashboards?page_size={page_size}")
+        assert response.status_code == 422
+        mock_service.list_dashboards.assert_not_called()
+
+    @patch("sre_agent.api.routers.dashboards.get_dashboard_service")
+    def test_panel_data_returns_200(
+        self, mock_get_service: Any, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        mock_service.resolve_panel_data.return_value = {"panels": {}, "stats": {}}
+        mock_get_service.return_value = mock_service
+        response = client.post("/api/dashboards/d1/data", json={"minutes_ago": 30})
+        assert response.status_code == 200
+        mock_service.resolve_panel_data.assert_awaited_once_with(
+            "d1", project_id=None, minutes_ago=30
+        )
+
+    @patch("sre_agent.api.routers.dashboards.get_dashboard_service")
+    def test_panel_data_not_found_returns_404(
+        self, mock_get_service: Any, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        mock_service.resolve_panel_data.return_value = None
+        mock_get_service.return_value = mock_service
+        response = client.post("/api/dashboards/missing/data")
+        assert response.status_code == 404
+
 
 class TestTemplateRouter:
     """Tests for OOTB template endpoints."""
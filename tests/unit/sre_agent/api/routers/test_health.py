@@ -175,3 +175,56 @@ class TestRouterConfiguration:
         """The /api/debug route should be registered."""
         paths = [route.path for route in router.routes]
         assert "/api/debug" in paths
+
+
+class TestReadinessEndpoint:
+    """Tests for GET /ready."""
+
+    def test_not_ready_until_warm_up_finishes(self, client: TestClient) -> None:
+        """Readiness should be 503 with per-task progress until warm-up is done."""
+        from sre_agent.core.startup import (
+            StartupConfig,
+            StartupOrchestrator,
+            TaskState,
+            WarmUpTask,
+        )
+
+        orchestrator = StartupOrchestrator(StartupConfig())
+        orchestrator.add(WarmUpTask("agents", lambda: None))
+        with patch(
+            "sre_agent.core.startup.get_startup_orchestrator",
+            return_value=orchestrator,
+        ):
+            response = client.get("/ready")
+            assert response.status_code == 503
+            assert response.json()["tasks"]["agents"]["state"] == "pending"
+
+            orchestrator.tasks["agents"].state = TaskState.READY
+            response = client.get("/ready")
+            assert response.status_code == 200
+            assert response.json()["ready"] is True
+
+
+class TestDebugLoopEndpoint:
+    """Tests for GET /api/debug/loop."""
+
+    def test_lists_top_blockers(self, client: TestClient) -> None:
+        """The endpoint should report the monitor's blockers, worst first."""
+        from sre_agent.core.loop_monitor import (
+            LoopMonitor,
+            LoopMonitorConfig,
+        )
+
+        monitor = LoopMonitor(LoopMonitorConfig(threshold_ms=100), export=False)
+        monitor._record_lag(150.0)
+        monitor._record_lag(20.0)
+        with patch(
+            "sre_agent.core.loop_monitor.get_loop_monitor", return_value=monitor
+        ):
+            data = client.get("/api/debug/loop", params={"limit": 5}).json()
+
+        assert data["running"] is False
+        assert data["stalls"] == 1
+        assert data["lag_ms"]["samples"] == 2
+        assert data["top_blockers"][0]["blocker"] == "unattributed"
+        assert data["recent_stalls"][0]["duration_ms"] == 150.0
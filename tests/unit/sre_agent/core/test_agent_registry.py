@@ -0,0 +1,132 @@
+"""Tests for the lazy agent registry."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import sre_agent
+from sre_agent.core.agent_registry import AgentRegistry
+
+
+def test_builds_on_first_get_and_memoizes() -> None:
+    registry = AgentRegistry()
+    calls: list[str] = []
+    registry.register("a", lambda: calls.append("a") or object())
+
+    assert not registry.is_built("a")
+    first = registry.get("a")
+    assert registry.get("a") is first
+    assert calls == ["a"]
+    assert "a" in registry.stats()["built"]
+
+
+def test_factories_can_depend_on_other_agents() -> None:
+    registry = AgentRegistry()
+    registry.register("child", lambda: {"name": "child"})
+    registry.register("parent", lambda: {"children": [registry.get("child")]})
+
+    parent = registry.get("parent")
+    assert parent["children"][0] is registry.get("child")
+
+
+def test_circular_dependency_is_reported() -> None:
+    registry = AgentRegistry()
+    registry.register("a", lambda: registry.get("b"))
+    registry.register("b", lambda: registry.get("a"))
+
+    with pytest.raises(RuntimeError, match="Circular"):
+        registry.get("a")
+
+
+def test_failures_are_not_memoized() -> None:
+    registry = AgentRegistry()
+    attempts = []
+
+    def flaky() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("boom")
+        return "ok"
+
+    registry.register("flaky", flaky)
+    with pytest.raises(ConnectionError):
+        registry.get("flaky")
+    assert registry.failures == {"flaky": "boom"}
+    assert registry.get("flaky") == "ok"
+    assert registry.failures == {}
+
+
+def test_concurrent_gets_build_once() -> None:
+    registry = AgentRegistry()
+    calls = []
+
+    def slow() -> object:
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    registry.register("slow", slow)
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("slow")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_unknown_and_duplicate_names() -> None:
+    registry = AgentRegistry()
+    registry.register("a", object)
+    with pytest.raises(KeyError):
+        registry.get("missing")
+    with pytest.raises(ValueError):
+        registry.register("a", object)
+    first = registry.get("a")
+    registry.register("a", object, replace=True)
+    assert registry.get("a") is not first
+
+
+@pytest.mark.asyncio()
+async def test_warm_up_builds_everything_and_skips_failures() -> None:
+    registry = AgentRegistry()
+    registry.register("good", object)
+    registry.register("bad", lambda: 1 / 0)
+
+    timings = await registry.awarm_up()
+
+    assert list(timings) == ["good"]
+    assert registry.is_built("good")
+    assert "bad" in registry.failures
+    assert await registry.awarm_up(["good"]) == {}
+
+
+def test_importing_agent_module_defers_agents_and_tools() -> None:
+    code = (
+        "import sys\n"
+        "import sre_agent.agent as agent\n"
+        "heavy = [m for m in ('google.cloud.bigquery', 'google.cloud.trace_v1',"
+        " 'sre_agent.sub_agents.trace', 'sre_agent.council.tool_registry',"
+        " 'sre_agent.api.app') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+        "assert 'root_agent' not in vars(agent)\n"
+        "assert 'TOOL_NAME_MAP' not in vars(agent)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "GOOGLE_CLOUD_PROJECT": "test-project"},
+        cwd=os.path.dirname(os.path.dirname(sre_agent.__file__)),
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
@@ -5,6 +5,7 @@ Validates all circuit breaker states and transitions:
 - OPEN -> HALF_OPEN after recovery timeout
 - HALF_OPEN -> CLOSED on success threshold
 - HALF_OPEN -> OPEN on failure during recovery
+- Scoped breakers keyed by (backend, project, error class)
 """
 
 import time
@@ -15,6 +16,9 @@ from sre_agent.core.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerOpenError,
     CircuitBreakerRegistry,
+    ErrorClass,
+    classify_error,
+    scope_key,
 )
 
 
@@ -303,3 +307,76 @@ class TestCircuitBreakerOpenError:
         error = CircuitBreakerOpenError("my_tool", 42.5)
         assert error.retry_after_seconds == 42.5
         assert "42.5" in str(error)
+
+
+class TestClassifyError:
+    """Tests for mapping errors to error classes."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            ("429 Quota exceeded for quota metric 'Read requests'", ErrorClass.QUOTA),
+            ("RESOURCE_EXHAUSTED", ErrorClass.QUOTA),
+            ("503 Service Unavailable", ErrorClass.UNAVAILABLE),
+            ("Deadline Exceeded", ErrorClass.TIMEOUT),
+            ("403 Permission denied on resource", ErrorClass.PERMISSION),
+            ("400 Invalid filter expression", ErrorClass.CLIENT),
+            ("Backend 'logging' throttled locally", ErrorClass.THROTTLED),
+            ("something odd happened", ErrorClass.INTERNAL),
+        ],
+    )
+    def test_messages(self, error: str, expected: ErrorClass) -> None:
+        assert classify_error(error) == expected
+
+    def test_exceptions(self) -> None:
+        assert classify_error(TimeoutError()) == ErrorClass.TIMEOUT
+        assert classify_error(ConnectionError("reset")) == ErrorClass.UNAVAILABLE
+
+
+class TestScopedBreakers:
+    """Tests for breakers keyed by backend, project and error class."""
+
+    def test_open_breaker_only_blocks_its_scope(self) -> None:
+        registry = CircuitBreakerRegistry()
+        registry.configure("logging", CircuitBreakerConfig(failure_threshold=1))
+        registry.record_failure(scope_key("logging", "proj-a"), ErrorClass.QUOTA)
+
+        with pytest.raises(CircuitBreakerOpenError) as exc_info:
+            registry.pre_call(scope_key("logging", "proj-a"))
+        assert exc_info.value.tool_name == "logging:proj-a:quota"
+        assert registry.pre_call(scope_key("logging", "proj-b")) is True
+        assert registry.pre_call(scope_key("monitoring", "proj-a")) is True
+
+    def test_error_classes_trip_independently(self) -> None:
+        registry = CircuitBreakerRegistry()
+        scope = scope_key("logging", "p")
+        registry.configure(scope, CircuitBreakerConfig(failure_threshold=2))
+        registry.record_failure(scope, ErrorClass.QUOTA)
+        registry.record_failure(scope, ErrorClass.UNAVAILABLE)
+        assert registry.get_open_circuits() == []
+        registry.record_failure(scope, ErrorClass.QUOTA)
+        assert registry.get_open_circuits() == ["logging:p:quota"]
+
+    def test_client_errors_never_trip(self) -> None:
+        registry = CircuitBreakerRegistry()
+        scope = scope_key("logging", "p")
+        registry.configure(scope, CircuitBreakerConfig(failure_threshold=1))
+        for error_class in (ErrorClass.CLIENT, ErrorClass.PERMISSION):
+            registry.record_failure(scope, error_class)
+        assert registry.pre_call(scope) is True
+        assert registry.get_status(scope)["total_failures"] == 2
+
+    def test_success_recovers_half_open_breaker(self) -> None:
+        registry = CircuitBreakerRegistry()
+        scope = scope_key("cloudtrace", "p")
+        registry.configure(
+            "cloudtrace",
+            CircuitBreakerConfig(
+                failure_threshold=1, recovery_timeout_seconds=0.05, success_threshold=1
+            ),
+        )
+        registry.record_failure(scope, ErrorClass.TIMEOUT)
+        time.sleep(0.06)
+        assert registry.pre_call(scope) is True
+        registry.record_success(scope)
+        assert registry.get_status(scope, ErrorClass.TIMEOUT)["state"] == "closed"
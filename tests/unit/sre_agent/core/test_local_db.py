@@ -0,0 +1,117 @@
+"""Tests for the pooled WAL SQLite access layer."""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from sre_agent.core.local_db import (
+    LocalDatabase,
+    LocalDatabaseConfig,
+    close_local_databases,
+    get_local_database,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = LocalDatabase(
+        str(tmp_path / "local.db"),
+        LocalDatabaseConfig(readers=2, group_commit_window_ms=20),
+    )
+    database.write(
+        lambda conn: conn.execute(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)"
+        )
+    )
+    yield database
+    database.close()
+
+
+def _count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+def test_connections_use_wal(db: LocalDatabase) -> None:
+    assert (
+        db.read(lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0]) == "wal"
+    )
+    assert db.read(lambda conn: conn.execute("PRAGMA synchronous").fetchone()[0]) == 1
+
+
+def test_write_then_read(db: LocalDatabase) -> None:
+    rowcount = db.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+    assert rowcount == 1
+    assert db.read(_count) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_wrappers(db: LocalDatabase) -> None:
+    await db.awrite(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"))
+    assert await db.aread(_count) == 1
+
+
+def test_concurrent_writes_are_group_committed(db: LocalDatabase) -> None:
+    barrier = threading.Barrier(20)
+
+    def insert(i: int) -> None:
+        barrier.wait()
+        db.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",))
+
+    threads = [threading.Thread(target=insert, args=(i,)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert db.read(_count) == 20
+    assert db.jobs_committed == 21  # including the fixture's CREATE TABLE
+    assert db.batches < db.jobs_committed
+    assert db.max_batch_seen > 1
+
+
+def test_failing_job_does_not_roll_back_its_batch(db: LocalDatabase) -> None:
+    ok = db.submit(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"))
+    dup = db.submit(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"))
+    ok2 = db.submit(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('b')"))
+
+    ok.result()
+    ok2.result()
+    with pytest.raises(sqlite3.IntegrityError):
+        dup.result()
+    assert db.read(_count) == 2
+
+
+def test_close_flushes_pending_writes(tmp_path) -> None:
+    path = str(tmp_path / "flush.db")
+    database = LocalDatabase(path, LocalDatabaseConfig(group_commit_window_ms=50))
+    database.write(lambda conn: conn.execute("CREATE TABLE t (x INTEGER)"))
+    futures = [
+        database.submit(lambda conn: conn.execute("INSERT INTO t VALUES (1)"))
+        for _ in range(5)
+    ]
+    database.close()
+
+    assert all(f.done() for f in futures)
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 5
+    with pytest.raises(RuntimeError, match="closed"):
+        database.submit(lambda conn: None)
+
+
+def test_shared_database_is_reopened_when_file_is_replaced(tmp_path) -> None:
+    path = str(tmp_path / "shared.db")
+    try:
+        first = get_local_database(path)
+        assert get_local_database(path) is first
+
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        second = get_local_database(path)
+
+        assert second is not first
+        assert os.path.exists(path)
+    finally:
+        close_local_databases()
@@ -0,0 +1,159 @@
+"""Tests for the event-loop lag monitor and blocking-call attribution."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sre_agent.api.middleware import loop_attribution_middleware
+from sre_agent.core.loop_monitor import (
+    UNATTRIBUTED,
+    EventLoopBlockedError,
+    LoopMonitor,
+    LoopMonitorConfig,
+    activity,
+    attributed,
+    blocking_budget,
+    current_activity,
+    get_loop_monitor,
+    reset_loop_monitor,
+)
+from sre_agent.tools.common.decorators import adk_tool
+
+
+def _monitor() -> LoopMonitor:
+    return LoopMonitor(LoopMonitorConfig(interval_ms=5, threshold_ms=50), export=False)
+
+
+@adk_tool
+def blocking_tool(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+class TestAttribution:
+    def test_labels_nest_and_unwind(self) -> None:
+        @attributed("callback:outer")
+        def outer() -> list[str]:
+            with activity(lambda: "route:GET /x"):
+                return current_activity()
+
+        assert outer() == ["callback:outer", "route:GET /x"]
+        assert current_activity() == []
+
+    @pytest.mark.asyncio
+    async def test_stall_is_attributed_to_the_running_tool(self) -> None:
+        monitor = _monitor()
+        monitor.start()
+        with activity("route:POST /agent"):
+            assert blocking_tool(0.2) == "done"
+        await monitor.stop()
+
+        [stall] = monitor.stalls
+        assert stall.blocker == "tool:blocking_tool"
+        assert stall.activity == ["route:POST /agent", "tool:blocking_tool"]
+        assert "test_loop_monitor.py" in stall.site
+        assert "blocking_tool" in stall.site
+        assert stall.duration_ms >= 100
+
+    @pytest.mark.asyncio
+    async def test_child_tasks_inherit_labels(self) -> None:
+        async def handler() -> None:
+            time.sleep(0.2)
+
+        monitor = _monitor()
+        monitor.start()
+        with activity("route:GET /slow"):
+            await asyncio.create_task(handler())
+        await monitor.stop()
+
+        assert [s.blocker for s in monitor.stalls] == ["route:GET /slow"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_ranks_blockers(self) -> None:
+        monitor = _monitor()
+        monitor.start()
+        time.sleep(0.15)
+        await asyncio.sleep(0.02)
+        for _ in range(2):
+            with activity("callback:before_model"):
+                time.sleep(0.15)
+            await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["running"] is False
+        assert snapshot["stalls"] == 3
+        assert snapshot["lag_ms"]["max"] >= 100
+        top = snapshot["top_blockers"]
+        assert [(b["blocker"], b["count"]) for b in top] == [
+            ("callback:before_model", 2),
+            (UNATTRIBUTED, 1),
+        ]
+        assert top[0]["total_ms"] >= top[0]["max_ms"]
+
+
+class TestBlockingBudget:
+    @pytest.mark.asyncio
+    async def test_fails_when_a_call_blocks_over_budget(self) -> None:
+        with pytest.raises(EventLoopBlockedError) as exc_info:
+            async with blocking_budget(50):
+                blocking_tool(0.2)
+        assert exc_info.value.stall.blocker == "tool:blocking_tool"
+        assert "budget 50ms" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_passes_for_awaited_and_offloaded_work(self) -> None:
+        @adk_tool(execution="io")
+        def offloaded(seconds: float) -> str:
+            time.sleep(seconds)
+            return "done"
+
+        async with blocking_budget(50) as monitor:
+            await asyncio.sleep(0.1)
+            assert await offloaded(0.2) == "done"
+        assert monitor.stalls == []
+
+    @pytest.mark.asyncio
+    async def test_errors_in_the_block_propagate(self) -> None:
+        with pytest.raises(KeyError):
+            async with blocking_budget(50):
+                raise KeyError("x")
+
+
+@pytest.fixture
+def monitored_client() -> Iterator[TestClient]:
+    reset_loop_monitor()
+    app = FastAPI()
+    app.middleware("http")(loop_attribution_middleware)
+
+    @app.get("/slow/{item_id}")
+    async def slow(item_id: str) -> dict[str, str]:
+        time.sleep(0.2)
+        return {"id": item_id}
+
+    async def start() -> None:
+        get_loop_monitor().start()
+
+    async def stop() -> None:
+        await get_loop_monitor().stop()
+
+    app.router.add_event_handler("startup", start)
+    app.router.add_event_handler("shutdown", stop)
+    get_loop_monitor().config = LoopMonitorConfig(interval_ms=5, threshold_ms=50)
+    with TestClient(app) as client:
+        yield client
+    reset_loop_monitor()
+
+
+def test_routes_are_attributed_by_template(monitored_client: TestClient) -> None:
+    assert monitored_client.get("/slow/abc123").status_code == 200
+    deadline = time.monotonic() + 2
+    while not get_loop_monitor().stalls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    [stall] = get_loop_monitor().stalls
+    assert stall.blocker == "route:GET /slow/{item_id}"
@@ -0,0 +1,150 @@
+"""Tests for adaptive concurrency limits and per-project quota buckets."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sre_agent.core.resilience import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveLimitConfig,
+    BackendOverloadedError,
+    GuardedClient,
+    ResilienceManager,
+    TokenBucket,
+    project_from_request,
+    quota_for,
+)
+
+
+class TestTokenBucket:
+    def test_takes_until_empty(self) -> None:
+        bucket = TokenBucket(rate_per_second=1.0, capacity=2)
+        assert bucket.try_take() == 0.0
+        assert bucket.try_take() == 0.0
+        wait = bucket.try_take()
+        assert 0.0 < wait <= 1.0
+
+    def test_refills_over_time(self) -> None:
+        bucket = TokenBucket(rate_per_second=100.0, capacity=1)
+        bucket.try_take()
+        time.sleep(0.02)
+        assert bucket.try_take() == 0.0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_blocks_beyond_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("b", AdaptiveLimitConfig(initial_limit=2))
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert not limiter.acquire(timeout=0.01)
+
+    def test_release_wakes_waiter(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("b", AdaptiveLimitConfig(initial_limit=1))
+        limiter.try_acquire()
+        threading.Timer(0.02, limiter.release, args=(1.0,)).start()
+        assert limiter.acquire(timeout=1.0)
+
+    def test_multiplicative_decrease_on_overload(self) -> None:
+        config = AdaptiveLimitConfig(initial_limit=10, backoff_ratio=0.5)
+        limiter = AdaptiveConcurrencyLimiter("b", config)
+        limiter.try_acquire()
+        limiter.release(10.0, overloaded=True)
+        assert limiter.limit == 5
+        # A second error within the cooldown belongs to the same episode.
+        limiter.try_acquire()
+        limiter.release(10.0, overloaded=True)
+        assert limiter.limit == 5
+
+    def test_slow_calls_count_as_overload(self) -> None:
+        config = AdaptiveLimitConfig(initial_limit=10, latency_target_ms=100)
+        limiter = AdaptiveConcurrencyLimiter("b", config)
+        limiter.try_acquire()
+        limiter.release(500.0)
+        assert limiter.limit == 7
+
+    def test_additive_increase_per_window(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("b", AdaptiveLimitConfig(initial_limit=4))
+        for _ in range(5):
+            limiter.try_acquire()
+            limiter.release(10.0)
+        assert limiter.limit == 5
+
+    def test_respects_bounds(self) -> None:
+        config = AdaptiveLimitConfig(
+            initial_limit=2, min_limit=2, max_limit=2, decrease_cooldown_seconds=0
+        )
+        limiter = AdaptiveConcurrencyLimiter("b", config)
+        for overloaded in (True, False, False, False):
+            limiter.try_acquire()
+            limiter.release(10.0, overloaded=overloaded)
+        assert limiter.limit == 2
+
+
+class TestResilienceManager:
+    def test_quota_is_per_project(self) -> None:
+        manager = ResilienceManager(max_quota_wait_seconds=0)
+        with patch.dict(os.environ, {"SRE_AGENT_QUOTA_QPS_TESTAPI": "0.001"}):
+            with manager.guard("testapi", "a"):
+                pass
+            for _ in range(int(quota_for("testapi").burst) - 1):
+                with manager.guard("testapi", "a"):
+                    pass
+            with pytest.raises(BackendOverloadedError, match="quota"):
+                with manager.guard("testapi", "a"):
+                    pass
+            with manager.guard("testapi", "b"):
+                pass
+
+    def test_quota_error_shrinks_limit(self) -> None:
+        manager = ResilienceManager(AdaptiveLimitConfig(initial_limit=10))
+        with pytest.raises(RuntimeError):
+            with manager.guard("monitoring", "p"):
+                raise RuntimeError("429 Too Many Requests")
+        assert manager.limiter("monitoring").limit == 7
+        assert manager.limiter("monitoring").in_flight == 0
+
+    def test_concurrency_limit_rejects_after_timeout(self) -> None:
+        manager = ResilienceManager(
+            AdaptiveLimitConfig(initial_limit=1, acquire_timeout_seconds=0.01)
+        )
+        with manager.guard("monitoring", "p"):
+            with pytest.raises(BackendOverloadedError, match="concurrency"):
+                with manager.guard("monitoring", "p"):
+                    pass
+
+
+class TestGuardedClient:
+    def test_guards_api_methods_only(self) -> None:
+        client = MagicMock()
+        client.list_log_entries.return_value = ["entry"]
+        manager = MagicMock()
+        guarded = GuardedClient(client, "logging", manager)
+
+        assert guarded.list_log_entries(
+            request={"resource_names": ["projects/p1"]}
+        ) == ["entry"]
+        manager.guard.assert_called_once_with("logging", "p1")
+
+        guarded.common_project_path("p1")
+        assert manager.guard.call_count == 1
+        assert guarded.wrapped is client
+
+
+class TestProjectFromRequest:
+    def test_request_dict_name(self) -> None:
+        assert project_from_request((), {"request": {"name": "projects/p/x"}}) == "p"
+
+    def test_proto_like_request(self) -> None:
+        request = MagicMock(spec=["parent"])
+        request.parent = "projects/p2/locations/global"
+        assert project_from_request((request,), {}) == "p2"
+
+    def test_project_id_kwarg(self) -> None:
+        assert project_from_request((), {"project_id": "p3"}) == "p3"
+
+    def test_unknown(self) -> None:
+        assert project_from_request((), {"filter": "x"}) is None
@@ -0,0 +1,306 @@
+"""Tests for worker-shared state backends and the stores built on them."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import sre_agent
+from sre_agent.core.loop_monitor import blocking_budget
+from sre_agent.core.shared_state import (
+    FakeKVClient,
+    InProcessStore,
+    KVStore,
+    SharedStateConfig,
+    SharedStore,
+    SQLiteStore,
+    configure_shared_state,
+    get_shared_store,
+    reset_shared_state,
+    wait_for_background,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite", "kv"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> SharedStore:
+    if request.param == "sqlite":
+        return SQLiteStore("test", str(tmp_path / "state.db"))
+    if request.param == "kv":
+        return KVStore("test", FakeKVClient())
+    return InProcessStore("test")
+
+
+@pytest.fixture
+def fake_kv() -> Iterator[FakeKVClient]:
+    """Route get_shared_store() to a fake network KV service."""
+    client = FakeKVClient()
+    configure_shared_state(SharedStateConfig(backend="kv"), kv_client=client)
+    yield client
+    reset_shared_state()
+
+
+class TestStoreContract:
+    """Behavior every backend must share."""
+
+    def test_set_get_delete(self, store: SharedStore) -> None:
+        assert store.get("k") is None
+        store.update("k", lambda _: {"a": [1, 2]})
+        assert store.get("k") == {"a": [1, 2]}
+        store.delete("k")
+        assert store.get("k") is None
+
+    def test_ttl_expiry(self, store: SharedStore) -> None:
+        store.update("short", lambda _: 1, ttl_seconds=0.05)
+        store.update("long", lambda _: 2, ttl_seconds=60)
+        time.sleep(0.1)
+        assert store.get("short") is None
+        assert store.keys() == ["long"]
+
+    def test_update_none_deletes_and_errors_abort(self, store: SharedStore) -> None:
+        store.update("k", lambda _: 1)
+
+        def boom(_: object) -> object:
+            raise ValueError("no")
+
+        with pytest.raises(ValueError):
+            store.update("k", boom)
+        assert store.get("k") == 1
+        store.update("k", lambda _: None)
+        assert store.get("k") is None
+
+    def test_incr_and_clear(self, store: SharedStore) -> None:
+        for _ in range(3):
+            store.incr("n", 2)
+        assert store.get("n") == 6
+        store.clear()
+        assert store.keys() == []
+
+
+def test_namespaces_are_isolated() -> None:
+    client = FakeKVClient()
+    a, b = KVStore("a", client), KVStore("b", client)
+    a.set("k", 1)
+    assert b.get("k") is None
+    b.clear()
+    assert a.get("k") == 1
+
+
+def test_sqlite_updates_are_atomic_across_processes(tmp_path: Path) -> None:
+    path = str(tmp_path / "state.db")
+    code = (
+        "import sys\n"
+        "from sre_agent.core.shared_state import SQLiteStore\n"
+        "store = SQLiteStore('counter', sys.argv[1])\n"
+        "for _ in range(50):\n"
+        "    store.incr('n')\n"
+    )
+    cwd = os.path.dirname(os.path.dirname(sre_agent.__file__))
+    workers = [
+        subprocess.Popen([sys.executable, "-c", code, path], cwd=cwd) for _ in range(4)
+    ]
+    assert all(w.wait(timeout=120) == 0 for w in workers)
+    assert SQLiteStore("counter", path).get("n") == 200
+
+
+def test_unavailable_backend_falls_back_to_in_process() -> None:
+    configure_shared_state(SharedStateConfig(backend="kv", url="redis://nowhere"))
+    try:
+        # Without the redis package (or service) the store degrades.
+        store = get_shared_store("x")
+        assert isinstance(store, (InProcessStore, KVStore))
+    finally:
+        reset_shared_state()
+
+
+class TestSharedConsumers:
+    """Two instances over one backend stand in for two uvicorn workers."""
+
+    def test_data_cache_hits_across_workers(self, fake_kv: FakeKVClient) -> None:
+        from sre_agent.tools.common.cache import DataCache
+
+        worker_a = DataCache(shared=get_shared_store("data_cache"))
+        worker_b = DataCache(shared=get_shared_store("data_cache"))
+
+        worker_a.put("trace:1", {"spans": []})
+        assert worker_b.get("trace:1") == {"spans": []}
+
+        requests = fake_kv.requests
+        assert worker_b.get("trace:1") == {"spans": []}
+        assert fake_kv.requests == requests  # served from B's local tier
+
+        worker_a.put("obj", object())  # not JSON: stays local
+        assert worker_b.get("obj") is None
+
+    def test_approval_decided_on_another_worker(self, fake_kv: FakeKVClient) -> None:
+        from sre_agent.core.approval import ApprovalManager, ApprovalStatus
+
+        worker_a = ApprovalManager(store=get_shared_store("approvals"))
+        worker_b = ApprovalManager(store=get_shared_store("approvals"))
+
+        request = worker_a.create_request(
+            "s1", "u1", "restart_pod", {"pod": "p"}, "reason", "low"
+        )
+        assert [r.request_id for r in worker_b.get_pending_requests("s1")] == [
+            request.request_id
+        ]
+
+        event = worker_b.process_decision("s1", request.request_id, True, "admin")
+        assert event.status == ApprovalStatus.APPROVED
+        assert worker_a.get_pending_requests("s1") == []
+        with pytest.raises(ValueError, match="already been processed"):
+            worker_a.process_decision("s1", request.request_id, False, "admin")
+
+    def test_open_circuit_is_seen_by_other_workers(self, fake_kv: FakeKVClient) -> None:
+        from sre_agent.core.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitBreakerOpenError,
+            CircuitBreakerRegistry,
+            ErrorClass,
+        )
+
+        config = CircuitBreakerConfig(failure_threshold=2, recovery_timeout_seconds=60)
+        CircuitBreakerRegistry.reset()
+        try:
+            worker_a = CircuitBreakerRegistry()
+            worker_a.configure("logging", config)
+            for _ in range(2):
+                worker_a.record_failure("logging:p1", ErrorClass.QUOTA)
+
+            CircuitBreakerRegistry.reset()
+            worker_b = CircuitBreakerRegistry()
+            with pytest.raises(CircuitBreakerOpenError, match="logging:p1:quota"):
+                worker_b.pre_call("logging:p1")
+            assert worker_b.pre_call("logging:p2")
+        finally:
+            CircuitBreakerRegistry.reset()
+
+    def test_usage_is_aggregated_across_workers(self, fake_kv: FakeKVClient) -> None:
+        from sre_agent.core.model_callbacks import ModelCallMetrics, UsageTracker
+
+        worker_a = UsageTracker(shared=get_shared_store("model_usage"))
+        worker_b = UsageTracker(shared=get_shared_store("model_usage"))
+
+        worker_a.record(ModelCallMetrics("root", "m", input_tokens=10, output_tokens=5))
+        worker_b.record(ModelCallMetrics("logs", "m", input_tokens=1, output_tokens=1))
+
+        assert worker_a.total_tokens == 17
+        summary = worker_b.get_summary()
+        assert summary["total_calls"] == 2
+        assert set(summary["per_agent"]) == {"root", "logs"}
+
+    @pytest.mark.asyncio
+    async def test_token_validation_is_shared_without_raw_tokens(
+        self, fake_kv: FakeKVClient
+    ) -> None:
+        from sre_agent import auth
+
+        token = "ya29.secret-token"
+        info = auth.TokenInfo(valid=True, email="u@example.com", expires_in=300)
+        await auth._share_token_info(token, info)
+
+        auth._token_cache.pop(token, None)
+        assert await auth._get_shared_token_info(token) == info
+        assert auth._token_cache[token][1] == info
+        assert not any(token in key for key in fake_kv.scan(""))
+        auth._token_cache.pop(token, None)
+
+
+class _SlowSharedStore(InProcessStore):
+    """A shared store whose calls block until released, like a busy backend."""
+
+    is_shared = True
+
+    def __init__(self) -> None:
+        super().__init__("slow")
+        self.released = threading.Event()
+        self.threads: set[int] = set()
+
+    def _wait(self) -> None:
+        self.threads.add(threading.get_ident())
+        assert self.released.wait(5)
+
+    def get(self, key: str) -> Any | None:
+        self._wait()
+        return super().get(key)
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Any | None], Any | None],
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        self._wait()
+        return super().update(key, fn, ttl_seconds)
+
+
+class TestEventLoopHotPaths:
+    """Shared-state I/O never runs on the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_usage_is_published_and_refreshed_in_the_background(self) -> None:
+        from sre_agent.core.model_callbacks import ModelCallMetrics, UsageTracker
+
+        store = _SlowSharedStore()
+        tracker = UsageTracker(shared=store)
+        async with blocking_budget(200):
+            tracker.record(ModelCallMetrics("root", "m", input_tokens=10))
+            assert tracker.total_tokens == 10  # local totals until refreshed
+            store.released.set()
+            await asyncio.to_thread(wait_for_background)
+
+        assert threading.get_ident() not in store.threads
+        assert store.get("totals")["total_tokens"] == 10
+        assert tracker.get_summary()["total_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_marks_are_read_and_published_in_the_background(self) -> None:
+        from sre_agent.core.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitBreakerOpenError,
+            CircuitBreakerRegistry,
+            ErrorClass,
+        )
+
+        store = _SlowSharedStore()
+        config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout_seconds=60)
+        CircuitBreakerRegistry.reset()
+        try:
+            worker_a = CircuitBreakerRegistry()
+            worker_a._shared = store
+            worker_a.configure("logging", config)
+            CircuitBreakerRegistry.reset()
+            worker_b = CircuitBreakerRegistry()
+            worker_b._shared = store
+
+            async with blocking_budget(200):
+                worker_a.record_failure("logging:p1", ErrorClass.QUOTA)
+                assert worker_b.pre_call("logging:p1")  # not seen yet
+                store.released.set()
+                await asyncio.to_thread(wait_for_background)
+                with pytest.raises(CircuitBreakerOpenError):
+                    worker_b.pre_call("logging:p1")
+            assert threading.get_ident() not in store.threads
+        finally:
+            CircuitBreakerRegistry.reset()
+
+    @pytest.mark.asyncio
+    async def test_runner_calls_shared_approvals_in_a_thread(self) -> None:
+        from unittest.mock import MagicMock
+
+        from sre_agent.core.approval import ApprovalManager
+        from sre_agent.core.runner import Runner
+
+        store = _SlowSharedStore()
+        store.released.set()
+        manager = ApprovalManager(store=store)
+        runner = Runner(agent=MagicMock(), approval_manager=manager)
+
+        assert await runner._call_approvals(manager.get_pending_requests, "s1") == []
+        assert store.threads and threading.get_ident() not in store.threads
@@ -0,0 +1,187 @@
+"""Tests for startup warm-up orchestration."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from sre_agent.core.startup import (
+    StartupConfig,
+    StartupOrchestrator,
+    TaskState,
+    WarmUpTask,
+    default_warm_up_tasks,
+    load_warm_state,
+    restore_warm_state,
+    save_warm_state,
+)
+from sre_agent.services.telemetry_catalog import (
+    TelemetryCatalogConfig,
+    TelemetrySources,
+    get_telemetry_catalog,
+    reset_telemetry_catalog,
+)
+
+
+def _orchestrator() -> StartupOrchestrator:
+    return StartupOrchestrator(StartupConfig(task_timeout_seconds=5.0))
+
+
+@pytest.mark.asyncio
+async def test_dependencies_run_first_and_independent_tasks_overlap() -> None:
+    orchestrator = _orchestrator()
+    events: list[str] = []
+
+    def slow(name: str) -> object:
+        async def run() -> None:
+            events.append(f"{name}:start")
+            await asyncio.sleep(0.05)
+            events.append(f"{name}:end")
+
+        return run
+
+    orchestrator.add(WarmUpTask("a", slow("a")))  # type: ignore[arg-type]
+    orchestrator.add(WarmUpTask("b", slow("b")))  # type: ignore[arg-type]
+    orchestrator.add(WarmUpTask("c", lambda: events.append("c"), depends_on=("a",)))
+
+    assert not orchestrator.is_ready
+    await orchestrator.run()
+
+    assert orchestrator.is_ready
+    assert events.index("b:start") < events.index("a:end")
+    assert events.index("c") > events.index("a:end")
+    assert orchestrator.readiness()["progress"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_failures_skip_dependents() -> None:
+    orchestrator = _orchestrator()
+
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    orchestrator.add(WarmUpTask("hang", hang, timeout_seconds=0.05))
+    orchestrator.add(WarmUpTask("boom", lambda: 1 / 0))
+    orchestrator.add(WarmUpTask("after", lambda: None, depends_on=("boom",)))
+    orchestrator.add(WarmUpTask("fine", lambda: None))
+
+    start = time.monotonic()
+    await orchestrator.run()
+
+    assert time.monotonic() - start < 2
+    tasks = orchestrator.readiness()["tasks"]
+    assert tasks["hang"]["state"] == TaskState.TIMED_OUT.value
+    assert tasks["boom"]["state"] == TaskState.FAILED.value
+    assert "division" in tasks["boom"]["error"]
+    assert tasks["after"]["state"] == TaskState.SKIPPED.value
+    assert tasks["fine"]["state"] == TaskState.READY.value
+    assert not orchestrator.is_ready
+
+
+@pytest.mark.asyncio
+async def test_optional_failures_do_not_block_readiness() -> None:
+    orchestrator = _orchestrator()
+    orchestrator.add(WarmUpTask("required", lambda: None))
+    orchestrator.add(WarmUpTask("optional", lambda: 1 / 0, required=False))
+
+    await orchestrator.run()
+
+    assert orchestrator.is_ready
+
+
+def test_add_rejects_duplicates_and_unknown_dependencies() -> None:
+    orchestrator = _orchestrator()
+    orchestrator.add(WarmUpTask("a", lambda: None))
+    with pytest.raises(ValueError):
+        orchestrator.add(WarmUpTask("a", lambda: None))
+    with pytest.raises(ValueError):
+        orchestrator.add(WarmUpTask("b", lambda: None, depends_on=("missing",)))
+
+
+def test_no_tasks_is_ready() -> None:
+    readiness = _orchestrator().readiness()
+    assert readiness["ready"] is True
+    assert readiness["progress"] == 1.0
+
+
+def test_warm_state_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SRE_AGENT_TELEMETRY_CATALOG_DB", "")
+    reset_telemetry_catalog()
+    path = str(tmp_path / "warm.json")
+    config = StartupConfig(snapshot_path=path)
+    try:
+        catalog = get_telemetry_catalog()
+        catalog.prime(
+            [
+                TelemetrySources(
+                    "proj", "user@example.com", log_table="proj.logs._AllLogs"
+                ).to_dict(),
+                TelemetrySources("old", "user@example.com", discovered_at=0).to_dict(),
+            ]
+        )
+        assert save_warm_state(config)
+        state = load_warm_state(path, 60)
+        assert state is not None
+        assert [e["project_id"] for e in state["telemetry_catalog"]] == ["proj"]
+
+        reset_telemetry_catalog()
+        assert restore_warm_state(config) == 1
+        sources = get_telemetry_catalog().peek("proj", "user@example.com")
+        assert sources is not None
+        assert sources.log_table == "proj.logs._AllLogs"
+    finally:
+        reset_telemetry_catalog()
+
+
+def test_stale_or_foreign_snapshots_are_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "warm.json"
+    assert load_warm_state(str(path), 60) is None
+
+    path.write_text(json.dumps({"version": 1, "written_at": 0}))
+    assert load_warm_state(str(path), 60) is None
+
+    path.write_text(json.dumps({"version": 99, "written_at": time.time()}))
+    assert load_warm_state(str(path), 60) is None
+
+    path.write_text("not json")
+    assert load_warm_state(str(path), 60) is None
+
+
+def test_catalog_prime_skips_expired_entries() -> None:
+    from sre_agent.services.telemetry_catalog import TelemetryCatalog
+
+    catalog = TelemetryCatalog(TelemetryCatalogConfig(db_path=""))
+    loaded = catalog.prime(
+        [
+            TelemetrySources("p", "u").to_dict(),
+            TelemetrySources("q", "u", discovered_at=0).to_dict(),
+            {"unexpected": 1},
+        ]
+    )
+    assert loaded == 1
+    assert [e["project_id"] for e in catalog.snapshot()] == ["p"]
+
+
+def test_sandbox_workers_are_warmed_when_local_execution_is_on(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from unittest.mock import MagicMock
+
+    from sre_agent.tools.sandbox import worker_pool
+
+    pool = MagicMock()
+    monkeypatch.setattr(worker_pool, "get_local_worker_pool", lambda: pool)
+    task = next(
+        t for t in default_warm_up_tasks(StartupConfig()) if t.name == "sandbox_workers"
+    )
+    assert not task.required
+
+    monkeypatch.setenv("SRE_AGENT_LOCAL_EXECUTION", "false")
+    task.run()
+    pool.warm.assert_not_called()
+
+    monkeypatch.setenv("SRE_AGENT_LOCAL_EXECUTION", "true")
+    task.run()
+    pool.warm.assert_called_once_with()
@@ -0,0 +1,147 @@
+"""Tests for selective panel re-execution in debate rounds."""
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+from google.adk.models.llm_request import LlmRequest
+
+from sre_agent.council.debate import (
+    PANEL_FINDING_KEYS,
+    _build_convergence_tracker,
+    _make_carry_forward_callback,
+    _make_critic_context_injector,
+    _record_disputed_panels,
+    create_debate_pipeline,
+    resolve_disputed_panels,
+)
+from sre_agent.council.schemas import CouncilConfig
+from sre_agent.council.state import (
+    CRITIC_REPORT,
+    DEBATE_CONVERGENCE_HISTORY,
+    DEBATE_DISPUTED_PANELS,
+    LOGS_FINDING,
+    TRACE_FINDING,
+)
+from sre_agent.council.tool_memo import memo_before_tool_callback
+
+
+def _ctx(state: dict[str, Any]) -> Any:
+    ctx = MagicMock()
+    ctx.state = state
+    return ctx
+
+
+class TestResolveDisputedPanels:
+    """Tests for resolve_disputed_panels."""
+
+    def test_uses_explicit_list(self) -> None:
+        critic = {"gaps": ["Check the alert policy"], "disputed_panels": ["logs"]}
+        assert resolve_disputed_panels(critic) == {"logs"}
+
+    def test_accepts_agent_names_and_ignores_unknown(self) -> None:
+        critic = {"disputed_panels": ["Trace_Panel", "bogus"]}
+        assert resolve_disputed_panels(critic) == {"trace"}
+
+    def test_infers_from_issue_keywords(self) -> None:
+        critic = {
+            "gaps": ["No span-level breakdown for checkout"],
+            "contradictions": ["Metrics show healthy CPU but logs show OOM errors"],
+        }
+        assert resolve_disputed_panels(critic) == {"trace", "metrics", "logs"}
+
+    def test_unroutable_issue_disputes_all(self) -> None:
+        critic = {"gaps": ["Root cause remains unclear"]}
+        assert resolve_disputed_panels(critic) == set(PANEL_FINDING_KEYS)
+
+    def test_no_issues_disputes_nothing(self) -> None:
+        assert resolve_disputed_panels({"agreements": ["all good"]}) == set()
+
+
+class TestRecordDisputedPanels:
+    """Tests for the critic after_agent_callback."""
+
+    def test_stores_sorted_panels(self) -> None:
+        report = {"gaps": [], "contradictions": [], "disputed_panels": ["logs", "data"]}
+        ctx = _ctx({CRITIC_REPORT: json.dumps(report)})
+        _record_disputed_panels(ctx)
+        assert ctx.state[DEBATE_DISPUTED_PANELS] == ["data", "logs"]
+
+    def test_malformed_report_reruns_all(self) -> None:
+        ctx = _ctx({CRITIC_REPORT: "NOT_JSON{"})
+        _record_disputed_panels(ctx)
+        assert ctx.state[DEBATE_DISPUTED_PANELS] == sorted(PANEL_FINDING_KEYS)
+
+
+class TestCarryForward:
+    """Tests for skipping undisputed debate panels."""
+
+    def test_skips_undisputed_panel_with_finding(self) -> None:
+        cb = _make_carry_forward_callback("trace", TRACE_FINDING)
+        ctx = _ctx({DEBATE_DISPUTED_PANELS: ["logs"], TRACE_FINDING: "{}"})
+        result = cb(ctx)
+        assert result is not None
+        assert "carried forward" in result.parts[0].text
+
+    def test_runs_disputed_panel(self) -> None:
+        cb = _make_carry_forward_callback("logs", LOGS_FINDING)
+        ctx = _ctx({DEBATE_DISPUTED_PANELS: ["logs"], LOGS_FINDING: "{}"})
+        assert cb(ctx) is None
+
+    def test_runs_panel_without_previous_finding(self) -> None:
+        cb = _make_carry_forward_callback("trace", TRACE_FINDING)
+        ctx = _ctx({DEBATE_DISPUTED_PANELS: []})
+        assert cb(ctx) is None
+
+    def test_runs_when_critic_has_not_run(self) -> None:
+        cb = _make_carry_forward_callback("trace", TRACE_FINDING)
+        assert cb(_ctx({TRACE_FINDING: "{}"})) is None
+
+
+class TestCriticContextInjector:
+    """Tests for the before_model_callback that injects critic feedback."""
+
+    def test_appends_user_turn(self) -> None:
+        report = {"gaps": ["No trace data for service B"], "contradictions": []}
+        request = LlmRequest()
+        inject = _make_critic_context_injector("trace")
+        result = inject(_ctx({CRITIC_REPORT: json.dumps(report)}), request)
+        assert result is None
+        assert len(request.contents) == 1
+        assert request.contents[0].role == "user"
+        assert "No trace data for service B" in request.contents[0].parts[0].text
+
+    def test_noop_without_critic_report(self) -> None:
+        request = LlmRequest()
+        _make_critic_context_injector("trace")(_ctx({}), request)
+        assert request.contents == []
+
+
+class TestPipelineWiring:
+    """Tests for how the debate pipeline attaches the new callbacks."""
+
+    def _debate_loop(self) -> Any:
+        return create_debate_pipeline(CouncilConfig()).sub_agents[2]
+
+    def test_debate_panels_have_skip_and_injection_callbacks(self) -> None:
+        debate_panels = self._debate_loop().sub_agents[1]
+        for panel in debate_panels.sub_agents:
+            assert panel.before_agent_callback is not None
+            assert isinstance(panel.before_model_callback, list)
+            assert len(panel.before_model_callback) == 2
+            assert panel.before_tool_callback is memo_before_tool_callback
+
+    def test_initial_panels_memoize_tools(self) -> None:
+        initial = create_debate_pipeline(CouncilConfig()).sub_agents[0]
+        for panel in initial.sub_agents:
+            assert panel.before_tool_callback is memo_before_tool_callback
+
+    def test_critic_records_disputed_panels(self) -> None:
+        critic = self._debate_loop().sub_agents[0]
+        assert critic.after_agent_callback is _record_disputed_panels
+
+    def test_convergence_records_rerun_panels(self) -> None:
+        tracker = _build_convergence_tracker(CouncilConfig())
+        ctx = _ctx({DEBATE_DISPUTED_PANELS: ["metrics"]})
+        tracker(ctx)
+        assert ctx.state[DEBATE_CONVERGENCE_HISTORY][0]["panels_rerun"] == ["metrics"]
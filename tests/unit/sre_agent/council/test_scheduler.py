@@ -0,0 +1,231 @@
+"""Tests for deadline-aware council panel scheduling."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import InMemoryRunner
+from google.genai import types as genai_types
+
+from sre_agent.council import scheduler
+from sre_agent.council.parallel_council import create_council_pipeline
+from sre_agent.council.scheduler import (
+    BudgetedParallelAgent,
+    CouncilPipeline,
+    PanelBudget,
+    tool_budget_before_tool_callback,
+)
+from sre_agent.council.schemas import CouncilConfig
+from sre_agent.council.state import COUNCIL_AMENDMENTS, COUNCIL_PANEL_STATUS
+
+
+class _FakePanel(BaseAgent):
+    """Panel that writes its finding after ``delay`` seconds."""
+
+    delay: float = 0.0
+    output_key: str = ""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        await asyncio.sleep(self.delay)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(
+                state_delta={
+                    self.output_key: json.dumps({"summary": f"{self.name} done"})
+                }
+            ),
+        )
+
+
+class _FakeSynthesizer(BaseAgent):
+    """Synthesizer that records which findings existed when it started."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        seen = sorted(k for k in ctx.session.state if k.endswith("_finding"))
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            actions=EventActions(state_delta={"council_synthesis": seen}),
+        )
+
+
+def _pipeline(delays: dict[str, float], config: CouncilConfig) -> CouncilPipeline:
+    panels = [
+        _FakePanel(name=f"{name}_panel", delay=delay, output_key=f"{name}_finding")
+        for name, delay in delays.items()
+    ]
+    return CouncilPipeline(
+        name="council_pipeline",
+        sub_agents=[
+            BudgetedParallelAgent(
+                name="parallel_panels", sub_agents=panels, council_config=config
+            ),
+            _FakeSynthesizer(name="council_synthesizer"),
+        ],
+        council_config=config,
+    )
+
+
+async def _run(agent: BaseAgent) -> tuple[list[Event], dict[str, Any]]:
+    runner = InMemoryRunner(agent=agent, app_name="test")
+    session = await runner.session_service.create_session(app_name="test", user_id="u")
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id="u",
+            session_id=session.id,
+            new_message=genai_types.Content(
+                role="user", parts=[genai_types.Part(text="investigate")]
+            ),
+        )
+    ]
+    final = await runner.session_service.get_session(
+        app_name="test", user_id="u", session_id=session.id
+    )
+    assert final is not None
+    return events, final.state
+
+
+class _Py310Asyncio:
+    """``asyncio`` as on Python 3.10, where its TimeoutError is not the builtin."""
+
+    class TimeoutError(Exception):
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(asyncio, name)
+
+    async def wait_for(self, aw: Any, timeout: float | None) -> Any:
+        try:
+            return await asyncio.wait_for(aw, timeout)
+        except TimeoutError:
+            raise self.TimeoutError from None
+
+
+@pytest.fixture
+def short_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        PanelBudget,
+        "from_config",
+        classmethod(lambda cls, config: cls(0.5, 1_000, 2)),
+    )
+
+
+class TestCouncilPipeline:
+    @pytest.mark.asyncio
+    async def test_synthesizes_after_all_panels_when_fast(self) -> None:
+        config = CouncilConfig(quorum=2, quorum_grace_seconds=1.0)
+        _, state = await _run(_pipeline({"trace": 0, "logs": 0.01}, config))
+        assert state["council_synthesis"] == ["logs_finding", "trace_finding"]
+        assert state[COUNCIL_PANEL_STATUS] == {
+            "trace_panel": "completed",
+            "logs_panel": "completed",
+        }
+        assert COUNCIL_AMENDMENTS not in state
+
+    @pytest.mark.asyncio
+    async def test_quorum_starts_synthesis_and_amends_late_finding(self) -> None:
+        config = CouncilConfig(quorum=2, quorum_grace_seconds=0.0)
+        events, state = await _run(
+            _pipeline({"trace": 0, "metrics": 0, "data": 0.2}, config)
+        )
+        assert state["council_synthesis"] == ["metrics_finding", "trace_finding"]
+        assert state[COUNCIL_PANEL_STATUS]["data_panel"] == "late"
+        assert state[COUNCIL_AMENDMENTS] == [
+            {"panel": "data_panel", "summary": "data_panel done"}
+        ]
+        # The late finding still lands in state for result extraction.
+        assert "data_finding" in state
+        texts = [p.text for e in events if e.content for p in e.content.parts if p.text]
+        assert any(t.startswith("Amendment: data_panel") for t in texts)
+
+    @pytest.mark.asyncio
+    async def test_quorum_grace_wake_up_starts_synthesis(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(scheduler, "asyncio", _Py310Asyncio())
+        config = CouncilConfig(quorum=1, quorum_grace_seconds=0.05)
+        _, state = await _run(_pipeline({"trace": 0, "data": 0.3}, config))
+        assert state["council_synthesis"] == ["trace_finding"]
+        assert state[COUNCIL_PANEL_STATUS] == {
+            "trace_panel": "completed",
+            "data_panel": "late",
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("short_budget")
+    async def test_cancels_panel_past_wall_clock_budget(self) -> None:
+        config = CouncilConfig(quorum=1, quorum_grace_seconds=0.0)
+        _, state = await _run(_pipeline({"trace": 0, "data": 30}, config))
+        assert state[COUNCIL_PANEL_STATUS] == {
+            "trace_panel": "completed",
+            "data_panel": "timed_out",
+        }
+        assert "data_finding" not in state
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("short_budget")
+    async def test_parallel_agent_alone_waits_for_budget(self) -> None:
+        config = CouncilConfig()
+        agent = _pipeline({"trace": 0, "data": 30}, config).sub_agents[0]
+        agent.parent_agent = None
+        _, state = await _run(agent)
+        assert state[COUNCIL_PANEL_STATUS]["data_panel"] == "timed_out"
+        assert "trace_finding" in state
+
+
+class TestToolBudget:
+    def _context(self, invocation_id: str, agent_name: str) -> Any:
+        ctx = MagicMock()
+        ctx.invocation_id = invocation_id
+        ctx.agent_name = agent_name
+        return ctx
+
+    def test_noop_outside_scheduled_run(self) -> None:
+        ctx = self._context("unknown", "trace_panel")
+        assert tool_budget_before_tool_callback(MagicMock(), {}, ctx) is None
+
+    def test_refuses_calls_over_budget(self) -> None:
+        scheduler._register_budget("inv", max_tool_calls=2)
+        try:
+            ctx = self._context("inv", "trace_panel")
+            assert tool_budget_before_tool_callback(MagicMock(), {}, ctx) is None
+            assert tool_budget_before_tool_callback(MagicMock(), {}, ctx) is None
+            refused = tool_budget_before_tool_callback(MagicMock(), {}, ctx)
+            assert refused is not None and refused["status"] == "error"
+            other = self._context("inv", "logs_panel")
+            assert tool_budget_before_tool_callback(MagicMock(), {}, other) is None
+        finally:
+            scheduler._release_budget("inv")
+
+    def test_token_exhaustion_refuses_calls(self) -> None:
+        scheduler._register_budget("inv", max_tool_calls=10)
+        try:
+            scheduler._exhaust_budget("inv", "trace_panel")
+            ctx = self._context("inv", "trace_panel")
+            assert tool_budget_before_tool_callback(MagicMock(), {}, ctx) is not None
+        finally:
+            scheduler._release_budget("inv")
+
+
+class TestPanelBudget:
+    def test_panel_timeout_capped_by_council_timeout(self) -> None:
+        config = CouncilConfig(timeout_seconds=30, panel_timeout_seconds=60)
+        assert PanelBudget.from_config(config).wall_clock_seconds == 30.0
+
+    def test_pipeline_panels_have_tool_budget(self) -> None:
+        pipeline = create_council_pipeline()
+        for panel in pipeline.sub_agents[0].sub_agents:
+            assert panel.before_tool_callback is tool_budget_before_tool_callback
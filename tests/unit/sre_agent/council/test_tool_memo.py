@@ -0,0 +1,119 @@
+"""Tests for the per-investigation tool result memo."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from sre_agent.council.tool_memo import (
+    ToolResultMemo,
+    get_tool_result_memo,
+    is_memoizable,
+    memo_after_tool_callback,
+    memo_before_tool_callback,
+    reset_tool_result_memo,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_memo() -> Iterator[None]:
+    reset_tool_result_memo()
+    yield
+    reset_tool_result_memo()
+
+
+def _tool(name: str) -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    return tool
+
+
+def _context(invocation_id: str = "inv-1") -> MagicMock:
+    ctx = MagicMock()
+    ctx.invocation_id = invocation_id
+    return ctx
+
+
+class TestIsMemoizable:
+    def test_read_only_tools(self) -> None:
+        assert is_memoizable("fetch_trace")
+        assert is_memoizable("list_log_entries")
+
+    def test_state_and_side_effect_tools(self) -> None:
+        assert not is_memoizable("update_investigation_state")
+        assert not is_memoizable("get_investigation_summary")
+        assert not is_memoizable("gcp_execute_sql")
+
+    def test_write_tools_are_never_memoized(self) -> None:
+        for name in (
+            "restart_pod",
+            "scale_deployment",
+            "rollback_deployment",
+            "acknowledge_alert",
+            "silence_alert",
+        ):
+            assert not is_memoizable(name), name
+
+    def test_unknown_tools_are_not_memoized(self) -> None:
+        assert not is_memoizable("some_new_tool")
+
+
+class TestCallbacks:
+    @pytest.mark.asyncio
+    async def test_replays_identical_call(self) -> None:
+        tool, ctx = _tool("fetch_trace"), _context()
+        response = {"status": "success", "result": {"spans": []}}
+        args = {"trace_id": "abc", "project_id": "p"}
+
+        assert await memo_before_tool_callback(tool, args, ctx) is None
+        await memo_after_tool_callback(tool, args, ctx, response)
+
+        reordered = {"project_id": "p", "trace_id": "abc"}
+        assert await memo_before_tool_callback(tool, reordered, ctx) == response
+        assert get_tool_result_memo().stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_investigation(self) -> None:
+        tool = _tool("fetch_trace")
+        await memo_after_tool_callback(tool, {"t": 1}, _context("a"), {"ok": 1})
+        assert await memo_before_tool_callback(tool, {"t": 1}, _context("b")) is None
+
+    @pytest.mark.asyncio
+    async def test_skips_errors_and_denylisted_tools(self) -> None:
+        ctx = _context()
+        await memo_after_tool_callback(
+            _tool("fetch_trace"), {}, ctx, {"status": "error", "error": "boom"}
+        )
+        await memo_after_tool_callback(
+            _tool("update_investigation_state"), {}, ctx, {"status": "success"}
+        )
+        assert await memo_before_tool_callback(_tool("fetch_trace"), {}, ctx) is None
+        assert (
+            await memo_before_tool_callback(
+                _tool("update_investigation_state"), {}, ctx
+            )
+            is None
+        )
+
+
+class TestToolResultMemo:
+    def test_evicts_least_recent_investigation(self) -> None:
+        memo = ToolResultMemo(max_investigations=2)
+        memo.put("a", "t", {}, {"v": "a"})
+        memo.put("b", "t", {}, {"v": "b"})
+        memo.get("a", "t", {})
+        memo.put("c", "t", {}, {"v": "c"})
+        assert memo.get("b", "t", {}) is None
+        assert memo.get("a", "t", {}) == {"v": "a"}
+
+    def test_caps_entries_per_investigation(self) -> None:
+        memo = ToolResultMemo(max_entries=1)
+        memo.put("a", "t", {"i": 1}, {"v": 1})
+        memo.put("a", "t", {"i": 2}, {"v": 2})
+        assert memo.get("a", "t", {"i": 2}) is None
+
+    def test_clear(self) -> None:
+        memo = ToolResultMemo()
+        memo.put("a", "t", {}, {"v": 1})
+        memo.clear("a")
+        assert memo.get("a", "t", {}) is None
@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from sre_agent.memory.callbacks import (
     _extract_error_lesson,
@@ -15,6 +16,13 @@ from sre_agent.memory.callbacks import (
     before_tool_memory_callback,
     on_tool_error_memory_callback,
 )
+from sre_agent.memory.write_behind import get_memory_writer
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _close_memory_writer():
+    yield
+    await get_memory_writer().close()
 
 
 class TestIsLearnableFailure:
@@ -143,6 +151,7 @@ class TestAfterToolMemoryCallback:
             result = await after_tool_memory_callback(
                 tool, {"filter": "bad"}, tool_context, tool_response
             )
+            await get_memory_writer().flush()
 
             assert result is None
             # Called twice: once for TOOL FAILURE LESSON, once for [MISTAKE]
@@ -225,6 +234,7 @@ class TestOnToolErrorMemoryCallback:
             result = await on_tool_error_memory_callback(
                 tool, {"query": "rate(foo_bar[5m])"}, tool_context, error
             )
+            await get_memory_writer().flush()
 
             assert result is None
             # Called twice: once for TOOL ERROR LESSON, once for [MISTAKE]
@@ -346,10 +356,11 @@ class TestBeforeToolMemoryCallback:
         tool = MagicMock()
         tool.name = "fetch_trace"
         tool_context = MagicMock()
+        tool_context.invocation_context.session.id = "sess-1"
 
         with patch("sre_agent.memory.factory.get_memory_manager") as mock_mgr:
             mock_manager = MagicMock()
-            mock_manager.record_tool_call = MagicMock()
+            mock_manager.record_tool_call = MagicMock(return_value=1)
             mock_mgr.return_value = mock_manager
 
             result = await before_tool_memory_callback(
@@ -357,7 +368,9 @@ class TestBeforeToolMemoryCallback:
             )
 
             assert result is None
-            mock_manager.record_tool_call.assert_called_once_with("fetch_trace")
+            mock_manager.record_tool_call.assert_called_once_with(
+                "fetch_trace", "sess-1"
+            )
 
     @pytest.mark.asyncio
     async def test_never_breaks_on_error(self) -> None:
@@ -401,6 +414,7 @@ class TestAfterToolMemoryCallbackSuccesses:
             result = await after_tool_memory_callback(
                 tool, {"trace_id": "abc"}, tool_context, tool_response
             )
+            await get_memory_writer().flush()
 
             assert result is None
             mock_manager.add_finding.assert_called_once()
@@ -21,17 +21,36 @@ async def test_record_tool_call(manager):
     """Test recording tool calls."""
     manager.record_tool_call("tool1")
     manager.record_tool_call("tool2")
-    assert manager._current_tool_sequence == ["tool1", "tool2"]
+    assert manager.get_tool_sequence() == ["tool1", "tool2"]
 
     manager.reset_session_tracking()
-    assert manager._current_tool_sequence == []
+    assert manager.get_tool_sequence() == []
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_tracked_per_session(manager):
+    """Concurrent investigations must not mix their tool sequences."""
+    assert manager.record_tool_call("fetch_trace", "sess-a") == 1
+    assert manager.record_tool_call("list_log_entries", "sess-b") == 1
+    assert manager.record_tool_call("analyze_critical_path", "sess-a") == 2
+
+    assert manager.get_tool_sequence("sess-a") == [
+        "fetch_trace",
+        "analyze_critical_path",
+    ]
+    assert manager.get_tool_sequence("sess-b") == ["list_log_entries"]
+
+    manager.reset_session_tracking("sess-a")
+    assert manager.get_tool_sequence("sess-a") == []
+    assert manager.get_tool_sequence("sess-b") == ["list_log_entries"]
 
 
 @pytest.mark.asyncio
 async def test_learn_from_investigation(manager):
     """Test learning from a successful investigation."""
-    manager.record_tool_call("query_metrics")
-    manager.record_tool_call("fetch_traces")
+    manager.record_tool_call("query_metrics", "sess-1")
+    manager.record_tool_call("fetch_traces", "sess-1")
+    manager.record_tool_call("list_log_entries", "sess-2")
 
     # Mock save_memory if it exists on the service
     manager.memory_service.save_memory = AsyncMock()
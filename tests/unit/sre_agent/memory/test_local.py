@@ -7,23 +7,29 @@ import os
 
 import pytest
 
+from sre_agent.core.local_db import close_local_databases
 from sre_agent.memory.local import LocalMemoryService
 
 DB_PATH = "test_memory.db"
 
 
+def _remove_db(path):
+    close_local_databases()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
 @pytest.fixture
 def local_memory():
     """Create a fresh local memory service."""
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
+    _remove_db(DB_PATH)
 
     service = LocalMemoryService(db_path=DB_PATH)
     yield service
 
     # Cleanup
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
+    _remove_db(DB_PATH)
 
 
 @pytest.mark.asyncio
@@ -92,3 +98,121 @@ async def test_search_limit(local_memory):
 
     # Let's verify exact count returned by service
     assert len(results) == 6
+
+
+@pytest.mark.asyncio
+async def test_bm25_ranks_more_relevant_first(local_memory):
+    """Test that results are ranked by relevance, not recency."""
+    await local_memory.save_memory(
+        session_id="s",
+        memory_content="Database connection pool exhausted on checkout service",
+        metadata={"user_id": "user_a"},
+    )
+    await local_memory.save_memory(
+        session_id="s",
+        memory_content="Checkout latency regression after deploy",
+        metadata={"user_id": "user_a"},
+    )
+
+    results = await local_memory.search_memory(
+        query="connection pool exhausted", limit=2, user_id="user_a"
+    )
+
+    assert results[0].content.startswith("Database connection pool")
+    assert results[0].score > results[-1].score
+    assert all(0.0 < r.score <= 1.0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_user_and_app_filters_apply_in_query(local_memory):
+    """Test that user and app scoping happen before ranking and limiting."""
+    for i in range(5):
+        await local_memory.save_memory(
+            session_id="s",
+            memory_content=f"OOMKilled pod {i}",
+            metadata={"user_id": "user_b"},
+        )
+    await local_memory.save_memory(
+        session_id="s",
+        memory_content="OOMKilled pod in payments",
+        metadata={"user_id": "user_a", "app_name": "sre_agent"},
+    )
+
+    results = await local_memory.search_memory(
+        query="OOMKilled", limit=1, user_id="user_a"
+    )
+    assert [r.metadata["user_id"] for r in results] == ["user_a"]
+
+    assert (
+        await local_memory.search_memory(
+            query="OOMKilled", user_id="user_a", app_name="other_app"
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_time_filter(local_memory):
+    """Test filtering by creation time."""
+    from datetime import datetime, timedelta, timezone
+
+    await local_memory.save_memory(
+        session_id="s", memory_content="Old incident", metadata={"user_id": "u"}
+    )
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    assert await local_memory.search_memory(query="incident", since=future) == []
+    assert len(await local_memory.search_memory(query="incident", until=future)) == 1
+
+
+@pytest.mark.asyncio
+async def test_vector_fallback_matches_near_misses(local_memory):
+    """Test that hashed n-gram vectors recall wording the index misses."""
+    await local_memory.save_memory(
+        session_id="s",
+        memory_content="Upstream connect error: timeout contacting backend",
+        metadata={"user_id": "u"},
+    )
+
+    results = await local_memory.search_memory(query="timedout backend", user_id="u")
+    assert len(results) == 1
+
+    lexical_only = LocalMemoryService(db_path=DB_PATH, vector_weight=0.0)
+    assert await lexical_only.search_memory(query="timedout", user_id="u") == []
+
+
+@pytest.mark.asyncio
+async def test_query_syntax_is_escaped(local_memory):
+    """Test that FTS5 operators in user input are treated as plain text."""
+    await local_memory.save_memory(
+        session_id="s", memory_content="NOT a problem", metadata={"user_id": "u"}
+    )
+
+    results = await local_memory.search_memory(query='NOT "problem* (', user_id="u")
+    assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_legacy_database_is_migrated_and_indexed(local_memory):
+    """Test that rows written before the FTS index existed become searchable."""
+    import sqlite3
+
+    legacy_path = "test_memory_legacy.db"
+    try:
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute(
+                "CREATE TABLE memories (id TEXT PRIMARY KEY, user_id TEXT NOT NULL, "
+                "session_id TEXT NOT NULL, content TEXT NOT NULL, "
+                "metadata TEXT DEFAULT '{}', "
+                "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+            )
+            conn.execute(
+                "INSERT INTO memories (id, user_id, session_id, content, metadata) "
+                "VALUES ('m1', 'u', 's', 'Disk pressure on node pool', '{}')"
+            )
+
+        service = LocalMemoryService(db_path=legacy_path)
+        results = await service.search_memory(query="disk pressure", user_id="u")
+        assert [r.id for r in results] == ["m1"]
+    finally:
+        _remove_db(legacy_path)
@@ -512,3 +512,90 @@ class TestLoadFromMemoryBank:
         ):
             loaded = await store.load_from_memory_bank()
             assert loaded == 0
+
+
+class TestIndexedStore:
+    """Tests for the bounded working set and the indexed mistakes table."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        from sre_agent.core.local_db import close_local_databases
+
+        yield str(tmp_path / "mistakes.db")
+        close_local_databases()
+
+    @staticmethod
+    async def _record(store: MistakeMemoryStore, tool: str, error: str) -> None:
+        with patch("sre_agent.memory.factory.get_memory_manager") as mock_factory:
+            mock_factory.return_value = AsyncMock()
+            await store.record_mistake(tool, error, {})
+
+    @pytest.mark.asyncio
+    async def test_working_set_is_bounded(self) -> None:
+        store = MistakeMemoryStore(max_cached=3)
+        for i in range(5):
+            await self._record(store, "tool", f"error {i}")
+
+        assert await store.count_mistakes() == 3
+        top = await store.get_mistakes_for_tool("tool")
+        assert {r.error_message for r in top} == {"error 2", "error 3", "error 4"}
+
+    @pytest.mark.asyncio
+    async def test_top_k_tracks_increments(self) -> None:
+        store = MistakeMemoryStore()
+        await self._record(store, "a", "first")
+        await self._record(store, "b", "second")
+        await self._record(store, "b", "second")
+        await self._record(store, "a", "first")
+        await self._record(store, "a", "first")
+
+        top = await store.get_top_mistakes(limit=2)
+        assert [(r.tool_name, r.occurrence_count) for r in top] == [("a", 3), ("b", 2)]
+        assert await store.get_top_mistakes(limit=1) == top[:1]
+
+    @pytest.mark.asyncio
+    async def test_records_survive_restart_and_eviction(self, db_path: str) -> None:
+        store = MistakeMemoryStore(db_path=db_path, max_cached=1)
+        await self._record(store, "query_promql", "syntax error")
+        await self._record(store, "list_log_entries", "invalid filter")
+        # The first record was evicted; recurrence must still be counted.
+        await self._record(store, "query_promql", "syntax error")
+        with patch("sre_agent.memory.factory.get_memory_manager") as mock_factory:
+            mock_factory.return_value = AsyncMock()
+            await store.record_correction(
+                "query_promql", "syntax error", "balance parens", {}
+            )
+        fingerprint = _compute_fingerprint(
+            "query_promql", MistakeCategory.SYNTAX_ERROR, "syntax error"
+        )
+
+        reopened = MistakeMemoryStore(db_path=db_path)
+        assert await reopened.count_mistakes() == 2
+        promql = await reopened.get_mistakes_for_tool("query_promql")
+        assert promql[0].occurrence_count == 2
+        assert promql[0].correction == "balance parens"
+        corrected = await reopened.get_corrected_mistakes()
+        assert [r.fingerprint for r in corrected] == [fingerprint]
+
+        with patch("sre_agent.memory.factory.get_memory_manager") as mock_factory:
+            mock_factory.return_value = AsyncMock(
+                get_relevant_findings=AsyncMock(return_value=[])
+            )
+            assert await reopened.load_from_memory_bank() == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_lookup_uses_index(self, db_path: str) -> None:
+        store = MistakeMemoryStore(db_path=db_path)
+        await self._record(store, "query_promql", "syntax error")
+        assert store._db is not None
+
+        plan = store._db.read(
+            lambda conn: conn.execute(
+                "EXPLAIN QUERY PLAN SELECT record FROM mistakes "
+                "WHERE tool_name = ? ORDER BY occurrence_count DESC LIMIT 5",
+                ("query_promql",),
+            ).fetchall()
+        )
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "idx_mistakes_tool" in details
+        assert "TEMP B-TREE" not in details
@@ -0,0 +1,60 @@
+"""Tests for session-scoped tool sequence tracking."""
+
+from unittest.mock import patch
+
+from sre_agent.memory.tool_sequence import SessionToolTracker
+
+
+class TestSessionToolTracker:
+    """Tests for bounded per-session tool traces."""
+
+    def test_compact_sequence_collapses_repeats(self) -> None:
+        tracker = SessionToolTracker()
+        for tool in ("fetch_trace", "fetch_trace", "list_logs", "fetch_trace"):
+            tracker.record(tool, "s1")
+
+        assert tracker.sequence("s1") == ["fetch_trace", "list_logs", "fetch_trace"]
+
+    def test_ring_buffer_bounds_calls_but_counts_all(self) -> None:
+        tracker = SessionToolTracker(max_calls_per_session=3)
+        for i in range(10):
+            count = tracker.record(f"tool_{i}", "s1")
+
+        assert count == 10
+        assert tracker.sequence("s1") == ["tool_7", "tool_8", "tool_9"]
+
+    def test_least_recently_active_session_is_evicted(self) -> None:
+        tracker = SessionToolTracker(max_sessions=2)
+        tracker.record("a", "s1")
+        tracker.record("b", "s2")
+        tracker.record("c", "s1")
+        tracker.record("d", "s3")
+
+        assert len(tracker) == 2
+        assert tracker.sequence("s2") == []
+        assert tracker.sequence("s1") == ["a", "c"]
+
+    def test_idle_sessions_expire(self) -> None:
+        tracker = SessionToolTracker(ttl_seconds=60)
+        with patch("sre_agent.memory.tool_sequence.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            tracker.record("a", "idle")
+            clock.return_value = 1030.0
+            tracker.record("b", "active")
+            clock.return_value = 1070.0
+
+            assert tracker.sequence("idle") == []
+            assert tracker.sequence("active") == ["b"]
+
+            tracker.record("c", "active")
+            assert len(tracker) == 1
+
+    def test_reset_forgets_only_that_session(self) -> None:
+        tracker = SessionToolTracker()
+        tracker.record("a", "s1")
+        tracker.record("b", None)
+
+        tracker.reset("s1")
+
+        assert tracker.sequence("s1") == []
+        assert tracker.sequence() == ["b"]
@@ -0,0 +1,127 @@
+"""Tests for the memory write-behind pipeline."""
+
+import asyncio
+
+import pytest
+
+from sre_agent.memory.write_behind import (
+    MemoryWrite,
+    MemoryWriteBehind,
+    MemoryWriteBehindConfig,
+)
+
+
+def _recorder(log: list[str], name: str, delay: float = 0.0) -> MemoryWrite:
+    async def run() -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        log.append(name)
+
+    return MemoryWrite(kind="test", run=run)
+
+
+class TestMemoryWriteBehind:
+    """Tests for queuing, batching and flushing deferred memory writes."""
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_write(self) -> None:
+        writer = MemoryWriteBehind(MemoryWriteBehindConfig(flush_interval_ms=10))
+        log: list[str] = []
+
+        assert await writer.submit(_recorder(log, "a")) is True
+        assert log == []
+
+        await writer.flush()
+        assert log == ["a"]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_by_key(self) -> None:
+        writer = MemoryWriteBehind(MemoryWriteBehindConfig(flush_interval_ms=10))
+        log: list[str] = []
+        for name in ("first", "second"):
+            write = _recorder(log, name)
+            await writer.submit(
+                MemoryWrite(kind="finding", run=write.run, key="same-lesson")
+            )
+        await writer.submit(_recorder(log, "other"))
+        await writer.close()
+
+        assert sorted(log) == ["first", "other"]
+        assert writer.stats()["deduped"] == 1
+        assert writer.stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ordered_writes_apply_in_submission_order(self) -> None:
+        writer = MemoryWriteBehind(MemoryWriteBehindConfig(flush_interval_ms=10))
+        log: list[str] = []
+        # The slower first write must still finish before the second starts.
+        for name, delay in (("failure", 0.02), ("success", 0.0)):
+            write = _recorder(log, name, delay)
+            await writer.submit(
+                MemoryWrite(kind="mistake", run=write.run, ordered=True)
+            )
+        await writer.close()
+
+        assert log == ["failure", "success"]
+
+    @pytest.mark.asyncio
+    async def test_batches_close_at_max_batch(self) -> None:
+        writer = MemoryWriteBehind(
+            MemoryWriteBehindConfig(max_batch=2, flush_interval_ms=10)
+        )
+        log: list[str] = []
+        for i in range(5):
+            await writer.submit(_recorder(log, str(i)))
+        await writer.close()
+
+        assert sorted(log) == ["0", "1", "2", "3", "4"]
+        assert writer.stats()["batches"] == 3
+
+    @pytest.mark.asyncio
+    async def test_overflow_is_dropped_and_counted(self) -> None:
+        writer = MemoryWriteBehind(
+            MemoryWriteBehindConfig(max_queue=2, flush_interval_ms=10)
+        )
+        log: list[str] = []
+        results = [await writer.submit(_recorder(log, str(i))) for i in range(3)]
+        await writer.close()
+
+        assert results == [True, True, False]
+        assert len(log) == 2
+        assert writer.stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_stop_worker(self) -> None:
+        writer = MemoryWriteBehind(MemoryWriteBehindConfig(flush_interval_ms=0))
+        log: list[str] = []
+
+        async def boom() -> None:
+            raise RuntimeError("memory bank down")
+
+        await writer.submit(MemoryWrite(kind="finding", run=boom))
+        await writer.flush()
+        await writer.submit(_recorder(log, "after"))
+        await writer.close()
+
+        assert log == ["after"]
+        assert writer.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_applies_inline(self) -> None:
+        writer = MemoryWriteBehind(MemoryWriteBehindConfig(enabled=False))
+        log: list[str] = []
+
+        await writer.submit(_recorder(log, "inline"))
+
+        assert log == ["inline"]
+        assert writer.stats()["enqueued"] == 0
+
+    def test_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SRE_AGENT_MEMORY_WRITE_BEHIND", "false")
+        monkeypatch.setenv("SRE_AGENT_MEMORY_WRITE_BEHIND_QUEUE", "10")
+
+        config = MemoryWriteBehindConfig.from_env()
+
+        assert config.enabled is False
+        assert config.max_queue == 10
@@ -0,0 +1,319 @@
+"""Tests for incremental agent_graph_hourly rollup maintenance.
+
+Runs the maintainer against the SQLite stand-in backend so watermark
+tracking, late-arriving span reprocessing and freshness reporting are
+exercised end to end without BigQuery.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from sre_agent.services.agent_graph_rollup import (
+    AgentGraphRollupMaintainer,
+    BigQueryRollupBackend,
+    RollupConfig,
+    RollupTarget,
+    RollupWindow,
+    SqliteRollupBackend,
+    build_hourly_source_sql,
+    build_merge_sql,
+    build_scheduled_refresh_sql,
+    floor_hour,
+    main,
+)
+
+TARGET = RollupTarget("test-project", "agentops")
+NOW = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture()
+def conn() -> sqlite3.Connection:
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+@pytest.fixture()
+def backend(conn: sqlite3.Connection) -> SqliteRollupBackend:
+    return SqliteRollupBackend(conn)
+
+
+@pytest.fixture()
+def clock() -> _Clock:
+    return _Clock(NOW)
+
+
+@pytest.fixture()
+def maintainer(
+    backend: SqliteRollupBackend, clock: _Clock
+) -> AgentGraphRollupMaintainer:
+    config = RollupConfig(
+        reprocess_horizon_hours=2,
+        initial_lookback_hours=6,
+        max_hours_per_run=24,
+        stale_after_hours=2,
+    )
+    return AgentGraphRollupMaintainer(backend, config=config, clock=clock)
+
+
+def _add_edge(
+    conn: sqlite3.Connection,
+    start: datetime,
+    source: str = "Agent::root",
+    target: str = "Tool::fetch_logs",
+    weight: int = 1,
+    session_id: str = "s1",
+) -> None:
+    with conn:
+        conn.execute(
+            "INSERT INTO agent_topology_edges VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                "t1",
+                session_id,
+                start.strftime("%Y-%m-%d %H:%M:%S"),
+                source,
+                target,
+                weight,
+                10.0 * weight,
+                100 * weight,
+                0,
+                "svc",
+            ),
+        )
+
+
+def _hourly(conn: sqlite3.Connection) -> dict[str, int]:
+    rows = conn.execute(
+        "SELECT time_bucket, call_count FROM agent_graph_hourly ORDER BY 1"
+    ).fetchall()
+    return {bucket: calls for bucket, calls in rows}
+
+
+class TestPlanWindow:
+    def test_first_run_uses_initial_lookback(
+        self, maintainer: AgentGraphRollupMaintainer
+    ) -> None:
+        window = maintainer.plan_window(None)
+        assert window is not None
+        assert window.end == floor_hour(NOW)
+        assert window.hours == 6
+
+    def test_reprocesses_horizon_before_watermark(
+        self, maintainer: AgentGraphRollupMaintainer
+    ) -> None:
+        window = maintainer.plan_window(datetime(2026, 3, 1, 11, tzinfo=timezone.utc))
+        assert window == RollupWindow(
+            start=datetime(2026, 3, 1, 9, tzinfo=timezone.utc),
+            end=datetime(2026, 3, 1, 12, tzinfo=timezone.utc),
+        )
+
+    def test_never_includes_open_hour(
+        self, maintainer: AgentGraphRollupMaintainer
+    ) -> None:
+        window = maintainer.plan_window(floor_hour(NOW))
+        assert window is not None
+        assert window.end == floor_hour(NOW)
+
+    def test_caps_hours_per_run(self, backend: SqliteRollupBackend) -> None:
+        m = AgentGraphRollupMaintainer(
+            backend,
+            config=RollupConfig(reprocess_horizon_hours=0, max_hours_per_run=3),
+            clock=_Clock(NOW),
+        )
+        watermark = floor_hour(NOW) - timedelta(hours=10)
+        window = m.plan_window(watermark)
+        assert window is not None
+        assert window.end == watermark + timedelta(hours=3)
+
+    def test_nothing_to_do_without_horizon(self, backend: SqliteRollupBackend) -> None:
+        m = AgentGraphRollupMaintainer(
+            backend,
+            config=RollupConfig(reprocess_horizon_hours=0),
+            clock=_Clock(NOW),
+        )
+        assert m.plan_window(floor_hour(NOW)) is None
+
+
+class TestRefresh:
+    def test_first_refresh_materializes_closed_hours_only(
+        self,
+        maintainer: AgentGraphRollupMaintainer,
+        conn: sqlite3.Connection,
+    ) -> None:
+        _add_edge(conn, datetime(2026, 3, 1, 10, 5))
+        _add_edge(conn, datetime(2026, 3, 1, 10, 45), weight=2)
+        _add_edge(conn, datetime(2026, 3, 1, 12, 10))  # open hour
+
+        result = maintainer.refresh(TARGET)
+
+        assert result.watermark == datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        assert _hourly(conn) == {"2026-03-01 10:00:00": 3}
+
+    def test_late_arriving_span_is_reprocessed(
+        self,
+        maintainer: AgentGraphRollupMaintainer,
+        conn: sqlite3.Connection,
+        clock: _Clock,
+    ) -> None:
+        _add_edge(conn, datetime(2026, 3, 1, 11, 5))
+        maintainer.refresh(TARGET)
+        assert _hourly(conn) == {"2026-03-01 11:00:00": 1}
+
+        # A span for 11:xx lands after the 11:00 bucket was rolled up.
+        _add_edge(conn, datetime(2026, 3, 1, 11, 50), weight=4)
+        clock.now = NOW + timedelta(hours=1)
+        result = maintainer.refresh(TARGET)
+
+        assert result.window is not None
+        assert result.window.start == datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        assert _hourly(conn) == {"2026-03-01 11:00:00": 5}
+
+    def test_merge_deletes_vanished_keys_inside_window_only(
+        self,
+        maintainer: AgentGraphRollupMaintainer,
+        conn: sqlite3.Connection,
+    ) -> None:
+        with conn:
+            conn.execute(
+                "INSERT INTO agent_graph_hourly (time_bucket, source_id, target_id, "
+                "source_type, target_type, call_count) VALUES "
+                "('2026-03-01 10:00:00', 'Agent::gone', 'Tool::gone', 'Agent', 'Tool', 9),"
+                "('2026-02-01 10:00:00', 'Agent::old', 'Tool::old', 'Agent', 'Tool', 7)"
+            )
+        maintainer.refresh(TARGET)
+        assert _hourly(conn) == {"2026-02-01 10:00:00": 7}
+
+    def test_refresh_is_idempotent(
+        self,
+        maintainer: AgentGraphRollupMaintainer,
+        conn: sqlite3.Connection,
+    ) -> None:
+        _add_edge(conn, datetime(2026, 3, 1, 9, 5))
+        maintainer.refresh(TARGET)
+        maintainer.refresh(TARGET)
+        assert _hourly(conn) == {"2026-03-01 09:00:00": 1}
+
+
+class TestStatus:
+    def test_uninitialized_before_first_run(
+        self, maintainer: AgentGraphRollupMaintainer
+    ) -> None:
+        status = maintainer.get_status(TARGET)
+        assert status["status"] == "uninitialized"
+        assert status["raw_fallback_from"] is None
+
+    def test_fresh_then_stale(
+        self, maintainer: AgentGraphRollupMaintainer, clock: _Clock
+    ) -> None:
+        maintainer.refresh(TARGET)
+        status = maintainer.get_status(TARGET)
+        assert status["status"] == "fresh"
+        assert status["lag_hours"] == 0
+        assert status["last_run"]["hours_processed"] == 6
+
+        clock.now = NOW + timedelta(hours=5)
+        assert maintainer.get_status(TARGET)["status"] == "stale"
+
+    def test_watermark_survives_new_maintainer(
+        self, maintainer: AgentGraphRollupMaintainer, backend: SqliteRollupBackend
+    ) -> None:
+        maintainer.refresh(TARGET)
+        fresh = AgentGraphRollupMaintainer(backend, clock=_Clock(NOW))
+        assert fresh.get_watermark(TARGET) == floor_hour(NOW)
+
+    def test_watermark_advanced_elsewhere_is_seen_after_ttl(
+        self, backend: SqliteRollupBackend, clock: _Clock
+    ) -> None:
+        reader = AgentGraphRollupMaintainer(
+            backend, config=RollupConfig(watermark_ttl_seconds=60), clock=clock
+        )
+        assert reader.get_watermark(TARGET) is None
+
+        # Another worker (or the scheduled query) advances the watermark.
+        writer = AgentGraphRollupMaintainer(
+            backend, config=RollupConfig(initial_lookback_hours=6), clock=clock
+        )
+        assert writer.refresh(TARGET).watermark == floor_hour(NOW)
+        assert reader.get_watermark(TARGET) is None
+
+        clock.now = NOW + timedelta(seconds=61)
+        assert reader.get_watermark(TARGET) == floor_hour(NOW)
+        assert reader.get_status(TARGET)["status"] == "fresh"
+
+
+class TestBigQuerySql:
+    def test_merge_is_bounded_to_window(self) -> None:
+        window = RollupWindow(
+            start=datetime(2026, 3, 1, 9, tzinfo=timezone.utc),
+            end=datetime(2026, 3, 1, 12, tzinfo=timezone.utc),
+        )
+        sql = build_merge_sql(TARGET, window)
+        assert "MERGE `test-project.agentops.agent_graph_hourly` T" in sql
+        assert "WHEN NOT MATCHED BY SOURCE" in sql
+        assert "TIMESTAMP('2026-03-01 09:00:00 UTC')" in sql
+        assert "TIMESTAMP('2026-03-01 12:00:00 UTC')" in sql
+
+    def test_hourly_source_without_watermark_reads_everything_raw(self) -> None:
+        sql = build_hourly_source_sql("p", "d")
+        assert "`p.d.agent_graph_hourly`" not in sql
+        assert "`p.d.agent_topology_edges`" in sql
+        assert "UNION ALL" not in sql
+
+    def test_hourly_source_uses_watermark(self) -> None:
+        sql = build_hourly_source_sql(
+            "p", "d", datetime(2026, 3, 1, 9, tzinfo=timezone.utc)
+        )
+        assert "time_bucket < TIMESTAMP('2026-03-01 09:00:00 UTC')" in sql
+
+    def test_hourly_source_tail_types_nodes_like_rollup(self) -> None:
+        sql = build_hourly_source_sql(
+            "p", "d", datetime(2026, 3, 1, 9, tzinfo=timezone.utc)
+        )
+        tail = sql.split("UNION ALL")[1]
+        assert "`p.d.agent_topology_nodes` n_dst" in tail
+        assert "n_src.node_type AS source_type" in tail
+        assert "n_dst.node_type AS target_type" in tail
+        assert "SPLIT(" not in sql
+
+    def test_scheduled_refresh_merges_since_watermark(self) -> None:
+        sql = build_scheduled_refresh_sql(
+            TARGET, RollupConfig(reprocess_horizon_hours=3, max_hours_per_run=24)
+        )
+        # BigQuery only accepts DECLARE at the top of a script.
+        assert sql.strip().startswith("DECLARE")
+        assert "MERGE `test-project.agentops.agent_graph_hourly` T" in sql
+        assert "MERGE `test-project.agentops.agent_graph_rollup_state` T" in sql
+        assert "WHERE target = 'test-project.agentops'" in sql
+        assert "INTERVAL 3 HOUR" in sql
+        assert "INTERVAL 24 HOUR" in sql
+        assert "T.time_bucket >= window_start" in sql
+        assert "INSERT INTO" not in sql
+
+    def test_bigquery_backend_reports_affected_rows(self) -> None:
+        client = MagicMock()
+        client.query_and_wait.return_value.num_dml_affected_rows = 42
+        backend = BigQueryRollupBackend(lambda _project: client)
+        window = RollupWindow(
+            start=datetime(2026, 3, 1, 9, tzinfo=timezone.utc),
+            end=datetime(2026, 3, 1, 10, tzinfo=timezone.utc),
+        )
+        assert backend.merge_hours(TARGET, window) == 42
+
+    def test_cli_prints_scheduled_refresh_script(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        main(["test-project", "agentops"])
+        out = capsys.readouterr().out
+        assert out.startswith("DECLARE")
+        assert (
+            out.strip() == build_scheduled_refresh_sql(TARGET, RollupConfig()).strip()
+        )
@@ -0,0 +1,175 @@
+"""Tests for batched dashboard panel data resolution."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sre_agent.services.dashboard_panel_resolver import (
+    DEFAULT_FETCHERS,
+    BackendQuery,
+    PanelQueryResolver,
+    PanelResolverConfig,
+    QueryKind,
+    plan_dashboard,
+)
+
+CPU = 'metric.type="compute.googleapis.com/instance/cpu/utilization"'
+
+
+def _metric_panel(panel_id: str, aggregation: str) -> dict[str, Any]:
+    return {
+        "id": panel_id,
+        "queries": [
+            {
+                "datasource": {"type": "cloud_monitoring"},
+                "cloud_monitoring": {"filter_str": CPU, "aggregation": aggregation},
+            }
+        ],
+    }
+
+
+def _log_panel(panel_id: str, severities: list[str] | None) -> dict[str, Any]:
+    logs: dict[str, Any] = {"filter_str": 'resource.type="k8s_container"'}
+    if severities:
+        logs["severity_levels"] = severities
+    return {
+        "id": panel_id,
+        "queries": [{"datasource": {"type": "loki"}, "logs": logs}],
+    }
+
+
+DASHBOARD: dict[str, Any] = {
+    "id": "d1",
+    "project_id": "proj",
+    "panels": [
+        _metric_panel("cpu-mean", "ALIGN_MEAN"),
+        _metric_panel("cpu-max", "ALIGN_MAX"),
+        _log_panel("errors", ["ERROR"]),
+        _log_panel("warnings", ["WARNING"]),
+        {
+            "id": "traces",
+            "queries": [
+                {"datasource": {"type": "tempo"}, "logs": {"filter_str": "span:x"}}
+            ],
+        },
+        {"id": "text", "type": "text"},
+    ],
+}
+
+
+class FakeBackend:
+    def __init__(self) -> None:
+        self.calls: list[BackendQuery] = []
+
+    def fetchers(self) -> dict[QueryKind, Any]:
+        async def fetch(query: BackendQuery, start: datetime) -> Any:
+            self.calls.append(query)
+            if query.kind is QueryKind.LOGS:
+                entries = [
+                    {"severity": "ERROR", "message": "boom"},
+                    {"severity": "WARNING", "message": "careful"},
+                ]
+                return [
+                    e
+                    for e in entries
+                    if not query.severities or e["severity"] in query.severities
+                ]
+            if query.kind is QueryKind.TRACES:
+                raise RuntimeError("trace backend down")
+            return {"series": [query.expression]}
+
+        return {kind: fetch for kind in QueryKind}
+
+
+def test_plan_dedupes_metrics_and_limits_each_log_panel() -> None:
+    plan = plan_dashboard(DASHBOARD, None, 60, PanelResolverConfig(log_limit=50))
+
+    assert len(plan.refs) == 5
+    assert plan.skipped == 0
+    kinds = sorted(q.kind.value for q in plan.queries)
+    assert kinds == ["logs", "logs", "metrics", "traces"]
+    logs = [q for q in plan.queries if q.kind is QueryKind.LOGS]
+    assert [q.severities for q in logs] == [
+        frozenset({"ERROR"}),
+        frozenset({"WARNING"}),
+    ]
+    assert all(q.limit == 50 and q.project_id == "proj" for q in logs)
+
+
+def test_plan_merges_log_panels_with_identical_severities() -> None:
+    dashboard = {
+        "panels": [
+            _log_panel("a", ["ERROR", "WARNING"]),
+            _log_panel("b", ["warning", "error"]),
+        ]
+    }
+
+    plan = plan_dashboard(dashboard, "proj", 60)
+
+    assert len(plan.refs) == 2
+    assert len(plan.queries) == 1
+
+
+@pytest.mark.asyncio()
+async def test_resolve_issues_one_call_per_backend_query() -> None:
+    backend = FakeBackend()
+    resolver = PanelQueryResolver(PanelResolverConfig(), backend.fetchers())
+
+    result = await resolver.resolve(DASHBOARD)
+
+    assert len(backend.calls) == 4
+    assert result["stats"]["panel_queries"] == 5
+    assert result["stats"]["backend_calls"] == 4
+    panels = result["panels"]
+    assert panels["cpu-mean"][0]["data"] == panels["cpu-max"][0]["data"]
+    assert [e["message"] for e in panels["errors"][0]["data"]] == ["boom"]
+    assert [e["message"] for e in panels["warnings"][0]["data"]] == ["careful"]
+    assert panels["traces"][0]["error"] == "trace backend down"
+
+
+@pytest.mark.asyncio()
+async def test_resolve_reuses_results_within_cache_window() -> None:
+    backend = FakeBackend()
+    resolver = PanelQueryResolver(
+        PanelResolverConfig(cache_window_seconds=3600), backend.fetchers()
+    )
+
+    await resolver.resolve(DASHBOARD)
+    second = await resolver.resolve(DASHBOARD)
+
+    # Only the failed trace query is retried.
+    assert [q.kind for q in backend.calls[4:]] == [QueryKind.TRACES]
+    assert second["stats"]["cache_hits"] == 3
+
+
+@pytest.mark.asyncio()
+async def test_log_panel_without_severities_fetches_all() -> None:
+    backend = FakeBackend()
+    resolver = PanelQueryResolver(PanelResolverConfig(), backend.fetchers())
+    dashboard = {"panels": [_log_panel("all", None), _log_panel("err", ["error"])]}
+
+    result = await resolver.resolve(dashboard, project_id="proj")
+
+    # The unfiltered panel must not use up the filtered panel's limit.
+    assert [q.severities for q in backend.calls] == [frozenset(), {"ERROR"}]
+    assert len(result["panels"]["all"][0]["data"]) == 2
+    assert len(result["panels"]["err"][0]["data"]) == 1
+
+
+@pytest.mark.asyncio()
+async def test_metrics_fetch_covers_the_aligned_window_start() -> None:
+    start = datetime.now(timezone.utc) - timedelta(minutes=65)
+    query = BackendQuery(QueryKind.METRICS, "proj", CPU, 60)
+
+    with (
+        patch("sre_agent.tools.list_time_series", new=AsyncMock(return_value=[])) as ts,
+        patch(
+            "sre_agent.tools.analysis.genui_adapter.transform_metrics",
+            side_effect=lambda raw: raw,
+        ),
+    ):
+        await DEFAULT_FETCHERS[QueryKind.METRICS](query, start)
+
+    assert ts.await_args.kwargs["minutes_ago"] == 66
@@ -1,18 +1,20 @@
 """Tests for dashboard service."""
 
+from pathlib import Path
+
 import pytest
 
 from sre_agent.services.dashboard_service import (
     DashboardService,
-    _dashboard_store,
     get_dashboard_service,
 )
+from sre_agent.services.dashboard_store import DashboardConflictError
 
 
 @pytest.fixture(autouse=True)
-def _clear_store() -> None:
-    """Clear the dashboard store before each test."""
-    _dashboard_store.clear()
+def _fresh_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own empty dashboard database."""
+    monkeypatch.setenv("SRE_AGENT_DASHBOARD_DB", str(tmp_path / "dashboards.db"))
 
 
 class TestDashboardService:
@@ -193,6 +195,54 @@ class TestDashboardService:
         panel = next(p for p in result["panels"] if p["id"] == "p1")
         assert panel["grid_position"] == new_pos
 
+    @pytest.mark.asyncio()
+    async def test_panel_edit_with_stale_version_raises(
+        self, service: DashboardService
+    ) -> None:
+        dash = await service.create_dashboard(display_name="Conflict")
+        await service.add_panel(dash["id"], {"title": "A"}, expected_version=1)
+        with pytest.raises(DashboardConflictError):
+            await service.add_panel(dash["id"], {"title": "B"}, expected_version=1)
+
+    @pytest.mark.asyncio()
+    async def test_list_dashboards_paginates(self, service: DashboardService) -> None:
+        for i in range(3):
+            await service.create_dashboard(display_name=f"D{i}")
+        first = await service.list_dashboards(include_cloud=False, page_size=2)
+        second = await service.list_dashboards(
+            include_cloud=False, page_size=2, page_token=first["next_page_token"]
+        )
+        assert first["total_count"] == 3
+        assert len(first["dashboards"]) == 2
+        assert len(second["dashboards"]) == 1
+        assert second["next_page_token"] is None
+
+    @pytest.mark.asyncio()
+    async def test_cloud_dashboards_are_listed_on_the_first_page(
+        self, service: DashboardService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def cloud(project_id: str) -> list[dict[str, str]]:
+            return [{"id": "cloud-1", "source": "cloud_monitoring"}]
+
+        monkeypatch.setattr(service, "_cached_cloud_dashboards", cloud)
+        for i in range(3):
+            await service.create_dashboard(display_name=f"D{i}", project_id="proj")
+        first = await service.list_dashboards(project_id="proj", page_size=2)
+        second = await service.list_dashboards(
+            project_id="proj", page_size=2, page_token=first["next_page_token"]
+        )
+        assert first["total_count"] == 4
+        assert first["dashboards"][-1]["id"] == "cloud-1"
+        assert "cloud-1" not in [d["id"] for d in second["dashboards"]]
+
+    @pytest.mark.asyncio()
+    async def test_dashboards_survive_service_restart(
+        self, service: DashboardService
+    ) -> None:
+        created = await service.create_dashboard(display_name="Persistent")
+        fresh = DashboardService()
+        assert await fresh.get_dashboard(created["id"]) is not None
+
     def test_find_next_position_empty(self) -> None:
         service = DashboardService()
         pos = service._find_next_position([])
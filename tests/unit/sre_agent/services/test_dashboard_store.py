@@ -0,0 +1,155 @@
+"""Tests for the SQLite dashboard store."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from sre_agent.services.dashboard_store import (
+    MAX_PAGE_SIZE,
+    DashboardConflictError,
+    DashboardStore,
+)
+
+
+def _dashboard(dashboard_id: str, updated_at: str, **kwargs: object) -> dict:
+    return {
+        "id": dashboard_id,
+        "display_name": f"Dashboard {dashboard_id}",
+        "panels": [{"id": "p1"}],
+        "metadata": {"updated_at": updated_at, "version": 1},
+        **kwargs,
+    }
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> DashboardStore:
+    return DashboardStore(str(tmp_path / "dashboards.db"))
+
+
+@pytest.mark.asyncio()
+async def test_put_get_delete_round_trip(store: DashboardStore) -> None:
+    await store.put(_dashboard("d1", "2026-01-01T00:00:00"))
+
+    loaded = await store.get("d1")
+    assert loaded is not None
+    assert loaded["panels"] == [{"id": "p1"}]
+
+    assert await store.delete("d1") is True
+    assert await store.get("d1") is None
+    assert await store.delete("d1") is False
+
+
+@pytest.mark.asyncio()
+async def test_list_page_paginates_newest_first(store: DashboardStore) -> None:
+    for i in range(5):
+        await store.put(_dashboard(f"d{i}", f"2026-01-0{i + 1}T00:00:00"))
+
+    first = await store.list_page(page_size=2)
+    assert [d["id"] for d in first.dashboards] == ["d4", "d3"]
+    assert first.total_count == 5
+    assert first.dashboards[0]["panel_count"] == 1
+
+    second = await store.list_page(page_size=2, page_token=first.next_page_token)
+    third = await store.list_page(page_size=2, page_token=second.next_page_token)
+    assert [d["id"] for d in second.dashboards] == ["d2", "d1"]
+    assert [d["id"] for d in third.dashboards] == ["d0"]
+    assert third.next_page_token is None
+
+
+@pytest.mark.asyncio()
+async def test_list_page_filters_by_project_and_owner(store: DashboardStore) -> None:
+    await store.put(_dashboard("a", "2026-01-01", project_id="p1"))
+    b = _dashboard("b", "2026-01-02", project_id="p1")
+    b["metadata"]["created_by"] = "alice@example.com"
+    await store.put(b)
+    await store.put(_dashboard("c", "2026-01-03", project_id="p2"))
+
+    by_project = await store.list_page(project_id="p1")
+    by_owner = await store.list_page(project_id="p1", owner="alice@example.com")
+
+    assert [d["id"] for d in by_project.dashboards] == ["b", "a"]
+    assert [d["id"] for d in by_owner.dashboards] == ["b"]
+    assert by_owner.total_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_list_page_includes_dashboards_without_project(
+    store: DashboardStore,
+) -> None:
+    await store.put(_dashboard("legacy", "2026-01-01"))
+    await store.put(_dashboard("a", "2026-01-02", project_id="p1"))
+    await store.put(_dashboard("c", "2026-01-03", project_id="p2"))
+
+    page = await store.list_page(project_id="p1")
+
+    assert [d["id"] for d in page.dashboards] == ["a", "legacy"]
+    assert page.total_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_list_page_rejects_bad_token(store: DashboardStore) -> None:
+    with pytest.raises(ValueError, match="Invalid page token"):
+        await store.list_page(page_token="not-a-token")
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("page_size", [0, -1])
+async def test_list_page_rejects_non_positive_page_size(
+    store: DashboardStore, page_size: int
+) -> None:
+    await store.put(_dashboard("d1", "2026-01-01T00:00:00"))
+    with pytest.raises(ValueError, match="page_size"):
+        await store.list_page(page_size=page_size)
+
+
+@pytest.mark.asyncio()
+async def test_list_page_caps_page_size(store: DashboardStore) -> None:
+    for i in range(MAX_PAGE_SIZE + 2):
+        await store.put(
+            _dashboard(f"d{i:03d}", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}")
+        )
+
+    page = await store.list_page(page_size=10_000)
+
+    assert len(page.dashboards) == MAX_PAGE_SIZE
+    assert page.next_page_token is not None
+
+
+@pytest.mark.asyncio()
+async def test_list_page_empty_store(store: DashboardStore) -> None:
+    page = await store.list_page(page_size=1)
+    assert page.dashboards == []
+    assert page.next_page_token is None
+
+
+@pytest.mark.asyncio()
+async def test_mutate_bumps_version_and_serializes_edits(
+    store: DashboardStore,
+) -> None:
+    await store.put(_dashboard("d1", "2026-01-01T00:00:00", panels=[]))
+
+    def add(i: int):
+        return lambda doc: doc["panels"].append({"id": f"p{i}"})
+
+    await asyncio.gather(*(store.mutate("d1", add(i)) for i in range(10)))
+
+    loaded = await store.get("d1")
+    assert loaded is not None
+    assert len(loaded["panels"]) == 10
+    assert loaded["metadata"]["version"] == 11
+    assert await store.mutate("missing", add(0)) is None
+
+
+@pytest.mark.asyncio()
+async def test_mutate_rejects_stale_version(store: DashboardStore) -> None:
+    await store.put(_dashboard("d1", "2026-01-01T00:00:00"))
+    await store.mutate("d1", lambda doc: None, expected_version=1)
+
+    with pytest.raises(DashboardConflictError) as excinfo:
+        await store.mutate("d1", lambda doc: doc.update(panels=[]), expected_version=1)
+
+    assert excinfo.value.actual == 2
+    loaded = await store.get("d1")
+    assert loaded is not None
+    assert loaded["panels"] == [{"id": "p1"}]
@@ -0,0 +1,146 @@
+"""Tests for the write-behind session event journal."""
+
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from sre_agent.services.session import ADKSessionManager
+
+
+def _event(text: str, partial: bool = False, **state: str) -> Event:
+    return Event(
+        invocation_id=str(uuid.uuid4()),
+        author="sre_agent",
+        content=types.Content(role="model", parts=[types.Part.from_text(text=text)]),
+        actions=EventActions(state_delta=state),
+        partial=partial,
+        timestamp=time.time(),
+    )
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch: pytest.MonkeyPatch) -> ADKSessionManager:
+    monkeypatch.delenv("SRE_AGENT_ID", raising=False)
+    monkeypatch.setenv("RUNNING_IN_AGENT_ENGINE", "false")
+    monkeypatch.setenv("USE_DATABASE_SESSIONS", "true")
+    monkeypatch.setenv("SESSION_DB_PATH", str(tmp_path / "sessions.db"))
+    return ADKSessionManager()
+
+
+async def _stored_texts(manager: ADKSessionManager, session_id: str) -> list[str]:
+    stored = await manager.session_service.get_session(
+        app_name=manager.app_name, user_id="u1", session_id=session_id
+    )
+    return [e.content.parts[0].text for e in stored.events if e.content]
+
+
+class TestSessionEventJournal:
+    """Tests for acknowledging events in memory and persisting them in order."""
+
+    @pytest.mark.asyncio
+    async def test_append_acknowledges_in_memory_before_persisting(
+        self, manager: ADKSessionManager
+    ) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+
+        await journal.append(_event("one", phase="triage"))
+
+        # The running agent sees the event and state delta immediately.
+        assert [e.content.parts[0].text for e in session.events] == ["one"]
+        assert session.state["phase"] == "triage"
+
+        await journal.close()
+        assert await _stored_texts(manager, session.id) == ["one"]
+
+    @pytest.mark.asyncio
+    async def test_events_persist_in_order(self, manager: ADKSessionManager) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+        texts = [f"chunk-{i}" for i in range(20)]
+
+        for text in texts:
+            await journal.append(_event(text))
+        await journal.flush()
+
+        assert await _stored_texts(manager, session.id) == texts
+        assert len(session.events) == len(texts)
+        assert journal.stats()["persisted"] == len(texts)
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_events_are_not_persisted(
+        self, manager: ADKSessionManager
+    ) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+
+        await journal.append(_event("stream", partial=True))
+        await journal.append(_event("final"))
+        await journal.close()
+
+        assert await _stored_texts(manager, session.id) == ["final"]
+
+    @pytest.mark.asyncio
+    async def test_direct_writes_go_through_open_journal(
+        self, manager: ADKSessionManager
+    ) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+
+        await journal.append(_event("answer"))
+        await manager.update_session_state(session, {"title": "Latency spike"})
+        await journal.close()
+
+        # Writes after close hit storage directly and still pass the
+        # stale-session check, since the journal kept the revision current.
+        await manager.update_session_state(session, {"title": "Renamed"})
+
+        stored = await manager.session_service.get_session(
+            app_name=manager.app_name, user_id="u1", session_id=session.id
+        )
+        assert stored.state["title"] == "Renamed"
+        assert len(stored.events) == 3
+        assert stored.events[0].content.parts[0].text == "answer"
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_counted_and_stream_continues(
+        self, manager: ADKSessionManager
+    ) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+        original = manager.session_service.append_event
+        calls = 0
+
+        async def flaky(sess, event):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("storage unavailable")
+            return await original(sess, event)
+
+        with patch.object(manager.session_service, "append_event", flaky):
+            await journal.append(_event("lost"))
+            await journal.append(_event("kept"))
+            await journal.flush()
+
+        assert journal.stats()["failed"] == 1
+        assert await _stored_texts(manager, session.id) == ["kept"]
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_journal(self, manager: ADKSessionManager) -> None:
+        session = await manager.create_session(user_id="u1")
+        journal = manager.open_journal(session)
+        assert manager.open_journal(session) is journal
+
+        await manager.close_journals()
+
+        assert journal.closed
+        assert manager.open_journal(session) is not journal
+        with pytest.raises(RuntimeError):
+            await journal.append(_event("late"))
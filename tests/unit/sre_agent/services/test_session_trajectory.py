@@ -0,0 +1,207 @@
+"""Tests for bounded, cached and streamed session trajectory assembly."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.services.session_trajectory import (
+    SessionTrajectoryAssembler,
+    TrajectoryConfig,
+    build_trace_log_filter,
+    reset_fetch_limiter,
+)
+from sre_agent.tools.common.cache import get_data_cache
+
+
+def _row(trace_id: str, span_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_id=None,
+        start_time=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        node_type="LLM",
+        node_label="gemini",
+        duration_ms=10.0,
+        status_code=0,
+        status_desc=None,
+        input_tokens=1,
+        output_tokens=2,
+        request_model="gemini-2.5-flash",
+    )
+
+
+def _trace(trace_id: str, span_id: str) -> dict[str, Any]:
+    return {
+        "trace_id": trace_id,
+        "spans": [{"span_id": span_id, "labels": {"gen_ai.prompt": trace_id}}],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    get_data_cache().clear()
+    reset_fetch_limiter()
+    yield
+    get_data_cache().clear()
+    reset_fetch_limiter()
+
+
+CONFIG = TrajectoryConfig(
+    max_concurrent_traces=3,
+    max_traces_per_log_filter=100,
+    log_page_size=50,
+    max_log_pages=3,
+)
+
+
+def test_log_filter_uses_single_grouped_trace_clause() -> None:
+    assert build_trace_log_filter("p", ["a", "b"]) == (
+        'trace=("projects/p/traces/a" OR "projects/p/traces/b")'
+    )
+
+
+@pytest.mark.asyncio()
+async def test_trace_fetches_are_bounded() -> None:
+    rows = [_row(f"t{i}", f"s{i}") for i in range(12)]
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_fetch(project_id: str, trace_id: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _trace(trace_id, f"s{trace_id[1:]}")
+
+    with (
+        patch("sre_agent.tools.clients.trace._fetch_trace_sync", fake_fetch),
+        patch(
+            "sre_agent.tools.clients.logging._list_log_entries_sync",
+            return_value={"entries": []},
+        ),
+    ):
+        trajectory = await SessionTrajectoryAssembler("p", CONFIG).assemble(rows)
+
+    assert peak <= CONFIG.max_concurrent_traces
+    assert [s["prompt"] for s in trajectory] == [f"t{i}" for i in range(12)]
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_requests_share_one_limiter() -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_fetch(project_id: str, trace_id: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return _trace(trace_id, "s")
+
+    with (
+        patch("sre_agent.tools.clients.trace._fetch_trace_sync", fake_fetch),
+        patch(
+            "sre_agent.tools.clients.logging._list_log_entries_sync",
+            return_value={"entries": []},
+        ),
+    ):
+        await asyncio.gather(
+            *(
+                SessionTrajectoryAssembler("p", CONFIG).assemble(
+                    [_row(f"r{r}t{i}", f"r{r}s{i}") for i in range(6)]
+                )
+                for r in range(4)
+            )
+        )
+
+    assert peak <= CONFIG.max_concurrent_traces
+
+
+@pytest.mark.asyncio()
+async def test_cached_traces_skip_fetch() -> None:
+    get_data_cache().put("trace:t1", _trace("t1", "s1"))
+    assembler = SessionTrajectoryAssembler("p", CONFIG)
+
+    with (
+        patch("sre_agent.tools.clients.trace._fetch_trace_sync") as mock_fetch,
+        patch(
+            "sre_agent.tools.clients.logging._list_log_entries_sync",
+            return_value={"entries": []},
+        ),
+    ):
+        trajectory = await assembler.assemble([_row("t1", "s1")])
+
+    mock_fetch.assert_not_called()
+    assert assembler.cache_hits == 1
+    assert trajectory[0]["prompt"] == "t1"
+
+
+@pytest.mark.asyncio()
+async def test_logs_use_one_filter_and_follow_pages() -> None:
+    rows = [_row("t1", "s1"), _row("t2", "s2")]
+    pages = {
+        None: {
+            "entries": [{"span_id": "s1", "severity": "INFO"}],
+            "next_page_token": "p2",
+        },
+        "p2": {"entries": [{"span_id": "s2", "severity": "ERROR"}]},
+    }
+    calls: list[tuple[str, str | None]] = []
+
+    def fake_logs(project_id, filter_str, limit, page_token, tool_context):
+        calls.append((filter_str, page_token))
+        return pages[page_token]
+
+    with (
+        patch(
+            "sre_agent.tools.clients.trace._fetch_trace_sync",
+            side_effect=lambda p, t: _trace(t, "x"),
+        ),
+        patch("sre_agent.tools.clients.logging._list_log_entries_sync", fake_logs),
+    ):
+        trajectory = await SessionTrajectoryAssembler("p", CONFIG).assemble(rows)
+
+    assert [token for _, token in calls] == [None, "p2"]
+    assert calls[0][0] == build_trace_log_filter("p", ["t1", "t2"])
+    assert trajectory[0]["logs"][0]["severity"] == "INFO"
+    assert trajectory[1]["logs"][0]["severity"] == "ERROR"
+
+
+@pytest.mark.asyncio()
+async def test_stream_yields_skeleton_first_and_records_failures() -> None:
+    rows = [_row("t1", "s1"), _row("t2", "s2")]
+
+    def fake_fetch(project_id: str, trace_id: str) -> dict[str, Any]:
+        if trace_id == "t2":
+            raise RuntimeError("boom")
+        return _trace(trace_id, "s1")
+
+    with (
+        patch("sre_agent.tools.clients.trace._fetch_trace_sync", fake_fetch),
+        patch(
+            "sre_agent.tools.clients.logging._list_log_entries_sync",
+            return_value={"entries": []},
+        ),
+    ):
+        events = [e async for e in SessionTrajectoryAssembler("p", CONFIG).stream(rows)]
+
+    assert events[0]["type"] == "spans"
+    assert all(step["prompt"] is None for step in events[0]["trajectory"])
+    trace_events = {e["traceId"]: e for e in events if e["type"] == "trace"}
+    assert trace_events["t1"]["steps"][0]["prompt"] == "t1"
+    assert events[-1]["type"] == "complete"
+    assert events[-1]["failedTraces"] == ["t2"]
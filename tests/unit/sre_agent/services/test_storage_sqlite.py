@@ -0,0 +1,68 @@
+"""Tests for the SQLite preferences backend."""
+
+import json
+
+import pytest
+
+from sre_agent.core.local_db import close_local_databases
+from sre_agent.services.storage import SQLitePreferencesBackend, StorageService
+
+
+@pytest.fixture(autouse=True)
+def close_databases():
+    yield
+    close_local_databases()
+
+
+@pytest.mark.asyncio
+async def test_set_get_delete(tmp_path):
+    backend = SQLitePreferencesBackend(str(tmp_path / "prefs.db"), None)
+
+    assert await backend.get("u:selected_project") is None
+    await backend.set("u:selected_project", "proj-1")
+    await backend.set("u:tool_config", {"fetch_trace": True})
+    assert await backend.get("u:selected_project") == "proj-1"
+    assert await backend.get("u:tool_config") == {"fetch_trace": True}
+
+    await backend.set("u:selected_project", "proj-2")
+    assert await backend.get("u:selected_project") == "proj-2"
+
+    await backend.delete("u:selected_project")
+    assert await backend.get("u:selected_project") is None
+
+
+@pytest.mark.asyncio
+async def test_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "prefs.json"
+    legacy.write_text(json.dumps({"u:selected_project": "legacy-proj"}))
+    db_path = str(tmp_path / "prefs.db")
+
+    backend = SQLitePreferencesBackend(db_path, str(legacy))
+    assert await backend.get("u:selected_project") == "legacy-proj"
+
+    await backend.set("u:selected_project", "new-proj")
+    reopened = SQLitePreferencesBackend(db_path, str(legacy))
+    assert await reopened.get("u:selected_project") == "new-proj"
+
+
+@pytest.mark.asyncio
+async def test_storage_service_roundtrip(tmp_path):
+    storage = StorageService.__new__(StorageService)
+    storage._backend = SQLitePreferencesBackend(str(tmp_path / "prefs.db"), None)
+
+    await storage.add_saved_query({"id": "q1", "query": "severity>=ERROR"}, "u1")
+    assert [q["id"] for q in await storage.get_saved_queries("u1")] == ["q1"]
+
+
+@pytest.mark.asyncio
+async def test_storage_service_uses_configured_path(tmp_path, monkeypatch):
+    db_path = tmp_path / "configured.db"
+    monkeypatch.setenv("SRE_AGENT_PREFERENCES_DB", str(db_path))
+    monkeypatch.delenv("K_SERVICE", raising=False)
+    monkeypatch.delenv("USE_FIRESTORE", raising=False)
+
+    storage = StorageService()
+    await storage.set_selected_project("proj-1", "u1")
+
+    assert isinstance(storage._backend, SQLitePreferencesBackend)
+    assert db_path.exists()
@@ -0,0 +1,252 @@
+"""Tests for the per-principal telemetry source catalog."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from sre_agent.services.telemetry_catalog import (
+    DiscoveryError,
+    TelemetryCatalog,
+    TelemetryCatalogConfig,
+    TelemetrySources,
+)
+
+PROJECT = "proj"
+
+
+class FakeGCP:
+    """Routes discovery requests to canned Logging/Observability/BigQuery data."""
+
+    def __init__(
+        self,
+        datasets: dict[str, list[str]],
+        trace_link: str | None = None,
+        log_link: str | None = None,
+        dataset_status: int = 200,
+    ) -> None:
+        self.datasets = datasets
+        self.trace_link = trace_link
+        self.log_link = log_link
+        self.dataset_status = dataset_status
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(path)
+        bq = f"/bigquery/v2/projects/{PROJECT}/datasets"
+        if path.endswith("/buckets/_Default/links"):
+            return self._links(self.log_link)
+        if path.endswith("/locations/-/buckets"):
+            name = f"projects/{PROJECT}/locations/global/buckets/spans"
+            return httpx.Response(200, json={"buckets": [{"name": name}]})
+        if path.endswith("/buckets/spans/links"):
+            return self._links(self.trace_link, link_id="trace_link")
+        if path == bq:
+            if self.dataset_status != 200:
+                error = {"error": {"message": "Permission denied"}}
+                return httpx.Response(self.dataset_status, json=error)
+            refs = [{"datasetReference": {"datasetId": d}} for d in self.datasets]
+            return httpx.Response(200, json={"datasets": refs})
+        if path.startswith(bq) and path.endswith("/tables"):
+            dataset = path.split("/")[-2]
+            if dataset not in self.datasets:
+                return httpx.Response(404, json={})
+            refs = [{"tableReference": {"tableId": t}} for t in self.datasets[dataset]]
+            return httpx.Response(200, json={"tables": refs})
+        if path.startswith(bq) and "/tables/" in path:
+            fields = [{"name": "trace_id"}, {"name": "start_time"}]
+            return httpx.Response(200, json={"schema": {"fields": fields}})
+        return httpx.Response(404, json={})
+
+    def _links(self, dataset: str | None, link_id: str = "link") -> httpx.Response:
+        if not dataset:
+            return httpx.Response(200, json={})
+        link = {
+            "name": f"projects/{PROJECT}/links/{link_id}",
+            "bigqueryDataset": {
+                "datasetId": f"bigquery.googleapis.com/projects/{PROJECT}/datasets/"
+                f"{dataset}"
+            },
+        }
+        return httpx.Response(200, json={"links": [link]})
+
+
+def _catalog(fake: FakeGCP, **config: object) -> TelemetryCatalog:
+    return TelemetryCatalog(
+        TelemetryCatalogConfig(db_path="", **config),  # type: ignore[arg-type]
+        transport=httpx.MockTransport(fake),
+    )
+
+
+@pytest.fixture(autouse=True)
+def token():
+    with patch(
+        "sre_agent.services.telemetry_catalog._resolve_token", return_value="tok"
+    ) as mock:
+        yield mock
+
+
+class TestDiscovery:
+    """Tests for concurrent discovery of datasets, tables and schemas."""
+
+    @pytest.mark.asyncio
+    async def test_discovers_linked_datasets_tables_and_schemas(self) -> None:
+        fake = FakeGCP(
+            {"other": [], "traces": ["_AllSpans", "otel_spans_flat"], "logs": []},
+            trace_link="traces",
+            log_link="logs",
+        )
+        catalog = _catalog(fake)
+
+        sources = await catalog.get(PROJECT)
+
+        assert sources.trace_dataset == "traces"
+        assert sources.log_dataset == "logs"
+        assert sources.trace_table == "proj.traces._AllSpans"
+        assert sources.log_table is None
+        assert sources.typed_trace_table == "proj.traces.otel_spans_flat"
+        assert sources.mode == "bigquery"
+        assert sources.schemas["proj.traces._AllSpans"] == ["trace_id", "start_time"]
+        # Linked datasets are inspected first.
+        assert sources.datasets_scanned == ["traces", "logs", "other"]
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_unlinked_tables_found_by_scan(self) -> None:
+        fake = FakeGCP({"a": [], "b": ["_AllLogs"], "c": ["_AllSpans"]})
+        catalog = _catalog(fake)
+
+        sources = await catalog.get(PROJECT)
+
+        assert sources.trace_table == "proj.c._AllSpans"
+        assert sources.trace_dataset == "c"
+        assert sources.log_table == "proj.b._AllLogs"
+        assert sources.log_dataset == "b"
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_unlisted_project_probes_fallback_datasets(self) -> None:
+        fake = FakeGCP({"obs_bucket_spans": ["_AllSpans"]}, dataset_status=403)
+        catalog = _catalog(fake)
+
+        sources = await catalog.get(PROJECT)
+
+        assert sources.trace_table == "proj.obs_bucket_spans._AllSpans"
+        assert sources.datasets_scanned == ["obs_bucket_spans"]
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_permission_denied_raises_without_caching(self) -> None:
+        fake = FakeGCP({}, dataset_status=403)
+        catalog = _catalog(fake)
+
+        with pytest.raises(DiscoveryError) as exc_info:
+            await catalog.get(PROJECT)
+
+        assert exc_info.value.error_type == "PERMISSION_DENIED"
+        assert exc_info.value.non_retryable
+        assert catalog.peek(PROJECT) is None
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_raise(self, token: MagicMock) -> None:
+        token.return_value = None
+        catalog = _catalog(FakeGCP({}))
+
+        with pytest.raises(DiscoveryError) as exc_info:
+            await catalog.get(PROJECT)
+
+        assert exc_info.value.error_type == "AUTH_ERROR"
+
+
+class TestCaching:
+    """Tests for principal scoping, refresh and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_discovery(self) -> None:
+        fake = FakeGCP({"traces": ["_AllSpans"]})
+        catalog = _catalog(fake)
+
+        results = await asyncio.gather(*(catalog.get(PROJECT) for _ in range(5)))
+
+        assert all(r is results[0] for r in results)
+        assert catalog.stats()["discoveries"] == 1
+        assert catalog.peek(PROJECT, "adc") is results[0]
+        await catalog.get(PROJECT)
+        assert catalog.stats()["hits"] == 1
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_per_principal(self) -> None:
+        catalog = _catalog(FakeGCP({"traces": ["_AllSpans"]}))
+        principal = "sre_agent.services.telemetry_catalog.current_principal"
+
+        with patch(principal, return_value="alice@example.com"):
+            alice = await catalog.get(PROJECT)
+        with patch(principal, return_value="bob@example.com"):
+            bob = await catalog.get(PROJECT)
+
+        assert alice is not bob
+        assert catalog.stats()["discoveries"] == 2
+        assert catalog.peek(PROJECT, "alice@example.com") is alice
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_and_refreshed_in_background(self) -> None:
+        fake = FakeGCP({"traces": ["_AllSpans"]})
+        catalog = _catalog(fake, refresh_after_seconds=60.0)
+        first = await catalog.get(PROJECT)
+        first.discovered_at = time.time() - 120
+        fake.datasets["logs"] = ["_AllLogs"]
+
+        served = await catalog.get(PROJECT)
+        assert served is first
+        await asyncio.sleep(0.05)
+
+        refreshed = catalog.peek(PROJECT, "adc")
+        assert refreshed is not None
+        assert refreshed.log_table == "proj.logs._AllLogs"
+        assert catalog.stats()["refreshes"] == 1
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_restart(self, tmp_path) -> None:
+        db_path = str(tmp_path / "catalog.db")
+        fake = FakeGCP({"traces": ["_AllSpans"]})
+        catalog = TelemetryCatalog(
+            TelemetryCatalogConfig(db_path=db_path),
+            transport=httpx.MockTransport(fake),
+        )
+        await catalog.get(PROJECT)
+        await catalog.close()
+        requests = len(fake.paths)
+
+        # Let the group-commit writer persist the entry.
+        from sre_agent.core.local_db import get_local_database
+
+        await get_local_database(db_path).awrite(lambda conn: None)
+        restarted = TelemetryCatalog(
+            TelemetryCatalogConfig(db_path=db_path),
+            transport=httpx.MockTransport(fake),
+        )
+        sources = await restarted.get(PROJECT)
+
+        assert sources.trace_table == "proj.traces._AllSpans"
+        assert len(fake.paths) == requests
+        assert restarted.stats()["discoveries"] == 0
+
+
+def test_sources_round_trip_and_describe() -> None:
+    sources = TelemetrySources(
+        project_id=PROJECT,
+        principal="adc",
+        trace_table="proj.traces._AllSpans",
+        schemas={"proj.traces._AllSpans": ["trace_id"]},
+    )
+
+    assert TelemetrySources.from_dict(sources.to_dict()) == sources
+    assert sources.describe() == "Traces: proj.traces._AllSpans"
+    assert "Trace and Logging APIs" in TelemetrySources(PROJECT, "adc").describe()
@@ -6,6 +6,8 @@ tools and the sub-agent workflow.
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from sre_agent.tools.analysis.logs.extraction import (
     extract_messages_from_entries,
 )
@@ -19,14 +21,15 @@ from sre_agent.tools.analysis.logs.patterns import (
 class TestLogPatternAnalysisWorkflow:
     """Integration tests for the log pattern analysis workflow."""
 
-    def test_full_pattern_extraction_workflow(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_full_pattern_extraction_workflow(self, sample_text_payload_logs):
         """Test complete pattern extraction from raw logs."""
         # Step 1: Extract messages
         messages = extract_messages_from_entries(sample_text_payload_logs)
         assert len(messages) == len(sample_text_payload_logs)
 
         # Step 2: Extract patterns
-        result = extract_log_patterns(sample_text_payload_logs)
+        result = await extract_log_patterns(sample_text_payload_logs)
 
         # Verify workflow produced expected results
         assert result.status == "success"
@@ -35,22 +38,23 @@ class TestLogPatternAnalysisWorkflow:
         assert data["unique_patterns"] > 0
         assert data["compression_ratio"] >= 1.0
 
-    def test_incident_detection_workflow(
+    @pytest.mark.asyncio
+    async def test_incident_detection_workflow(
         self, baseline_period_logs, incident_period_logs
     ):
         """Test complete incident detection workflow."""
         # Step 1: Extract patterns from baseline
-        baseline_result = extract_log_patterns(baseline_period_logs)
+        baseline_result = await extract_log_patterns(baseline_period_logs)
         assert baseline_result.status == "success"
         assert baseline_result.result["total_logs_processed"] > 0
 
         # Step 2: Extract patterns from incident period
-        incident_result = extract_log_patterns(incident_period_logs)
+        incident_result = await extract_log_patterns(incident_period_logs)
         assert incident_result.status == "success"
         assert incident_result.result["total_logs_processed"] > 0
 
         # Step 3: Compare patterns to find anomalies
-        comparison = compare_log_patterns(
+        comparison = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
         )
@@ -67,10 +71,11 @@ class TestLogPatternAnalysisWorkflow:
         # Alert level should be elevated
         assert data["alert_level"] != ""
 
-    def test_error_triage_workflow(self, incident_period_logs):
+    @pytest.mark.asyncio
+    async def test_error_triage_workflow(self, incident_period_logs):
         """Test error-focused triage workflow."""
         # Step 1: Analyze for anomalies with error focus
-        result = analyze_log_anomalies(
+        result = await analyze_log_anomalies(
             incident_period_logs,
             focus_on_errors=True,
             max_results=10,
@@ -85,7 +90,8 @@ class TestLogPatternAnalysisWorkflow:
         # Should have actionable recommendation
         assert len(data["recommendation"]) > 0
 
-    def test_pattern_compression_effectiveness(self):
+    @pytest.mark.asyncio
+    async def test_pattern_compression_effectiveness(self):
         """Test that pattern extraction achieves meaningful compression."""
         # Generate repetitive logs
         logs = []
@@ -114,7 +120,7 @@ class TestLogPatternAnalysisWorkflow:
                 }
             )
 
-        result = extract_log_patterns(logs)
+        result = await extract_log_patterns(logs)
 
         assert result.status == "success"
         data = result.result
@@ -123,7 +129,8 @@ class TestLogPatternAnalysisWorkflow:
         assert data["unique_patterns"] <= 5
         assert data["compression_ratio"] >= 30  # At least 30:1 compression
 
-    def test_mixed_severity_analysis(self):
+    @pytest.mark.asyncio
+    async def test_mixed_severity_analysis(self):
         """Test analysis of logs with mixed severity levels."""
         logs = [
             {"textPayload": "Info message 1", "severity": "INFO"},
@@ -134,7 +141,7 @@ class TestLogPatternAnalysisWorkflow:
             {"textPayload": "Critical failure detected", "severity": "CRITICAL"},
         ]
 
-        result = analyze_log_anomalies(logs, focus_on_errors=True)
+        result = await analyze_log_anomalies(logs, focus_on_errors=True)
 
         assert result.status == "success"
         data = result.result
@@ -152,22 +159,24 @@ class TestLogPatternAnalysisWorkflow:
 class TestLogPatternToolIntegration:
     """Tests for tool integration in the log pattern workflow."""
 
-    def test_tools_work_with_empty_logs(self):
+    @pytest.mark.asyncio
+    async def test_tools_work_with_empty_logs(self):
         """Test that tools handle empty log lists gracefully."""
-        result = extract_log_patterns([])
+        result = await extract_log_patterns([])
         assert result.status == "success"
         assert result.result["total_logs_processed"] == 0
         assert result.result["unique_patterns"] == 0
 
-        comparison = compare_log_patterns([], [])
+        comparison = await compare_log_patterns([], [])
         assert comparison.status == "success"
         assert comparison.result["baseline_summary"]["total_logs"] == 0
 
-        anomalies = analyze_log_anomalies([])
+        anomalies = await analyze_log_anomalies([])
         assert anomalies.status == "success"
         assert anomalies.result["total_logs"] == 0
 
-    def test_tools_handle_malformed_entries(self):
+    @pytest.mark.asyncio
+    async def test_tools_handle_malformed_entries(self):
         """Test that tools handle malformed log entries."""
         logs = [
             {"textPayload": "Valid message", "severity": "INFO"},
@@ -177,13 +186,14 @@ class TestLogPatternToolIntegration:
         ]
 
         # Should not raise exceptions
-        result = extract_log_patterns(logs)
+        result = await extract_log_patterns(logs)
         assert result.status == "success"
         assert result.result["total_logs_processed"] == 4
 
-    def test_json_payload_field_detection(self, sample_json_payload_logs):
+    @pytest.mark.asyncio
+    async def test_json_payload_field_detection(self, sample_json_payload_logs):
         """Test that JSON payload fields are correctly detected."""
-        result = extract_log_patterns(sample_json_payload_logs)
+        result = await extract_log_patterns(sample_json_payload_logs)
 
         assert result.status == "success"
         data = result.result
@@ -191,10 +201,11 @@ class TestLogPatternToolIntegration:
         assert data["total_logs_processed"] == len(sample_json_payload_logs)
         assert data["unique_patterns"] > 0
 
-    def test_pattern_stability_across_runs(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_pattern_stability_across_runs(self, sample_text_payload_logs):
         """Test that pattern extraction is deterministic."""
-        result1 = extract_log_patterns(sample_text_payload_logs)
-        result2 = extract_log_patterns(sample_text_payload_logs)
+        result1 = await extract_log_patterns(sample_text_payload_logs)
+        result2 = await extract_log_patterns(sample_text_payload_logs)
 
         assert result1.status == "success"
         assert result2.status == "success"
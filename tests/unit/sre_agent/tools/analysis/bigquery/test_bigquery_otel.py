@@ -44,7 +44,7 @@ class TestBigQueryOtelTools:
 
         assert "sql_query" in result_data
         assert (
-            "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = 'payment-service'"
+            """JSON_VALUE(resource.attributes, '$."service.name"') = 'payment-service'"""
             in result_data["sql_query"]
         )
         assert "12 HOUR" in result_data["sql_query"]
@@ -189,7 +189,7 @@ class TestBigQueryOtelTools:
         result_data = result.result
 
         assert (
-            "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = 'checkout-service'"
+            """JSON_VALUE(resource.attributes, '$."service.name"') = 'checkout-service'"""
             in result_data["sql_query"]
         )
 
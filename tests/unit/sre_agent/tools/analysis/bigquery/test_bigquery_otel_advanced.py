@@ -127,7 +127,7 @@ class TestAnalyzeSpanLinks:
         data = result.result
         query = data["sql_query"]
         assert (
-            "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = 'frontend'"
+            """JSON_VALUE(resource.attributes, '$."service.name"') = 'frontend'"""
             in query
         )
 
@@ -265,7 +265,7 @@ class TestAnalyzeDatabaseOperations:
         assert result.status == ToolStatus.SUCCESS
         data = result.result
         query = data["sql_query"]
-        assert "db.system') = 'postgresql'" in query
+        assert """db.system"') = 'postgresql'""" in query
 
     def test_database_analysis_includes_sample_statements(self):
         """Test that database analysis includes sample SQL statements."""
@@ -36,7 +36,7 @@ class TestAnalyzeAggregateMetrics:
         data = result.result
         query = data["sql_query"]
         assert (
-            "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = 'frontend'"
+            """JSON_VALUE(resource.attributes, '$."service.name"') = 'frontend'"""
             in query
         )
 
@@ -78,7 +78,7 @@ class TestAnalyzeAggregateMetrics:
         assert "duration_nano" in query
         assert "status.code = 2" in query  # ERROR status
         assert "parent_span_id IS NULL" in query
-        assert "JSON_EXTRACT_SCALAR(resource.attributes" in query
+        assert "JSON_VALUE(resource.attributes" in query
 
     def test_query_group_by_service_name(self):
         """Test grouping by service name."""
@@ -91,7 +91,7 @@ class TestAnalyzeAggregateMetrics:
         assert result.status == ToolStatus.SUCCESS
         data = result.result
         query = data["sql_query"]
-        assert "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name')" in query
+        assert """JSON_VALUE(resource.attributes, '$."service.name"')""" in query
 
     def test_query_group_by_operation_name(self):
         """Test grouping by operation name."""
@@ -261,7 +261,7 @@ class TestCorrelateLogsWithTrace:
         assert "time_unix_nano" in query
         assert "severity_text" in query
         assert "body.string_value" in query
-        assert "JSON_EXTRACT_SCALAR(l.resource.attributes, '$.service.name')" in query
+        assert """JSON_VALUE(l.resource.attributes, '$."service.name"')""" in query
 
 
 class TestCompareTimePeriods:
@@ -299,7 +299,7 @@ class TestCompareTimePeriods:
         data = result.result
         query = data["sql_query"]
         assert (
-            "JSON_EXTRACT_SCALAR(resource.attributes, '$.service.name') = 'frontend'"
+            """JSON_VALUE(resource.attributes, '$."service.name"') = 'frontend'"""
             in query
         )
 
@@ -0,0 +1,145 @@
+"""Tests for schema-aware OTel column resolution."""
+
+import pytest
+
+from sre_agent.schema import ToolStatus
+from sre_agent.services import telemetry_catalog
+from sre_agent.services.telemetry_catalog import (
+    TelemetryCatalog,
+    TelemetryCatalogConfig,
+    TelemetrySources,
+)
+from sre_agent.tools.analysis.bigquery import (
+    analyze_aggregate_metrics,
+    find_exemplar_traces,
+)
+from sre_agent.tools.analysis.bigquery.otel_schema import (
+    FLAT_SPANS_TABLE,
+    SPAN_ATTRIBUTE_COLUMNS,
+    build_flat_spans_view_sql,
+    clear_otel_schema_registry,
+    register_otel_table,
+    resolve_span_schema,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    clear_otel_schema_registry()
+    yield
+    clear_otel_schema_registry()
+
+
+class TestOtelTableSchema:
+    def test_unregistered_table_uses_json_extract(self):
+        schema = resolve_span_schema("proj.traces", "_AllSpans")
+        assert schema.table_ref == "proj.traces._AllSpans"
+        assert schema.mode == "json_extract"
+        assert (
+            schema.attr("service.name")
+            == """JSON_VALUE(resource.attributes, '$."service.name"')"""
+        )
+
+    def test_registered_table_uses_typed_columns(self):
+        register_otel_table("proj.traces", "_AllSpans", "proj.agentops.otel_spans_flat")
+        schema = resolve_span_schema("proj.traces", "_AllSpans")
+        assert schema.table_ref == "proj.agentops.otel_spans_flat"
+        assert schema.mode == "typed_columns"
+        assert schema.attr("service.name", "t") == "t.service_name"
+        assert schema.attr("http.status_code") == "http_status_code"
+
+    def test_partial_typed_columns_fall_back_per_attribute(self):
+        register_otel_table(
+            "proj.traces", "_AllSpans", "proj.x.flat", typed_columns=["service_name"]
+        )
+        schema = resolve_span_schema("proj.traces", "_AllSpans")
+        assert schema.attr("service.name") == "service_name"
+        assert schema.attr("db.system").startswith("JSON_VALUE(attributes")
+
+    def test_direct_flat_table_reference_is_typed(self):
+        schema = resolve_span_schema("proj.agentops", FLAT_SPANS_TABLE)
+        assert schema.is_flat
+        assert schema.table_ref == "proj.agentops.otel_spans_flat"
+
+
+class TestTenantScoping:
+    def test_registration_requires_project_qualified_dataset(self):
+        with pytest.raises(ValueError, match="project-qualified"):
+            register_otel_table("traces", "_AllSpans", "proj.agentops.otel_spans_flat")
+
+    def test_bare_dataset_resolves_against_own_project(self, monkeypatch):
+        register_otel_table("proj-a.traces", "_AllSpans", "proj-a.agentops.flat")
+
+        monkeypatch.setattr(
+            "sre_agent.auth.get_current_project_id_or_none", lambda: "proj-b"
+        )
+        assert not resolve_span_schema("traces", "_AllSpans").is_flat
+
+        monkeypatch.setattr(
+            "sre_agent.auth.get_current_project_id_or_none", lambda: "proj-a"
+        )
+        assert resolve_span_schema("traces", "_AllSpans").table_ref == (
+            "proj-a.agentops.flat"
+        )
+
+    def test_catalog_typed_table_is_scoped_to_principal(self, monkeypatch):
+        catalog = TelemetryCatalog(TelemetryCatalogConfig(db_path=""))
+        catalog._remember(
+            TelemetrySources(
+                project_id="proj",
+                principal="alice",
+                trace_table="proj.traces._AllSpans",
+                typed_trace_table="proj.traces.otel_spans_flat",
+            )
+        )
+        monkeypatch.setattr(telemetry_catalog, "_catalog", catalog)
+
+        monkeypatch.setattr(telemetry_catalog, "current_principal", lambda: "alice")
+        schema = resolve_span_schema("proj.traces", "_AllSpans")
+        assert schema.table_ref == "proj.traces.otel_spans_flat"
+
+        monkeypatch.setattr(telemetry_catalog, "current_principal", lambda: "bob")
+        assert not resolve_span_schema("proj.traces", "_AllSpans").is_flat
+
+
+class TestToolsUseTypedColumns:
+    def test_aggregate_metrics_filters_on_typed_column(self):
+        register_otel_table("proj.traces", "_AllSpans", "proj.agentops.otel_spans_flat")
+        result = analyze_aggregate_metrics(
+            dataset_id="proj.traces",
+            table_name="_AllSpans",
+            service_name="checkout",
+        )
+        assert result.status == ToolStatus.SUCCESS
+        sql = result.result["sql_query"]
+        assert "`proj.agentops.otel_spans_flat`" in sql
+        assert "service_name = 'checkout'" in sql
+        assert "JSON_VALUE" not in sql
+        assert result.result["column_mode"] == "typed_columns"
+
+    def test_exemplar_traces_without_registration_keep_json(self):
+        result = find_exemplar_traces(dataset_id="proj.traces", table_name="_AllSpans")
+        assert result.status == ToolStatus.SUCCESS
+        assert "proj.traces._AllSpans" in result.result["sql_query"]
+        assert result.result["column_mode"] == "json_extract"
+
+
+class TestFlatSpansViewSql:
+    def test_view_is_partitioned_and_clustered(self):
+        sql = build_flat_spans_view_sql("proj", "agentops", "traces")
+        assert "`proj.agentops.otel_spans_flat`" in sql
+        assert "PARTITION BY DATE(start_time)" in sql
+        assert "CLUSTER BY service_name" in sql
+        assert "FROM `proj.traces._AllSpans`" in sql
+        assert """JSON_VALUE(resource.attributes, '$."service.name"')""" in sql
+
+    def test_json_fallback_matches_view_extraction(self):
+        # A dotted OTel key is one literal key, not a nested path; both modes
+        # must read it the same way or raw and flat queries disagree.
+        sql = build_flat_spans_view_sql("proj", "agentops", "traces")
+        schema = resolve_span_schema("proj.traces", "_AllSpans")
+        for key, column in SPAN_ATTRIBUTE_COLUMNS.items():
+            assert f"{schema.attr(key)} AS {column.flat_column}" in sql
+        assert schema.attr("http.status_code") == (
+            """JSON_VALUE(attributes, '$."http.status_code"')"""
+        )
@@ -4,6 +4,8 @@ Tests the pattern extraction, comparison, and anomaly detection
 functionality using the Drain3 algorithm.
 """
 
+import pytest
+
 from sre_agent.schema import ToolStatus
 from sre_agent.tools.analysis.logs.patterns import (
     LogPattern,
@@ -397,9 +399,10 @@ class TestComparePatterns:
 class TestExtractLogPatterns:
     """Tests for the extract_log_patterns tool."""
 
-    def test_extract_from_text_payload_logs(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_extract_from_text_payload_logs(self, sample_text_payload_logs):
         """Test pattern extraction from textPayload logs."""
-        result = extract_log_patterns(sample_text_payload_logs)
+        result = await extract_log_patterns(sample_text_payload_logs)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -408,15 +411,17 @@ class TestExtractLogPatterns:
         assert "top_patterns" in data
         assert data["total_logs_processed"] == len(sample_text_payload_logs)
 
-    def test_extract_with_max_patterns(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_extract_with_max_patterns(self, sample_text_payload_logs):
         """Test limiting max patterns returned."""
-        result = extract_log_patterns(sample_text_payload_logs, max_patterns=2)
+        result = await extract_log_patterns(sample_text_payload_logs, max_patterns=2)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
         assert len(data["top_patterns"]) <= 2
 
-    def test_extract_with_min_count(self):
+    @pytest.mark.asyncio
+    async def test_extract_with_min_count(self):
         """Test filtering by minimum count."""
         # Create logs with clear repetition
         logs = []
@@ -434,7 +439,7 @@ class TestExtractLogPatterns:
             }
         )
 
-        result = extract_log_patterns(logs, min_count=5)
+        result = await extract_log_patterns(logs, min_count=5)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -443,9 +448,10 @@ class TestExtractLogPatterns:
         if data["top_patterns"]:
             assert data["top_patterns"][0]["count"] >= 5
 
-    def test_extract_tracks_severity_distribution(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_extract_tracks_severity_distribution(self, sample_text_payload_logs):
         """Test that severity distribution is tracked."""
-        result = extract_log_patterns(sample_text_payload_logs)
+        result = await extract_log_patterns(sample_text_payload_logs)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -458,11 +464,12 @@ class TestExtractLogPatterns:
 class TestCompareLogPatterns:
     """Tests for the compare_log_patterns tool."""
 
-    def test_compare_baseline_vs_incident(
+    @pytest.mark.asyncio
+    async def test_compare_baseline_vs_incident(
         self, baseline_period_logs, incident_period_logs
     ):
         """Test comparing baseline vs incident period logs."""
-        result = compare_log_patterns(
+        result = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
         )
@@ -478,9 +485,10 @@ class TestCompareLogPatterns:
         anomalies = data["anomalies"]
         assert len(anomalies.get("new_patterns", [])) > 0
 
-    def test_compare_identical_periods(self, baseline_period_logs):
+    @pytest.mark.asyncio
+    async def test_compare_identical_periods(self, baseline_period_logs):
         """Test comparing identical log sets."""
-        result = compare_log_patterns(
+        result = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=baseline_period_logs,
         )
@@ -493,19 +501,20 @@ class TestCompareLogPatterns:
         # Should have no disappeared patterns
         assert len(anomalies.get("disappeared_patterns", [])) == 0
 
-    def test_compare_with_significance_threshold(
+    @pytest.mark.asyncio
+    async def test_compare_with_significance_threshold(
         self, baseline_period_logs, incident_period_logs
     ):
         """Test significance threshold affects results."""
         # High threshold - fewer significant changes
-        result_high = compare_log_patterns(
+        result_high = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
             significance_threshold=0.9,
         )
 
         # Low threshold - more significant changes
-        result_low = compare_log_patterns(
+        result_low = await compare_log_patterns(
             baseline_entries_json=baseline_period_logs,
             comparison_entries_json=incident_period_logs,
             significance_threshold=0.1,
@@ -525,9 +534,10 @@ class TestCompareLogPatterns:
 class TestAnalyzeLogAnomalies:
     """Tests for the analyze_log_anomalies tool."""
 
-    def test_analyze_error_logs(self, incident_period_logs):
+    @pytest.mark.asyncio
+    async def test_analyze_error_logs(self, incident_period_logs):
         """Test anomaly analysis focused on errors."""
-        result = analyze_log_anomalies(incident_period_logs, focus_on_errors=True)
+        result = await analyze_log_anomalies(incident_period_logs, focus_on_errors=True)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -536,26 +546,31 @@ class TestAnalyzeLogAnomalies:
         assert "error_patterns" in data
         assert "recommendation" in data
 
-    def test_analyze_all_logs(self, sample_text_payload_logs):
+    @pytest.mark.asyncio
+    async def test_analyze_all_logs(self, sample_text_payload_logs):
         """Test anomaly analysis without error focus."""
-        result = analyze_log_anomalies(sample_text_payload_logs, focus_on_errors=False)
+        result = await analyze_log_anomalies(
+            sample_text_payload_logs, focus_on_errors=False
+        )
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
         assert "top_patterns" in data
         assert len(data["top_patterns"]) > 0
 
-    def test_analyze_with_max_results(self, incident_period_logs):
+    @pytest.mark.asyncio
+    async def test_analyze_with_max_results(self, incident_period_logs):
         """Test limiting max results."""
-        result = analyze_log_anomalies(incident_period_logs, max_results=3)
+        result = await analyze_log_anomalies(incident_period_logs, max_results=3)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
         assert len(data["top_patterns"]) <= 3
 
-    def test_recommendation_generation(self, incident_period_logs):
+    @pytest.mark.asyncio
+    async def test_recommendation_generation(self, incident_period_logs):
         """Test that recommendations are generated."""
-        result = analyze_log_anomalies(incident_period_logs)
+        result = await analyze_log_anomalies(incident_period_logs)
 
         assert result.status == ToolStatus.SUCCESS
         data = result.result
@@ -1,5 +1,7 @@
 """Tests for metrics analysis tools."""
 
+import pytest
+
 from sre_agent.schema import ToolStatus
 from sre_agent.tools.analysis.metrics import (
     calculate_series_stats,
@@ -29,7 +31,8 @@ def test_calculate_series_stats_empty() -> None:
     assert result.result == {}
 
 
-def test_detect_metric_anomalies_basic() -> None:
+@pytest.mark.asyncio
+async def test_detect_metric_anomalies_basic() -> None:
     # Mean=5, Stdev=0. (all 5s)
     # Add an anomaly: 100
     data = [5.0] * 10 + [100.0]
@@ -37,7 +40,7 @@ def test_detect_metric_anomalies_basic() -> None:
     # 5.0 * 10 = 50. + 100 = 150. / 11 ~= 13.6
     # This might skewer stdev.
 
-    result_response = detect_metric_anomalies(data, threshold_sigma=2.0)
+    result_response = await detect_metric_anomalies(data, threshold_sigma=2.0)
     assert result_response.status == ToolStatus.SUCCESS
     result = result_response.result
     assert result["is_anomaly_detected"] is True
@@ -45,9 +48,12 @@ def test_detect_metric_anomalies_basic() -> None:
     assert result["anomalies"][0]["value"] == 100.0
 
 
-def test_detect_metric_anomalies_dicts() -> None:
+@pytest.mark.asyncio
+async def test_detect_metric_anomalies_dicts() -> None:
     data = [{"v": 10}, {"v": 10}, {"v": 500}]
-    result_response = detect_metric_anomalies(data, value_key="v", threshold_sigma=1.0)
+    result_response = await detect_metric_anomalies(
+        data, value_key="v", threshold_sigma=1.0
+    )
     assert result_response.status == ToolStatus.SUCCESS
     result = result_response.result
     assert result["is_anomaly_detected"] is True
@@ -88,20 +94,22 @@ def test_calculate_series_stats_single_point() -> None:
     assert stats["mean"] == 42.0
 
 
-def test_detect_metric_anomalies_no_anomalies() -> None:
+@pytest.mark.asyncio
+async def test_detect_metric_anomalies_no_anomalies() -> None:
     # Normal distributionish data
     data = [10.0, 11.0, 9.0, 10.5, 9.5]
-    result_response = detect_metric_anomalies(data, threshold_sigma=3.0)
+    result_response = await detect_metric_anomalies(data, threshold_sigma=3.0)
     assert result_response.status == ToolStatus.SUCCESS
     result = result_response.result
     assert result["is_anomaly_detected"] is False
     assert len(result["anomalies"]) == 0
 
 
-def test_detect_metric_anomalies_zero_variance() -> None:
+@pytest.mark.asyncio
+async def test_detect_metric_anomalies_zero_variance() -> None:
     # All same values
     data = [10.0] * 5
-    result_response = detect_metric_anomalies(data)
+    result_response = await detect_metric_anomalies(data)
     assert result_response.status == ToolStatus.SUCCESS
     result = result_response.result
     assert result["is_anomaly_detected"] is False
@@ -269,3 +269,29 @@ def test_transform_trace_quality_analysis():
     child_span = next(s for s in result_skew["spans"] if s["span_id"] == "child")
     assert child_span["attributes"]["/agent/quality/type"] == "clock_skew"
     assert "outside parent" in child_span["attributes"]["/agent/quality/issue"]
+
+
+def test_transform_metrics_downsamples_keeping_extremes_and_anomalies():
+    points = [
+        {"timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z", "value": 1.0}
+        for i in range(3600)
+    ]
+    points[1234]["value"] = 99.0
+    points[2000]["is_anomaly"] = True
+
+    result = transform_metrics({"points": points}, max_points=100)
+
+    assert result["truncated"] is True
+    assert result["total_point_count"] == 3600
+    assert len(result["points"]) <= 101
+    assert any(p["value"] == 99.0 for p in result["points"])
+    assert any(p.get("is_anomaly") for p in result["points"])
+
+
+def test_transform_log_entries_caps_entries():
+    entries = [{"insertId": str(i), "severity": "INFO"} for i in range(50)]
+
+    result = transform_log_entries({"entries": entries}, max_entries=10)
+
+    assert len(result["entries"]) == 10
+    assert result["total_entry_count"] == 50
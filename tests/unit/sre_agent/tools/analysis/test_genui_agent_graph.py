@@ -4,7 +4,10 @@ Verifies scoped node IDs, depth/parent tracking, children_count, expandable
 flags, and edge depth computation.
 """
 
-from sre_agent.tools.analysis.genui_adapter import transform_agent_graph
+from sre_agent.tools.analysis.genui_adapter import (
+    transform_agent_graph,
+    transform_agent_trace,
+)
 
 
 def _make_span(
@@ -694,3 +697,20 @@ def test_full_agent_hierarchy():
     # Edge count: user→sre, sre→model, sre→tool, sre→trace, sre→logs,
     #             trace→model, trace→tool, logs→tool = 8
     assert len(result["edges"]) == 8
+
+
+def test_deep_agent_trees_do_not_hit_recursion_limit():
+    root: dict = {"span_id": "0", "kind": "agent_invocation", "agent_name": "a0"}
+    node = root
+    for i in range(1, 5000):
+        child = {"span_id": str(i), "kind": "llm_call", "model_used": "m"}
+        node["children"] = [child]
+        node = child
+    data = {"trace_id": "t", "root_spans": [root]}
+
+    trace = transform_agent_trace(data)
+    graph = transform_agent_graph(data)
+
+    assert len(trace["nodes"]) == 5000
+    assert trace["nodes"][-1]["depth"] == 4999
+    assert any(n["id"] == "model:m@a0" for n in graph["nodes"])
@@ -0,0 +1,107 @@
+"""Tests for the memoized, budgeted GenUI transform pipeline."""
+
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import patch
+
+from sre_agent.tools.analysis import genui_adapter
+from sre_agent.tools.analysis.genui_pipeline import (
+    DisplayBudget,
+    TransformCache,
+    WidgetPatcher,
+)
+
+TRACE = genui_adapter.COMPONENT_TRACE_WATERFALL
+LOGS = genui_adapter.COMPONENT_LOG_ENTRIES_VIEWER
+
+
+def _trace(span_count: int) -> dict[str, Any]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    spans = [
+        {
+            "span_id": str(i),
+            "parent_span_id": str(i - 1) if i % 50 else None,
+            "name": f"op-{i}",
+            "start_time": (start + timedelta(milliseconds=i)).isoformat(),
+            "end_time": (start + timedelta(milliseconds=10_000 - i)).isoformat(),
+            "labels": {"/http/status_code": "500" if i == 4321 else "200"},
+        }
+        for i in range(span_count)
+    ]
+    return {"trace_id": "t1", "spans": spans}
+
+
+def _log_event(entries: list[dict[str, Any]], token: str | None = None) -> dict:
+    return {
+        "type": "dashboard",
+        "category": "logs",
+        "widget_type": LOGS,
+        "tool_name": "list_log_entries",
+        "data": {
+            "entries": entries,
+            "filter": "severity>=ERROR",
+            "project_id": "p",
+            "next_page_token": token,
+        },
+    }
+
+
+def test_cache_transforms_equal_results_once() -> None:
+    result = _trace(10)
+
+    with patch.object(
+        genui_adapter, "transform_trace", wraps=genui_adapter.transform_trace
+    ) as spy:
+        cache = TransformCache(DisplayBudget())
+        first = cache.transform(TRACE, result)
+        again = cache.transform(TRACE, result)
+        copied = cache.transform(TRACE, copy.deepcopy(result))
+
+    assert spy.call_count == 1
+    assert first is again is copied
+    assert cache.hits == 2
+
+
+def test_large_trace_is_downsampled_to_budget() -> None:
+    cache = TransformCache(DisplayBudget(max_spans=500))
+
+    payload = cache.transform(TRACE, _trace(5000))
+
+    assert payload["truncated"] is True
+    assert payload["total_span_count"] == 5000
+    assert len(payload["spans"]) <= 500
+    kept = {s["span_id"] for s in payload["spans"]}
+    assert "4321" in kept  # error spans are kept first
+    for span in payload["spans"]:  # and never lose their parents
+        assert span["parent_span_id"] is None or span["parent_span_id"] in kept
+    assert len(json.dumps(payload)) < 500_000
+
+
+def test_patcher_sends_growth_as_patch() -> None:
+    patcher = WidgetPatcher()
+    first = [{"insert_id": "1"}, {"insert_id": "2"}]
+    grown = [*first, {"insert_id": "3"}]
+
+    full = json.loads(patcher.encode(_log_event(first, "a")) or "")
+    patch_event = json.loads(patcher.encode(_log_event(grown, "b")) or "")
+
+    assert full["type"] == "dashboard"
+    assert patch_event["type"] == "dashboard_patch"
+    assert patch_event["widget_key"] == full["widget_key"]
+    assert patch_event["field"] == "entries"
+    assert patch_event["items"] == [{"insert_id": "3"}]
+    assert patch_event["set"] == {"next_page_token": "b"}
+
+
+def test_patcher_drops_repeats_and_resends_changes() -> None:
+    patcher = WidgetPatcher()
+    entries = [{"insert_id": "1"}, {"insert_id": "2"}]
+
+    assert patcher.encode(_log_event(entries)) is not None
+    assert patcher.encode(_log_event(list(entries))) is None
+    replaced = json.loads(patcher.encode(_log_event([{"insert_id": "9"}])) or "")
+
+    assert replaced["type"] == "dashboard"
+    assert patcher.duplicates == 1
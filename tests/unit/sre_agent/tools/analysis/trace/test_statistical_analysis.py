@@ -60,9 +60,10 @@ def slow_target_trace():
     }
 
 
-def test_perform_causal_analysis(baseline_trace, slow_target_trace):
+@pytest.mark.asyncio
+async def test_perform_causal_analysis(baseline_trace, slow_target_trace):
     """Test causal analysis using string inputs (integration checks build_call_graph fix)."""
-    response = perform_causal_analysis(
+    response = await perform_causal_analysis(
         baseline_trace, slow_target_trace, project_id="test-p"
     )
 
@@ -124,16 +125,21 @@ def test_detect_latency_anomalies(baseline_trace, slow_target_trace):
     assert anomalies["child"]["anomaly_type"] == "slow"
 
 
-def test_perform_causal_analysis_with_invalid_json(baseline_trace):
+@pytest.mark.asyncio
+async def test_perform_causal_analysis_with_invalid_json(baseline_trace):
     """Test that causal analysis handles invalid JSON."""
     invalid_json = '{"trace_id": "invalid", "spans": [}'
 
     # Test with invalid baseline
-    result1 = perform_causal_analysis(invalid_json, baseline_trace, project_id="test-p")
+    result1 = await perform_causal_analysis(
+        invalid_json, baseline_trace, project_id="test-p"
+    )
     assert result1.status == ToolStatus.ERROR
     assert result1.error is not None
 
     # Test with invalid target
-    result2 = perform_causal_analysis(baseline_trace, invalid_json, project_id="test-p")
+    result2 = await perform_causal_analysis(
+        baseline_trace, invalid_json, project_id="test-p"
+    )
     assert result2.status == ToolStatus.ERROR
     assert result2.error is not None
@@ -105,7 +105,8 @@ def test_detect_latency_anomalies_full_flow(mock_trace_data):
             assert len(res.result["anomalous_spans"]) > 0
 
 
-def test_perform_causal_analysis_success():
+@pytest.mark.asyncio
+async def test_perform_causal_analysis_success():
     baseline = {"spans": [{"name": "gateway", "duration_ms": 100}]}
     target = {
         "spans": [
@@ -122,12 +123,13 @@ def test_perform_causal_analysis_success():
         "sre_agent.tools.analysis.trace.statistical_analysis.fetch_trace_data",
         side_effect=[baseline, target],
     ):
-        res = perform_causal_analysis("b1", "t1")
+        res = await perform_causal_analysis("b1", "t1")
         assert res.status == ToolStatus.SUCCESS
         assert res.result["root_cause_candidates"][0]["is_likely_root_cause"] is True
 
 
-def test_analyze_trace_patterns_trends():
+@pytest.mark.asyncio
+async def test_analyze_trace_patterns_trends():
     traces = [
         {
             "duration_ms": 100,
@@ -155,7 +157,7 @@ def test_analyze_trace_patterns_trends():
         "sre_agent.tools.analysis.trace.statistical_analysis._fetch_traces_parallel",
         return_value=traces,
     ):
-        res = analyze_trace_patterns(["t1", "t2", "t3", "t4"])
+        res = await analyze_trace_patterns(["t1", "t2", "t3", "t4"])
         assert res.result["overall_trend"] == "degrading"
         assert len(res.result["patterns"]["intermittent_issues"]) > 0
 
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+import pytest
+
 from sre_agent.schema import BaseToolResponse, ToolStatus
 from sre_agent.tools.analysis.trace.statistical_analysis import (
     analyze_critical_path,
@@ -49,12 +51,13 @@ def test_analyze_critical_path_success(mock_fetch):
     assert result["total_critical_duration_ms"] == 100.0
 
 
+@pytest.mark.asyncio
 @patch("sre_agent.tools.analysis.trace.statistical_analysis.fetch_trace_data")
 @patch(
     "sre_agent.tools.analysis.trace.statistical_analysis._analyze_critical_path_impl"
 )
 @patch("sre_agent.tools.analysis.trace.analysis._build_call_graph_impl")
-def test_perform_causal_analysis_success(
+async def test_perform_causal_analysis_success(
     mock_build_graph, mock_analyze_critical, mock_fetch
 ):
     # Baseline: Span A takes 10ms
@@ -93,7 +96,7 @@ def test_perform_causal_analysis_success(
         "span_tree": [{"span_id": "t1", "depth": 0, "children": []}]
     }
 
-    response = perform_causal_analysis("base", "target", project_id="test-p")
+    response = await perform_causal_analysis("base", "target", project_id="test-p")
     assert response.status == ToolStatus.SUCCESS
     result = response.result
 
@@ -105,8 +108,9 @@ def test_perform_causal_analysis_success(
     assert top["is_likely_root_cause"] is True
 
 
+@pytest.mark.asyncio
 @patch("sre_agent.tools.analysis.trace.statistical_analysis._fetch_traces_parallel")
-def test_analyze_trace_patterns_mocked_fetch(mock_fetch_parallel):
+async def test_analyze_trace_patterns_mocked_fetch(mock_fetch_parallel):
     t1 = {
         "trace_id": "t1",
         "duration_ms": 200,
@@ -124,7 +128,7 @@ def test_analyze_trace_patterns_mocked_fetch(mock_fetch_parallel):
     }
     mock_fetch_parallel.return_value = [t1, t2, t3]
 
-    response = analyze_trace_patterns(["t1", "t2", "t3"], project_id="test-p")
+    response = await analyze_trace_patterns(["t1", "t2", "t3"], project_id="test-p")
     assert response.status == ToolStatus.SUCCESS
     result = response.result
 
@@ -85,3 +85,23 @@ def test_strict_euc_enforcement_skipped():
     # Skipped as lazy evaluation doesn't fail at init time.
     # In production, failures happen when client makes network calls with evaluating ContextVars.
     pass
+
+
+def test_clients_are_guarded_by_adaptive_limits():
+    from sre_agent.core.resilience import GuardedClient
+
+    with patch("google.cloud.monitoring_v3.MetricServiceClient") as mock_class:
+        mock_class.return_value.list_time_series.return_value = ["ts"]
+        client = get_monitoring_client()
+        assert isinstance(client, GuardedClient)
+        assert client.list_time_series(name="projects/p") == ["ts"]
+
+
+def test_adaptive_limits_can_be_disabled():
+    from sre_agent.core.resilience import GuardedClient
+
+    with (
+        patch.dict("os.environ", {"SRE_AGENT_ADAPTIVE_LIMITS": "false"}),
+        patch("google.cloud.monitoring_v3.MetricServiceClient"),
+    ):
+        assert not isinstance(get_monitoring_client(), GuardedClient)
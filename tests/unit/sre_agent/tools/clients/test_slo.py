@@ -1,5 +1,6 @@
 """Unit tests for the SLO/SLI client."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -172,3 +173,28 @@ async def test_analyze_error_budget_burn_all_risks():
             result = await analyze_error_budget_burn("proj", "svc", "slo", hours=24)
             assert result.status == ToolStatus.SUCCESS
             assert result.result["risk_level"] == "MEDIUM"
+
+
+@pytest.mark.asyncio
+async def test_golden_signals_query_off_the_event_loop():
+    """Guarded client calls may block on quota, so they must not run on the loop."""
+    loop_thread = threading.get_ident()
+    call_threads: list[int] = []
+
+    def list_time_series(**kwargs):
+        call_threads.append(threading.get_ident())
+        return []
+
+    with patch(
+        "sre_agent.tools.clients.slo.get_monitoring_client"
+    ) as mock_client_factory:
+        with patch("sre_agent.tools.clients.slo.monitoring_v3"):
+            mock_client = MagicMock()
+            mock_client.list_time_series.side_effect = list_time_series
+            mock_client_factory.return_value = mock_client
+
+            await get_golden_signals(project_id="test-proj", service_name="svc")
+            await analyze_error_budget_burn("proj", "svc", "slo", hours=24)
+
+    assert call_threads
+    assert loop_thread not in call_threads
@@ -111,3 +111,17 @@ async def test_fetch_trace_shortcut():
         result = await fetch_trace("ok", "proj")
         assert result.status == ToolStatus.SUCCESS
         assert result.result["trace_id"] == "ok"
+
+
+def test_trace_client_is_guarded_by_adaptive_limits():
+    from sre_agent.core.resilience import GuardedClient
+    from sre_agent.tools.clients.trace import get_trace_client
+
+    with patch("sre_agent.tools.clients.trace.trace_v1.TraceServiceClient") as cls:
+        cls.return_value.get_trace.return_value = "trace"
+        client = get_trace_client(credentials=MagicMock())
+        assert isinstance(client, GuardedClient)
+        assert client.get_trace(project_id="p", trace_id="t") == "trace"
+
+        with patch.dict("os.environ", {"SRE_AGENT_ADAPTIVE_LIMITS": "false"}):
+            assert not isinstance(get_trace_client(), GuardedClient)
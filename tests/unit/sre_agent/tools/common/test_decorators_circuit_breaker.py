@@ -18,6 +18,8 @@ import pytest
 from sre_agent.core.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerRegistry,
+    ErrorClass,
+    scope_key,
 )
 from sre_agent.schema import BaseToolResponse, ToolStatus
 from sre_agent.tools.common.decorators import (
@@ -95,25 +97,68 @@ class TestCircuitBreakerDecoratorIntegration:
         # Configure circuit with low threshold
         registry = CircuitBreakerRegistry()
         config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout_seconds=60)
-        registry.configure("fetch_trace", config)
+        registry.configure("cloudtrace", config)
+        scope = scope_key("cloudtrace", "proj-a")
 
         @adk_tool
-        async def fetch_trace(trace_id: str = "test") -> BaseToolResponse:
+        async def fetch_trace(
+            trace_id: str = "test", project_id: str | None = None
+        ) -> BaseToolResponse:
             return BaseToolResponse(status=ToolStatus.SUCCESS, result={"data": "ok"})
 
         with patch.dict(os.environ, disable_logging_skip):
-            # Trip the circuit by recording a failure
-            registry.pre_call("fetch_trace")
-            registry.record_failure("fetch_trace")
+            # Trip the circuit by recording an outage in proj-a
+            registry.pre_call(scope)
+            registry.record_failure(scope, ErrorClass.UNAVAILABLE)
 
             # Next call should be blocked
-            result = await fetch_trace(trace_id="test-123")
+            result = await fetch_trace(trace_id="test-123", project_id="proj-a")
 
         assert isinstance(result, BaseToolResponse)
         assert result.status == ToolStatus.ERROR
         assert "Circuit breaker OPEN" in result.error
         assert result.metadata["circuit_breaker"] is True
         assert result.metadata["non_retryable"] is True
+        assert result.metadata["circuit"] == f"{scope}:unavailable"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_is_scoped_to_project(
+        self, disable_logging_skip: dict[str, str]
+    ) -> None:
+        """A tripped breaker in one project must not block other projects."""
+        registry = CircuitBreakerRegistry()
+        registry.configure("logging", CircuitBreakerConfig(failure_threshold=1))
+        registry.record_failure(scope_key("logging", "proj-a"), ErrorClass.QUOTA)
+
+        @adk_tool
+        async def list_log_entries(project_id: str | None = None) -> BaseToolResponse:
+            return BaseToolResponse(status=ToolStatus.SUCCESS, result=[])
+
+        with patch.dict(os.environ, disable_logging_skip):
+            blocked = await list_log_entries(project_id="proj-a")
+            allowed = await list_log_entries(project_id="proj-b")
+
+        assert blocked.status == ToolStatus.ERROR
+        assert allowed.status == ToolStatus.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_breaker(
+        self, disable_logging_skip: dict[str, str]
+    ) -> None:
+        """Permission and argument errors are counted but never open a circuit."""
+        registry = CircuitBreakerRegistry()
+        registry.configure("logging", CircuitBreakerConfig(failure_threshold=1))
+
+        @adk_tool
+        async def list_log_entries(project_id: str | None = None) -> BaseToolResponse:
+            return BaseToolResponse(status=ToolStatus.ERROR, error="403 Forbidden")
+
+        with patch.dict(os.environ, disable_logging_skip):
+            await list_log_entries(project_id="proj-a")
+            second = await list_log_entries(project_id="proj-a")
+
+        assert "Circuit breaker" not in (second.error or "")
+        assert registry.get_open_circuits() == []
 
     @pytest.mark.asyncio
     async def test_success_records_in_circuit_breaker(
@@ -121,17 +166,18 @@ class TestCircuitBreakerDecoratorIntegration:
     ) -> None:
         """Successful tool calls should record success in circuit breaker."""
         registry = CircuitBreakerRegistry()
+        scope = scope_key("monitoring", "proj-a")
         # Pre-record a failure to verify success decrements it
-        registry.record_failure("list_alerts")
+        registry.record_failure(scope, ErrorClass.UNAVAILABLE)
 
         @adk_tool
-        async def list_alerts() -> BaseToolResponse:
+        async def list_alerts(project_id: str = "proj-a") -> BaseToolResponse:
             return BaseToolResponse(status=ToolStatus.SUCCESS, result=[])
 
         with patch.dict(os.environ, disable_logging_skip):
-            await list_alerts()
+            await list_alerts(project_id="proj-a")
 
-        status = registry.get_status("list_alerts")
+        status = registry.get_status(scope, ErrorClass.UNAVAILABLE)
         assert status["failure_count"] == 0  # Decremented from 1
 
     @pytest.mark.asyncio
@@ -142,13 +188,13 @@ class TestCircuitBreakerDecoratorIntegration:
         registry = CircuitBreakerRegistry()
 
         @adk_tool
-        async def list_log_entries() -> BaseToolResponse:
+        async def list_log_entries(project_id: str | None = None) -> BaseToolResponse:
             return BaseToolResponse(status=ToolStatus.ERROR, error="Permission denied")
 
         with patch.dict(os.environ, disable_logging_skip):
-            await list_log_entries()
+            await list_log_entries(project_id="proj-a")
 
-        status = registry.get_status("list_log_entries")
+        status = registry.get_status(scope_key("logging", "proj-a"))
         assert status["total_failures"] == 1
 
     @pytest.mark.asyncio
@@ -159,15 +205,17 @@ class TestCircuitBreakerDecoratorIntegration:
         registry = CircuitBreakerRegistry()
 
         @adk_tool
-        async def query_promql() -> BaseToolResponse:
+        async def query_promql(project_id: str | None = None) -> BaseToolResponse:
             raise ConnectionError("Network unreachable")
 
         with patch.dict(os.environ, disable_logging_skip):
             with pytest.raises(ConnectionError):
-                await query_promql()
+                await query_promql(project_id="proj-a")
 
-        status = registry.get_status("query_promql")
-        assert status["total_failures"] == 1
+        scope = scope_key("monitoring", "proj-a")
+        assert registry.get_status(scope)["total_failures"] == 1
+        status = registry.get_status(scope, ErrorClass.UNAVAILABLE)
+        assert status["failure_count"] == 1
 
     @pytest.mark.asyncio
     async def test_non_protected_tool_ignores_circuit_breaker(
@@ -0,0 +1,198 @@
+"""Tests for tool execution classes and the CPU-heavy tool process pool."""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sre_agent.schema import BaseToolResponse, ToolStatus
+from sre_agent.tools.analysis.logs.patterns import extract_log_patterns
+from sre_agent.tools.common.decorators import adk_tool
+from sre_agent.tools.common.execution import (
+    CpuQuotaExceededError,
+    ExecutionClass,
+    ToolPoolConfig,
+    ToolProcessPool,
+    _trace_context,
+    function_ref,
+    get_tool_process_pool,
+    reset_tool_process_pool,
+    run_tool_body,
+)
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[ToolProcessPool]:
+    config = ToolPoolConfig.from_env()
+    config.max_workers = 1
+    config.cpu_quota_seconds = 10.0
+    tool_pool = ToolProcessPool(config)
+    yield tool_pool
+    tool_pool.shutdown()
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestToolProcessPool:
+    @pytest.mark.asyncio
+    async def test_runs_unwrapped_tool_in_a_worker(
+        self, pool: ToolProcessPool, sample_text_payload_logs: list[dict]
+    ) -> None:
+        ref = function_ref(extract_log_patterns.__wrapped__)
+        assert ref == ("sre_agent.tools.analysis.logs.patterns", "extract_log_patterns")
+
+        result = await pool.run(ref, (sample_text_payload_logs,))
+
+        assert isinstance(result, BaseToolResponse)
+        assert result.status == ToolStatus.SUCCESS
+        assert result.result["total_logs_processed"] == len(sample_text_payload_logs)
+        assert await pool.run(("os", "getpid")) != os.getpid()
+
+    def test_warm_up_starts_every_worker(self, pool: ToolProcessPool) -> None:
+        assert pool.warm_up(("sre_agent.tools.analysis.logs.patterns",)) == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_carry_the_worker_traceback(
+        self, pool: ToolProcessPool
+    ) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            await pool.run(("builtins", "int"), ("not a number",))
+        notes = getattr(exc_info.value, "__notes__", [""])
+        assert "Traceback from tool worker" in notes[0]
+
+    @pytest.mark.asyncio
+    async def test_cpu_quota_stops_runaway_calls(self, pool: ToolProcessPool) -> None:
+        start = time.monotonic()
+        with pytest.raises(CpuQuotaExceededError):
+            await pool.run(
+                ("builtins", "exec"), ("while True: pass",), cpu_quota_seconds=0.3
+            )
+        assert time.monotonic() - start < 3
+        # The worker interrupted the call and stays usable.
+        assert await pool.run(("builtins", "sum"), ([1, 2, 3],)) == 6
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_the_running_worker(
+        self, pool: ToolProcessPool
+    ) -> None:
+        await pool.run(("builtins", "len"), ("warm",))
+        [pid] = pool.worker_pids
+        killed = pool.killed
+
+        task = asyncio.create_task(
+            pool.run(("time", "sleep"), (30,), cpu_quota_seconds=0)
+        )
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        deadline = time.monotonic() + 5
+        while _alive(pid) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        assert not _alive(pid)
+        assert pool.killed == killed + 1
+        assert await pool.run(("os", "getpid")) != pid
+
+
+def test_trace_context_continues_the_callers_trace() -> None:
+    from opentelemetry import propagate, trace
+    from opentelemetry.sdk.trace import TracerProvider
+
+    tracer = TracerProvider().get_tracer(__name__)
+    carrier: dict[str, str] = {}
+    with tracer.start_as_current_span("tool call") as parent:
+        propagate.inject(carrier)
+
+    with _trace_context(carrier, "extract_log_patterns"):
+        current = trace.get_current_span().get_span_context()
+    assert current.trace_id == parent.get_span_context().trace_id
+
+
+class TestRunToolBody:
+    @pytest.mark.asyncio
+    async def test_untransferable_arguments_fall_back_to_a_thread(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SRE_AGENT_CPU_POOL", "true")
+        reset_tool_process_pool()
+        try:
+            lock = threading.Lock()
+            result = await run_tool_body(repr, ExecutionClass.CPU_HEAVY, (lock,), {})
+            assert "lock" in result
+            assert get_tool_process_pool().worker_pids == []  # type: ignore[union-attr]
+        finally:
+            reset_tool_process_pool()
+
+    @pytest.mark.asyncio
+    async def test_disabled_pool_runs_in_a_thread(self) -> None:
+        assert get_tool_process_pool() is None  # SRE_AGENT_CPU_POOL=false in tests
+        result = await run_tool_body(
+            threading.get_ident, ExecutionClass.CPU_HEAVY, (), {}
+        )
+        assert result != threading.get_ident()
+
+
+class TestAdkToolExecutionClasses:
+    def test_defaults_keep_existing_scheduling(self) -> None:
+        @adk_tool
+        def light() -> int:
+            return 1
+
+        @adk_tool
+        async def io() -> int:
+            return 1
+
+        assert light() == 1
+        assert light._execution_class is ExecutionClass.CPU_LIGHT
+        assert io._execution_class is ExecutionClass.IO
+
+    @pytest.mark.asyncio
+    async def test_sync_io_tools_run_in_a_thread_with_context(self) -> None:
+        var: contextvars.ContextVar[str] = contextvars.ContextVar("var")
+        var.set("request-1")
+
+        @adk_tool(execution=ExecutionClass.IO)
+        def blocking() -> dict:
+            return {"thread": threading.get_ident(), "var": var.get()}
+
+        assert asyncio.iscoroutinefunction(blocking)
+        result = await blocking()
+        assert result["thread"] != threading.get_ident()
+        assert result["var"] == "request-1"
+
+    @pytest.mark.asyncio
+    async def test_cpu_heavy_tools_are_awaitable(self) -> None:
+        @adk_tool(execution="cpu-heavy")
+        def crunch(n: int, tool_context: object = None) -> int:
+            return sum(range(n))
+
+        assert crunch._execution_class is ExecutionClass.CPU_HEAVY
+        assert await crunch(10, tool_context=object()) == 45
+
+    @pytest.mark.asyncio
+    async def test_quota_overrun_becomes_a_tool_error(self) -> None:
+        @adk_tool(execution=ExecutionClass.CPU_HEAVY, cpu_quota_seconds=1)
+        def crunch() -> int:
+            return 0
+
+        with patch(
+            "sre_agent.tools.common.decorators.run_tool_body",
+            AsyncMock(side_effect=CpuQuotaExceededError("crunch", 1)),
+        ):
+            result = await crunch()
+
+        assert result.status == ToolStatus.ERROR
+        assert result.metadata["cpu_quota_exceeded"] is True
+        assert result.metadata["non_retryable"] is True
@@ -1,35 +1,36 @@
 """Tests for discover_telemetry_sources tool."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from sre_agent.schema import ToolStatus
+from sre_agent.services.telemetry_catalog import DiscoveryError, TelemetrySources
 from sre_agent.tools.discovery.discovery_tool import discover_telemetry_sources
 
 
+def _patch_catalog(**get_kwargs):
+    catalog = MagicMock()
+    catalog.get = AsyncMock(**get_kwargs)
+    return patch(
+        "sre_agent.tools.discovery.discovery_tool.get_telemetry_catalog",
+        return_value=catalog,
+    )
+
+
 @pytest.mark.asyncio
 async def test_dlp_discovery_success(mock_tool_context):
     """Test successful discovery of both traces and logs tables."""
-
-    # Mock create_bigquery_mcp_toolset to return a mock toolset
-    mock_toolset = AsyncMock()
-
-    # Mock tools within toolset
-    mock_list_datasets = AsyncMock()
-    mock_list_datasets.name = "list_dataset_ids"
-    mock_list_datasets.run_async.return_value = ["my_dataset"]
-
-    mock_list_tables = AsyncMock()
-    mock_list_tables.name = "list_table_ids"
-    mock_list_tables.run_async.return_value = ["_AllSpans", "_AllLogs"]
-
-    mock_toolset.get_tools.return_value = [mock_list_datasets, mock_list_tables]
-
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.create_bigquery_mcp_toolset",
-        return_value=mock_toolset,
-    ):
+    sources = TelemetrySources(
+        project_id="test-project",
+        principal="adc",
+        trace_table="test-project.my_dataset._AllSpans",
+        log_table="test-project.my_dataset._AllLogs",
+        schemas={"test-project.my_dataset._AllSpans": ["trace_id", "span_id"]},
+        datasets_scanned=["my_dataset"],
+    )
+
+    with _patch_catalog(return_value=sources) as get_catalog:
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
@@ -39,29 +40,25 @@ async def test_dlp_discovery_success(mock_tool_context):
         assert res_data["mode"] == "bigquery"
         assert res_data["trace_table"] == "test-project.my_dataset._AllSpans"
         assert res_data["log_table"] == "test-project.my_dataset._AllLogs"
+        assert res_data["datasets_scanned"] == ["my_dataset"]
+        assert res_data["schemas"]["test-project.my_dataset._AllSpans"] == [
+            "trace_id",
+            "span_id",
+        ]
+        assert get_catalog.return_value.get.await_args.args == ("test-project",)
 
 
 @pytest.mark.asyncio
 async def test_dlp_discovery_partial(mock_tool_context):
     """Test discovery where only traces are found."""
-
-    mock_toolset = AsyncMock()
-
-    mock_list_datasets = AsyncMock()
-    mock_list_datasets.name = "list_dataset_ids"
-    mock_list_datasets.run_async.return_value = ["dataset1", "dataset2"]
-
-    mock_list_tables = AsyncMock()
-    mock_list_tables.name = "list_table_ids"
-    # dataset1 has nothing, dataset2 has spans
-    mock_list_tables.run_async.side_effect = [[], ["_AllSpans"]]
-
-    mock_toolset.get_tools.return_value = [mock_list_datasets, mock_list_tables]
-
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.create_bigquery_mcp_toolset",
-        return_value=mock_toolset,
-    ):
+    sources = TelemetrySources(
+        project_id="test-project",
+        principal="adc",
+        trace_table="test-project.dataset2._AllSpans",
+        datasets_scanned=["dataset1", "dataset2"],
+    )
+
+    with _patch_catalog(return_value=sources):
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
@@ -76,23 +73,11 @@ async def test_dlp_discovery_partial(mock_tool_context):
 @pytest.mark.asyncio
 async def test_dlp_discovery_fallback(mock_tool_context):
     """Test fallback when no tables are found."""
+    sources = TelemetrySources(
+        project_id="test-project", principal="adc", datasets_scanned=["dataset1"]
+    )
 
-    mock_toolset = AsyncMock()
-
-    mock_list_datasets = AsyncMock()
-    mock_list_datasets.name = "list_dataset_ids"
-    mock_list_datasets.run_async.return_value = ["dataset1"]
-
-    mock_list_tables = AsyncMock()
-    mock_list_tables.name = "list_table_ids"
-    mock_list_tables.run_async.return_value = ["some_other_table"]
-
-    mock_toolset.get_tools.return_value = [mock_list_datasets, mock_list_tables]
-
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.create_bigquery_mcp_toolset",
-        return_value=mock_toolset,
-    ):
+    with _patch_catalog(return_value=sources):
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
@@ -104,20 +89,13 @@ async def test_dlp_discovery_fallback(mock_tool_context):
 
 
 @pytest.mark.asyncio
-async def test_dlp_discovery_handles_cancellation_gracefully(mock_tool_context):
-    """Test that discovery handles tool cancellation without getting stuck."""
-
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.call_mcp_tool_with_retry"
-    ) as mock_call:
-        # Simulate cancellation error from MCP
-        mock_call.return_value = {
-            "status": "error",
-            "error": "Tool execution cancelled by system",
-            "error_type": "SYSTEM_CANCELLATION",
-            "non_retryable": True,
-        }
+async def test_dlp_discovery_handles_permission_errors_gracefully(mock_tool_context):
+    """Test that a failed discovery does not invite retry loops."""
+    error = DiscoveryError(
+        "Failed to list BigQuery datasets", "PERMISSION_DENIED", non_retryable=True
+    )
 
+    with _patch_catalog(side_effect=error):
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
@@ -134,17 +112,9 @@ async def test_dlp_discovery_handles_cancellation_gracefully(mock_tool_context):
 @pytest.mark.asyncio
 async def test_dlp_discovery_provides_alternative_suggestions(mock_tool_context):
     """Test that discovery failure provides actionable alternative suggestions."""
+    error = DiscoveryError("No GCP credentials available", "AUTH_ERROR", True)
 
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.call_mcp_tool_with_retry"
-    ) as mock_call:
-        mock_call.return_value = {
-            "status": "error",
-            "error": "MCP toolset unavailable",
-            "error_type": "MCP_UNAVAILABLE",
-            "non_retryable": True,
-        }
-
+    with _patch_catalog(side_effect=error):
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
@@ -158,19 +128,12 @@ async def test_dlp_discovery_provides_alternative_suggestions(mock_tool_context)
 @pytest.mark.asyncio
 async def test_dlp_discovery_error_includes_original_error_type(mock_tool_context):
     """Test that discovery preserves error type information."""
+    error = DiscoveryError("Failed to list BigQuery datasets (HTTP 0)", "UNAVAILABLE")
 
-    with patch(
-        "sre_agent.tools.discovery.discovery_tool.call_mcp_tool_with_retry"
-    ) as mock_call:
-        mock_call.return_value = {
-            "status": "error",
-            "error": "Timeout after 30s",
-            "error_type": "TIMEOUT",
-            "non_retryable": True,
-        }
-
+    with _patch_catalog(side_effect=error):
         result = await discover_telemetry_sources(
             project_id="test-project", tool_context=mock_tool_context
         )
 
-        assert result.metadata.get("error_type") == "TIMEOUT"
+        assert result.metadata.get("error_type") == "UNAVAILABLE"
+        assert result.metadata.get("non_retryable") is False
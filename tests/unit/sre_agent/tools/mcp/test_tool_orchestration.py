@@ -355,18 +355,18 @@ class TestDiscoveryToolErrorHandling:
     @pytest.mark.asyncio
     async def test_discovery_failure_returns_warning_not_error(self, mock_tool_context):
         """Test that discovery failure returns warning (not error) with guidance."""
+        from sre_agent.services.telemetry_catalog import DiscoveryError
         from sre_agent.tools.discovery.discovery_tool import discover_telemetry_sources
 
-        # Mock MCP tool to return an error
+        # Discovery fails with an error the catalog marks non-retryable
         with patch(
-            "sre_agent.tools.discovery.discovery_tool.call_mcp_tool_with_retry"
-        ) as mock_call:
-            mock_call.return_value = {
-                "status": "error",
-                "error": "Tool execution cancelled by system",
-                "error_type": "SYSTEM_CANCELLATION",
-                "non_retryable": True,
-            }
+            "sre_agent.tools.discovery.discovery_tool.get_telemetry_catalog"
+        ) as mock_catalog:
+            mock_catalog.return_value.get = AsyncMock(
+                side_effect=DiscoveryError(
+                    "Failed to list BigQuery datasets", "PERMISSION_DENIED", True
+                )
+            )
 
             result = await discover_telemetry_sources(
                 project_id="test-project", tool_context=mock_tool_context
@@ -382,17 +382,15 @@ class TestDiscoveryToolErrorHandling:
     @pytest.mark.asyncio
     async def test_discovery_failure_suggests_alternatives(self, mock_tool_context):
         """Test that discovery failure suggests specific alternative tools."""
+        from sre_agent.services.telemetry_catalog import DiscoveryError
         from sre_agent.tools.discovery.discovery_tool import discover_telemetry_sources
 
         with patch(
-            "sre_agent.tools.discovery.discovery_tool.call_mcp_tool_with_retry"
-        ) as mock_call:
-            mock_call.return_value = {
-                "status": "error",
-                "error": "MCP unavailable",
-                "error_type": "MCP_UNAVAILABLE",
-                "non_retryable": True,
-            }
+            "sre_agent.tools.discovery.discovery_tool.get_telemetry_catalog"
+        ) as mock_catalog:
+            mock_catalog.return_value.get = AsyncMock(
+                side_effect=DiscoveryError("No GCP credentials available", "AUTH_ERROR")
+            )
 
             result = await discover_telemetry_sources(
                 project_id="test-project", tool_context=mock_tool_context
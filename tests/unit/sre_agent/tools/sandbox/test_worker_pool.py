@@ -0,0 +1,113 @@
+"""Tests for the pre-warmed local sandbox worker pool."""
+
+import asyncio
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from sre_agent.tools.sandbox.executor import LocalCodeExecutor
+from sre_agent.tools.sandbox.schemas import SandboxFile
+from sre_agent.tools.sandbox.worker_pool import LocalWorkerPool, WorkerPoolConfig
+
+
+@pytest.fixture()
+def pool(tmp_path) -> Iterator[LocalWorkerPool]:
+    pool = LocalWorkerPool(
+        WorkerPoolConfig(
+            max_workers=2,
+            timeout_seconds=5,
+            max_rss_mb=512,
+            job_root=str(tmp_path),
+        )
+    )
+    yield pool
+    pool.shutdown()
+
+
+class TestLocalWorkerPool:
+    def test_runs_code_and_reuses_warm_worker(self, pool: LocalWorkerPool) -> None:
+        first = pool.run("import os; print(os.getpid())")
+        second = pool.run("import os; print(os.getpid())")
+
+        assert first.error is None
+        assert first.stdout == second.stdout
+        assert int(first.stdout) != os.getpid()
+
+    def test_server_cwd_is_untouched(self, pool: LocalWorkerPool) -> None:
+        cwd = os.getcwd()
+        result = pool.run("import os; print(os.getcwd())")
+
+        assert os.getcwd() == cwd
+        assert result.stdout.strip().startswith(pool.job_root)
+
+    def test_output_files_exclude_inputs(self, pool: LocalWorkerPool) -> None:
+        result = pool.run(
+            "data = open('input_data.json').read()\n"
+            "open('output.json', 'w').write(data)",
+            input_files={"input_data.json": b'{"a": 1}'},
+        )
+
+        assert result.error is None
+        assert result.output_files == {"output.json": b'{"a": 1}'}
+        assert os.listdir(pool.job_root) == []
+
+    def test_timeout_kills_worker_and_pool_recovers(self, tmp_path) -> None:
+        pool = LocalWorkerPool(
+            WorkerPoolConfig(max_workers=1, timeout_seconds=0.5, job_root=str(tmp_path))
+        )
+        try:
+            result = pool.run("while True:\n    pass")
+            assert result.error is not None
+            assert "timed out" in result.error
+            assert pool.run("print('ok')").stdout == "ok\n"
+        finally:
+            pool.shutdown()
+
+    def test_memory_cap_kills_worker(self, tmp_path) -> None:
+        pool = LocalWorkerPool(
+            WorkerPoolConfig(max_workers=1, max_rss_mb=200, job_root=str(tmp_path))
+        )
+        try:
+            result = pool.run(
+                "blob = b'x' * (400 * 1024 * 1024)\nwhile True:\n    pass"
+            )
+            assert result.error is not None
+            assert "memory limit" in result.error
+        finally:
+            pool.shutdown()
+
+    def test_streams_output(self, pool: LocalWorkerPool) -> None:
+        chunks: list[tuple[str, str]] = []
+        pool.run(
+            "import sys\nprint('one')\nprint('two', file=sys.stderr)",
+            on_output=lambda stream, text: chunks.append((stream, text)),
+        )
+        assert ("stdout", "one\n") in chunks
+        assert ("stderr", "two\n") in chunks
+
+    def test_user_errors_keep_worker(self, pool: LocalWorkerPool) -> None:
+        result = pool.run("1 / 0")
+        assert result.error == "division by zero"
+        assert pool.stats()["idle"] == 1
+
+
+class TestLocalCodeExecutorConcurrency:
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_get_isolated_directories(
+        self, pool: LocalWorkerPool
+    ) -> None:
+        executor = LocalCodeExecutor(pool=pool)
+        code = "print(open('data.txt').read())"
+
+        outputs = await asyncio.gather(
+            *(
+                executor.execute_code(
+                    code,
+                    input_files=[SandboxFile(name="data.txt", content=str(i).encode())],
+                )
+                for i in range(4)
+            )
+        )
+
+        assert [o.stdout.strip() for o in outputs] == ["0", "1", "2", "3"]
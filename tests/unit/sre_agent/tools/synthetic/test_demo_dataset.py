@@ -0,0 +1,110 @@
+"""Tests for the shared, indexed guest-mode demo dataset."""
+
+from pathlib import Path
+
+import pytest
+
+from sre_agent.tools.synthetic.demo_data_generator import DemoDataGenerator
+from sre_agent.tools.synthetic.demo_dataset import (
+    SNAPSHOT_ENV_VAR,
+    get_demo_dataset,
+    load_snapshot,
+    reset_demo_dataset,
+    save_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(SNAPSHOT_ENV_VAR, raising=False)
+    reset_demo_dataset()
+    yield
+    reset_demo_dataset()
+
+
+class TestSharedDataset:
+    def test_is_built_once(self) -> None:
+        assert get_demo_dataset() is get_demo_dataset()
+
+    def test_responses_are_memoized(self) -> None:
+        ds = get_demo_dataset()
+        assert ds.get_dashboard_kpis(hours=24) is ds.get_dashboard_kpis(hours=24)
+
+    def test_matches_fresh_generator(self) -> None:
+        fresh = DemoDataGenerator(seed=42)
+        ds = get_demo_dataset()
+        assert ds.get_topology(hours=24) == fresh.get_topology(hours=24)
+        assert ds.get_dashboard_kpis(hours=72) == fresh.get_dashboard_kpis(hours=72)
+
+    def test_span_details_do_not_depend_on_call_order(self) -> None:
+        ds = get_demo_dataset()
+        trace = ds.get_all_traces()[0]
+        llm_span = next(
+            s for s in trace["spans"] if s["attributes"].get("gen_ai.system")
+        )
+        other = DemoDataGenerator(seed=42)
+        other.get_session_trajectory(trace["session_id"])
+
+        assert ds.get_span_details(
+            trace["trace_id"], llm_span["span_id"]
+        ) == other.get_span_details(trace["trace_id"], llm_span["span_id"])
+
+
+class TestIndexes:
+    def test_trace_and_session_lookup(self) -> None:
+        ds = get_demo_dataset()
+        trace = ds.get_all_traces()[10]
+        assert ds.get_trace(trace["trace_id"]) is trace
+        assert trace in ds.get_session_traces(trace["session_id"])
+        assert ds.get_trace("missing") is None
+        assert ds.get_session_traces("missing") == []
+
+    def test_service_filter_matches_linear_scan(self) -> None:
+        ds = get_demo_dataset()
+        service = ds.get_all_traces()[0]["spans"][0]["resource"]["attributes"][
+            "service.name"
+        ]
+        expected = [
+            t
+            for t in ds.get_all_traces()
+            if any(
+                s["resource"]["attributes"].get("service.name") == service
+                for s in t["spans"]
+            )
+        ]
+        assert ds._filter_traces(168, service) == expected
+
+
+class TestSnapshot:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "demo.json")
+        gen = DemoDataGenerator(seed=42)
+        save_snapshot(gen, path)
+
+        loaded = load_snapshot(path)
+
+        assert loaded is not None
+        assert loaded.get_all_traces() == gen.get_all_traces()
+        assert loaded.get_dashboard_sessions(hours=48) == gen.get_dashboard_sessions(
+            hours=48
+        )
+
+    def test_incompatible_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "demo.json")
+        save_snapshot(DemoDataGenerator(seed=42), path, seed=7)
+        assert load_snapshot(path) is None
+        assert load_snapshot(str(tmp_path / "missing.json")) is None
+
+    def test_env_snapshot_written_then_reused(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "snap" / "demo.json"
+        monkeypatch.setenv(SNAPSHOT_ENV_VAR, str(path))
+
+        first = get_demo_dataset()
+        assert path.exists()
+
+        reset_demo_dataset()
+        second = get_demo_dataset()
+        assert second is not first
+        assert second.get_all_traces() == first.get_all_traces()
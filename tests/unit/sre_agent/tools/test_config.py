@@ -222,6 +222,20 @@ def test_tool_config_manager_enabled_tools():
     assert success is False
 
 
+def test_tool_config_manager_version_bumps_on_change():
+    """Test that enable/disable changes bump the config version."""
+    manager = get_tool_config_manager()
+    version = manager.version
+
+    manager.set_enabled("list_traces", False)
+    assert manager.version == version + 1
+    manager.set_enabled("list_traces", True)
+    assert manager.version == version + 2
+
+    manager.set_enabled("non_existent_tool", False)
+    assert manager.version == version + 2
+
+
 def test_tool_config_manager_get_enabled_disabled_tools():
     """Test getting lists of enabled/disabled tools."""
     manager = get_tool_config_manager()
@@ -78,6 +78,7 @@ async def test_complete_investigation_learns_pattern(
     mock_manager.learn_from_investigation = AsyncMock()
     mock_manager.add_session_to_memory = AsyncMock(return_value=True)
     mock_manager.reset_session_tracking = MagicMock()
+    mock_manager.get_tool_sequence = MagicMock(return_value=["fetch_trace"])
     mock_memory_manager.return_value = mock_manager
 
     with patch("sre_agent.tools.memory._get_context") as mock_get_ctx:
@@ -104,7 +105,8 @@ async def test_complete_investigation_learns_pattern(
     learn_call = mock_manager.learn_from_investigation.call_args
     assert learn_call.kwargs["symptom_type"] == "high_latency_checkout"
     assert learn_call.kwargs["root_cause_category"] == "connection_pool_exhaustion"
-    mock_manager.reset_session_tracking.assert_called_once()
+    mock_manager.get_tool_sequence.assert_called_once_with("test-session-123")
+    mock_manager.reset_session_tracking.assert_called_once_with("test-session-123")
 
 
 @pytest.mark.asyncio